@@ -1,13 +1,19 @@
 # main_qt.py
 import os
+from time import perf_counter
 
 from src.infra.platform.env_loader import load_env_file
 
 load_env_file()
 
+from src.infra.platform.startup_profiler import get_startup_profiler  # noqa: E402
+
+_imports_started = perf_counter()
 import resources.resources_rc  # noqa: E402,F401
 from src.ui_qml.shell.app import main  # noqa: E402
 
+get_startup_profiler().record("startup.imports", started=_imports_started, finished=perf_counter())
+
 if __name__ == "__main__":
     os.environ["QT_QUICK_CONTROLS_STYLE"] = "Basic"
     raise SystemExit(main())
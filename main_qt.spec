@@ -1,9 +1,17 @@
 # -*- mode: python ; coding: utf-8 -*-
 from PyInstaller.utils.hooks import collect_submodules
 from pathlib import Path
+import sys
 
 project_root = Path(SPECPATH)
 
+# Record the migration head once per build so startup can skip Alembic
+# when the database is already current.
+sys.path.insert(0, str(project_root))
+from src.infra.persistence.migrations.head_revision import write_head_revisions_file
+
+write_head_revisions_file(project_root / "src" / "infra" / "persistence" / "migrations")
+
 hidden = (
     collect_submodules("infra")
     + collect_submodules("core")
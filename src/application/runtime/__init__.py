@@ -4,5 +4,12 @@ from src.application.runtime.desktop_api_registry import (
     DesktopApiRegistry,
     build_desktop_api_registry,
 )
+from src.application.runtime.lazy_proxy import LazyProxy, is_lazy_resolved, resolve_lazy
 
-__all__ = ["DesktopApiRegistry", "build_desktop_api_registry"]
+__all__ = [
+    "DesktopApiRegistry",
+    "LazyProxy",
+    "build_desktop_api_registry",
+    "is_lazy_resolved",
+    "resolve_lazy",
+]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING
 
+from src.application.runtime.lazy_proxy import LazyProxy, resolve_lazy
 from src.core.platform.api.desktop.integration import IntegrationCapabilityDesktopApi
 from src.core.platform.api.desktop.integration.capability_api import build_integration_capability_api
 from src.core.platform.api.desktop.access.access import PlatformAccessDesktopApi
@@ -25,49 +27,6 @@ from src.core.platform.application.platform_runtime import (
     PlatformRuntimeApplicationService,
     resolve_platform_runtime_application_service,
 )
-from src.core.modules.inventory_procurement.api.desktop import (
-    InventoryProcurementCatalogDesktopApi,
-    InventoryProcurementDashboardDesktopApi,
-    InventoryProcurementInventoryDesktopApi,
-    InventoryProcurementPricingDesktopApi,
-    InventoryProcurementProcurementDesktopApi,
-    InventoryProcurementReservationsDesktopApi,
-    InventoryProcurementWorkspaceDesktopApi,
-)
-from src.core.modules.inventory_procurement.api.desktop_runtime import (
-    InventoryProcurementDesktopRuntimePlatformDependencies,
-    build_inventory_procurement_desktop_runtime_apis,
-)
-from src.core.modules.maintenance.api.desktop import (
-    MaintenanceAssetsDesktopApi,
-    MaintenanceDashboardDesktopApi,
-    MaintenancePlannerDesktopApi,
-    MaintenancePreventiveDesktopApi,
-    MaintenanceReliabilityDesktopApi,
-    MaintenanceWorkOrdersDesktopApi,
-    MaintenanceWorkRequestsDesktopApi,
-    MaintenanceWorkspaceDesktopApi,
-)
-from src.core.modules.maintenance.api.desktop_runtime import (
-    MaintenanceDesktopRuntimePlatformDependencies,
-    build_maintenance_desktop_runtime_apis,
-)
-from src.core.modules.project_management.api.desktop import (
-    ProjectManagementCollaborationDesktopApi,
-    ProjectManagementDashboardDesktopApi,
-    ProjectManagementFinancialsDesktopApi,
-    ProjectManagementPortfolioDesktopApi,
-    ProjectManagementProjectsDesktopApi,
-    ProjectManagementRegisterDesktopApi,
-    ProjectManagementResourcesDesktopApi,
-    ProjectManagementSchedulingDesktopApi,
-    ProjectManagementTasksDesktopApi,
-    ProjectManagementTimesheetsDesktopApi,
-)
-from src.core.modules.project_management.api.desktop_runtime import (
-    ProjectManagementDesktopRuntimePlatformDependencies,
-    build_project_management_desktop_runtime_apis,
-)
 from src.core.platform.access import AccessControlService
 from src.core.platform.application.approval.approval_service import ApprovalService
 from src.core.platform.application.history.activity.activity_service import ActivityService
@@ -104,6 +63,40 @@ from src.core.platform.application.master_data.party.party_service import PartyS
 from src.core.platform.application.master_data.site.site_service import SiteService
 
 
+if TYPE_CHECKING:
+    from src.core.modules.inventory_procurement.api.desktop import (
+        InventoryProcurementCatalogDesktopApi,
+        InventoryProcurementDashboardDesktopApi,
+        InventoryProcurementInventoryDesktopApi,
+        InventoryProcurementPricingDesktopApi,
+        InventoryProcurementProcurementDesktopApi,
+        InventoryProcurementReservationsDesktopApi,
+        InventoryProcurementWorkspaceDesktopApi,
+    )
+    from src.core.modules.maintenance.api.desktop import (
+        MaintenanceAssetsDesktopApi,
+        MaintenanceDashboardDesktopApi,
+        MaintenancePlannerDesktopApi,
+        MaintenancePreventiveDesktopApi,
+        MaintenanceReliabilityDesktopApi,
+        MaintenanceWorkOrdersDesktopApi,
+        MaintenanceWorkRequestsDesktopApi,
+        MaintenanceWorkspaceDesktopApi,
+    )
+    from src.core.modules.project_management.api.desktop import (
+        ProjectManagementCollaborationDesktopApi,
+        ProjectManagementDashboardDesktopApi,
+        ProjectManagementFinancialsDesktopApi,
+        ProjectManagementPortfolioDesktopApi,
+        ProjectManagementProjectsDesktopApi,
+        ProjectManagementRegisterDesktopApi,
+        ProjectManagementResourcesDesktopApi,
+        ProjectManagementSchedulingDesktopApi,
+        ProjectManagementTasksDesktopApi,
+        ProjectManagementTimesheetsDesktopApi,
+    )
+
+
 @dataclass(frozen=True)
 class DesktopApiRegistry:
     integration_capability: IntegrationCapabilityDesktopApi
@@ -153,6 +146,14 @@ class DesktopApiRegistry:
 
 
 def build_desktop_api_registry(services: Mapping[str, object]) -> DesktopApiRegistry:
+    """Build the desktop APIs over ``services``.
+
+    Module APIs, and the platform APIs whose services only exist once every
+    module bundle has registered against them (access, approval, department,
+    user), are ``LazyProxy`` stand-ins: their services are resolved on the
+    first call, so startup only builds the platform bundle. A missing
+    service for one of them is reported on that first call.
+    """
     platform_runtime_application_service = resolve_platform_runtime_application_service(
         platform_runtime_application_service=services.get(
             "platform_runtime_application_service"
@@ -171,18 +172,9 @@ def build_desktop_api_registry(services: Mapping[str, object]) -> DesktopApiRegi
     site_service = services.get("site_service")
     if not isinstance(site_service, SiteService):
         raise RuntimeError("Platform site service is not configured.")
-    department_service = services.get("department_service")
-    if not isinstance(department_service, DepartmentService):
-        raise RuntimeError("Platform department service is not configured.")
     employee_service = services.get("employee_service")
     if not isinstance(employee_service, EmployeeService):
         raise RuntimeError("Platform employee service is not configured.")
-    access_service = services.get("access_service")
-    if not isinstance(access_service, AccessControlService):
-        raise RuntimeError("Platform access service is not configured.")
-    approval_service = services.get("approval_service")
-    if not isinstance(approval_service, ApprovalService):
-        raise RuntimeError("Platform approval service is not configured.")
     enterprise_audit_service = services.get("enterprise_audit_service")
     financial_period_service = services.get("financial_period_service")
     if not isinstance(financial_period_service, FinancialPeriodService):
@@ -194,68 +186,58 @@ def build_desktop_api_registry(services: Mapping[str, object]) -> DesktopApiRegi
     party_service = services.get("party_service")
     if not isinstance(party_service, PartyService):
         raise RuntimeError("Platform party service is not configured.")
-    auth_service = services.get("auth_service")
-    if not isinstance(auth_service, AuthService):
-        raise RuntimeError("Platform auth service is not configured.")
     service_principal_service = services.get("service_principal_service")
     if not isinstance(service_principal_service, ServicePrincipalService):
         raise RuntimeError("Platform service-principal service is not configured.")
 
-    project_service = services.get("project_service")
-    task_service = services.get("task_service")
-    resource_service = services.get("resource_service")
-    baseline_service = services.get("baseline_service")
-    inventory_service = services.get("inventory_service")
-    inventory_reservation_service = services.get("inventory_reservation_service")
-    inventory_purchasing_service = services.get("inventory_purchasing_service")
+    def department_service() -> DepartmentService:
+        return _required_service(
+            services, "department_service", DepartmentService, "Platform department service is not configured."
+        )
+
+    def approval_service() -> ApprovalService:
+        return _required_service(
+            services, "approval_service", ApprovalService, "Platform approval service is not configured."
+        )
 
     platform_site_api = PlatformSiteDesktopApi(site_service=site_service)
     platform_calendar_api = (
         None
     )  # PlatformCalendarDesktopApi removed; use EnterpriseCalendarDesktopApi
 
+    # Scope types are offered from service registration alone; the module
+    # services are only resolved when a scope picker loads its options.
     access_scope_type_choices: list[tuple[str, str]] = []
     access_scope_option_loaders: dict[str, object] = {}
     access_scope_disabled_hints: dict[str, str] = {}
-    if project_service is not None and hasattr(project_service, "list_projects"):
+    if "project_service" in services:
         access_scope_type_choices.append(("Project", "project"))
         access_scope_option_loaders["project"] = lambda: [
             (project.name, project.id)
-            for project in project_service.list_projects()
+            for project in _list_from(services, "project_service", "list_projects")
         ]
     access_scope_type_choices.append(("Site", "site"))
     access_scope_option_loaders["site"] = lambda: _load_site_scope_options(
         platform_site_api
     )
-    if inventory_service is not None and hasattr(
-        inventory_service,
-        "list_storerooms",
-    ):
+    if "inventory_service" in services:
         access_scope_type_choices.append(("Storeroom", "storeroom"))
         access_scope_option_loaders["storeroom"] = lambda: [
             (f"{storeroom.storeroom_code} - {storeroom.name}", storeroom.id)
-            for storeroom in inventory_service.list_storerooms()
+            for storeroom in _list_from(services, "inventory_service", "list_storerooms")
         ]
 
-    maintenance_asset_service = services.get("maintenance_asset_service")
-    maintenance_location_service = services.get("maintenance_location_service")
-    if maintenance_asset_service is not None and hasattr(
-        maintenance_asset_service,
-        "list_assets",
-    ):
+    if "maintenance_asset_service" in services:
         access_scope_type_choices.append(("Asset", "maintenance"))
         access_scope_option_loaders["maintenance"] = lambda: [
             (f"{asset.name} ({asset.asset_code})", asset.id)
-            for asset in maintenance_asset_service.list_assets()
+            for asset in _list_from(services, "maintenance_asset_service", "list_assets")
         ]
-    elif maintenance_location_service is not None and hasattr(
-        maintenance_location_service,
-        "list_locations",
-    ):
+    elif "maintenance_location_service" in services:
         access_scope_type_choices.append(("Maintenance Location", "maintenance"))
         access_scope_option_loaders["maintenance"] = lambda: [
             (location.name, location.id)
-            for location in maintenance_location_service.list_locations()
+            for location in _list_from(services, "maintenance_location_service", "list_locations")
         ]
 
     module_registry = services.get("module_registry")
@@ -296,7 +278,13 @@ def build_desktop_api_registry(services: Mapping[str, object]) -> DesktopApiRegi
     shift_pattern_service = services.get("shift_pattern_service")
     calendar_assignment_service = services.get("calendar_assignment_service")
     enterprise_calendar_resolver = services.get("enterprise_calendar_resolver")
-    resource_capacity_calculator = services.get("resource_capacity_calculator")
+    # The capacity calculator belongs to project management; it is only
+    # needed when a capacity summary is requested.
+    resource_capacity_calculator = (
+        LazyProxy(lambda: services["resource_capacity_calculator"], label="resource_capacity_calculator")
+        if "resource_capacity_calculator" in services
+        else None
+    )
     if (
         isinstance(enterprise_calendar_service, EnterpriseCalendarService)
         and isinstance(working_rule_service, WorkingRuleService)
@@ -317,31 +305,29 @@ def build_desktop_api_registry(services: Mapping[str, object]) -> DesktopApiRegi
             capacity_calculator=resource_capacity_calculator,
         )
 
-    project_management_apis = build_project_management_desktop_runtime_apis(
-        services=services,
-        platform_dependencies=ProjectManagementDesktopRuntimePlatformDependencies(
+    project_management_apis = LazyProxy(
+        lambda: _build_project_management_apis(
+            services,
             employee_service=employee_service,
             site_service=site_service,
-            department_service=department_service,
-            approval_service=approval_service,
-            reservation_service=inventory_reservation_service,
+            department_service=department_service(),
+            approval_service=approval_service(),
             enterprise_calendar_api=enterprise_calendar_api,
         ),
+        label="project management desktop APIs",
     )
-    inventory_procurement_apis = build_inventory_procurement_desktop_runtime_apis(
-        services=services,
-        platform_dependencies=InventoryProcurementDesktopRuntimePlatformDependencies(
-            module_catalog_service=services.get("module_catalog_service"),
-            user_session=services.get("user_session"),
-        ),
+    inventory_procurement_apis = LazyProxy(
+        lambda: _build_inventory_procurement_apis(services),
+        label="inventory and procurement desktop APIs",
     )
-    maintenance_apis = build_maintenance_desktop_runtime_apis(
-        services=services,
-        platform_dependencies=MaintenanceDesktopRuntimePlatformDependencies(
+    maintenance_apis = LazyProxy(
+        lambda: _build_maintenance_apis(
+            services,
             site_service=site_service,
             party_service=party_service,
             employee_service=employee_service,
         ),
+        label="maintenance desktop APIs",
     )
 
     return DesktopApiRegistry(
@@ -352,20 +338,27 @@ def build_desktop_api_registry(services: Mapping[str, object]) -> DesktopApiRegi
         platform_calendar=platform_calendar_api,
         platform_enterprise_calendar=enterprise_calendar_api,
         platform_site=platform_site_api,
-        platform_department=PlatformDepartmentDesktopApi(
-            department_service=department_service,
+        platform_department=LazyProxy(
+            lambda: PlatformDepartmentDesktopApi(department_service=department_service()),
+            label="platform_department",
         ),
         platform_employee=PlatformEmployeeDesktopApi(
             employee_service=employee_service,
         ),
-        platform_access=PlatformAccessDesktopApi(
-            access_service=access_service,
-            scope_type_choices=tuple(access_scope_type_choices),
-            scope_option_loaders=access_scope_option_loaders,
-            scope_disabled_hints=access_scope_disabled_hints,
+        platform_access=LazyProxy(
+            lambda: PlatformAccessDesktopApi(
+                access_service=_required_service(
+                    services, "access_service", AccessControlService, "Platform access service is not configured."
+                ),
+                scope_type_choices=tuple(access_scope_type_choices),
+                scope_option_loaders=access_scope_option_loaders,
+                scope_disabled_hints=access_scope_disabled_hints,
+            ),
+            label="platform_access",
         ),
-        platform_approval=PlatformApprovalDesktopApi(
-            approval_service=approval_service,
+        platform_approval=LazyProxy(
+            lambda: PlatformApprovalDesktopApi(approval_service=approval_service()),
+            label="platform_approval",
         ),
         platform_activity=PlatformActivityDesktopApi(activity_service=activity_service) if isinstance(activity_service, ActivityService) else None,
         platform_enterprise_audit=PlatformEnterpriseAuditDesktopApi(enterprise_audit_service=enterprise_audit_service) if isinstance(enterprise_audit_service, EnterpriseAuditService) else None,
@@ -380,15 +373,116 @@ def build_desktop_api_registry(services: Mapping[str, object]) -> DesktopApiRegi
         ),
         platform_support=PlatformSupportDesktopApi(),
         platform_tenant=_build_platform_tenant_api(services),
-        platform_user=PlatformUserDesktopApi(
-            auth_service=auth_service,
+        platform_user=LazyProxy(
+            lambda: PlatformUserDesktopApi(
+                auth_service=_required_service(
+                    services, "auth_service", AuthService, "Platform auth service is not configured."
+                ),
+            ),
+            label="platform_user",
         ),
         platform_identity=PlatformIdentityDesktopApi(
             service_principal_service=service_principal_service,
         ),
-        **vars(project_management_apis),
-        **vars(inventory_procurement_apis),
-        **vars(maintenance_apis),
+        **_lazy_group_fields(project_management_apis, "project_management_"),
+        **_lazy_group_fields(inventory_procurement_apis, "inventory_procurement_"),
+        **_lazy_group_fields(maintenance_apis, "maintenance_"),
+    )
+
+
+def _required_service(
+    services: Mapping[str, object],
+    key: str,
+    service_type: type,
+    message: str,
+):
+    service = services.get(key)
+    if not isinstance(service, service_type):
+        raise RuntimeError(message)
+    return service
+
+
+def _list_from(services: Mapping[str, object], key: str, method: str) -> list:
+    loader = getattr(services.get(key), method, None)
+    return list(loader()) if callable(loader) else []
+
+
+def _lazy_group_fields(group: LazyProxy, prefix: str) -> dict[str, LazyProxy]:
+    # One proxy per registry field; the first call on any of them builds the
+    # whole module group once.
+    return {
+        field.name: LazyProxy(
+            lambda name=field.name: getattr(resolve_lazy(group), name),
+            label=field.name,
+        )
+        for field in fields(DesktopApiRegistry)
+        if field.name.startswith(prefix)
+    }
+
+
+# Module API packages are imported by these builders rather than at module
+# level, so startup does not pay for importing modules nobody has opened.
+def _build_project_management_apis(
+    services: Mapping[str, object],
+    *,
+    employee_service: EmployeeService,
+    site_service: SiteService,
+    department_service: DepartmentService,
+    approval_service: ApprovalService,
+    enterprise_calendar_api: EnterpriseCalendarDesktopApi | None,
+):
+    from src.core.modules.project_management.api.desktop_runtime import (
+        ProjectManagementDesktopRuntimePlatformDependencies,
+        build_project_management_desktop_runtime_apis,
+    )
+
+    return build_project_management_desktop_runtime_apis(
+        services=services,
+        platform_dependencies=ProjectManagementDesktopRuntimePlatformDependencies(
+            employee_service=employee_service,
+            site_service=site_service,
+            department_service=department_service,
+            approval_service=approval_service,
+            reservation_service=services.get("inventory_reservation_service"),
+            enterprise_calendar_api=enterprise_calendar_api,
+        ),
+    )
+
+
+def _build_inventory_procurement_apis(services: Mapping[str, object]):
+    from src.core.modules.inventory_procurement.api.desktop_runtime import (
+        InventoryProcurementDesktopRuntimePlatformDependencies,
+        build_inventory_procurement_desktop_runtime_apis,
+    )
+
+    return build_inventory_procurement_desktop_runtime_apis(
+        services=services,
+        platform_dependencies=InventoryProcurementDesktopRuntimePlatformDependencies(
+            module_catalog_service=services.get("module_catalog_service"),
+            user_session=services.get("user_session"),
+        ),
+    )
+
+
+def _build_maintenance_apis(
+    services: Mapping[str, object],
+    *,
+    site_service: SiteService,
+    party_service: PartyService,
+    employee_service: EmployeeService,
+):
+    from src.core.modules.maintenance.api.desktop_runtime import (
+        MaintenanceDesktopRuntimePlatformDependencies,
+        build_maintenance_desktop_runtime_apis,
+    )
+
+    return build_maintenance_desktop_runtime_apis(
+        services=services,
+        platform_dependencies=MaintenanceDesktopRuntimePlatformDependencies(
+            site_service=site_service,
+            party_service=party_service,
+            employee_service=employee_service,
+        ),
     )
 
 
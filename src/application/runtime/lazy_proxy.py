@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from threading import Lock
+from typing import Any
+
+
+class LazyProxy:
+    """Stands in for an object that ``factory`` builds on first use.
+
+    Attribute reads, writes and deletes are forwarded to the built object,
+    so a caller can hold the proxy wherever it would hold the object and
+    nothing is built until the first method call or attribute read.
+    """
+
+    __slots__ = ("_lazy_factory", "_lazy_label", "_lazy_lock", "_lazy_target")
+
+    def __init__(self, factory: Callable[[], Any], *, label: str = "") -> None:
+        object.__setattr__(self, "_lazy_factory", factory)
+        object.__setattr__(self, "_lazy_label", label)
+        object.__setattr__(self, "_lazy_lock", Lock())
+        object.__setattr__(self, "_lazy_target", None)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(resolve_lazy(self), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(resolve_lazy(self), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(resolve_lazy(self), name)
+
+    def __repr__(self) -> str:
+        target = object.__getattribute__(self, "_lazy_target")
+        if target is not None:
+            return repr(target)
+        return f"<LazyProxy {object.__getattribute__(self, '_lazy_label') or 'object'} (unresolved)>"
+
+
+def resolve_lazy(value: Any) -> Any:
+    """The object behind ``value`` when it is a ``LazyProxy``, building it if
+    needed; any other value is returned unchanged."""
+    if not isinstance(value, LazyProxy):
+        return value
+    target = object.__getattribute__(value, "_lazy_target")
+    if target is not None:
+        return target
+    with object.__getattribute__(value, "_lazy_lock"):
+        target = object.__getattribute__(value, "_lazy_target")
+        if target is None:
+            target = object.__getattribute__(value, "_lazy_factory")()
+            object.__setattr__(value, "_lazy_target", target)
+    return target
+
+
+def is_lazy_resolved(value: Any) -> bool:
+    """False only for a ``LazyProxy`` whose object has not been built yet."""
+    return not isinstance(value, LazyProxy) or object.__getattribute__(value, "_lazy_target") is not None
+
+
+__all__ = ["LazyProxy", "is_lazy_resolved", "resolve_lazy"]
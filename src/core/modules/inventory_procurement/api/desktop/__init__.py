@@ -51,6 +51,7 @@ from src.core.modules.inventory_procurement.api.desktop.inventory import (
     InventoryStoreroomOptionDescriptor,
     InventoryStoreroomStatusDescriptor,
     InventoryStoreroomUpdateCommand,
+    InventoryTransactionLabelLookup,
     InventoryTransactionTypeDescriptor,
     InventoryTransferCommand,
     build_inventory_procurement_inventory_desktop_api,
@@ -167,6 +168,7 @@ __all__ = [
     "InventoryStoreroomOptionDescriptor",
     "InventoryStoreroomStatusDescriptor",
     "InventoryStoreroomUpdateCommand",
+    "InventoryTransactionLabelLookup",
     "InventoryTransactionTypeDescriptor",
     "InventoryTransferCommand",
     "build_inventory_procurement_catalog_desktop_api",
@@ -27,6 +27,7 @@ from src.core.modules.inventory_procurement.api.desktop.inventory.models import
     InventoryStoreroomDesktopDto,
     InventoryStoreroomStatusDescriptor,
     InventoryStoreroomUpdateCommand,
+    InventoryTransactionLabelLookup,
     InventoryTransactionTypeDescriptor,
     InventoryTransferCommand,
 )
@@ -88,6 +89,7 @@ __all__ = [
     "InventoryStoreroomOptionDescriptor",
     "InventoryStoreroomStatusDescriptor",
     "InventoryStoreroomUpdateCommand",
+    "InventoryTransactionLabelLookup",
     "InventoryTransactionTypeDescriptor",
     "InventoryTransferCommand",
     "build_inventory_procurement_inventory_desktop_api",
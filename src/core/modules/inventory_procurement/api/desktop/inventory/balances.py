@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from src.core.modules.inventory_procurement.api.desktop.inventory.models import (
     InventoryStockBalanceDesktopDto,
     InventoryStockTransactionDesktopDto,
+    InventoryTransactionLabelLookup,
 )
 from src.core.modules.inventory_procurement.api.desktop.inventory.serializers import (
     serialize_balance,
@@ -72,6 +75,72 @@ class InventoryDesktopBalanceMixin:
             for row in rows
         )
 
+    def list_transaction_labels(self) -> InventoryTransactionLabelLookup:
+        return InventoryTransactionLabelLookup(
+            items={row.value: row.label for row in self.list_items(active_only=None)},
+            storerooms={
+                row.value: row.label
+                for row in self.list_storeroom_options(active_only=None)
+            },
+        )
+
+    def list_transactions_page(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 200,
+        stock_item_id: str | None = None,
+        storeroom_ids: Sequence[str] | None = None,
+        transaction_type: str | None = None,
+        search_text: str | None = None,
+        sort_key: str | None = None,
+        ascending: bool = False,
+        labels: InventoryTransactionLabelLookup | None = None,
+    ) -> tuple[tuple[InventoryStockTransactionDesktopDto, ...], bool]:
+        """One page of the movement register. Pass the ``labels`` of
+        ``list_transaction_labels`` to reuse them across pages."""
+        if self._stock_service is None:
+            return (), False
+        lookup = labels or self.list_transaction_labels()
+        rows, has_more = self._stock_service.list_transactions_page(
+            offset=offset,
+            limit=limit,
+            stock_item_id=stock_item_id,
+            storeroom_ids=storeroom_ids,
+            transaction_type=transaction_type,
+            search_text=search_text,
+            sort_key=sort_key,
+            ascending=ascending,
+        )
+        return (
+            tuple(
+                serialize_transaction(
+                    row,
+                    item_lookup=lookup.items,
+                    storeroom_lookup=lookup.storerooms,
+                )
+                for row in rows
+            ),
+            has_more,
+        )
+
+    def count_transactions(
+        self,
+        *,
+        stock_item_id: str | None = None,
+        storeroom_ids: Sequence[str] | None = None,
+        transaction_type: str | None = None,
+        search_text: str | None = None,
+    ) -> int:
+        if self._stock_service is None:
+            return 0
+        return self._stock_service.count_transactions(
+            stock_item_id=stock_item_id,
+            storeroom_ids=storeroom_ids,
+            transaction_type=transaction_type,
+            search_text=search_text,
+        )
+
     def _serialize_transaction(self, row) -> InventoryStockTransactionDesktopDto:
         item_lookup = {entry.value: entry.label for entry in self.list_items(active_only=None)}
         storeroom_lookup = {
@@ -122,6 +122,15 @@ class InventoryStockTransactionDesktopDto:
     notes: str
 
 
+@dataclass(frozen=True)
+class InventoryTransactionLabelLookup:
+    """Item and storeroom labels for movement rows, loaded once and reused
+    for every page of the register."""
+
+    items: dict[str, str]
+    storerooms: dict[str, str]
+
+
 @dataclass(frozen=True)
 class InventoryStorageLocationDesktopDto:
     id: str
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from src.core.modules.inventory_procurement.application.common.support import normalize_optional_text
 from src.core.modules.inventory_procurement.domain.inventory.stock import (
     StockBalance,
@@ -77,5 +79,76 @@ class StockControlQueryMixin:
             scope_id_getter=lambda row: getattr(row, "storeroom_id", ""),
         )
 
+    def list_transactions_page(
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 200,
+        stock_item_id: str | None = None,
+        storeroom_ids: Sequence[str] | None = None,
+        transaction_type: str | None = None,
+        search_text: str | None = None,
+        sort_key: str | None = None,
+        ascending: bool = False,
+    ) -> tuple[list[StockTransaction], bool]:
+        """One page of the movement register, filtered and sorted in SQL.
+
+        Returns the visible rows and whether more rows may follow. The
+        user's storeroom scope is applied in the query, so pages are full
+        until the register runs out; the next page starts at
+        ``offset + limit``."""
+        self._require_read("list stock transactions")
+        organization = self._active_organization()
+        page_size = max(1, int(limit or 200))
+        rows = self._transaction_repo.list_page_for_organization(
+            organization.id,
+            offset=max(0, int(offset or 0)),
+            limit=page_size,
+            stock_item_id=normalize_optional_text(stock_item_id) or None,
+            storeroom_ids=self._readable_storeroom_ids(storeroom_ids),
+            transaction_type=normalize_optional_text(transaction_type) or None,
+            search_text=normalize_optional_text(search_text) or None,
+            sort_key=normalize_optional_text(sort_key) or None,
+            ascending=bool(ascending),
+        )
+        visible = filter_scope_rows(
+            rows,
+            self._user_session,
+            scope_type="storeroom",
+            permission_code="inventory.read",
+            scope_id_getter=lambda row: getattr(row, "storeroom_id", ""),
+        )
+        return visible, len(rows) == page_size
+
+    def count_transactions(
+        self,
+        *,
+        stock_item_id: str | None = None,
+        storeroom_ids: Sequence[str] | None = None,
+        transaction_type: str | None = None,
+        search_text: str | None = None,
+    ) -> int:
+        """Number of movements ``list_transactions_page`` pages through."""
+        self._require_read("count stock transactions")
+        organization = self._active_organization()
+        return self._transaction_repo.count_for_organization(
+            organization.id,
+            stock_item_id=normalize_optional_text(stock_item_id) or None,
+            storeroom_ids=self._readable_storeroom_ids(storeroom_ids),
+            transaction_type=normalize_optional_text(transaction_type) or None,
+            search_text=normalize_optional_text(search_text) or None,
+        )
+
+    def _readable_storeroom_ids(self, storeroom_ids: Sequence[str] | None) -> tuple[str, ...] | None:
+        """``storeroom_ids`` narrowed to the storerooms a scope-restricted
+        user may read (``None`` leaves an unrestricted query unfiltered)."""
+        requested = None if storeroom_ids is None else tuple(storeroom_ids)
+        session = self._user_session
+        if session is None or not session.is_scope_restricted("storeroom"):
+            return requested
+        allowed = session.scope_ids_for("storeroom", "inventory.read")
+        if requested is None:
+            return tuple(sorted(allowed))
+        return tuple(storeroom_id for storeroom_id in requested if storeroom_id in allowed)
 
 __all__ = ["StockControlQueryMixin"]
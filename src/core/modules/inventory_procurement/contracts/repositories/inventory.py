@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 from src.core.modules.inventory_procurement.domain.inventory.foundation import (
     CycleCount,
@@ -70,6 +71,9 @@ class StockTransactionRepository(ABC):
     @abstractmethod
     def add(self, transaction: StockTransaction) -> None: ...
 
+    @abstractmethod
+    def add_many(self, transactions: list[StockTransaction]) -> None: ...
+
     @abstractmethod
     def get(self, transaction_id: str) -> StockTransaction | None: ...
 
@@ -86,6 +90,32 @@ class StockTransactionRepository(ABC):
         limit: int = 200,
     ) -> list[StockTransaction]: ...
 
+    @abstractmethod
+    def list_page_for_organization(
+        self,
+        organization_id: str,
+        *,
+        offset: int = 0,
+        limit: int = 200,
+        stock_item_id: str | None = None,
+        storeroom_ids: Sequence[str] | None = None,
+        transaction_type: str | None = None,
+        search_text: str | None = None,
+        sort_key: str | None = None,
+        ascending: bool = False,
+    ) -> list[StockTransaction]: ...
+
+    @abstractmethod
+    def count_for_organization(
+        self,
+        organization_id: str,
+        *,
+        stock_item_id: str | None = None,
+        storeroom_ids: Sequence[str] | None = None,
+        transaction_type: str | None = None,
+        search_text: str | None = None,
+    ) -> int: ...
+
 
 class StockReservationRepository(ABC):
     @abstractmethod
@@ -24,6 +24,7 @@ class CallbackImportDefinition:
     execute_handler: ExecutionHandler
     module_code: str = "inventory_procurement"
     permission_code: str = "import.manage"
+    chunk_size: int | None = None
 
     def field_specs(self) -> tuple[ImportFieldSpec, ...]:
         return self.field_specs_value
@@ -41,6 +42,7 @@ def register_inventory_procurement_import_definitions(
     schemas: Mapping[str, tuple[ImportFieldSpec, ...]],
     preview_handlers: Mapping[str, PreviewHandler],
     execution_handlers: Mapping[str, ExecutionHandler],
+    chunk_sizes: Mapping[str, int] | None = None,
 ) -> ImportDefinitionRegistry:
     for operation_key, field_specs in schemas.items():
         if registry.has(operation_key):
@@ -51,6 +53,7 @@ def register_inventory_procurement_import_definitions(
                 field_specs_value=field_specs,
                 preview_handler=preview_handlers[operation_key],
                 execute_handler=execution_handlers[operation_key],
+                chunk_size=(chunk_sizes or {}).get(operation_key),
             )
         )
     return registry
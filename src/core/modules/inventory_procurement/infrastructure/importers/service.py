@@ -48,7 +48,11 @@ from src.core.platform.application.data_operations.exporting import (
     ensure_output_path,
 )
 from src.core.platform.domain.data_operations.exporting import ExportArtifactDraft
-from src.core.platform.application.data_operations.importing import CsvImportRuntime, ImportDefinitionRegistry
+from src.core.platform.application.data_operations.importing import (
+    DEFAULT_IMPORT_CHUNK_SIZE,
+    CsvImportRuntime,
+    ImportDefinitionRegistry,
+)
 from src.core.platform.domain.data_operations.importing import ImportPreview, ImportSummary
 from src.core.platform.application.master_data.site.site_service import SiteService
 from src.core.platform.application.master_data.party.party_service import PartyService
@@ -118,6 +122,13 @@ class InventoryDataExchangeService(
                 "purchase_orders": self._import_purchase_orders,
                 "receipts": self._import_receipts,
             },
+            # Document imports group their line rows by document number
+            # across the whole file, so only the row-per-record imports are
+            # executed in chunks.
+            chunk_sizes={
+                "items": DEFAULT_IMPORT_CHUNK_SIZE,
+                "storerooms": DEFAULT_IMPORT_CHUNK_SIZE,
+            },
         )
         self._import_runtime = import_runtime or CsvImportRuntime(
             registry,
@@ -119,28 +119,32 @@ def stock_balance_from_orm(obj: StockBalanceORM) -> StockBalance:
     )
 
 
+def stock_transaction_to_row(transaction: StockTransaction) -> dict[str, object]:
+    return {
+        "id": transaction.id,
+        "organization_id": transaction.organization_id,
+        "transaction_number": transaction.transaction_number,
+        "stock_item_id": transaction.stock_item_id,
+        "storeroom_id": transaction.storeroom_id,
+        "transaction_type": transaction.transaction_type,
+        "quantity": transaction.quantity,
+        "uom": transaction.uom,
+        "unit_cost": transaction.unit_cost,
+        "transaction_at": transaction.transaction_at,
+        "reference_type": transaction.reference_type or None,
+        "reference_id": transaction.reference_id or None,
+        "performed_by_user_id": transaction.performed_by_user_id,
+        "performed_by_username": transaction.performed_by_username or None,
+        "resulting_on_hand_qty": transaction.resulting_on_hand_qty,
+        "resulting_available_qty": transaction.resulting_available_qty,
+        "notes": transaction.notes or None,
+        "lot_number": transaction.lot_number or None,
+        "serial_number": transaction.serial_number or None,
+    }
+
+
 def stock_transaction_to_orm(transaction: StockTransaction) -> StockTransactionORM:
-    return StockTransactionORM(
-        id=transaction.id,
-        organization_id=transaction.organization_id,
-        transaction_number=transaction.transaction_number,
-        stock_item_id=transaction.stock_item_id,
-        storeroom_id=transaction.storeroom_id,
-        transaction_type=transaction.transaction_type,
-        quantity=transaction.quantity,
-        uom=transaction.uom,
-        unit_cost=transaction.unit_cost,
-        transaction_at=transaction.transaction_at,
-        reference_type=transaction.reference_type or None,
-        reference_id=transaction.reference_id or None,
-        performed_by_user_id=transaction.performed_by_user_id,
-        performed_by_username=transaction.performed_by_username or None,
-        resulting_on_hand_qty=transaction.resulting_on_hand_qty,
-        resulting_available_qty=transaction.resulting_available_qty,
-        notes=transaction.notes or None,
-        lot_number=transaction.lot_number or None,
-        serial_number=transaction.serial_number or None,
-    )
+    return StockTransactionORM(**stock_transaction_to_row(transaction))
 
 
 def stock_transaction_from_orm(obj: StockTransactionORM) -> StockTransaction:
@@ -368,6 +372,7 @@ __all__ = [
     "stock_reservation_to_orm",
     "stock_transaction_from_orm",
     "stock_transaction_to_orm",
+    "stock_transaction_to_row",
     "storage_location_from_orm",
     "storage_location_to_orm",
     "storeroom_from_orm",
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import Sequence
+
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
 from src.core.modules.inventory_procurement.contracts.repositories.inventory import (
@@ -21,6 +23,7 @@ from src.core.modules.inventory_procurement.domain.inventory.stock import (
     StockBalance,
     StockReservation,
     StockTransaction,
+    StockTransactionType,
     Storeroom,
 )
 from src.core.modules.inventory_procurement.infrastructure.persistence.mappers.inventory import (
@@ -34,11 +37,13 @@ from src.core.modules.inventory_procurement.infrastructure.persistence.mappers.i
     stock_reservation_to_orm,
     stock_transaction_from_orm,
     stock_transaction_to_orm,
+    stock_transaction_to_row,
     storage_location_from_orm,
     storage_location_to_orm,
     storeroom_from_orm,
     storeroom_to_orm,
 )
+from src.core.modules.inventory_procurement.infrastructure.persistence.orm.catalog import StockItemORM
 from src.core.modules.inventory_procurement.infrastructure.persistence.orm.inventory import (
     CycleCountORM,
     ReorderPolicyORM,
@@ -55,8 +60,25 @@ from src.core.platform.application.tenant.tenancy.tenant_context import (
     TenantContextService,
     require_tenant_context_service,
 )
+from src.infra.persistence.db.bulk import bulk_insert
 from src.infra.persistence.db.optimistic import update_with_version_check
 
+_STOCK_TRANSACTION_SORT_COLUMNS = {
+    "transaction_number": (StockTransactionORM.transaction_number,),
+    "transaction_type": (StockTransactionORM.transaction_type,),
+    "transaction_at": (StockTransactionORM.transaction_at,),
+    "quantity": (StockTransactionORM.quantity,),
+    "stock_item": (
+        select(StockItemORM.name)
+        .where(StockItemORM.id == StockTransactionORM.stock_item_id)
+        .scalar_subquery(),
+        select(StoreroomORM.name)
+        .where(StoreroomORM.id == StockTransactionORM.storeroom_id)
+        .scalar_subquery(),
+    ),
+    "reference": (StockTransactionORM.reference_type, StockTransactionORM.reference_id),
+}
+
 
 class SqlAlchemyStoreroomRepository(StoreroomRepository, InventoryTenantScopedRepositorySupport):
     _repository_label = "Storeroom repository"
@@ -276,6 +298,15 @@ class SqlAlchemyStockTransactionRepository(
         self._stamp_scope(ctx, orm)
         self.session.add(orm)
 
+    def add_many(self, transactions: list[StockTransaction]) -> None:
+        if not transactions:
+            return
+        ctx = self._context(operation_label="add stock transactions")
+        rows = [stock_transaction_to_row(transaction) for transaction in transactions]
+        for row in rows:
+            self._stamp_scope_values(ctx, StockTransactionORM, row)
+        bulk_insert(self.session, StockTransactionORM, rows)
+
     def get(self, transaction_id: str) -> StockTransaction | None:
         obj = self._get_in_scope(
             StockTransactionORM,
@@ -318,6 +349,111 @@ class SqlAlchemyStockTransactionRepository(
         ).scalars().all()
         return [stock_transaction_from_orm(row) for row in rows]
 
+    def list_page_for_organization(
+        self,
+        organization_id: str,
+        *,
+        offset: int = 0,
+        limit: int = 200,
+        stock_item_id: str | None = None,
+        storeroom_ids: Sequence[str] | None = None,
+        transaction_type: str | None = None,
+        search_text: str | None = None,
+        sort_key: str | None = None,
+        ascending: bool = False,
+    ) -> list[StockTransaction]:
+        sort_columns = _STOCK_TRANSACTION_SORT_COLUMNS.get(sort_key or "transaction_at")
+        if sort_columns is None:
+            raise ValueError(f"Unsupported stock transaction sort key '{sort_key}'.")
+        stmt = self._filtered_page_statement(
+            select(StockTransactionORM),
+            organization_id,
+            operation_label="list stock transaction page",
+            stock_item_id=stock_item_id,
+            storeroom_ids=storeroom_ids,
+            transaction_type=transaction_type,
+            search_text=search_text,
+        )
+        if stmt is None:
+            return []
+        rows = self.session.execute(
+            stmt.order_by(
+                *(column.asc() if ascending else column.desc() for column in sort_columns),
+                StockTransactionORM.id.asc(),
+            )
+            .offset(max(0, int(offset or 0)))
+            .limit(max(1, int(limit or 200)))
+        ).scalars().all()
+        return [stock_transaction_from_orm(row) for row in rows]
+
+    def count_for_organization(
+        self,
+        organization_id: str,
+        *,
+        stock_item_id: str | None = None,
+        storeroom_ids: Sequence[str] | None = None,
+        transaction_type: str | None = None,
+        search_text: str | None = None,
+    ) -> int:
+        stmt = self._filtered_page_statement(
+            select(func.count()).select_from(StockTransactionORM),
+            organization_id,
+            operation_label="count stock transactions",
+            stock_item_id=stock_item_id,
+            storeroom_ids=storeroom_ids,
+            transaction_type=transaction_type,
+            search_text=search_text,
+        )
+        return 0 if stmt is None else int(self.session.execute(stmt).scalar_one())
+
+    def _filtered_page_statement(
+        self,
+        stmt,
+        organization_id: str,
+        *,
+        operation_label: str,
+        stock_item_id: str | None,
+        storeroom_ids: Sequence[str] | None,
+        transaction_type: str | None,
+        search_text: str | None,
+    ):
+        ctx = self._context(operation_label=operation_label)
+        if not self._organization_in_scope(ctx, organization_id):
+            return None
+        stmt = stmt.where(StockTransactionORM.organization_id == organization_id)
+        stmt = self._apply_scope(stmt, StockTransactionORM, ctx)
+        if stock_item_id is not None:
+            stmt = stmt.where(StockTransactionORM.stock_item_id == stock_item_id)
+        if storeroom_ids is not None:
+            stmt = stmt.where(StockTransactionORM.storeroom_id.in_(list(storeroom_ids)))
+        if transaction_type is not None:
+            stmt = stmt.where(StockTransactionORM.transaction_type == StockTransactionType(transaction_type))
+        needle = (search_text or "").strip()
+        if needle:
+            pattern = f"%{needle}%"
+            stmt = stmt.where(
+                or_(
+                    StockTransactionORM.transaction_number.ilike(pattern),
+                    StockTransactionORM.reference_type.ilike(pattern),
+                    StockTransactionORM.reference_id.ilike(pattern),
+                    StockTransactionORM.performed_by_username.ilike(pattern),
+                    StockTransactionORM.notes.ilike(pattern),
+                    StockTransactionORM.stock_item_id.in_(
+                        select(StockItemORM.id).where(
+                            StockItemORM.organization_id == organization_id,
+                            or_(StockItemORM.item_code.ilike(pattern), StockItemORM.name.ilike(pattern)),
+                        )
+                    ),
+                    StockTransactionORM.storeroom_id.in_(
+                        select(StoreroomORM.id).where(
+                            StoreroomORM.organization_id == organization_id,
+                            or_(StoreroomORM.storeroom_code.ilike(pattern), StoreroomORM.name.ilike(pattern)),
+                        )
+                    ),
+                )
+            )
+        return stmt
+
 
 class SqlAlchemyStockReservationRepository(
     StockReservationRepository, InventoryTenantScopedRepositorySupport
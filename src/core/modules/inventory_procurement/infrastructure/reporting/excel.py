@@ -9,9 +9,15 @@ from src.core.modules.inventory_procurement.infrastructure.reporting.models impo
     ProcurementOverviewReport,
     StockStatusReport,
 )
+from src.core.platform.application.data_operations.exporting.excel_sheet_writer import ExcelSheetWriter
 
 
 class InventoryExcelReportRenderer:
+    """Inventory report workbooks, written in openpyxl's write-only mode.
+
+    Rows are streamed to disk as they are appended, through the shared
+    ``ExcelSheetWriter`` and its reused per-column cell styles."""
+
     def __init__(self) -> None:
         self._header_font = Font(bold=True)
         self._title_font = Font(bold=True, size=14)
@@ -23,12 +29,22 @@ class InventoryExcelReportRenderer:
             top=Side(style="thin"),
             bottom=Side(style="thin"),
         )
+        self._cell_styles = {
+            "title": {"font": self._title_font},
+            "label": {"font": self._header_font},
+            "header": {
+                "font": self._header_font,
+                "fill": self._header_fill,
+                "alignment": self._center,
+                "border": self._thin_border,
+            },
+            "cell": {"border": self._thin_border},
+        }
 
     def render_stock_status(self, report: StockStatusReport, output_path: Path) -> Path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        workbook = Workbook()
-        summary = workbook.active
-        summary.title = "Summary"
+        workbook = Workbook(write_only=True)
+        summary = self._sheet(workbook, "Summary", (("A", 30), ("B", 22)))
 
         self._write_metric_sheet(
             summary,
@@ -37,7 +53,26 @@ class InventoryExcelReportRenderer:
             summary_metrics=report.summary,
         )
 
-        balances = workbook.create_sheet("Balances")
+        balances = self._sheet(
+            workbook,
+            "Balances",
+            (
+                ("A", 18),
+                ("B", 28),
+                ("C", 18),
+                ("D", 24),
+                ("E", 14),
+                ("F", 12),
+                ("G", 14),
+                ("H", 14),
+                ("I", 14),
+                ("J", 14),
+                ("K", 14),
+                ("L", 16),
+                ("M", 22),
+                ("N", 22),
+            ),
+        )
         headers = (
             "Item Code",
             "Item Name",
@@ -55,7 +90,7 @@ class InventoryExcelReportRenderer:
             "Last Issue",
         )
         self._write_header_row(balances, headers)
-        for row_index, row in enumerate(report.rows, start=2):
+        for row in report.rows:
             values = (
                 row.item_code,
                 row.item_name,
@@ -72,26 +107,7 @@ class InventoryExcelReportRenderer:
                 row.last_receipt_at,
                 row.last_issue_at,
             )
-            self._write_data_row(balances, row_index, values)
-        self._set_widths(
-            balances,
-            (
-                ("A", 18),
-                ("B", 28),
-                ("C", 18),
-                ("D", 24),
-                ("E", 14),
-                ("F", 12),
-                ("G", 14),
-                ("H", 14),
-                ("I", 14),
-                ("J", 14),
-                ("K", 14),
-                ("L", 16),
-                ("M", 22),
-                ("N", 22),
-            ),
-        )
+            self._write_data_row(balances, values)
         workbook.save(output_path)
         return output_path
 
@@ -101,9 +117,8 @@ class InventoryExcelReportRenderer:
         output_path: Path,
     ) -> Path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        workbook = Workbook()
-        summary = workbook.active
-        summary.title = "Summary"
+        workbook = Workbook(write_only=True)
+        summary = self._sheet(workbook, "Summary", (("A", 30), ("B", 22)))
 
         self._write_metric_sheet(
             summary,
@@ -112,7 +127,23 @@ class InventoryExcelReportRenderer:
             summary_metrics=report.summary,
         )
 
-        requisitions = workbook.create_sheet("Requisitions")
+        requisitions = self._sheet(
+            workbook,
+            "Requisitions",
+            (
+                ("A", 20),
+                ("B", 18),
+                ("C", 14),
+                ("D", 18),
+                ("E", 18),
+                ("F", 14),
+                ("G", 12),
+                ("H", 10),
+                ("I", 14),
+                ("J", 14),
+                ("K", 28),
+            ),
+        )
         self._write_header_row(
             requisitions,
             (
@@ -129,10 +160,9 @@ class InventoryExcelReportRenderer:
                 "Purpose",
             ),
         )
-        for row_index, row in enumerate(report.requisitions, start=2):
+        for row in report.requisitions:
             self._write_data_row(
                 requisitions,
-                row_index,
                 (
                     row.requisition_number,
                     row.status,
@@ -147,24 +177,25 @@ class InventoryExcelReportRenderer:
                     row.purpose,
                 ),
             )
-        self._set_widths(
-            requisitions,
+
+        purchase_orders = self._sheet(
+            workbook,
+            "Purchase Orders",
             (
                 ("A", 20),
                 ("B", 18),
                 ("C", 14),
                 ("D", 18),
-                ("E", 18),
-                ("F", 14),
-                ("G", 12),
-                ("H", 10),
+                ("E", 14),
+                ("F", 18),
+                ("G", 10),
+                ("H", 14),
                 ("I", 14),
                 ("J", 14),
-                ("K", 28),
+                ("K", 14),
+                ("L", 12),
             ),
         )
-
-        purchase_orders = workbook.create_sheet("Purchase Orders")
         self._write_header_row(
             purchase_orders,
             (
@@ -182,10 +213,9 @@ class InventoryExcelReportRenderer:
                 "Currency",
             ),
         )
-        for row_index, row in enumerate(report.purchase_orders, start=2):
+        for row in report.purchase_orders:
             self._write_data_row(
                 purchase_orders,
-                row_index,
                 (
                     row.po_number,
                     row.status,
@@ -201,25 +231,23 @@ class InventoryExcelReportRenderer:
                     row.currency_code,
                 ),
             )
-        self._set_widths(
-            purchase_orders,
+
+        receipts = self._sheet(
+            workbook,
+            "Receipts",
             (
                 ("A", 20),
-                ("B", 18),
+                ("B", 20),
                 ("C", 14),
-                ("D", 18),
-                ("E", 14),
-                ("F", 18),
+                ("D", 14),
+                ("E", 18),
+                ("F", 22),
                 ("G", 10),
                 ("H", 14),
                 ("I", 14),
-                ("J", 14),
-                ("K", 14),
-                ("L", 12),
+                ("J", 18),
             ),
         )
-
-        receipts = workbook.create_sheet("Receipts")
         self._write_header_row(
             receipts,
             (
@@ -235,10 +263,9 @@ class InventoryExcelReportRenderer:
                 "Received By",
             ),
         )
-        for row_index, row in enumerate(report.receipts, start=2):
+        for row in report.receipts:
             self._write_data_row(
                 receipts,
-                row_index,
                 (
                     row.receipt_number,
                     row.purchase_order_number,
@@ -252,62 +279,33 @@ class InventoryExcelReportRenderer:
                     row.received_by_username,
                 ),
             )
-        self._set_widths(
-            receipts,
-            (
-                ("A", 20),
-                ("B", 20),
-                ("C", 14),
-                ("D", 14),
-                ("E", 18),
-                ("F", 22),
-                ("G", 10),
-                ("H", 14),
-                ("I", 14),
-                ("J", 18),
-            ),
-        )
 
         workbook.save(output_path)
         return output_path
 
-    def _write_metric_sheet(self, sheet, *, title, filters, summary_metrics) -> None:
-        sheet["A1"] = title
-        sheet["A1"].font = self._title_font
-        row = 3
-        row = self._write_metric_block(sheet, row, "Filters", filters)
-        row += 1
-        self._write_metric_block(sheet, row, "Summary", summary_metrics)
-        self._set_widths(sheet, (("A", 30), ("B", 22)))
+    def _sheet(self, workbook: Workbook, title: str, widths) -> ExcelSheetWriter:
+        return ExcelSheetWriter(workbook, title, styles=self._cell_styles, widths=widths)
 
-    def _write_metric_block(self, sheet, row: int, title: str, metrics) -> int:
-        sheet[f"A{row}"] = title
-        sheet[f"A{row}"].font = self._header_font
-        row += 1
-        self._write_header_row(sheet, ("Metric", "Value"), row=row)
-        row += 1
-        for metric in metrics:
-            self._write_data_row(sheet, row, (metric.label, metric.value))
-            row += 1
-        return row
+    def _write_metric_sheet(self, sheet: ExcelSheetWriter, *, title, filters, summary_metrics) -> None:
+        sheet.append([title], "title")
+        sheet.blank()
+        self._write_metric_block(sheet, "Filters", filters)
+        sheet.blank()
+        self._write_metric_block(sheet, "Summary", summary_metrics)
 
-    def _write_header_row(self, sheet, headers, *, row: int = 1) -> None:
-        for column_index, header in enumerate(headers, start=1):
-            cell = sheet.cell(row=row, column=column_index, value=header)
-            cell.font = self._header_font
-            cell.fill = self._header_fill
-            cell.alignment = self._center
-            cell.border = self._thin_border
+    def _write_metric_block(self, sheet: ExcelSheetWriter, title: str, metrics) -> None:
+        sheet.append([title], "label")
+        self._write_header_row(sheet, ("Metric", "Value"))
+        for metric in metrics:
+            self._write_data_row(sheet, (metric.label, metric.value))
 
-    def _write_data_row(self, sheet, row_index: int, values) -> None:
-        for column_index, value in enumerate(values, start=1):
-            cell = sheet.cell(row=row_index, column=column_index, value=value)
-            cell.border = self._thin_border
+    @staticmethod
+    def _write_header_row(sheet: ExcelSheetWriter, headers) -> None:
+        sheet.append(tuple(headers), "header")
 
     @staticmethod
-    def _set_widths(sheet, widths) -> None:
-        for column, width in widths:
-            sheet.column_dimensions[column].width = width
+    def _write_data_row(sheet: ExcelSheetWriter, values) -> None:
+        sheet.append(tuple(values), "cell")
 
 
 __all__ = ["InventoryExcelReportRenderer"]
@@ -37,6 +37,7 @@ from src.core.modules.maintenance.api.desktop.dashboard import (
 )
 from src.core.modules.maintenance.api.desktop.planner import (
     MaintenancePlannerDesktopApi,
+    MaintenancePlannerLanePageDescriptor,
     MaintenancePlannerMaterialRiskRowDescriptor,
     MaintenancePlannerMetricDescriptor,
     MaintenancePlannerOverviewDescriptor,
@@ -78,6 +79,8 @@ from src.core.modules.maintenance.api.desktop.reliability import (
     MaintenanceReliabilityRecurringRowDescriptor,
     MaintenanceReliabilitySnapshotDescriptor,
     MaintenanceReliabilitySuggestionRowDescriptor,
+    MaintenanceSensorTrendDescriptor,
+    MaintenanceSensorTrendPointDescriptor,
     build_maintenance_reliability_desktop_api,
 )
 from src.core.modules.maintenance.api.desktop.workspaces import (
@@ -134,6 +137,7 @@ __all__ = [
     "MaintenanceLocationOptionDescriptor",
     "MaintenanceLocationUpdateCommand",
     "MaintenancePlannerDesktopApi",
+    "MaintenancePlannerLanePageDescriptor",
     "MaintenancePlannerMaterialRiskRowDescriptor",
     "MaintenancePlannerMetricDescriptor",
     "MaintenancePlannerOverviewDescriptor",
@@ -162,6 +166,8 @@ __all__ = [
     "MaintenanceReliabilityRecurringRowDescriptor",
     "MaintenanceReliabilitySnapshotDescriptor",
     "MaintenanceReliabilitySuggestionRowDescriptor",
+    "MaintenanceSensorTrendDescriptor",
+    "MaintenanceSensorTrendPointDescriptor",
     "MaintenanceSiteOptionDescriptor",
     "MaintenanceSystemCreateCommand",
     "MaintenanceSystemDesktopDto",
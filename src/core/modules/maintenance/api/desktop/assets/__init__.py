@@ -5,6 +5,7 @@ from src.core.modules.maintenance.api.desktop.assets.api import (
 from src.core.modules.maintenance.api.desktop.assets.models import (
     MaintenanceAssetCreateCommand,
     MaintenanceAssetDesktopDto,
+    MaintenanceAssetSubtreeDesktopDto,
     MaintenanceAssetUpdateCommand,
     MaintenanceComponentCreateCommand,
     MaintenanceComponentDesktopDto,
@@ -33,6 +34,7 @@ __all__ = [
     "MaintenanceAssetDesktopDto",
     "MaintenanceAssetOptionDescriptor",
     "MaintenanceAssetsDesktopApi",
+    "MaintenanceAssetSubtreeDesktopDto",
     "MaintenanceAssetUpdateCommand",
     "MaintenanceBusinessPartyOptionDescriptor",
     "MaintenanceComponentCreateCommand",
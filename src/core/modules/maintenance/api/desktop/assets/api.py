@@ -10,6 +10,7 @@ from src.core.modules.maintenance.api.desktop._support import format_enum_label
 from src.core.modules.maintenance.api.desktop.assets.models import (
     MaintenanceAssetCreateCommand,
     MaintenanceAssetDesktopDto,
+    MaintenanceAssetSubtreeDesktopDto,
     MaintenanceAssetUpdateCommand,
     MaintenanceComponentCreateCommand,
     MaintenanceComponentDesktopDto,
@@ -29,6 +30,7 @@ from src.core.modules.maintenance.api.desktop.assets.serializers import (
     component_label,
     location_label,
     serialize_asset,
+    serialize_asset_subtree,
     serialize_component,
     serialize_location,
     serialize_system,
@@ -409,6 +411,9 @@ class MaintenanceAssetsDesktopApi:
             )
         )
 
+    def summarize_asset_subtree(self, asset_id: str) -> MaintenanceAssetSubtreeDesktopDto:
+        return serialize_asset_subtree(self._require_asset_service().summarize_asset_subtree(asset_id))
+
     def create_asset(
         self,
         command: MaintenanceAssetCreateCommand,
@@ -106,6 +106,17 @@ class MaintenanceAssetDesktopDto:
     version: int
 
 
+@dataclass(frozen=True)
+class MaintenanceAssetSubtreeDesktopDto:
+    asset_id: str
+    asset_count: int
+    max_depth: int
+    work_order_count: int
+    open_work_order_count: int
+    downtime_minutes: int
+    material_requirement_count: int
+
+
 @dataclass(frozen=True)
 class MaintenanceComponentDesktopDto:
     id: str
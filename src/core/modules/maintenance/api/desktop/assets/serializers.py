@@ -13,6 +13,7 @@ from src.core.modules.maintenance.api.desktop._support import (
 )
 from src.core.modules.maintenance.api.desktop.assets.models import (
     MaintenanceAssetDesktopDto,
+    MaintenanceAssetSubtreeDesktopDto,
     MaintenanceComponentDesktopDto,
     MaintenanceLocationDesktopDto,
     MaintenanceSystemDesktopDto,
@@ -199,6 +200,18 @@ def component_label(row) -> str:
     return code_name_label(getattr(row, "component_code", ""), getattr(row, "name", ""))
 
 
+def serialize_asset_subtree(summary) -> MaintenanceAssetSubtreeDesktopDto:
+    return MaintenanceAssetSubtreeDesktopDto(
+        asset_id=summary.asset_id,
+        asset_count=int(summary.asset_count),
+        max_depth=int(summary.max_depth),
+        work_order_count=int(summary.work_order_count),
+        open_work_order_count=int(summary.open_work_order_count),
+        downtime_minutes=int(summary.downtime_minutes),
+        material_requirement_count=int(summary.material_requirement_count),
+    )
+
+
 def build_lookup(rows, *, label_getter) -> dict[str, str]:
     return {
         row.id: label_getter(row)
@@ -213,6 +226,7 @@ __all__ = [
     "component_label",
     "location_label",
     "serialize_asset",
+    "serialize_asset_subtree",
     "serialize_component",
     "serialize_location",
     "serialize_system",
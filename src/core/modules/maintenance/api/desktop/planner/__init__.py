@@ -6,7 +6,11 @@ from src.core.modules.maintenance.api.desktop.planner.models import (
     MAINTENANCE_PLANNER_ALL_REQUESTS,
     MAINTENANCE_PLANNER_ALL_WORK_ORDERS,
     MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS,
+    MAINTENANCE_PLANNER_MATERIAL_LANE,
     MAINTENANCE_PLANNER_OPEN_REQUESTS,
+    MAINTENANCE_PLANNER_REQUEST_LANE,
+    MAINTENANCE_PLANNER_WORK_ORDER_LANE,
+    MaintenancePlannerLanePageDescriptor,
     MaintenancePlannerMaterialRiskRowDescriptor,
     MaintenancePlannerMetricDescriptor,
     MaintenancePlannerOverviewDescriptor,
@@ -22,8 +26,12 @@ __all__ = [
     "MAINTENANCE_PLANNER_ALL_REQUESTS",
     "MAINTENANCE_PLANNER_ALL_WORK_ORDERS",
     "MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS",
+    "MAINTENANCE_PLANNER_MATERIAL_LANE",
     "MAINTENANCE_PLANNER_OPEN_REQUESTS",
+    "MAINTENANCE_PLANNER_REQUEST_LANE",
+    "MAINTENANCE_PLANNER_WORK_ORDER_LANE",
     "MaintenancePlannerDesktopApi",
+    "MaintenancePlannerLanePageDescriptor",
     "MaintenancePlannerMaterialRiskRowDescriptor",
     "MaintenancePlannerMetricDescriptor",
     "MaintenancePlannerOverviewDescriptor",
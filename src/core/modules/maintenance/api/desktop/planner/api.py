@@ -15,20 +15,22 @@ from src.core.modules.maintenance.api.desktop.planner.models import (
     MAINTENANCE_PLANNER_ALL_REQUESTS,
     MAINTENANCE_PLANNER_ALL_WORK_ORDERS,
     MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS,
+    MAINTENANCE_PLANNER_MATERIAL_LANE,
     MAINTENANCE_PLANNER_OPEN_REQUESTS,
+    MAINTENANCE_PLANNER_REQUEST_LANE,
+    MAINTENANCE_PLANNER_WORK_ORDER_LANE,
+    MaintenancePlannerLanePageDescriptor,
     MaintenancePlannerMetricDescriptor,
     MaintenancePlannerOverviewDescriptor,
     MaintenancePlannerQueueDescriptor,
     MaintenancePlannerSnapshotDescriptor,
 )
 from src.core.modules.maintenance.api.desktop.planner.serializers import (
-    request_search_blob,
     serialize_material_risk_row,
     serialize_preventive_row,
     serialize_recurring_row,
     serialize_request_row,
     serialize_work_order_row,
-    work_order_search_blob,
 )
 from src.core.modules.maintenance.api.desktop.shared_options import (
     MaintenanceAssetOptionDescriptor,
@@ -38,8 +40,13 @@ from src.core.modules.maintenance.api.desktop.shared_options import (
     serialize_site_option,
     serialize_system_option,
 )
+from src.core.modules.maintenance.application.common.planner_lanes import (
+    MAINTENANCE_PLANNER_LANE_PAGE_SIZE,
+    MaintenancePlannerLane,
+)
 from src.core.modules.maintenance.domain import MaintenanceWorkOrderStatus, MaintenanceWorkRequestStatus
 from src.core.platform.application.master_data.site.site_service import SiteService
+from src.core.platform.common.exceptions import ValidationError
 
 _OPEN_REQUEST_STATUSES = {
     MaintenanceWorkRequestStatus.NEW.value,
@@ -53,6 +60,9 @@ _CLOSED_WORK_ORDER_STATUSES = {
     MaintenanceWorkOrderStatus.CLOSED.value,
     MaintenanceWorkOrderStatus.CANCELLED.value,
 }
+_BACKLOG_WORK_ORDER_STATUSES = {
+    status.value for status in MaintenanceWorkOrderStatus
+} - _CLOSED_WORK_ORDER_STATUSES
 _MATERIAL_RISK_STATUSES = {
     "PLANNED",
     "SHORTAGE_IDENTIFIED",
@@ -230,6 +240,7 @@ class MaintenancePlannerDesktopApi:
         request_queue: str = MAINTENANCE_PLANNER_OPEN_REQUESTS,
         work_order_queue: str = MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS,
         search_text: str = "",
+        page_size: int = MAINTENANCE_PLANNER_LANE_PAGE_SIZE,
     ) -> MaintenancePlannerSnapshotDescriptor:
         site_options = self.list_sites(active_only=None)
         selected_site_id = self._resolve_option_value(site_id, site_options)
@@ -241,7 +252,6 @@ class MaintenancePlannerDesktopApi:
         selected_request_queue = self._resolve_queue_value(request_queue, request_queue_options)
         work_order_queue_options = self.list_work_order_queue_options()
         selected_work_order_queue = self._resolve_queue_value(work_order_queue, work_order_queue_options)
-        normalized_search = str(search_text or "").strip().lower()
 
         if self._work_request_service is None or self._work_order_service is None:
             return MaintenancePlannerSnapshotDescriptor(
@@ -260,24 +270,29 @@ class MaintenancePlannerDesktopApi:
                 empty_state="Maintenance planner desktop API is not fully connected.",
             )
 
-        request_rows = list(
-            self._work_request_service.list_work_requests(
-                site_id=selected_site_id or None,
-                asset_id=selected_asset_id or None,
-                system_id=selected_system_id or None,
-            )
+        request_lane = self._request_lane(
+            site_id=selected_site_id,
+            asset_id=selected_asset_id,
+            system_id=selected_system_id,
+            request_queue=selected_request_queue,
+            search_text=search_text,
+            page_size=page_size,
         )
-        work_order_rows = list(
-            self._work_order_service.list_work_orders(
-                site_id=selected_site_id or None,
-                asset_id=selected_asset_id or None,
-                system_id=selected_system_id or None,
-            )
+        work_order_lane = self._work_order_lane(
+            site_id=selected_site_id,
+            asset_id=selected_asset_id,
+            system_id=selected_system_id,
+            work_order_queue=selected_work_order_queue,
+            search_text=search_text,
+            page_size=page_size,
         )
-        material_requirement_rows = (
-            list(self._material_requirement_service.list_requirements())
-            if self._material_requirement_service is not None
-            else []
+        material_lane = self._material_lane(
+            site_id=selected_site_id,
+            asset_id=selected_asset_id,
+            system_id=selected_system_id,
+            work_order_queue=selected_work_order_queue,
+            search_text=search_text,
+            page_size=page_size,
         )
         preventive_plans = (
             list(
@@ -298,7 +313,7 @@ class MaintenancePlannerDesktopApi:
                     site_id=selected_site_id or None,
                 )
             )
-            if self._preventive_generation_service is not None
+            if self._preventive_generation_service is not None and preventive_plans
             else []
         )
         recurring_rows = (
@@ -320,53 +335,24 @@ class MaintenancePlannerDesktopApi:
             else []
         )
 
-        if selected_request_queue == MAINTENANCE_PLANNER_OPEN_REQUESTS:
-            request_rows = [
-                row
-                for row in request_rows
-                if getattr(getattr(row, "status", None), "value", "") in _OPEN_REQUEST_STATUSES
-            ]
-        elif selected_request_queue != MAINTENANCE_PLANNER_ALL_REQUESTS:
-            request_rows = [
-                row
-                for row in request_rows
-                if getattr(getattr(row, "status", None), "value", "") == selected_request_queue
-            ]
-        if selected_work_order_queue == MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS:
-            work_order_rows = [
-                row
-                for row in work_order_rows
-                if getattr(getattr(row, "status", None), "value", "") not in _CLOSED_WORK_ORDER_STATUSES
-            ]
-        elif selected_work_order_queue != MAINTENANCE_PLANNER_ALL_WORK_ORDERS:
-            work_order_rows = [
-                row
-                for row in work_order_rows
-                if getattr(getattr(row, "status", None), "value", "") == selected_work_order_queue
-            ]
-        if normalized_search:
-            request_rows = [row for row in request_rows if normalized_search in request_search_blob(row)]
-            work_order_rows = [row for row in work_order_rows if normalized_search in work_order_search_blob(row)]
-
         site_lookup = {option.value: option.label for option in site_options}
         asset_lookup = {option.value: option.label for option in asset_options}
         system_lookup = {option.value: option.label for option in system_options}
-        work_order_descriptors = tuple(serialize_work_order_row(row) for row in work_order_rows)
-        work_order_label_lookup = {
-            row.id: descriptor.work_order_label
-            for row, descriptor in zip(work_order_rows, work_order_descriptors)
-        }
-        work_order_ids = set(work_order_label_lookup)
-        preventive_candidate_lookup = {row.plan_id: row for row in preventive_candidates}
-        material_rows = tuple(
-            serialize_material_risk_row(
+        request_rows = tuple(
+            serialize_request_row(
                 row,
-                work_order_label=work_order_label_lookup.get(row.work_order_id, row.work_order_id),
+                site_lookup=site_lookup,
+                asset_lookup=asset_lookup,
+                system_lookup=system_lookup,
             )
-            for row in material_requirement_rows
-            if row.work_order_id in work_order_ids
-            and getattr(getattr(row, "procurement_status", None), "value", "") in _MATERIAL_RISK_STATUSES
+            for row in request_lane.items
         )
+        work_order_rows = tuple(serialize_work_order_row(row) for row in work_order_lane.items)
+        material_rows = self._serialize_material_rows(
+            material_lane.items,
+            work_order_label_lookup={row.id: row.work_order_label for row in work_order_rows},
+        )
+        preventive_candidate_lookup = {row.plan_id: row for row in preventive_candidates}
         preventive_rows = tuple(
             sorted(
                 (
@@ -398,12 +384,12 @@ class MaintenancePlannerDesktopApi:
             metrics=(
                 MaintenancePlannerMetricDescriptor(
                     "Open Requests",
-                    str(len(request_rows)),
+                    str(request_lane.total),
                     "Intake still needing planner attention",
                 ),
                 MaintenancePlannerMetricDescriptor(
                     "Backlog Orders",
-                    str(len(work_order_rows)),
+                    str(work_order_lane.total),
                     "Orders still in planning or execution queues",
                 ),
                 MaintenancePlannerMetricDescriptor(
@@ -413,7 +399,7 @@ class MaintenancePlannerDesktopApi:
                 ),
                 MaintenancePlannerMetricDescriptor(
                     "Material Risks",
-                    str(len(material_rows)),
+                    str(material_lane.total),
                     "Requirements not yet fully ready",
                 ),
                 MaintenancePlannerMetricDescriptor(
@@ -437,16 +423,8 @@ class MaintenancePlannerDesktopApi:
             work_order_queue_options=work_order_queue_options,
             selected_work_order_queue=selected_work_order_queue,
             search_text=search_text,
-            request_rows=tuple(
-                serialize_request_row(
-                    row,
-                    site_lookup=site_lookup,
-                    asset_lookup=asset_lookup,
-                    system_lookup=system_lookup,
-                )
-                for row in request_rows
-            ),
-            work_order_rows=work_order_descriptors,
+            request_rows=request_rows,
+            work_order_rows=work_order_rows,
             material_rows=material_rows,
             preventive_rows=preventive_rows,
             recurring_rows=tuple(
@@ -456,9 +434,183 @@ class MaintenancePlannerDesktopApi:
                 )
                 for row in recurring_rows
             ),
+            request_total=request_lane.total,
+            request_next_token=request_lane.next_token,
+            work_order_total=work_order_lane.total,
+            work_order_next_token=work_order_lane.next_token,
+            material_total=material_lane.total,
+            material_next_token=material_lane.next_token,
             empty_state="" if any((request_rows, work_order_rows, material_rows, preventive_rows, recurring_rows)) else "No planner items match the current filters.",
         )
 
+    def load_lane_page(
+        self,
+        lane: str,
+        *,
+        page_token: str,
+        site_id: str | None = None,
+        asset_id: str | None = None,
+        system_id: str | None = None,
+        request_queue: str = MAINTENANCE_PLANNER_OPEN_REQUESTS,
+        work_order_queue: str = MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS,
+        search_text: str = "",
+        page_size: int = MAINTENANCE_PLANNER_LANE_PAGE_SIZE,
+    ) -> MaintenancePlannerLanePageDescriptor:
+        """The next page of one lane, continuing from a ``*_next_token`` of
+        the snapshot or of a previous page built with the same filters."""
+        if self._work_request_service is None or self._work_order_service is None:
+            return MaintenancePlannerLanePageDescriptor(lane=lane)
+        filters = {
+            "site_id": str(site_id or "").strip(),
+            "asset_id": str(asset_id or "").strip(),
+            "system_id": str(system_id or "").strip(),
+            "search_text": search_text,
+            "page_size": page_size,
+            "page_token": page_token,
+        }
+        if lane == MAINTENANCE_PLANNER_REQUEST_LANE:
+            site_lookup = {option.value: option.label for option in self.list_sites(active_only=None)}
+            asset_lookup = {
+                option.value: option.label
+                for option in self.list_asset_options(active_only=None, site_id=filters["site_id"] or None)
+            }
+            system_lookup = {
+                option.value: option.label
+                for option in self.list_system_options(active_only=None, site_id=filters["site_id"] or None)
+            }
+            request_lane = self._request_lane(request_queue=request_queue, **filters)
+            rows = tuple(
+                serialize_request_row(
+                    row,
+                    site_lookup=site_lookup,
+                    asset_lookup=asset_lookup,
+                    system_lookup=system_lookup,
+                )
+                for row in request_lane.items
+            )
+            return self._lane_page(lane, rows, request_lane)
+        if lane == MAINTENANCE_PLANNER_WORK_ORDER_LANE:
+            work_order_lane = self._work_order_lane(work_order_queue=work_order_queue, **filters)
+            rows = tuple(serialize_work_order_row(row) for row in work_order_lane.items)
+            return self._lane_page(lane, rows, work_order_lane)
+        if lane == MAINTENANCE_PLANNER_MATERIAL_LANE:
+            material_lane = self._material_lane(work_order_queue=work_order_queue, **filters)
+            rows = self._serialize_material_rows(material_lane.items, work_order_label_lookup={})
+            return self._lane_page(lane, rows, material_lane)
+        raise ValidationError(
+            f"Unknown maintenance planner lane: {lane}.",
+            code="MAINTENANCE_PLANNER_LANE_INVALID",
+        )
+
+    def _request_lane(
+        self,
+        *,
+        site_id: str,
+        asset_id: str,
+        system_id: str,
+        request_queue: str,
+        search_text: str,
+        page_size: int,
+        page_token: str = "",
+    ) -> MaintenancePlannerLane:
+        if request_queue == MAINTENANCE_PLANNER_OPEN_REQUESTS:
+            statuses = _OPEN_REQUEST_STATUSES
+        elif request_queue == MAINTENANCE_PLANNER_ALL_REQUESTS:
+            statuses = None
+        else:
+            statuses = {request_queue}
+        return self._work_request_service.list_work_request_lane(
+            site_id=site_id or None,
+            asset_id=asset_id or None,
+            system_id=system_id or None,
+            statuses=statuses,
+            search_text=search_text,
+            page_size=page_size,
+            page_token=page_token,
+        )
+
+    def _work_order_lane(
+        self,
+        *,
+        site_id: str,
+        asset_id: str,
+        system_id: str,
+        work_order_queue: str,
+        search_text: str,
+        page_size: int,
+        page_token: str = "",
+    ) -> MaintenancePlannerLane:
+        return self._work_order_service.list_work_order_lane(
+            site_id=site_id or None,
+            asset_id=asset_id or None,
+            system_id=system_id or None,
+            statuses=self._work_order_statuses(work_order_queue),
+            search_text=search_text,
+            page_size=page_size,
+            page_token=page_token,
+        )
+
+    def _material_lane(
+        self,
+        *,
+        site_id: str,
+        asset_id: str,
+        system_id: str,
+        work_order_queue: str,
+        search_text: str,
+        page_size: int,
+        page_token: str = "",
+    ) -> MaintenancePlannerLane:
+        if self._material_requirement_service is None:
+            return MaintenancePlannerLane(items=(), total=0)
+        return self._material_requirement_service.list_material_risk_lane(
+            procurement_statuses=_MATERIAL_RISK_STATUSES,
+            site_id=site_id or None,
+            asset_id=asset_id or None,
+            system_id=system_id or None,
+            work_order_statuses=self._work_order_statuses(work_order_queue),
+            search_text=search_text,
+            page_size=page_size,
+            page_token=page_token,
+        )
+
+    def _serialize_material_rows(
+        self,
+        rows,
+        *,
+        work_order_label_lookup: dict[str, str],
+    ) -> tuple:
+        labels = dict(work_order_label_lookup)
+        # Risks may sit on work orders beyond the loaded work order page;
+        # those labels are loaded together.
+        missing = {row.work_order_id for row in rows} - labels.keys()
+        if missing:
+            labels.update(
+                (work_order.id, serialize_work_order_row(work_order).work_order_label)
+                for work_order in self._work_order_service.get_work_orders(missing)
+            )
+        return tuple(
+            serialize_material_risk_row(row, work_order_label=labels.get(row.work_order_id, row.work_order_id))
+            for row in rows
+        )
+
+    @staticmethod
+    def _work_order_statuses(work_order_queue: str) -> set[str] | None:
+        if work_order_queue == MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS:
+            return _BACKLOG_WORK_ORDER_STATUSES
+        if work_order_queue == MAINTENANCE_PLANNER_ALL_WORK_ORDERS:
+            return None
+        return {work_order_queue}
+
+    @staticmethod
+    def _lane_page(lane: str, rows: tuple, page: MaintenancePlannerLane) -> MaintenancePlannerLanePageDescriptor:
+        return MaintenancePlannerLanePageDescriptor(
+            lane=lane,
+            rows=rows,
+            total=page.total,
+            next_token=page.next_token,
+        )
+
     @staticmethod
     def _resolve_option_value(value: str | None, options) -> str:
         normalized = str(value or "").strip()
@@ -13,6 +13,9 @@ MAINTENANCE_PLANNER_OPEN_REQUESTS = "OPEN_REQUESTS"
 MAINTENANCE_PLANNER_ALL_REQUESTS = "ALL_REQUESTS"
 MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS = "BACKLOG_WORK_ORDERS"
 MAINTENANCE_PLANNER_ALL_WORK_ORDERS = "ALL_WORK_ORDERS"
+MAINTENANCE_PLANNER_REQUEST_LANE = "requests"
+MAINTENANCE_PLANNER_WORK_ORDER_LANE = "work_orders"
+MAINTENANCE_PLANNER_MATERIAL_LANE = "materials"
 
 
 @dataclass(frozen=True)
@@ -118,14 +121,32 @@ class MaintenancePlannerSnapshotDescriptor:
     material_rows: tuple[MaintenancePlannerMaterialRiskRowDescriptor, ...] = field(default_factory=tuple)
     preventive_rows: tuple[MaintenancePlannerPreventiveRowDescriptor, ...] = field(default_factory=tuple)
     recurring_rows: tuple[MaintenancePlannerRecurringRowDescriptor, ...] = field(default_factory=tuple)
+    request_total: int = 0
+    request_next_token: str = ""
+    work_order_total: int = 0
+    work_order_next_token: str = ""
+    material_total: int = 0
+    material_next_token: str = ""
     empty_state: str = ""
 
 
+@dataclass(frozen=True)
+class MaintenancePlannerLanePageDescriptor:
+    lane: str
+    rows: tuple = field(default_factory=tuple)
+    total: int = 0
+    next_token: str = ""
+
+
 __all__ = [
     "MAINTENANCE_PLANNER_ALL_REQUESTS",
     "MAINTENANCE_PLANNER_ALL_WORK_ORDERS",
     "MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS",
+    "MAINTENANCE_PLANNER_MATERIAL_LANE",
     "MAINTENANCE_PLANNER_OPEN_REQUESTS",
+    "MAINTENANCE_PLANNER_REQUEST_LANE",
+    "MAINTENANCE_PLANNER_WORK_ORDER_LANE",
+    "MaintenancePlannerLanePageDescriptor",
     "MaintenancePlannerMaterialRiskRowDescriptor",
     "MaintenancePlannerMetricDescriptor",
     "MaintenancePlannerOverviewDescriptor",
@@ -764,6 +764,26 @@ class MaintenancePreventiveDesktopApi:
         rows = self._preventive_generation_service.generate_due_work(plan_id=plan_id)
         return tuple(serialize_generation_result(row) for row in rows)
 
+    def generate_all_due_work(
+        self,
+        *,
+        site_id: str | None = None,
+    ) -> tuple[MaintenancePreventiveGenerationResultDescriptor, ...]:
+        """Generate due work for every visible plan, committed in chunks;
+        returns the plans that generated work."""
+        self._require_service(
+            self._preventive_generation_service,
+            "preventive generation service",
+        )
+        report = self._preventive_generation_service.generate_due_work_in_batches(
+            site_id=site_id or None
+        )
+        return tuple(
+            serialize_generation_result(row)
+            for row in report.results
+            if not row.skipped_reason
+        )
+
     def _serialize_plan(self, row) -> MaintenancePreventivePlanDesktopDto:
         plan_task_count_lookup = Counter()
         if self._preventive_plan_task_service is not None:
@@ -11,6 +11,8 @@ from src.core.modules.maintenance.api.desktop.reliability.models import (
     MaintenanceReliabilityRecurringRowDescriptor,
     MaintenanceReliabilitySnapshotDescriptor,
     MaintenanceReliabilitySuggestionRowDescriptor,
+    MaintenanceSensorTrendDescriptor,
+    MaintenanceSensorTrendPointDescriptor,
 )
 
 __all__ = [
@@ -23,5 +25,7 @@ __all__ = [
     "MaintenanceReliabilityRecurringRowDescriptor",
     "MaintenanceReliabilitySnapshotDescriptor",
     "MaintenanceReliabilitySuggestionRowDescriptor",
+    "MaintenanceSensorTrendDescriptor",
+    "MaintenanceSensorTrendPointDescriptor",
     "build_maintenance_reliability_desktop_api",
 ]
@@ -1,22 +1,31 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+
 from src.core.modules.maintenance import (
     MaintenanceAssetService,
     MaintenanceFailureCodeService,
     MaintenanceLocationService,
     MaintenanceReliabilityService,
+    MaintenanceSensorReadingService,
+    MaintenanceSensorService,
     MaintenanceSystemService,
 )
+from src.core.modules.maintenance.application.reliability.sensor_reading_service import DEFAULT_TREND_POINTS
+from src.core.modules.maintenance.api.desktop._support import code_name_label
+from src.core.modules.maintenance.api.desktop.planner.serializers import format_timestamp_label
 from src.core.modules.maintenance.api.desktop.reliability.models import (
     MaintenanceReliabilityChoiceDescriptor,
     MaintenanceReliabilityMetricDescriptor,
     MaintenanceReliabilityOverviewDescriptor,
     MaintenanceReliabilitySnapshotDescriptor,
+    MaintenanceSensorTrendDescriptor,
 )
 from src.core.modules.maintenance.api.desktop.reliability.serializers import (
     serialize_failure_symptom_option,
     serialize_insight_row,
     serialize_recurring_row,
+    serialize_sensor_trend_point,
     serialize_suggestion_row,
 )
 from src.core.modules.maintenance.api.desktop.shared_options import (
@@ -34,6 +43,7 @@ from src.core.platform.application.master_data.site.site_service import SiteServ
 _DAY_CHOICES = (30, 60, 90, 180, 365)
 _LIMIT_CHOICES = (5, 10, 20, 50)
 _THRESHOLD_CHOICES = (2, 3, 4, 5)
+_TREND_GRAIN_LABELS = {"MINUTE": "Per minute", "HOUR": "Hourly", "DAY": "Daily"}
 
 
 class MaintenanceReliabilityDesktopApi:
@@ -46,6 +56,8 @@ class MaintenanceReliabilityDesktopApi:
         asset_service: MaintenanceAssetService | None = None,
         location_service: MaintenanceLocationService | None = None,
         system_service: MaintenanceSystemService | None = None,
+        sensor_service: MaintenanceSensorService | None = None,
+        sensor_reading_service: MaintenanceSensorReadingService | None = None,
     ) -> None:
         self._reliability_service = reliability_service
         self._failure_code_service = failure_code_service
@@ -53,6 +65,8 @@ class MaintenanceReliabilityDesktopApi:
         self._asset_service = asset_service
         self._location_service = location_service
         self._system_service = system_service
+        self._sensor_service = sensor_service
+        self._sensor_reading_service = sensor_reading_service
 
     def list_sites(
         self,
@@ -308,6 +322,47 @@ class MaintenanceReliabilityDesktopApi:
             empty_state="" if has_content else "No reliability analytics match the current filters.",
         )
 
+    def build_sensor_trend(
+        self,
+        sensor_id: str,
+        *,
+        days: int = 90,
+        window_end: datetime | None = None,
+        max_points: int = DEFAULT_TREND_POINTS,
+    ) -> MaintenanceSensorTrendDescriptor:
+        """The sensor's series over the ``days`` before ``window_end`` (now by
+        default), read from the rollup grain that fits ``max_points``."""
+        end = window_end or datetime.now(timezone.utc)
+        start = end - timedelta(days=self._resolve_int_choice(days, _DAY_CHOICES, 90))
+        if self._sensor_reading_service is None:
+            return MaintenanceSensorTrendDescriptor(
+                sensor_id=str(sensor_id or ""),
+                sensor_label="-",
+                unit="",
+                window_start_label=format_timestamp_label(start),
+                window_end_label=format_timestamp_label(end),
+                grain_label="-",
+                empty_state="Maintenance sensor trends are not connected.",
+            )
+        trend = self._sensor_reading_service.read_trend(
+            sensor_id,
+            window_start=start,
+            window_end=end,
+            max_points=max_points,
+        )
+        sensor = self._sensor_service.get_sensor(trend.sensor_id) if self._sensor_service is not None else None
+        points = tuple(serialize_sensor_trend_point(point) for point in trend.points)
+        return MaintenanceSensorTrendDescriptor(
+            sensor_id=trend.sensor_id,
+            sensor_label=code_name_label(sensor.sensor_code, sensor.sensor_name) if sensor is not None else trend.sensor_id,
+            unit=sensor.unit if sensor is not None else "",
+            window_start_label=format_timestamp_label(trend.window_start),
+            window_end_label=format_timestamp_label(trend.window_end),
+            grain_label=_TREND_GRAIN_LABELS.get(trend.grain.value, trend.grain.value) if trend.grain else "Raw readings",
+            points=points,
+            empty_state="" if points else "No sensor readings fall in this window.",
+        )
+
     @staticmethod
     def _resolve_option_value(value: str | None, options) -> str:
         normalized = str(value or "").strip()
@@ -339,6 +394,8 @@ def build_maintenance_reliability_desktop_api(
     asset_service: MaintenanceAssetService | None = None,
     location_service: MaintenanceLocationService | None = None,
     system_service: MaintenanceSystemService | None = None,
+    sensor_service: MaintenanceSensorService | None = None,
+    sensor_reading_service: MaintenanceSensorReadingService | None = None,
 ) -> MaintenanceReliabilityDesktopApi:
     return MaintenanceReliabilityDesktopApi(
         reliability_service=reliability_service,
@@ -347,6 +404,8 @@ def build_maintenance_reliability_desktop_api(
         asset_service=asset_service,
         location_service=location_service,
         system_service=system_service,
+        sensor_service=sensor_service,
+        sensor_reading_service=sensor_reading_service,
     )
 
 
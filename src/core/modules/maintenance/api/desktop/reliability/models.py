@@ -92,6 +92,28 @@ class MaintenanceReliabilitySnapshotDescriptor:
     empty_state: str = ""
 
 
+@dataclass(frozen=True)
+class MaintenanceSensorTrendPointDescriptor:
+    bucket_start_label: str
+    reading_count: int
+    min_value: float
+    max_value: float
+    avg_value: float
+    last_value: float
+
+
+@dataclass(frozen=True)
+class MaintenanceSensorTrendDescriptor:
+    sensor_id: str
+    sensor_label: str
+    unit: str
+    window_start_label: str
+    window_end_label: str
+    grain_label: str
+    points: tuple[MaintenanceSensorTrendPointDescriptor, ...] = field(default_factory=tuple)
+    empty_state: str = ""
+
+
 __all__ = [
     "MaintenanceFailureSymptomOptionDescriptor",
     "MaintenanceReliabilityChoiceDescriptor",
@@ -101,4 +123,6 @@ __all__ = [
     "MaintenanceReliabilityRecurringRowDescriptor",
     "MaintenanceReliabilitySnapshotDescriptor",
     "MaintenanceReliabilitySuggestionRowDescriptor",
+    "MaintenanceSensorTrendDescriptor",
+    "MaintenanceSensorTrendPointDescriptor",
 ]
@@ -8,6 +8,7 @@ from src.core.modules.maintenance.api.desktop.reliability.models import (
     MaintenanceReliabilityInsightRowDescriptor,
     MaintenanceReliabilityRecurringRowDescriptor,
     MaintenanceReliabilitySuggestionRowDescriptor,
+    MaintenanceSensorTrendPointDescriptor,
 )
 from src.core.modules.maintenance.api.desktop._support import code_name_label
 
@@ -74,9 +75,21 @@ def serialize_recurring_row(row) -> MaintenanceReliabilityRecurringRowDescriptor
     )
 
 
+def serialize_sensor_trend_point(point) -> MaintenanceSensorTrendPointDescriptor:
+    return MaintenanceSensorTrendPointDescriptor(
+        bucket_start_label=format_timestamp_label(point.bucket_start),
+        reading_count=int(point.reading_count),
+        min_value=float(point.min_value),
+        max_value=float(point.max_value),
+        avg_value=float(point.avg_value),
+        last_value=float(point.last_value),
+    )
+
+
 __all__ = [
     "serialize_failure_symptom_option",
     "serialize_insight_row",
     "serialize_recurring_row",
+    "serialize_sensor_trend_point",
     "serialize_suggestion_row",
 ]
@@ -303,6 +303,7 @@ class MaintenanceWorkOrdersDesktopApi:
         *,
         site_id: str | None = None,
         asset_id: str | None = None,
+        under_asset_id: str | None = None,
         component_id: str | None = None,
         system_id: str | None = None,
         location_id: str | None = None,
@@ -329,6 +330,7 @@ class MaintenanceWorkOrdersDesktopApi:
             service.list_work_orders(
                 site_id=site_id,
                 asset_id=asset_id,
+                under_asset_id=under_asset_id,
                 component_id=component_id,
                 system_id=system_id,
                 location_id=location_id,
@@ -74,6 +74,8 @@ def build_maintenance_desktop_runtime_apis(
             asset_service=resolved.asset_service,
             location_service=resolved.location_service,
             system_service=resolved.system_service,
+            sensor_service=resolved.sensor_service,
+            sensor_reading_service=resolved.sensor_reading_service,
         ),
         maintenance_work_requests=build_maintenance_work_requests_desktop_api(
             work_request_service=resolved.work_request_service,
@@ -14,6 +14,7 @@ from src.core.modules.maintenance import (
     MaintenanceReliabilityService,
     MaintenanceSensorService,
     MaintenanceSensorExceptionService,
+    MaintenanceSensorReadingService,
     MaintenanceSystemService,
     MaintenanceTaskStepTemplateService,
     MaintenanceTaskTemplateService,
@@ -40,6 +41,7 @@ class MaintenanceDesktopRuntimeServices:
     reliability_service: MaintenanceReliabilityService | None
     sensor_service: MaintenanceSensorService | None
     sensor_exception_service: MaintenanceSensorExceptionService | None
+    sensor_reading_service: MaintenanceSensorReadingService | None
     failure_code_service: MaintenanceFailureCodeService | None
 
 
@@ -69,6 +71,7 @@ def resolve_maintenance_desktop_runtime_services(
     reliability_service = services.get("maintenance_reliability_service")
     sensor_service = services.get("maintenance_sensor_service")
     sensor_exception_service = services.get("maintenance_sensor_exception_service")
+    sensor_reading_service = services.get("maintenance_sensor_reading_service")
     failure_code_service = services.get("maintenance_failure_code_service")
     return MaintenanceDesktopRuntimeServices(
         location_service=(
@@ -155,6 +158,11 @@ def resolve_maintenance_desktop_runtime_services(
             )
             else None
         ),
+        sensor_reading_service=(
+            sensor_reading_service
+            if isinstance(sensor_reading_service, MaintenanceSensorReadingService)
+            else None
+        ),
         failure_code_service=(
             failure_code_service
             if isinstance(failure_code_service, MaintenanceFailureCodeService)
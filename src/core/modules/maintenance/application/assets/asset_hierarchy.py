@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
+from src.core.modules.maintenance.domain import (
+    MaintenanceAsset,
+    MaintenanceAssetClosureDrift,
+    MaintenanceAssetSubtreeSummary,
+    MaintenanceWorkOrderStatus,
+)
+from src.core.platform.access.authorization import filter_scope_rows
+from src.core.platform.common.exceptions import BusinessRuleError
+
+_TERMINAL_WORK_ORDER_STATUSES = frozenset(
+    {
+        MaintenanceWorkOrderStatus.COMPLETED,
+        MaintenanceWorkOrderStatus.VERIFIED,
+        MaintenanceWorkOrderStatus.CLOSED,
+        MaintenanceWorkOrderStatus.CANCELLED,
+    }
+)
+
+
+class MaintenanceAssetHierarchyMixin:
+    """Subtree reads and re-parenting checks for the asset service.
+
+    With a hierarchy repository these read the closure table; without one
+    they walk ``parent_asset_id`` over the organization's assets.
+    """
+
+    def list_asset_subtree(
+        self,
+        asset_id: str,
+        *,
+        include_self: bool = True,
+        max_depth: int | None = None,
+        active_only: bool | None = None,
+    ) -> list[MaintenanceAsset]:
+        """``asset_id`` and every asset below it, shallowest first."""
+        root = self.get_asset(asset_id)
+        if self._hierarchy_repo is not None:
+            rows = self._hierarchy_repo.list_subtree(
+                root.id,
+                include_self=include_self,
+                max_depth=max_depth,
+                active_only=active_only,
+            )
+        else:
+            rows = self._walk_subtree(root, include_self=include_self, max_depth=max_depth, active_only=active_only)
+        return filter_scope_rows(
+            rows,
+            self._user_session,
+            scope_type="maintenance",
+            permission_code="maintenance.read",
+            scope_id_getter=lambda row: getattr(row, "id", ""),
+        )
+
+    def list_asset_ancestor_ids(self, asset_id: str) -> list[str]:
+        """Ancestors of ``asset_id``, its parent first."""
+        asset = self.get_asset(asset_id)
+        if self._hierarchy_repo is not None:
+            return self._hierarchy_repo.list_ancestor_ids(asset.id)
+        return self._walk_ancestor_ids(asset)
+
+    def summarize_asset_subtree(self, asset_id: str) -> MaintenanceAssetSubtreeSummary:
+        """Asset, work order, downtime and material counts for ``asset_id``
+        and everything below it, one indexed join per figure."""
+        asset = self.get_asset(asset_id)
+        if self._hierarchy_repo is None:
+            raise BusinessRuleError(
+                "Asset hierarchy roll-ups need the asset hierarchy repository.",
+                code="MAINTENANCE_ASSET_HIERARCHY_UNAVAILABLE",
+            )
+        return self._hierarchy_repo.summarize_subtree(
+            asset.id,
+            terminal_statuses=_TERMINAL_WORK_ORDER_STATUSES,
+        )
+
+    def rebuild_asset_hierarchy(self) -> int:
+        """Re-derive the active organization's closure rows from the parent
+        links; returns how many rows were written."""
+        self._require_manage("rebuild maintenance asset hierarchy")
+        organization = self._active_organization()
+        if self._hierarchy_repo is None:
+            return 0
+        try:
+            written = self._hierarchy_repo.rebuild(organization.id)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        return written
+
+    def check_asset_hierarchy(self) -> list[MaintenanceAssetClosureDrift]:
+        """Closure rows that disagree with the parent links; empty when the
+        hierarchy is consistent."""
+        self._require_read("check maintenance asset hierarchy")
+        organization = self._active_organization()
+        if self._hierarchy_repo is None:
+            return []
+        return self._hierarchy_repo.list_drift(organization.id)
+
+    def _ensure_not_below(self, asset_id: str, parent: MaintenanceAsset) -> None:
+        if self._hierarchy_repo is not None:
+            creates_cycle = self._hierarchy_repo.is_descendant(asset_id, parent.id)
+        else:
+            creates_cycle = asset_id in self._walk_ancestor_ids(parent)
+        if creates_cycle:
+            raise BusinessRuleError(
+                "An asset cannot be moved below one of its own descendants.",
+                code="MAINTENANCE_ASSET_PARENT_CYCLE",
+            )
+
+    def _walk_ancestor_ids(self, asset: MaintenanceAsset) -> list[str]:
+        ancestor_ids: list[str] = []
+        seen = {asset.id}
+        parent_id = asset.parent_asset_id
+        while parent_id and parent_id not in seen:
+            ancestor_ids.append(parent_id)
+            seen.add(parent_id)
+            parent = self._asset_repo.get(parent_id)
+            parent_id = parent.parent_asset_id if parent is not None else None
+        return ancestor_ids
+
+    def _walk_subtree(
+        self,
+        root: MaintenanceAsset,
+        *,
+        include_self: bool,
+        max_depth: int | None,
+        active_only: bool | None,
+    ) -> list[MaintenanceAsset]:
+        children: dict[str, list[MaintenanceAsset]] = defaultdict(list)
+        for row in self._asset_repo.list_for_organization(root.organization_id):
+            if row.parent_asset_id:
+                children[row.parent_asset_id].append(row)
+        rows: list[tuple[int, MaintenanceAsset]] = []
+        seen = {root.id}
+        level = [root]
+        depth = 0
+        while level and (max_depth is None or depth <= max_depth):
+            rows.extend((depth, row) for row in level)
+            level = [child for row in level for child in children.get(row.id, ()) if child.id not in seen]
+            seen.update(child.id for child in level)
+            depth += 1
+        return [
+            row
+            for row_depth, row in sorted(rows, key=lambda item: (item[0], item[1].name, item[1].asset_code))
+            if (include_self or row_depth > 0) and (active_only is None or row.is_active == bool(active_only))
+        ]
+
+
+__all__ = ["MaintenanceAssetHierarchyMixin"]
@@ -19,10 +19,12 @@ from src.core.modules.maintenance.domain import (
     MaintenanceSystem,
 )
 from src.core.modules.maintenance.contracts.repositories import (
+    MaintenanceAssetHierarchyRepository,
     MaintenanceAssetRepository,
     MaintenanceLocationRepository,
     MaintenanceSystemRepository,
 )
+from src.core.modules.maintenance.application.assets.asset_hierarchy import MaintenanceAssetHierarchyMixin
 from src.core.modules.maintenance.application.common.support import (
     normalize_optional_text,
 )
@@ -56,7 +58,7 @@ _SUPPLIER_PARTY_TYPES = {
 }
 
 
-class MaintenanceAssetService:
+class MaintenanceAssetService(MaintenanceAssetHierarchyMixin):
     def __init__(
         self,
         session: Session,
@@ -67,6 +69,7 @@ class MaintenanceAssetService:
         location_repo: MaintenanceLocationRepository,
         system_repo: MaintenanceSystemRepository,
         party_repo: PartyRepository,
+        hierarchy_repo: MaintenanceAssetHierarchyRepository | None = None,
         tenant_context_service: TenantContextService | None = None,
         user_session=None,
         activity_service=None,
@@ -82,6 +85,7 @@ class MaintenanceAssetService:
         self._location_repo: MaintenanceLocationRepository = location_repo
         self._system_repo: MaintenanceSystemRepository = system_repo
         self._party_repo: PartyRepository = party_repo
+        self._hierarchy_repo: MaintenanceAssetHierarchyRepository | None = hierarchy_repo
         self._user_session = user_session
         self._activity_service = activity_service
 
@@ -292,6 +296,8 @@ class MaintenanceAssetService:
             raise ValidationError("Asset code already exists in the active organization.", code="MAINTENANCE_ASSET_CODE_EXISTS")
         try:
             self._asset_repo.add(asset)
+            if self._hierarchy_repo is not None:
+                self._hierarchy_repo.add_asset(asset)
             self._session.commit()
         except IntegrityError as exc:
             self._session.rollback()
@@ -427,6 +433,8 @@ class MaintenanceAssetService:
                 raise ValidationError("Asset code already exists in the active organization.", code="MAINTENANCE_ASSET_CODE_EXISTS")
         try:
             self._asset_repo.update(updated)
+            if self._hierarchy_repo is not None and updated.parent_asset_id != asset.parent_asset_id:
+                self._hierarchy_repo.move_asset(updated.id, updated.parent_asset_id)
             self._session.commit()
         except IntegrityError as exc:
             self._session.rollback()
@@ -487,6 +495,8 @@ class MaintenanceAssetService:
             raise ValidationError("Parent maintenance asset must belong to the same location.", code="MAINTENANCE_ASSET_LOCATION_MISMATCH")
         if system_id is not None and parent.system_id not in (None, system_id):
             raise ValidationError("Parent maintenance asset must align to the same system.", code="MAINTENANCE_ASSET_SYSTEM_MISMATCH")
+        if self_id:
+            self._ensure_not_below(self_id, parent)
         return parent
 
     def _resolve_party(
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from src.core.modules.maintenance.contracts.repositories import MaintenanceFailureRollupRepository
+from src.core.modules.maintenance.domain.reliability.failure_rollups import MaintenanceFailureOccurrence
+
+
+def sync_failure_rollup(
+    session: Session,
+    failure_rollup_repo: MaintenanceFailureRollupRepository | None,
+    before: MaintenanceFailureOccurrence | None,
+    after: MaintenanceFailureOccurrence | None,
+) -> None:
+    """Keep the failure rollups in step with one work order's failure moving
+    from ``before`` to ``after``, inside the caller's transaction."""
+    # A completion folds its failure into the rollup in place. A reopen,
+    # or an edit to a completed repair, cannot be subtracted that way,
+    # so the rollups it touches are refolded from their work orders.
+    if failure_rollup_repo is None or before == after:
+        return
+    if before is None:
+        failure_rollup_repo.record_failure(after)
+        return
+    session.flush()
+    keys = {before.key} if after is None else {before.key, after.key}
+    failure_rollup_repo.refresh(before.organization_id, keys)
+
+
+__all__ = ["sync_failure_rollup"]
@@ -0,0 +1,179 @@
+"""Paging helpers shared by the maintenance planner lanes."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from collections import Counter
+from collections.abc import Callable, Collection, Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Generic, TypeVar
+
+from src.core.modules.maintenance.contracts.repositories import MaintenancePlannerLaneCursor
+from src.core.platform.application.security.authorization import get_authorization_engine
+from src.core.platform.common.exceptions import ValidationError
+
+T = TypeVar("T")
+
+MAINTENANCE_PLANNER_LANE_PAGE_SIZE = 50
+MAINTENANCE_PLANNER_LANE_MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class MaintenancePlannerLane(Generic[T]):
+    """One page of a planner lane.
+
+    ``total`` counts every row of the lane, not just this page, and
+    ``status_counts`` counts the lane's rows per status before the status
+    filter, so queue pickers can show their counts too. ``next_token`` is
+    empty on the last page.
+    """
+
+    items: tuple[T, ...]
+    total: int
+    status_counts: Mapping[str, int] = field(default_factory=dict)
+    next_token: str = ""
+
+    @property
+    def has_more(self) -> bool:
+        return bool(self.next_token)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def encode_lane_token(cursor: MaintenancePlannerLaneCursor) -> str:
+    raw = f"{_as_utc(cursor.created_at).isoformat()}|{cursor.record_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_lane_token(token: str | None) -> MaintenancePlannerLaneCursor | None:
+    normalized = str(token or "").strip()
+    if not normalized:
+        return None
+    try:
+        created_at, record_id = base64.urlsafe_b64decode(normalized.encode("ascii")).decode("utf-8").split("|", 1)
+        return MaintenancePlannerLaneCursor(created_at=datetime.fromisoformat(created_at), record_id=record_id)
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValidationError(
+            "Planner page token is not valid.",
+            code="MAINTENANCE_PLANNER_PAGE_TOKEN_INVALID",
+        ) from exc
+
+
+def normalize_lane_page_size(page_size: int) -> int:
+    if page_size < 1:
+        raise ValidationError(
+            "Planner page size must be at least 1.",
+            code="MAINTENANCE_PLANNER_PAGE_SIZE_INVALID",
+        )
+    return min(page_size, MAINTENANCE_PLANNER_LANE_MAX_PAGE_SIZE)
+
+
+def normalize_lane_statuses(statuses: Collection[str] | None) -> frozenset[str] | None:
+    if statuses is None:
+        return None
+    return frozenset(str(status or "").strip().upper() for status in statuses if str(status or "").strip())
+
+
+def planner_scope_anchor_ids(user_session) -> frozenset[str] | None:
+    """Maintenance scopes a restricted session may read, or ``None``."""
+    engine = get_authorization_engine()
+    if not engine.is_scope_restricted(user_session, "maintenance"):
+        return None
+    return frozenset(engine.scope_ids_for(user_session, "maintenance", "maintenance.read"))
+
+
+def lane_total(status_counts: Mapping[str, int], statuses: frozenset[str] | None) -> int:
+    if statuses is None:
+        return sum(status_counts.values())
+    return sum(count for status, count in status_counts.items() if status in statuses)
+
+
+def lane_from_page(
+    rows: list[T],
+    *,
+    page_size: int,
+    total: int,
+    status_counts: Mapping[str, int] | None = None,
+) -> MaintenancePlannerLane[T]:
+    """Lane page from ``rows`` fetched with a limit of ``page_size + 1``;
+    the extra row only tells whether another page follows."""
+    items = tuple(rows[:page_size])
+    next_token = ""
+    if len(rows) > page_size and items:
+        last = items[-1]
+        next_token = encode_lane_token(MaintenancePlannerLaneCursor(created_at=last.created_at, record_id=last.id))
+    return MaintenancePlannerLane(
+        items=items,
+        total=total,
+        status_counts=dict(status_counts or {}),
+        next_token=next_token,
+    )
+
+
+def rows_matching_search(
+    rows: Iterable[T],
+    search_text: str,
+    search_fields: Callable[[T], Iterable[str | None]],
+) -> list[T]:
+    needle = str(search_text or "").strip().lower()
+    return [
+        row
+        for row in rows
+        if not needle or any(needle in str(value or "").lower() for value in search_fields(row))
+    ]
+
+
+def lane_from_loaded_rows(
+    rows: Iterable[T],
+    *,
+    statuses: frozenset[str] | None,
+    search_text: str,
+    search_fields: Callable[[T], Iterable[str | None]],
+    page_size: int,
+    after: MaintenancePlannerLaneCursor | None,
+    newest_first: bool = True,
+    status_of: Callable[[T], str] = lambda row: row.status.value,
+) -> MaintenancePlannerLane[T]:
+    """The same lane page folded from already loaded rows, for services
+    built without a planner repository."""
+    matching = rows_matching_search(rows, search_text, search_fields)
+    status_counts = Counter(status_of(row) for row in matching)
+    in_lane = sorted(
+        (row for row in matching if statuses is None or status_of(row) in statuses),
+        key=lambda row: (_as_utc(row.created_at), row.id),
+        reverse=newest_first,
+    )
+    if after is not None:
+        position = (_as_utc(after.created_at), after.record_id)
+        in_lane = [
+            row
+            for row in in_lane
+            if ((_as_utc(row.created_at), row.id) < position) == newest_first
+            and (_as_utc(row.created_at), row.id) != position
+        ]
+    return lane_from_page(
+        in_lane[: page_size + 1],
+        page_size=page_size,
+        total=lane_total(status_counts, statuses),
+        status_counts=dict(status_counts),
+    )
+
+
+__all__ = [
+    "MAINTENANCE_PLANNER_LANE_MAX_PAGE_SIZE",
+    "MAINTENANCE_PLANNER_LANE_PAGE_SIZE",
+    "MaintenancePlannerLane",
+    "decode_lane_token",
+    "encode_lane_token",
+    "lane_from_loaded_rows",
+    "lane_from_page",
+    "lane_total",
+    "normalize_lane_page_size",
+    "normalize_lane_statuses",
+    "planner_scope_anchor_ids",
+    "rows_matching_search",
+]
@@ -6,8 +6,10 @@ Internal code should import directly from the relevant subpackage.
 
 from src.core.modules.maintenance.application.preventive.models import (
     MaintenanceGeneratedWorkPackage,
+    MaintenancePreventiveBatchGenerationReport,
     MaintenancePreventiveDueCandidate,
     MaintenancePreventiveForecastRow,
+    MaintenancePreventiveGenerationChunk,
     MaintenancePreventiveGenerationResult,
     MaintenanceTriggerEvaluation,
 )
@@ -22,8 +24,10 @@ from src.core.modules.maintenance.application.preventive.services import (
 
 __all__ = [
     "MaintenanceGeneratedWorkPackage",
+    "MaintenancePreventiveBatchGenerationReport",
     "MaintenancePreventiveDueCandidate",
     "MaintenancePreventiveForecastRow",
+    "MaintenancePreventiveGenerationChunk",
     "MaintenancePreventiveGenerationResult",
     "MaintenancePreventiveGenerationService",
     "MaintenancePreventivePlanService",
@@ -6,14 +6,18 @@ from src.core.modules.maintenance.application.preventive.models.candidates impor
 )
 from src.core.modules.maintenance.application.preventive.models.results import (
     MaintenanceGeneratedWorkPackage,
+    MaintenancePreventiveBatchGenerationReport,
     MaintenancePreventiveForecastRow,
+    MaintenancePreventiveGenerationChunk,
     MaintenancePreventiveGenerationResult,
 )
 
 __all__ = [
     "MaintenanceGeneratedWorkPackage",
+    "MaintenancePreventiveBatchGenerationReport",
     "MaintenancePreventiveDueCandidate",
     "MaintenancePreventiveForecastRow",
+    "MaintenancePreventiveGenerationChunk",
     "MaintenancePreventiveGenerationResult",
     "MaintenanceTriggerEvaluation",
 ]
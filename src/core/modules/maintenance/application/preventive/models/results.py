@@ -20,6 +20,50 @@ class MaintenancePreventiveGenerationResult:
     skipped_reason: str = ""
 
 
+@dataclass(frozen=True)
+class MaintenancePreventiveGenerationChunk:
+    """One committed chunk of a batched generation run, in plan-id order."""
+
+    chunk_index: int
+    first_plan_id: str
+    last_plan_id: str
+    results: tuple[MaintenancePreventiveGenerationResult, ...]
+    created_instance_count: int = 0
+    removed_instance_count: int = 0
+
+    @property
+    def plan_count(self) -> int:
+        return len(self.results)
+
+    @property
+    def generated_count(self) -> int:
+        return sum(1 for row in self.results if not row.skipped_reason)
+
+
+@dataclass(frozen=True)
+class MaintenancePreventiveBatchGenerationReport:
+    """Outcome of ``generate_due_work_in_batches``.
+
+    ``resume_after_plan_id`` is the last committed plan; passing it back
+    continues an interrupted run with the next plan.
+    """
+
+    run_id: str
+    chunks: tuple[MaintenancePreventiveGenerationChunk, ...]
+
+    @property
+    def results(self) -> tuple[MaintenancePreventiveGenerationResult, ...]:
+        return tuple(row for chunk in self.chunks for row in chunk.results)
+
+    @property
+    def generated_count(self) -> int:
+        return sum(chunk.generated_count for chunk in self.chunks)
+
+    @property
+    def resume_after_plan_id(self) -> str | None:
+        return self.chunks[-1].last_plan_id if self.chunks else None
+
+
 @dataclass(frozen=True)
 class MaintenancePreventiveForecastRow:
     """A single row in a preventive schedule forecast."""
@@ -44,6 +88,8 @@ class MaintenanceGeneratedWorkPackage:
 
 __all__ = [
     "MaintenanceGeneratedWorkPackage",
+    "MaintenancePreventiveBatchGenerationReport",
     "MaintenancePreventiveForecastRow",
+    "MaintenancePreventiveGenerationChunk",
     "MaintenancePreventiveGenerationResult",
 ]
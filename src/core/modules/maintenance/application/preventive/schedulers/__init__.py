@@ -1,5 +1,8 @@
 """Preventive schedule management — instance sync, due dates, forecasts."""
 
+from src.core.modules.maintenance.application.preventive.schedulers.blackout_calendar import (
+    PreventiveBlackoutCalendar,
+)
 from src.core.modules.maintenance.application.preventive.schedulers.forecast import (
     forecast_planner_state,
 )
@@ -7,4 +10,4 @@ from src.core.modules.maintenance.application.preventive.schedulers.instance_sch
     PreventiveInstanceScheduler,
 )
 
-__all__ = ["PreventiveInstanceScheduler", "forecast_planner_state"]
+__all__ = ["PreventiveBlackoutCalendar", "PreventiveInstanceScheduler", "forecast_planner_state"]
@@ -0,0 +1,82 @@
+"""Blackout window index — merged date intervals with bisect lookups."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+from src.core.modules.maintenance.domain import MaintenanceBlackoutWindow
+
+
+class PreventiveBlackoutCalendar:
+    """
+    A plan's active blackout windows as sorted, merged date intervals.
+
+    ``blackout_end`` answers "is this day blacked out, and on which day does
+    that blackout end" with one bisect instead of a scan over every window.
+    One-off windows are merged once; annual windows are expanded for the
+    years lookups reach, so one calendar can be reused for a whole
+    generation run.
+    """
+
+    def __init__(self, windows: Iterable[MaintenanceBlackoutWindow] = ()) -> None:
+        active = [window for window in windows if window.is_active]
+        self._fixed = [
+            (window.start_date, window.end_date) for window in active if window.recurrence != "ANNUAL"
+        ]
+        self._annual = [window for window in active if window.recurrence == "ANNUAL"]
+        self._first_year: int | None = None
+        self._last_year: int | None = None
+        self._starts: list[date] = []
+        self._ends: list[date] = []
+        if not self._annual:
+            self._rebuild(self._fixed)
+
+    def __bool__(self) -> bool:
+        return bool(self._fixed or self._annual)
+
+    def covers(self, check_date: date) -> bool:
+        return self.blackout_end(check_date) is not None
+
+    def blackout_end(self, check_date: date) -> date | None:
+        """Last blacked-out day of the blackout covering ``check_date``, or None.
+
+        Overlapping and back-to-back windows count as one blackout. Where
+        annual windows chain across more years than have been expanded, the
+        end returned is the last expanded day, so it is never too late.
+        """
+        if self._annual:
+            self._expand_to(check_date.year)
+        index = bisect_right(self._starts, check_date) - 1
+        if index >= 0 and check_date <= self._ends[index]:
+            return self._ends[index]
+        return None
+
+    def _expand_to(self, year: int) -> None:
+        # One year either side, so a window wrapping over New Year and a
+        # blackout running on into the next year are both merged.
+        if self._first_year is not None and self._first_year < year < self._last_year:
+            return
+        first = year - 1 if self._first_year is None else min(self._first_year, year - 1)
+        last = year + 1 if self._last_year is None else max(self._last_year, year + 1)
+        intervals = list(self._fixed)
+        for window in self._annual:
+            # The occurrence starting the year before may wrap into ``first``.
+            intervals.extend(window.occurrence_in_year(y) for y in range(first - 1, last + 1))
+        self._first_year, self._last_year = first, last
+        self._rebuild(intervals)
+
+    def _rebuild(self, intervals: list[tuple[date, date]]) -> None:
+        starts: list[date] = []
+        ends: list[date] = []
+        for start, end in sorted(intervals):
+            if ends and start <= ends[-1] + timedelta(days=1):
+                ends[-1] = max(ends[-1], end)
+                continue
+            starts.append(start)
+            ends.append(end)
+        self._starts, self._ends = starts, ends
+
+
+__all__ = ["PreventiveBlackoutCalendar"]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
 
 from sqlalchemy.orm import Session
 
@@ -17,6 +19,9 @@ from src.core.modules.maintenance.contracts.repositories import (
     MaintenancePreventivePlanInstanceRepository,
     MaintenancePreventivePlanRepository,
 )
+from src.core.modules.maintenance.application.preventive.schedulers.blackout_calendar import (
+    PreventiveBlackoutCalendar,
+)
 from src.core.modules.maintenance.application.preventive.utils.date_utils import (
     advance_calendar_due,
     lead_window_starts_at,
@@ -24,6 +29,20 @@ from src.core.modules.maintenance.application.preventive.utils.date_utils import
 )
 
 
+@dataclass(frozen=True)
+class PlannedInstanceReconciliation:
+    """How a plan's PLANNED instances must change to match its horizon."""
+
+    planned: tuple[MaintenancePreventivePlanInstance, ...]
+    created: tuple[MaintenancePreventivePlanInstance, ...]
+    removed: tuple[MaintenancePreventivePlanInstance, ...]
+    plan_changed: bool
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.created or self.removed or self.plan_changed)
+
+
 class PreventiveInstanceScheduler:
     """
     Manages the lifecycle of preventive plan schedule instances.
@@ -70,20 +89,47 @@ class PreventiveInstanceScheduler:
                 plan_id=plan.id,
             )
         rows = self._instance_repo.list_for_organization(plan.organization_id, plan_id=plan.id)
-        planned_by_due = {
-            resolve_as_of(row.due_at): row
-            for row in rows
-            if row.status == MaintenancePreventiveInstanceStatus.PLANNED
-        }
-        desired_due_dates = self.build_planned_due_dates(plan, as_of)
-        desired_instances: list[MaintenancePreventivePlanInstance] = []
-        changed = False
-        audit_now = datetime.now(timezone.utc)
+        reconciliation = self.reconcile_planned_instances(
+            plan,
+            [row for row in rows if row.status == MaintenancePreventiveInstanceStatus.PLANNED],
+            as_of,
+        )
+        for instance in reconciliation.created:
+            self._instance_repo.add(instance)
+        for orphan in reconciliation.removed:
+            self._instance_repo.delete(orphan.id)
+        if reconciliation.plan_changed:
+            self._plan_repo.update(plan)
+        if reconciliation.changed:
+            self._session.commit()
+
+        return self._normalize(
+            self._instance_repo.list_for_organization(plan.organization_id, plan_id=plan.id)
+        )
+
+    def reconcile_planned_instances(
+        self,
+        plan: MaintenancePreventivePlan,
+        planned: Sequence[MaintenancePreventivePlanInstance],
+        as_of: datetime,
+        *,
+        blackouts: PreventiveBlackoutCalendar | None = None,
+    ) -> PlannedInstanceReconciliation:
+        """
+        Work out, without writing, which PLANNED instances to create and
+        remove so ``planned`` matches the desired horizon.
 
-        for due_at in desired_due_dates:
+        Moves `plan.next_due_at` to the nearest remaining instance; the
+        caller persists the plan when ``plan_changed`` is set.
+        """
+        planned_by_due = {resolve_as_of(row.due_at): row for row in planned}
+        audit_now = datetime.now(timezone.utc)
+        desired: list[MaintenancePreventivePlanInstance] = []
+        created: list[MaintenancePreventivePlanInstance] = []
+        for due_at in self.build_planned_due_dates(plan, as_of, blackouts=blackouts):
             existing = planned_by_due.pop(due_at, None)
             if existing is not None:
-                desired_instances.append(existing)
+                desired.append(existing)
                 continue
             instance = MaintenancePreventivePlanInstance.create(
                 organization_id=plan.organization_id,
@@ -93,34 +139,33 @@ class PreventiveInstanceScheduler:
                 created_at=audit_now,
                 updated_at=audit_now,
             )
-            self._instance_repo.add(instance)
-            desired_instances.append(instance)
-            changed = True
+            desired.append(instance)
+            created.append(instance)
 
-        for orphan in planned_by_due.values():
-            self._instance_repo.delete(orphan.id)
-            changed = True
-
-        next_due_at = desired_instances[0].due_at if desired_instances else None
-        if plan.next_due_at != next_due_at:
+        next_due_at = desired[0].due_at if desired else None
+        plan_changed = plan.next_due_at != next_due_at
+        if plan_changed:
             plan.next_due_at = next_due_at
             plan.updated_at = audit_now
-            self._plan_repo.update(plan)
-            changed = True
-
-        if changed:
-            self._session.commit()
-
-        return self._normalize(
-            self._instance_repo.list_for_organization(plan.organization_id, plan_id=plan.id)
+        return PlannedInstanceReconciliation(
+            planned=tuple(desired),
+            created=tuple(created),
+            removed=tuple(planned_by_due.values()),
+            plan_changed=plan_changed,
         )
 
     def build_planned_due_dates(
         self,
         plan: MaintenancePreventivePlan,
         as_of: datetime,
+        *,
+        blackouts: PreventiveBlackoutCalendar | None = None,
     ) -> list[datetime]:
-        """Build the ordered list of desired due dates for the planning horizon."""
+        """Build the ordered list of desired due dates for the planning horizon.
+
+        ``blackouts`` is the plan's blackout calendar when the caller already
+        holds one; otherwise it is built from the repository.
+        """
         if plan.calendar_frequency_unit is None or plan.calendar_frequency_value in (None, 0):
             return []
 
@@ -132,11 +177,8 @@ class PreventiveInstanceScheduler:
                 plan.calendar_frequency_value,
             )
 
-        blackout_windows = (
-            self._blackout_window_repo.list_for_plan(plan.organization_id, plan.id, active_only=True)
-            if self._blackout_window_repo is not None
-            else []
-        )
+        if blackouts is None:
+            blackouts = self.blackout_calendar(plan)
 
         planned_due_dates: list[datetime] = []
         current_due = start_due
@@ -144,11 +186,16 @@ class PreventiveInstanceScheduler:
         horizon = max(plan.generation_horizon_count, 1)
         max_iter = horizon * 4  # guard against infinite loop
         iterations = 0
+        blacked_out_until: date | None = None
 
         while generated < horizon and iterations < max_iter:
             iterations += 1
             due_date = current_due.date() if hasattr(current_due, "date") else current_due
-            if not any(w.covers(due_date) for w in blackout_windows):
+            # Dates only move forward, so no lookup is needed until the
+            # current blackout has ended.
+            if blacked_out_until is None or due_date > blacked_out_until:
+                blacked_out_until = blackouts.blackout_end(due_date) if blackouts else None
+            if blacked_out_until is None:
                 planned_due_dates.append(current_due)
                 generated += 1
             current_due = advance_calendar_due(
@@ -159,6 +206,14 @@ class PreventiveInstanceScheduler:
 
         return planned_due_dates
 
+    def blackout_calendar(self, plan: MaintenancePreventivePlan) -> PreventiveBlackoutCalendar:
+        """The plan's active blackout windows, indexed for due-date lookups."""
+        if self._blackout_window_repo is None:
+            return PreventiveBlackoutCalendar()
+        return PreventiveBlackoutCalendar(
+            self._blackout_window_repo.list_for_plan(plan.organization_id, plan.id, active_only=True)
+        )
+
     def select_due_instance(
         self,
         plan: MaintenancePreventivePlan,
@@ -167,15 +222,43 @@ class PreventiveInstanceScheduler:
         """Return the earliest PLANNED instance whose lead window has opened, or None."""
         if not self.plan_uses_calendar_instances(plan):
             return None
-        for row in self._instance_repo.list_for_organization(
-            plan.organization_id,
-            plan_id=plan.id,
-            status=MaintenancePreventiveInstanceStatus.PLANNED.value,
-        ):
+        return self.first_due_instance(
+            plan,
+            self._instance_repo.list_for_organization(
+                plan.organization_id,
+                plan_id=plan.id,
+                status=MaintenancePreventiveInstanceStatus.PLANNED.value,
+            ),
+            as_of,
+        )
+
+    def first_due_instance(
+        self,
+        plan: MaintenancePreventivePlan,
+        planned: Sequence[MaintenancePreventivePlanInstance],
+        as_of: datetime,
+    ) -> MaintenancePreventivePlanInstance | None:
+        """``select_due_instance`` over already-loaded PLANNED instances in due order."""
+        for row in planned:
             if as_of >= lead_window_starts_at(plan, resolve_as_of(row.due_at)):
                 return row
         return None
 
+    def planned_instances_by_plan(
+        self,
+        organization_id: str,
+    ) -> dict[str, list[MaintenancePreventivePlanInstance]]:
+        """Every PLANNED instance in the organization, grouped by plan in due order."""
+        grouped: dict[str, list[MaintenancePreventivePlanInstance]] = {}
+        for row in self._normalize(
+            self._instance_repo.list_for_organization(
+                organization_id,
+                status=MaintenancePreventiveInstanceStatus.PLANNED.value,
+            )
+        ):
+            grouped.setdefault(row.plan_id, []).append(row)
+        return grouped
+
     def list_instances(
         self,
         plan: MaintenancePreventivePlan,
@@ -202,4 +285,4 @@ class PreventiveInstanceScheduler:
         return rows
 
 
-__all__ = ["PreventiveInstanceScheduler"]
+__all__ = ["PlannedInstanceReconciliation", "PreventiveInstanceScheduler"]
@@ -0,0 +1,410 @@
+"""Chunked, set-based preventive generation for large nightly runs."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from src.core.modules.maintenance.domain import (
+    MaintenanceBlackoutWindow,
+    MaintenancePreventivePlan,
+    MaintenancePreventivePlanInstance,
+    MaintenancePreventivePlanTask,
+    MaintenanceSensor,
+    MaintenanceWorkOrder,
+    MaintenanceWorkRequest,
+)
+from src.core.modules.maintenance.application.preventive.models.candidates import (
+    MaintenancePreventiveDueCandidate,
+)
+from src.core.modules.maintenance.application.preventive.models.results import (
+    MaintenancePreventiveBatchGenerationReport,
+    MaintenancePreventiveGenerationChunk,
+    MaintenancePreventiveGenerationResult,
+)
+from src.core.modules.maintenance.application.preventive.schedulers.blackout_calendar import (
+    PreventiveBlackoutCalendar,
+)
+from src.core.modules.maintenance.application.preventive.utils.code_utils import (
+    build_generated_code,
+    build_generation_description,
+    map_plan_to_work_order_type,
+)
+from src.core.modules.maintenance.application.preventive.utils.date_utils import resolve_as_of
+from src.core.platform.common.exceptions import ValidationError
+from src.core.platform.common.ids import generate_id
+from src.core.shared.activity.activity_recorder import record_activity
+from src.core.shared.events.domain_events import DomainChangeEvent, domain_events
+
+DEFAULT_GENERATION_CHUNK_SIZE = 500
+
+_NO_BLACKOUTS = PreventiveBlackoutCalendar()
+
+
+@dataclass
+class _GenerationSnapshot:
+    """Everything due-detection reads, loaded once per run."""
+
+    planned_by_plan: dict[str, list[MaintenancePreventivePlanInstance]]
+    plan_tasks_by_plan: dict[str, list[MaintenancePreventivePlanTask]]
+    sensors: dict[str, MaintenanceSensor]
+    blackouts_by_plan: dict[str, PreventiveBlackoutCalendar]
+
+
+@dataclass
+class _ChunkWrites:
+    """Rows one chunk writes, keyed by id so a plan touched twice is written once."""
+
+    work_orders: list[MaintenanceWorkOrder] = field(default_factory=list)
+    work_requests: list[MaintenanceWorkRequest] = field(default_factory=list)
+    created_instances: dict[str, MaintenancePreventivePlanInstance] = field(default_factory=dict)
+    removed_instance_ids: set[str] = field(default_factory=set)
+    generated_instances: list[MaintenancePreventivePlanInstance] = field(default_factory=list)
+    plans: dict[str, MaintenancePreventivePlan] = field(default_factory=dict)
+    plan_tasks: dict[str, MaintenancePreventivePlanTask] = field(default_factory=dict)
+
+
+class MaintenancePreventiveBatchGenerationMixin:
+    """``generate_due_work`` for every plan at once, committed in chunks.
+
+    With a generation repository the plans' instances, plan tasks, sensors
+    and blackout windows are loaded once, due-detection runs in memory and
+    each chunk's instances, work orders, work requests and schedule updates
+    are written with executemany statements under a single commit. Without
+    one every chunk falls back to the per-plan path.
+    """
+
+    def generate_due_work_in_batches(
+        self,
+        *,
+        as_of: datetime | None = None,
+        site_id: str | None = None,
+        chunk_size: int = DEFAULT_GENERATION_CHUNK_SIZE,
+        resume_after_plan_id: str | None = None,
+        on_chunk: Callable[[MaintenancePreventiveGenerationChunk], None] | None = None,
+    ) -> MaintenancePreventiveBatchGenerationReport:
+        """
+        Generate due work for the visible active plans in plan-id order,
+        ``chunk_size`` plans per transaction.
+
+        ``on_chunk`` is called after each chunk commits. A failing chunk is
+        rolled back and its error raised; every earlier chunk stays
+        committed, so passing the last reported ``last_plan_id`` as
+        ``resume_after_plan_id`` picks the run up where it stopped.
+
+        Plans whose work order needs a task package are staged with their
+        chunk but generated through the work order services once it has
+        committed.
+        """
+        self._require_manage("generate maintenance preventive work")
+        if chunk_size < 1:
+            raise ValidationError(
+                "Preventive generation chunk size must be at least 1.",
+                code="MAINTENANCE_PREVENTIVE_GENERATION_CHUNK_SIZE_INVALID",
+            )
+        organization = self._active_organization()
+        resolved_as_of = resolve_as_of(as_of)
+        if site_id is not None:
+            self._get_site(site_id, organization=organization)
+        plans = sorted(
+            self._list_visible_active_plans(organization=organization, site_id=site_id, plan_id=None),
+            key=lambda row: row.id,
+        )
+        if resume_after_plan_id:
+            plans = [row for row in plans if row.id > resume_after_plan_id]
+        snapshot = (
+            self._load_generation_snapshot(organization.id)
+            if self._generation_repo is not None and plans
+            else None
+        )
+        run_id = generate_id()
+        chunks: list[MaintenancePreventiveGenerationChunk] = []
+        for start in range(0, len(plans), chunk_size):
+            chunk_plans = plans[start:start + chunk_size]
+            if snapshot is None:
+                chunk = MaintenancePreventiveGenerationChunk(
+                    chunk_index=len(chunks),
+                    first_plan_id=chunk_plans[0].id,
+                    last_plan_id=chunk_plans[-1].id,
+                    results=tuple(self._generate_plan(plan, resolved_as_of) for plan in chunk_plans),
+                )
+            else:
+                chunk = self._generate_chunk(
+                    chunk_plans,
+                    resolved_as_of,
+                    snapshot=snapshot,
+                    run_id=run_id,
+                    chunk_index=len(chunks),
+                )
+            chunks.append(chunk)
+            if on_chunk is not None:
+                on_chunk(chunk)
+        return MaintenancePreventiveBatchGenerationReport(run_id=run_id, chunks=tuple(chunks))
+
+    def _load_generation_snapshot(self, organization_id: str) -> _GenerationSnapshot:
+        plan_tasks_by_plan: dict[str, list[MaintenancePreventivePlanTask]] = {}
+        for row in self._preventive_plan_task_repo.list_for_organization(organization_id):
+            plan_tasks_by_plan.setdefault(row.plan_id, []).append(row)
+        blackout_windows_by_plan: dict[str, list[MaintenanceBlackoutWindow]] = {}
+        if self._blackout_window_repo is not None:
+            for window in self._blackout_window_repo.list_for_organization(organization_id, active_only=True):
+                blackout_windows_by_plan.setdefault(window.preventive_plan_id, []).append(window)
+        return _GenerationSnapshot(
+            planned_by_plan=self._scheduler.planned_instances_by_plan(organization_id),
+            plan_tasks_by_plan=plan_tasks_by_plan,
+            sensors={row.id: row for row in self._sensor_repo.list_for_organization(organization_id)},
+            # Indexed once; each calendar serves every reconciliation of its
+            # plan in the run.
+            blackouts_by_plan={
+                plan_id: PreventiveBlackoutCalendar(windows)
+                for plan_id, windows in blackout_windows_by_plan.items()
+            },
+        )
+
+    def _generate_chunk(
+        self,
+        plans: Sequence[MaintenancePreventivePlan],
+        as_of: datetime,
+        *,
+        snapshot: _GenerationSnapshot,
+        run_id: str,
+        chunk_index: int,
+    ) -> MaintenancePreventiveGenerationChunk:
+        writes = _ChunkWrites()
+        results: dict[str, MaintenancePreventiveGenerationResult] = {}
+        packaged: list[tuple[MaintenancePreventivePlan, MaintenancePreventiveDueCandidate]] = []
+        for plan in plans:
+            planned = snapshot.planned_by_plan.get(plan.id, [])
+            if self._scheduler.plan_uses_calendar_instances(plan):
+                planned = self._stage_reconciliation(plan, planned, as_of, snapshot=snapshot, writes=writes)
+            plan_tasks = snapshot.plan_tasks_by_plan.get(plan.id, [])
+            candidate = self._evaluate_candidate(
+                plan, as_of, planned=planned, plan_tasks=plan_tasks, sensors=snapshot.sensors
+            )
+            if candidate.due_state != "DUE":
+                results[plan.id] = MaintenancePreventiveGenerationResult(
+                    plan_id=plan.id,
+                    plan_code=plan.plan_code,
+                    generation_target=candidate.generation_target,
+                    skipped_reason=candidate.due_reason,
+                )
+                continue
+            self._require_scope_manage(
+                self._scope_anchor_for_plan(plan),
+                operation_label="generate maintenance preventive work",
+            )
+            selected_ids = set(candidate.selected_plan_task_ids)
+            selected = [row for row in plan_tasks if row.id in selected_ids]
+            if plan.auto_generate_work_order and selected:
+                packaged.append((plan, candidate))
+                continue
+            results[plan.id] = self._stage_generated_work(
+                plan, candidate, as_of, planned=planned, selected=selected, snapshot=snapshot, writes=writes
+            )
+
+        # The same code and site/reference checks create_work_order and
+        # create_work_request run, with one code lookup per kind for the chunk.
+        writes.work_orders = self._work_order_service.prepare_new_work_orders(writes.work_orders)
+        writes.work_requests = self._work_request_service.prepare_new_work_requests(writes.work_requests)
+        try:
+            self._generation_repo.add_work_orders(writes.work_orders)
+            self._generation_repo.add_work_requests(writes.work_requests)
+            self._generation_repo.add_instances(list(writes.created_instances.values()))
+            self._generation_repo.delete_instances(writes.removed_instance_ids)
+            self._generation_repo.update_instance_generation(writes.generated_instances)
+            self._generation_repo.update_plan_schedules(list(writes.plans.values()))
+            self._generation_repo.update_plan_task_schedules(list(writes.plan_tasks.values()))
+            self._work_order_service.record_work_orders_created(writes.work_orders, commit=False)
+            self._work_request_service.record_work_requests_created(writes.work_requests, commit=False)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        self._record_chunk_change(run_id, chunk_index=chunk_index, plans=plans, writes=writes)
+
+        for plan, candidate in packaged:
+            results[plan.id] = self._generate_candidate(plan, candidate, as_of)
+        return MaintenancePreventiveGenerationChunk(
+            chunk_index=chunk_index,
+            first_plan_id=plans[0].id,
+            last_plan_id=plans[-1].id,
+            results=tuple(results[plan.id] for plan in plans),
+            created_instance_count=len(writes.created_instances),
+            removed_instance_count=len(writes.removed_instance_ids),
+        )
+
+    def _stage_reconciliation(
+        self,
+        plan: MaintenancePreventivePlan,
+        planned: list[MaintenancePreventivePlanInstance],
+        as_of: datetime,
+        *,
+        snapshot: _GenerationSnapshot,
+        writes: _ChunkWrites,
+    ) -> list[MaintenancePreventivePlanInstance]:
+        reconciliation = self._scheduler.reconcile_planned_instances(
+            plan,
+            planned,
+            as_of,
+            blackouts=snapshot.blackouts_by_plan.get(plan.id, _NO_BLACKOUTS),
+        )
+        for instance in reconciliation.created:
+            writes.created_instances[instance.id] = instance
+        for orphan in reconciliation.removed:
+            # An instance staged earlier in this chunk is simply not inserted.
+            if writes.created_instances.pop(orphan.id, None) is None:
+                writes.removed_instance_ids.add(orphan.id)
+        if reconciliation.plan_changed:
+            writes.plans[plan.id] = plan
+        return list(reconciliation.planned)
+
+    def _stage_generated_work(
+        self,
+        plan: MaintenancePreventivePlan,
+        candidate: MaintenancePreventiveDueCandidate,
+        as_of: datetime,
+        *,
+        planned: list[MaintenancePreventivePlanInstance],
+        selected: list[MaintenancePreventivePlanTask],
+        snapshot: _GenerationSnapshot,
+        writes: _ChunkWrites,
+    ) -> MaintenancePreventiveGenerationResult:
+        uses_calendar = self._scheduler.plan_uses_calendar_instances(plan)
+        due_instance = self._scheduler.first_due_instance(plan, planned, as_of) if uses_calendar else None
+        requested_by_user_id, requested_by_name = self._requesting_user()
+        generated_work_request_id: str | None = None
+        generated_work_order_id: str | None = None
+        if plan.auto_generate_work_order:
+            work_order = MaintenanceWorkOrder.create(
+                organization_id=plan.organization_id,
+                site_id=plan.site_id,
+                work_order_code=build_generated_code(plan.plan_code, suffix="WO"),
+                work_order_type=map_plan_to_work_order_type(plan),
+                source_type="PREVENTIVE_PLAN",
+                source_id=plan.id,
+                asset_id=plan.asset_id,
+                component_id=plan.component_id,
+                system_id=plan.system_id,
+                title=plan.name,
+                description=build_generation_description(plan, candidate, as_of),
+                priority=plan.priority,
+                requested_by_user_id=requested_by_user_id,
+                requires_shutdown=plan.requires_shutdown,
+                approval_required=plan.approval_required,
+                is_preventive=True,
+                notes=f"Generated from preventive plan {plan.plan_code}.",
+            )
+            writes.work_orders.append(work_order)
+            generated_work_order_id = work_order.id
+        else:
+            work_request = MaintenanceWorkRequest.create(
+                organization_id=plan.organization_id,
+                site_id=plan.site_id,
+                work_request_code=build_generated_code(plan.plan_code, suffix="WR"),
+                source_type="PREVENTIVE_PLAN",
+                source_id=plan.id,
+                source_plan_task_ids=tuple(row.id for row in selected),
+                request_type=plan.plan_type.value,
+                asset_id=plan.asset_id,
+                component_id=plan.component_id,
+                system_id=plan.system_id,
+                title=plan.name,
+                description=build_generation_description(plan, candidate, as_of),
+                priority=plan.priority,
+                requested_by_user_id=requested_by_user_id,
+                requested_by_name_snapshot=requested_by_name,
+                notes=f"Generated from preventive plan {plan.plan_code}.",
+            )
+            writes.work_requests.append(work_request)
+            generated_work_request_id = work_request.id
+
+        remaining = planned
+        if due_instance is not None:
+            self._mark_instance_generated(
+                due_instance, as_of,
+                generated_work_request_id=generated_work_request_id,
+                generated_work_order_id=generated_work_order_id,
+            )
+            # One staged in this chunk is inserted already generated.
+            if due_instance.id not in writes.created_instances:
+                writes.generated_instances.append(due_instance)
+            remaining = [row for row in planned if row.id != due_instance.id]
+        self._mark_plan_generated(
+            plan,
+            as_of,
+            sensor=snapshot.sensors.get(plan.sensor_id) if plan.sensor_id else None,
+            due_instance=due_instance,
+            remaining_planned=remaining,
+        )
+        writes.plans[plan.id] = plan
+        if due_instance is not None and uses_calendar:
+            # Same top-up ``_apply_plan_generation_state`` does after a commit.
+            self._stage_reconciliation(plan, remaining, as_of, snapshot=snapshot, writes=writes)
+        for plan_task in selected:
+            self._mark_plan_task_generated(
+                plan_task,
+                as_of,
+                sensor=snapshot.sensors.get(plan_task.sensor_id_override) if plan_task.sensor_id_override else None,
+            )
+            writes.plan_tasks[plan_task.id] = plan_task
+        return MaintenancePreventiveGenerationResult(
+            plan_id=plan.id,
+            plan_code=plan.plan_code,
+            generation_target="WORK_ORDER" if plan.auto_generate_work_order else "WORK_REQUEST",
+            generated_work_request_id=generated_work_request_id,
+            generated_work_order_id=generated_work_order_id,
+        )
+
+    def _requesting_user(self) -> tuple[str | None, str]:
+        principal = getattr(self._user_session, "principal", None)
+        if principal is None:
+            return None, ""
+        return principal.user_id, principal.display_name or principal.username or ""
+
+    def _record_chunk_change(
+        self,
+        run_id: str,
+        *,
+        chunk_index: int,
+        plans: Sequence[MaintenancePreventivePlan],
+        writes: _ChunkWrites,
+    ) -> None:
+        record_activity(
+            self,
+            action="maintenance.preventive.generate_batch",
+            entity_type="maintenance_preventive_plan",
+            entity_id=run_id,
+            module="maintenance",
+            details={
+                "run_id": run_id,
+                "chunk_index": chunk_index,
+                "plan_count": len(plans),
+                "first_plan_id": plans[0].id,
+                "last_plan_id": plans[-1].id,
+                "generated_work_order_ids": [row.id for row in writes.work_orders],
+                "generated_work_request_ids": [row.id for row in writes.work_requests],
+                "created_instance_count": len(writes.created_instances),
+                "removed_instance_count": len(writes.removed_instance_ids),
+            },
+        )
+        changed = (
+            ("maintenance_preventive_plan", "maintenance_preventive_plans_changed", writes.plans),
+            ("maintenance_preventive_plan_task", "maintenance_preventive_plan_tasks_changed", writes.plan_tasks),
+            ("maintenance_work_order", "maintenance_work_orders_changed", writes.work_orders),
+            ("maintenance_work_request", "maintenance_work_requests_changed", writes.work_requests),
+        )
+        for entity_type, source_event, rows in changed:
+            if rows:
+                domain_events.domain_changed.emit(
+                    DomainChangeEvent(
+                        category="module",
+                        scope_code="maintenance_management",
+                        entity_type=entity_type,
+                        entity_id=run_id,
+                        source_event=source_event,
+                    )
+                )
+
+
+__all__ = ["DEFAULT_GENERATION_CHUNK_SIZE", "MaintenancePreventiveBatchGenerationMixin"]
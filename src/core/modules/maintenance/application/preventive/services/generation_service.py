@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 
 from sqlalchemy.orm import Session
@@ -13,9 +14,11 @@ from src.core.modules.maintenance.domain import (
     MaintenancePreventivePlan,
     MaintenancePreventivePlanInstance,
     MaintenancePreventivePlanTask,
+    MaintenanceSensor,
 )
 from src.core.modules.maintenance.contracts.repositories import (
     MaintenanceBlackoutWindowRepository,
+    MaintenancePreventiveGenerationRepository,
     MaintenancePreventivePlanInstanceRepository,
     MaintenancePreventivePlanRepository,
     MaintenancePreventivePlanTaskRepository,
@@ -55,6 +58,9 @@ from src.core.modules.maintenance.application.preventive.schedulers.forecast imp
 from src.core.modules.maintenance.application.preventive.schedulers.instance_scheduler import (
     PreventiveInstanceScheduler,
 )
+from src.core.modules.maintenance.application.preventive.services.batch_generation import (
+    MaintenancePreventiveBatchGenerationMixin,
+)
 from src.core.modules.maintenance.application.preventive.services.work_package import (
     MaintenancePreventiveWorkPackageBuilder,
 )
@@ -84,7 +90,7 @@ from src.core.platform.domain.master_data.org import Organization
 from src.core.platform.domain.master_data.site import Site
 
 
-class MaintenancePreventiveGenerationService:
+class MaintenancePreventiveGenerationService(MaintenancePreventiveBatchGenerationMixin):
     """
     Orchestrates preventive maintenance due-detection and work generation.
 
@@ -111,6 +117,7 @@ class MaintenancePreventiveGenerationService:
         work_order_task_service: MaintenanceWorkOrderTaskService,
         work_order_task_step_service: MaintenanceWorkOrderTaskStepService,
         blackout_window_repo: MaintenanceBlackoutWindowRepository | None = None,
+        generation_repo: MaintenancePreventiveGenerationRepository | None = None,
         tenant_context_service: TenantContextService | None = None,
         user_session=None,
         activity_service=None,
@@ -132,6 +139,8 @@ class MaintenancePreventiveGenerationService:
         self._work_order_service = work_order_service
         self._work_order_task_service = work_order_task_service
         self._work_order_task_step_service = work_order_task_step_service
+        self._blackout_window_repo = blackout_window_repo
+        self._generation_repo = generation_repo
         self._user_session = user_session
         self._activity_service = activity_service
         self._scheduler = PreventiveInstanceScheduler(
@@ -258,50 +267,73 @@ class MaintenancePreventiveGenerationService:
         if site_id is not None:
             self._get_site(site_id, organization=organization)
         rows = self._list_visible_active_plans(organization=organization, site_id=site_id, plan_id=plan_id)
-        results: list[MaintenancePreventiveGenerationResult] = []
-        for plan in rows:
-            self._scheduler.sync_calendar_plan_instances(plan, resolved_as_of)
-            candidate = self._build_candidate(plan, resolved_as_of)
-            if candidate.due_state != "DUE":
-                results.append(
-                    MaintenancePreventiveGenerationResult(
-                        plan_id=plan.id,
-                        plan_code=plan.plan_code,
-                        generation_target=candidate.generation_target,
-                        skipped_reason=candidate.due_reason,
-                    )
-                )
-                continue
-            self._require_scope_manage(
-                self._scope_anchor_for_plan(plan),
-                operation_label="generate maintenance preventive work",
-            )
-            results.append(self._generate_candidate(plan, candidate, resolved_as_of))
-        return results
+        return [self._generate_plan(plan, resolved_as_of) for plan in rows]
 
     # ------------------------------------------------------------------
     # Internal orchestration
     # ------------------------------------------------------------------
 
+    def _generate_plan(
+        self,
+        plan: MaintenancePreventivePlan,
+        as_of: datetime,
+    ) -> MaintenancePreventiveGenerationResult:
+        self._scheduler.sync_calendar_plan_instances(plan, as_of)
+        candidate = self._build_candidate(plan, as_of)
+        if candidate.due_state != "DUE":
+            return MaintenancePreventiveGenerationResult(
+                plan_id=plan.id,
+                plan_code=plan.plan_code,
+                generation_target=candidate.generation_target,
+                skipped_reason=candidate.due_reason,
+            )
+        self._require_scope_manage(
+            self._scope_anchor_for_plan(plan),
+            operation_label="generate maintenance preventive work",
+        )
+        return self._generate_candidate(plan, candidate, as_of)
+
     def _build_candidate(
         self,
         plan: MaintenancePreventivePlan,
         as_of: datetime,
     ) -> MaintenancePreventiveDueCandidate:
+        planned: list[MaintenancePreventivePlanInstance] = []
+        sensor_ids: set[str] = set()
         if self._scheduler.plan_uses_calendar_instances(plan):
-            instances = self._scheduler.list_instances(
+            planned = self._scheduler.list_instances(
                 plan, status=MaintenancePreventiveInstanceStatus.PLANNED.value
             )
+        elif plan.sensor_id:
+            sensor_ids.add(plan.sensor_id)
+        plan_tasks = self._preventive_plan_task_repo.list_for_organization(
+            plan.organization_id, plan_id=plan.id
+        )
+        sensor_ids.update(row.sensor_id_override for row in plan_tasks if row.sensor_id_override)
+        sensors = {sensor_id: self._sensor_repo.get(sensor_id) for sensor_id in sensor_ids}
+        return self._evaluate_candidate(
+            plan, as_of, planned=planned, plan_tasks=plan_tasks, sensors=sensors
+        )
+
+    def _evaluate_candidate(
+        self,
+        plan: MaintenancePreventivePlan,
+        as_of: datetime,
+        *,
+        planned: list[MaintenancePreventivePlanInstance],
+        plan_tasks: list[MaintenancePreventivePlanTask],
+        sensors: Mapping[str, MaintenanceSensor | None],
+    ) -> MaintenancePreventiveDueCandidate:
+        """Due state of ``plan`` from already-loaded rows: its PLANNED
+        instances, its plan tasks and every sensor they reference."""
+        if self._scheduler.plan_uses_calendar_instances(plan):
             plan_eval = evaluate_calendar_instance_window(
-                plan=plan, instances=instances, as_of=as_of
+                plan=plan, instances=planned, as_of=as_of
             )
         else:
-            sensor = self._sensor_repo.get(plan.sensor_id) if plan.sensor_id else None
+            sensor = sensors.get(plan.sensor_id) if plan.sensor_id else None
             plan_eval = evaluate_plan_trigger(plan, sensor=sensor, as_of=as_of)
 
-        plan_tasks = self._preventive_plan_task_repo.list_for_organization(
-            plan.organization_id, plan_id=plan.id
-        )
         selected_ids: list[str] = []
         blocked_ids: list[str] = []
         target = "WORK_ORDER" if plan.auto_generate_work_order else "WORK_REQUEST"
@@ -311,11 +343,7 @@ class MaintenancePreventiveGenerationService:
                 if plan_eval.due:
                     selected_ids.append(plan_task.id)
                 continue
-            task_sensor = (
-                self._sensor_repo.get(plan_task.sensor_id_override)
-                if plan_task.sensor_id_override
-                else None
-            )
+            task_sensor = sensors.get(plan_task.sensor_id_override) if plan_task.sensor_id_override else None
             task_eval = evaluate_plan_task_trigger(plan_task, sensor=task_sensor, as_of=as_of)
             if task_eval.due:
                 selected_ids.append(plan_task.id)
@@ -455,31 +483,24 @@ class MaintenancePreventiveGenerationService:
         generated_work_order_id: str | None,
     ) -> None:
         sensor = self._sensor_repo.get(plan.sensor_id) if plan.sensor_id else None
-        audit_now = datetime.now(timezone.utc)
-        plan.last_generated_at = as_of
         if due_instance is not None:
-            due_instance.status = MaintenancePreventiveInstanceStatus.GENERATED
-            due_instance.generated_at = as_of
-            due_instance.generated_work_request_id = generated_work_request_id
-            due_instance.generated_work_order_id = generated_work_order_id
-            due_instance.updated_at = audit_now
+            self._mark_instance_generated(
+                due_instance, as_of,
+                generated_work_request_id=generated_work_request_id,
+                generated_work_order_id=generated_work_order_id,
+            )
             self._preventive_plan_instance_repo.update(due_instance)
-            remaining = self._preventive_plan_instance_repo.list_for_organization(
+        remaining = (
+            self._preventive_plan_instance_repo.list_for_organization(
                 plan.organization_id, plan_id=plan.id,
                 status=MaintenancePreventiveInstanceStatus.PLANNED.value,
             )
-            plan.next_due_at = remaining[0].due_at if remaining else None
-        else:
-            plan.next_due_at = next_calendar_due_value(
-                as_of, plan.calendar_frequency_unit, plan.calendar_frequency_value
-            )
-        plan.next_due_counter = next_sensor_due_counter(
-            sensor=sensor,
-            threshold=plan.sensor_threshold,
-            direction=plan.sensor_direction,
-            current_due_counter=plan.next_due_counter,
+            if due_instance is not None
+            else []
+        )
+        self._mark_plan_generated(
+            plan, as_of, sensor=sensor, due_instance=due_instance, remaining_planned=remaining
         )
-        plan.updated_at = audit_now
         self._preventive_plan_repo.update(plan)
         self._session.commit()
         if due_instance is not None and self._scheduler.plan_uses_calendar_instances(plan):
@@ -504,18 +525,7 @@ class MaintenancePreventiveGenerationService:
             if plan_task.sensor_id_override
             else None
         )
-        audit_now = datetime.now(timezone.utc)
-        plan_task.last_generated_at = as_of
-        plan_task.next_due_at = next_calendar_due_value(
-            as_of, plan_task.calendar_frequency_unit_override, plan_task.calendar_frequency_value_override
-        )
-        plan_task.next_due_counter = next_sensor_due_counter(
-            sensor=sensor,
-            threshold=plan_task.sensor_threshold_override,
-            direction=plan_task.sensor_direction_override,
-            current_due_counter=plan_task.next_due_counter,
-        )
-        plan_task.updated_at = audit_now
+        self._mark_plan_task_generated(plan_task, as_of, sensor=sensor)
         self._preventive_plan_task_repo.update(plan_task)
         self._session.commit()
         domain_events.domain_changed.emit(
@@ -528,6 +538,63 @@ class MaintenancePreventiveGenerationService:
             )
         )
 
+    def _mark_instance_generated(
+        self,
+        instance: MaintenancePreventivePlanInstance,
+        as_of: datetime,
+        *,
+        generated_work_request_id: str | None,
+        generated_work_order_id: str | None,
+    ) -> None:
+        instance.status = MaintenancePreventiveInstanceStatus.GENERATED
+        instance.generated_at = as_of
+        instance.generated_work_request_id = generated_work_request_id
+        instance.generated_work_order_id = generated_work_order_id
+        instance.updated_at = datetime.now(timezone.utc)
+
+    def _mark_plan_generated(
+        self,
+        plan: MaintenancePreventivePlan,
+        as_of: datetime,
+        *,
+        sensor: MaintenanceSensor | None,
+        due_instance: MaintenancePreventivePlanInstance | None,
+        remaining_planned: list[MaintenancePreventivePlanInstance],
+    ) -> None:
+        plan.last_generated_at = as_of
+        if due_instance is not None:
+            plan.next_due_at = remaining_planned[0].due_at if remaining_planned else None
+        else:
+            plan.next_due_at = next_calendar_due_value(
+                as_of, plan.calendar_frequency_unit, plan.calendar_frequency_value
+            )
+        plan.next_due_counter = next_sensor_due_counter(
+            sensor=sensor,
+            threshold=plan.sensor_threshold,
+            direction=plan.sensor_direction,
+            current_due_counter=plan.next_due_counter,
+        )
+        plan.updated_at = datetime.now(timezone.utc)
+
+    def _mark_plan_task_generated(
+        self,
+        plan_task: MaintenancePreventivePlanTask,
+        as_of: datetime,
+        *,
+        sensor: MaintenanceSensor | None,
+    ) -> None:
+        plan_task.last_generated_at = as_of
+        plan_task.next_due_at = next_calendar_due_value(
+            as_of, plan_task.calendar_frequency_unit_override, plan_task.calendar_frequency_value_override
+        )
+        plan_task.next_due_counter = next_sensor_due_counter(
+            sensor=sensor,
+            threshold=plan_task.sensor_threshold_override,
+            direction=plan_task.sensor_direction_override,
+            current_due_counter=plan_task.next_due_counter,
+        )
+        plan_task.updated_at = datetime.now(timezone.utc)
+
     def _selected_plan_tasks(
         self,
         plan_id: str,
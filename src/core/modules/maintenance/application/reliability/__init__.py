@@ -5,7 +5,13 @@ from .failure_code_service import MaintenanceFailureCodeService
 from .integration_source_service import MaintenanceIntegrationSourceService
 from .reliability_service import MaintenanceReliabilityService
 from .sensor_exception_service import MaintenanceSensorExceptionService
-from .sensor_reading_service import MaintenanceSensorReadingService
+from .sensor_reading_service import (
+    MaintenanceSensorReadingBatchResult,
+    MaintenanceSensorReadingService,
+    MaintenanceSensorTrend,
+    MaintenanceSensorTrendPoint,
+    MaintenanceSensorTriggerCheck,
+)
 from .sensor_service import MaintenanceSensorService
 from .sensor_source_mapping_service import MaintenanceSensorSourceMappingService
 
@@ -15,7 +21,11 @@ __all__ = [
     "MaintenanceIntegrationSourceService",
     "MaintenanceReliabilityService",
     "MaintenanceSensorExceptionService",
+    "MaintenanceSensorReadingBatchResult",
     "MaintenanceSensorReadingService",
     "MaintenanceSensorService",
     "MaintenanceSensorSourceMappingService",
+    "MaintenanceSensorTrend",
+    "MaintenanceSensorTrendPoint",
+    "MaintenanceSensorTriggerCheck",
 ]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from functools import reduce
+
+from src.core.modules.maintenance.domain import MaintenanceFailureRollup, MaintenanceFailureRollupDrift
+from src.core.modules.maintenance.domain.reliability.failure_rollups import (
+    failure_occurrence_for,
+    rollup_failure_occurrences,
+)
+from src.core.modules.maintenance.infrastructure.reporting import MaintenanceAssetReliability
+from src.core.modules.maintenance.application.common.support import normalize_maintenance_code
+from src.core.platform.access.authorization import filter_scope_rows
+from src.core.platform.application.security.authorization.enforcement.permission_checks import require_permission
+from src.core.platform.common.exceptions import BusinessRuleError
+
+
+class MaintenanceAssetReliabilityMixin:
+    """Per-asset MTBF and MTTR read from the failure rollups, one row per
+    asset and failure code, instead of from each asset's work orders."""
+
+    def list_asset_reliability(
+        self,
+        *,
+        site_id: str | None = None,
+        asset_id: str | None = None,
+        asset_category: str | None = None,
+        failure_code: str | None = None,
+        limit: int | None = None,
+    ) -> list[MaintenanceAssetReliability]:
+        self._require_report_view("view maintenance asset reliability")
+        organization = self._active_organization()
+        self._validate_scope_filters(
+            organization=organization,
+            site_id=site_id,
+            asset_id=asset_id,
+            system_id=None,
+            location_id=None,
+        )
+        if failure_code is not None:
+            failure_code = normalize_maintenance_code(failure_code, label="Failure code")
+        if self._failure_rollup_repo is not None:
+            rollups = self._failure_rollup_repo.list_for_organization(
+                organization.id,
+                site_id=site_id,
+                asset_id=asset_id,
+                asset_category=asset_category,
+                failure_code=failure_code,
+            )
+            rollups = filter_scope_rows(
+                rollups,
+                self._user_session,
+                scope_type="maintenance",
+                permission_code="maintenance.read",
+                scope_id_getter=lambda rollup: rollup.asset_id,
+            )
+        else:
+            rollups = rollup_failure_occurrences(
+                occurrence
+                for occurrence in (
+                    failure_occurrence_for(row)
+                    for row in self._list_work_orders(
+                        organization=organization,
+                        site_id=site_id,
+                        asset_id=asset_id,
+                        asset_category=asset_category,
+                    )
+                )
+                if occurrence is not None and (failure_code is None or occurrence.failure_code == failure_code)
+            )
+        by_asset: dict[str, list[MaintenanceFailureRollup]] = defaultdict(list)
+        for rollup in rollups:
+            by_asset[rollup.asset_id].append(rollup)
+        assets = {
+            row.id: row
+            for row in self._asset_repo.list_for_organization(organization.id, active_only=None, site_id=site_id)
+        }
+        failure_lookup = self._failure_lookup(organization.id)
+        results = [
+            self._asset_reliability(asset_rollups, assets.get(rollup_asset_id), failure_lookup)
+            for rollup_asset_id, asset_rollups in by_asset.items()
+        ]
+        # Worst actors first: the most failures, then the shortest MTBF.
+        results.sort(
+            key=lambda row: (
+                -row.failure_count,
+                row.mtbf_hours if row.mtbf_hours is not None else float("inf"),
+                row.asset_code,
+            )
+        )
+        return results if limit is None else results[:limit]
+
+    def rebuild_failure_rollups(self) -> int:
+        """Refold every failure rollup of the active organization from its
+        work orders; for backfill and for repairing drift."""
+        require_permission(self._user_session, "maintenance.manage", operation_label="rebuild maintenance failure rollups")
+        repo = self._require_failure_rollup_repo()
+        organization = self._active_organization()
+        try:
+            written = repo.rebuild(organization.id)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        return written
+
+    def check_failure_rollups(self) -> list[MaintenanceFailureRollupDrift]:
+        """Rollups of the active organization that disagree with a fresh
+        fold of their work orders; empty when they are consistent."""
+        self._require_report_view("check maintenance failure rollups")
+        return self._require_failure_rollup_repo().list_drift(self._active_organization().id)
+
+    def _require_failure_rollup_repo(self):
+        if self._failure_rollup_repo is None:
+            raise BusinessRuleError(
+                "Maintenance failure rollups are not configured.",
+                code="MAINTENANCE_FAILURE_ROLLUPS_UNAVAILABLE",
+            )
+        return self._failure_rollup_repo
+
+    def _asset_reliability(
+        self,
+        rollups: list[MaintenanceFailureRollup],
+        asset,
+        failure_lookup: dict[str, str],
+    ) -> MaintenanceAssetReliability:
+        # Failure modes of one asset interleave in time; merging their
+        # rollups gives the asset-level figures exactly.
+        total = reduce(MaintenanceFailureRollup.merged, rollups)
+        leading = min(rollups, key=lambda rollup: (-rollup.failure_count, rollup.failure_code))
+        uptime_seconds = max(total.uptime_seconds, 0)
+        return MaintenanceAssetReliability(
+            asset_id=total.asset_id,
+            asset_code=asset.asset_code if asset is not None else total.asset_id,
+            asset_name=asset.name if asset is not None else "",
+            failure_count=total.failure_count,
+            failure_mode_count=len(rollups),
+            mtbf_hours=self._mean_hours(uptime_seconds, total.failure_count - 1),
+            mttr_hours=self._mean_hours(total.repair_seconds, total.repair_count),
+            uptime_hours=round(uptime_seconds / 3600.0, 2),
+            repair_hours=round(total.repair_seconds / 3600.0, 2),
+            leading_failure_code=leading.failure_code,
+            leading_failure_name=failure_lookup.get(leading.failure_code, leading.failure_code),
+            last_failure_at=total.last_failure_at,
+        )
+
+
+__all__ = ["MaintenanceAssetReliabilityMixin"]
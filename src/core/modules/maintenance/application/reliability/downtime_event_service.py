@@ -7,13 +7,16 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from src.core.modules.maintenance.domain import MaintenanceDowntimeEvent, MaintenanceWorkOrder
+from src.core.modules.maintenance.domain.reliability.failure_rollups import failure_occurrence_for
 from src.core.modules.maintenance.contracts.repositories import (
     MaintenanceAssetComponentRepository,
     MaintenanceAssetRepository,
     MaintenanceDowntimeEventRepository,
+    MaintenanceFailureRollupRepository,
     MaintenanceSystemRepository,
     MaintenanceWorkOrderRepository,
 )
+from src.core.modules.maintenance.application.common.failure_rollups import sync_failure_rollup
 from src.core.modules.maintenance.application.common.support import (
     calculate_downtime_minutes,
     coerce_optional_datetime,
@@ -46,6 +49,7 @@ class MaintenanceDowntimeEventService:
         asset_repo: MaintenanceAssetRepository,
         component_repo: MaintenanceAssetComponentRepository,
         system_repo: MaintenanceSystemRepository,
+        failure_rollup_repo: MaintenanceFailureRollupRepository | None = None,
         tenant_context_service: TenantContextService | None = None,
         user_session=None,
         activity_service=None,
@@ -61,6 +65,7 @@ class MaintenanceDowntimeEventService:
         self._asset_repo = asset_repo
         self._component_repo = component_repo
         self._system_repo = system_repo
+        self._failure_rollup_repo = failure_rollup_repo
         self._user_session = user_session
         self._activity_service = activity_service
 
@@ -69,6 +74,7 @@ class MaintenanceDowntimeEventService:
         *,
         work_order_id: str | None = None,
         asset_id: str | None = None,
+        under_asset_id: str | None = None,
         system_id: str | None = None,
         downtime_type: str | None = None,
         reason_code: str | None = None,
@@ -76,6 +82,8 @@ class MaintenanceDowntimeEventService:
         started_from=None,
         started_to=None,
     ) -> list[MaintenanceDowntimeEvent]:
+        """``under_asset_id`` keeps events on that asset or any asset below
+        it in the hierarchy."""
         self._require_read("list maintenance downtime events")
         organization = self._active_organization()
         if work_order_id is not None:
@@ -86,12 +94,15 @@ class MaintenanceDowntimeEventService:
             )
         if asset_id is not None:
             self._get_asset(asset_id, organization=organization)
+        if under_asset_id is not None:
+            self._get_asset(under_asset_id, organization=organization)
         if system_id is not None:
             self._get_system(system_id, organization=organization)
         rows = self._downtime_event_repo.list_for_organization(
             organization.id,
             work_order_id=normalize_optional_text(work_order_id) or None,
             asset_id=normalize_optional_text(asset_id) or None,
+            under_asset_id=normalize_optional_text(under_asset_id) or None,
             system_id=normalize_optional_text(system_id) or None,
             downtime_type=normalize_optional_text(downtime_type).upper() or None,
             reason_code=normalize_optional_text(reason_code).upper() or None,
@@ -113,6 +124,7 @@ class MaintenanceDowntimeEventService:
         search_text: str = "",
         work_order_id: str | None = None,
         asset_id: str | None = None,
+        under_asset_id: str | None = None,
         system_id: str | None = None,
         open_only: bool | None = None,
     ) -> list[MaintenanceDowntimeEvent]:
@@ -120,6 +132,7 @@ class MaintenanceDowntimeEventService:
         rows = self.list_downtime_events(
             work_order_id=work_order_id,
             asset_id=asset_id,
+            under_asset_id=under_asset_id,
             system_id=system_id,
             open_only=open_only,
         )
@@ -340,9 +353,13 @@ class MaintenanceDowntimeEventService:
             work_order.organization_id,
             work_order_id=work_order.id,
         )
+        # The booked downtime is the repair time of a completed failure that
+        # has no actual start or end, so the rollup moves with it.
+        before = failure_occurrence_for(work_order)
         work_order.downtime_minutes = sum(row.duration_minutes or 0 for row in rows) or None
         work_order.updated_at = datetime.now(timezone.utc)
         self._work_order_repo.update(work_order)
+        sync_failure_rollup(self._session, self._failure_rollup_repo, before, failure_occurrence_for(work_order))
 
     def _active_organization(self) -> Organization:
         return self._tenant_context_service.require_context(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import Counter, defaultdict
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.orm import Session
@@ -19,8 +20,11 @@ from src.core.modules.maintenance.contracts.repositories import (
     MaintenanceAssetRepository,
     MaintenanceDowntimeEventRepository,
     MaintenanceFailureCodeRepository,
+    MaintenanceFailureRollupRepository,
     MaintenanceLocationRepository,
+    MaintenanceReliabilityAnalyticsRepository,
     MaintenanceSystemRepository,
+    MaintenanceWorkOrderAnalyticsFilter,
     MaintenanceWorkOrderRepository,
 )
 from src.core.modules.maintenance.infrastructure.reporting import (
@@ -31,7 +35,11 @@ from src.core.modules.maintenance.infrastructure.reporting import (
     ReportMetric,
 )
 from src.core.modules.maintenance.application.common.support import normalize_maintenance_code
+from src.core.modules.maintenance.application.reliability.asset_reliability import (
+    MaintenanceAssetReliabilityMixin,
+)
 from src.core.platform.access.authorization import filter_scope_rows
+from src.core.platform.application.security.authorization import get_authorization_engine
 from src.core.platform.application.security.authorization.enforcement.permission_checks import require_permission
 from src.core.platform.common.exceptions import NotFoundError, ValidationError
 from src.core.platform.contract.repositories.master_data.org.contracts import OrganizationRepository
@@ -51,7 +59,20 @@ _TERMINAL_WORK_ORDER_STATUSES = {
 }
 
 
-class MaintenanceReliabilityService:
+@dataclass(frozen=True, slots=True)
+class _DashboardFigures:
+    backlog_by_status: Counter[str]
+    backlog_by_priority: Counter[str]
+    overdue_count: int
+    completed_in_window: int
+    downtime_by_type: Counter[str]
+    open_downtime_events: int
+    downtime_minutes: int
+    mttr_hours: float | None
+    mtbf_hours: float | None
+
+
+class MaintenanceReliabilityService(MaintenanceAssetReliabilityMixin):
     def __init__(
         self,
         session: Session,
@@ -65,6 +86,8 @@ class MaintenanceReliabilityService:
         work_order_repo: MaintenanceWorkOrderRepository,
         failure_code_repo: MaintenanceFailureCodeRepository,
         downtime_event_repo: MaintenanceDowntimeEventRepository,
+        analytics_repo: MaintenanceReliabilityAnalyticsRepository | None = None,
+        failure_rollup_repo: MaintenanceFailureRollupRepository | None = None,
         tenant_context_service: TenantContextService | None = None,
         user_session=None,
     ) -> None:
@@ -82,6 +105,10 @@ class MaintenanceReliabilityService:
         self._work_order_repo: MaintenanceWorkOrderRepository = work_order_repo
         self._failure_code_repo: MaintenanceFailureCodeRepository = failure_code_repo
         self._downtime_event_repo: MaintenanceDowntimeEventRepository = downtime_event_repo
+        # With an analytics repository the figures are grouped in SQL;
+        # without one they are computed from the listed work orders.
+        self._analytics_repo: MaintenanceReliabilityAnalyticsRepository | None = analytics_repo
+        self._failure_rollup_repo: MaintenanceFailureRollupRepository | None = failure_rollup_repo
         self._user_session = user_session
 
     def build_reliability_dashboard(
@@ -91,7 +118,9 @@ class MaintenanceReliabilityService:
         asset_id: str | None = None,
         system_id: str | None = None,
         location_id: str | None = None,
+        asset_category: str | None = None,
         days: int = 90,
+        as_of: datetime | None = None,
         recurring_threshold: int = 2,
         limit: int = 5,
     ) -> MaintenanceReliabilityDashboard:
@@ -104,36 +133,25 @@ class MaintenanceReliabilityService:
             system_id=system_id,
             location_id=location_id,
         )
-        window_start = self._window_start(days)
-        work_orders = self._list_work_orders(
-            organization=organization,
-            site_id=site_id,
-            asset_id=asset_id,
-            system_id=system_id,
-            location_id=location_id,
+        window_end = self._normalize_timestamp(as_of)
+        window_start = self._window_start(days, as_of=window_end)
+        build_figures = (
+            self._dashboard_figures_from_aggregates
+            if self._analytics_repo is not None
+            else self._dashboard_figures
         )
-        windowed_work_orders = [row for row in work_orders if self._activity_at(row) >= window_start]
-        downtime_rows = self._list_downtime_events(
+        figures = build_figures(
             organization=organization,
             site_id=site_id,
             asset_id=asset_id,
             system_id=system_id,
             location_id=location_id,
-            started_from=window_start,
+            asset_category=asset_category,
+            window_start=window_start,
+            window_end=window_end,
         )
-
-        open_rows = [row for row in work_orders if self._is_open_status(row.status)]
-        overdue_rows = [
-            row
-            for row in open_rows
-            if row.planned_end is not None
-            and self._normalize_timestamp(row.planned_end) < datetime.now(timezone.utc)
-        ]
-        backlog_by_status = Counter(str(row.status.value) for row in open_rows)
-        backlog_by_priority = Counter(str(row.priority.value) for row in open_rows)
-        downtime_by_type = Counter(str(row.downtime_type or "UNSPECIFIED") for row in downtime_rows)
-        mttr_hours = self._mean_repair_hours(windowed_work_orders)
-        mtbf_hours = self._mean_interval_hours(windowed_work_orders)
+        backlog_by_status = figures.backlog_by_status
+        backlog_by_priority = figures.backlog_by_priority
 
         return MaintenanceReliabilityDashboard(
             title="Maintenance Reliability Dashboard",
@@ -145,14 +163,14 @@ class MaintenanceReliabilityService:
                 ReportMetric("Window", f"{days} days"),
             ),
             summary=(
-                ReportMetric("Open work orders", len(open_rows)),
-                ReportMetric("In progress work orders", sum(1 for row in open_rows if row.status == MaintenanceWorkOrderStatus.IN_PROGRESS)),
-                ReportMetric("Overdue work orders", len(overdue_rows)),
-                ReportMetric("Completed in window", sum(1 for row in windowed_work_orders if row.status in _TERMINAL_WORK_ORDER_STATUSES)),
-                ReportMetric("Open downtime events", sum(1 for row in downtime_rows if row.ended_at is None)),
-                ReportMetric("Downtime minutes", sum(int(row.duration_minutes or 0) for row in downtime_rows)),
-                ReportMetric("MTTR hours", mttr_hours if mttr_hours is not None else "n/a"),
-                ReportMetric("MTBF hours", mtbf_hours if mtbf_hours is not None else "n/a"),
+                ReportMetric("Open work orders", sum(backlog_by_status.values())),
+                ReportMetric("In progress work orders", backlog_by_status.get(MaintenanceWorkOrderStatus.IN_PROGRESS.value, 0)),
+                ReportMetric("Overdue work orders", figures.overdue_count),
+                ReportMetric("Completed in window", figures.completed_in_window),
+                ReportMetric("Open downtime events", figures.open_downtime_events),
+                ReportMetric("Downtime minutes", figures.downtime_minutes),
+                ReportMetric("MTTR hours", figures.mttr_hours if figures.mttr_hours is not None else "n/a"),
+                ReportMetric("MTBF hours", figures.mtbf_hours if figures.mtbf_hours is not None else "n/a"),
             ),
             backlog_by_status=tuple(
                 ReportMetric(status.replace("_", " ").title(), backlog_by_status.get(status.value, 0))
@@ -166,7 +184,7 @@ class MaintenanceReliabilityService:
             ),
             downtime_by_type=tuple(
                 ReportMetric(label.replace("_", " ").title(), minutes)
-                for label, minutes in sorted(downtime_by_type.items(), key=lambda item: (-item[1], item[0]))
+                for label, minutes in sorted(figures.downtime_by_type.items(), key=lambda item: (-item[1], item[0]))
             ),
             top_root_causes=tuple(
                 self.list_root_cause_analysis(
@@ -174,7 +192,9 @@ class MaintenanceReliabilityService:
                     asset_id=asset_id,
                     system_id=system_id,
                     location_id=location_id,
+                    asset_category=asset_category,
                     days=days,
+                    as_of=as_of,
                     limit=limit,
                 )
             ),
@@ -184,7 +204,9 @@ class MaintenanceReliabilityService:
                     asset_id=asset_id,
                     system_id=system_id,
                     location_id=location_id,
+                    asset_category=asset_category,
                     days=days,
+                    as_of=as_of,
                     min_occurrences=recurring_threshold,
                     limit=limit,
                 )
@@ -198,7 +220,9 @@ class MaintenanceReliabilityService:
         asset_id: str | None = None,
         system_id: str | None = None,
         location_id: str | None = None,
+        asset_category: str | None = None,
         days: int = 180,
+        as_of: datetime | None = None,
         limit: int = 20,
     ) -> list[MaintenanceRootCauseInsight]:
         self._require_report_view("view maintenance root cause analysis")
@@ -210,7 +234,38 @@ class MaintenanceReliabilityService:
             system_id=system_id,
             location_id=location_id,
         )
-        window_start = self._window_start(days)
+        window_end = self._normalize_timestamp(as_of)
+        window_start = self._window_start(days, as_of=window_end)
+        failure_lookup = self._failure_lookup(organization.id)
+        if self._analytics_repo is not None:
+            facts = self._analytics_repo.list_root_causes(
+                self._analytics_filter(
+                    organization=organization,
+                    site_id=site_id,
+                    asset_id=asset_id,
+                    system_id=system_id,
+                    location_id=location_id,
+                    asset_category=asset_category,
+                    activity_from=window_start,
+                    activity_to=window_end,
+                ),
+                terminal_statuses=_TERMINAL_WORK_ORDER_STATUSES,
+                limit=limit,
+            )
+            return [
+                MaintenanceRootCauseInsight(
+                    failure_code=fact.failure_code,
+                    failure_name=failure_lookup.get(fact.failure_code, fact.failure_code),
+                    root_cause_code=fact.root_cause_code,
+                    root_cause_name=failure_lookup.get(fact.root_cause_code, fact.root_cause_code),
+                    work_order_count=fact.work_order_count,
+                    total_downtime_minutes=fact.total_downtime_minutes,
+                    average_downtime_minutes=round(fact.total_downtime_minutes / fact.work_order_count, 2),
+                    latest_occurrence_at=fact.latest_occurrence_at,
+                    open_work_orders=fact.open_work_orders,
+                )
+                for fact in facts
+            ]
         rows = [
             row
             for row in self._list_work_orders(
@@ -219,10 +274,10 @@ class MaintenanceReliabilityService:
                 asset_id=asset_id,
                 system_id=system_id,
                 location_id=location_id,
+                asset_category=asset_category,
             )
-            if row.root_cause_code and self._activity_at(row) >= window_start
+            if row.root_cause_code and self._in_window(row, window_start, window_end)
         ]
-        failure_lookup = self._failure_lookup(organization.id)
         aggregates: dict[tuple[str, str], dict[str, object]] = {}
         for row in rows:
             key = (row.failure_code or "", row.root_cause_code or "")
@@ -272,7 +327,9 @@ class MaintenanceReliabilityService:
         failure_code: str,
         asset_id: str | None = None,
         system_id: str | None = None,
+        asset_category: str | None = None,
         days: int = 365,
+        as_of: datetime | None = None,
         limit: int = 5,
     ) -> list[MaintenanceRootCauseSuggestion]:
         self._require_report_view("suggest maintenance root causes")
@@ -289,14 +346,49 @@ class MaintenanceReliabilityService:
         if system_id is not None:
             self._get_system(system_id, organization=organization)
 
-        window_start = self._window_start(days)
+        window_end = self._normalize_timestamp(as_of)
+        window_start = self._window_start(days, as_of=window_end)
         failure_lookup = self._failure_lookup(organization.id)
+        if self._analytics_repo is not None:
+            filters = self._analytics_filter(
+                organization=organization,
+                asset_category=asset_category,
+                activity_from=window_start,
+                activity_to=window_end,
+            )
+            # Narrowest scope first; the organization is the fallback.
+            for match_scope, scoped_filters in (
+                ("asset", replace(filters, asset_id=asset_id) if asset_id is not None else None),
+                ("system", replace(filters, system_id=system_id) if system_id is not None else None),
+                ("organization", filters),
+            ):
+                if scoped_filters is None:
+                    continue
+                facts = self._analytics_repo.list_root_causes(
+                    scoped_filters,
+                    terminal_statuses=_TERMINAL_WORK_ORDER_STATUSES,
+                    failure_code=normalized_failure_code,
+                    limit=limit,
+                )
+                if facts:
+                    return [
+                        MaintenanceRootCauseSuggestion(
+                            root_cause_code=fact.root_cause_code,
+                            root_cause_name=failure_lookup.get(fact.root_cause_code, fact.root_cause_code),
+                            match_scope=match_scope,
+                            occurrence_count=fact.work_order_count,
+                            total_downtime_minutes=fact.total_downtime_minutes,
+                            latest_occurrence_at=fact.latest_occurrence_at,
+                        )
+                        for fact in facts
+                    ]
+            return []
         base_rows = [
             row
-            for row in self._list_work_orders(organization=organization)
+            for row in self._list_work_orders(organization=organization, asset_category=asset_category)
             if row.failure_code == normalized_failure_code
             and row.root_cause_code
-            and self._activity_at(row) >= window_start
+            and self._in_window(row, window_start, window_end)
         ]
 
         for match_scope, filtered_rows in (
@@ -355,7 +447,9 @@ class MaintenanceReliabilityService:
         asset_id: str | None = None,
         system_id: str | None = None,
         location_id: str | None = None,
+        asset_category: str | None = None,
         days: int = 180,
+        as_of: datetime | None = None,
         min_occurrences: int = 2,
         limit: int = 20,
     ) -> list[MaintenanceRecurringFailurePattern]:
@@ -373,53 +467,98 @@ class MaintenanceReliabilityService:
                 "Recurring failure analysis requires at least two occurrences.",
                 code="MAINTENANCE_RECURRING_FAILURE_THRESHOLD_INVALID",
             )
-        window_start = self._window_start(days)
-        rows = [
-            row
-            for row in self._list_work_orders(
-                organization=organization,
-                site_id=site_id,
-                asset_id=asset_id,
-                system_id=system_id,
-                location_id=location_id,
-            )
-            if row.failure_code and row.status != MaintenanceWorkOrderStatus.CANCELLED and self._activity_at(row) >= window_start
-        ]
+        window_end = self._normalize_timestamp(as_of)
+        window_start = self._window_start(days, as_of=window_end)
         failure_lookup = self._failure_lookup(organization.id)
         anchors = self._anchor_lookup(organization.id)
-        grouped: dict[tuple[str, str, str, str], list[MaintenanceWorkOrder]] = defaultdict(list)
-        for row in rows:
-            anchor_type, anchor_id = self._pattern_anchor(row)
-            if not anchor_id:
-                continue
-            grouped[(anchor_type, anchor_id, row.failure_code, row.root_cause_code or "")].append(row)
-
         patterns: list[MaintenanceRecurringFailurePattern] = []
-        for (anchor_type, anchor_id, failure_code, root_cause_code), group_rows in grouped.items():
-            if len(group_rows) < min_occurrences:
-                continue
-            lead_root_cause = root_cause_code or self._leading_root_cause(group_rows)
-            activity_points = sorted(self._activity_at(row) for row in group_rows)
-            total_downtime = sum(int(row.downtime_minutes or 0) for row in group_rows)
-            patterns.append(
-                MaintenanceRecurringFailurePattern(
-                    anchor_type=anchor_type,
-                    anchor_id=anchor_id,
-                    anchor_code=anchors.get((anchor_type, anchor_id), ("", ""))[0],
-                    anchor_name=anchors.get((anchor_type, anchor_id), ("", ""))[1],
-                    failure_code=failure_code,
-                    failure_name=failure_lookup.get(failure_code, failure_code),
-                    leading_root_cause_code=lead_root_cause,
-                    leading_root_cause_name=failure_lookup.get(lead_root_cause, lead_root_cause),
-                    occurrence_count=len(group_rows),
-                    open_work_orders=sum(1 for row in group_rows if self._is_open_status(row.status)),
-                    total_downtime_minutes=total_downtime,
-                    mean_interval_hours=self._interval_hours(activity_points),
-                    mean_repair_hours=self._repair_hours(group_rows),
-                    first_occurrence_at=activity_points[0] if activity_points else None,
-                    last_occurrence_at=activity_points[-1] if activity_points else None,
-                )
+        if self._analytics_repo is not None:
+            facts = self._analytics_repo.list_recurring_failures(
+                self._analytics_filter(
+                    organization=organization,
+                    site_id=site_id,
+                    asset_id=asset_id,
+                    system_id=system_id,
+                    location_id=location_id,
+                    asset_category=asset_category,
+                    activity_from=window_start,
+                    activity_to=window_end,
+                ),
+                terminal_statuses=_TERMINAL_WORK_ORDER_STATUSES,
+                min_occurrences=min_occurrences,
             )
+            for fact in facts:
+                anchor_code, anchor_name = anchors.get((fact.anchor_type, fact.anchor_id), ("", ""))
+                patterns.append(
+                    MaintenanceRecurringFailurePattern(
+                        anchor_type=fact.anchor_type,
+                        anchor_id=fact.anchor_id,
+                        anchor_code=anchor_code,
+                        anchor_name=anchor_name,
+                        failure_code=fact.failure_code,
+                        failure_name=failure_lookup.get(fact.failure_code, fact.failure_code),
+                        leading_root_cause_code=fact.root_cause_code,
+                        leading_root_cause_name=failure_lookup.get(fact.root_cause_code, fact.root_cause_code),
+                        occurrence_count=fact.occurrence_count,
+                        open_work_orders=fact.open_work_orders,
+                        total_downtime_minutes=fact.total_downtime_minutes,
+                        mean_interval_hours=self._span_interval_hours(
+                            fact.first_occurrence_at,
+                            fact.last_occurrence_at,
+                            fact.occurrence_count,
+                        ),
+                        mean_repair_hours=self._mean_hours(fact.repair_seconds, fact.repair_count),
+                        first_occurrence_at=fact.first_occurrence_at,
+                        last_occurrence_at=fact.last_occurrence_at,
+                    )
+                )
+        else:
+            rows = [
+                row
+                for row in self._list_work_orders(
+                    organization=organization,
+                    site_id=site_id,
+                    asset_id=asset_id,
+                    system_id=system_id,
+                    location_id=location_id,
+                    asset_category=asset_category,
+                )
+                if row.failure_code
+                and row.status != MaintenanceWorkOrderStatus.CANCELLED
+                and self._in_window(row, window_start, window_end)
+            ]
+            grouped: dict[tuple[str, str, str, str], list[MaintenanceWorkOrder]] = defaultdict(list)
+            for row in rows:
+                anchor_type, anchor_id = self._pattern_anchor(row)
+                if not anchor_id:
+                    continue
+                grouped[(anchor_type, anchor_id, row.failure_code, row.root_cause_code or "")].append(row)
+
+            for (anchor_type, anchor_id, failure_code, root_cause_code), group_rows in grouped.items():
+                if len(group_rows) < min_occurrences:
+                    continue
+                lead_root_cause = root_cause_code or self._leading_root_cause(group_rows)
+                activity_points = sorted(self._activity_at(row) for row in group_rows)
+                total_downtime = sum(int(row.downtime_minutes or 0) for row in group_rows)
+                patterns.append(
+                    MaintenanceRecurringFailurePattern(
+                        anchor_type=anchor_type,
+                        anchor_id=anchor_id,
+                        anchor_code=anchors.get((anchor_type, anchor_id), ("", ""))[0],
+                        anchor_name=anchors.get((anchor_type, anchor_id), ("", ""))[1],
+                        failure_code=failure_code,
+                        failure_name=failure_lookup.get(failure_code, failure_code),
+                        leading_root_cause_code=lead_root_cause,
+                        leading_root_cause_name=failure_lookup.get(lead_root_cause, lead_root_cause),
+                        occurrence_count=len(group_rows),
+                        open_work_orders=sum(1 for row in group_rows if self._is_open_status(row.status)),
+                        total_downtime_minutes=total_downtime,
+                        mean_interval_hours=self._interval_hours(activity_points),
+                        mean_repair_hours=self._repair_hours(group_rows),
+                        first_occurrence_at=activity_points[0] if activity_points else None,
+                        last_occurrence_at=activity_points[-1] if activity_points else None,
+                    )
+                )
         patterns.sort(
             key=lambda row: (
                 -row.occurrence_count,
@@ -430,6 +569,149 @@ class MaintenanceReliabilityService:
         )
         return patterns[:limit]
 
+    def _dashboard_figures(
+        self,
+        *,
+        organization: Organization,
+        site_id: str | None,
+        asset_id: str | None,
+        system_id: str | None,
+        location_id: str | None,
+        asset_category: str | None,
+        window_start: datetime,
+        window_end: datetime | None,
+    ) -> _DashboardFigures:
+        work_orders = self._list_work_orders(
+            organization=organization,
+            site_id=site_id,
+            asset_id=asset_id,
+            system_id=system_id,
+            location_id=location_id,
+            asset_category=asset_category,
+        )
+        windowed_work_orders = [row for row in work_orders if self._in_window(row, window_start, window_end)]
+        downtime_rows = self._list_downtime_events(
+            organization=organization,
+            site_id=site_id,
+            asset_id=asset_id,
+            system_id=system_id,
+            location_id=location_id,
+            asset_category=asset_category,
+            started_from=window_start,
+            started_to=window_end,
+        )
+        open_rows = [row for row in work_orders if self._is_open_status(row.status)]
+        now = datetime.now(timezone.utc)
+        return _DashboardFigures(
+            backlog_by_status=Counter(str(row.status.value) for row in open_rows),
+            backlog_by_priority=Counter(str(row.priority.value) for row in open_rows),
+            overdue_count=sum(
+                1
+                for row in open_rows
+                if row.planned_end is not None and self._normalize_timestamp(row.planned_end) < now
+            ),
+            completed_in_window=sum(1 for row in windowed_work_orders if row.status in _TERMINAL_WORK_ORDER_STATUSES),
+            downtime_by_type=Counter(str(row.downtime_type or "UNSPECIFIED") for row in downtime_rows),
+            open_downtime_events=sum(1 for row in downtime_rows if row.ended_at is None),
+            downtime_minutes=sum(int(row.duration_minutes or 0) for row in downtime_rows),
+            mttr_hours=self._mean_repair_hours(windowed_work_orders),
+            mtbf_hours=self._mean_interval_hours(windowed_work_orders),
+        )
+
+    def _dashboard_figures_from_aggregates(
+        self,
+        *,
+        organization: Organization,
+        site_id: str | None,
+        asset_id: str | None,
+        system_id: str | None,
+        location_id: str | None,
+        asset_category: str | None,
+        window_start: datetime,
+        window_end: datetime | None,
+    ) -> _DashboardFigures:
+        filters = self._analytics_filter(
+            organization=organization,
+            site_id=site_id,
+            asset_id=asset_id,
+            system_id=system_id,
+            location_id=location_id,
+            asset_category=asset_category,
+        )
+        windowed = replace(filters, activity_from=window_start, activity_to=window_end)
+        backlog_by_status: Counter[str] = Counter()
+        backlog_by_priority: Counter[str] = Counter()
+        overdue_count = 0
+        for fact in self._analytics_repo.list_backlog(
+            filters,
+            statuses=[status for status in MaintenanceWorkOrderStatus if self._is_open_status(status)],
+            overdue_before=datetime.now(timezone.utc),
+        ):
+            backlog_by_status[str(fact.status.value)] += fact.work_order_count
+            backlog_by_priority[str(fact.priority.value)] += fact.work_order_count
+            overdue_count += fact.overdue_count
+        downtime_by_type: Counter[str] = Counter()
+        open_downtime_events = 0
+        downtime_minutes = 0
+        for fact in self._analytics_repo.list_downtime_by_type(
+            filters,
+            started_from=window_start,
+            started_to=window_end,
+        ):
+            downtime_by_type[fact.downtime_type or "UNSPECIFIED"] += fact.event_count
+            open_downtime_events += fact.open_event_count
+            downtime_minutes += fact.total_minutes
+        repairs = self._analytics_repo.summarize_repairs(windowed, terminal_statuses=_TERMINAL_WORK_ORDER_STATUSES)
+        intervals = [
+            value
+            for fact in self._analytics_repo.list_failure_spans(windowed)
+            for value in [
+                self._span_interval_hours(fact.first_occurrence_at, fact.last_occurrence_at, fact.occurrence_count)
+            ]
+            if value is not None
+        ]
+        return _DashboardFigures(
+            backlog_by_status=backlog_by_status,
+            backlog_by_priority=backlog_by_priority,
+            overdue_count=overdue_count,
+            completed_in_window=repairs.terminal_count,
+            downtime_by_type=downtime_by_type,
+            open_downtime_events=open_downtime_events,
+            downtime_minutes=downtime_minutes,
+            mttr_hours=self._mean_hours(repairs.repair_seconds, repairs.repair_count),
+            mtbf_hours=self._mean_of_intervals(intervals),
+        )
+
+    def _analytics_filter(
+        self,
+        *,
+        organization: Organization,
+        site_id: str | None = None,
+        asset_id: str | None = None,
+        system_id: str | None = None,
+        location_id: str | None = None,
+        asset_category: str | None = None,
+        activity_from: datetime | None = None,
+        activity_to: datetime | None = None,
+    ) -> MaintenanceWorkOrderAnalyticsFilter:
+        engine = get_authorization_engine()
+        scope_anchor_ids = (
+            frozenset(engine.scope_ids_for(self._user_session, "maintenance", "maintenance.read"))
+            if engine.is_scope_restricted(self._user_session, "maintenance")
+            else None
+        )
+        return MaintenanceWorkOrderAnalyticsFilter(
+            organization_id=organization.id,
+            site_id=site_id,
+            asset_id=asset_id,
+            system_id=system_id,
+            location_id=location_id,
+            asset_category=asset_category,
+            scope_anchor_ids=scope_anchor_ids,
+            activity_from=activity_from,
+            activity_to=activity_to,
+        )
+
     def _active_organization(self) -> Organization:
         return self._tenant_context_service.require_context(
             operation_label="maintenance reliability analytics"
@@ -473,6 +755,7 @@ class MaintenanceReliabilityService:
         asset_id: str | None = None,
         system_id: str | None = None,
         location_id: str | None = None,
+        asset_category: str | None = None,
     ) -> list[MaintenanceWorkOrder]:
         rows = self._work_order_repo.list_for_organization(
             organization.id,
@@ -481,6 +764,16 @@ class MaintenanceReliabilityService:
             system_id=system_id,
             location_id=location_id,
         )
+        if asset_category is not None:
+            category_asset_ids = {
+                asset.id
+                for asset in self._asset_repo.list_for_organization(
+                    organization.id,
+                    active_only=None,
+                    asset_category=asset_category,
+                )
+            }
+            rows = [row for row in rows if row.asset_id in category_asset_ids]
         return list(
             filter_scope_rows(
                 rows,
@@ -499,7 +792,9 @@ class MaintenanceReliabilityService:
         asset_id: str | None = None,
         system_id: str | None = None,
         location_id: str | None = None,
+        asset_category: str | None = None,
         started_from: datetime | None = None,
+        started_to: datetime | None = None,
     ) -> list[MaintenanceDowntimeEvent]:
         filtered_work_orders = self._list_work_orders(
             organization=organization,
@@ -507,6 +802,7 @@ class MaintenanceReliabilityService:
             asset_id=asset_id,
             system_id=system_id,
             location_id=location_id,
+            asset_category=asset_category,
         )
         site_filtered_work_order_ids = {row.id for row in filtered_work_orders}
         allowed_asset_ids = {row.asset_id for row in filtered_work_orders if row.asset_id}
@@ -516,8 +812,11 @@ class MaintenanceReliabilityService:
             asset_id=asset_id,
             system_id=system_id,
             started_from=started_from,
+            started_to=started_to,
         )
-        if not site_filtered_work_order_ids and any(value is not None for value in (site_id, location_id)):
+        if not site_filtered_work_order_ids and any(
+            value is not None for value in (site_id, location_id, asset_category)
+        ):
             return []
         filtered = []
         for row in rows:
@@ -591,65 +890,80 @@ class MaintenanceReliabilityService:
             or datetime.now(timezone.utc)
         )
 
+    @classmethod
+    def _in_window(cls, work_order: MaintenanceWorkOrder, window_start: datetime, window_end: datetime | None) -> bool:
+        activity_at = cls._activity_at(work_order)
+        return activity_at >= window_start and (window_end is None or activity_at <= window_end)
+
     @staticmethod
     def _is_open_status(status: MaintenanceWorkOrderStatus) -> bool:
         return status not in _TERMINAL_WORK_ORDER_STATUSES
 
     @staticmethod
-    def _window_start(days: int) -> datetime:
+    def _window_start(days: int, *, as_of: datetime | None = None) -> datetime:
         if days <= 0:
             raise ValidationError(
                 "Analytics window must be greater than zero days.",
                 code="MAINTENANCE_ANALYTICS_WINDOW_INVALID",
             )
-        return datetime.now(timezone.utc) - timedelta(days=days)
+        return (as_of or datetime.now(timezone.utc)) - timedelta(days=days)
 
     @staticmethod
     def _mean_repair_hours(rows: list[MaintenanceWorkOrder]) -> float | None:
-        values = []
+        seconds = []
         for row in rows:
             start_at = MaintenanceReliabilityService._normalize_timestamp(row.actual_start)
             end_at = MaintenanceReliabilityService._normalize_timestamp(row.actual_end)
             if start_at is not None and end_at is not None and end_at >= start_at:
-                values.append((end_at - start_at).total_seconds() / 3600.0)
+                seconds.append((end_at - start_at).total_seconds())
             elif row.downtime_minutes:
-                values.append(float(row.downtime_minutes) / 60.0)
-        if not values:
-            return None
-        return round(sum(values) / len(values), 2)
+                seconds.append(row.downtime_minutes * 60)
+        return MaintenanceReliabilityService._mean_hours(sum(seconds), len(seconds))
 
     @staticmethod
     def _repair_hours(rows: list[MaintenanceWorkOrder]) -> float | None:
-        values = [
+        seconds = [
             (
                 MaintenanceReliabilityService._normalize_timestamp(row.actual_end)
                 - MaintenanceReliabilityService._normalize_timestamp(row.actual_start)
             ).total_seconds()
-            / 3600.0
             for row in rows
             if MaintenanceReliabilityService._normalize_timestamp(row.actual_start) is not None
             and MaintenanceReliabilityService._normalize_timestamp(row.actual_end) is not None
             and MaintenanceReliabilityService._normalize_timestamp(row.actual_end)
             >= MaintenanceReliabilityService._normalize_timestamp(row.actual_start)
         ]
-        if not values:
-            values = [float(row.downtime_minutes or 0) / 60.0 for row in rows if row.downtime_minutes]
-        if not values:
+        if not seconds:
+            seconds = [row.downtime_minutes * 60 for row in rows if row.downtime_minutes]
+        return MaintenanceReliabilityService._mean_hours(sum(seconds), len(seconds))
+
+    @staticmethod
+    def _mean_hours(total_seconds: float, count: int) -> float | None:
+        # Averaged from a seconds total so that SQL sums and in-memory sums
+        # round identically.
+        if not count:
             return None
-        return round(sum(values) / len(values), 2)
+        return round(total_seconds / 3600.0 / count, 2)
 
     @staticmethod
     def _interval_hours(points: list[datetime]) -> float | None:
         if len(points) < 2:
             return None
-        intervals = [
-            (current - previous).total_seconds() / 3600.0
-            for previous, current in zip(points, points[1:])
-            if current >= previous
-        ]
+        return MaintenanceReliabilityService._span_interval_hours(points[0], points[-1], len(points))
+
+    @staticmethod
+    def _mean_of_intervals(intervals: list[float]) -> float | None:
         if not intervals:
             return None
-        return round(sum(intervals) / len(intervals), 2)
+        return round(sum(sorted(intervals)) / len(intervals), 2)
+
+    @staticmethod
+    def _span_interval_hours(first_at: datetime, last_at: datetime, occurrence_count: int) -> float | None:
+        # The gaps between consecutive occurrences add up to the whole span,
+        # so their mean needs only the first, the last and the count.
+        if occurrence_count < 2:
+            return None
+        return round((last_at - first_at).total_seconds() / 3600.0 / (occurrence_count - 1), 2)
 
     @staticmethod
     def _normalize_timestamp(value: datetime | None) -> datetime | None:
@@ -674,9 +988,7 @@ class MaintenanceReliabilityService:
             for value in [self._interval_hours(sorted(points))]
             if value is not None
         ]
-        if not intervals:
-            return None
-        return round(sum(intervals) / len(intervals), 2)
+        return self._mean_of_intervals(intervals)
 
     def _get_site(self, site_id: str, *, organization: Organization) -> Site:
         site = self._site_repo.get(site_id)
@@ -1,15 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import replace
-from datetime import datetime, timezone
+import os
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 
 from sqlalchemy.orm import Session
 
-from src.core.modules.maintenance.domain import MaintenanceSensor, MaintenanceSensorReading
+from src.core.modules.maintenance.domain import (
+    MaintenancePlanStatus,
+    MaintenancePlanTaskTriggerScope,
+    MaintenanceSensor,
+    MaintenanceSensorDirection,
+    MaintenanceSensorQualityState,
+    MaintenanceSensorReading,
+    MaintenanceSensorRollupGrain,
+    MaintenanceTriggerMode,
+)
+from src.core.modules.maintenance.domain.reliability import (
+    rollup_sensor_readings,
+    sensor_rollup_bucket_start,
+    sensor_rollup_grain_for,
+)
+from src.core.modules.maintenance.domain.reliability.sensor_rollups import ROLLUP_QUALITY_STATES
 from src.core.modules.maintenance.contracts.repositories import (
     MaintenanceAssetComponentRepository,
+    MaintenancePreventivePlanRepository,
+    MaintenancePreventivePlanTaskRepository,
     MaintenanceSensorReadingRepository,
     MaintenanceSensorRepository,
+    MaintenanceSensorRollupRepository,
 )
 from src.core.modules.maintenance.application.common.support import (
     coerce_optional_datetime,
@@ -18,10 +39,16 @@ from src.core.modules.maintenance.application.common.support import (
 from src.core.modules.maintenance.application.common.scope_authorization import (
     deny_maintenance_scope_access,
 )
+from src.core.modules.maintenance.application.preventive.evaluators.trigger_evaluator import (
+    evaluate_plan_task_trigger,
+    evaluate_plan_trigger,
+)
+from src.core.modules.maintenance.application.preventive.models.candidates import MaintenanceTriggerEvaluation
 from src.core.platform.access.authorization import filter_scope_rows, require_scope_permission
 from src.core.shared.activity.activity_recorder import record_activity
 from src.core.platform.application.security.authorization.enforcement.permission_checks import require_permission
 from src.core.platform.common.exceptions import NotFoundError, ValidationError
+from src.core.platform.common.ids import generate_id
 from src.core.platform.contract.repositories.master_data.org.contracts import OrganizationRepository
 from src.core.platform.application.tenant.tenancy.tenant_context import (
     TenantContextService,
@@ -30,6 +57,59 @@ from src.core.platform.application.tenant.tenancy.tenant_context import (
 from src.core.shared.events.domain_events import DomainChangeEvent, domain_events
 from src.core.platform.domain.master_data.org import Organization
 
+_REVIEW_QUALITY_STATES = frozenset({"STALE", "ERROR"})
+DEFAULT_TREND_POINTS = 1000
+DEFAULT_RAW_READING_RETENTION_DAYS = 90
+
+
+@dataclass(frozen=True)
+class MaintenanceSensorTriggerCheck:
+    """Trigger state of one sensor-driven preventive plan, or of one plan
+    task's sensor override when ``plan_task_id`` is set, after a reading batch."""
+
+    plan_id: str
+    plan_code: str
+    sensor_id: str
+    evaluated_value: Decimal | None
+    evaluation: MaintenanceTriggerEvaluation
+    plan_task_id: str | None = None
+
+
+@dataclass(frozen=True)
+class MaintenanceSensorReadingBatchResult:
+    """Outcome of one ``record_readings`` batch."""
+
+    source_batch_id: str
+    readings: tuple[MaintenanceSensorReading, ...]
+    refreshed_sensor_ids: tuple[str, ...] = ()
+    trigger_checks: tuple[MaintenanceSensorTriggerCheck, ...] = ()
+
+    @property
+    def due_plan_ids(self) -> tuple[str, ...]:
+        return tuple(dict.fromkeys(check.plan_id for check in self.trigger_checks if check.evaluation.due))
+
+
+@dataclass(frozen=True)
+class MaintenanceSensorTrendPoint:
+    bucket_start: datetime
+    reading_count: int
+    min_value: Decimal
+    max_value: Decimal
+    avg_value: Decimal
+    last_value: Decimal
+
+
+@dataclass(frozen=True)
+class MaintenanceSensorTrend:
+    """A sensor's series over a window, from rollups of ``grain`` or, when
+    ``grain`` is ``None``, from raw readings (one point per reading)."""
+
+    sensor_id: str
+    window_start: datetime
+    window_end: datetime
+    grain: MaintenanceSensorRollupGrain | None
+    points: tuple[MaintenanceSensorTrendPoint, ...]
+
 
 class MaintenanceSensorReadingService:
     def __init__(
@@ -40,6 +120,10 @@ class MaintenanceSensorReadingService:
         organization_repo: OrganizationRepository,
         sensor_repo: MaintenanceSensorRepository,
         component_repo: MaintenanceAssetComponentRepository,
+        preventive_plan_repo: MaintenancePreventivePlanRepository | None = None,
+        preventive_plan_task_repo: MaintenancePreventivePlanTaskRepository | None = None,
+        sensor_rollup_repo: MaintenanceSensorRollupRepository | None = None,
+        raw_reading_retention: timedelta | None = None,
         sensor_exception_service=None,
         tenant_context_service: TenantContextService | None = None,
         user_session=None,
@@ -54,6 +138,18 @@ class MaintenanceSensorReadingService:
         )
         self._sensor_repo = sensor_repo
         self._component_repo = component_repo
+        self._preventive_plan_repo = preventive_plan_repo
+        self._preventive_plan_task_repo = preventive_plan_task_repo
+        self._sensor_rollup_repo = sensor_rollup_repo
+        self._raw_reading_retention = raw_reading_retention or timedelta(
+            days=max(
+                int(
+                    os.getenv("PM_SENSOR_RAW_RETENTION_DAYS", str(DEFAULT_RAW_READING_RETENTION_DAYS))
+                    or DEFAULT_RAW_READING_RETENTION_DAYS
+                ),
+                1,
+            )
+        )
         self._sensor_exception_service = sensor_exception_service
         self._user_session = user_session
         self._activity_service = activity_service
@@ -118,15 +214,313 @@ class MaintenanceSensorReadingService:
     ) -> MaintenanceSensorReading:
         self._require_manage("record maintenance sensor reading")
         organization = self._active_organization()
+        sensor = self._require_recordable_sensor(
+            sensor_id,
+            organization=organization,
+            operation_label="record maintenance sensor reading",
+        )
+        reading = self._build_reading(
+            sensor,
+            organization=organization,
+            reading_value=reading_value,
+            reading_unit=reading_unit,
+            reading_timestamp=reading_timestamp,
+            quality_state=quality_state,
+            source_name=source_name,
+            source_batch_id=source_batch_id,
+            received_at=received_at,
+            raw_payload_ref=raw_payload_ref,
+        )
+        refreshed_sensor = self._refreshed_snapshot(sensor, reading)
+
+        try:
+            self._sensor_reading_repo.add(reading)
+            if refreshed_sensor is not None:
+                self._sensor_repo.update(refreshed_sensor)
+            self._merge_rollups([reading])
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        self._record_change("maintenance_sensor_reading.create", reading)
+        if refreshed_sensor is not None:
+            self._emit_sensor_changed(sensor.id)
+        self._raise_quality_exception_if_needed(reading)
+        return reading
+
+    def record_readings(
+        self,
+        readings: Iterable[Mapping[str, object]],
+        *,
+        source_name: str = "",
+        source_batch_id: str = "",
+    ) -> MaintenanceSensorReadingBatchResult:
+        """
+        Record a batch of readings across any number of sensors in one commit.
+
+        Each mapping takes the keyword arguments of ``record_reading``;
+        ``source_name`` and ``source_batch_id`` fill in readings that leave
+        them blank, and the batch ID is generated when none is given. Sensor
+        ownership, state and scope are checked once per distinct sensor, and
+        an invalid reading rejects the whole batch. The readings are inserted
+        with one bulk statement, each sensor's snapshot is refreshed once from
+        its newest reading, and one activity entry and one change event per
+        entity type summarise the batch. Stale or errored readings raise one
+        sensor exception per sensor, for its newest such reading.
+
+        With a preventive plan repository, every active sensor-driven plan
+        linked to a sensor in the batch is evaluated once against the batch's
+        decisive value (see ``_decisive_reading``), so a threshold crossed
+        mid-batch is reported even when a later reading fell back below it.
+        """
+        self._require_manage("record maintenance sensor readings")
+        organization = self._active_organization()
+        batch_id = normalize_optional_text(source_batch_id) or generate_id()
+        default_source_name = normalize_optional_text(source_name)
+        sensors: dict[str, MaintenanceSensor] = {}
+        created: list[MaintenanceSensorReading] = []
+        for payload in readings:
+            sensor_id = normalize_optional_text(payload.get("sensor_id"))
+            sensor = sensors.get(sensor_id)
+            if sensor is None:
+                sensor = self._require_recordable_sensor(
+                    sensor_id,
+                    organization=organization,
+                    operation_label="record maintenance sensor readings",
+                )
+                sensors[sensor_id] = sensor
+            created.append(
+                self._build_reading(
+                    sensor,
+                    organization=organization,
+                    reading_value=payload.get("reading_value"),
+                    reading_unit=payload.get("reading_unit") or "",
+                    reading_timestamp=payload.get("reading_timestamp"),
+                    quality_state=payload.get("quality_state"),
+                    source_name=payload.get("source_name") or default_source_name,
+                    source_batch_id=payload.get("source_batch_id") or batch_id,
+                    received_at=payload.get("received_at"),
+                    raw_payload_ref=payload.get("raw_payload_ref") or "",
+                )
+            )
+        if not created:
+            return MaintenanceSensorReadingBatchResult(source_batch_id=batch_id, readings=())
+
+        readings_by_sensor: dict[str, list[MaintenanceSensorReading]] = {}
+        for reading in created:
+            readings_by_sensor.setdefault(reading.sensor_id, []).append(reading)
+        refreshed: dict[str, MaintenanceSensor] = {}
+        for sensor_id, sensor_readings in readings_by_sensor.items():
+            newest = sensor_readings[0]
+            for reading in sensor_readings[1:]:
+                if reading.reading_timestamp >= newest.reading_timestamp:
+                    newest = reading
+            refreshed_sensor = self._refreshed_snapshot(sensors[sensor_id], newest)
+            if refreshed_sensor is not None:
+                refreshed[sensor_id] = refreshed_sensor
+
+        try:
+            self._sensor_reading_repo.add_many(created)
+            for refreshed_sensor in refreshed.values():
+                self._sensor_repo.update(refreshed_sensor)
+            self._merge_rollups(created)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        sensors.update(refreshed)
+        self._record_batch_change(batch_id, organization=organization, readings=created)
+        if refreshed:
+            self._emit_sensor_changed(next(iter(refreshed)) if len(refreshed) == 1 else batch_id)
+        for sensor_readings in readings_by_sensor.values():
+            flagged = [
+                reading
+                for reading in sensor_readings
+                if reading.quality_state.value in _REVIEW_QUALITY_STATES
+            ]
+            if flagged:
+                self._raise_quality_exception_if_needed(
+                    max(flagged, key=lambda reading: reading.reading_timestamp)
+                )
+        return MaintenanceSensorReadingBatchResult(
+            source_batch_id=batch_id,
+            readings=tuple(created),
+            refreshed_sensor_ids=tuple(refreshed),
+            trigger_checks=self._evaluate_batch_triggers(
+                organization,
+                readings_by_sensor=readings_by_sensor,
+                sensors=sensors,
+            ),
+        )
+
+    def read_trend(
+        self,
+        sensor_id: str,
+        *,
+        window_start,
+        window_end,
+        resolution: timedelta | None = None,
+        max_points: int = DEFAULT_TREND_POINTS,
+    ) -> MaintenanceSensorTrend:
+        """
+        A sensor's series over ``[window_start, window_end]`` from the
+        finest rollup grain at least ``resolution`` wide (by default the
+        window split into ``max_points``), so the series never has more
+        points than asked for while a grain can hold it. A year charted at
+        the default resolution reads 365 day buckets rather than millions
+        of raw readings. Below a minute it reads the raw readings.
+        """
+        self._require_read("view maintenance sensor trend")
+        organization = self._active_organization()
+        sensor = self._get_sensor(sensor_id, organization=organization)
+        self._require_scope_read(self._scope_anchor_for(sensor), operation_label="view maintenance sensor trend")
+        start = coerce_optional_datetime(window_start, label="Trend window start")
+        end = coerce_optional_datetime(window_end, label="Trend window end")
+        if start is None or end is None or end <= start:
+            raise ValidationError(
+                "Trend window end must be after its start.",
+                code="MAINTENANCE_SENSOR_TREND_WINDOW_INVALID",
+            )
+        if resolution is None:
+            resolution = (end - start) / max(int(max_points), 1)
+        grain = sensor_rollup_grain_for(resolution) if self._sensor_rollup_repo is not None else None
+        if grain is None:
+            points = tuple(
+                MaintenanceSensorTrendPoint(
+                    bucket_start=reading.reading_timestamp,
+                    reading_count=1,
+                    min_value=reading.reading_value,
+                    max_value=reading.reading_value,
+                    avg_value=reading.reading_value,
+                    last_value=reading.reading_value,
+                )
+                for reading in reversed(
+                    self._sensor_reading_repo.list_for_organization(
+                        organization.id,
+                        sensor_id=sensor.id,
+                        reading_from=start,
+                        reading_to=end,
+                    )
+                )
+                if reading.quality_state in ROLLUP_QUALITY_STATES
+            )
+        else:
+            points = tuple(
+                MaintenanceSensorTrendPoint(
+                    bucket_start=rollup.bucket_start,
+                    reading_count=rollup.reading_count,
+                    min_value=rollup.min_value,
+                    max_value=rollup.max_value,
+                    avg_value=rollup.avg_value,
+                    last_value=rollup.last_value,
+                )
+                for rollup in self._sensor_rollup_repo.list_for_sensor(
+                    organization.id,
+                    sensor.id,
+                    grain=grain,
+                    bucket_from=sensor_rollup_bucket_start(start, grain),
+                    bucket_to=end,
+                )
+            )
+        return MaintenanceSensorTrend(
+            sensor_id=sensor.id,
+            window_start=start,
+            window_end=end,
+            grain=grain,
+            points=points,
+        )
+
+    def prune_raw_readings(
+        self,
+        *,
+        older_than: timedelta | None = None,
+        sensor_id: str | None = None,
+        as_of=None,
+    ) -> int:
+        """
+        Delete raw readings older than the retention horizon (``older_than``,
+        else ``PM_SENSOR_RAW_RETENTION_DAYS``, default 90 days) for one
+        sensor or the whole organization, returning how many went. Trend
+        rollups are kept, so long windows still chart after pruning.
+        """
+        self._require_manage("prune maintenance sensor readings")
+        organization = self._active_organization()
+        if sensor_id is not None:
+            sensor = self._get_sensor(sensor_id, organization=organization)
+            self._require_scope_manage(
+                self._scope_anchor_for(sensor),
+                operation_label="prune maintenance sensor readings",
+            )
+        else:
+            self._require_scope_manage("", operation_label="prune maintenance sensor readings")
+        reference = coerce_optional_datetime(as_of, label="Prune as of") or datetime.now(timezone.utc)
+        cutoff = reference - (older_than or self._raw_reading_retention)
+        try:
+            deleted = self._sensor_reading_repo.delete_before(organization.id, cutoff, sensor_id=sensor_id)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            raise
+        entity_id = sensor_id or organization.id
+        record_activity(
+            self,
+            action="maintenance_sensor_reading.prune",
+            entity_type="maintenance_sensor_reading",
+            entity_id=entity_id,
+            module="maintenance",
+            details={
+                "organization_id": organization.id,
+                "sensor_id": sensor_id or "",
+                "cutoff": cutoff.isoformat(),
+                "deleted_count": deleted,
+            },
+        )
+        if deleted:
+            domain_events.domain_changed.emit(
+                DomainChangeEvent(
+                    category="module",
+                    scope_code="maintenance_management",
+                    entity_type="maintenance_sensor_reading",
+                    entity_id=entity_id,
+                    source_event="maintenance_sensor_readings_changed",
+                )
+            )
+        return deleted
+
+    def _merge_rollups(self, readings: list[MaintenanceSensorReading]) -> None:
+        if self._sensor_rollup_repo is not None:
+            self._sensor_rollup_repo.merge_many(rollup_sensor_readings(readings))
+
+    def _require_recordable_sensor(
+        self,
+        sensor_id: str,
+        *,
+        organization: Organization,
+        operation_label: str,
+    ) -> MaintenanceSensor:
         sensor = self._get_sensor(sensor_id, organization=organization)
         if not sensor.is_active:
             raise ValidationError(
                 "Cannot record a reading against an inactive maintenance sensor.",
                 code="MAINTENANCE_SENSOR_INACTIVE",
             )
-        scope_id = self._scope_anchor_for(sensor)
-        self._require_scope_manage(scope_id, operation_label="record maintenance sensor reading")
+        self._require_scope_manage(self._scope_anchor_for(sensor), operation_label=operation_label)
+        return sensor
 
+    def _build_reading(
+        self,
+        sensor: MaintenanceSensor,
+        *,
+        organization: Organization,
+        reading_value,
+        reading_unit: str,
+        reading_timestamp,
+        quality_state,
+        source_name: str,
+        source_batch_id: str,
+        received_at,
+        raw_payload_ref: str,
+    ) -> MaintenanceSensorReading:
         candidate_unit = normalize_optional_text(reading_unit) or sensor.unit
         normalized_source_batch_id = normalize_optional_text(source_batch_id)
         normalized_raw_payload_ref = normalize_optional_text(raw_payload_ref)
@@ -168,49 +562,113 @@ class MaintenanceSensorReadingService:
                 "Reading unit must match the configured maintenance sensor unit.",
                 code="MAINTENANCE_SENSOR_READING_UNIT_MISMATCH",
             )
-        should_refresh_snapshot = (
-            sensor.last_read_at is None or reading.reading_timestamp >= sensor.last_read_at
+        return reading
+
+    @staticmethod
+    def _refreshed_snapshot(
+        sensor: MaintenanceSensor,
+        reading: MaintenanceSensorReading,
+    ) -> MaintenanceSensor | None:
+        if sensor.last_read_at is not None and reading.reading_timestamp < sensor.last_read_at:
+            return None
+        return replace(
+            sensor,
+            current_value=reading.reading_value,
+            unit=reading.reading_unit,
+            last_read_at=reading.reading_timestamp,
+            last_quality_state=reading.quality_state,
+            updated_at=datetime.now(timezone.utc),
         )
-        refreshed_sensor = sensor
-        if should_refresh_snapshot:
-            refreshed_sensor = replace(
-                sensor,
-                current_value=reading.reading_value,
-                unit=reading.reading_unit,
-                last_read_at=reading.reading_timestamp,
-                last_quality_state=reading.quality_state,
-                updated_at=datetime.now(timezone.utc),
-            )
 
-        try:
-            self._sensor_reading_repo.add(reading)
-            if should_refresh_snapshot:
-                self._sensor_repo.update(refreshed_sensor)
-            self._session.commit()
-        except Exception:
-            self._session.rollback()
-            raise
-        self._record_change("maintenance_sensor_reading.create", reading)
-        if should_refresh_snapshot:
-            domain_events.domain_changed.emit(
-                DomainChangeEvent(
-                    category="module",
-                    scope_code="maintenance_management",
-                    entity_type="maintenance_sensor",
-                    entity_id=sensor.id,
-                    source_event="maintenance_sensors_changed",
+    def _evaluate_batch_triggers(
+        self,
+        organization: Organization,
+        *,
+        readings_by_sensor: Mapping[str, list[MaintenanceSensorReading]],
+        sensors: Mapping[str, MaintenanceSensor],
+    ) -> tuple[MaintenanceSensorTriggerCheck, ...]:
+        if self._preventive_plan_repo is None or not readings_by_sensor:
+            return ()
+        as_of = datetime.now(timezone.utc)
+        sensor_ids = tuple(readings_by_sensor)
+        plans = {
+            plan.id: plan
+            for plan in self._preventive_plan_repo.list_for_organization(
+                organization.id,
+                active_only=True,
+                status=MaintenancePlanStatus.ACTIVE.value,
+                sensor_ids=sensor_ids,
+            )
+        }
+        checks: list[MaintenanceSensorTriggerCheck] = []
+        for plan in plans.values():
+            if plan.trigger_mode == MaintenanceTriggerMode.CALENDAR:
+                continue
+            sensor = _sensor_at(
+                sensors[plan.sensor_id],
+                _decisive_reading(
+                    readings_by_sensor[plan.sensor_id],
+                    direction=plan.sensor_direction,
+                    threshold=plan.sensor_threshold,
+                    last_generated_at=plan.last_generated_at,
+                ),
+            )
+            checks.append(
+                MaintenanceSensorTriggerCheck(
+                    plan_id=plan.id,
+                    plan_code=plan.plan_code,
+                    sensor_id=plan.sensor_id,
+                    evaluated_value=sensor.current_value,
+                    evaluation=evaluate_plan_trigger(plan, sensor=sensor, as_of=as_of),
                 )
             )
-        if reading.quality_state.value in {"STALE", "ERROR"}:
-            self._raise_exception_if_possible(
-                sensor_id=sensor.id,
-                exception_type="STALE_READING" if reading.quality_state.value == "STALE" else "EXTERNAL_SYNC_FAILURE",
-                message="Sensor reading quality requires planner review.",
-                detected_at=reading.reading_timestamp,
-                source_batch_id=reading.source_batch_id,
-                raw_payload_ref=reading.raw_payload_ref,
+        if self._preventive_plan_task_repo is None:
+            return tuple(checks)
+        for plan_task in self._preventive_plan_task_repo.list_for_organization(
+            organization.id,
+            sensor_ids=sensor_ids,
+        ):
+            if plan_task.trigger_scope == MaintenancePlanTaskTriggerScope.INHERIT_PLAN:
+                continue
+            if plan_task.trigger_mode_override == MaintenanceTriggerMode.CALENDAR:
+                continue
+            if plan_task.plan_id not in plans:
+                plans[plan_task.plan_id] = self._preventive_plan_repo.get(plan_task.plan_id)
+            plan = plans[plan_task.plan_id]
+            if plan is None or not plan.is_active or plan.status != MaintenancePlanStatus.ACTIVE:
+                continue
+            sensor = _sensor_at(
+                sensors[plan_task.sensor_id_override],
+                _decisive_reading(
+                    readings_by_sensor[plan_task.sensor_id_override],
+                    direction=plan_task.sensor_direction_override,
+                    threshold=plan_task.sensor_threshold_override,
+                    last_generated_at=plan_task.last_generated_at,
+                ),
             )
-        return reading
+            checks.append(
+                MaintenanceSensorTriggerCheck(
+                    plan_id=plan.id,
+                    plan_code=plan.plan_code,
+                    sensor_id=plan_task.sensor_id_override,
+                    evaluated_value=sensor.current_value,
+                    evaluation=evaluate_plan_task_trigger(plan_task, sensor=sensor, as_of=as_of),
+                    plan_task_id=plan_task.id,
+                )
+            )
+        return tuple(checks)
+
+    def _raise_quality_exception_if_needed(self, reading: MaintenanceSensorReading) -> None:
+        if reading.quality_state.value not in _REVIEW_QUALITY_STATES:
+            return
+        self._raise_exception_if_possible(
+            sensor_id=reading.sensor_id,
+            exception_type="STALE_READING" if reading.quality_state.value == "STALE" else "EXTERNAL_SYNC_FAILURE",
+            message="Sensor reading quality requires planner review.",
+            detected_at=reading.reading_timestamp,
+            source_batch_id=reading.source_batch_id,
+            raw_payload_ref=reading.raw_payload_ref,
+        )
 
     def _raise_exception_if_possible(
         self,
@@ -319,6 +777,50 @@ class MaintenanceSensorReadingService:
             )
         )
 
+    def _record_batch_change(
+        self,
+        batch_id: str,
+        *,
+        organization: Organization,
+        readings: list[MaintenanceSensorReading],
+    ) -> None:
+        timestamps = [reading.reading_timestamp for reading in readings]
+        record_activity(
+            self,
+            action="maintenance_sensor_reading.batch_create",
+            entity_type="maintenance_sensor_reading",
+            entity_id=batch_id,
+            module="maintenance",
+            details={
+                "organization_id": organization.id,
+                "source_batch_id": batch_id,
+                "reading_count": len(readings),
+                "sensor_count": len({reading.sensor_id for reading in readings}),
+                "reading_from": min(timestamps).isoformat(),
+                "reading_to": max(timestamps).isoformat(),
+            },
+        )
+        domain_events.domain_changed.emit(
+            DomainChangeEvent(
+                category="module",
+                scope_code="maintenance_management",
+                entity_type="maintenance_sensor_reading",
+                entity_id=batch_id,
+                source_event="maintenance_sensor_readings_changed",
+            )
+        )
+
+    def _emit_sensor_changed(self, entity_id: str) -> None:
+        domain_events.domain_changed.emit(
+            DomainChangeEvent(
+                category="module",
+                scope_code="maintenance_management",
+                entity_type="maintenance_sensor",
+                entity_id=entity_id,
+                source_event="maintenance_sensors_changed",
+            )
+        )
+
     def _get_sensor(self, sensor_id: str, *, organization: Organization) -> MaintenanceSensor:
         sensor = self._sensor_repo.get(sensor_id)
         if sensor is None or sensor.organization_id != organization.id:
@@ -337,4 +839,54 @@ class MaintenanceSensorReadingService:
         require_permission(self._user_session, "maintenance.manage", operation_label=operation_label)
 
 
-__all__ = ["MaintenanceSensorReadingService"]
+def _decisive_reading(
+    readings: list[MaintenanceSensorReading],
+    *,
+    direction: MaintenanceSensorDirection | None,
+    threshold: Decimal | None,
+    last_generated_at: datetime | None,
+) -> MaintenanceSensorReading | None:
+    """
+    The batch reading a plan's (or a plan task override's) trigger should
+    see: the highest valid value for a rising threshold, the lowest for a
+    falling one, and for an exact threshold a matching reading if there is
+    one, else the newest. Falling and exact thresholds only count readings
+    newer than the last generation, as the evaluator does. ``None`` when no
+    reading qualifies.
+    """
+    valid = [reading for reading in readings if reading.quality_state == MaintenanceSensorQualityState.VALID]
+    if direction != MaintenanceSensorDirection.GREATER_OR_EQUAL and last_generated_at is not None:
+        valid = [reading for reading in valid if reading.reading_timestamp > last_generated_at]
+    if not valid or direction is None:
+        return None
+    if direction == MaintenanceSensorDirection.GREATER_OR_EQUAL:
+        return max(valid, key=lambda reading: reading.reading_value)
+    if direction == MaintenanceSensorDirection.LESS_OR_EQUAL:
+        return min(valid, key=lambda reading: reading.reading_value)
+    for reading in valid:
+        if reading.reading_value == threshold:
+            return reading
+    return max(valid, key=lambda reading: reading.reading_timestamp)
+
+
+def _sensor_at(sensor: MaintenanceSensor, reading: MaintenanceSensorReading | None) -> MaintenanceSensor:
+    """``sensor`` as a trigger sees it once ``reading`` is its latest value."""
+    if reading is None:
+        return sensor
+    return replace(
+        sensor,
+        current_value=reading.reading_value,
+        last_read_at=reading.reading_timestamp,
+        last_quality_state=reading.quality_state,
+    )
+
+
+__all__ = [
+    "DEFAULT_RAW_READING_RETENTION_DAYS",
+    "DEFAULT_TREND_POINTS",
+    "MaintenanceSensorReadingBatchResult",
+    "MaintenanceSensorReadingService",
+    "MaintenanceSensorTrend",
+    "MaintenanceSensorTrendPoint",
+    "MaintenanceSensorTriggerCheck",
+]
@@ -0,0 +1,61 @@
+"""Scheduled pruning of raw sensor readings."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Mapping
+from datetime import timedelta
+
+from sqlalchemy.orm import Session
+
+from src.core.platform.common.exceptions import BusinessRuleError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SENSOR_RETENTION_INTERVAL = timedelta(hours=24)
+
+
+class MaintenanceSensorRetentionJob:
+    """
+    Deletes raw sensor readings past the retention horizon, keeping the
+    trend rollups (see ``MaintenanceSensorReadingService.prune_raw_readings``).
+
+    Each run opens its own session from ``session_factory`` and builds a
+    service graph on it with ``build_services``, so it never shares a
+    session with the UI. ``build_services`` returns ``None`` when there is
+    no signed-in user to run as; a user who may not manage maintenance is
+    skipped the same way, and the next run tries again.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], Session],
+        build_services: Callable[[Session], Mapping[str, object] | None],
+        older_than: timedelta | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._build_services = build_services
+        self._older_than = older_than
+
+    def run(self) -> int:
+        session = self._session_factory()
+        try:
+            services = self._build_services(session)
+            if services is None:
+                return 0
+            try:
+                deleted = services["maintenance_sensor_reading_service"].prune_raw_readings(
+                    older_than=self._older_than,
+                )
+            except BusinessRuleError as exc:
+                logger.debug("Sensor reading retention skipped: %s", exc)
+                return 0
+        finally:
+            session.close()
+        if deleted:
+            logger.info("Sensor reading retention pruned raw_readings=%s", deleted)
+        return deleted
+
+
+__all__ = ["DEFAULT_SENSOR_RETENTION_INTERVAL", "MaintenanceSensorRetentionJob"]
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from src.core.modules.maintenance.domain import (
+    MaintenanceWorkOrder,
+    MaintenanceWorkOrderMaterialRequirement,
+)
+from src.core.modules.maintenance.contracts.repositories import MaintenancePlannerLaneFilter
+from src.core.modules.maintenance.application.common.planner_lanes import (
+    MAINTENANCE_PLANNER_LANE_PAGE_SIZE,
+    MaintenancePlannerLane,
+    decode_lane_token,
+    lane_from_loaded_rows,
+    lane_from_page,
+    lane_total,
+    normalize_lane_page_size,
+    normalize_lane_statuses,
+    planner_scope_anchor_ids,
+    rows_matching_search,
+)
+
+
+def _work_order_search_fields(row: MaintenanceWorkOrder) -> tuple[str | None, ...]:
+    return (row.work_order_code, row.title, row.description, row.failure_code, row.root_cause_code)
+
+
+class MaintenanceWorkOrderPlannerLaneMixin:
+    """The planner's work order lane, one page at a time, filtered, sorted
+    and counted in SQL when the service has a planner repository."""
+
+    def list_work_order_lane(
+        self,
+        *,
+        site_id: str | None = None,
+        asset_id: str | None = None,
+        system_id: str | None = None,
+        statuses: Collection[str] | None = None,
+        search_text: str = "",
+        page_size: int = MAINTENANCE_PLANNER_LANE_PAGE_SIZE,
+        page_token: str = "",
+    ) -> MaintenancePlannerLane[MaintenanceWorkOrder]:
+        page_size = normalize_lane_page_size(page_size)
+        after = decode_lane_token(page_token)
+        lane_statuses = normalize_lane_statuses(statuses)
+        if self._planner_repo is None:
+            return lane_from_loaded_rows(
+                self.list_work_orders(site_id=site_id, asset_id=asset_id, system_id=system_id),
+                statuses=lane_statuses,
+                search_text=search_text,
+                search_fields=_work_order_search_fields,
+                page_size=page_size,
+                after=after,
+            )
+        self._require_read("list maintenance work orders")
+        organization = self._active_organization()
+        if site_id is not None:
+            self._get_site(site_id, organization=organization)
+        if asset_id is not None:
+            self._get_asset(asset_id, organization=organization)
+        if system_id is not None:
+            self._get_system(system_id, organization=organization)
+        filters = MaintenancePlannerLaneFilter(
+            organization_id=organization.id,
+            site_id=site_id,
+            asset_id=asset_id,
+            system_id=system_id,
+            statuses=lane_statuses,
+            search_text=str(search_text or "").strip(),
+            scope_anchor_ids=planner_scope_anchor_ids(self._user_session),
+        )
+        status_counts = self._planner_repo.count_work_orders_by_status(filters)
+        return lane_from_page(
+            self._planner_repo.list_work_orders(filters, limit=page_size + 1, after=after),
+            page_size=page_size,
+            total=lane_total(status_counts, lane_statuses),
+            status_counts=status_counts,
+        )
+
+
+class MaintenanceMaterialRiskLaneMixin:
+    """The planner's material lane: requirements not yet ready on the work
+    orders the work order lane selects, oldest first."""
+
+    def list_material_risk_lane(
+        self,
+        *,
+        procurement_statuses: Collection[str],
+        site_id: str | None = None,
+        asset_id: str | None = None,
+        system_id: str | None = None,
+        work_order_statuses: Collection[str] | None = None,
+        search_text: str = "",
+        page_size: int = MAINTENANCE_PLANNER_LANE_PAGE_SIZE,
+        page_token: str = "",
+    ) -> MaintenancePlannerLane[MaintenanceWorkOrderMaterialRequirement]:
+        self._require_read("list maintenance material requirements")
+        organization = self._active_organization()
+        page_size = normalize_lane_page_size(page_size)
+        after = decode_lane_token(page_token)
+        risk_statuses = normalize_lane_statuses(procurement_statuses)
+        filters = MaintenancePlannerLaneFilter(
+            organization_id=organization.id,
+            site_id=site_id,
+            asset_id=asset_id,
+            system_id=system_id,
+            statuses=normalize_lane_statuses(work_order_statuses),
+            search_text=str(search_text or "").strip(),
+            scope_anchor_ids=planner_scope_anchor_ids(self._user_session),
+        )
+        if self._planner_repo is None:
+            work_order_ids = {
+                row.id
+                for row in rows_matching_search(
+                    self._work_order_repo.list_for_organization(
+                        organization.id,
+                        site_id=site_id,
+                        asset_id=asset_id,
+                        system_id=system_id,
+                    ),
+                    filters.search_text,
+                    _work_order_search_fields,
+                )
+                if filters.statuses is None or row.status.value in filters.statuses
+            }
+            return lane_from_loaded_rows(
+                (row for row in self.list_requirements() if row.work_order_id in work_order_ids),
+                statuses=risk_statuses,
+                search_text="",
+                search_fields=lambda row: (),
+                page_size=page_size,
+                after=after,
+                newest_first=False,
+                status_of=lambda row: row.procurement_status.value,
+            )
+        status_counts = self._planner_repo.count_material_risks_by_status(
+            filters,
+            procurement_statuses=risk_statuses,
+        )
+        return lane_from_page(
+            self._planner_repo.list_material_risks(
+                filters,
+                procurement_statuses=risk_statuses,
+                limit=page_size + 1,
+                after=after,
+            ),
+            page_size=page_size,
+            total=sum(status_counts.values()),
+            status_counts=status_counts,
+        )
+
+
+__all__ = ["MaintenanceMaterialRiskLaneMixin", "MaintenanceWorkOrderPlannerLaneMixin"]
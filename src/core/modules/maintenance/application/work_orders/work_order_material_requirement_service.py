@@ -22,9 +22,13 @@ from src.core.modules.maintenance.domain import (
     MaintenanceWorkOrderStatus,
 )
 from src.core.modules.maintenance.contracts.repositories import (
+    MaintenancePlannerRepository,
     MaintenanceWorkOrderMaterialRequirementRepository,
     MaintenanceWorkOrderRepository,
 )
+from src.core.modules.maintenance.application.work_orders.planner_lanes import (
+    MaintenanceMaterialRiskLaneMixin,
+)
 from src.core.modules.maintenance.application.common.scope_authorization import (
     deny_maintenance_scope_access,
 )
@@ -44,7 +48,7 @@ from src.core.platform.domain.master_data.org import Organization
 _MATERIAL_SOURCE_TYPE = "maintenance_material_demand"
 
 
-class MaintenanceWorkOrderMaterialRequirementService:
+class MaintenanceWorkOrderMaterialRequirementService(MaintenanceMaterialRiskLaneMixin):
     def __init__(
         self,
         session: Session,
@@ -55,6 +59,7 @@ class MaintenanceWorkOrderMaterialRequirementService:
         item_service: ItemMasterService | None = None,
         inventory_service: InventoryService | None = None,
         maintenance_material_service: MaintenanceMaterialService | None = None,
+        planner_repo: MaintenancePlannerRepository | None = None,
         tenant_context_service: TenantContextService | None = None,
         user_session=None,
         activity_service=None,
@@ -70,6 +75,7 @@ class MaintenanceWorkOrderMaterialRequirementService:
         self._item_service = item_service
         self._inventory_service = inventory_service
         self._maintenance_material_service = maintenance_material_service
+        self._planner_repo = planner_repo
         self._user_session = user_session
         self._activity_service = activity_service
 
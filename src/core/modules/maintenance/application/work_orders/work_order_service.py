@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from calendar import monthrange
+from collections.abc import Iterable, Sequence
 from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 
@@ -27,7 +28,9 @@ from src.core.modules.maintenance.contracts.repositories import (
     MaintenanceAssetComponentRepository,
     MaintenanceAssetRepository,
     MaintenanceFailureCodeRepository,
+    MaintenanceFailureRollupRepository,
     MaintenanceLocationRepository,
+    MaintenancePlannerRepository,
     MaintenancePreventivePlanInstanceRepository,
     MaintenancePreventivePlanRepository,
     MaintenancePreventivePlanTaskRepository,
@@ -37,9 +40,18 @@ from src.core.modules.maintenance.contracts.repositories import (
     MaintenanceWorkOrderRepository,
     MaintenanceWorkRequestRepository,
 )
+from src.core.modules.maintenance.domain.reliability.failure_rollups import (
+    FAILURE_COMPLETED_STATUSES,
+    MaintenanceFailureOccurrence,
+    failure_occurrence_for,
+)
+from src.core.modules.maintenance.application.common.failure_rollups import sync_failure_rollup
 from src.core.modules.maintenance.application.preventive.services.work_package import (
     MaintenancePreventiveWorkPackageBuilder,
 )
+from src.core.modules.maintenance.application.work_orders.planner_lanes import (
+    MaintenanceWorkOrderPlannerLaneMixin,
+)
 from src.core.modules.maintenance.application.work_orders.work_order_task_service import (
     MaintenanceWorkOrderTaskService,
 )
@@ -72,7 +84,7 @@ from src.core.platform.domain.master_data.org import Organization
 from src.core.platform.domain.master_data.site import Site
 
 
-class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
+class MaintenanceWorkOrderService(MaintenanceWorkOrderPlannerLaneMixin, MaintenanceWorkOrderValidationMixin):
     def __init__(
         self,
         session: Session,
@@ -94,6 +106,8 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         task_step_template_repo: MaintenanceTaskStepTemplateRepository | None = None,
         work_order_task_service: MaintenanceWorkOrderTaskService | None = None,
         work_order_task_step_service: MaintenanceWorkOrderTaskStepService | None = None,
+        failure_rollup_repo: MaintenanceFailureRollupRepository | None = None,
+        planner_repo: MaintenancePlannerRepository | None = None,
         tenant_context_service: TenantContextService | None = None,
         user_session=None,
         activity_service=None,
@@ -120,6 +134,8 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         self._task_step_template_repo: MaintenanceTaskStepTemplateRepository | None = task_step_template_repo
         self._work_order_task_service: MaintenanceWorkOrderTaskService | None = work_order_task_service
         self._work_order_task_step_service: MaintenanceWorkOrderTaskStepService | None = work_order_task_step_service
+        self._failure_rollup_repo: MaintenanceFailureRollupRepository | None = failure_rollup_repo
+        self._planner_repo: MaintenancePlannerRepository | None = planner_repo
         self._work_package_builder: MaintenancePreventiveWorkPackageBuilder | None = None
         if (
             preventive_plan_task_repo is not None
@@ -142,6 +158,7 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         *,
         site_id: str | None = None,
         asset_id: str | None = None,
+        under_asset_id: str | None = None,
         component_id: str | None = None,
         system_id: str | None = None,
         location_id: str | None = None,
@@ -155,12 +172,16 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         is_preventive: bool | None = None,
         is_emergency: bool | None = None,
     ) -> list[MaintenanceWorkOrder]:
+        """``under_asset_id`` keeps work orders on that asset or any asset
+        below it in the hierarchy."""
         self._require_read("list maintenance work orders")
         organization = self._active_organization()
         if site_id is not None:
             self._get_site(site_id, organization=organization)
         if asset_id is not None:
             self._get_asset(asset_id, organization=organization)
+        if under_asset_id is not None:
+            self._get_asset(under_asset_id, organization=organization)
         if component_id is not None:
             self._get_component(component_id, organization=organization)
         if system_id is not None:
@@ -171,6 +192,7 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
             organization.id,
             site_id=site_id,
             asset_id=asset_id,
+            under_asset_id=under_asset_id,
             component_id=component_id,
             system_id=system_id,
             location_id=location_id,
@@ -197,6 +219,7 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         *,
         search_text: str = "",
         site_id: str | None = None,
+        under_asset_id: str | None = None,
         status: str | None = None,
         priority: str | None = None,
         work_order_type: str | None = None,
@@ -206,6 +229,7 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         normalized_search = normalize_optional_text(search_text).lower()
         rows = self.list_work_orders(
             site_id=site_id,
+            under_asset_id=under_asset_id,
             status=status,
             priority=priority,
             work_order_type=work_order_type,
@@ -243,6 +267,20 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         self._require_scope_read(self._scope_anchor_for(work_order), operation_label="view maintenance work order")
         return work_order
 
+    def get_work_orders(self, work_order_ids: Iterable[str]) -> list[MaintenanceWorkOrder]:
+        """The work orders among ``work_order_ids`` that the user may read, in
+        one query; ids that are missing or out of scope are left out."""
+        self._require_read("view maintenance work orders")
+        organization = self._active_organization()
+        rows = self._work_order_repo.list_by_ids(organization.id, {str(value) for value in work_order_ids})
+        return filter_scope_rows(
+            rows,
+            self._user_session,
+            scope_type="maintenance",
+            permission_code="maintenance.read",
+            scope_id_getter=self._scope_anchor_for,
+        )
+
     def find_work_order_by_code(
         self,
         work_order_code: str,
@@ -307,8 +345,7 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
             is_emergency=is_emergency,
             notes=notes,
         )
-        if self._work_order_repo.get_by_code(organization.id, draft.work_order_code) is not None:
-            raise ValidationError("Work order code already exists in the active organization.", code="MAINTENANCE_WORK_ORDER_CODE_EXISTS")
+        self._require_unused_code(organization, draft.work_order_code)
 
         source_request = None
         next_source_id = draft.source_id
@@ -346,22 +383,13 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
             if source_request_type == "PREVENTIVE_PLAN":
                 next_is_preventive = True
 
-        resolved_asset_id, resolved_component_id, resolved_system_id, resolved_location_id = self._resolve_context_references(
-            organization=organization,
-            site=site,
+        work_order = replace(
+            draft,
+            source_id=next_source_id,
             asset_id=next_asset_id,
             component_id=next_component_id,
             system_id=next_system_id,
             location_id=next_location_id,
-        )
-
-        work_order = replace(
-            draft,
-            source_id=next_source_id,
-            asset_id=resolved_asset_id,
-            component_id=resolved_component_id,
-            system_id=resolved_system_id,
-            location_id=resolved_location_id,
             title=next_title,
             description=next_description,
             priority=next_priority,
@@ -374,6 +402,7 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
             is_emergency=is_emergency,
             notes=notes,
         )
+        work_order = self._with_resolved_references(work_order, organization=organization, site=site)
         try:
             self._work_order_repo.add(work_order)
             converted_request = self._sync_source_request_conversion(
@@ -395,6 +424,50 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         self._record_change("maintenance_work_order.create", work_order)
         return work_order
 
+    def prepare_new_work_orders(
+        self,
+        drafts: Sequence[MaintenanceWorkOrder],
+    ) -> list[MaintenanceWorkOrder]:
+        """
+        Validate work orders a caller is about to insert in bulk, the way
+        ``create_work_order`` validates a single one, without saving them.
+
+        Codes must be unused in the active organization and across
+        ``drafts``; the asset, component, system and location must belong to
+        the work order's site. The returned work orders carry the component's
+        asset when only a component was given.
+        """
+        self._require_manage("create maintenance work order")
+        organization = self._active_organization()
+        taken_codes = {
+            row.work_order_code
+            for row in self._work_order_repo.list_by_codes(
+                organization.id, [row.work_order_code for row in drafts]
+            )
+        }
+        sites: dict[str, Site] = {}
+        prepared: list[MaintenanceWorkOrder] = []
+        for draft in drafts:
+            if draft.work_order_code in taken_codes:
+                raise ValidationError("Work order code already exists in the active organization.", code="MAINTENANCE_WORK_ORDER_CODE_EXISTS")
+            taken_codes.add(draft.work_order_code)
+            site = sites.get(draft.site_id)
+            if site is None:
+                site = sites[draft.site_id] = self._get_site(draft.site_id, organization=organization)
+            prepared.append(self._with_resolved_references(draft, organization=organization, site=site))
+        return prepared
+
+    def record_work_orders_created(
+        self,
+        work_orders: Sequence[MaintenanceWorkOrder],
+        *,
+        commit: bool = True,
+    ) -> None:
+        """Record the ``maintenance_work_order.create`` activity for work
+        orders inserted in bulk; the caller emits the domain change."""
+        for work_order in work_orders:
+            self._record_activity("maintenance_work_order.create", work_order, commit=commit)
+
     def update_work_order(
         self,
         work_order_id: str,
@@ -531,7 +604,11 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         )
         if status is not None:
             prior_status = work_order.status
-            self._validate_work_order_status_transition(work_order.status, updated.status)
+            self._validate_work_order_status_transition(
+                work_order.status,
+                updated.status,
+                is_preventive=work_order.is_preventive or updated.is_preventive,
+            )
             if updated.status == MaintenanceWorkOrderStatus.IN_PROGRESS and work_order.actual_start is None:
                 updated = replace(updated, actual_start=now)
             elif (
@@ -546,18 +623,11 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
                     closed_at=now,
                     closed_by_user_id=current_user_id or updated.closed_by_user_id,
                 )
+            if prior_status in FAILURE_COMPLETED_STATUSES and updated.status == MaintenanceWorkOrderStatus.IN_PROGRESS:
+                # Reopened: the repair is unfinished until completed again.
+                updated = replace(updated, actual_end=None)
             status_completion_changed = (
-                prior_status not in (
-                    MaintenanceWorkOrderStatus.COMPLETED,
-                    MaintenanceWorkOrderStatus.VERIFIED,
-                    MaintenanceWorkOrderStatus.CLOSED,
-                )
-                and updated.status
-                in (
-                    MaintenanceWorkOrderStatus.COMPLETED,
-                    MaintenanceWorkOrderStatus.VERIFIED,
-                    MaintenanceWorkOrderStatus.CLOSED,
-                )
+                prior_status not in FAILURE_COMPLETED_STATUSES and updated.status in FAILURE_COMPLETED_STATUSES
             )
         if work_order_code is not None:
             existing = self._work_order_repo.get_by_code(updated.organization_id, updated.work_order_code)
@@ -568,6 +638,7 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
 
         try:
             self._work_order_repo.update(updated)
+            self._sync_failure_rollup(failure_occurrence_for(work_order), failure_occurrence_for(updated))
             self._session.commit()
         except IntegrityError as exc:
             self._session.rollback()
@@ -766,6 +837,13 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         preventive_plan.updated_at = completed_at
         self._preventive_plan_repo.update(preventive_plan)
 
+    def _sync_failure_rollup(
+        self,
+        before: MaintenanceFailureOccurrence | None,
+        after: MaintenanceFailureOccurrence | None,
+    ) -> None:
+        sync_failure_rollup(self._session, self._failure_rollup_repo, before, after)
+
     def _advance_calendar_due(
         self,
         anchor: datetime,
@@ -821,6 +899,18 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
         return site
 
     def _record_change(self, action: str, work_order: MaintenanceWorkOrder) -> None:
+        self._record_activity(action, work_order)
+        domain_events.domain_changed.emit(
+            DomainChangeEvent(
+                category="module",
+                scope_code="maintenance_management",
+                entity_type="maintenance_work_order",
+                entity_id=work_order.id,
+                source_event="maintenance_work_orders_changed",
+            )
+        )
+
+    def _record_activity(self, action: str, work_order: MaintenanceWorkOrder, *, commit: bool = True) -> None:
         record_activity(
             self,
             action=action,
@@ -836,15 +926,7 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
                 "status": work_order.status.value,
                 "priority": work_order.priority.value,
             },
-        )
-        domain_events.domain_changed.emit(
-            DomainChangeEvent(
-                category="module",
-                scope_code="maintenance_management",
-                entity_type="maintenance_work_order",
-                entity_id=work_order.id,
-                source_event="maintenance_work_orders_changed",
-            )
+            commit=commit,
         )
 
     def _record_source_request_conversion(self, work_request: MaintenanceWorkRequest) -> None:
@@ -914,6 +996,33 @@ class MaintenanceWorkOrderService(MaintenanceWorkOrderValidationMixin):
                 ),
             )
 
+    def _require_unused_code(self, organization: Organization, work_order_code: str) -> None:
+        if self._work_order_repo.get_by_code(organization.id, work_order_code) is not None:
+            raise ValidationError("Work order code already exists in the active organization.", code="MAINTENANCE_WORK_ORDER_CODE_EXISTS")
+
+    def _with_resolved_references(
+        self,
+        work_order: MaintenanceWorkOrder,
+        *,
+        organization: Organization,
+        site: Site,
+    ) -> MaintenanceWorkOrder:
+        asset_id, component_id, system_id, location_id = self._resolve_context_references(
+            organization=organization,
+            site=site,
+            asset_id=work_order.asset_id,
+            component_id=work_order.component_id,
+            system_id=work_order.system_id,
+            location_id=work_order.location_id,
+        )
+        return replace(
+            work_order,
+            asset_id=asset_id,
+            component_id=component_id,
+            system_id=system_id,
+            location_id=location_id,
+        )
+
     def _resolve_context_references(
         self,
         *,
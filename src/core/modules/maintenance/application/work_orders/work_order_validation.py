@@ -9,8 +9,14 @@ class MaintenanceWorkOrderValidationMixin:
         self,
         current_status: MaintenanceWorkOrderStatus,
         new_status: MaintenanceWorkOrderStatus,
+        *,
+        is_preventive: bool = False,
     ) -> None:
-        """Validate that a work order status transition is allowed."""
+        """Validate that a work order status transition is allowed.
+
+        Completed and verified work orders may be reopened unless they are
+        preventive: completing one already advanced its plan, which a reopen
+        would not undo."""
         valid_transitions = {
             MaintenanceWorkOrderStatus.DRAFT: {
                 MaintenanceWorkOrderStatus.PLANNED,
@@ -61,10 +67,12 @@ class MaintenanceWorkOrderValidationMixin:
                 MaintenanceWorkOrderStatus.CANCELLED,
             },
             MaintenanceWorkOrderStatus.COMPLETED: {
+                MaintenanceWorkOrderStatus.IN_PROGRESS,
                 MaintenanceWorkOrderStatus.VERIFIED,
                 MaintenanceWorkOrderStatus.CLOSED,
             },
             MaintenanceWorkOrderStatus.VERIFIED: {
+                MaintenanceWorkOrderStatus.IN_PROGRESS,
                 MaintenanceWorkOrderStatus.CLOSED,
             },
             MaintenanceWorkOrderStatus.CLOSED: set(),
@@ -76,6 +84,15 @@ class MaintenanceWorkOrderValidationMixin:
                 f"Cannot change work order status from {current_status.value} to {new_status.value}.",
                 code="MAINTENANCE_WORK_ORDER_STATUS_INVALID_TRANSITION",
             )
+        if (
+            is_preventive
+            and new_status == MaintenanceWorkOrderStatus.IN_PROGRESS
+            and current_status in (MaintenanceWorkOrderStatus.COMPLETED, MaintenanceWorkOrderStatus.VERIFIED)
+        ):
+            raise ValidationError(
+                "A completed preventive work order cannot be reopened; raise a new work order instead.",
+                code="MAINTENANCE_WORK_ORDER_PREVENTIVE_REOPEN",
+            )
 
 
 __all__ = [
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from src.core.modules.maintenance.domain import MaintenanceWorkRequest
+from src.core.modules.maintenance.contracts.repositories import MaintenancePlannerLaneFilter
+from src.core.modules.maintenance.application.common.planner_lanes import (
+    MAINTENANCE_PLANNER_LANE_PAGE_SIZE,
+    MaintenancePlannerLane,
+    decode_lane_token,
+    lane_from_loaded_rows,
+    lane_from_page,
+    lane_total,
+    normalize_lane_page_size,
+    normalize_lane_statuses,
+    planner_scope_anchor_ids,
+)
+
+
+def _search_fields(row: MaintenanceWorkRequest) -> tuple[str | None, ...]:
+    return (row.work_request_code, row.title, row.description, row.failure_symptom_code, row.request_type)
+
+
+class MaintenanceWorkRequestPlannerLaneMixin:
+    """The planner's request lane, one page at a time, filtered, sorted and
+    counted in SQL when the service has a planner repository."""
+
+    def list_work_request_lane(
+        self,
+        *,
+        site_id: str | None = None,
+        asset_id: str | None = None,
+        system_id: str | None = None,
+        statuses: Collection[str] | None = None,
+        search_text: str = "",
+        page_size: int = MAINTENANCE_PLANNER_LANE_PAGE_SIZE,
+        page_token: str = "",
+    ) -> MaintenancePlannerLane[MaintenanceWorkRequest]:
+        page_size = normalize_lane_page_size(page_size)
+        after = decode_lane_token(page_token)
+        lane_statuses = normalize_lane_statuses(statuses)
+        if self._planner_repo is None:
+            return lane_from_loaded_rows(
+                self.list_work_requests(site_id=site_id, asset_id=asset_id, system_id=system_id),
+                statuses=lane_statuses,
+                search_text=search_text,
+                search_fields=_search_fields,
+                page_size=page_size,
+                after=after,
+            )
+        self._require_read("list maintenance work requests")
+        organization = self._active_organization()
+        if site_id is not None:
+            self._get_site(site_id, organization=organization)
+        if asset_id is not None:
+            self._get_asset(asset_id, organization=organization)
+        if system_id is not None:
+            self._get_system(system_id, organization=organization)
+        filters = MaintenancePlannerLaneFilter(
+            organization_id=organization.id,
+            site_id=site_id,
+            asset_id=asset_id,
+            system_id=system_id,
+            statuses=lane_statuses,
+            search_text=str(search_text or "").strip(),
+            scope_anchor_ids=planner_scope_anchor_ids(self._user_session),
+        )
+        status_counts = self._planner_repo.count_work_requests_by_status(filters)
+        return lane_from_page(
+            self._planner_repo.list_work_requests(filters, limit=page_size + 1, after=after),
+            page_size=page_size,
+            total=lane_total(status_counts, lane_statuses),
+            status_counts=status_counts,
+        )
+
+
+__all__ = ["MaintenanceWorkRequestPlannerLaneMixin"]
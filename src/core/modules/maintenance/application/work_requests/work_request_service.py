@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import replace
 from datetime import datetime, timezone
 
@@ -22,6 +23,7 @@ from src.core.modules.maintenance.contracts.repositories import (
     MaintenanceAssetRepository,
     MaintenanceFailureCodeRepository,
     MaintenanceLocationRepository,
+    MaintenancePlannerRepository,
     MaintenanceSystemRepository,
     MaintenanceWorkRequestRepository,
 )
@@ -32,6 +34,9 @@ from src.core.modules.maintenance.application.common.support import (
 from src.core.modules.maintenance.application.common.scope_authorization import (
     deny_maintenance_scope_access,
 )
+from src.core.modules.maintenance.application.work_requests.planner_lane import (
+    MaintenanceWorkRequestPlannerLaneMixin,
+)
 from src.core.modules.maintenance.application.work_requests.validation import (
     MaintenanceWorkRequestValidationMixin,
 )
@@ -51,7 +56,7 @@ from src.core.platform.domain.master_data.org import Organization
 from src.core.platform.domain.master_data.site import Site
 
 
-class MaintenanceWorkRequestService(MaintenanceWorkRequestValidationMixin):
+class MaintenanceWorkRequestService(MaintenanceWorkRequestPlannerLaneMixin, MaintenanceWorkRequestValidationMixin):
     def __init__(
         self,
         session: Session,
@@ -65,6 +70,7 @@ class MaintenanceWorkRequestService(MaintenanceWorkRequestValidationMixin):
         location_repo: MaintenanceLocationRepository,
         system_repo: MaintenanceSystemRepository,
         failure_code_repo: MaintenanceFailureCodeRepository | None = None,
+        planner_repo: MaintenancePlannerRepository | None = None,
         tenant_context_service: TenantContextService | None = None,
         user_session=None,
         activity_service=None,
@@ -83,6 +89,7 @@ class MaintenanceWorkRequestService(MaintenanceWorkRequestValidationMixin):
         self._location_repo: MaintenanceLocationRepository = location_repo
         self._system_repo: MaintenanceSystemRepository = system_repo
         self._failure_code_repo: MaintenanceFailureCodeRepository | None = failure_code_repo
+        self._planner_repo: MaintenancePlannerRepository | None = planner_repo
         self._user_session = user_session
         self._activity_service = activity_service
 
@@ -282,6 +289,76 @@ class MaintenanceWorkRequestService(MaintenanceWorkRequestValidationMixin):
         self._record_change("maintenance_work_request.create", work_request)
         return work_request
 
+    def prepare_new_work_requests(
+        self,
+        drafts: Sequence[MaintenanceWorkRequest],
+    ) -> list[MaintenanceWorkRequest]:
+        """
+        Validate work requests a caller is about to insert in bulk, the way
+        ``create_work_request`` validates a single one, without saving them.
+
+        Codes must be unused in the active organization and across
+        ``drafts``; preventive requests must name their source plan; the
+        asset, component, system and location must belong to the request's
+        site. The returned work requests carry the component's asset when
+        only a component was given.
+        """
+        self._require_manage("create maintenance work request")
+        organization = self._active_organization()
+        taken_codes = {
+            row.work_request_code
+            for row in self._work_request_repo.list_by_codes(
+                organization.id, [row.work_request_code for row in drafts]
+            )
+        }
+        sites: dict[str, Site] = {}
+        prepared: list[MaintenanceWorkRequest] = []
+        for draft in drafts:
+            if draft.work_request_code in taken_codes:
+                raise ValidationError("Work request code already exists in the active organization.", code="MAINTENANCE_WORK_REQUEST_CODE_EXISTS")
+            taken_codes.add(draft.work_request_code)
+            if draft.source_type == MaintenanceWorkRequestSourceType.PREVENTIVE_PLAN and not draft.source_id:
+                raise ValidationError(
+                    "Preventive maintenance work requests must retain their source plan id.",
+                    code="MAINTENANCE_WORK_REQUEST_SOURCE_REQUIRED",
+                )
+            site = sites.get(draft.site_id)
+            if site is None:
+                site = sites[draft.site_id] = self._get_site(draft.site_id, organization=organization)
+            asset_id, component_id, system_id, location_id = self._resolve_context_references(
+                organization=organization,
+                site=site,
+                asset_id=draft.asset_id,
+                component_id=draft.component_id,
+                system_id=draft.system_id,
+                location_id=draft.location_id,
+            )
+            prepared.append(
+                replace(
+                    draft,
+                    asset_id=asset_id,
+                    component_id=component_id,
+                    system_id=system_id,
+                    location_id=location_id,
+                    failure_symptom_code=self._normalize_failure_symptom_code(
+                        draft.failure_symptom_code,
+                        organization=organization,
+                    ),
+                )
+            )
+        return prepared
+
+    def record_work_requests_created(
+        self,
+        work_requests: Sequence[MaintenanceWorkRequest],
+        *,
+        commit: bool = True,
+    ) -> None:
+        """Record the ``maintenance_work_request.create`` activity for work
+        requests inserted in bulk; the caller emits the domain change."""
+        for work_request in work_requests:
+            self._record_activity("maintenance_work_request.create", work_request, commit=commit)
+
     def update_work_request(
         self,
         work_request_id: str,
@@ -451,6 +528,18 @@ class MaintenanceWorkRequestService(MaintenanceWorkRequestValidationMixin):
         return site
 
     def _record_change(self, action: str, work_request: MaintenanceWorkRequest) -> None:
+        self._record_activity(action, work_request)
+        domain_events.domain_changed.emit(
+            DomainChangeEvent(
+                category="module",
+                scope_code="maintenance_management",
+                entity_type="maintenance_work_request",
+                entity_id=work_request.id,
+                source_event="maintenance_work_requests_changed",
+            )
+        )
+
+    def _record_activity(self, action: str, work_request: MaintenanceWorkRequest, *, commit: bool = True) -> None:
         record_activity(
             self,
             action=action,
@@ -466,15 +555,7 @@ class MaintenanceWorkRequestService(MaintenanceWorkRequestValidationMixin):
                 "status": work_request.status.value,
                 "priority": work_request.priority.value,
             },
-        )
-        domain_events.domain_changed.emit(
-            DomainChangeEvent(
-                category="module",
-                scope_code="maintenance_management",
-                entity_type="maintenance_work_request",
-                entity_id=work_request.id,
-                source_event="maintenance_work_requests_changed",
-            )
+            commit=commit,
         )
 
     def _require_read(self, operation_label: str) -> None:
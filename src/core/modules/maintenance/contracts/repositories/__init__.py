@@ -2,10 +2,16 @@
 
 from src.core.modules.maintenance.contracts.repositories.assets import (
     MaintenanceAssetComponentRepository,
+    MaintenanceAssetHierarchyRepository,
     MaintenanceAssetRepository,
     MaintenanceLocationRepository,
     MaintenanceSystemRepository,
 )
+from src.core.modules.maintenance.contracts.repositories.planner import (
+    MaintenancePlannerLaneCursor,
+    MaintenancePlannerLaneFilter,
+    MaintenancePlannerRepository,
+)
 from src.core.modules.maintenance.contracts.repositories.preventive import (
     MaintenanceBlackoutWindowRepository,
     MaintenancePreventivePlanInstanceRepository,
@@ -14,14 +20,27 @@ from src.core.modules.maintenance.contracts.repositories.preventive import (
     MaintenanceTaskStepTemplateRepository,
     MaintenanceTaskTemplateRepository,
 )
+from src.core.modules.maintenance.contracts.repositories.preventive_generation import (
+    MaintenancePreventiveGenerationRepository,
+)
 from src.core.modules.maintenance.contracts.repositories.reliability import (
     MaintenanceDowntimeEventRepository,
+    MaintenanceDowntimeTypeFact,
     MaintenanceFailureCodeRepository,
+    MaintenanceFailureRollupRepository,
+    MaintenanceFailureSpanFact,
     MaintenanceIntegrationSourceRepository,
+    MaintenanceRecurringFailureFact,
+    MaintenanceReliabilityAnalyticsRepository,
+    MaintenanceRepairSummaryFact,
+    MaintenanceRootCauseFact,
     MaintenanceSensorExceptionRepository,
     MaintenanceSensorReadingRepository,
     MaintenanceSensorRepository,
+    MaintenanceSensorRollupRepository,
     MaintenanceSensorSourceMappingRepository,
+    MaintenanceWorkOrderAnalyticsFilter,
+    MaintenanceWorkOrderBacklogFact,
 )
 from src.core.modules.maintenance.contracts.repositories.work_orders import (
     MaintenanceWorkOrderMaterialRequirementRepository,
@@ -36,21 +55,36 @@ from src.core.modules.maintenance.contracts.repositories.work_requests import (
 __all__ = [
     "MaintenanceBlackoutWindowRepository",
     "MaintenanceAssetComponentRepository",
+    "MaintenanceAssetHierarchyRepository",
     "MaintenanceAssetRepository",
     "MaintenanceDowntimeEventRepository",
+    "MaintenanceDowntimeTypeFact",
     "MaintenanceFailureCodeRepository",
+    "MaintenanceFailureRollupRepository",
+    "MaintenanceFailureSpanFact",
     "MaintenanceIntegrationSourceRepository",
     "MaintenanceLocationRepository",
+    "MaintenancePlannerLaneCursor",
+    "MaintenancePlannerLaneFilter",
+    "MaintenancePlannerRepository",
+    "MaintenancePreventiveGenerationRepository",
     "MaintenancePreventivePlanInstanceRepository",
     "MaintenancePreventivePlanRepository",
     "MaintenancePreventivePlanTaskRepository",
+    "MaintenanceRecurringFailureFact",
+    "MaintenanceReliabilityAnalyticsRepository",
+    "MaintenanceRepairSummaryFact",
+    "MaintenanceRootCauseFact",
     "MaintenanceSensorExceptionRepository",
     "MaintenanceSensorReadingRepository",
     "MaintenanceSensorRepository",
+    "MaintenanceSensorRollupRepository",
     "MaintenanceSensorSourceMappingRepository",
     "MaintenanceSystemRepository",
     "MaintenanceTaskStepTemplateRepository",
     "MaintenanceTaskTemplateRepository",
+    "MaintenanceWorkOrderAnalyticsFilter",
+    "MaintenanceWorkOrderBacklogFact",
     "MaintenanceWorkOrderMaterialRequirementRepository",
     "MaintenanceWorkOrderRepository",
     "MaintenanceWorkOrderTaskRepository",
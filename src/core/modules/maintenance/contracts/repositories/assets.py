@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 
 from src.core.modules.maintenance.domain.assets.asset import (
     MaintenanceAsset,
     MaintenanceAssetComponent,
 )
+from src.core.modules.maintenance.domain.assets.hierarchy import (
+    MaintenanceAssetClosureDrift,
+    MaintenanceAssetSubtreeSummary,
+)
+from src.core.modules.maintenance.domain.enums import MaintenanceWorkOrderStatus
 from src.core.modules.maintenance.domain.locations.location import (
     MaintenanceLocation,
     MaintenanceSystem,
@@ -88,6 +94,55 @@ class MaintenanceAssetRepository(ABC):
     ) -> list[MaintenanceAsset]: ...
 
 
+class MaintenanceAssetHierarchyRepository(ABC):
+    """Closure of the asset hierarchy: one row per ancestor and descendant
+    pair, so subtree reads are a single indexed join instead of a walk up
+    or down ``parent_asset_id``.
+
+    ``add_asset`` and ``move_asset`` run in the caller's transaction,
+    right after the asset row itself is written.
+    """
+
+    @abstractmethod
+    def add_asset(self, asset: MaintenanceAsset) -> None: ...
+
+    @abstractmethod
+    def move_asset(self, asset_id: str, parent_asset_id: str | None) -> None:
+        """Re-hang ``asset_id`` and its whole subtree under ``parent_asset_id``."""
+
+    @abstractmethod
+    def is_descendant(self, ancestor_id: str, descendant_id: str) -> bool:
+        """Whether ``descendant_id`` is ``ancestor_id`` or sits below it."""
+
+    @abstractmethod
+    def list_ancestor_ids(self, asset_id: str) -> list[str]:
+        """Ancestors of ``asset_id``, nearest first."""
+
+    @abstractmethod
+    def list_subtree(
+        self,
+        asset_id: str,
+        *,
+        include_self: bool = True,
+        max_depth: int | None = None,
+        active_only: bool | None = None,
+    ) -> list[MaintenanceAsset]: ...
+
+    @abstractmethod
+    def summarize_subtree(
+        self,
+        asset_id: str,
+        *,
+        terminal_statuses: Collection[MaintenanceWorkOrderStatus],
+    ) -> MaintenanceAssetSubtreeSummary: ...
+
+    @abstractmethod
+    def rebuild(self, organization_id: str) -> int: ...
+
+    @abstractmethod
+    def list_drift(self, organization_id: str) -> list[MaintenanceAssetClosureDrift]: ...
+
+
 class MaintenanceAssetComponentRepository(ABC):
     @abstractmethod
     def add(self, component: MaintenanceAssetComponent) -> None: ...
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.core.modules.maintenance.domain.work_orders.order import (
+    MaintenanceWorkOrder,
+    MaintenanceWorkOrderMaterialRequirement,
+)
+from src.core.modules.maintenance.domain.work_requests.request import (
+    MaintenanceWorkRequest,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenancePlannerLaneFilter:
+    """Records one planner lane lists.
+
+    ``statuses`` is ``None`` for every status. ``search_text`` is matched
+    case-insensitively against each of the record's code, title,
+    description, failure codes and type. ``scope_anchor_ids`` is ``None``
+    for an unrestricted session; otherwise only records anchored to one of
+    those maintenance scopes are listed.
+    """
+
+    organization_id: str
+    site_id: str | None = None
+    asset_id: str | None = None
+    system_id: str | None = None
+    statuses: frozenset[str] | None = None
+    search_text: str = ""
+    scope_anchor_ids: frozenset[str] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenancePlannerLaneCursor:
+    """The last row of a page; the next page starts right after it in the
+    lane's ``(created_at, id)`` order."""
+
+    created_at: datetime
+    record_id: str
+
+
+class MaintenancePlannerRepository(ABC):
+    """Paged, filtered reads behind the maintenance planner lanes.
+
+    Request and work order lanes run newest first; the material lane runs
+    oldest first. ``count_*_by_status`` ignore ``filters.statuses`` so a
+    single grouped query gives the lane total and every queue's count.
+    """
+
+    @abstractmethod
+    def list_work_requests(
+        self,
+        filters: MaintenancePlannerLaneFilter,
+        *,
+        limit: int,
+        after: MaintenancePlannerLaneCursor | None = None,
+    ) -> list[MaintenanceWorkRequest]: ...
+
+    @abstractmethod
+    def count_work_requests_by_status(self, filters: MaintenancePlannerLaneFilter) -> dict[str, int]: ...
+
+    @abstractmethod
+    def list_work_orders(
+        self,
+        filters: MaintenancePlannerLaneFilter,
+        *,
+        limit: int,
+        after: MaintenancePlannerLaneCursor | None = None,
+    ) -> list[MaintenanceWorkOrder]: ...
+
+    @abstractmethod
+    def count_work_orders_by_status(self, filters: MaintenancePlannerLaneFilter) -> dict[str, int]: ...
+
+    @abstractmethod
+    def list_material_risks(
+        self,
+        filters: MaintenancePlannerLaneFilter,
+        *,
+        procurement_statuses: Collection[str],
+        limit: int,
+        after: MaintenancePlannerLaneCursor | None = None,
+    ) -> list[MaintenanceWorkOrderMaterialRequirement]:
+        """Requirements in ``procurement_statuses`` on the work orders that
+        ``filters`` selects."""
+
+    @abstractmethod
+    def count_material_risks_by_status(
+        self,
+        filters: MaintenancePlannerLaneFilter,
+        *,
+        procurement_statuses: Collection[str],
+    ) -> dict[str, int]:
+        """Material risks per procurement status."""
+
+
+__all__ = [
+    "MaintenancePlannerLaneCursor",
+    "MaintenancePlannerLaneFilter",
+    "MaintenancePlannerRepository",
+]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 
 from src.core.modules.maintenance.domain.preventive.schedule import (
     MaintenanceBlackoutWindow,
@@ -83,6 +84,7 @@ class MaintenancePreventivePlanRepository(ABC):
         plan_type: str | None = None,
         trigger_mode: str | None = None,
         sensor_id: str | None = None,
+        sensor_ids: Collection[str] | None = None,
     ) -> list[MaintenancePreventivePlan]: ...
 
 
@@ -103,6 +105,7 @@ class MaintenancePreventivePlanTaskRepository(ABC):
         *,
         plan_id: str | None = None,
         task_template_id: str | None = None,
+        sensor_ids: Collection[str] | None = None,
     ) -> list[MaintenancePreventivePlanTask]: ...
 
 
@@ -155,3 +158,8 @@ class MaintenanceBlackoutWindowRepository(ABC):
     def list_for_plan(
         self, organization_id: str, plan_id: str, *, active_only: bool = True
     ) -> list[MaintenanceBlackoutWindow]: ...
+
+    @abstractmethod
+    def list_for_organization(
+        self, organization_id: str, *, active_only: bool = True
+    ) -> list[MaintenanceBlackoutWindow]: ...
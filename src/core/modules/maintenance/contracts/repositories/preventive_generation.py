@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Collection, Sequence
+
+from src.core.modules.maintenance.domain.preventive.schedule import (
+    MaintenancePreventivePlan,
+    MaintenancePreventivePlanInstance,
+    MaintenancePreventivePlanTask,
+)
+from src.core.modules.maintenance.domain.work_orders.order import MaintenanceWorkOrder
+from src.core.modules.maintenance.domain.work_requests.request import MaintenanceWorkRequest
+
+
+class MaintenancePreventiveGenerationRepository(ABC):
+    """Set-based writes for a batched preventive generation run.
+
+    Every method writes all of its rows with executemany statements and
+    leaves the transaction to the caller. The ``update_*`` methods write
+    only the scheduling columns generation changes and check each row's
+    version, so a plan edited mid-run fails the chunk instead of being
+    overwritten.
+    """
+
+    @abstractmethod
+    def add_instances(self, instances: Sequence[MaintenancePreventivePlanInstance]) -> None: ...
+
+    @abstractmethod
+    def delete_instances(self, instance_ids: Collection[str]) -> None: ...
+
+    @abstractmethod
+    def update_instance_generation(
+        self,
+        instances: Sequence[MaintenancePreventivePlanInstance],
+    ) -> None: ...
+
+    @abstractmethod
+    def add_work_orders(self, work_orders: Sequence[MaintenanceWorkOrder]) -> None: ...
+
+    @abstractmethod
+    def add_work_requests(self, work_requests: Sequence[MaintenanceWorkRequest]) -> None: ...
+
+    @abstractmethod
+    def update_plan_schedules(self, plans: Sequence[MaintenancePreventivePlan]) -> None: ...
+
+    @abstractmethod
+    def update_plan_task_schedules(
+        self,
+        plan_tasks: Sequence[MaintenancePreventivePlanTask],
+    ) -> None: ...
+
+
+__all__ = ["MaintenancePreventiveGenerationRepository"]
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
+from dataclasses import dataclass
+from datetime import datetime
 
 from src.core.modules.maintenance.domain.reliability.monitoring import (
     MaintenanceDowntimeEvent,
@@ -11,6 +14,17 @@ from src.core.modules.maintenance.domain.reliability.monitoring import (
     MaintenanceSensorReading,
     MaintenanceSensorSourceMapping,
 )
+from src.core.modules.maintenance.domain.enums import (
+    MaintenancePriority,
+    MaintenanceSensorRollupGrain,
+    MaintenanceWorkOrderStatus,
+)
+from src.core.modules.maintenance.domain.reliability.failure_rollups import (
+    MaintenanceFailureOccurrence,
+    MaintenanceFailureRollup,
+    MaintenanceFailureRollupDrift,
+)
+from src.core.modules.maintenance.domain.reliability.sensor_rollups import MaintenanceSensorRollup
 
 
 class MaintenanceSensorRepository(ABC):
@@ -45,6 +59,9 @@ class MaintenanceSensorReadingRepository(ABC):
     @abstractmethod
     def add(self, sensor_reading: MaintenanceSensorReading) -> None: ...
 
+    @abstractmethod
+    def add_many(self, sensor_readings: list[MaintenanceSensorReading]) -> None: ...
+
     @abstractmethod
     def get(self, sensor_reading_id: str) -> MaintenanceSensorReading | None: ...
 
@@ -60,6 +77,59 @@ class MaintenanceSensorReadingRepository(ABC):
         reading_to=None,
     ) -> list[MaintenanceSensorReading]: ...
 
+    @abstractmethod
+    def delete_before(
+        self,
+        organization_id: str,
+        cutoff: datetime,
+        *,
+        sensor_id: str | None = None,
+    ) -> int: ...
+
+
+class MaintenanceSensorRollupRepository(ABC):
+    @abstractmethod
+    def merge_many(self, rollups: list[MaintenanceSensorRollup]) -> None: ...
+
+    @abstractmethod
+    def replace_for_sensor(self, sensor_id: str, rollups: list[MaintenanceSensorRollup]) -> None: ...
+
+    @abstractmethod
+    def list_for_sensor(
+        self,
+        organization_id: str,
+        sensor_id: str,
+        *,
+        grain: MaintenanceSensorRollupGrain,
+        bucket_from: datetime | None = None,
+        bucket_to: datetime | None = None,
+    ) -> list[MaintenanceSensorRollup]: ...
+
+
+class MaintenanceFailureRollupRepository(ABC):
+    @abstractmethod
+    def record_failure(self, occurrence: MaintenanceFailureOccurrence) -> None: ...
+
+    @abstractmethod
+    def refresh(self, organization_id: str, keys: Collection[tuple[str, str]]) -> None: ...
+
+    @abstractmethod
+    def rebuild(self, organization_id: str) -> int: ...
+
+    @abstractmethod
+    def list_drift(self, organization_id: str) -> list[MaintenanceFailureRollupDrift]: ...
+
+    @abstractmethod
+    def list_for_organization(
+        self,
+        organization_id: str,
+        *,
+        site_id: str | None = None,
+        asset_id: str | None = None,
+        asset_category: str | None = None,
+        failure_code: str | None = None,
+    ) -> list[MaintenanceFailureRollup]: ...
+
 
 class MaintenanceIntegrationSourceRepository(ABC):
     @abstractmethod
@@ -174,6 +244,7 @@ class MaintenanceDowntimeEventRepository(ABC):
         *,
         work_order_id: str | None = None,
         asset_id: str | None = None,
+        under_asset_id: str | None = None,
         system_id: str | None = None,
         downtime_type: str | None = None,
         reason_code: str | None = None,
@@ -181,3 +252,139 @@ class MaintenanceDowntimeEventRepository(ABC):
         started_from=None,
         started_to=None,
     ) -> list[MaintenanceDowntimeEvent]: ...
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceWorkOrderAnalyticsFilter:
+    """Work orders an analytics query aggregates over.
+
+    ``scope_anchor_ids`` is ``None`` for an unrestricted session; otherwise
+    only work orders anchored to one of those maintenance scopes count.
+    The activity bounds apply to the work order's activity timestamp.
+    """
+
+    organization_id: str
+    site_id: str | None = None
+    asset_id: str | None = None
+    system_id: str | None = None
+    location_id: str | None = None
+    asset_category: str | None = None
+    scope_anchor_ids: frozenset[str] | None = None
+    activity_from: datetime | None = None
+    activity_to: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceWorkOrderBacklogFact:
+    status: MaintenanceWorkOrderStatus
+    priority: MaintenancePriority
+    work_order_count: int
+    overdue_count: int
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceRepairSummaryFact:
+    """Repair time as a total over a count, left for the caller to average
+    so that the division happens the same way for every source."""
+
+    terminal_count: int
+    repair_count: int
+    repair_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceFailureSpanFact:
+    anchor_type: str
+    anchor_id: str
+    occurrence_count: int
+    first_occurrence_at: datetime
+    last_occurrence_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceRootCauseFact:
+    failure_code: str
+    root_cause_code: str
+    work_order_count: int
+    total_downtime_minutes: int
+    latest_occurrence_at: datetime
+    open_work_orders: int
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceRecurringFailureFact:
+    anchor_type: str
+    anchor_id: str
+    failure_code: str
+    root_cause_code: str
+    occurrence_count: int
+    open_work_orders: int
+    total_downtime_minutes: int
+    repair_count: int
+    repair_seconds: float
+    first_occurrence_at: datetime
+    last_occurrence_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceDowntimeTypeFact:
+    downtime_type: str
+    event_count: int
+    open_event_count: int
+    total_minutes: int
+
+
+class MaintenanceReliabilityAnalyticsRepository(ABC):
+    """Grouped reliability aggregates computed by the database, so that
+    dashboards never load the work order history into memory."""
+
+    @abstractmethod
+    def list_backlog(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        statuses: Collection[MaintenanceWorkOrderStatus],
+        overdue_before: datetime,
+    ) -> list[MaintenanceWorkOrderBacklogFact]: ...
+
+    @abstractmethod
+    def summarize_repairs(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        terminal_statuses: Collection[MaintenanceWorkOrderStatus],
+    ) -> MaintenanceRepairSummaryFact: ...
+
+    @abstractmethod
+    def list_failure_spans(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+    ) -> list[MaintenanceFailureSpanFact]: ...
+
+    @abstractmethod
+    def list_root_causes(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        terminal_statuses: Collection[MaintenanceWorkOrderStatus],
+        failure_code: str | None = None,
+        limit: int,
+    ) -> list[MaintenanceRootCauseFact]: ...
+
+    @abstractmethod
+    def list_recurring_failures(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        terminal_statuses: Collection[MaintenanceWorkOrderStatus],
+        min_occurrences: int,
+    ) -> list[MaintenanceRecurringFailureFact]: ...
+
+    @abstractmethod
+    def list_downtime_by_type(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        started_from: datetime | None = None,
+        started_to: datetime | None = None,
+    ) -> list[MaintenanceDowntimeTypeFact]: ...
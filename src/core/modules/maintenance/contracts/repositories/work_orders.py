@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 
 from src.core.modules.maintenance.domain.work_orders.order import (
     MaintenanceWorkOrder,
@@ -23,6 +24,12 @@ class MaintenanceWorkOrderRepository(ABC):
     @abstractmethod
     def get_by_code(self, organization_id: str, work_order_code: str) -> MaintenanceWorkOrder | None: ...
 
+    @abstractmethod
+    def list_by_ids(self, organization_id: str, work_order_ids: Collection[str]) -> list[MaintenanceWorkOrder]: ...
+
+    @abstractmethod
+    def list_by_codes(self, organization_id: str, work_order_codes: Collection[str]) -> list[MaintenanceWorkOrder]: ...
+
     @abstractmethod
     def list_for_organization(
         self,
@@ -30,6 +37,7 @@ class MaintenanceWorkOrderRepository(ABC):
         *,
         site_id: str | None = None,
         asset_id: str | None = None,
+        under_asset_id: str | None = None,
         component_id: str | None = None,
         system_id: str | None = None,
         location_id: str | None = None,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 
 from src.core.modules.maintenance.domain.work_requests.request import (
     MaintenanceWorkRequest,
@@ -20,6 +21,13 @@ class MaintenanceWorkRequestRepository(ABC):
     @abstractmethod
     def get_by_code(self, organization_id: str, work_request_code: str) -> MaintenanceWorkRequest | None: ...
 
+    @abstractmethod
+    def list_by_codes(
+        self,
+        organization_id: str,
+        work_request_codes: Collection[str],
+    ) -> list[MaintenanceWorkRequest]: ...
+
     @abstractmethod
     def list_for_organization(
         self,
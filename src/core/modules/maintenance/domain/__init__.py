@@ -4,6 +4,11 @@ from src.core.modules.maintenance.domain.assets.asset import (
     MaintenanceAsset,
     MaintenanceAssetComponent,
 )
+from src.core.modules.maintenance.domain.assets.hierarchy import (
+    MaintenanceAssetClosureDrift,
+    MaintenanceAssetClosureEntry,
+    MaintenanceAssetSubtreeSummary,
+)
 from src.core.modules.maintenance.domain.enums import (
     MaintenanceCalendarFrequencyUnit,
     MaintenanceCriticality,
@@ -21,6 +26,7 @@ from src.core.modules.maintenance.domain.enums import (
     MaintenanceSensorExceptionStatus,
     MaintenanceSensorExceptionType,
     MaintenanceSensorQualityState,
+    MaintenanceSensorRollupGrain,
     MaintenanceTaskCompletionRule,
     MaintenanceTemplateStatus,
     MaintenanceTriggerMode,
@@ -52,6 +58,12 @@ from src.core.modules.maintenance.domain.reliability.monitoring import (
     MaintenanceSensorReading,
     MaintenanceSensorSourceMapping,
 )
+from src.core.modules.maintenance.domain.reliability.failure_rollups import (
+    MaintenanceFailureOccurrence,
+    MaintenanceFailureRollup,
+    MaintenanceFailureRollupDrift,
+)
+from src.core.modules.maintenance.domain.reliability.sensor_rollups import MaintenanceSensorRollup
 from src.core.modules.maintenance.domain.work_orders.order import (
     MaintenanceWorkOrder,
     MaintenanceWorkOrderMaterialRequirement,
@@ -64,12 +76,18 @@ from src.core.modules.maintenance.domain.work_requests.request import (
 
 __all__ = [
     "MaintenanceAsset",
+    "MaintenanceAssetClosureDrift",
+    "MaintenanceAssetClosureEntry",
     "MaintenanceAssetComponent",
+    "MaintenanceAssetSubtreeSummary",
     "MaintenanceCalendarFrequencyUnit",
     "MaintenanceCriticality",
     "MaintenanceDowntimeEvent",
     "MaintenanceFailureCode",
     "MaintenanceFailureCodeType",
+    "MaintenanceFailureOccurrence",
+    "MaintenanceFailureRollup",
+    "MaintenanceFailureRollupDrift",
     "MaintenanceGenerationLeadUnit",
     "MaintenanceIntegrationSource",
     "MaintenanceLifecycleStatus",
@@ -91,7 +109,9 @@ __all__ = [
     "MaintenanceSensorExceptionStatus",
     "MaintenanceSensorExceptionType",
     "MaintenanceSensorQualityState",
+    "MaintenanceSensorRollupGrain",
     "MaintenanceSensorReading",
+    "MaintenanceSensorRollup",
     "MaintenanceSensorSourceMapping",
     "MaintenanceSystem",
     "MaintenanceTaskCompletionRule",
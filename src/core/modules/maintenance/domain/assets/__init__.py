@@ -4,8 +4,18 @@ from src.core.modules.maintenance.domain.assets.asset import (
     MaintenanceAsset,
     MaintenanceAssetComponent,
 )
+from src.core.modules.maintenance.domain.assets.hierarchy import (
+    MaintenanceAssetClosureDrift,
+    MaintenanceAssetClosureEntry,
+    MaintenanceAssetSubtreeSummary,
+    iter_asset_closure,
+)
 
 __all__ = [
     "MaintenanceAsset",
+    "MaintenanceAssetClosureDrift",
+    "MaintenanceAssetClosureEntry",
     "MaintenanceAssetComponent",
+    "MaintenanceAssetSubtreeSummary",
+    "iter_asset_closure",
 ]
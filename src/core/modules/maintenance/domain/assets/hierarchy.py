@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceAssetClosureEntry:
+    """``descendant_id`` sits ``depth`` levels below ``ancestor_id`` in the
+    asset hierarchy; every asset is its own ancestor at depth 0."""
+
+    organization_id: str
+    ancestor_id: str
+    descendant_id: str
+    depth: int
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.ancestor_id, self.descendant_id)
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceAssetClosureDrift:
+    """A stored closure row that disagrees with the assets' parent links.
+    ``expected_depth`` is ``None`` for a stale row and ``stored_depth`` is
+    ``None`` for a missing one."""
+
+    ancestor_id: str
+    descendant_id: str
+    expected_depth: int | None
+    stored_depth: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceAssetSubtreeSummary:
+    """Roll-up of an asset and everything below it."""
+
+    asset_id: str
+    asset_count: int
+    max_depth: int
+    work_order_count: int
+    open_work_order_count: int
+    downtime_minutes: int
+    material_requirement_count: int
+
+
+def iter_asset_closure(
+    parents: Mapping[str, tuple[str, str | None]],
+) -> Iterator[MaintenanceAssetClosureEntry]:
+    """Closure rows for the assets in ``parents``, which maps each asset id
+    to its ``(organization_id, parent_asset_id)``.
+
+    Walks down from the roots, so each asset reuses its parent's ancestor
+    chain instead of climbing the tree again. A parent outside ``parents``
+    makes the asset a root. Assets caught in a parent cycle, which older
+    data may hold, are unreachable from any root and only get their own
+    depth-0 row.
+    """
+    children: dict[str, list[str]] = defaultdict(list)
+    roots: list[str] = []
+    for asset_id, (_organization_id, parent_id) in parents.items():
+        if parent_id and parent_id != asset_id and parent_id in parents:
+            children[parent_id].append(asset_id)
+        else:
+            roots.append(asset_id)
+    reached: set[str] = set()
+    for root_id in roots:
+        stack: list[tuple[str, tuple[str, ...]]] = [(root_id, ())]
+        while stack:
+            asset_id, ancestors = stack.pop()
+            reached.add(asset_id)
+            organization_id = parents[asset_id][0]
+            chain = ancestors + (asset_id,)
+            for depth, ancestor_id in enumerate(reversed(chain)):
+                yield MaintenanceAssetClosureEntry(
+                    organization_id=organization_id,
+                    ancestor_id=ancestor_id,
+                    descendant_id=asset_id,
+                    depth=depth,
+                )
+            stack.extend((child_id, chain) for child_id in children.get(asset_id, ()))
+    for asset_id, (organization_id, _parent_id) in parents.items():
+        if asset_id not in reached:
+            yield MaintenanceAssetClosureEntry(
+                organization_id=organization_id,
+                ancestor_id=asset_id,
+                descendant_id=asset_id,
+                depth=0,
+            )
+
+
+__all__ = [
+    "MaintenanceAssetClosureDrift",
+    "MaintenanceAssetClosureEntry",
+    "MaintenanceAssetSubtreeSummary",
+    "iter_asset_closure",
+]
@@ -110,6 +110,12 @@ class MaintenanceSensorQualityState(str, Enum):
     ERROR = "ERROR"
 
 
+class MaintenanceSensorRollupGrain(str, Enum):
+    MINUTE = "MINUTE"
+    HOUR = "HOUR"
+    DAY = "DAY"
+
+
 class MaintenanceSensorExceptionType(str, Enum):
     MISSING_FEED = "MISSING_FEED"
     STALE_READING = "STALE_READING"
@@ -208,6 +214,7 @@ __all__ = [
     "MaintenanceSensorExceptionStatus",
     "MaintenanceSensorExceptionType",
     "MaintenanceSensorQualityState",
+    "MaintenanceSensorRollupGrain",
     "MaintenanceTaskCompletionRule",
     "MaintenanceTemplateStatus",
     "MaintenanceTriggerMode",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import calendar
 from datetime import date, datetime, timezone
 from decimal import Decimal
 
@@ -486,6 +487,13 @@ class MaintenancePreventivePlanInstance:
         )
 
 
+def _same_day_in_year(value: date, year: int) -> date:
+    # 29 February falls back to the 28th in common years.
+    if value.month == 2 and value.day == 29 and not calendar.isleap(year):
+        return date(year, 2, 28)
+    return value.replace(year=year)
+
+
 @validated_dataclass
 class MaintenanceBlackoutWindow:
     id: str
@@ -594,15 +602,26 @@ class MaintenanceBlackoutWindow:
             notes=notes,
         )
 
+    def occurrence_in_year(self, year: int) -> tuple[date, date]:
+        """The annual window starting in ``year``; its end may fall in ``year + 1``."""
+        adjusted = _same_day_in_year(self.start_date, year)
+        adjusted_end = _same_day_in_year(self.end_date, year)
+        if adjusted_end < adjusted:
+            adjusted_end = _same_day_in_year(self.end_date, year + 1)
+        return adjusted, adjusted_end
+
     def covers(self, check_date: date) -> bool:
         if not self.is_active:
             return False
         if self.recurrence == "ANNUAL":
-            adjusted = self.start_date.replace(year=check_date.year)
-            adjusted_end = self.end_date.replace(year=check_date.year)
-            if adjusted_end < adjusted:
-                adjusted_end = adjusted_end.replace(year=check_date.year + 1)
-            return adjusted <= check_date <= adjusted_end
+            # Early January can still sit in last year's wrapping window.
+            return any(
+                start <= check_date <= end
+                for start, end in (
+                    self.occurrence_in_year(check_date.year - 1),
+                    self.occurrence_in_year(check_date.year),
+                )
+            )
         return self.start_date <= check_date <= self.end_date
 
 
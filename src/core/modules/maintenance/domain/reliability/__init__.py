@@ -1,5 +1,12 @@
 """Reliability domain."""
 
+from src.core.modules.maintenance.domain.reliability.failure_rollups import (
+    MaintenanceFailureOccurrence,
+    MaintenanceFailureRollup,
+    MaintenanceFailureRollupDrift,
+    failure_occurrence_for,
+    rollup_failure_occurrences,
+)
 from src.core.modules.maintenance.domain.reliability.monitoring import (
     MaintenanceDowntimeEvent,
     MaintenanceFailureCode,
@@ -9,13 +16,28 @@ from src.core.modules.maintenance.domain.reliability.monitoring import (
     MaintenanceSensorReading,
     MaintenanceSensorSourceMapping,
 )
+from src.core.modules.maintenance.domain.reliability.sensor_rollups import (
+    MaintenanceSensorRollup,
+    rollup_sensor_readings,
+    sensor_rollup_bucket_start,
+    sensor_rollup_grain_for,
+)
 
 __all__ = [
     "MaintenanceDowntimeEvent",
     "MaintenanceFailureCode",
+    "MaintenanceFailureOccurrence",
+    "MaintenanceFailureRollup",
+    "MaintenanceFailureRollupDrift",
     "MaintenanceIntegrationSource",
     "MaintenanceSensor",
     "MaintenanceSensorException",
     "MaintenanceSensorReading",
+    "MaintenanceSensorRollup",
     "MaintenanceSensorSourceMapping",
+    "failure_occurrence_for",
+    "rollup_failure_occurrences",
+    "rollup_sensor_readings",
+    "sensor_rollup_bucket_start",
+    "sensor_rollup_grain_for",
 ]
@@ -0,0 +1,198 @@
+"""Per-asset, per-failure-mode MTBF/MTTR rollups."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from src.core.modules.maintenance.domain.enums import (
+    MaintenanceWorkOrderStatus,
+    MaintenanceWorkOrderType,
+)
+from src.core.modules.maintenance.domain.work_orders.order import MaintenanceWorkOrder
+
+FAILURE_WORK_ORDER_TYPES = frozenset(
+    {MaintenanceWorkOrderType.CORRECTIVE, MaintenanceWorkOrderType.EMERGENCY}
+)
+
+# A failure counts once its repair is done; reopening takes it back out.
+FAILURE_COMPLETED_STATUSES = frozenset(
+    {
+        MaintenanceWorkOrderStatus.COMPLETED,
+        MaintenanceWorkOrderStatus.VERIFIED,
+        MaintenanceWorkOrderStatus.CLOSED,
+    }
+)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceFailureOccurrence:
+    """One completed corrective repair of ``failure_code`` on an asset."""
+
+    organization_id: str
+    asset_id: str
+    failure_code: str
+    failed_at: datetime
+    repair_seconds: int | None = None
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.asset_id, self.failure_code
+
+
+def failure_occurrence_for(work_order: MaintenanceWorkOrder) -> MaintenanceFailureOccurrence | None:
+    """The failure a work order records, or ``None`` while it is open, when
+    it is not corrective, or when it names no asset or failure code.
+
+    The failure is dated from the repair start and the repair lasts from
+    start to end, falling back to the booked downtime when either is
+    missing, as the reliability dashboard measures MTTR.
+    """
+    if (
+        work_order.work_order_type not in FAILURE_WORK_ORDER_TYPES
+        or work_order.status not in FAILURE_COMPLETED_STATUSES
+        or not work_order.asset_id
+        or not work_order.failure_code
+    ):
+        return None
+    failed_at = work_order.actual_start or work_order.created_at or work_order.actual_end
+    if failed_at is None:
+        return None
+    repair_seconds = None
+    if work_order.actual_start is not None and work_order.actual_end is not None:
+        span = _as_utc(work_order.actual_end) - _as_utc(work_order.actual_start)
+        if span.total_seconds() >= 0:
+            repair_seconds = int(span.total_seconds())
+    if repair_seconds is None and work_order.downtime_minutes:
+        repair_seconds = work_order.downtime_minutes * 60
+    return MaintenanceFailureOccurrence(
+        organization_id=work_order.organization_id,
+        asset_id=work_order.asset_id,
+        failure_code=work_order.failure_code,
+        failed_at=_as_utc(failed_at),
+        repair_seconds=repair_seconds,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceFailureRollup:
+    """Failure count, repair time and uptime of one failure mode on one asset.
+
+    Uptime is the time between the first and the last failure not spent
+    repairing: their span less the repairs of every failure but the last,
+    whose repair runs past the window. ``last_repair_seconds`` is kept so
+    that a failure landing after the last one can extend it in O(1).
+    """
+
+    organization_id: str
+    asset_id: str
+    failure_code: str
+    failure_count: int
+    repair_count: int
+    repair_seconds: int
+    uptime_seconds: int
+    last_repair_seconds: int
+    first_failure_at: datetime
+    last_failure_at: datetime
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.asset_id, self.failure_code
+
+    @property
+    def mtbf_seconds(self) -> float | None:
+        if self.failure_count < 2:
+            return None
+        return max(self.uptime_seconds, 0) / (self.failure_count - 1)
+
+    @property
+    def mttr_seconds(self) -> float | None:
+        if not self.repair_count:
+            return None
+        return self.repair_seconds / self.repair_count
+
+    @classmethod
+    def from_occurrence(cls, occurrence: MaintenanceFailureOccurrence) -> MaintenanceFailureRollup:
+        repair_seconds = occurrence.repair_seconds or 0
+        return cls(
+            organization_id=occurrence.organization_id,
+            asset_id=occurrence.asset_id,
+            failure_code=occurrence.failure_code,
+            failure_count=1,
+            repair_count=0 if occurrence.repair_seconds is None else 1,
+            repair_seconds=repair_seconds,
+            uptime_seconds=0,
+            last_repair_seconds=repair_seconds,
+            first_failure_at=occurrence.failed_at,
+            last_failure_at=occurrence.failed_at,
+        )
+
+    def with_occurrence(self, occurrence: MaintenanceFailureOccurrence) -> MaintenanceFailureRollup:
+        """This rollup with one more failure, wherever it falls in time."""
+        return self.merged(MaintenanceFailureRollup.from_occurrence(occurrence))
+
+    def merged(self, other: MaintenanceFailureRollup) -> MaintenanceFailureRollup:
+        """This rollup combined with ``other`` over distinct failures. Also
+        combines different failure modes into an asset-level figure, in
+        which case the result keeps this rollup's failure code."""
+        # Ties go to the longer repair so the result does not depend on
+        # the order failures were folded in.
+        latest = max(self, other, key=lambda rollup: (rollup.last_failure_at, rollup.last_repair_seconds))
+        first_failure_at = min(self.first_failure_at, other.first_failure_at)
+        repair_seconds = self.repair_seconds + other.repair_seconds
+        span_seconds = int((latest.last_failure_at - first_failure_at).total_seconds())
+        return MaintenanceFailureRollup(
+            organization_id=self.organization_id,
+            asset_id=self.asset_id,
+            failure_code=self.failure_code,
+            failure_count=self.failure_count + other.failure_count,
+            repair_count=self.repair_count + other.repair_count,
+            repair_seconds=repair_seconds,
+            uptime_seconds=span_seconds - (repair_seconds - latest.last_repair_seconds),
+            last_repair_seconds=latest.last_repair_seconds,
+            first_failure_at=first_failure_at,
+            last_failure_at=latest.last_failure_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceFailureRollupDrift:
+    """A stored rollup that disagrees with its work orders. ``expected`` is
+    ``None`` for a stale row and ``stored`` is ``None`` for a missing one."""
+
+    asset_id: str
+    failure_code: str
+    expected: MaintenanceFailureRollup | None
+    stored: MaintenanceFailureRollup | None
+
+
+def rollup_failure_occurrences(
+    occurrences: Iterable[MaintenanceFailureOccurrence],
+) -> list[MaintenanceFailureRollup]:
+    """One rollup per asset and failure code touched by ``occurrences``, in
+    any order: folding is order independent."""
+    rollups: dict[tuple[str, str], MaintenanceFailureRollup] = {}
+    for occurrence in occurrences:
+        existing = rollups.get(occurrence.key)
+        rollups[occurrence.key] = (
+            MaintenanceFailureRollup.from_occurrence(occurrence)
+            if existing is None
+            else existing.with_occurrence(occurrence)
+        )
+    return list(rollups.values())
+
+
+__all__ = [
+    "FAILURE_COMPLETED_STATUSES",
+    "FAILURE_WORK_ORDER_TYPES",
+    "MaintenanceFailureOccurrence",
+    "MaintenanceFailureRollup",
+    "MaintenanceFailureRollupDrift",
+    "failure_occurrence_for",
+    "rollup_failure_occurrences",
+]
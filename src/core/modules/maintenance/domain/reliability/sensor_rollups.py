@@ -0,0 +1,139 @@
+"""Time-bucketed sensor reading rollups."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from src.core.modules.maintenance.domain.enums import (
+    MaintenanceSensorQualityState,
+    MaintenanceSensorRollupGrain,
+)
+from src.core.modules.maintenance.domain.reliability.monitoring import MaintenanceSensorReading
+
+SENSOR_ROLLUP_GRAIN_WIDTHS: dict[MaintenanceSensorRollupGrain, timedelta] = {
+    MaintenanceSensorRollupGrain.MINUTE: timedelta(minutes=1),
+    MaintenanceSensorRollupGrain.HOUR: timedelta(hours=1),
+    MaintenanceSensorRollupGrain.DAY: timedelta(days=1),
+}
+
+# Stale and errored readings are kept raw for review but stay out of trends.
+ROLLUP_QUALITY_STATES = frozenset(
+    {MaintenanceSensorQualityState.VALID, MaintenanceSensorQualityState.ESTIMATED}
+)
+
+
+def sensor_rollup_bucket_start(timestamp: datetime, grain: MaintenanceSensorRollupGrain) -> datetime:
+    """Start of the UTC bucket of ``grain`` holding ``timestamp``."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    else:
+        timestamp = timestamp.astimezone(timezone.utc)
+    if grain == MaintenanceSensorRollupGrain.MINUTE:
+        return timestamp.replace(second=0, microsecond=0)
+    if grain == MaintenanceSensorRollupGrain.HOUR:
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def sensor_rollup_grain_for(resolution: timedelta) -> MaintenanceSensorRollupGrain | None:
+    """The finest grain whose buckets are at least ``resolution`` wide, so a
+    series read from it has no more points than ``resolution`` allows; the
+    widest grain when even that is narrower than ``resolution``. ``None``
+    below a minute, where only the raw readings are that fine."""
+    if resolution < SENSOR_ROLLUP_GRAIN_WIDTHS[MaintenanceSensorRollupGrain.MINUTE]:
+        return None
+    covering = [grain for grain, width in SENSOR_ROLLUP_GRAIN_WIDTHS.items() if width >= resolution]
+    if not covering:
+        return max(SENSOR_ROLLUP_GRAIN_WIDTHS, key=SENSOR_ROLLUP_GRAIN_WIDTHS.__getitem__)
+    return min(covering, key=SENSOR_ROLLUP_GRAIN_WIDTHS.__getitem__)
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceSensorRollup:
+    """Min, max, sum, count and last value of one sensor over one bucket."""
+
+    organization_id: str
+    sensor_id: str
+    grain: MaintenanceSensorRollupGrain
+    bucket_start: datetime
+    reading_count: int
+    min_value: Decimal
+    max_value: Decimal
+    sum_value: Decimal
+    last_value: Decimal
+    last_reading_at: datetime
+
+    @property
+    def avg_value(self) -> Decimal:
+        return self.sum_value / self.reading_count
+
+    @property
+    def key(self) -> tuple[str, MaintenanceSensorRollupGrain, datetime]:
+        return self.sensor_id, self.grain, self.bucket_start
+
+    @classmethod
+    def from_reading(
+        cls,
+        reading: MaintenanceSensorReading,
+        grain: MaintenanceSensorRollupGrain,
+    ) -> MaintenanceSensorRollup:
+        return cls(
+            organization_id=reading.organization_id,
+            sensor_id=reading.sensor_id,
+            grain=grain,
+            bucket_start=sensor_rollup_bucket_start(reading.reading_timestamp, grain),
+            reading_count=1,
+            min_value=reading.reading_value,
+            max_value=reading.reading_value,
+            sum_value=reading.reading_value,
+            last_value=reading.reading_value,
+            last_reading_at=reading.reading_timestamp,
+        )
+
+    def merged(self, other: MaintenanceSensorRollup) -> MaintenanceSensorRollup:
+        """This bucket combined with ``other`` for the same key. On equal
+        timestamps the last value comes from ``other``."""
+        newer = other if other.last_reading_at >= self.last_reading_at else self
+        return MaintenanceSensorRollup(
+            organization_id=self.organization_id,
+            sensor_id=self.sensor_id,
+            grain=self.grain,
+            bucket_start=self.bucket_start,
+            reading_count=self.reading_count + other.reading_count,
+            min_value=min(self.min_value, other.min_value),
+            max_value=max(self.max_value, other.max_value),
+            sum_value=self.sum_value + other.sum_value,
+            last_value=newer.last_value,
+            last_reading_at=newer.last_reading_at,
+        )
+
+
+def rollup_sensor_readings(
+    readings: Iterable[MaintenanceSensorReading],
+    grains: Iterable[MaintenanceSensorRollupGrain] = tuple(MaintenanceSensorRollupGrain),
+) -> list[MaintenanceSensorRollup]:
+    """One rollup per sensor, grain and bucket touched by ``readings``,
+    skipping readings whose quality keeps them out of trends."""
+    grains = tuple(grains)
+    buckets: dict[tuple[str, MaintenanceSensorRollupGrain, datetime], MaintenanceSensorRollup] = {}
+    for reading in readings:
+        if reading.quality_state not in ROLLUP_QUALITY_STATES:
+            continue
+        for grain in grains:
+            rollup = MaintenanceSensorRollup.from_reading(reading, grain)
+            existing = buckets.get(rollup.key)
+            buckets[rollup.key] = rollup if existing is None else existing.merged(rollup)
+    return list(buckets.values())
+
+
+__all__ = [
+    "MaintenanceSensorRollup",
+    "ROLLUP_QUALITY_STATES",
+    "SENSOR_ROLLUP_GRAIN_WIDTHS",
+    "rollup_sensor_readings",
+    "sensor_rollup_bucket_start",
+    "sensor_rollup_grain_for",
+]
@@ -1,3 +1,8 @@
 """Maintenance persistence mappers."""
 
+from src.core.modules.maintenance.infrastructure.persistence.mappers.asset_hierarchy import *  # noqa: F401,F403
+from src.core.modules.maintenance.infrastructure.persistence.mappers.failure_rollup import *  # noqa: F401,F403
 from src.core.modules.maintenance.infrastructure.persistence.mappers.mapper import *  # noqa: F401,F403
+from src.core.modules.maintenance.infrastructure.persistence.mappers.preventive_generation import *  # noqa: F401,F403
+from src.core.modules.maintenance.infrastructure.persistence.mappers.sensor_reading import *  # noqa: F401,F403
+from src.core.modules.maintenance.infrastructure.persistence.mappers.sensor_rollup import *  # noqa: F401,F403
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from sqlalchemy import Row
+
+from src.core.modules.maintenance.domain import MaintenanceAssetClosureEntry
+from src.core.modules.maintenance.infrastructure.persistence.orm.asset_hierarchy_models import (
+    MaintenanceAssetClosureORM,
+)
+
+
+def maintenance_asset_closure_to_row(entry: MaintenanceAssetClosureEntry) -> dict[str, object]:
+    return {
+        "ancestor_id": entry.ancestor_id,
+        "descendant_id": entry.descendant_id,
+        "organization_id": entry.organization_id,
+        "depth": entry.depth,
+    }
+
+
+def maintenance_asset_closure_from_orm(obj: MaintenanceAssetClosureORM | Row) -> MaintenanceAssetClosureEntry:
+    return MaintenanceAssetClosureEntry(
+        organization_id=obj.organization_id,
+        ancestor_id=obj.ancestor_id,
+        descendant_id=obj.descendant_id,
+        depth=int(obj.depth),
+    )
+
+
+__all__ = [
+    "maintenance_asset_closure_from_orm",
+    "maintenance_asset_closure_to_row",
+]
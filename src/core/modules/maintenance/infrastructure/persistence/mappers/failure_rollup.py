@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Row
+
+from src.core.modules.maintenance.domain import MaintenanceFailureRollup
+from src.core.modules.maintenance.infrastructure.persistence.orm.failure_rollup_models import (
+    MaintenanceFailureRollupORM,
+)
+
+
+def maintenance_failure_rollup_to_row(rollup: MaintenanceFailureRollup) -> dict[str, object]:
+    return {
+        "asset_id": rollup.asset_id,
+        "failure_code": rollup.failure_code,
+        "organization_id": rollup.organization_id,
+        "failure_count": rollup.failure_count,
+        "repair_count": rollup.repair_count,
+        "repair_seconds": rollup.repair_seconds,
+        "uptime_seconds": rollup.uptime_seconds,
+        "last_repair_seconds": rollup.last_repair_seconds,
+        "first_failure_at": rollup.first_failure_at,
+        "last_failure_at": rollup.last_failure_at,
+    }
+
+
+def maintenance_failure_rollup_from_orm(obj: MaintenanceFailureRollupORM | Row) -> MaintenanceFailureRollup:
+    return MaintenanceFailureRollup(
+        organization_id=obj.organization_id,
+        asset_id=obj.asset_id,
+        failure_code=obj.failure_code,
+        failure_count=obj.failure_count,
+        repair_count=obj.repair_count,
+        repair_seconds=obj.repair_seconds,
+        uptime_seconds=obj.uptime_seconds,
+        last_repair_seconds=obj.last_repair_seconds,
+        first_failure_at=_as_utc(obj.first_failure_at),
+        last_failure_at=_as_utc(obj.last_failure_at),
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # DateTime columns come back naive on SQLite; failure times are UTC.
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+__all__ = [
+    "maintenance_failure_rollup_from_orm",
+    "maintenance_failure_rollup_to_row",
+]
@@ -14,7 +14,6 @@ from src.core.modules.maintenance.domain import (
     MaintenancePreventivePlanTask,
     MaintenanceSensorException,
     MaintenanceSensor,
-    MaintenanceSensorReading,
     MaintenanceSensorSourceMapping,
     MaintenanceWorkOrderMaterialRequirement,
     MaintenanceSystem,
@@ -36,7 +35,6 @@ from src.core.modules.maintenance.infrastructure.persistence.orm.models import (
     MaintenancePreventivePlanTaskORM,
     MaintenanceSensorExceptionORM,
     MaintenanceSensorORM,
-    MaintenanceSensorReadingORM,
     MaintenanceSensorSourceMappingORM,
     MaintenanceSystemORM,
     MaintenanceTaskStepTemplateORM,
@@ -320,42 +318,6 @@ def maintenance_sensor_from_orm(obj: MaintenanceSensorORM) -> MaintenanceSensor:
     )
 
 
-def maintenance_sensor_reading_to_orm(sensor_reading: MaintenanceSensorReading) -> MaintenanceSensorReadingORM:
-    return MaintenanceSensorReadingORM(
-        id=sensor_reading.id,
-        organization_id=sensor_reading.organization_id,
-        sensor_id=sensor_reading.sensor_id,
-        reading_value=sensor_reading.reading_value,
-        reading_unit=sensor_reading.reading_unit,
-        reading_timestamp=sensor_reading.reading_timestamp,
-        quality_state=sensor_reading.quality_state,
-        source_name=sensor_reading.source_name or None,
-        source_batch_id=sensor_reading.source_batch_id or None,
-        received_at=sensor_reading.received_at,
-        raw_payload_ref=sensor_reading.raw_payload_ref or None,
-        created_at=sensor_reading.created_at,
-        version=getattr(sensor_reading, "version", 1),
-    )
-
-
-def maintenance_sensor_reading_from_orm(obj: MaintenanceSensorReadingORM) -> MaintenanceSensorReading:
-    return MaintenanceSensorReading(
-        id=obj.id,
-        organization_id=obj.organization_id,
-        sensor_id=obj.sensor_id,
-        reading_value=obj.reading_value,
-        reading_unit=obj.reading_unit,
-        reading_timestamp=obj.reading_timestamp,
-        quality_state=obj.quality_state,
-        source_name=obj.source_name or "",
-        source_batch_id=obj.source_batch_id or "",
-        received_at=obj.received_at,
-        raw_payload_ref=obj.raw_payload_ref or "",
-        created_at=obj.created_at,
-        version=getattr(obj, "version", 1),
-    )
-
-
 def maintenance_integration_source_to_orm(
     integration_source: MaintenanceIntegrationSource,
 ) -> MaintenanceIntegrationSourceORM:
@@ -1178,8 +1140,6 @@ __all__ = [
     "maintenance_sensor_exception_from_orm",
     "maintenance_sensor_exception_to_orm",
     "maintenance_sensor_from_orm",
-    "maintenance_sensor_reading_from_orm",
-    "maintenance_sensor_reading_to_orm",
     "maintenance_sensor_source_mapping_from_orm",
     "maintenance_sensor_source_mapping_to_orm",
     "maintenance_sensor_to_orm",
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from sqlalchemy import inspect
+
+from src.core.modules.maintenance.domain import (
+    MaintenancePreventivePlanInstance,
+    MaintenanceWorkOrder,
+    MaintenanceWorkRequest,
+)
+from src.core.modules.maintenance.infrastructure.persistence.mappers.mapper import (
+    maintenance_preventive_plan_instance_to_orm,
+    maintenance_work_order_to_orm,
+    maintenance_work_request_to_orm,
+)
+
+
+def _column_values(orm: object) -> dict[str, object]:
+    # Reuse the ``*_to_orm`` field mapping so bulk rows cannot drift from
+    # what ``add`` writes; only the columns the mapper set are carried over.
+    state = inspect(orm)
+    return {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+
+
+def maintenance_preventive_plan_instance_to_row(
+    preventive_instance: MaintenancePreventivePlanInstance,
+) -> dict[str, object]:
+    return _column_values(maintenance_preventive_plan_instance_to_orm(preventive_instance))
+
+
+def maintenance_work_order_to_row(work_order: MaintenanceWorkOrder) -> dict[str, object]:
+    return _column_values(maintenance_work_order_to_orm(work_order))
+
+
+def maintenance_work_request_to_row(work_request: MaintenanceWorkRequest) -> dict[str, object]:
+    return _column_values(maintenance_work_request_to_orm(work_request))
+
+
+__all__ = [
+    "maintenance_preventive_plan_instance_to_row",
+    "maintenance_work_order_to_row",
+    "maintenance_work_request_to_row",
+]
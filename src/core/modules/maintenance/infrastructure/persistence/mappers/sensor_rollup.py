@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Row
+
+from src.core.modules.maintenance.domain import MaintenanceSensorRollup
+from src.core.modules.maintenance.infrastructure.persistence.orm.sensor_rollup_models import (
+    MaintenanceSensorReadingRollupORM,
+)
+
+
+def maintenance_sensor_rollup_to_row(rollup: MaintenanceSensorRollup) -> dict[str, object]:
+    return {
+        "sensor_id": rollup.sensor_id,
+        "grain": rollup.grain,
+        "bucket_start": rollup.bucket_start,
+        "organization_id": rollup.organization_id,
+        "reading_count": rollup.reading_count,
+        "min_value": rollup.min_value,
+        "max_value": rollup.max_value,
+        "sum_value": rollup.sum_value,
+        "last_value": rollup.last_value,
+        "last_reading_at": rollup.last_reading_at,
+    }
+
+
+def maintenance_sensor_rollup_from_orm(obj: MaintenanceSensorReadingRollupORM | Row) -> MaintenanceSensorRollup:
+    return MaintenanceSensorRollup(
+        organization_id=obj.organization_id,
+        sensor_id=obj.sensor_id,
+        grain=obj.grain,
+        bucket_start=_as_utc(obj.bucket_start),
+        reading_count=obj.reading_count,
+        min_value=obj.min_value,
+        max_value=obj.max_value,
+        sum_value=obj.sum_value,
+        last_value=obj.last_value,
+        last_reading_at=_as_utc(obj.last_reading_at),
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # DateTime columns come back naive on SQLite; rollup keys are UTC.
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+__all__ = [
+    "maintenance_sensor_rollup_from_orm",
+    "maintenance_sensor_rollup_to_row",
+]
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from sqlalchemy import ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infra.persistence.orm.base import Base
+
+
+class MaintenanceAssetClosureORM(Base):
+    __tablename__ = "maintenance_asset_closure"
+    __table_args__ = (
+        Index("ix_maintenance_asset_closure_descendant", "descendant_id", "depth"),
+        Index("ix_maintenance_asset_closure_org", "organization_id"),
+    )
+
+    ancestor_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("maintenance_assets.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    descendant_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("maintenance_assets.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    organization_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+__all__ = ["MaintenanceAssetClosureORM"]
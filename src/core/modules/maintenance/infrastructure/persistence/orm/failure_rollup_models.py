@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infra.persistence.orm.base import Base
+
+
+class MaintenanceFailureRollupORM(Base):
+    __tablename__ = "maintenance_failure_rollups"
+    __table_args__ = (
+        Index("ix_maintenance_failure_rollups_org", "organization_id"),
+    )
+
+    asset_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("maintenance_assets.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    failure_code: Mapped[str] = mapped_column(String(64), primary_key=True)
+    organization_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    failure_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    repair_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    repair_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+    uptime_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+    last_repair_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+    first_failure_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    last_failure_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+__all__ = ["MaintenanceFailureRollupORM"]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import (
+    DateTime,
+    Enum as SAEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.modules.maintenance.domain import MaintenanceSensorRollupGrain
+from src.infra.persistence.orm.base import Base
+
+
+class MaintenanceSensorReadingRollupORM(Base):
+    __tablename__ = "maintenance_sensor_reading_rollups"
+    __table_args__ = (
+        Index("ix_maintenance_sensor_reading_rollups_org", "organization_id"),
+    )
+
+    sensor_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("maintenance_sensors.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    grain: Mapped[MaintenanceSensorRollupGrain] = mapped_column(
+        SAEnum(MaintenanceSensorRollupGrain),
+        primary_key=True,
+    )
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    organization_id: Mapped[str] = mapped_column(
+        String,
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    reading_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    min_value: Mapped[Decimal] = mapped_column(Numeric(18, 6), nullable=False)
+    max_value: Mapped[Decimal] = mapped_column(Numeric(18, 6), nullable=False)
+    sum_value: Mapped[Decimal] = mapped_column(Numeric(24, 6), nullable=False)
+    last_value: Mapped[Decimal] = mapped_column(Numeric(18, 6), nullable=False)
+    last_reading_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+
+__all__ = ["MaintenanceSensorReadingRollupORM"]
@@ -1,5 +1,17 @@
 """Maintenance repository implementations."""
 
+from src.core.modules.maintenance.infrastructure.persistence.repositories.asset_hierarchy_repository import (
+    SqlAlchemyMaintenanceAssetHierarchyRepository,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories.failure_rollup_repository import (
+    SqlAlchemyMaintenanceFailureRollupRepository,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories.planner_repository import (
+    SqlAlchemyMaintenancePlannerRepository,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories.preventive_generation_repository import (
+    SqlAlchemyMaintenancePreventiveGenerationRepository,
+)
 from src.core.modules.maintenance.infrastructure.persistence.repositories.preventive_instance_repository import (
     SqlAlchemyMaintenancePreventivePlanInstanceRepository,
 )
@@ -11,7 +23,6 @@ from src.core.modules.maintenance.infrastructure.persistence.repositories.reposi
     SqlAlchemyMaintenancePreventivePlanRepository,
     SqlAlchemyMaintenancePreventivePlanTaskRepository,
     SqlAlchemyMaintenanceSensorExceptionRepository,
-    SqlAlchemyMaintenanceSensorReadingRepository,
     SqlAlchemyMaintenanceSensorRepository,
     SqlAlchemyMaintenanceSensorSourceMappingRepository,
     SqlAlchemyMaintenanceSystemRepository,
@@ -23,24 +34,39 @@ from src.core.modules.maintenance.infrastructure.persistence.repositories.reposi
     SqlAlchemyMaintenanceWorkOrderTaskStepRepository,
     SqlAlchemyMaintenanceWorkRequestRepository,
 )
+from src.core.modules.maintenance.infrastructure.persistence.repositories.reliability_analytics_repository import (
+    SqlAlchemyMaintenanceReliabilityAnalyticsRepository,
+)
 from src.core.modules.maintenance.infrastructure.persistence.repositories.reliability_repository import (
     SqlAlchemyMaintenanceDowntimeEventRepository,
     SqlAlchemyMaintenanceFailureCodeRepository,
 )
+from src.core.modules.maintenance.infrastructure.persistence.repositories.sensor_reading_repository import (
+    SqlAlchemyMaintenanceSensorReadingRepository,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories.sensor_rollup_repository import (
+    SqlAlchemyMaintenanceSensorRollupRepository,
+)
 
 __all__ = [
     "SqlAlchemyMaintenanceAssetComponentRepository",
+    "SqlAlchemyMaintenanceAssetHierarchyRepository",
     "SqlAlchemyMaintenanceAssetRepository",
     "SqlAlchemyMaintenanceDowntimeEventRepository",
     "SqlAlchemyMaintenanceFailureCodeRepository",
+    "SqlAlchemyMaintenanceFailureRollupRepository",
     "SqlAlchemyMaintenanceIntegrationSourceRepository",
     "SqlAlchemyMaintenanceLocationRepository",
+    "SqlAlchemyMaintenancePlannerRepository",
+    "SqlAlchemyMaintenancePreventiveGenerationRepository",
     "SqlAlchemyMaintenancePreventivePlanInstanceRepository",
     "SqlAlchemyMaintenancePreventivePlanRepository",
     "SqlAlchemyMaintenancePreventivePlanTaskRepository",
+    "SqlAlchemyMaintenanceReliabilityAnalyticsRepository",
     "SqlAlchemyMaintenanceSensorExceptionRepository",
     "SqlAlchemyMaintenanceSensorReadingRepository",
     "SqlAlchemyMaintenanceSensorRepository",
+    "SqlAlchemyMaintenanceSensorRollupRepository",
     "SqlAlchemyMaintenanceSensorSourceMappingRepository",
     "SqlAlchemyMaintenanceSystemRepository",
     "SqlAlchemyMaintenanceTaskStepTemplateRepository",
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import Select, and_, delete, func, insert, literal, select, true
+from sqlalchemy.orm import Session
+
+from src.core.modules.maintenance.domain import (
+    MaintenanceAsset,
+    MaintenanceAssetClosureDrift,
+    MaintenanceAssetClosureEntry,
+    MaintenanceAssetSubtreeSummary,
+    MaintenanceWorkOrderStatus,
+)
+from src.core.modules.maintenance.domain.assets.hierarchy import iter_asset_closure
+from src.core.modules.maintenance.contracts.repositories import MaintenanceAssetHierarchyRepository
+from src.core.modules.maintenance.infrastructure.persistence.mappers import (
+    maintenance_asset_closure_from_orm,
+    maintenance_asset_closure_to_row,
+    maintenance_asset_from_orm,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.asset_hierarchy_models import (
+    MaintenanceAssetClosureORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.models import (
+    MaintenanceAssetORM,
+    MaintenanceDowntimeEventORM,
+    MaintenanceWorkOrderMaterialRequirementORM,
+    MaintenanceWorkOrderORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories._tenant_scope import (
+    MaintenanceTenantScopedRepositorySupport,
+)
+from src.core.platform.application.tenant.tenancy.tenant_context import (
+    TenantContextService,
+    require_tenant_context_service,
+)
+from src.infra.persistence.db.bulk import bulk_insert
+
+_CLOSURE = MaintenanceAssetClosureORM.__table__
+_ASSETS = MaintenanceAssetORM.__table__
+
+
+def compute_asset_closure(
+    session: Session,
+    *,
+    organization_id: str | None = None,
+) -> list[MaintenanceAssetClosureEntry]:
+    """Closure rows derived afresh from the assets' parent links. Not
+    tenant scoped: callers check scope."""
+    stmt = select(_ASSETS.c.id, _ASSETS.c.organization_id, _ASSETS.c.parent_asset_id)
+    if organization_id is not None:
+        stmt = stmt.where(_ASSETS.c.organization_id == organization_id)
+    parents = {
+        asset_id: (asset_organization_id, parent_id)
+        for asset_id, asset_organization_id, parent_id in session.execute(stmt.execution_options(yield_per=5000))
+    }
+    return list(iter_asset_closure(parents))
+
+
+def rebuild_asset_closure(session: Session, *, organization_id: str | None = None) -> int:
+    """Replace the stored closure of one or every organization with one
+    derived from parent links; returns how many rows were written."""
+    entries = compute_asset_closure(session, organization_id=organization_id)
+    stmt = delete(_CLOSURE)
+    if organization_id is not None:
+        stmt = stmt.where(_CLOSURE.c.organization_id == organization_id)
+    session.execute(stmt)
+    return bulk_insert(
+        session,
+        MaintenanceAssetClosureORM,
+        [maintenance_asset_closure_to_row(entry) for entry in entries],
+    )
+
+
+def find_asset_closure_drift(
+    session: Session,
+    *,
+    organization_id: str | None = None,
+) -> list[MaintenanceAssetClosureDrift]:
+    """Stored closure rows that are missing, stale or at the wrong depth."""
+    expected = {entry.key: entry.depth for entry in compute_asset_closure(session, organization_id=organization_id)}
+    stmt = select(*_CLOSURE.c)
+    if organization_id is not None:
+        stmt = stmt.where(_CLOSURE.c.organization_id == organization_id)
+    stored = {
+        entry.key: entry.depth
+        for entry in (maintenance_asset_closure_from_orm(row) for row in session.execute(stmt))
+    }
+    return [
+        MaintenanceAssetClosureDrift(
+            ancestor_id=ancestor_id,
+            descendant_id=descendant_id,
+            expected_depth=expected.get((ancestor_id, descendant_id)),
+            stored_depth=stored.get((ancestor_id, descendant_id)),
+        )
+        for ancestor_id, descendant_id in sorted(expected.keys() | stored.keys())
+        if expected.get((ancestor_id, descendant_id)) != stored.get((ancestor_id, descendant_id))
+    ]
+
+
+def join_asset_subtree(stmt: Select, asset_id_column, ancestor_id: str) -> Select:
+    """Narrow ``stmt`` to rows whose ``asset_id_column`` is ``ancestor_id``
+    or an asset below it: one join on the closure primary key, so each row
+    matches at most once."""
+    return stmt.join(
+        _CLOSURE,
+        and_(_CLOSURE.c.descendant_id == asset_id_column, _CLOSURE.c.ancestor_id == ancestor_id),
+    )
+
+
+def _subtree_ids(asset_id: str):
+    return select(_CLOSURE.c.descendant_id).where(_CLOSURE.c.ancestor_id == asset_id)
+
+
+class SqlAlchemyMaintenanceAssetHierarchyRepository(
+    MaintenanceAssetHierarchyRepository, MaintenanceTenantScopedRepositorySupport
+):
+    _repository_label = "Maintenance asset hierarchy repository"
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        tenant_context_service: TenantContextService | None = None,
+    ) -> None:
+        self.session = session
+        self._tenant_context_service = require_tenant_context_service(
+            tenant_context_service,
+            consumer_label=type(self).__name__,
+        )
+
+    def add_asset(self, asset: MaintenanceAsset) -> None:
+        # The asset row is usually still pending in the session.
+        self.session.flush()
+        self._require_assets_in_scope({asset.id}, operation_label="add maintenance asset to hierarchy")
+        c = _CLOSURE.c
+        self.session.execute(
+            insert(_CLOSURE).values(
+                ancestor_id=asset.id,
+                descendant_id=asset.id,
+                organization_id=asset.organization_id,
+                depth=0,
+            )
+        )
+        if asset.parent_asset_id:
+            self.session.execute(
+                insert(_CLOSURE).from_select(
+                    ["ancestor_id", "descendant_id", "organization_id", "depth"],
+                    select(c.ancestor_id, literal(asset.id), c.organization_id, c.depth + 1).where(
+                        c.descendant_id == asset.parent_asset_id
+                    ),
+                )
+            )
+
+    def move_asset(self, asset_id: str, parent_asset_id: str | None) -> None:
+        self._require_assets_in_scope(
+            {asset_id, parent_asset_id} - {None},
+            operation_label="move maintenance asset in hierarchy",
+        )
+        c = _CLOSURE.c
+        # Detach: drop every link from outside the subtree into it.
+        self.session.execute(
+            delete(_CLOSURE).where(
+                c.descendant_id.in_(_subtree_ids(asset_id)),
+                c.ancestor_id.not_in(_subtree_ids(asset_id)),
+            )
+        )
+        if not parent_asset_id:
+            return
+        # Attach: every ancestor of the new parent gains every subtree node.
+        above = _CLOSURE.alias("above")
+        below = _CLOSURE.alias("below")
+        self.session.execute(
+            insert(_CLOSURE).from_select(
+                ["ancestor_id", "descendant_id", "organization_id", "depth"],
+                select(
+                    above.c.ancestor_id,
+                    below.c.descendant_id,
+                    below.c.organization_id,
+                    above.c.depth + below.c.depth + 1,
+                )
+                .select_from(above.join(below, true()))
+                .where(
+                    above.c.descendant_id == parent_asset_id,
+                    below.c.ancestor_id == asset_id,
+                ),
+            )
+        )
+
+    def is_descendant(self, ancestor_id: str, descendant_id: str) -> bool:
+        c = _CLOSURE.c
+        row = self.session.execute(
+            select(c.depth).where(c.ancestor_id == ancestor_id, c.descendant_id == descendant_id).limit(1)
+        ).first()
+        return row is not None
+
+    def list_ancestor_ids(self, asset_id: str) -> list[str]:
+        self._require_assets_in_scope({asset_id}, operation_label="list maintenance asset ancestors")
+        c = _CLOSURE.c
+        rows = self.session.execute(
+            select(c.ancestor_id).where(c.descendant_id == asset_id, c.depth > 0).order_by(c.depth.asc())
+        ).scalars()
+        return list(rows)
+
+    def list_subtree(
+        self,
+        asset_id: str,
+        *,
+        include_self: bool = True,
+        max_depth: int | None = None,
+        active_only: bool | None = None,
+    ) -> list[MaintenanceAsset]:
+        ctx = self._context(operation_label="list maintenance asset subtree")
+        c = _CLOSURE.c
+        stmt = select(MaintenanceAssetORM).join(
+            MaintenanceAssetClosureORM,
+            MaintenanceAssetClosureORM.descendant_id == MaintenanceAssetORM.id,
+        ).where(c.ancestor_id == asset_id)
+        stmt = self._apply_scope(stmt, MaintenanceAssetORM, ctx)
+        if not include_self:
+            stmt = stmt.where(c.depth > 0)
+        if max_depth is not None:
+            stmt = stmt.where(c.depth <= max_depth)
+        if active_only is not None:
+            stmt = stmt.where(MaintenanceAssetORM.is_active == bool(active_only))
+        rows = self.session.execute(
+            stmt.order_by(c.depth.asc(), MaintenanceAssetORM.name.asc(), MaintenanceAssetORM.asset_code.asc())
+        ).scalars().all()
+        return [maintenance_asset_from_orm(row) for row in rows]
+
+    def summarize_subtree(
+        self,
+        asset_id: str,
+        *,
+        terminal_statuses: Collection[MaintenanceWorkOrderStatus],
+    ) -> MaintenanceAssetSubtreeSummary:
+        self._require_assets_in_scope({asset_id}, operation_label="summarize maintenance asset subtree")
+        c = _CLOSURE.c
+        subtree = _subtree_ids(asset_id)
+        asset_count, max_depth = self.session.execute(
+            select(func.count(), func.max(c.depth)).where(c.ancestor_id == asset_id)
+        ).one()
+        wo = MaintenanceWorkOrderORM
+        work_order_count, open_count = self.session.execute(
+            select(
+                func.count(),
+                func.count().filter(wo.status.not_in(sorted(terminal_statuses, key=lambda status: status.value))),
+            ).where(wo.asset_id.in_(subtree))
+        ).one()
+        event = MaintenanceDowntimeEventORM
+        downtime_minutes = self.session.execute(
+            select(func.sum(func.coalesce(event.duration_minutes, 0))).where(event.asset_id.in_(subtree))
+        ).scalar()
+        requirement = MaintenanceWorkOrderMaterialRequirementORM
+        material_count = self.session.execute(
+            select(func.count()).where(
+                requirement.work_order_id.in_(select(wo.id).where(wo.asset_id.in_(subtree)))
+            )
+        ).scalar()
+        return MaintenanceAssetSubtreeSummary(
+            asset_id=asset_id,
+            asset_count=int(asset_count or 0),
+            max_depth=int(max_depth or 0),
+            work_order_count=int(work_order_count or 0),
+            open_work_order_count=int(open_count or 0),
+            downtime_minutes=int(downtime_minutes or 0),
+            material_requirement_count=int(material_count or 0),
+        )
+
+    def rebuild(self, organization_id: str) -> int:
+        ctx = self._context(operation_label="rebuild maintenance asset hierarchy")
+        if not self._organization_in_scope(ctx, organization_id):
+            return 0
+        return rebuild_asset_closure(self.session, organization_id=organization_id)
+
+    def list_drift(self, organization_id: str) -> list[MaintenanceAssetClosureDrift]:
+        ctx = self._context(operation_label="check maintenance asset hierarchy")
+        if not self._organization_in_scope(ctx, organization_id):
+            return []
+        return find_asset_closure_drift(self.session, organization_id=organization_id)
+
+    def _require_assets_in_scope(self, asset_ids: Collection[str], *, operation_label: str) -> None:
+        self._require_all_in_scope(
+            MaintenanceAssetORM,
+            set(asset_ids),
+            operation_label=operation_label,
+            not_found_message="Maintenance asset not found.",
+        )
+
+
+__all__ = [
+    "SqlAlchemyMaintenanceAssetHierarchyRepository",
+    "compute_asset_closure",
+    "find_asset_closure_drift",
+    "join_asset_subtree",
+    "rebuild_asset_closure",
+]
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from src.core.modules.maintenance.domain import (
+    MaintenanceFailureOccurrence,
+    MaintenanceFailureRollup,
+    MaintenanceFailureRollupDrift,
+)
+from src.core.modules.maintenance.domain.reliability.failure_rollups import (
+    FAILURE_COMPLETED_STATUSES,
+    FAILURE_WORK_ORDER_TYPES,
+    failure_occurrence_for,
+    rollup_failure_occurrences,
+)
+from src.core.modules.maintenance.contracts.repositories import MaintenanceFailureRollupRepository
+from src.core.modules.maintenance.infrastructure.persistence.mappers import (
+    maintenance_failure_rollup_from_orm,
+    maintenance_failure_rollup_to_row,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.failure_rollup_models import (
+    MaintenanceFailureRollupORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.models import (
+    MaintenanceAssetORM,
+    MaintenanceWorkOrderORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories._tenant_scope import (
+    MaintenanceParentScopedRepositorySupport,
+)
+from src.core.platform.application.tenant.tenancy.tenant_context import (
+    TenantContextService,
+    require_tenant_context_service,
+)
+from src.infra.persistence.db.bulk import bulk_insert
+
+_ROLLUPS = MaintenanceFailureRollupORM.__table__
+_WORK_ORDERS = MaintenanceWorkOrderORM.__table__
+
+
+def _failure_work_orders(organization_id: str | None):
+    # The columns ``failure_occurrence_for`` reads, for completed corrective
+    # work orders that name an asset and a failure code.
+    c = _WORK_ORDERS.c
+    stmt = select(
+        c.organization_id,
+        c.asset_id,
+        c.failure_code,
+        c.work_order_type,
+        c.status,
+        c.actual_start,
+        c.actual_end,
+        c.created_at,
+        c.downtime_minutes,
+    ).where(
+        c.work_order_type.in_(sorted(FAILURE_WORK_ORDER_TYPES)),
+        c.status.in_(sorted(FAILURE_COMPLETED_STATUSES)),
+        c.asset_id.is_not(None),
+        c.failure_code != "",
+    )
+    if organization_id is not None:
+        stmt = stmt.where(c.organization_id == organization_id)
+    return stmt
+
+
+def compute_failure_rollups(
+    session: Session,
+    *,
+    organization_id: str | None = None,
+    keys: Collection[tuple[str, str]] | None = None,
+) -> list[MaintenanceFailureRollup]:
+    """Rollups folded afresh from work orders, for every asset and failure
+    code or only for ``keys``. Not tenant scoped: callers check scope."""
+    stmt = _failure_work_orders(organization_id)
+    if keys is not None:
+        if not keys:
+            return []
+        wanted = set(keys)
+        stmt = stmt.where(
+            _WORK_ORDERS.c.asset_id.in_(sorted({asset_id for asset_id, _ in wanted})),
+            _WORK_ORDERS.c.failure_code.in_(sorted({failure_code for _, failure_code in wanted})),
+        )
+    rows = session.execute(stmt.execution_options(yield_per=2000))
+    # Rows carry the work-order attributes ``failure_occurrence_for`` reads.
+    occurrences = (failure_occurrence_for(row) for row in rows)
+    return rollup_failure_occurrences(
+        occurrence
+        for occurrence in occurrences
+        if occurrence is not None and (keys is None or occurrence.key in wanted)
+    )
+
+
+def rebuild_failure_rollups(session: Session, *, organization_id: str | None = None) -> int:
+    """Replace the stored rollups of one or every organization with ones
+    folded from work orders; returns how many were written."""
+    rollups = compute_failure_rollups(session, organization_id=organization_id)
+    stmt = delete(_ROLLUPS)
+    if organization_id is not None:
+        stmt = stmt.where(_ROLLUPS.c.organization_id == organization_id)
+    session.execute(stmt)
+    bulk_insert(
+        session,
+        MaintenanceFailureRollupORM,
+        [maintenance_failure_rollup_to_row(rollup) for rollup in rollups],
+    )
+    return len(rollups)
+
+
+def find_failure_rollup_drift(
+    session: Session,
+    *,
+    organization_id: str | None = None,
+) -> list[MaintenanceFailureRollupDrift]:
+    """Stored rollups that are missing, stale or differ from a fresh fold."""
+    expected = {rollup.key: rollup for rollup in compute_failure_rollups(session, organization_id=organization_id)}
+    stmt = select(*_ROLLUPS.c)
+    if organization_id is not None:
+        stmt = stmt.where(_ROLLUPS.c.organization_id == organization_id)
+    stored = {
+        rollup.key: rollup
+        for rollup in (maintenance_failure_rollup_from_orm(row) for row in session.execute(stmt))
+    }
+    return [
+        MaintenanceFailureRollupDrift(
+            asset_id=asset_id,
+            failure_code=failure_code,
+            expected=expected.get((asset_id, failure_code)),
+            stored=stored.get((asset_id, failure_code)),
+        )
+        for asset_id, failure_code in sorted(expected.keys() | stored.keys())
+        if expected.get((asset_id, failure_code)) != stored.get((asset_id, failure_code))
+    ]
+
+
+class SqlAlchemyMaintenanceFailureRollupRepository(
+    MaintenanceFailureRollupRepository, MaintenanceParentScopedRepositorySupport
+):
+    _repository_label = "Maintenance failure rollup repository"
+    _scope_joins = (
+        (MaintenanceAssetORM, MaintenanceFailureRollupORM.asset_id == MaintenanceAssetORM.id),
+    )
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        tenant_context_service: TenantContextService | None = None,
+    ):
+        self.session = session
+        self._tenant_context_service = require_tenant_context_service(
+            tenant_context_service,
+            consumer_label=type(self).__name__,
+        )
+
+    def record_failure(self, occurrence: MaintenanceFailureOccurrence) -> None:
+        """Fold one failure into its stored rollup, locking the row so that
+        concurrent completions on the same asset and mode serialize."""
+        self._require_all_in_scope(
+            MaintenanceAssetORM,
+            {occurrence.asset_id},
+            operation_label="record maintenance failure rollup",
+            not_found_message="Maintenance asset not found.",
+        )
+        c = _ROLLUPS.c
+        key_clause = (c.asset_id == occurrence.asset_id, c.failure_code == occurrence.failure_code)
+        row = self.session.execute(select(*_ROLLUPS.c).where(*key_clause).with_for_update()).first()
+        if row is None:
+            rollup = MaintenanceFailureRollup.from_occurrence(occurrence)
+            self.session.execute(insert(_ROLLUPS).values(**maintenance_failure_rollup_to_row(rollup)))
+            return
+        rollup = maintenance_failure_rollup_from_orm(row).with_occurrence(occurrence)
+        self.session.execute(
+            update(_ROLLUPS).where(*key_clause).values(**maintenance_failure_rollup_to_row(rollup))
+        )
+
+    def refresh(self, organization_id: str, keys: Collection[tuple[str, str]]) -> None:
+        """Refold the given asset and failure-code pairs from their work
+        orders; used where a failure leaves a rollup and cannot be
+        subtracted in place."""
+        ctx = self._context(operation_label="refresh maintenance failure rollups")
+        if not keys or not self._organization_in_scope(ctx, organization_id):
+            return
+        self._require_all_in_scope(
+            MaintenanceAssetORM,
+            {asset_id for asset_id, _ in keys},
+            operation_label="refresh maintenance failure rollups",
+            not_found_message="Maintenance asset not found.",
+        )
+        rollups = compute_failure_rollups(self.session, organization_id=organization_id, keys=keys)
+        c = _ROLLUPS.c
+        for asset_id, failure_code in set(keys):
+            self.session.execute(delete(_ROLLUPS).where(c.asset_id == asset_id, c.failure_code == failure_code))
+        bulk_insert(
+            self.session,
+            MaintenanceFailureRollupORM,
+            [maintenance_failure_rollup_to_row(rollup) for rollup in rollups],
+        )
+
+    def rebuild(self, organization_id: str) -> int:
+        ctx = self._context(operation_label="rebuild maintenance failure rollups")
+        if not self._organization_in_scope(ctx, organization_id):
+            return 0
+        return rebuild_failure_rollups(self.session, organization_id=organization_id)
+
+    def list_drift(self, organization_id: str) -> list[MaintenanceFailureRollupDrift]:
+        ctx = self._context(operation_label="check maintenance failure rollups")
+        if not self._organization_in_scope(ctx, organization_id):
+            return []
+        return find_failure_rollup_drift(self.session, organization_id=organization_id)
+
+    def list_for_organization(
+        self,
+        organization_id: str,
+        *,
+        site_id: str | None = None,
+        asset_id: str | None = None,
+        asset_category: str | None = None,
+        failure_code: str | None = None,
+    ) -> list[MaintenanceFailureRollup]:
+        ctx = self._context(operation_label="list maintenance failure rollups")
+        if not self._organization_in_scope(ctx, organization_id):
+            return []
+        stmt = self._scoped_stmt_for_anchor(
+            MaintenanceFailureRollupORM,
+            MaintenanceAssetORM,
+            joins=self._scope_joins,
+            operation_label="list maintenance failure rollups",
+        ).where(MaintenanceFailureRollupORM.organization_id == organization_id)
+        if site_id is not None:
+            stmt = stmt.where(MaintenanceAssetORM.site_id == site_id)
+        if asset_id is not None:
+            stmt = stmt.where(MaintenanceFailureRollupORM.asset_id == asset_id)
+        if asset_category is not None:
+            stmt = stmt.where(MaintenanceAssetORM.asset_category == asset_category)
+        if failure_code is not None:
+            stmt = stmt.where(MaintenanceFailureRollupORM.failure_code == failure_code)
+        rows = self.session.execute(
+            stmt.with_only_columns(*_ROLLUPS.c).order_by(
+                MaintenanceFailureRollupORM.asset_id,
+                MaintenanceFailureRollupORM.failure_code,
+            )
+        ).all()
+        return [maintenance_failure_rollup_from_orm(row) for row in rows]
+
+
+__all__ = [
+    "SqlAlchemyMaintenanceFailureRollupRepository",
+    "compute_failure_rollups",
+    "find_failure_rollup_drift",
+    "rebuild_failure_rollups",
+]
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.orm import Session
+
+from src.core.modules.maintenance.domain import (
+    MaintenanceWorkOrder,
+    MaintenanceWorkOrderMaterialRequirement,
+    MaintenanceWorkRequest,
+)
+from src.core.modules.maintenance.contracts.repositories import (
+    MaintenancePlannerLaneCursor,
+    MaintenancePlannerLaneFilter,
+    MaintenancePlannerRepository,
+)
+from src.core.modules.maintenance.infrastructure.persistence.mappers import (
+    maintenance_work_order_from_orm,
+    maintenance_work_order_material_requirement_from_orm,
+    maintenance_work_request_from_orm,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.models import (
+    MaintenanceAssetComponentORM,
+    MaintenanceWorkOrderMaterialRequirementORM,
+    MaintenanceWorkOrderORM,
+    MaintenanceWorkRequestORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories._tenant_scope import (
+    MaintenanceTenantScopedRepositorySupport,
+)
+from src.core.platform.application.tenant.tenancy.tenant_context import (
+    TenantContextService,
+    require_tenant_context_service,
+)
+
+_WR = MaintenanceWorkRequestORM
+_WO = MaintenanceWorkOrderORM
+_REQ = MaintenanceWorkOrderMaterialRequirementORM
+
+# The columns the planner search box matches, per lane.
+_WORK_REQUEST_SEARCH_COLUMNS = (
+    _WR.work_request_code,
+    _WR.title,
+    _WR.description,
+    _WR.failure_symptom_code,
+    _WR.request_type,
+)
+_WORK_ORDER_SEARCH_COLUMNS = (
+    _WO.work_order_code,
+    _WO.title,
+    _WO.description,
+    _WO.failure_code,
+    _WO.root_cause_code,
+)
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    # Timestamps are stored as naive UTC; compare the cursor the same way.
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _scope_anchor_id(model):
+    return case(
+        (model.asset_id != "", model.asset_id),
+        (MaintenanceAssetComponentORM.asset_id != "", MaintenanceAssetComponentORM.asset_id),
+        (model.system_id != "", model.system_id),
+        (model.location_id != "", model.location_id),
+        else_="",
+    )
+
+
+def _search_clause(columns, search_text: str):
+    needle = search_text.strip().lower()
+    return or_(*(func.lower(func.coalesce(column, "")).contains(needle, autoescape=True) for column in columns))
+
+
+def _after_clause(model, after: MaintenancePlannerLaneCursor, *, newest_first: bool):
+    created_at = _as_naive_utc(after.created_at)
+    if newest_first:
+        return or_(
+            model.created_at < created_at,
+            and_(model.created_at == created_at, model.id < after.record_id),
+        )
+    return or_(
+        model.created_at > created_at,
+        and_(model.created_at == created_at, model.id > after.record_id),
+    )
+
+
+def _lane_order(model, *, newest_first: bool):
+    if newest_first:
+        return model.created_at.desc(), model.id.desc()
+    return model.created_at.asc(), model.id.asc()
+
+
+class SqlAlchemyMaintenancePlannerRepository(
+    MaintenancePlannerRepository, MaintenanceTenantScopedRepositorySupport
+):
+    _repository_label = "Maintenance planner repository"
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        tenant_context_service: TenantContextService | None = None,
+    ) -> None:
+        self.session = session
+        self._tenant_context_service = require_tenant_context_service(
+            tenant_context_service,
+            consumer_label=type(self).__name__,
+        )
+
+    def list_work_requests(
+        self,
+        filters: MaintenancePlannerLaneFilter,
+        *,
+        limit: int,
+        after: MaintenancePlannerLaneCursor | None = None,
+    ) -> list[MaintenanceWorkRequest]:
+        stmt = self._lane(
+            _WR,
+            (_WR,),
+            filters,
+            search_columns=_WORK_REQUEST_SEARCH_COLUMNS,
+            operation_label="list maintenance planner work requests",
+        )
+        if stmt is None:
+            return []
+        if after is not None:
+            stmt = stmt.where(_after_clause(_WR, after, newest_first=True))
+        rows = self.session.execute(stmt.order_by(*_lane_order(_WR, newest_first=True)).limit(limit)).scalars().all()
+        return [maintenance_work_request_from_orm(row) for row in rows]
+
+    def count_work_requests_by_status(self, filters: MaintenancePlannerLaneFilter) -> dict[str, int]:
+        stmt = self._lane(
+            _WR,
+            (_WR.status, func.count()),
+            filters,
+            search_columns=_WORK_REQUEST_SEARCH_COLUMNS,
+            with_statuses=False,
+            operation_label="count maintenance planner work requests",
+        )
+        if stmt is None:
+            return {}
+        return {status.value: int(count) for status, count in self.session.execute(stmt.group_by(_WR.status))}
+
+    def list_work_orders(
+        self,
+        filters: MaintenancePlannerLaneFilter,
+        *,
+        limit: int,
+        after: MaintenancePlannerLaneCursor | None = None,
+    ) -> list[MaintenanceWorkOrder]:
+        stmt = self._lane(
+            _WO,
+            (_WO,),
+            filters,
+            search_columns=_WORK_ORDER_SEARCH_COLUMNS,
+            operation_label="list maintenance planner work orders",
+        )
+        if stmt is None:
+            return []
+        if after is not None:
+            stmt = stmt.where(_after_clause(_WO, after, newest_first=True))
+        rows = self.session.execute(stmt.order_by(*_lane_order(_WO, newest_first=True)).limit(limit)).scalars().all()
+        return [maintenance_work_order_from_orm(row) for row in rows]
+
+    def count_work_orders_by_status(self, filters: MaintenancePlannerLaneFilter) -> dict[str, int]:
+        stmt = self._lane(
+            _WO,
+            (_WO.status, func.count()),
+            filters,
+            search_columns=_WORK_ORDER_SEARCH_COLUMNS,
+            with_statuses=False,
+            operation_label="count maintenance planner work orders",
+        )
+        if stmt is None:
+            return {}
+        return {status.value: int(count) for status, count in self.session.execute(stmt.group_by(_WO.status))}
+
+    def list_material_risks(
+        self,
+        filters: MaintenancePlannerLaneFilter,
+        *,
+        procurement_statuses: Collection[str],
+        limit: int,
+        after: MaintenancePlannerLaneCursor | None = None,
+    ) -> list[MaintenanceWorkOrderMaterialRequirement]:
+        stmt = self._material_risks((_REQ,), filters, procurement_statuses=procurement_statuses)
+        if stmt is None:
+            return []
+        if after is not None:
+            stmt = stmt.where(_after_clause(_REQ, after, newest_first=False))
+        rows = self.session.execute(stmt.order_by(*_lane_order(_REQ, newest_first=False)).limit(limit)).scalars().all()
+        return [maintenance_work_order_material_requirement_from_orm(row) for row in rows]
+
+    def count_material_risks_by_status(
+        self,
+        filters: MaintenancePlannerLaneFilter,
+        *,
+        procurement_statuses: Collection[str],
+    ) -> dict[str, int]:
+        stmt = self._material_risks(
+            (_REQ.procurement_status, func.count()),
+            filters,
+            procurement_statuses=procurement_statuses,
+        )
+        if stmt is None:
+            return {}
+        return {
+            status.value: int(count)
+            for status, count in self.session.execute(stmt.group_by(_REQ.procurement_status))
+        }
+
+    def _material_risks(
+        self,
+        columns: tuple,
+        filters: MaintenancePlannerLaneFilter,
+        *,
+        procurement_statuses: Collection[str],
+    ):
+        if not procurement_statuses:
+            return None
+        work_order_ids = self._lane(
+            _WO,
+            (_WO.id,),
+            filters,
+            search_columns=_WORK_ORDER_SEARCH_COLUMNS,
+            operation_label="list maintenance planner material risks",
+        )
+        if work_order_ids is None:
+            return None
+        return select(*columns).select_from(_REQ).where(
+            _REQ.organization_id == filters.organization_id,
+            _REQ.procurement_status.in_(sorted(procurement_statuses)),
+            _REQ.work_order_id.in_(work_order_ids.scalar_subquery()),
+        )
+
+    def _lane(
+        self,
+        model,
+        columns: tuple,
+        filters: MaintenancePlannerLaneFilter,
+        *,
+        search_columns: tuple,
+        operation_label: str,
+        with_statuses: bool = True,
+    ):
+        """``columns`` over the ``model`` rows matching ``filters``, or
+        ``None`` when nothing can match."""
+        ctx = self._context(operation_label=operation_label)
+        if not self._organization_in_scope(ctx, filters.organization_id):
+            return None
+        if with_statuses and filters.statuses is not None and not filters.statuses:
+            return None
+        stmt = select(*columns).select_from(model).where(model.organization_id == filters.organization_id)
+        stmt = self._apply_scope(stmt, model, ctx)
+        if filters.site_id is not None:
+            stmt = stmt.where(model.site_id == filters.site_id)
+        if filters.asset_id is not None:
+            stmt = stmt.where(model.asset_id == filters.asset_id)
+        if filters.system_id is not None:
+            stmt = stmt.where(model.system_id == filters.system_id)
+        if with_statuses and filters.statuses is not None:
+            stmt = stmt.where(model.status.in_(sorted(filters.statuses)))
+        if filters.search_text.strip():
+            stmt = stmt.where(_search_clause(search_columns, filters.search_text))
+        if filters.scope_anchor_ids is not None:
+            stmt = stmt.outerjoin(
+                MaintenanceAssetComponentORM,
+                MaintenanceAssetComponentORM.id == model.component_id,
+            ).where(_scope_anchor_id(model).in_(sorted(filters.scope_anchor_ids)))
+        return stmt
+
+
+__all__ = ["SqlAlchemyMaintenancePlannerRepository"]
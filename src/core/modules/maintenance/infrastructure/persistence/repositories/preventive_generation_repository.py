@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from src.core.modules.maintenance.domain import (
+    MaintenancePreventiveInstanceStatus,
+    MaintenancePreventivePlan,
+    MaintenancePreventivePlanInstance,
+    MaintenancePreventivePlanTask,
+    MaintenanceWorkOrder,
+    MaintenanceWorkRequest,
+)
+from src.core.modules.maintenance.contracts.repositories import MaintenancePreventiveGenerationRepository
+from src.core.modules.maintenance.infrastructure.persistence.mappers import (
+    maintenance_preventive_plan_instance_to_row,
+    maintenance_work_order_to_row,
+    maintenance_work_request_to_row,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.models import (
+    MaintenancePreventivePlanORM,
+    MaintenancePreventivePlanTaskORM,
+    MaintenanceWorkOrderORM,
+    MaintenanceWorkRequestORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.preventive_runtime_models import (
+    MaintenancePreventivePlanInstanceORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories._tenant_scope import (
+    MaintenanceTenantScopedRepositorySupport,
+)
+from src.core.platform.application.tenant.tenancy.tenant_context import (
+    TenantContextService,
+    require_tenant_context_service,
+)
+from src.infra.persistence.db.bulk import BulkRowUpdate, bulk_insert, bulk_update, chunked
+
+_PLAN = MaintenancePreventivePlanORM
+_INSTANCE = MaintenancePreventivePlanInstanceORM
+
+
+class SqlAlchemyMaintenancePreventiveGenerationRepository(
+    MaintenancePreventiveGenerationRepository, MaintenanceTenantScopedRepositorySupport
+):
+    _repository_label = "Maintenance preventive generation repository"
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        tenant_context_service: TenantContextService | None = None,
+    ) -> None:
+        self.session = session
+        self._tenant_context_service = require_tenant_context_service(
+            tenant_context_service,
+            consumer_label=type(self).__name__,
+        )
+
+    def add_instances(self, instances: Sequence[MaintenancePreventivePlanInstance]) -> None:
+        if not instances:
+            return
+        self._require_plans_in_scope(
+            {instance.plan_id for instance in instances},
+            operation_label="add maintenance preventive plan instances",
+        )
+        bulk_insert(
+            self.session,
+            _INSTANCE,
+            [maintenance_preventive_plan_instance_to_row(instance) for instance in instances],
+        )
+
+    def delete_instances(self, instance_ids: Collection[str]) -> None:
+        if not instance_ids:
+            return
+        scoped_plan_ids = self._scoped_plan_ids(operation_label="delete maintenance preventive plan instances")
+        # Only still-planned rows go; one generated meanwhile is kept.
+        for chunk in chunked(sorted(instance_ids)):
+            self.session.execute(
+                delete(_INSTANCE).where(
+                    _INSTANCE.id.in_(chunk),
+                    _INSTANCE.plan_id.in_(scoped_plan_ids),
+                    _INSTANCE.status == MaintenancePreventiveInstanceStatus.PLANNED,
+                )
+            )
+
+    def update_instance_generation(
+        self,
+        instances: Sequence[MaintenancePreventivePlanInstance],
+    ) -> None:
+        if not instances:
+            return
+        versions = bulk_update(
+            self.session,
+            _INSTANCE,
+            [
+                BulkRowUpdate(
+                    row_id=instance.id,
+                    values={
+                        "status": instance.status,
+                        "generated_at": instance.generated_at,
+                        "generated_work_request_id": instance.generated_work_request_id,
+                        "generated_work_order_id": instance.generated_work_order_id,
+                        "updated_at": instance.updated_at,
+                    },
+                    expected_version=getattr(instance, "version", 1),
+                    match={"plan_id": instance.plan_id},
+                )
+                for instance in instances
+            ],
+            scope_filters={
+                "plan_id": self._scoped_plan_ids(
+                    operation_label="update maintenance preventive plan instances"
+                )
+            },
+            not_found_message="Maintenance preventive plan instance not found.",
+            stale_message="Maintenance preventive plan instance was updated by another user.",
+        )
+        for instance, version in zip(instances, versions):
+            instance.version = version
+
+    def add_work_orders(self, work_orders: Sequence[MaintenanceWorkOrder]) -> None:
+        if not work_orders:
+            return
+        ctx = self._context(operation_label="add maintenance work orders")
+        rows = [maintenance_work_order_to_row(work_order) for work_order in work_orders]
+        for row in rows:
+            self._stamp_scope_values(ctx, MaintenanceWorkOrderORM, row)
+        bulk_insert(self.session, MaintenanceWorkOrderORM, rows)
+
+    def add_work_requests(self, work_requests: Sequence[MaintenanceWorkRequest]) -> None:
+        if not work_requests:
+            return
+        ctx = self._context(operation_label="add maintenance work requests")
+        rows = [maintenance_work_request_to_row(work_request) for work_request in work_requests]
+        for row in rows:
+            self._stamp_scope_values(ctx, MaintenanceWorkRequestORM, row)
+        bulk_insert(self.session, MaintenanceWorkRequestORM, rows)
+
+    def update_plan_schedules(self, plans: Sequence[MaintenancePreventivePlan]) -> None:
+        if not plans:
+            return
+        versions = bulk_update(
+            self.session,
+            _PLAN,
+            [
+                BulkRowUpdate(
+                    row_id=plan.id,
+                    values={
+                        "last_generated_at": plan.last_generated_at,
+                        "next_due_at": plan.next_due_at,
+                        "next_due_counter": plan.next_due_counter,
+                        "updated_at": plan.updated_at,
+                    },
+                    expected_version=getattr(plan, "version", 1),
+                )
+                for plan in plans
+            ],
+            scope_filters={
+                "id": self._scoped_plan_ids(operation_label="update maintenance preventive plans")
+            },
+            not_found_message="Maintenance preventive plan not found.",
+            stale_message="Maintenance preventive plan was updated by another user.",
+        )
+        for plan, version in zip(plans, versions):
+            plan.version = version
+
+    def update_plan_task_schedules(
+        self,
+        plan_tasks: Sequence[MaintenancePreventivePlanTask],
+    ) -> None:
+        if not plan_tasks:
+            return
+        versions = bulk_update(
+            self.session,
+            MaintenancePreventivePlanTaskORM,
+            [
+                BulkRowUpdate(
+                    row_id=plan_task.id,
+                    values={
+                        "last_generated_at": plan_task.last_generated_at,
+                        "next_due_at": plan_task.next_due_at,
+                        "next_due_counter": plan_task.next_due_counter,
+                        "updated_at": plan_task.updated_at,
+                    },
+                    expected_version=getattr(plan_task, "version", 1),
+                    match={"plan_id": plan_task.plan_id},
+                )
+                for plan_task in plan_tasks
+            ],
+            scope_filters={
+                "plan_id": self._scoped_plan_ids(operation_label="update maintenance preventive plan tasks")
+            },
+            not_found_message="Maintenance preventive plan task not found.",
+            stale_message="Maintenance preventive plan task was updated by another user.",
+        )
+        for plan_task, version in zip(plan_tasks, versions):
+            plan_task.version = version
+
+    def _scoped_plan_ids(self, *, operation_label: str):
+        ctx = self._context(operation_label=operation_label)
+        return self._apply_scope(select(_PLAN.id), _PLAN, ctx)
+
+    def _require_plans_in_scope(self, plan_ids: set[str], *, operation_label: str) -> None:
+        self._require_all_in_scope(
+            _PLAN,
+            plan_ids,
+            operation_label=operation_label,
+            not_found_message="Maintenance preventive plan not found.",
+        )
+
+
+__all__ = ["SqlAlchemyMaintenancePreventiveGenerationRepository"]
@@ -0,0 +1,438 @@
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime, timezone
+
+from sqlalchemy import Integer, and_, case, cast, func, or_, select
+from sqlalchemy.orm import Session
+
+from src.core.modules.maintenance.domain import MaintenanceWorkOrderStatus
+from src.core.modules.maintenance.contracts.repositories import (
+    MaintenanceDowntimeTypeFact,
+    MaintenanceFailureSpanFact,
+    MaintenanceRecurringFailureFact,
+    MaintenanceReliabilityAnalyticsRepository,
+    MaintenanceRepairSummaryFact,
+    MaintenanceRootCauseFact,
+    MaintenanceWorkOrderAnalyticsFilter,
+    MaintenanceWorkOrderBacklogFact,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.models import (
+    MaintenanceAssetComponentORM,
+    MaintenanceAssetORM,
+    MaintenanceDowntimeEventORM,
+    MaintenanceWorkOrderORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories._tenant_scope import (
+    MaintenanceTenantScopedRepositorySupport,
+)
+from src.core.platform.application.tenant.tenancy.tenant_context import (
+    TenantContextService,
+    require_tenant_context_service,
+)
+
+_WO = MaintenanceWorkOrderORM
+
+# The timestamp a work order is reported under: when it was closed, else
+# the furthest point it reached.
+_ACTIVITY_AT = func.coalesce(
+    _WO.closed_at,
+    _WO.actual_end,
+    _WO.actual_start,
+    _WO.planned_start,
+    _WO.created_at,
+)
+_PATTERN_ANCHOR_TYPE = case(
+    (_WO.asset_id != "", "asset"),
+    (_WO.system_id != "", "system"),
+    (_WO.location_id != "", "location"),
+    else_="",
+)
+_PATTERN_ANCHOR_ID = case(
+    (_WO.asset_id != "", _WO.asset_id),
+    (_WO.system_id != "", _WO.system_id),
+    (_WO.location_id != "", _WO.location_id),
+    else_="",
+)
+_SCOPE_ANCHOR_ID = case(
+    (_WO.asset_id != "", _WO.asset_id),
+    (MaintenanceAssetComponentORM.asset_id != "", MaintenanceAssetComponentORM.asset_id),
+    (_WO.system_id != "", _WO.system_id),
+    (_WO.location_id != "", _WO.location_id),
+    else_="",
+)
+_DOWNTIME_MINUTES = func.coalesce(_WO.downtime_minutes, 0)
+_DOWNTIME_SECONDS = case((_DOWNTIME_MINUTES != 0, _WO.downtime_minutes * 60))
+_HAS_REPAIR_SPAN = and_(
+    _WO.actual_start.is_not(None),
+    _WO.actual_end.is_not(None),
+    _WO.actual_end >= _WO.actual_start,
+)
+
+
+def _seconds_between(dialect_name: str, start, end):
+    # Whole seconds on SQLite, where julianday() arithmetic would add
+    # floating-point noise that shows up in the two-decimal averages.
+    if dialect_name == "sqlite":
+        return cast(func.strftime("%s", end), Integer) - cast(func.strftime("%s", start), Integer)
+    return func.extract("epoch", end - start)
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _count_where(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+class SqlAlchemyMaintenanceReliabilityAnalyticsRepository(
+    MaintenanceReliabilityAnalyticsRepository, MaintenanceTenantScopedRepositorySupport
+):
+    _repository_label = "Maintenance reliability analytics repository"
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        tenant_context_service: TenantContextService | None = None,
+    ) -> None:
+        self.session = session
+        self._tenant_context_service = require_tenant_context_service(
+            tenant_context_service,
+            consumer_label=type(self).__name__,
+        )
+
+    def list_backlog(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        statuses: Collection[MaintenanceWorkOrderStatus],
+        overdue_before: datetime,
+    ) -> list[MaintenanceWorkOrderBacklogFact]:
+        stmt = self._work_orders(
+            (
+                _WO.status,
+                _WO.priority,
+                func.count(),
+                _count_where(_WO.planned_end < overdue_before),
+            ),
+            filters,
+            operation_label="summarize maintenance work order backlog",
+        )
+        if stmt is None or not statuses:
+            return []
+        rows = self.session.execute(
+            stmt.where(_WO.status.in_(tuple(statuses))).group_by(_WO.status, _WO.priority)
+        ).all()
+        return [
+            MaintenanceWorkOrderBacklogFact(
+                status=status,
+                priority=priority,
+                work_order_count=int(count),
+                overdue_count=int(overdue or 0),
+            )
+            for status, priority, count, overdue in rows
+        ]
+
+    def summarize_repairs(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        terminal_statuses: Collection[MaintenanceWorkOrderStatus],
+    ) -> MaintenanceRepairSummaryFact:
+        # Per work order: the actual repair span when it is recorded, else
+        # the logged downtime.
+        repair_seconds = case(
+            (_HAS_REPAIR_SPAN, self._repair_span_seconds()),
+            else_=_DOWNTIME_SECONDS,
+        )
+        stmt = self._work_orders(
+            (
+                _count_where(_WO.status.in_(tuple(terminal_statuses))),
+                func.count(repair_seconds),
+                func.sum(repair_seconds),
+            ),
+            filters,
+            operation_label="summarize maintenance repairs",
+        )
+        if stmt is None:
+            return MaintenanceRepairSummaryFact(terminal_count=0, repair_count=0, repair_seconds=0.0)
+        terminal_count, repair_count, total_seconds = self.session.execute(stmt).one()
+        return MaintenanceRepairSummaryFact(
+            terminal_count=int(terminal_count or 0),
+            repair_count=int(repair_count or 0),
+            repair_seconds=float(total_seconds or 0),
+        )
+
+    def list_failure_spans(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+    ) -> list[MaintenanceFailureSpanFact]:
+        anchor_type = _PATTERN_ANCHOR_TYPE.label("anchor_type")
+        anchor_id = _PATTERN_ANCHOR_ID.label("anchor_id")
+        stmt = self._work_orders(
+            (
+                anchor_type,
+                anchor_id,
+                func.count(),
+                func.min(_ACTIVITY_AT),
+                func.max(_ACTIVITY_AT),
+            ),
+            filters,
+            operation_label="summarize maintenance failure intervals",
+        )
+        if stmt is None:
+            return []
+        rows = self.session.execute(
+            stmt.where(_WO.failure_code != "", _PATTERN_ANCHOR_ID != "").group_by(anchor_type, anchor_id)
+        ).all()
+        return [
+            MaintenanceFailureSpanFact(
+                anchor_type=row_anchor_type,
+                anchor_id=row_anchor_id,
+                occurrence_count=int(count),
+                first_occurrence_at=_as_utc(first_at),
+                last_occurrence_at=_as_utc(last_at),
+            )
+            for row_anchor_type, row_anchor_id, count, first_at, last_at in rows
+        ]
+
+    def list_root_causes(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        terminal_statuses: Collection[MaintenanceWorkOrderStatus],
+        failure_code: str | None = None,
+        limit: int,
+    ) -> list[MaintenanceRootCauseFact]:
+        work_order_count = func.count().label("work_order_count")
+        total_downtime = func.sum(_DOWNTIME_MINUTES).label("total_downtime")
+        stmt = self._work_orders(
+            (
+                _WO.failure_code,
+                _WO.root_cause_code,
+                work_order_count,
+                total_downtime,
+                func.max(_ACTIVITY_AT),
+                _count_where(_WO.status.not_in(tuple(terminal_statuses))),
+            ),
+            filters,
+            operation_label="summarize maintenance root causes",
+        )
+        if stmt is None:
+            return []
+        stmt = stmt.where(_WO.root_cause_code != "")
+        if failure_code is not None:
+            stmt = stmt.where(_WO.failure_code == failure_code)
+        rows = self.session.execute(
+            stmt.group_by(_WO.failure_code, _WO.root_cause_code)
+            .order_by(
+                work_order_count.desc(),
+                total_downtime.desc(),
+                _WO.root_cause_code,
+                _WO.failure_code,
+            )
+            .limit(limit)
+        ).all()
+        return [
+            MaintenanceRootCauseFact(
+                failure_code=row_failure_code or "",
+                root_cause_code=root_cause_code,
+                work_order_count=int(count),
+                total_downtime_minutes=int(downtime or 0),
+                latest_occurrence_at=_as_utc(latest_at),
+                open_work_orders=int(open_count or 0),
+            )
+            for row_failure_code, root_cause_code, count, downtime, latest_at, open_count in rows
+        ]
+
+    def list_recurring_failures(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        terminal_statuses: Collection[MaintenanceWorkOrderStatus],
+        min_occurrences: int,
+    ) -> list[MaintenanceRecurringFailureFact]:
+        """Failure groups per anchor, failure code and root cause with at
+        least ``min_occurrences`` work orders. Cancelled work orders are not
+        failures and never count."""
+        # A group's repair time comes from its repair spans, or from its
+        # logged downtime when none of its work orders recorded a span.
+        span_seconds = case((_HAS_REPAIR_SPAN, self._repair_span_seconds()))
+        has_spans = func.count(span_seconds) > 0
+        repair_count = case((has_spans, func.count(span_seconds)), else_=func.count(_DOWNTIME_SECONDS))
+        repair_seconds = case((has_spans, func.sum(span_seconds)), else_=func.sum(_DOWNTIME_SECONDS))
+        anchor_type = _PATTERN_ANCHOR_TYPE.label("anchor_type")
+        anchor_id = _PATTERN_ANCHOR_ID.label("anchor_id")
+        stmt = self._work_orders(
+            (
+                anchor_type,
+                anchor_id,
+                _WO.failure_code,
+                _WO.root_cause_code,
+                func.count(),
+                _count_where(_WO.status.not_in(tuple(terminal_statuses))),
+                func.sum(_DOWNTIME_MINUTES),
+                repair_count,
+                repair_seconds,
+                func.min(_ACTIVITY_AT),
+                func.max(_ACTIVITY_AT),
+            ),
+            filters,
+            operation_label="summarize maintenance recurring failures",
+        )
+        if stmt is None:
+            return []
+        rows = self.session.execute(
+            stmt.where(
+                _WO.failure_code != "",
+                _WO.status != MaintenanceWorkOrderStatus.CANCELLED,
+                _PATTERN_ANCHOR_ID != "",
+            )
+            .group_by(
+                anchor_type,
+                anchor_id,
+                _WO.failure_code,
+                _WO.root_cause_code,
+            )
+            .having(func.count() >= min_occurrences)
+        ).all()
+        return [
+            MaintenanceRecurringFailureFact(
+                anchor_type=row_anchor_type,
+                anchor_id=row_anchor_id,
+                failure_code=row_failure_code,
+                root_cause_code=root_cause_code or "",
+                occurrence_count=int(count),
+                open_work_orders=int(open_count or 0),
+                total_downtime_minutes=int(downtime or 0),
+                repair_count=int(group_repair_count or 0),
+                repair_seconds=float(group_repair_seconds or 0),
+                first_occurrence_at=_as_utc(first_at),
+                last_occurrence_at=_as_utc(last_at),
+            )
+            for (
+                row_anchor_type,
+                row_anchor_id,
+                row_failure_code,
+                root_cause_code,
+                count,
+                open_count,
+                downtime,
+                group_repair_count,
+                group_repair_seconds,
+                first_at,
+                last_at,
+            ) in rows
+        ]
+
+    def list_downtime_by_type(
+        self,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        started_from: datetime | None = None,
+        started_to: datetime | None = None,
+    ) -> list[MaintenanceDowntimeTypeFact]:
+        """Downtime events per type. Once any work order matches ``filters``,
+        only events tied to one of them, to one of their assets or to one of
+        their systems count; site, location and asset category filters that
+        match no work order match no downtime either."""
+        work_orders = self._work_orders(
+            (_WO.id, _WO.asset_id, _WO.system_id),
+            filters,
+            operation_label="summarize maintenance downtime",
+        )
+        if work_orders is None:
+            return []
+        work_orders = work_orders.subquery()
+        has_work_orders = self.session.execute(select(work_orders.c.id).limit(1)).first() is not None
+        if not has_work_orders and any(
+            value is not None for value in (filters.site_id, filters.location_id, filters.asset_category)
+        ):
+            return []
+        event = MaintenanceDowntimeEventORM
+        stmt = select(
+            event.downtime_type,
+            func.count(),
+            _count_where(event.ended_at.is_(None)),
+            func.sum(func.coalesce(event.duration_minutes, 0)),
+        ).where(event.organization_id == filters.organization_id)
+        if filters.asset_id is not None:
+            stmt = stmt.where(event.asset_id == filters.asset_id)
+        if filters.system_id is not None:
+            stmt = stmt.where(event.system_id == filters.system_id)
+        if started_from is not None:
+            stmt = stmt.where(event.started_at >= started_from)
+        if started_to is not None:
+            stmt = stmt.where(event.started_at <= started_to)
+        if has_work_orders:
+            stmt = stmt.where(
+                or_(
+                    event.work_order_id.in_(select(work_orders.c.id)),
+                    event.asset_id.in_(select(work_orders.c.asset_id).where(work_orders.c.asset_id != "")),
+                    event.system_id.in_(select(work_orders.c.system_id).where(work_orders.c.system_id != "")),
+                )
+            )
+        rows = self.session.execute(stmt.group_by(event.downtime_type)).all()
+        return [
+            MaintenanceDowntimeTypeFact(
+                downtime_type=downtime_type or "",
+                event_count=int(count),
+                open_event_count=int(open_count or 0),
+                total_minutes=int(minutes or 0),
+            )
+            for downtime_type, count, open_count, minutes in rows
+        ]
+
+    def _work_orders(
+        self,
+        columns: tuple,
+        filters: MaintenanceWorkOrderAnalyticsFilter,
+        *,
+        operation_label: str,
+    ):
+        """``columns`` over the work orders matching ``filters``, or ``None``
+        when the organization is outside the active scope."""
+        ctx = self._context(operation_label=operation_label)
+        if not self._organization_in_scope(ctx, filters.organization_id):
+            return None
+        stmt = select(*columns).select_from(_WO).where(_WO.organization_id == filters.organization_id)
+        stmt = self._apply_scope(stmt, _WO, ctx)
+        if filters.site_id is not None:
+            stmt = stmt.where(_WO.site_id == filters.site_id)
+        if filters.asset_id is not None:
+            stmt = stmt.where(_WO.asset_id == filters.asset_id)
+        if filters.system_id is not None:
+            stmt = stmt.where(_WO.system_id == filters.system_id)
+        if filters.location_id is not None:
+            stmt = stmt.where(_WO.location_id == filters.location_id)
+        if filters.asset_category is not None:
+            stmt = stmt.where(
+                _WO.asset_id.in_(
+                    select(MaintenanceAssetORM.id).where(
+                        MaintenanceAssetORM.organization_id == filters.organization_id,
+                        MaintenanceAssetORM.asset_category == filters.asset_category,
+                    )
+                )
+            )
+        if filters.scope_anchor_ids is not None:
+            stmt = stmt.outerjoin(
+                MaintenanceAssetComponentORM,
+                MaintenanceAssetComponentORM.id == _WO.component_id,
+            ).where(_SCOPE_ANCHOR_ID.in_(sorted(filters.scope_anchor_ids)))
+        if filters.activity_from is not None:
+            stmt = stmt.where(_ACTIVITY_AT >= filters.activity_from)
+        if filters.activity_to is not None:
+            stmt = stmt.where(_ACTIVITY_AT <= filters.activity_to)
+        return stmt
+
+    def _repair_span_seconds(self):
+        return _seconds_between(self.session.get_bind().dialect.name, _WO.actual_start, _WO.actual_end)
+
+
+__all__ = ["SqlAlchemyMaintenanceReliabilityAnalyticsRepository"]
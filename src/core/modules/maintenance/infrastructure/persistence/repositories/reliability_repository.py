@@ -25,6 +25,9 @@ from src.core.modules.maintenance.infrastructure.persistence.repositories._tenan
     MaintenanceParentScopedRepositorySupport,
     MaintenanceTenantScopedRepositorySupport,
 )
+from src.core.modules.maintenance.infrastructure.persistence.repositories.asset_hierarchy_repository import (
+    join_asset_subtree,
+)
 from src.core.platform.common.exceptions import NotFoundError
 from src.core.platform.application.tenant.tenancy.tenant_context import (
     TenantContextService,
@@ -276,6 +279,7 @@ class SqlAlchemyMaintenanceDowntimeEventRepository(
         *,
         work_order_id: str | None = None,
         asset_id: str | None = None,
+        under_asset_id: str | None = None,
         system_id: str | None = None,
         downtime_type: str | None = None,
         reason_code: str | None = None,
@@ -293,6 +297,8 @@ class SqlAlchemyMaintenanceDowntimeEventRepository(
             stmt = stmt.where(MaintenanceDowntimeEventORM.work_order_id == work_order_id)
         if asset_id is not None:
             stmt = stmt.where(MaintenanceDowntimeEventORM.asset_id == asset_id)
+        if under_asset_id is not None:
+            stmt = join_asset_subtree(stmt, MaintenanceDowntimeEventORM.asset_id, under_asset_id)
         if system_id is not None:
             stmt = stmt.where(MaintenanceDowntimeEventORM.system_id == system_id)
         if downtime_type is not None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Collection
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -14,7 +15,6 @@ from src.core.modules.maintenance.domain import (
     MaintenancePreventivePlanTask,
     MaintenanceSensorException,
     MaintenanceSensor,
-    MaintenanceSensorReading,
     MaintenanceSensorSourceMapping,
     MaintenanceWorkOrderMaterialRequirement,
     MaintenanceSystem,
@@ -33,7 +33,6 @@ from src.core.modules.maintenance.contracts.repositories import (
     MaintenancePreventivePlanRepository,
     MaintenancePreventivePlanTaskRepository,
     MaintenanceSensorExceptionRepository,
-    MaintenanceSensorReadingRepository,
     MaintenanceSensorRepository,
     MaintenanceSensorSourceMappingRepository,
     MaintenanceSystemRepository,
@@ -61,8 +60,6 @@ from src.core.modules.maintenance.infrastructure.persistence.mappers import (
     maintenance_sensor_exception_from_orm,
     maintenance_sensor_exception_to_orm,
     maintenance_sensor_from_orm,
-    maintenance_sensor_reading_from_orm,
-    maintenance_sensor_reading_to_orm,
     maintenance_sensor_source_mapping_from_orm,
     maintenance_sensor_source_mapping_to_orm,
     maintenance_sensor_to_orm,
@@ -92,7 +89,6 @@ from src.core.modules.maintenance.infrastructure.persistence.orm.models import (
     MaintenancePreventivePlanTaskORM,
     MaintenanceSensorExceptionORM,
     MaintenanceSensorORM,
-    MaintenanceSensorReadingORM,
     MaintenanceSensorSourceMappingORM,
     MaintenanceSystemORM,
     MaintenanceTaskStepTemplateORM,
@@ -107,6 +103,12 @@ from src.core.modules.maintenance.infrastructure.persistence.repositories._tenan
     MaintenanceParentScopedRepositorySupport,
     MaintenanceTenantScopedRepositorySupport,
 )
+from src.core.modules.maintenance.infrastructure.persistence.repositories.asset_hierarchy_repository import (
+    join_asset_subtree,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories.sensor_reading_repository import (
+    SqlAlchemyMaintenanceSensorReadingRepository,
+)
 from src.core.platform.common.exceptions import NotFoundError
 from src.core.platform.application.tenant.tenancy.tenant_context import (
     TenantContextService,
@@ -729,80 +731,6 @@ class SqlAlchemyMaintenanceSensorRepository(
         return [maintenance_sensor_from_orm(row) for row in rows]
 
 
-class SqlAlchemyMaintenanceSensorReadingRepository(
-    MaintenanceSensorReadingRepository, MaintenanceParentScopedRepositorySupport
-):
-    _repository_label = "Maintenance sensor reading repository"
-    _scope_joins = (
-        (MaintenanceSensorORM, MaintenanceSensorReadingORM.sensor_id == MaintenanceSensorORM.id),
-    )
-
-    def __init__(
-        self,
-        session: Session,
-        *,
-        tenant_context_service: TenantContextService | None = None,
-    ):
-        self.session = session
-        self._tenant_context_service = require_tenant_context_service(
-            tenant_context_service,
-            consumer_label=type(self).__name__,
-        )
-
-    def add(self, sensor_reading: MaintenanceSensorReading) -> None:
-        self._require_in_scope(
-            MaintenanceSensorORM,
-            sensor_reading.sensor_id,
-            operation_label="add maintenance sensor reading",
-            not_found_message="Maintenance sensor not found.",
-        )
-        self.session.add(maintenance_sensor_reading_to_orm(sensor_reading))
-
-    def get(self, sensor_reading_id: str) -> MaintenanceSensorReading | None:
-        obj = self._get_via_anchor_in_scope(
-            MaintenanceSensorReadingORM,
-            MaintenanceSensorORM,
-            joins=self._scope_joins,
-            record_id=sensor_reading_id,
-            operation_label="get maintenance sensor reading",
-        )
-        return maintenance_sensor_reading_from_orm(obj) if obj else None
-
-    def list_for_organization(
-        self,
-        organization_id: str,
-        *,
-        sensor_id: str | None = None,
-        quality_state: str | None = None,
-        source_batch_id: str | None = None,
-        reading_from=None,
-        reading_to=None,
-    ) -> list[MaintenanceSensorReading]:
-        ctx = self._context(operation_label="list maintenance sensor readings")
-        if not self._organization_in_scope(ctx, organization_id):
-            return []
-        stmt = self._scoped_stmt_for_anchor(
-            MaintenanceSensorReadingORM,
-            MaintenanceSensorORM,
-            joins=self._scope_joins,
-            operation_label="list maintenance sensor readings",
-        ).where(MaintenanceSensorReadingORM.organization_id == organization_id)
-        if sensor_id is not None:
-            stmt = stmt.where(MaintenanceSensorReadingORM.sensor_id == sensor_id)
-        if quality_state is not None:
-            stmt = stmt.where(MaintenanceSensorReadingORM.quality_state == quality_state)
-        if source_batch_id is not None:
-            stmt = stmt.where(MaintenanceSensorReadingORM.source_batch_id == source_batch_id)
-        if reading_from is not None:
-            stmt = stmt.where(MaintenanceSensorReadingORM.reading_timestamp >= reading_from)
-        if reading_to is not None:
-            stmt = stmt.where(MaintenanceSensorReadingORM.reading_timestamp <= reading_to)
-        rows = self.session.execute(
-            stmt.order_by(MaintenanceSensorReadingORM.reading_timestamp.desc())
-        ).scalars().all()
-        return [maintenance_sensor_reading_from_orm(row) for row in rows]
-
-
 class SqlAlchemyMaintenanceIntegrationSourceRepository(
     MaintenanceIntegrationSourceRepository, MaintenanceTenantScopedRepositorySupport
 ):
@@ -1313,6 +1241,21 @@ class SqlAlchemyMaintenanceWorkRequestRepository(
         obj = self.session.execute(stmt).scalars().first()
         return maintenance_work_request_from_orm(obj) if obj else None
 
+    def list_by_codes(
+        self,
+        organization_id: str,
+        work_request_codes: Collection[str],
+    ) -> list[MaintenanceWorkRequest]:
+        ctx = self._context(operation_label="list maintenance work requests by code")
+        if not work_request_codes or not self._organization_in_scope(ctx, organization_id):
+            return []
+        stmt = select(MaintenanceWorkRequestORM).where(
+            MaintenanceWorkRequestORM.organization_id == organization_id,
+            MaintenanceWorkRequestORM.work_request_code.in_(set(work_request_codes)),
+        )
+        stmt = self._apply_scope(stmt, MaintenanceWorkRequestORM, ctx)
+        return [maintenance_work_request_from_orm(row) for row in self.session.execute(stmt).scalars()]
+
     def list_for_organization(
         self,
         organization_id: str,
@@ -1459,12 +1402,43 @@ class SqlAlchemyMaintenanceWorkOrderRepository(
         obj = self.session.execute(stmt).scalars().first()
         return maintenance_work_order_from_orm(obj) if obj else None
 
+    def list_by_ids(
+        self,
+        organization_id: str,
+        work_order_ids: Collection[str],
+    ) -> list[MaintenanceWorkOrder]:
+        ctx = self._context(operation_label="list maintenance work orders by id")
+        if not work_order_ids or not self._organization_in_scope(ctx, organization_id):
+            return []
+        stmt = select(MaintenanceWorkOrderORM).where(
+            MaintenanceWorkOrderORM.organization_id == organization_id,
+            MaintenanceWorkOrderORM.id.in_(set(work_order_ids)),
+        )
+        stmt = self._apply_scope(stmt, MaintenanceWorkOrderORM, ctx)
+        return [maintenance_work_order_from_orm(row) for row in self.session.execute(stmt).scalars()]
+
+    def list_by_codes(
+        self,
+        organization_id: str,
+        work_order_codes: Collection[str],
+    ) -> list[MaintenanceWorkOrder]:
+        ctx = self._context(operation_label="list maintenance work orders by code")
+        if not work_order_codes or not self._organization_in_scope(ctx, organization_id):
+            return []
+        stmt = select(MaintenanceWorkOrderORM).where(
+            MaintenanceWorkOrderORM.organization_id == organization_id,
+            MaintenanceWorkOrderORM.work_order_code.in_(set(work_order_codes)),
+        )
+        stmt = self._apply_scope(stmt, MaintenanceWorkOrderORM, ctx)
+        return [maintenance_work_order_from_orm(row) for row in self.session.execute(stmt).scalars()]
+
     def list_for_organization(
         self,
         organization_id: str,
         *,
         site_id: str | None = None,
         asset_id: str | None = None,
+        under_asset_id: str | None = None,
         component_id: str | None = None,
         system_id: str | None = None,
         location_id: str | None = None,
@@ -1487,6 +1461,8 @@ class SqlAlchemyMaintenanceWorkOrderRepository(
             stmt = stmt.where(MaintenanceWorkOrderORM.site_id == site_id)
         if asset_id is not None:
             stmt = stmt.where(MaintenanceWorkOrderORM.asset_id == asset_id)
+        if under_asset_id is not None:
+            stmt = join_asset_subtree(stmt, MaintenanceWorkOrderORM.asset_id, under_asset_id)
         if component_id is not None:
             stmt = stmt.where(MaintenanceWorkOrderORM.component_id == component_id)
         if system_id is not None:
@@ -2215,6 +2191,7 @@ class SqlAlchemyMaintenancePreventivePlanRepository(
         plan_type: str | None = None,
         trigger_mode: str | None = None,
         sensor_id: str | None = None,
+        sensor_ids: Collection[str] | None = None,
     ) -> list[MaintenancePreventivePlan]:
         ctx = self._context(operation_label="list maintenance preventive plans")
         if not self._organization_in_scope(ctx, organization_id):
@@ -2241,6 +2218,8 @@ class SqlAlchemyMaintenancePreventivePlanRepository(
             stmt = stmt.where(MaintenancePreventivePlanORM.trigger_mode == trigger_mode)
         if sensor_id is not None:
             stmt = stmt.where(MaintenancePreventivePlanORM.sensor_id == sensor_id)
+        if sensor_ids is not None:
+            stmt = stmt.where(MaintenancePreventivePlanORM.sensor_id.in_(list(sensor_ids)))
         rows = self.session.execute(
             stmt.order_by(MaintenancePreventivePlanORM.name.asc(), MaintenancePreventivePlanORM.plan_code.asc())
         ).scalars().all()
@@ -2364,6 +2343,7 @@ class SqlAlchemyMaintenancePreventivePlanTaskRepository(
         *,
         plan_id: str | None = None,
         task_template_id: str | None = None,
+        sensor_ids: Collection[str] | None = None,
     ) -> list[MaintenancePreventivePlanTask]:
         ctx = self._context(operation_label="list maintenance preventive plan tasks")
         if not self._organization_in_scope(ctx, organization_id):
@@ -2378,6 +2358,8 @@ class SqlAlchemyMaintenancePreventivePlanTaskRepository(
             stmt = stmt.where(MaintenancePreventivePlanTaskORM.plan_id == plan_id)
         if task_template_id is not None:
             stmt = stmt.where(MaintenancePreventivePlanTaskORM.task_template_id == task_template_id)
+        if sensor_ids is not None:
+            stmt = stmt.where(MaintenancePreventivePlanTaskORM.sensor_id_override.in_(list(sensor_ids)))
         rows = self.session.execute(
             stmt.order_by(
                 MaintenancePreventivePlanTaskORM.sequence_no.asc(),
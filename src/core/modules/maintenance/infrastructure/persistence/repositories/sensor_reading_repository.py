@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+from src.core.modules.maintenance.domain import MaintenanceSensorReading
+from src.core.modules.maintenance.contracts.repositories import MaintenanceSensorReadingRepository
+from src.core.modules.maintenance.infrastructure.persistence.mappers import (
+    maintenance_sensor_reading_from_orm,
+    maintenance_sensor_reading_to_orm,
+    maintenance_sensor_reading_to_row,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.models import (
+    MaintenanceSensorORM,
+    MaintenanceSensorReadingORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories._tenant_scope import (
+    MaintenanceParentScopedRepositorySupport,
+)
+from src.core.platform.application.tenant.tenancy.tenant_context import (
+    TenantContextService,
+    require_tenant_context_service,
+)
+from src.infra.persistence.db.bulk import bulk_insert
+
+
+class SqlAlchemyMaintenanceSensorReadingRepository(
+    MaintenanceSensorReadingRepository, MaintenanceParentScopedRepositorySupport
+):
+    _repository_label = "Maintenance sensor reading repository"
+    _scope_joins = (
+        (MaintenanceSensorORM, MaintenanceSensorReadingORM.sensor_id == MaintenanceSensorORM.id),
+    )
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        tenant_context_service: TenantContextService | None = None,
+    ):
+        self.session = session
+        self._tenant_context_service = require_tenant_context_service(
+            tenant_context_service,
+            consumer_label=type(self).__name__,
+        )
+
+    def add(self, sensor_reading: MaintenanceSensorReading) -> None:
+        self._require_in_scope(
+            MaintenanceSensorORM,
+            sensor_reading.sensor_id,
+            operation_label="add maintenance sensor reading",
+            not_found_message="Maintenance sensor not found.",
+        )
+        self.session.add(maintenance_sensor_reading_to_orm(sensor_reading))
+
+    def add_many(self, sensor_readings: list[MaintenanceSensorReading]) -> None:
+        if not sensor_readings:
+            return
+        self._require_all_in_scope(
+            MaintenanceSensorORM,
+            {reading.sensor_id for reading in sensor_readings},
+            operation_label="add maintenance sensor readings",
+            not_found_message="Maintenance sensor not found.",
+        )
+        bulk_insert(
+            self.session,
+            MaintenanceSensorReadingORM,
+            [maintenance_sensor_reading_to_row(reading) for reading in sensor_readings],
+        )
+
+    def get(self, sensor_reading_id: str) -> MaintenanceSensorReading | None:
+        obj = self._get_via_anchor_in_scope(
+            MaintenanceSensorReadingORM,
+            MaintenanceSensorORM,
+            joins=self._scope_joins,
+            record_id=sensor_reading_id,
+            operation_label="get maintenance sensor reading",
+        )
+        return maintenance_sensor_reading_from_orm(obj) if obj else None
+
+    def list_for_organization(
+        self,
+        organization_id: str,
+        *,
+        sensor_id: str | None = None,
+        quality_state: str | None = None,
+        source_batch_id: str | None = None,
+        reading_from=None,
+        reading_to=None,
+    ) -> list[MaintenanceSensorReading]:
+        ctx = self._context(operation_label="list maintenance sensor readings")
+        if not self._organization_in_scope(ctx, organization_id):
+            return []
+        stmt = self._scoped_stmt_for_anchor(
+            MaintenanceSensorReadingORM,
+            MaintenanceSensorORM,
+            joins=self._scope_joins,
+            operation_label="list maintenance sensor readings",
+        ).where(MaintenanceSensorReadingORM.organization_id == organization_id)
+        if sensor_id is not None:
+            stmt = stmt.where(MaintenanceSensorReadingORM.sensor_id == sensor_id)
+        if quality_state is not None:
+            stmt = stmt.where(MaintenanceSensorReadingORM.quality_state == quality_state)
+        if source_batch_id is not None:
+            stmt = stmt.where(MaintenanceSensorReadingORM.source_batch_id == source_batch_id)
+        if reading_from is not None:
+            stmt = stmt.where(MaintenanceSensorReadingORM.reading_timestamp >= reading_from)
+        if reading_to is not None:
+            stmt = stmt.where(MaintenanceSensorReadingORM.reading_timestamp <= reading_to)
+        rows = self.session.execute(
+            stmt.order_by(MaintenanceSensorReadingORM.reading_timestamp.desc())
+        ).scalars().all()
+        return [maintenance_sensor_reading_from_orm(row) for row in rows]
+
+    def delete_before(
+        self,
+        organization_id: str,
+        cutoff: datetime,
+        *,
+        sensor_id: str | None = None,
+    ) -> int:
+        ctx = self._context(operation_label="prune maintenance sensor readings")
+        if not self._organization_in_scope(ctx, organization_id):
+            return 0
+        stmt = delete(MaintenanceSensorReadingORM).where(
+            MaintenanceSensorReadingORM.organization_id == organization_id,
+            MaintenanceSensorReadingORM.reading_timestamp < cutoff,
+        )
+        if sensor_id is not None:
+            stmt = stmt.where(MaintenanceSensorReadingORM.sensor_id == sensor_id)
+        self.session.flush()
+        return int(self.session.execute(stmt).rowcount or 0)
+
+
+__all__ = ["SqlAlchemyMaintenanceSensorReadingRepository"]
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import bindparam, case, delete, select, update
+from sqlalchemy.orm import Session
+
+from src.core.modules.maintenance.domain import MaintenanceSensorRollup, MaintenanceSensorRollupGrain
+from src.core.modules.maintenance.domain.reliability import sensor_rollup_bucket_start
+from src.core.modules.maintenance.contracts.repositories import MaintenanceSensorRollupRepository
+from src.core.modules.maintenance.infrastructure.persistence.mappers import (
+    maintenance_sensor_rollup_from_orm,
+    maintenance_sensor_rollup_to_row,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.models import MaintenanceSensorORM
+from src.core.modules.maintenance.infrastructure.persistence.orm.sensor_rollup_models import (
+    MaintenanceSensorReadingRollupORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.repositories._tenant_scope import (
+    MaintenanceParentScopedRepositorySupport,
+)
+from src.core.platform.application.tenant.tenancy.tenant_context import (
+    TenantContextService,
+    require_tenant_context_service,
+)
+from src.infra.persistence.db.bulk import bulk_insert, chunked
+
+_ROLLUPS = MaintenanceSensorReadingRollupORM.__table__
+
+
+def _merge_statement():
+    # Folds a batch delta into a stored bucket in SQL, so two writers that
+    # touch the same bucket add up instead of overwriting each other.
+    c = _ROLLUPS.c
+    newer = c.last_reading_at > bindparam("b_last_reading_at", type_=c.last_reading_at.type)
+    return (
+        update(_ROLLUPS)
+        .where(
+            c.sensor_id == bindparam("b_sensor_id"),
+            c.grain == bindparam("b_grain", type_=c.grain.type),
+            c.bucket_start == bindparam("b_bucket_start", type_=c.bucket_start.type),
+        )
+        .values(
+            reading_count=c.reading_count + bindparam("b_reading_count", type_=c.reading_count.type),
+            sum_value=c.sum_value + bindparam("b_sum_value", type_=c.sum_value.type),
+            min_value=case(
+                (c.min_value <= bindparam("b_min_value", type_=c.min_value.type), c.min_value),
+                else_=bindparam("b_min_value", type_=c.min_value.type),
+            ),
+            max_value=case(
+                (c.max_value >= bindparam("b_max_value", type_=c.max_value.type), c.max_value),
+                else_=bindparam("b_max_value", type_=c.max_value.type),
+            ),
+            last_value=case(
+                (newer, c.last_value),
+                else_=bindparam("b_last_value", type_=c.last_value.type),
+            ),
+            last_reading_at=case(
+                (newer, c.last_reading_at),
+                else_=bindparam("b_last_reading_at", type_=c.last_reading_at.type),
+            ),
+        )
+    )
+
+
+class SqlAlchemyMaintenanceSensorRollupRepository(
+    MaintenanceSensorRollupRepository, MaintenanceParentScopedRepositorySupport
+):
+    _repository_label = "Maintenance sensor rollup repository"
+    _scope_joins = (
+        (MaintenanceSensorORM, MaintenanceSensorReadingRollupORM.sensor_id == MaintenanceSensorORM.id),
+    )
+    _merge_stmt = _merge_statement()
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        tenant_context_service: TenantContextService | None = None,
+    ):
+        self.session = session
+        self._tenant_context_service = require_tenant_context_service(
+            tenant_context_service,
+            consumer_label=type(self).__name__,
+        )
+
+    def merge_many(self, rollups: list[MaintenanceSensorRollup]) -> None:
+        """Insert new buckets with one bulk statement and fold the rest into
+        their stored rows with one executemany UPDATE."""
+        if not rollups:
+            return
+        self._require_all_in_scope(
+            MaintenanceSensorORM,
+            {rollup.sensor_id for rollup in rollups},
+            operation_label="merge maintenance sensor rollups",
+            not_found_message="Maintenance sensor not found.",
+        )
+        self.session.flush()
+        stored = self._stored_keys(rollups)
+        fresh = [rollup for rollup in rollups if rollup.key not in stored]
+        bulk_insert(
+            self.session,
+            MaintenanceSensorReadingRollupORM,
+            [maintenance_sensor_rollup_to_row(rollup) for rollup in fresh],
+        )
+        merged = [
+            {
+                "b_sensor_id": rollup.sensor_id,
+                "b_grain": rollup.grain,
+                "b_bucket_start": rollup.bucket_start,
+                "b_reading_count": rollup.reading_count,
+                "b_sum_value": rollup.sum_value,
+                "b_min_value": rollup.min_value,
+                "b_max_value": rollup.max_value,
+                "b_last_value": rollup.last_value,
+                "b_last_reading_at": rollup.last_reading_at,
+            }
+            for rollup in rollups
+            if rollup.key in stored
+        ]
+        for chunk in chunked(merged):
+            self.session.execute(self._merge_stmt, list(chunk))
+
+    def replace_for_sensor(self, sensor_id: str, rollups: list[MaintenanceSensorRollup]) -> None:
+        self._require_in_scope(
+            MaintenanceSensorORM,
+            sensor_id,
+            operation_label="rebuild maintenance sensor rollups",
+            not_found_message="Maintenance sensor not found.",
+        )
+        self.session.execute(delete(_ROLLUPS).where(_ROLLUPS.c.sensor_id == sensor_id))
+        bulk_insert(
+            self.session,
+            MaintenanceSensorReadingRollupORM,
+            [maintenance_sensor_rollup_to_row(rollup) for rollup in rollups],
+        )
+
+    def list_for_sensor(
+        self,
+        organization_id: str,
+        sensor_id: str,
+        *,
+        grain: MaintenanceSensorRollupGrain,
+        bucket_from: datetime | None = None,
+        bucket_to: datetime | None = None,
+    ) -> list[MaintenanceSensorRollup]:
+        ctx = self._context(operation_label="list maintenance sensor rollups")
+        if not self._organization_in_scope(ctx, organization_id):
+            return []
+        stmt = self._scoped_stmt_for_anchor(
+            MaintenanceSensorReadingRollupORM,
+            MaintenanceSensorORM,
+            joins=self._scope_joins,
+            operation_label="list maintenance sensor rollups",
+        ).where(
+            MaintenanceSensorReadingRollupORM.organization_id == organization_id,
+            MaintenanceSensorReadingRollupORM.sensor_id == sensor_id,
+            MaintenanceSensorReadingRollupORM.grain == grain,
+        )
+        if bucket_from is not None:
+            stmt = stmt.where(MaintenanceSensorReadingRollupORM.bucket_start >= bucket_from)
+        if bucket_to is not None:
+            stmt = stmt.where(MaintenanceSensorReadingRollupORM.bucket_start <= bucket_to)
+        # Plain column rows: a year of hourly buckets is thousands of rows
+        # that never need to enter the identity map.
+        rows = self.session.execute(
+            stmt.with_only_columns(*_ROLLUPS.c).order_by(MaintenanceSensorReadingRollupORM.bucket_start)
+        ).all()
+        return [maintenance_sensor_rollup_from_orm(row) for row in rows]
+
+    def _stored_keys(
+        self,
+        rollups: list[MaintenanceSensorRollup],
+    ) -> set[tuple[str, MaintenanceSensorRollupGrain, object]]:
+        by_grain: dict[MaintenanceSensorRollupGrain, list[MaintenanceSensorRollup]] = defaultdict(list)
+        for rollup in rollups:
+            by_grain[rollup.grain].append(rollup)
+        stored: set[tuple[str, MaintenanceSensorRollupGrain, object]] = set()
+        c = _ROLLUPS.c
+        for grain, grain_rollups in by_grain.items():
+            sensor_ids = {rollup.sensor_id for rollup in grain_rollups}
+            buckets = sorted({rollup.bucket_start for rollup in grain_rollups})
+            for bucket_chunk in chunked(buckets):
+                rows = self.session.execute(
+                    select(c.sensor_id, c.bucket_start).where(
+                        c.grain == grain,
+                        c.sensor_id.in_(sensor_ids),
+                        c.bucket_start.in_(bucket_chunk),
+                    )
+                ).all()
+                stored.update(
+                    (sensor_id, grain, sensor_rollup_bucket_start(bucket_start, grain))
+                    for sensor_id, bucket_start in rows
+                )
+        return stored
+
+
+__all__ = ["SqlAlchemyMaintenanceSensorRollupRepository"]
@@ -1,6 +1,7 @@
 from .contracts import MAINTENANCE_REPORT_CONTRACTS, MaintenanceReportContract
 from .definitions import register_maintenance_report_definitions
 from .models import (
+    MaintenanceAssetReliability,
     MaintenanceRecurringFailurePattern,
     MaintenanceReliabilityDashboard,
     MaintenanceRootCauseInsight,
@@ -11,6 +12,7 @@ from .service import MaintenanceReportRequest, MaintenanceReportingService
 
 __all__ = [
     "MAINTENANCE_REPORT_CONTRACTS",
+    "MaintenanceAssetReliability",
     "MaintenanceRecurringFailurePattern",
     "MaintenanceReportContract",
     "MaintenanceReportRequest",
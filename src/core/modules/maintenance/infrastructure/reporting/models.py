@@ -52,6 +52,22 @@ class MaintenanceRecurringFailurePattern:
     last_occurrence_at: datetime | None = None
 
 
+@dataclass(frozen=True)
+class MaintenanceAssetReliability:
+    asset_id: str
+    asset_code: str
+    asset_name: str
+    failure_count: int
+    failure_mode_count: int
+    mtbf_hours: float | None = None
+    mttr_hours: float | None = None
+    uptime_hours: float = 0.0
+    repair_hours: float = 0.0
+    leading_failure_code: str = ""
+    leading_failure_name: str = ""
+    last_failure_at: datetime | None = None
+
+
 @dataclass(frozen=True)
 class MaintenanceReliabilityDashboard:
     title: str
@@ -65,6 +81,7 @@ class MaintenanceReliabilityDashboard:
 
 
 __all__ = [
+    "MaintenanceAssetReliability",
     "MaintenanceRecurringFailurePattern",
     "MaintenanceReliabilityDashboard",
     "MaintenanceRootCauseInsight",
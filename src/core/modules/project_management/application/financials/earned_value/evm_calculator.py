@@ -6,6 +6,7 @@ Reporting delegates here; this owns the algorithm.
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from datetime import date
 from decimal import Decimal
 from typing import Callable
@@ -250,12 +251,12 @@ class EarnedValueCalculator:
         loader = getattr(self._calendar, "working_day_dates_between", None)
         if not callable(loader):
             return self._calendar.working_days_between
-        working_dates = loader(starts_on, ends_on)
+        working_dates = sorted(loader(starts_on, ends_on))
 
         def _count(start: date, end: date) -> int:
             if end < start:
                 return 0
-            return sum(1 for day in working_dates if start <= day <= end)
+            return bisect_right(working_dates, end) - bisect_left(working_dates, start)
 
         return _count
 
@@ -6,6 +6,7 @@ Acquires source facts once and delegates policy/math to their owning engines.
 from __future__ import annotations
 
 import calendar
+from collections.abc import Callable, Mapping
 from datetime import date
 
 from src.core.modules.project_management.application.financials.cost.engines.cost_policy_engine import (
@@ -20,10 +21,14 @@ from src.core.modules.project_management.application.financials.earned_value.evm
 from src.core.modules.project_management.contracts.reads.financials.evm_series_reader import (
     EvmSeriesReader,
 )
+from src.core.modules.project_management.contracts.reads.financials.models.finance_snapshot_facts import (
+    EvmSeriesFacts,
+)
 from src.core.platform.application.tenant.tenancy.tenant_context import TenantContextService
 
 from src.core.modules.project_management.application.financials.models.finance_models import (
     EvmSeriesPoint,
+    LaborDetailsResult,
 )
 
 
@@ -71,24 +76,30 @@ class EarnedValueSeriesCalculator:
         )
         if facts is None:
             return []
+        return self.build_series_from_facts(project_id, facts, as_of=as_of)
 
-        start = facts.finance.project.start_date or as_of
-        b_tasks = facts.baseline_tasks
-
-        if b_tasks:
-            starts = [bt.baseline_start for bt in b_tasks if bt.baseline_start]
-            if starts:
-                start = min(starts)
-
+    def series_period_ends(self, facts: EvmSeriesFacts, *, as_of: date) -> tuple[date, ...]:
+        """Month-ends from the baseline (or project) start through as_of."""
+        start = self._series_start(facts, as_of=as_of)
         points: list[date] = []
         cur = _month_end(start)
         end = _month_end(as_of)
         while cur <= end:
             points.append(cur)
             cur = _month_end(_add_months(cur, 1))
+        return tuple(points)
 
-        calendar_starts = [start]
-        calendar_ends = [end]
+    def prepare_working_days(
+        self,
+        facts: EvmSeriesFacts,
+        *,
+        as_of: date,
+    ) -> Callable[[date, date], int]:
+        """Working-day counter covering every date the series (and a single
+        as-of EVM calculation on the same facts) counts between."""
+        b_tasks = facts.baseline_tasks
+        calendar_starts = [self._series_start(facts, as_of=as_of)]
+        calendar_ends = [_month_end(as_of)]
         if facts.finance.project.start_date:
             calendar_starts.append(facts.finance.project.start_date)
         if facts.finance.project.end_date:
@@ -99,18 +110,47 @@ class EarnedValueSeriesCalculator:
         calendar_ends.extend(
             task.baseline_finish for task in b_tasks if task.baseline_finish is not None
         )
-        working_days_between = self._calculator.prepare_working_days(
+        return self._calculator.prepare_working_days(
             starts_on=min(calendar_starts),
             ends_on=max(calendar_ends),
         )
 
-        labor_by_date = dict(
+    def read_labor_series(
+        self,
+        project_id: str,
+        facts: EvmSeriesFacts,
+        *,
+        as_of: date,
+    ) -> dict[date, LaborDetailsResult]:
+        """Labor costs at every series month-end, rates resolved in one batch."""
+        return dict(
             self._labor_engine.calculate_project_labor_series(
                 project_id,
-                as_of_dates=tuple(points),
+                as_of_dates=self.series_period_ends(facts, as_of=as_of),
                 facts=facts.finance,
             )
         )
+
+    def build_series_from_facts(
+        self,
+        project_id: str,
+        facts: EvmSeriesFacts,
+        *,
+        as_of: date,
+        labor_by_date: Mapping[date, LaborDetailsResult] | None = None,
+        working_days_between: Callable[[date, date], int] | None = None,
+    ) -> list[EvmSeriesPoint]:
+        """Build the series from already-read facts.
+
+        A caller that has already resolved the labor series and the calendar
+        (the report snapshot does) passes them in, and the build reads
+        nothing further.
+        """
+        points = self.series_period_ends(facts, as_of=as_of)
+        if working_days_between is None:
+            working_days_between = self.prepare_working_days(facts, as_of=as_of)
+        if labor_by_date is None:
+            labor_by_date = self.read_labor_series(project_id, facts, as_of=as_of)
         out: list[EvmSeriesPoint] = []
         for pe in points:
             policy = self._cost_policy_engine.compose_from_facts_at(
@@ -138,6 +178,13 @@ class EarnedValueSeriesCalculator:
 
         return out
 
+    @staticmethod
+    def _series_start(facts: EvmSeriesFacts, *, as_of: date) -> date:
+        starts = [bt.baseline_start for bt in facts.baseline_tasks if bt.baseline_start]
+        if starts:
+            return min(starts)
+        return facts.finance.project.start_date or as_of
+
 
 def _month_end(d: date) -> date:
     last = calendar.monthrange(d.year, d.month)[1]
@@ -1,9 +1,15 @@
 from src.core.modules.project_management.infrastructure.importers.scheduling.mpp.mpp_parser import (
     MSProjectXmlParser,
 )
+from src.core.modules.project_management.infrastructure.importers.scheduling.mpp.mpp_stream_parser import (
+    MSProjectXmlStreamingParser,
+)
 from src.core.modules.project_management.infrastructure.importers.scheduling.primavera.p6_parser import (
     P6Parser,
 )
+from src.core.modules.project_management.infrastructure.importers.scheduling.primavera.p6_stream_parser import (
+    P6StreamingParser,
+)
 from src.core.modules.project_management.infrastructure.importers.services.validation import (
     ImportValidationService,
     ImportValidationSeverity,
@@ -17,5 +23,7 @@ __all__ = [
     "ImportValidationService",
     "ImportValidationSeverity",
     "MSProjectXmlParser",
+    "MSProjectXmlStreamingParser",
     "P6Parser",
+    "P6StreamingParser",
 ]
@@ -219,10 +219,15 @@ class SchedulingEngine:
                 # unconditionally on every single recalculation, correlating
                 # DB write volume with project size rather than with how
                 # much the schedule actually moved.
-                for task_id, info in result.items():
-                    if original_dates.get(task_id) == (info.task.start_date, info.task.end_date):
-                        continue
-                    self._task_repo.update(info.task)
+                # The moved tasks are then written as one batched UPDATE.
+                self._task_repo.update_many(
+                    [
+                        info.task
+                        for task_id, info in result.items()
+                        if original_dates.get(task_id)
+                        != (info.task.start_date, info.task.end_date)
+                    ]
+                )
                 if commit:
                     self._session.commit()
                 else:
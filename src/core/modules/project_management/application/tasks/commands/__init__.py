@@ -9,6 +9,11 @@ from src.core.modules.project_management.application.tasks.commands.assignment_a
 from src.core.modules.project_management.application.tasks.commands.assignment_bridge import (
     TaskAssignmentBridgeMixin,
 )
+from src.core.modules.project_management.application.tasks.commands.bulk_import import (
+    TaskBulkImportMixin,
+    TaskImportBatchResult,
+    TaskImportRow,
+)
 from src.core.modules.project_management.application.tasks.commands.dependency import (
     TaskDependencyMixin,
 )
@@ -28,7 +33,10 @@ from src.core.modules.project_management.application.tasks.commands.validation i
 __all__ = [
     "TaskAssignmentBridgeMixin",
     "TaskAssignmentMixin",
+    "TaskBulkImportMixin",
     "TaskDependencyMixin",
+    "TaskImportBatchResult",
+    "TaskImportRow",
     "TaskLifecycleMixin",
     "TaskScheduleSyncMixin",
     "TaskTimeEntryMixin",
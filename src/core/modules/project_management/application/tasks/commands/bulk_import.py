@@ -0,0 +1,516 @@
+"""Batched task import: one project task index, one write transaction and
+one schedule recalculation per imported project. Rows go through the same
+field and hierarchy rules as the single-task commands."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import date
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.core.modules.project_management.access.scope_permissions import require_project_permission
+from src.core.modules.project_management.contracts.repositories.tasks.task import TaskRepository
+from src.core.modules.project_management.application.tasks.commands.hierarchy_support import (
+    TaskWbsMovePlan,
+)
+from src.core.modules.project_management.domain.enums import ConstraintType, TaskStatus
+from src.core.modules.project_management.domain.tasks.task import Task
+from src.core.platform.application.security.authorization.enforcement.permission_checks import require_permission
+from src.core.platform.common.code_generation import (
+    CodeGenerator,
+    assert_code_unique,
+    normalize_manual_code,
+    sanitize_token,
+)
+from src.core.platform.common.exceptions import BusinessRuleError, NotFoundError, ValidationError
+from src.core.shared.activity import record_activity
+from src.core.shared.events.domain_events import domain_events
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TaskImportRow:
+    """One parsed import row. ``task_id`` / ``name`` identify an existing
+    task to update; otherwise the row creates a task."""
+
+    line_no: int
+    name: str
+    task_id: str = ""
+    code: str = ""
+    description: str = ""
+    start_date: date | None = None
+    duration_days: int | None = None
+    priority: int | None = None
+    deadline: date | None = None
+    status: TaskStatus | None = None
+    percent_complete: float | None = None
+    wbs_code: str = ""
+    parent_wbs_code: str = ""
+    sort_order: int | None = None
+    is_milestone: bool | None = None
+    constraint_type: ConstraintType | None = None
+    constraint_date: date | None = None
+
+
+@dataclass
+class TaskImportBatchResult:
+    created_count: int = 0
+    updated_count: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+
+class _ProjectTaskIndex:
+    """In-memory view of a project's tasks, kept current as rows are
+    staged so later rows see earlier ones (parents, codes, WBS)."""
+
+    def __init__(
+        self,
+        tasks: Sequence[Task],
+        *,
+        add_working_days: Callable[[date, int], date],
+    ) -> None:
+        self.by_id: dict[str, Task] = {}
+        self.by_name: dict[str, Task] = {}
+        self.by_wbs: dict[str, Task] = {}
+        self.codes: set[str] = set()
+        self.children: dict[str | None, list[str]] = {}
+        for task in sorted(tasks, key=lambda item: (item.sort_order, item.wbs_code, item.id)):
+            self.put(task)
+            self.children.setdefault(task.parent_task_id, []).append(task.id)
+        self._code_cursor: dict[str, int] = {}
+        self._add_working_days = add_working_days
+        # Calendar lookups hit the enterprise calendar tables; most rows of
+        # an import share a handful of (start, duration) pairs.
+        self._end_dates: dict[tuple[date, int], date] = {}
+        self._last_wbs_suffix: dict[str | None, int] = {}
+
+    def add_working_days(self, start_date: date, duration_days: int) -> date:
+        key = (start_date, int(duration_days))
+        end_date = self._end_dates.get(key)
+        if end_date is None:
+            end_date = self._end_dates[key] = self._add_working_days(*key)
+        return end_date
+
+    def put(self, task: Task, *, previous: Task | None = None) -> None:
+        if previous is not None:
+            name_key = previous.name.strip().lower()
+            if self.by_name.get(name_key) is previous:
+                del self.by_name[name_key]
+            wbs_key = previous.wbs_code.strip().upper()
+            if wbs_key and getattr(self.by_wbs.get(wbs_key), "id", None) == task.id:
+                del self.by_wbs[wbs_key]
+        self.by_id[task.id] = task
+        self.by_name.setdefault(task.name.strip().lower(), task)
+        if task.wbs_code:
+            self.by_wbs[task.wbs_code.strip().upper()] = task
+        if task.code:
+            self.codes.add(task.code.upper())
+
+    def find(self, *, task_id: str, name: str) -> Task | None:
+        if task_id and task_id in self.by_id:
+            return self.by_id[task_id]
+        return self.by_name.get(name.strip().lower())
+
+    def sibling_count(self, parent_id: str | None) -> int:
+        return len(self.children.get(parent_id, ()))
+
+    def ordered_tasks(self) -> list[Task]:
+        """Every task in sibling order, numbered by its staged position
+        (the stored sort orders of new rows are only settled at the end)."""
+        return [
+            replace(self.by_id[task_id], sort_order=position)
+            for task_ids in self.children.values()
+            for position, task_id in enumerate(task_ids)
+        ]
+
+    def relink(self, task_id: str, old_parent_id: str | None, new_parent_id: str | None, position: int) -> None:
+        self.children[old_parent_id].remove(task_id)
+        self.children.setdefault(new_parent_id, []).insert(position, task_id)
+        self._last_wbs_suffix.pop(old_parent_id, None)
+        self._last_wbs_suffix.pop(new_parent_id, None)
+
+    def next_wbs_code(self, parent: Task | None) -> str:
+        """Same numbering as ``_next_wbs_code`` without rescanning the
+        siblings for every staged row."""
+        parent_id = parent.id if parent is not None else None
+        prefix = f"{parent.wbs_code}." if parent is not None else ""
+        last = self._last_wbs_suffix.get(parent_id)
+        if last is None:
+            last = max(
+                (
+                    self._wbs_suffix(self.by_id[task_id].wbs_code, prefix)
+                    for task_id in self.children.get(parent_id, ())
+                ),
+                default=0,
+            )
+            self._last_wbs_suffix[parent_id] = last
+        return f"{prefix}{last + 1}"
+
+    def add_child(self, task: Task, parent: Task | None, position: int) -> None:
+        self.children.setdefault(task.parent_task_id, []).insert(position, task.id)
+        if task.parent_task_id in self._last_wbs_suffix:
+            prefix = f"{parent.wbs_code}." if parent is not None else ""
+            self._last_wbs_suffix[task.parent_task_id] = max(
+                self._last_wbs_suffix[task.parent_task_id],
+                self._wbs_suffix(task.wbs_code, prefix),
+            )
+
+    @staticmethod
+    def _wbs_suffix(wbs_code: str, prefix: str) -> int:
+        suffix = wbs_code[len(prefix) :] if wbs_code.startswith(prefix) else ""
+        return int(suffix) if suffix.isdigit() else 0
+
+    def resolve_code(self, code: str, name: str, *, exclude_code: str = "") -> str:
+        excluded = exclude_code.upper()
+
+        def taken(candidate: str) -> bool:
+            key = candidate.upper()
+            return key in self.codes and key != excluded
+
+        manual = normalize_manual_code(code)
+        if manual:
+            assert_code_unique(manual, exists=taken, label="Task code")
+            return manual
+        # Generated codes only ever fill upwards within a batch, so each
+        # name token resumes where the previous row stopped.
+        cursor_key = sanitize_token((name or "").strip())
+        generated = CodeGenerator().generate(
+            "task",
+            exists=taken,
+            name=(name or "").strip() or None,
+            use_year=not bool((name or "").strip()),
+            start=self._code_cursor.get(cursor_key, 1),
+        )
+        self._code_cursor[cursor_key] = int(generated.rsplit("-", 1)[-1]) + 1
+        return generated
+
+
+class TaskBulkImportMixin:
+    _session: Session
+    _task_repo: TaskRepository
+
+    def import_task_batch(
+        self,
+        project_id: str,
+        rows: Sequence[TaskImportRow],
+    ) -> TaskImportBatchResult:
+        """Create or update the project's tasks for ``rows``.
+
+        Every row is validated against an in-memory index of the project's
+        tasks before anything is written, with the rules ``create_task``,
+        ``update_task``, ``update_progress`` and ``move_task`` apply. Valid
+        rows -- WBS moves of existing tasks included -- are written with the
+        repository batch operations in one transaction, with one activity
+        entry per task; rows that fail validation are reported and skipped.
+        Parents declared later in the file are resolved by staging rows in
+        dependency order. The schedule is recalculated once."""
+        require_permission(self._user_session, "task.manage", operation_label="import tasks")
+        require_project_permission(
+            self._user_session,
+            project_id,
+            "task.manage",
+            operation_label="import tasks",
+        )
+        project = self._project_repo.get(project_id) if self._project_repo is not None else None
+        if self._project_repo is not None and project is None:
+            raise NotFoundError("Project not found.", code="PROJECT_NOT_FOUND")
+        index = _ProjectTaskIndex(
+            self._task_repo.list_by_project(project_id),
+            add_working_days=self._work_calendar_engine.add_working_days,
+        )
+        result = TaskImportBatchResult()
+        created: dict[str, Task] = {}
+        updated: dict[str, Task] = {}
+        touched: set[str] = set()
+        moves: dict[str, TaskWbsMovePlan] = {}
+        resequenced_parents: set[str | None] = set()
+        checked_parents: set[str] = set()
+
+        pending = list(rows)
+        while pending:
+            deferred: list[TaskImportRow] = []
+            for row in pending:
+                parent_key = row.parent_wbs_code.strip().upper()
+                parent = index.by_wbs.get(parent_key) if parent_key else None
+                if parent_key and parent is None:
+                    deferred.append(row)
+                    continue
+                try:
+                    if parent is not None and parent.id not in created and parent.id not in checked_parents:
+                        self._assert_parent_has_no_direct_execution(parent)
+                        checked_parents.add(parent.id)
+                    existing = index.find(task_id=row.task_id, name=row.name)
+                    if existing is None:
+                        task = self._stage_imported_task(row, project_id, project, parent, index)
+                        created[task.id] = task
+                        resequenced_parents.add(task.parent_task_id)
+                        result.created_count += 1
+                        continue
+                    changes, plan = self._stage_imported_update(row, project, parent, existing, index)
+                    for change in changes:
+                        if change.id in created:
+                            created[change.id] = change
+                        else:
+                            # Re-queued so update_many keeps the plan's
+                            # conflict-free (deepest-first) order.
+                            updated.pop(change.id, None)
+                            updated[change.id] = change
+                    if plan is not None:
+                        moves[existing.id] = plan
+                        resequenced_parents.update((existing.parent_task_id, changes[-1].parent_task_id))
+                    touched.add(existing.id)
+                    result.updated_count += 1
+                except Exception as exc:
+                    result.errors.append((row.line_no, str(exc)))
+            if len(deferred) == len(pending):
+                for row in deferred:
+                    result.errors.append(
+                        (
+                            row.line_no,
+                            f"Parent WBS code '{row.parent_wbs_code.strip().upper()}' was not found "
+                            "or the imported hierarchy contains a cycle.",
+                        )
+                    )
+                break
+            pending = deferred
+
+        updated.update(self._resequence_imported_siblings(index, created, resequenced_parents))
+        try:
+            self._task_repo.add_many(list(created.values()))
+            self._task_repo.update_many(list(updated.values()))
+            self._record_imported_activity(project_id, created, updated, touched, moves)
+            self._session.commit()
+        except IntegrityError as exc:
+            self._session.rollback()
+            raise ValidationError(
+                "Imported task codes or WBS codes conflict with existing tasks.",
+                code="TASK_IMPORT_CONFLICT",
+            ) from exc
+        except Exception:
+            self._session.rollback()
+            raise
+
+        self._sync_project_schedule(project_id)
+        logger.info(
+            "Imported tasks for project %s created=%s updated=%s errors=%s",
+            project_id,
+            result.created_count,
+            result.updated_count,
+            len(result.errors),
+        )
+        domain_events.tasks_changed.emit(project_id)
+        return result
+
+    def _stage_imported_task(
+        self,
+        row: TaskImportRow,
+        project_id: str,
+        project,
+        parent: Task | None,
+        index: _ProjectTaskIndex,
+    ) -> Task:
+        task = Task.create(
+            project_id=project_id,
+            name=row.name,
+            description=row.description,
+            start_date=row.start_date,
+            duration_days=row.duration_days,
+            status=row.status or TaskStatus.TODO,
+            priority=row.priority or 0,
+            deadline=row.deadline,
+            is_milestone=bool(row.is_milestone),
+            constraint_type=row.constraint_type,
+            constraint_date=row.constraint_date,
+        )
+        self._validate_constraint_date_is_working_day(task)
+        wbs_code = self._validate_wbs_code_for_parent(row.wbs_code or index.next_wbs_code(parent), parent)
+        if wbs_code in index.by_wbs:
+            raise ValidationError(
+                f"WBS code '{wbs_code}' already exists in this project.",
+                code="TASK_WBS_CODE_DUPLICATE",
+            )
+        task = replace(
+            task,
+            code=index.resolve_code(row.code, task.name),
+            parent_task_id=parent.id if parent is not None else None,
+            wbs_code=wbs_code,
+        )
+        task = self._with_scheduled_end(task, add_working_days=index.add_working_days)
+        if row.percent_complete is not None:
+            task = self._with_progress(task, row.percent_complete)
+        if project is not None:
+            self._validate_task_dates_for_project(project, task.start_date, task.end_date)
+        sibling_count = index.sibling_count(task.parent_task_id)
+        position = sibling_count if row.sort_order is None else max(0, min(row.sort_order, sibling_count))
+        index.add_child(task, parent, position)
+        index.put(task)
+        return task
+
+    def _stage_imported_update(
+        self,
+        row: TaskImportRow,
+        project,
+        parent: Task | None,
+        task: Task,
+        index: _ProjectTaskIndex,
+    ) -> tuple[list[Task], TaskWbsMovePlan | None]:
+        """Stage ``row`` onto ``task``; returns every task the row changed
+        (the row's task last) and the WBS move plan when it moves. Nothing is
+        staged if any rule rejects the row."""
+        if bool(index.children.get(task.id)):
+            self._require_summary_schedule_unchanged(
+                task,
+                start_date=row.start_date,
+                duration_days=row.duration_days,
+                status=row.status,
+            )
+            if row.percent_complete is not None:
+                raise BusinessRuleError(
+                    "Summary tasks cannot record progress; update their execution leaves instead.",
+                    code="TASK_WBS_SUMMARY_EXECUTION_FORBIDDEN",
+                )
+        if (row.constraint_type is not None and row.constraint_type != task.constraint_type) or (
+            row.constraint_date is not None and row.constraint_date != task.constraint_date
+        ):
+            raise BusinessRuleError(
+                "Scheduling constraints of existing tasks change through the constraint "
+                "command, which may need approval; import can only set them on new tasks.",
+                code="TASK_IMPORT_CONSTRAINT_UPDATE_FORBIDDEN",
+            )
+        code = None
+        if row.code.strip():
+            code = index.resolve_code(row.code, row.name, exclude_code=task.code)
+        candidate = self._with_task_fields(
+            task,
+            name=row.name,
+            description=row.description or None,
+            start_date=row.start_date,
+            duration_days=row.duration_days,
+            status=row.status,
+            priority=row.priority,
+            deadline=row.deadline,
+            code=code,
+            is_milestone=row.is_milestone,
+            add_working_days=index.add_working_days,
+        )
+        if project is not None:
+            self._validate_task_dates_for_project(
+                project, candidate.start_date, candidate.end_date
+            )
+        if row.percent_complete is not None:
+            candidate = self._with_progress(candidate, row.percent_complete)
+
+        hierarchy_requested = bool(row.wbs_code or parent is not None or row.sort_order is not None)
+        target_parent_id = (
+            parent.id
+            if parent is not None
+            else (None if hierarchy_requested else task.parent_task_id)
+        )
+        position = index.children[task.parent_task_id].index(task.id)
+        if (
+            target_parent_id == task.parent_task_id
+            and not (row.wbs_code and row.wbs_code.upper() != task.wbs_code)
+            and not (row.sort_order is not None and row.sort_order != position)
+        ):
+            index.put(candidate, previous=task)
+            return [candidate], None
+
+        tasks = [
+            replace(candidate, sort_order=position) if item.id == task.id else item
+            for item in index.ordered_tasks()
+        ]
+        plan = self._plan_wbs_move(
+            next(item for item in tasks if item.id == task.id),
+            tasks=tasks,
+            parent_task_id=target_parent_id,
+            wbs_code=row.wbs_code or None,
+            sort_order=row.sort_order,
+        )
+        index.put(candidate, previous=task)
+        for change in plan.updates:
+            index.put(change, previous=index.by_id[change.id])
+        index.relink(task.id, task.parent_task_id, target_parent_id, plan.sort_order)
+        changes = [change for change in plan.updates if change.id != task.id]
+        changes.append(index.by_id[task.id])
+        return changes, plan
+
+    def _record_imported_activity(
+        self,
+        project_id: str,
+        created: dict[str, Task],
+        updated: dict[str, Task],
+        touched: set[str],
+        moves: dict[str, TaskWbsMovePlan],
+    ) -> None:
+        """One entry per task, as the single-task commands write them,
+        inside the import's transaction."""
+        for task in created.values():
+            record_activity(
+                self,
+                action="task.create",
+                entity_type="task",
+                entity_id=task.id,
+                module="project_management",
+                workspace_id=project_id,
+                details={"name": task.name},
+                commit=False,
+            )
+        for task_id in touched.difference(created):
+            task = updated[task_id]
+            record_activity(
+                self,
+                action="task.update",
+                entity_type="task",
+                entity_id=task.id,
+                module="project_management",
+                workspace_id=project_id,
+                details={"name": task.name, "status": task.status.value},
+                commit=False,
+            )
+        for task_id, plan in moves.items():
+            task = created.get(task_id) or updated[task_id]
+            record_activity(
+                self,
+                action="task.wbs_move",
+                entity_type="task",
+                entity_id=task_id,
+                module="project_management",
+                workspace_id=project_id,
+                details={
+                    "parent_task_id": task.parent_task_id,
+                    "wbs_code": plan.wbs_code,
+                    "sort_order": plan.sort_order,
+                },
+                commit=False,
+            )
+
+    @staticmethod
+    def _resequence_imported_siblings(
+        index: _ProjectTaskIndex,
+        created: dict[str, Task],
+        parents: set[str | None],
+    ) -> dict[str, Task]:
+        """Number every sibling list that received new or moved tasks 0..n-1
+        (as create_task and move_task do per write); returns the existing
+        tasks whose sort order changed."""
+        moved: dict[str, Task] = {}
+        for parent_id in parents:
+            for position, task_id in enumerate(index.children.get(parent_id, ())):
+                task = index.by_id[task_id]
+                if task.sort_order == position:
+                    continue
+                task = replace(task, sort_order=position)
+                index.by_id[task_id] = task
+                if task_id in created:
+                    created[task_id] = task
+                else:
+                    moved[task_id] = task
+        return moved
+
+
+__all__ = ["TaskBulkImportMixin", "TaskImportBatchResult", "TaskImportRow"]
@@ -0,0 +1,116 @@
+"""Shared field rules for the task create, update, progress and import commands."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import date
+
+from src.core.modules.project_management.domain.enums import TaskStatus
+from src.core.modules.project_management.domain.tasks.task import Task
+from src.core.platform.common.exceptions import BusinessRuleError
+from src.core.platform.contract.port.time_management.calendar.calendar_protocol import CalendarProtocol
+
+AddWorkingDays = Callable[[date, int], date]
+
+
+class TaskFieldRulesMixin:
+    _work_calendar_engine: CalendarProtocol
+
+    @staticmethod
+    def _require_summary_schedule_unchanged(
+        task: Task,
+        *,
+        start_date: date | None,
+        duration_days: int | None,
+        status: TaskStatus | None,
+    ) -> None:
+        schedule_changed = (
+            (start_date is not None and start_date != task.start_date)
+            or (duration_days is not None and duration_days != task.duration_days)
+            or (status is not None and status != task.status)
+        )
+        if schedule_changed:
+            raise BusinessRuleError(
+                "Summary task schedule and status are rolled up from execution leaves.",
+                code="TASK_WBS_SUMMARY_EXECUTION_FORBIDDEN",
+            )
+
+    def _with_scheduled_end(
+        self,
+        task: Task,
+        *,
+        add_working_days: AddWorkingDays | None = None,
+    ) -> Task:
+        """``task`` with its end date on the working calendar; uses
+        ``task.duration_days``, which the model already zeroed for a milestone."""
+        if not task.start_date or task.duration_days is None:
+            return task
+        add = add_working_days or self._work_calendar_engine.add_working_days
+        return replace(task, end_date=add(task.start_date, int(task.duration_days)))
+
+    def _with_task_fields(
+        self,
+        task: Task,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        start_date: date | None = None,
+        duration_days: int | None = None,
+        status: TaskStatus | None = None,
+        priority: int | None = None,
+        deadline: date | None = None,
+        code: str | None = None,
+        is_milestone: bool | None = None,
+        add_working_days: AddWorkingDays | None = None,
+    ) -> Task:
+        """``task`` with the given fields applied; ``None`` keeps a field."""
+        next_is_milestone = task.is_milestone if is_milestone is None else is_milestone
+        next_duration_days = task.duration_days if duration_days is None else duration_days
+        if next_is_milestone:
+            # Milestones are zero-duration -- normalized here (not left to
+            # Task's own model validator) because end_date below is
+            # computed from next_duration_days BEFORE replace() runs, and
+            # must already agree with what the domain will settle on.
+            next_duration_days = 0
+        next_start_date = task.start_date if start_date is None else start_date
+        next_end_date = task.end_date
+        if (start_date is not None or duration_days is not None or is_milestone is not None) and (
+            next_start_date and next_duration_days is not None
+        ):
+            add = add_working_days or self._work_calendar_engine.add_working_days
+            next_end_date = add(next_start_date, int(next_duration_days))
+        return replace(
+            task,
+            name=task.name if name is None else name,
+            description=task.description if description is None else description,
+            start_date=next_start_date,
+            end_date=next_end_date,
+            duration_days=next_duration_days,
+            status=task.status if status is None else status,
+            priority=task.priority if priority is None else priority,
+            deadline=task.deadline if deadline is None else deadline,
+            code=task.code if code is None else code,
+            is_milestone=next_is_milestone,
+        )
+
+    @staticmethod
+    def _with_progress(task: Task, percent_complete: float) -> Task:
+        """``task`` at ``percent_complete``, with the status that progress
+        implies (0 reopens to TODO, 100 completes, anything between is
+        IN_PROGRESS)."""
+        candidate = replace(task, percent_complete=percent_complete)
+        next_percent_complete = candidate.percent_complete
+        next_status = task.status
+        if next_percent_complete == 0 and task.status != TaskStatus.TODO:
+            next_status = TaskStatus.TODO
+        elif 0 < next_percent_complete < 100 and task.status == TaskStatus.TODO:
+            next_status = TaskStatus.IN_PROGRESS
+        elif next_percent_complete == 100:
+            next_status = TaskStatus.DONE
+        elif next_percent_complete < 100 and task.status == TaskStatus.DONE:
+            next_status = TaskStatus.IN_PROGRESS
+        return replace(candidate, status=next_status)
+
+
+__all__ = ["TaskFieldRulesMixin"]
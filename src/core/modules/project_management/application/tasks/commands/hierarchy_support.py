@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from dataclasses import replace
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
 
 from sqlalchemy.exc import IntegrityError
 
@@ -17,6 +18,15 @@ from src.core.modules.project_management.domain.tasks.task import Task
 from src.core.platform.common.exceptions import BusinessRuleError, NotFoundError, ValidationError
 
 
+@dataclass(frozen=True)
+class TaskWbsMovePlan:
+    """The writes one WBS move needs, in a conflict-free order."""
+
+    wbs_code: str
+    sort_order: int
+    updates: tuple[Task, ...]
+
+
 class TaskHierarchySupportMixin:
     _task_repo: TaskRepository
     _assignment_repo: AssignmentRepository
@@ -157,6 +167,126 @@ class TaskHierarchySupportMixin:
             sort_order=resolved_order,
         )
 
+    def _plan_wbs_move(
+        self,
+        task: Task,
+        *,
+        tasks: Sequence[Task],
+        parent_task_id: str | None,
+        wbs_code: str | None,
+        sort_order: int | None,
+    ) -> TaskWbsMovePlan:
+        """Validate moving ``task`` (and its subtree) under ``parent_task_id``
+        against ``tasks``, the project's tasks in sibling order, and return the
+        recoded and resequenced rows without writing them."""
+        tasks = list(tasks)
+        parent = self._require_wbs_parent(
+            project_id=task.project_id,
+            parent_task_id=parent_task_id,
+            moving_task_id=task.id,
+            tasks=tasks,
+        )
+        if parent is not None:
+            self._assert_parent_has_no_direct_execution(parent)
+        children = self._children_by_parent(tasks)
+        subtree_ids: set[str] = set()
+
+        def collect(parent_id: str) -> None:
+            for child in children.get(parent_id, []):
+                subtree_ids.add(child.id)
+                collect(child.id)
+
+        collect(task.id)
+        subtree_ids.add(task.id)
+        corrupt_descendant = next(
+            (
+                item
+                for item in tasks
+                if item.id in subtree_ids
+                and item.id != task.id
+                and not item.wbs_code.startswith(f"{task.wbs_code}.")
+            ),
+            None,
+        )
+        if corrupt_descendant is not None:
+            raise BusinessRuleError(
+                "The stored WBS subtree has an invalid code path and must be repaired before moving it.",
+                code="TASK_WBS_CORRUPT_CODE_PATH",
+            )
+        siblings = [
+            item
+            for item in tasks
+            if item.parent_task_id == parent_task_id and item.id not in subtree_ids
+        ]
+        resolved_wbs = self._validate_wbs_code_for_parent(
+            wbs_code
+            or (
+                task.wbs_code
+                if task.parent_task_id == parent_task_id
+                else self._next_wbs_code(parent, siblings)
+            ),
+            parent,
+        )
+        old_prefix = task.wbs_code
+        replacement_codes = {
+            item.id: (
+                resolved_wbs
+                if item.id == task.id
+                else f"{resolved_wbs}{item.wbs_code[len(old_prefix):]}"
+            )
+            for item in tasks
+            if item.id in subtree_ids
+        }
+        occupied = {item.wbs_code for item in tasks if item.id not in subtree_ids}
+        if occupied.intersection(replacement_codes.values()):
+            raise ValidationError(
+                "The requested WBS move conflicts with an existing WBS code.",
+                code="TASK_WBS_CODE_DUPLICATE",
+            )
+        default_index = (
+            task.sort_order
+            if task.parent_task_id == parent_task_id
+            else len(siblings)
+        )
+        target_index = max(
+            0,
+            min(default_index if sort_order is None else sort_order, len(siblings)),
+        )
+        target_siblings = list(siblings)
+        target_siblings.insert(target_index, task)
+        old_siblings = [
+            item
+            for item in tasks
+            if item.parent_task_id == task.parent_task_id and item.id not in subtree_ids
+        ]
+        updates: dict[str, Task] = {}
+        for index, sibling in enumerate(old_siblings):
+            if sibling.sort_order != index:
+                updates[sibling.id] = replace(sibling, sort_order=index)
+        for index, sibling in enumerate(target_siblings):
+            updates[sibling.id] = replace(
+                sibling,
+                parent_task_id=parent_task_id if sibling.id == task.id else sibling.parent_task_id,
+                wbs_code=replacement_codes.get(sibling.id, sibling.wbs_code),
+                sort_order=index,
+            )
+        for item in tasks:
+            if item.id in subtree_ids and item.id != task.id:
+                updates[item.id] = replace(item, wbs_code=replacement_codes[item.id])
+        original_by_id = {item.id: item for item in tasks}
+        ordered_updates = sorted(
+            updates.values(),
+            key=lambda candidate: (
+                candidate.id in subtree_ids,
+                -original_by_id[candidate.id].wbs_code.count("."),
+            ),
+        )
+        return TaskWbsMovePlan(
+            wbs_code=resolved_wbs,
+            sort_order=target_index,
+            updates=tuple(ordered_updates),
+        )
+
     def _require_leaf_task(self, task: Task, *, operation_label: str) -> None:
         if self._task_repo.list_children(task.project_id, task.id):
             raise BusinessRuleError(
@@ -175,4 +305,4 @@ class TaskHierarchySupportMixin:
         return replace(task, sort_order=target_index)
 
 
-__all__ = ["TaskHierarchySupportMixin"]
+__all__ = ["TaskHierarchySupportMixin", "TaskWbsMovePlan"]
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import replace
 from datetime import date
 
 from sqlalchemy.exc import IntegrityError
@@ -13,7 +12,6 @@ from src.core.modules.project_management.access.scope_permissions import require
 from src.core.shared.activity import record_activity
 from src.core.platform.application.security.authorization.enforcement.permission_checks import require_permission
 from src.core.platform.common.exceptions import (
-    BusinessRuleError,
     ConcurrencyError,
     NotFoundError,
     ValidationError,
@@ -76,13 +74,7 @@ class TaskLifecycleMixin:
             wbs_code=wbs_code,
             sort_order=sort_order,
         )
-        # task.duration_days, not the raw duration_days param -- Task's own
-        # model validator normalizes it to 0 for a milestone, and end_date
-        # must stay consistent with whatever duration actually landed.
-        if start_date and task.duration_days is not None:
-            task.end_date = self._work_calendar_engine.add_working_days(
-                start_date, int(task.duration_days)
-            )
+        task = self._with_scheduled_end(task)
 
         self._validate_task_within_project_dates(project_id, task.start_date, task.end_date)
 
@@ -148,57 +140,33 @@ class TaskLifecycleMixin:
                 code="STALE_WRITE",
             )
         if self._task_repo.list_children(task.project_id, task.id):
-            schedule_changed = (
-                (start_date is not None and start_date != task.start_date)
-                or (duration_days is not None and duration_days != task.duration_days)
-                or (status is not None and status != task.status)
-            )
-            if schedule_changed:
-                raise BusinessRuleError(
-                    "Summary task schedule and status are rolled up from execution leaves.",
-                    code="TASK_WBS_SUMMARY_EXECUTION_FORBIDDEN",
-                )
-
-        next_name = task.name if name is None else name
-        next_is_milestone = task.is_milestone if is_milestone is None else is_milestone
-        next_duration_days = task.duration_days if duration_days is None else duration_days
-        if next_is_milestone:
-            # Milestones are zero-duration -- normalized here (not left to
-            # Task's own model validator) because end_date below is
-            # computed from next_duration_days BEFORE replace() runs, and
-            # must already agree with what the domain will settle on.
-            next_duration_days = 0
-        next_start_date = task.start_date if start_date is None else start_date
-        next_end_date = task.end_date
-        if (start_date is not None or duration_days is not None or is_milestone is not None) and (
-            next_start_date and next_duration_days is not None
-        ):
-            next_end_date = self._work_calendar_engine.add_working_days(
-                next_start_date,
-                int(next_duration_days),
+            self._require_summary_schedule_unchanged(
+                task,
+                start_date=start_date,
+                duration_days=duration_days,
+                status=status,
             )
 
-        next_code = task.code
+        next_code = None
         if code is not None and code.strip():
             next_code = self._resolve_task_code(
                 code,
                 task.project_id,
-                next_name,
+                task.name if name is None else name,
                 exclude_id=task.id,
             )
 
-        candidate = replace(
+        candidate = self._with_task_fields(
             task,
-            name=next_name,
-            description=task.description if description is None else description,
-            start_date=next_start_date,
-            end_date=next_end_date,
-            duration_days=next_duration_days,
-            status=task.status if status is None else status,
-            priority=task.priority if priority is None else priority,
-            deadline=task.deadline if deadline is None else deadline,
+            name=name,
+            description=description,
+            start_date=start_date,
+            duration_days=duration_days,
+            status=status,
+            priority=priority,
+            deadline=deadline,
             code=next_code,
-            is_milestone=next_is_milestone,
+            is_milestone=is_milestone,
         )
 
         self._validate_task_within_project_dates(
@@ -124,25 +124,12 @@ class TaskProgressMixin:
             )
         self._require_leaf_task(task, operation_label="record progress")
 
-        next_percent_complete = task.percent_complete
-        next_status = task.status
-        if percent_complete is not None:
-            next_percent_complete = replace(task, percent_complete=percent_complete).percent_complete
-            if next_percent_complete == 0 and task.status != TaskStatus.TODO:
-                next_status = TaskStatus.TODO
-            elif 0 < next_percent_complete < 100 and task.status == TaskStatus.TODO:
-                next_status = TaskStatus.IN_PROGRESS
-            elif next_percent_complete == 100:
-                next_status = TaskStatus.DONE
-            elif next_percent_complete < 100 and task.status == TaskStatus.DONE:
-                next_status = TaskStatus.IN_PROGRESS
-
+        progressed = task if percent_complete is None else self._with_progress(task, percent_complete)
         candidate = replace(
-            task,
-            percent_complete=next_percent_complete,
+            progressed,
             actual_start=task.actual_start if actual_start is None else actual_start,
             actual_end=task.actual_end if actual_end is None else actual_end,
-            status=next_status if status is None else status,
+            status=progressed.status if status is None else status,
         )
         self._validate_task_within_project_dates(
             candidate.project_id,
@@ -31,7 +31,10 @@ class TaskValidationMixin:
         project = self._project_repo.get(project_id)
         if not project:
             raise NotFoundError("Project not found.", code="PROJECT_NOT_FOUND")
+        self._validate_task_dates_for_project(project, task_start, task_end)
 
+    @staticmethod
+    def _validate_task_dates_for_project(project, task_start: date | None, task_end: date | None):
         project_start = getattr(project, "start_date", None)
         project_end = getattr(project, "end_date", None)
 
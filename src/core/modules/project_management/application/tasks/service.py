@@ -16,9 +16,15 @@ from src.core.modules.project_management.application.tasks.commands.assignment_b
 from src.core.modules.project_management.application.tasks.commands.approved_schedule_change import (
     ApprovedScheduleChangeMixin,
 )
+from src.core.modules.project_management.application.tasks.commands.bulk_import import (
+    TaskBulkImportMixin,
+)
 from src.core.modules.project_management.application.tasks.commands.dependency import (
     TaskDependencyMixin,
 )
+from src.core.modules.project_management.application.tasks.commands.field_rules import (
+    TaskFieldRulesMixin,
+)
 from src.core.modules.project_management.application.tasks.commands.deletion import (
     TaskDeletionMixin,
 )
@@ -92,6 +98,8 @@ class TaskService(
     TaskProgressMixin,
     TaskDeletionMixin,
     TaskLifecycleMixin,
+    TaskBulkImportMixin,
+    TaskFieldRulesMixin,
     TaskDependencyDiagnosticsMixin,
     TaskDependencyMixin,
     TaskSchedulingConstraintMixin,
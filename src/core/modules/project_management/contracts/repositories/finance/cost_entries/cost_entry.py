@@ -13,6 +13,9 @@ class ProjectCostEntryRepository(ABC):
     @abstractmethod
     def add(self, entry: ProjectCostEntry) -> None: ...
 
+    @abstractmethod
+    def add_many(self, entries: list[ProjectCostEntry]) -> None: ...
+
     @abstractmethod
     def get(self, entry_id: str, *, for_update: bool = False) -> ProjectCostEntry | None: ...
 
@@ -35,6 +38,12 @@ class ProjectCostEntryRepository(ABC):
     @abstractmethod
     def update(self, entry: ProjectCostEntry, *, expected_row_version: int) -> None: ...
 
+    @abstractmethod
+    def update_many(self, entries: list[ProjectCostEntry]) -> None:
+        """Versioned bulk update; each entry's current ``row_version`` is
+        the expected version and is bumped in place on success."""
+        ...
+
     @abstractmethod
     def delete_draft(self, entry_id: str, *, expected_row_version: int) -> None:
         """Atomically delete a draft whose version still matches."""
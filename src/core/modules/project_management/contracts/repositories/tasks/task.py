@@ -21,9 +21,22 @@ class TaskRepository(ABC):
     @abstractmethod
     def add(self, task: Task) -> None: ...
 
+    @abstractmethod
+    def add_many(self, tasks: list[Task]) -> None:
+        """Bulk insert -- imports and generators writing more than a
+        handful of tasks must use this instead of an ``add()`` loop; the
+        project scope is checked once per batch."""
+        ...
+
     @abstractmethod
     def update(self, task: Task) -> None: ...
 
+    @abstractmethod
+    def update_many(self, tasks: list[Task]) -> None:
+        """Versioned bulk update; bumps ``version`` on every task like
+        ``update()`` does."""
+        ...
+
     @abstractmethod
     def delete(self, task_id: str) -> None: ...
 
@@ -48,6 +61,9 @@ class AssignmentRepository(ABC):
     @abstractmethod
     def add(self, assignment: TaskAssignment) -> None: ...
 
+    @abstractmethod
+    def add_many(self, assignments: list[TaskAssignment]) -> None: ...
+
     @abstractmethod
     def get(self, assignment_id: str) -> TaskAssignment | None: ...
 
@@ -66,6 +82,9 @@ class AssignmentRepository(ABC):
     @abstractmethod
     def update(self, assignment: TaskAssignment) -> None: ...
 
+    @abstractmethod
+    def update_many(self, assignments: list[TaskAssignment]) -> None: ...
+
     @abstractmethod
     def update_planned_hours_with_version_check(
         self, assignment: TaskAssignment, *, expected_version: int
@@ -106,12 +125,18 @@ class DependencyRepository(ABC):
     @abstractmethod
     def add(self, dependency: TaskDependency) -> None: ...
 
+    @abstractmethod
+    def add_many(self, dependencies: list[TaskDependency]) -> None: ...
+
     @abstractmethod
     def get(self, dependency_id: str) -> TaskDependency | None: ...
 
     @abstractmethod
     def update(self, dependency: TaskDependency) -> None: ...
 
+    @abstractmethod
+    def update_many(self, dependencies: list[TaskDependency]) -> None: ...
+
     @abstractmethod
     def list_by_project(self, project_id: str) -> list[TaskDependency]: ...
 
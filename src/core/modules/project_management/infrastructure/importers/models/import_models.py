@@ -62,6 +62,8 @@ class ImportPreviewModel:
     rows: list[ImportRow] = field(default_factory=list)
     issues: list[ImportValidationIssue] = field(default_factory=list)
     created_at: datetime | None = None
+    # Records of the source's other kinds (e.g. "Resource", "TASKPRED"), by kind.
+    record_counts: dict[str, int] = field(default_factory=dict)
 
     @property
     def can_commit(self) -> bool:
@@ -1,5 +1,8 @@
 """Microsoft Project XML importer."""
 
 from src.core.modules.project_management.infrastructure.importers.scheduling.mpp.mpp_parser import MSProjectXmlParser
+from src.core.modules.project_management.infrastructure.importers.scheduling.mpp.mpp_stream_parser import (
+    MSProjectXmlStreamingParser,
+)
 
-__all__ = ["MSProjectXmlParser"]
+__all__ = ["MSProjectXmlParser", "MSProjectXmlStreamingParser"]
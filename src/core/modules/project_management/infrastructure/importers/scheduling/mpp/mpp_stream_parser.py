@@ -0,0 +1,238 @@
+"""Streaming Microsoft Project XML parser."""
+
+from __future__ import annotations
+
+import io
+import os
+import xml.etree.ElementTree as ET
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from src.core.modules.project_management.infrastructure.importers.models.import_models import (
+    ImportMappingProfile,
+    ImportRow,
+)
+from src.core.modules.project_management.infrastructure.importers.scheduling.mpp.mpp_parser import (
+    MSProjectXmlParser,
+)
+
+MSP_NAMESPACE = "http://schemas.microsoft.com/project"
+DEFAULT_MSP_BATCH_SIZE = 1000
+MAPPED_MSP_ELEMENTS = ("Task", "Resource", "Assignment")
+
+MspXmlSource = bytes | str | os.PathLike
+
+
+@dataclass(frozen=True)
+class MspRecord:
+    """One ``<Task>``, ``<Resource>`` or ``<Assignment>`` element, keyed by
+    the local names of its child elements. Task predecessor links are
+    folded into a ``Predecessors`` field (``uid:type:lag`` tokens)."""
+
+    element: str
+    fields: dict[str, str]
+
+
+def _local_name(tag: str) -> str:
+    return tag.split("}")[-1] if "}" in tag else tag
+
+
+def iter_msp_records(
+    source: IO[bytes] | IO[str],
+    *,
+    elements: Collection[str] = MAPPED_MSP_ELEMENTS,
+) -> Iterator[MspRecord]:
+    """Yield the records of ``elements`` as each element closes.
+
+    Only ``<Project>/<Tasks>/<Task>``-shaped elements (``Resources/Resource``,
+    ``Assignments/Assignment``) are read. Every element directly under a
+    collection -- wanted or not, e.g. ``<Calendar>`` or ``<ExtendedAttribute>``
+    -- and every top-level element is dropped from the tree as it closes, so
+    memory stays bounded by the largest single record rather than the
+    document.
+
+    Raises ``ET.ParseError`` for malformed XML."""
+    wanted = {f"{{{MSP_NAMESPACE}}}{name}": name for name in elements}
+    collections = {f"{{{MSP_NAMESPACE}}}{name}s" for name in elements}
+    predecessor_link = f"{{{MSP_NAMESPACE}}}PredecessorLink"
+    path: list[ET.Element] = []
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            path.append(element)
+            continue
+        path.pop()
+        depth = len(path)
+        if depth == 2:
+            if element.tag in wanted and path[1].tag in collections:
+                record = _msp_record(wanted[element.tag], element, predecessor_link)
+                path[1].remove(element)
+                yield record
+            else:
+                path[1].remove(element)
+        elif depth == 1:
+            path[0].remove(element)
+
+
+def _msp_record(name: str, element: ET.Element, predecessor_link: str) -> MspRecord:
+    fields: dict[str, str] = {}
+    predecessors: list[str] = []
+    for child in element:
+        if child.tag == predecessor_link:
+            predecessors.append(_predecessor_token(child))
+            continue
+        fields[_local_name(child.tag)] = (child.text or "").strip()
+    if predecessors:
+        fields["Predecessors"] = ";".join(predecessors)
+    return MspRecord(name, fields)
+
+
+def _predecessor_token(link: ET.Element) -> str:
+    values: dict[str, str] = {}
+    for child in link:
+        values.setdefault(_local_name(child.tag), child.text or "")
+    pred_uid = values.get("PredecessorUID", "")
+    link_type = values.get("Type", "0") or "0"
+    lag = values.get("LinkLag", "0") or "0"
+    return f"{pred_uid.strip()}:{link_type.strip()}:{lag.strip()}"
+
+
+def _is_placeholder_task(fields: dict[str, str]) -> bool:
+    return fields.get("UID", "") == "0" or (fields.get("IsNull") or "0") == "1"
+
+
+class MSProjectXmlStreamingParser(MSProjectXmlParser):
+    """
+    MS Project XML parser built on ``ElementTree.iterparse``.
+
+    ``MSProjectXmlParser`` builds the whole document tree before mapping a
+    single task. This parser handles each ``<Task>`` as its end tag is
+    read, then removes it from the tree, so a 100k-task export is mapped
+    with the memory of one task plus the current batch.
+    ``iter_element_batches`` hands tasks, resources and assignments over in
+    batches of ``batch_size``, in file order (MS Project writes all tasks
+    before resources and assignments); ``iter_row_batches`` and
+    ``iter_import_batches`` map its task batches to import rows.
+
+    Row output matches ``MSProjectXmlParser``, which is kept as the
+    fallback parser.
+    """
+
+    def __init__(self, *, batch_size: int = DEFAULT_MSP_BATCH_SIZE) -> None:
+        self._batch_size = max(1, int(batch_size))
+
+    def parse(
+        self,
+        source: MspXmlSource,
+        mapping: ImportMappingProfile | None = None,
+    ) -> list[ImportRow]:
+        rows: list[ImportRow] = []
+        for batch in self.iter_row_batches(source, mapping):
+            rows.extend(batch)
+        return rows
+
+    def detect_headers(self, source: MspXmlSource) -> list[str]:
+        """Child elements of the first task; only the document up to that
+        task is read."""
+        try:
+            with _open_xml(source) as handle:
+                for record in iter_msp_records(handle, elements=("Task",)):
+                    headers = list(record.fields)
+                    if "Predecessors" in headers:
+                        headers.remove("Predecessors")
+                    return headers or list(self._DEFAULT_MAP)
+        except ET.ParseError:
+            pass
+        return list(self._DEFAULT_MAP)
+
+    def iter_row_batches(
+        self,
+        source: MspXmlSource,
+        mapping: ImportMappingProfile | None = None,
+    ) -> Iterator[list[ImportRow]]:
+        """Task rows (skipping the project summary and null tasks) in
+        batches."""
+        for _element, rows in self.iter_import_batches(source, mapping, elements=("Task",)):
+            yield rows
+
+    def iter_import_batches(
+        self,
+        source: MspXmlSource,
+        mapping: ImportMappingProfile | None = None,
+        *,
+        elements: Collection[str] = MAPPED_MSP_ELEMENTS,
+    ) -> Iterator[tuple[str, list[ImportRow] | list[dict[str, str]]]]:
+        """``iter_element_batches`` with each task batch mapped to import
+        rows, numbered across batches; resource and assignment batches are
+        passed through as records."""
+        row_number = 0
+        for element, records in self.iter_element_batches(source, elements=elements):
+            if element != "Task":
+                yield element, records
+                continue
+            rows: list[ImportRow] = []
+            for fields in records:
+                row_number += 1
+                rows.append(
+                    ImportRow(
+                        row_number=row_number,
+                        source_data=fields,
+                        mapped_data=self._apply_mapping(fields, mapping),
+                    )
+                )
+            yield element, rows
+
+    def iter_element_batches(
+        self,
+        source: MspXmlSource,
+        *,
+        elements: Collection[str] = MAPPED_MSP_ELEMENTS,
+    ) -> Iterator[tuple[str, list[dict[str, str]]]]:
+        """``(element, records)`` batches of at most ``batch_size`` records
+        for each of ``elements``, in file order. An element's last batch is
+        emitted before the next collection starts. Task predecessor links
+        may point at tasks later in the file, so a writer resolves them
+        once every task batch has been written."""
+        batch: list[dict[str, str]] = []
+        batch_element: str | None = None
+        for record in self._records(source, elements=elements):
+            if record.element == "Task" and _is_placeholder_task(record.fields):
+                continue
+            if batch and (record.element != batch_element or len(batch) >= self._batch_size):
+                yield batch_element, batch
+                batch = []
+            batch_element = record.element
+            batch.append(record.fields)
+        if batch:
+            yield batch_element, batch
+
+    @staticmethod
+    def _records(source: MspXmlSource, *, elements: Collection[str]) -> Iterator[MspRecord]:
+        try:
+            with _open_xml(source) as handle:
+                yield from iter_msp_records(handle, elements=elements)
+        except ET.ParseError as exc:
+            raise ValueError(f"MS Project XML parse error: {exc}") from exc
+
+
+@contextmanager
+def _open_xml(source: MspXmlSource) -> Iterator[IO[bytes] | IO[str]]:
+    if isinstance(source, bytes):
+        yield io.BytesIO(source)
+        return
+    if isinstance(source, str):
+        yield io.StringIO(source)
+        return
+    with Path(source).open("rb") as handle:
+        yield handle
+
+
+__all__ = [
+    "DEFAULT_MSP_BATCH_SIZE",
+    "MAPPED_MSP_ELEMENTS",
+    "MSProjectXmlStreamingParser",
+    "MspRecord",
+    "iter_msp_records",
+]
@@ -1,5 +1,8 @@
 """Oracle Primavera P6 XER importer."""
 
 from src.core.modules.project_management.infrastructure.importers.scheduling.primavera.p6_parser import P6Parser
+from src.core.modules.project_management.infrastructure.importers.scheduling.primavera.p6_stream_parser import (
+    P6StreamingParser,
+)
 
-__all__ = ["P6Parser"]
+__all__ = ["P6Parser", "P6StreamingParser"]
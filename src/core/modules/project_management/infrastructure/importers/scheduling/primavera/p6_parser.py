@@ -10,6 +10,13 @@ from src.core.modules.project_management.infrastructure.importers.models.import_
     ImportRow,
 )
 
+DEFAULT_TASK_HEADERS = (
+    "task_id", "proj_id", "task_code", "task_name", "task_type",
+    "status_code", "start_date", "end_date", "target_start_date",
+    "target_end_date", "act_start_date", "act_end_date",
+    "phys_complete_pct", "remain_drtn_hr_cnt",
+)
+
 class P6Parser(ImportParser):
     """
     Oracle Primavera P6 XER parser.
@@ -73,12 +80,7 @@ class P6Parser(ImportParser):
         task_rows = tables.get("TASK", [])
         if task_rows:
             return list(task_rows[0].keys())
-        return [
-            "task_id", "proj_id", "task_code", "task_name", "task_type",
-            "status_code", "start_date", "end_date", "target_start_date",
-            "target_end_date", "act_start_date", "act_end_date",
-            "phys_complete_pct", "remain_drtn_hr_cnt",
-        ]
+        return list(DEFAULT_TASK_HEADERS)
 
     @staticmethod
     def _parse_xer_tables(text: str) -> dict[str, list[dict[str, str]]]:
@@ -121,4 +123,4 @@ class P6Parser(ImportParser):
             result[fm.target_field] = source_data.get(fm.source_field, fm.default_value)
         return result
 
-__all__ = ["P6Parser"]
+__all__ = ["DEFAULT_TASK_HEADERS", "P6Parser"]
@@ -0,0 +1,249 @@
+"""Streaming Oracle Primavera P6 XER parser."""
+
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Collection, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.core.modules.project_management.domain.enums import DependencyType
+from src.core.modules.project_management.infrastructure.importers.models.import_models import (
+    ImportMappingProfile,
+    ImportRow,
+)
+from src.core.modules.project_management.infrastructure.importers.scheduling.primavera.p6_parser import (
+    DEFAULT_TASK_HEADERS,
+    P6Parser,
+)
+
+XER_ENCODING = "latin-1"
+DEFAULT_XER_BATCH_SIZE = 1000
+MAPPED_XER_TABLES = ("TASK", "TASKPRED", "CALENDAR", "TASKRSRC")
+
+XerSource = bytes | str | os.PathLike
+
+
+@dataclass(frozen=True)
+class XerRecord:
+    """One ``%R`` line of an XER table, keyed by the table's ``%F`` fields."""
+
+    table: str
+    fields: dict[str, str]
+
+
+def iter_xer_records(
+    lines: Iterable[str],
+    *,
+    tables: Collection[str] | None = None,
+) -> Iterator[XerRecord]:
+    """Yield the records of ``tables`` (all tables when ``None``) as the
+    lines go by. Records of other tables are skipped without being split."""
+    current_table: str | None = None
+    headers: list[str] = []
+    wanted = False
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+        if not line:
+            continue
+        tag = line[:2]
+        if tag == "%R":
+            if wanted and headers:
+                values = line[2:].strip().split("\t")
+                if len(values) < len(headers):
+                    values.extend([""] * (len(headers) - len(values)))
+                yield XerRecord(current_table, dict(zip(headers, values)))
+        elif tag == "%T":
+            current_table = line[2:].strip()
+            headers = []
+            wanted = tables is None or current_table in tables
+        elif tag == "%F":
+            headers = line[2:].strip().split("\t")
+        elif tag == "%E":
+            current_table = None
+            headers = []
+            wanted = False
+
+
+class P6StreamingParser(P6Parser):
+    """
+    XER parser that reads the export line by line instead of splitting the
+    whole text and building every table up front.
+
+    Only the tables being mapped are materialised, one record at a time.
+    ``iter_table_batches`` hands the raw records of each table over in
+    batches of ``batch_size``; ``iter_import_batches`` maps them -- activities
+    to import rows, relationships, calendars and resource assignments to
+    records keyed by the PM field names. TASKPRED comes after TASK in an
+    export, so a first pass collects the predecessor tokens (the only
+    per-activity state kept), and a second pass streams the tables.
+
+    Row output matches ``P6Parser``, which is kept as the fallback parser.
+    """
+
+    def __init__(self, *, batch_size: int = DEFAULT_XER_BATCH_SIZE) -> None:
+        self._batch_size = max(1, int(batch_size))
+
+    def parse(
+        self,
+        source: XerSource,
+        mapping: ImportMappingProfile | None = None,
+    ) -> list[ImportRow]:
+        rows: list[ImportRow] = []
+        for batch in self.iter_row_batches(source, mapping):
+            rows.extend(batch)
+        return rows
+
+    def detect_headers(self, source: XerSource) -> list[str]:
+        """Fields of the first TASK table that has a record (as P6Parser)."""
+        with _open_lines(_decoded(source)) as lines:
+            for record in iter_xer_records(lines, tables=("TASK",)):
+                return list(record.fields)
+        return list(DEFAULT_TASK_HEADERS)
+
+    def iter_row_batches(
+        self,
+        source: XerSource,
+        mapping: ImportMappingProfile | None = None,
+    ) -> Iterator[list[ImportRow]]:
+        """Activity rows (with their ``predecessors`` field) in batches."""
+        for _table, rows in self.iter_import_batches(source, mapping, tables=("TASK",)):
+            yield rows
+
+    def iter_import_batches(
+        self,
+        source: XerSource,
+        mapping: ImportMappingProfile | None = None,
+        *,
+        tables: Collection[str] = MAPPED_XER_TABLES,
+    ) -> Iterator[tuple[str, list[ImportRow] | list[dict[str, object]]]]:
+        """``iter_table_batches`` with every batch mapped: TASK batches to
+        import rows numbered across batches, the other tables through
+        ``map_xer_record``."""
+        source = _decoded(source)
+        predecessors: dict[str, list[str]] = {}
+        if "TASK" in tables:
+            for _table, records in self.iter_table_batches(source, tables=("TASKPRED",)):
+                for fields in records:
+                    if fields.get("task_id"):
+                        predecessors.setdefault(fields["task_id"], []).append(_predecessor_token(fields))
+        row_number = 0
+        for table, records in self.iter_table_batches(source, tables=tables):
+            if table != "TASK":
+                yield table, [map_xer_record(table, fields) for fields in records]
+                continue
+            rows: list[ImportRow] = []
+            for source_data in records:
+                row_number += 1
+                tokens = predecessors.get(source_data.get("task_id", ""))
+                if tokens:
+                    source_data["predecessors"] = ";".join(tokens)
+                mapped = self._apply_mapping(source_data, mapping)
+                rows.append(ImportRow(row_number=row_number, source_data=source_data, mapped_data=mapped))
+            yield table, rows
+
+    def iter_table_batches(
+        self,
+        source: XerSource,
+        *,
+        tables: Collection[str] = MAPPED_XER_TABLES,
+    ) -> Iterator[tuple[str, list[dict[str, str]]]]:
+        """``(table, records)`` batches of at most ``batch_size`` records for
+        each of ``tables``, in file order. A table's last batch is emitted
+        before the next table starts, so a writer sees every activity before
+        the relationships that reference them."""
+        batch: list[dict[str, str]] = []
+        batch_table: str | None = None
+        with _open_lines(_decoded(source)) as lines:
+            for record in iter_xer_records(lines, tables=tables):
+                if batch and (record.table != batch_table or len(batch) >= self._batch_size):
+                    yield batch_table, batch
+                    batch = []
+                batch_table = record.table
+                batch.append(record.fields)
+        if batch:
+            yield batch_table, batch
+
+
+def _predecessor_token(fields: dict[str, str]) -> str:
+    return (
+        f"{fields.get('pred_task_id', '')}:{fields.get('pred_type', 'PR_FS')}:"
+        f"{fields.get('lag_hr_cnt', '0')}"
+    )
+
+
+# P6 stores lags and assignment quantities in hours; PM dependencies carry
+# whole days, at P6's default eight-hour day.
+_XER_HOURS_PER_DAY = 8.0
+_XER_DEPENDENCY_TYPES = {
+    "PR_FS": DependencyType.FINISH_TO_START,
+    "PR_FF": DependencyType.FINISH_TO_FINISH,
+    "PR_SS": DependencyType.START_TO_START,
+    "PR_SF": DependencyType.START_TO_FINISH,
+}
+
+
+def map_xer_record(table: str, fields: dict[str, str]) -> dict[str, object]:
+    """One TASKPRED, CALENDAR or TASKRSRC record keyed by the PM field
+    names (``source_id`` keeps the P6 key). Other tables pass through."""
+    if table == "TASKPRED":
+        lag_hours = _xer_number(fields.get("lag_hr_cnt"), 0.0)
+        return {
+            "source_id": fields.get("task_pred_id", ""),
+            "predecessor_task_id": fields.get("pred_task_id", ""),
+            "successor_task_id": fields.get("task_id", ""),
+            "dependency_type": _XER_DEPENDENCY_TYPES.get(
+                (fields.get("pred_type") or "PR_FS").strip().upper(),
+                DependencyType.FINISH_TO_START,
+            ),
+            "lag_days": int(round(lag_hours / _XER_HOURS_PER_DAY)),
+        }
+    if table == "CALENDAR":
+        return {
+            "source_id": fields.get("clndr_id", ""),
+            "name": fields.get("clndr_name", ""),
+            "is_default": (fields.get("default_flag") or "").strip().upper() == "Y",
+            "calendar_type": fields.get("clndr_type", ""),
+            "hours_per_day": _xer_number(fields.get("day_hr_cnt"), _XER_HOURS_PER_DAY),
+        }
+    if table == "TASKRSRC":
+        return {
+            "source_id": fields.get("taskrsrc_id", ""),
+            "task_id": fields.get("task_id", ""),
+            "resource_id": fields.get("rsrc_id", ""),
+            "allocation_percent": _xer_number(fields.get("target_qty_per_hr"), 1.0) * 100.0,
+            "allocated_planned_hours": _xer_number(fields.get("target_qty"), 0.0),
+        }
+    return dict(fields)
+
+
+def _xer_number(value: str | None, default: float) -> float:
+    try:
+        return float(value) if value not in (None, "") else default
+    except ValueError:
+        return default
+
+
+def _decoded(source: XerSource) -> str | os.PathLike:
+    return source.decode(XER_ENCODING) if isinstance(source, bytes) else source
+
+
+@contextmanager
+def _open_lines(source: str | os.PathLike) -> Iterator[Iterable[str]]:
+    if isinstance(source, str):
+        yield io.StringIO(source, newline="")
+        return
+    with Path(source).open("r", encoding=XER_ENCODING, newline="") as handle:
+        yield handle
+
+
+__all__ = [
+    "DEFAULT_XER_BATCH_SIZE",
+    "MAPPED_XER_TABLES",
+    "P6StreamingParser",
+    "XerRecord",
+    "iter_xer_records",
+    "map_xer_record",
+]
@@ -10,7 +10,11 @@ from src.core.modules.project_management.application.common.module_guard import
 from src.core.modules.project_management.application.projects import ProjectService
 from src.core.modules.project_management.application.resources import ResourceService
 from src.core.modules.project_management.application.tasks import TaskService
-from src.core.platform.application.data_operations.importing import CsvImportRuntime, ImportDefinitionRegistry
+from src.core.platform.application.data_operations.importing import (
+    DEFAULT_IMPORT_CHUNK_SIZE,
+    CsvImportRuntime,
+    ImportDefinitionRegistry,
+)
 
 from src.core.modules.project_management.infrastructure.importers.models import (
     ImportFieldSpec,
@@ -88,6 +92,12 @@ class DataImportService(ProjectManagementModuleGuardMixin):
                 "resources": lambda rows: import_resources(rows, resource_service=resource_service),
                 "tasks": lambda rows: import_tasks(rows, project_service=project_service, task_service=task_service),
             },
+            # Task rows may name a parent WBS code declared later in the file,
+            # so tasks are executed as one batch rather than in chunks.
+            chunk_sizes={
+                "projects": DEFAULT_IMPORT_CHUNK_SIZE,
+                "resources": DEFAULT_IMPORT_CHUNK_SIZE,
+            },
         )
         self._import_registry = registry
         self._import_runtime = import_runtime or CsvImportRuntime(
@@ -29,6 +29,7 @@ class CallbackImportDefinition:
     execute_handler: ExecutionHandler
     module_code: str = "project_management"
     permission_code: str = "import.manage"
+    chunk_size: int | None = None
 
     def field_specs(self) -> tuple[ImportFieldSpec, ...]:
         return self.field_specs_value
@@ -46,6 +47,7 @@ def register_project_management_import_definitions(
     schemas: dict[str, tuple[ImportFieldSpec, ...]],
     preview_handlers: dict[str, PreviewHandler],
     execution_handlers: dict[str, ExecutionHandler],
+    chunk_sizes: dict[str, int] | None = None,
 ) -> ImportDefinitionRegistry:
     for operation_key, field_specs in schemas.items():
         if registry.has(operation_key):
@@ -56,6 +58,7 @@ def register_project_management_import_definitions(
                 field_specs_value=field_specs,
                 preview_handler=preview_handlers[operation_key],
                 execute_handler=execution_handlers[operation_key],
+                chunk_size=(chunk_sizes or {}).get(operation_key),
             )
         )
     return registry
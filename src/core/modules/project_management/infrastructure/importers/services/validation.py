@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
 from src.core.modules.project_management.domain.identifiers import generate_id
@@ -14,6 +15,8 @@ from src.core.modules.project_management.infrastructure.importers.models.import_
     ImportValidationSeverity,
 )
 
+DEFAULT_PREVIEW_SAMPLE_ROWS = 50
+
 class ImportValidationService:
     """Validates parsed ImportRows against PM business rules before commit."""
 
@@ -86,6 +89,66 @@ class ImportValidationService:
             created_at=datetime.now(timezone.utc),
         )
 
+    def preview_builder(
+        self,
+        *,
+        required_fields: list[str] | None = None,
+        sample_size: int = DEFAULT_PREVIEW_SAMPLE_ROWS,
+    ) -> ImportPreviewBuilder:
+        return ImportPreviewBuilder(self, required_fields=required_fields, sample_size=sample_size)
+
+class ImportPreviewBuilder:
+    """Builds an ImportPreviewModel from row batches as a streaming parser
+    produces them. Every row is validated and counted, but only the first
+    ``sample_size`` rows are kept for display; the other record kinds of the
+    source (resources, relationships, ...) are counted per kind."""
+
+    def __init__(
+        self,
+        service: ImportValidationService,
+        *,
+        required_fields: list[str] | None = None,
+        sample_size: int = DEFAULT_PREVIEW_SAMPLE_ROWS,
+    ) -> None:
+        self._service = service
+        self._required_fields = required_fields
+        self._sample_size = max(0, int(sample_size))
+        self._rows: list[ImportRow] = []
+        self._issues: list[ImportValidationIssue] = []
+        self._record_counts: dict[str, int] = {}
+        self._total_rows = 0
+        self._error_rows = 0
+        self._warning_rows = 0
+
+    def add_rows(self, rows: Iterable[ImportRow]) -> None:
+        batch = list(rows)
+        issues = self._service.validate(batch, self._required_fields)
+        error_numbers = {i.row_number for i in issues if i.severity == ImportValidationSeverity.ERROR}
+        warning_numbers = {i.row_number for i in issues if i.severity == ImportValidationSeverity.WARNING}
+        self._total_rows += len(batch)
+        self._error_rows += sum(1 for r in batch if r.has_errors or r.row_number in error_numbers)
+        self._warning_rows += sum(1 for r in batch if r.row_number in warning_numbers)
+        self._issues.extend(issues)
+        room = self._sample_size - len(self._rows)
+        if room > 0:
+            self._rows.extend(batch[:room])
+
+    def count_records(self, kind: str, count: int) -> None:
+        self._record_counts[kind] = self._record_counts.get(kind, 0) + int(count)
+
+    def build(self) -> ImportPreviewModel:
+        return ImportPreviewModel(
+            session_id=generate_id(),
+            total_rows=self._total_rows,
+            valid_rows=self._total_rows - self._error_rows,
+            error_rows=self._error_rows,
+            warning_rows=self._warning_rows,
+            rows=list(self._rows),
+            issues=list(self._issues),
+            created_at=datetime.now(timezone.utc),
+            record_counts=dict(self._record_counts),
+        )
+
 class ImportMappingService:
     """Manages saved ImportMappingProfile objects."""
 
@@ -127,4 +190,9 @@ class ImportMappingService:
                 ))
         return profile
 
-__all__ = ["ImportMappingService", "ImportValidationService"]
+__all__ = [
+    "DEFAULT_PREVIEW_SAMPLE_ROWS",
+    "ImportMappingService",
+    "ImportPreviewBuilder",
+    "ImportValidationService",
+]
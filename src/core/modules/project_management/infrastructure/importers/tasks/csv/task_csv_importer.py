@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from src.core.modules.project_management.domain.enums import TaskStatus
+from src.core.modules.project_management.application.tasks.commands.bulk_import import TaskImportRow
 from src.core.platform.domain.data_operations.importing import ImportPreview, ImportPreviewRow, ImportSummary
 from src.core.modules.project_management.infrastructure.importers.utils.coercion import (
+    optional_constraint_type,
     optional_date,
+    optional_flag,
     optional_float,
     optional_int,
     optional_task_status,
@@ -17,6 +19,25 @@ from src.core.modules.project_management.infrastructure.importers.utils.lookup i
 )
 
 
+class _PreviewTaskIndex:
+    """A project's tasks, loaded once per preview rather than once per row."""
+
+    def __init__(self, tasks) -> None:
+        self.by_id = {task.id: task for task in tasks}
+        self.by_name: dict[str, object] = {}
+        for task in tasks:
+            self.by_name.setdefault(task.name.strip().lower(), task)
+        self.wbs_codes = {
+            str(getattr(task, "wbs_code", "") or "").strip().upper() for task in tasks
+        }
+
+    def find(self, *, task_id: str, name: str):
+        task = self.by_id.get(task_id) if task_id else None
+        if task is None:
+            task = self.by_name.get(name.strip().lower())
+        return task
+
+
 def preview_tasks(
     rows: list[tuple[int, dict[str, str]]],
     *,
@@ -25,6 +46,12 @@ def preview_tasks(
 ) -> ImportPreview:
     preview = ImportPreview(entity_type="tasks", available_columns=[], mapped_columns={})
     projects = build_project_lookup(project_service)
+    indexes: dict[str, _PreviewTaskIndex] = {}
+    file_wbs_codes: dict[str, set[str]] = {}
+    for _, candidate in rows:
+        file_wbs_codes.setdefault(str(candidate.get("project_id") or "").strip(), set()).add(
+            str(candidate.get("wbs_code") or "").strip().upper()
+        )
     for line_no, row in rows:
         try:
             project = resolve_project(
@@ -35,11 +62,12 @@ def preview_tasks(
             if project is None:
                 raise ValueError("Project reference is required via project_id or project_name.")
             name = required(row, "name")
-            tasks = task_service.list_tasks_for_project(project.id)
-            task_id = row.get("id") or ""
-            task = next((t for t in tasks if t.id == task_id), None) if task_id else None
-            if task is None:
-                task = next((t for t in tasks if t.name.strip().lower() == name.strip().lower()), None)
+            index = indexes.get(project.id)
+            if index is None:
+                index = indexes[project.id] = _PreviewTaskIndex(
+                    task_service.list_tasks_for_project(project.id)
+                )
+            task = index.find(task_id=row.get("id") or "", name=name)
             optional_date(row.get("start_date"))
             optional_int(row.get("duration_days"))
             optional_int(row.get("priority"))
@@ -47,21 +75,18 @@ def preview_tasks(
             optional_task_status(row.get("status"))
             optional_float(row.get("percent_complete"))
             optional_int(row.get("sort_order"))
+            optional_flag(row.get("is_milestone"))
+            optional_constraint_type(row.get("constraint_type"))
+            optional_date(row.get("constraint_date"))
             parent_wbs_code = str(row.get("parent_wbs_code") or "").strip().upper()
-            if parent_wbs_code:
-                available_wbs_codes = {
-                    str(getattr(item, "wbs_code", "") or "").strip().upper()
-                    for item in tasks
-                }
-                available_wbs_codes.update(
-                    str(candidate.get("wbs_code") or "").strip().upper()
-                    for _, candidate in rows
-                    if str(candidate.get("project_id") or "").strip() in {"", project.id}
+            if parent_wbs_code and not (
+                parent_wbs_code in index.wbs_codes
+                or parent_wbs_code in file_wbs_codes.get("", ())
+                or parent_wbs_code in file_wbs_codes.get(project.id, ())
+            ):
+                raise ValueError(
+                    f"Parent WBS code '{parent_wbs_code}' was not found in the project or import file."
                 )
-                if parent_wbs_code not in available_wbs_codes:
-                    raise ValueError(
-                        f"Parent WBS code '{parent_wbs_code}' was not found in the project or import file."
-                    )
             action = "UPDATE" if task is not None else "CREATE"
             preview.rows.append(
                 ImportPreviewRow(
@@ -89,138 +114,57 @@ def import_tasks(
     project_service,
     task_service,
 ) -> ImportSummary:
+    """Parse every row, then hand each project's rows to the task service as
+    one batch (one task load, one write transaction, one recalculation)."""
     summary = ImportSummary(entity_type="tasks")
     projects = build_project_lookup(project_service)
-    pending = list(rows)
-    while pending:
-        made_progress = False
-        next_pending: list[tuple[int, dict[str, str]]] = []
-        for line_no, row in pending:
-            project = None
-            parent_wbs_code = str(row.get("parent_wbs_code") or "").strip().upper()
-            try:
-                project = resolve_project(
-                    projects,
-                    project_id=row.get("project_id") or None,
-                    project_name=row.get("project_name") or None,
-                )
-                if project is None:
-                    raise ValueError("Project reference is required via project_id or project_name.")
-                current_tasks = task_service.list_tasks_for_project(project.id)
-                parent_task = next(
-                    (
-                        item
-                        for item in current_tasks
-                        if str(getattr(item, "wbs_code", "") or "").strip().upper()
-                        == parent_wbs_code
-                    ),
-                    None,
-                )
-                if parent_wbs_code and parent_task is None:
-                    next_pending.append((line_no, row))
-                    continue
-                _import_task_row(
-                    row,
-                    project=project,
-                    parent_task=parent_task,
-                    task_service=task_service,
-                    summary=summary,
-                )
-                made_progress = True
-            except Exception as exc:
-                summary.add_row_error(line_no=line_no, message=str(exc))
-                made_progress = True
+    batches: dict[str, list[TaskImportRow]] = {}
+    errors: list[tuple[int, str]] = []
+    for line_no, row in rows:
+        try:
+            project = resolve_project(
+                projects,
+                project_id=row.get("project_id") or None,
+                project_name=row.get("project_name") or None,
+            )
+            if project is None:
+                raise ValueError("Project reference is required via project_id or project_name.")
+            batches.setdefault(project.id, []).append(_parse_task_row(line_no, row))
+        except Exception as exc:
+            errors.append((line_no, str(exc)))
 
-        if not next_pending:
-            break
-        if not made_progress:
-            for line_no, row in next_pending:
-                parent_wbs_code = str(row.get("parent_wbs_code") or "").strip().upper()
-                summary.add_row_error(
-                    line_no=line_no,
-                    message=(
-                        f"Parent WBS code '{parent_wbs_code}' was not found or the imported hierarchy contains a cycle."
-                    ),
-                )
-            break
-        pending = next_pending
-    return summary
+    for project_id, batch in batches.items():
+        try:
+            result = task_service.import_task_batch(project_id, batch)
+        except Exception as exc:
+            errors.extend((item.line_no, str(exc)) for item in batch)
+            continue
+        summary.created_count += result.created_count
+        summary.updated_count += result.updated_count
+        errors.extend(result.errors)
 
+    for line_no, message in sorted(errors, key=lambda item: item[0]):
+        summary.add_row_error(line_no=line_no, message=message)
+    return summary
 
-def _import_task_row(
-    row: dict[str, str],
-    *,
-    project,
-    parent_task,
-    task_service,
-    summary: ImportSummary,
-) -> None:
-    name = required(row, "name")
-    tasks = task_service.list_tasks_for_project(project.id)
-    task = None
-    task_id = row.get("id") or ""
-    if task_id:
-        task = next((item for item in tasks if item.id == task_id), None)
-    if task is None:
-        task = next(
-            (item for item in tasks if item.name.strip().lower() == name.strip().lower()),
-            None,
-        )
-    payload = {
-        "name": name,
-        "code": str(row.get("task_code") or "").strip(),
-        "description": row.get("description", ""),
-        "start_date": optional_date(row.get("start_date")),
-        "duration_days": optional_int(row.get("duration_days")),
-        "priority": optional_int(row.get("priority")) or 0,
-        "deadline": optional_date(row.get("deadline")),
-    }
-    status = optional_task_status(row.get("status"))
-    percent_complete = optional_float(row.get("percent_complete"))
-    wbs_code = str(row.get("wbs_code") or "").strip()
-    sort_order = optional_int(row.get("sort_order"))
-    hierarchy_requested = bool(wbs_code or parent_task is not None or sort_order is not None)
-    if task is None:
-        created = task_service.create_task(
-            project.id,
-            status=status or TaskStatus.TODO,
-            parent_task_id=parent_task.id if parent_task is not None else None,
-            wbs_code=wbs_code,
-            sort_order=sort_order,
-            **payload,
-        )
-        if percent_complete is not None:
-            task_service.update_progress(created.id, percent_complete=percent_complete)
-        summary.created_count += 1
-        return
 
-    updated = task_service.update_task(
-        task.id,
-        expected_version=task.version,
-        status=status,
-        **payload,
-    )
-    target_parent_id = (
-        parent_task.id
-        if parent_task is not None
-        else (None if hierarchy_requested else task.parent_task_id)
+def _parse_task_row(line_no: int, row: dict[str, str]) -> TaskImportRow:
+    return TaskImportRow(
+        line_no=line_no,
+        name=required(row, "name"),
+        task_id=row.get("id") or "",
+        code=str(row.get("task_code") or "").strip(),
+        description=row.get("description") or "",
+        start_date=optional_date(row.get("start_date")),
+        duration_days=optional_int(row.get("duration_days")),
+        priority=optional_int(row.get("priority")),
+        deadline=optional_date(row.get("deadline")),
+        status=optional_task_status(row.get("status")),
+        percent_complete=optional_float(row.get("percent_complete")),
+        wbs_code=str(row.get("wbs_code") or "").strip(),
+        parent_wbs_code=str(row.get("parent_wbs_code") or "").strip().upper(),
+        sort_order=optional_int(row.get("sort_order")),
+        is_milestone=optional_flag(row.get("is_milestone")),
+        constraint_type=optional_constraint_type(row.get("constraint_type")),
+        constraint_date=optional_date(row.get("constraint_date")),
     )
-    if (
-        target_parent_id != task.parent_task_id
-        or (wbs_code and wbs_code.upper() != task.wbs_code)
-        or (sort_order is not None and sort_order != task.sort_order)
-    ):
-        updated = task_service.move_task(
-            updated.id,
-            parent_task_id=target_parent_id,
-            wbs_code=wbs_code or None,
-            sort_order=sort_order,
-            expected_version=updated.version,
-        )
-    if percent_complete is not None:
-        task_service.update_progress(
-            updated.id,
-            percent_complete=percent_complete,
-            expected_version=updated.version,
-        )
-    summary.updated_count += 1
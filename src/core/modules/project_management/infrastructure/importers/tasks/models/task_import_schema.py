@@ -16,4 +16,7 @@ TASK_IMPORT_SCHEMA: tuple[ImportFieldSpec, ...] = (
     ImportFieldSpec("deadline", "Deadline"),
     ImportFieldSpec("status", "Status"),
     ImportFieldSpec("percent_complete", "Percent Complete"),
+    ImportFieldSpec("is_milestone", "Milestone"),
+    ImportFieldSpec("constraint_type", "Constraint Type"),
+    ImportFieldSpec("constraint_date", "Constraint Date"),
 )
@@ -5,7 +5,12 @@ from __future__ import annotations
 from datetime import date
 from decimal import Decimal
 
-from src.core.modules.project_management.domain.enums import CostType, ProjectStatus, TaskStatus
+from src.core.modules.project_management.domain.enums import (
+    ConstraintType,
+    CostType,
+    ProjectStatus,
+    TaskStatus,
+)
 
 
 def required(row: dict[str, str], key: str) -> str:
@@ -42,6 +47,13 @@ def optional_bool(value: str | None, *, default: bool) -> bool:
     return text in {"1", "true", "yes", "y", "on"}
 
 
+def optional_flag(value: str | None) -> bool | None:
+    """``optional_bool`` that tells a blank cell (``None``) from "no"."""
+    if not str(value or "").strip():
+        return None
+    return optional_bool(value, default=False)
+
+
 def optional_project_status(value: str | None) -> ProjectStatus | None:
     text = str(value or "").strip().upper()
     return ProjectStatus(text) if text else None
@@ -52,6 +64,11 @@ def optional_task_status(value: str | None) -> TaskStatus | None:
     return TaskStatus(text) if text else None
 
 
+def optional_constraint_type(value: str | None) -> ConstraintType | None:
+    text = str(value or "").strip().lower()
+    return ConstraintType(text) if text else None
+
+
 def optional_cost_type(value: str | None) -> CostType | None:
     text = str(value or "").strip().upper()
     return CostType(text) if text else None
@@ -59,9 +76,11 @@ def optional_cost_type(value: str | None) -> CostType | None:
 
 __all__ = [
     "optional_bool",
+    "optional_constraint_type",
     "optional_cost_type",
     "optional_date",
     "optional_decimal",
+    "optional_flag",
     "optional_float",
     "optional_int",
     "optional_project_status",
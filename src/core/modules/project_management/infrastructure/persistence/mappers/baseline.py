@@ -56,17 +56,21 @@ def baseline_task_from_orm(obj: BaselineTaskORM) -> BaselineTask:
     )
 
 
+def baseline_task_to_row(task: BaselineTask) -> dict[str, object]:
+    return {
+        "id": task.id,
+        "baseline_id": task.baseline_id,
+        "task_id": task.task_id,
+        "task_name": task.task_name,
+        "baseline_start": task.baseline_start,
+        "baseline_finish": task.baseline_finish,
+        "baseline_duration_days": task.baseline_duration_days,
+        "baseline_planned_cost": task.baseline_planned_cost,
+    }
+
+
 def baseline_task_to_orm(task: BaselineTask) -> BaselineTaskORM:
-    return BaselineTaskORM(
-        id=task.id,
-        baseline_id=task.baseline_id,
-        task_id=task.task_id,
-        task_name=task.task_name,
-        baseline_start=task.baseline_start,
-        baseline_finish=task.baseline_finish,
-        baseline_duration_days=task.baseline_duration_days,
-        baseline_planned_cost=task.baseline_planned_cost,
-    )
+    return BaselineTaskORM(**baseline_task_to_row(task))
 
 
 def variance_record_from_orm(obj: BaselineVarianceRecordORM) -> BaselineVarianceRecord:
@@ -104,6 +108,7 @@ __all__ = [
     "baseline_to_orm",
     "baseline_task_from_orm",
     "baseline_task_to_orm",
+    "baseline_task_to_row",
     "variance_record_from_orm",
     "variance_record_to_orm",
 ]
@@ -15,56 +15,60 @@ from src.core.modules.project_management.infrastructure.persistence.orm.cost_ent
 )
 
 
+def cost_entry_to_row(entry: ProjectCostEntry) -> dict[str, object]:
+    return {
+        "id": entry.id,
+        "tenant_id": entry.tenant_id,
+        "organization_id": entry.organization_id,
+        "project_id": entry.project_id,
+        "description": entry.description,
+        "entry_kind": entry.entry_kind.value,
+        "status": entry.status.value,
+        "amount": entry.amount,
+        "currency_code": entry.currency_code,
+        "base_amount": entry.base_amount,
+        "base_currency_code": entry.base_currency_code,
+        "exchange_rate": entry.exchange_rate,
+        "exchange_rate_date": entry.exchange_rate_date,
+        "exchange_rate_source": entry.exchange_rate_source,
+        "exchange_rate_captured_at": entry.exchange_rate_captured_at,
+        "transaction_date": entry.transaction_date,
+        "posting_date": entry.posting_date,
+        "financial_period_id": entry.financial_period_id,
+        "cost_code_id": entry.cost_code_id,
+        "task_id": entry.task_id,
+        "resource_id": entry.resource_id,
+        "source_module": entry.source_module.value,
+        "source_type": entry.source_type.value,
+        "source_id": entry.source_id,
+        "source_line_id": entry.source_line_id,
+        "source_revision": entry.source_revision,
+        "source_content_hash": entry.source_content_hash,
+        "posting_purpose": entry.posting_purpose.value,
+        "idempotency_key": entry.idempotency_key,
+        "reverses_entry_id": entry.reverses_entry_id,
+        "reversed_by_entry_id": entry.reversed_by_entry_id,
+        "version": entry.row_version,
+        "created_by": entry.created_by,
+        "created_at": entry.created_at,
+        "updated_by": entry.updated_by,
+        "updated_at": entry.updated_at,
+        "submitted_by": entry.submitted_by,
+        "submitted_at": entry.submitted_at,
+        "approved_by": entry.approved_by,
+        "approved_at": entry.approved_at,
+        "rejected_by": entry.rejected_by,
+        "rejected_at": entry.rejected_at,
+        "rejection_notes": entry.rejection_notes,
+        "posted_by": entry.posted_by,
+        "posted_at": entry.posted_at,
+        "reversed_by": entry.reversed_by,
+        "reversed_at": entry.reversed_at,
+    }
+
+
 def cost_entry_to_orm(entry: ProjectCostEntry) -> ProjectCostEntryORM:
-    return ProjectCostEntryORM(
-        id=entry.id,
-        tenant_id=entry.tenant_id,
-        organization_id=entry.organization_id,
-        project_id=entry.project_id,
-        description=entry.description,
-        entry_kind=entry.entry_kind.value,
-        status=entry.status.value,
-        amount=entry.amount,
-        currency_code=entry.currency_code,
-        base_amount=entry.base_amount,
-        base_currency_code=entry.base_currency_code,
-        exchange_rate=entry.exchange_rate,
-        exchange_rate_date=entry.exchange_rate_date,
-        exchange_rate_source=entry.exchange_rate_source,
-        exchange_rate_captured_at=entry.exchange_rate_captured_at,
-        transaction_date=entry.transaction_date,
-        posting_date=entry.posting_date,
-        financial_period_id=entry.financial_period_id,
-        cost_code_id=entry.cost_code_id,
-        task_id=entry.task_id,
-        resource_id=entry.resource_id,
-        source_module=entry.source_module.value,
-        source_type=entry.source_type.value,
-        source_id=entry.source_id,
-        source_line_id=entry.source_line_id,
-        source_revision=entry.source_revision,
-        source_content_hash=entry.source_content_hash,
-        posting_purpose=entry.posting_purpose.value,
-        idempotency_key=entry.idempotency_key,
-        reverses_entry_id=entry.reverses_entry_id,
-        reversed_by_entry_id=entry.reversed_by_entry_id,
-        version=entry.row_version,
-        created_by=entry.created_by,
-        created_at=entry.created_at,
-        updated_by=entry.updated_by,
-        updated_at=entry.updated_at,
-        submitted_by=entry.submitted_by,
-        submitted_at=entry.submitted_at,
-        approved_by=entry.approved_by,
-        approved_at=entry.approved_at,
-        rejected_by=entry.rejected_by,
-        rejected_at=entry.rejected_at,
-        rejection_notes=entry.rejection_notes,
-        posted_by=entry.posted_by,
-        posted_at=entry.posted_at,
-        reversed_by=entry.reversed_by,
-        reversed_at=entry.reversed_at,
-    )
+    return ProjectCostEntryORM(**cost_entry_to_row(entry))
 
 
 def cost_entry_from_orm(row: ProjectCostEntryORM) -> ProjectCostEntry:
@@ -119,4 +123,4 @@ def cost_entry_from_orm(row: ProjectCostEntryORM) -> ProjectCostEntry:
     )
 
 
-__all__ = ["cost_entry_from_orm", "cost_entry_to_orm"]
+__all__ = ["cost_entry_from_orm", "cost_entry_to_orm", "cost_entry_to_row"]
@@ -7,32 +7,36 @@ from src.core.modules.project_management.domain.tasks.task import Task, TaskAssi
 from src.core.modules.project_management.infrastructure.persistence.orm.task import TaskAssignmentORM, TaskDependencyORM, TaskORM
 
 
-def task_to_orm(task: Task) -> TaskORM:
+def task_to_row(task: Task) -> dict[str, object]:
     constraint_type = getattr(task, "constraint_type", None)
-    return TaskORM(
-        id=task.id,
-        project_id=task.project_id,
-        task_code=getattr(task, "code", "") or None,
-        parent_task_id=task.parent_task_id,
-        wbs_code=task.wbs_code,
-        sort_order=task.sort_order,
-        name=task.name,
-        description=task.description,
-        start_date=task.start_date,
-        end_date=task.end_date,
-        duration_days=task.duration_days,
-        status=task.status,
-        priority=task.priority,
-        percent_complete=task.percent_complete,
-        actual_start=task.actual_start,
-        actual_end=task.actual_end,
-        deadline=task.deadline,
-        constraint_type=constraint_type.value if constraint_type is not None else None,
-        constraint_date=task.constraint_date,
-        is_milestone=getattr(task, "is_milestone", False),
-        resource_leveling_not_before=getattr(task, "resource_leveling_not_before", None),
-        version=getattr(task, "version", 1),
-    )
+    return {
+        "id": task.id,
+        "project_id": task.project_id,
+        "task_code": getattr(task, "code", "") or None,
+        "parent_task_id": task.parent_task_id,
+        "wbs_code": task.wbs_code,
+        "sort_order": task.sort_order,
+        "name": task.name,
+        "description": task.description,
+        "start_date": task.start_date,
+        "end_date": task.end_date,
+        "duration_days": task.duration_days,
+        "status": task.status,
+        "priority": task.priority,
+        "percent_complete": task.percent_complete,
+        "actual_start": task.actual_start,
+        "actual_end": task.actual_end,
+        "deadline": task.deadline,
+        "constraint_type": constraint_type.value if constraint_type is not None else None,
+        "constraint_date": task.constraint_date,
+        "is_milestone": getattr(task, "is_milestone", False),
+        "resource_leveling_not_before": getattr(task, "resource_leveling_not_before", None),
+        "version": getattr(task, "version", 1),
+    }
+
+
+def task_to_orm(task: Task) -> TaskORM:
+    return TaskORM(**task_to_row(task))
 
 
 def task_from_orm(obj: TaskORM) -> Task:
@@ -67,19 +71,23 @@ def task_from_orm(obj: TaskORM) -> Task:
     )
 
 
+def assignment_to_row(assignment: TaskAssignment) -> dict[str, object]:
+    return {
+        "id": assignment.id,
+        "task_id": assignment.task_id,
+        "resource_id": assignment.resource_id,
+        "project_resource_id": getattr(assignment, "project_resource_id", None),
+        "allocation_percent": assignment.allocation_percent,
+        "hours_logged": getattr(assignment, "hours_logged", 0.0),
+        "allocated_planned_hours": getattr(assignment, "allocated_planned_hours", Decimal("0")),
+        "version": getattr(assignment, "version", 1),
+        "response_status": getattr(assignment, "response_status", "pending"),
+        "responded_at": getattr(assignment, "responded_at", None),
+    }
+
+
 def assignment_to_orm(assignment: TaskAssignment) -> TaskAssignmentORM:
-    return TaskAssignmentORM(
-        id=assignment.id,
-        task_id=assignment.task_id,
-        resource_id=assignment.resource_id,
-        project_resource_id=getattr(assignment, "project_resource_id", None),
-        allocation_percent=assignment.allocation_percent,
-        hours_logged=getattr(assignment, "hours_logged", 0.0),
-        allocated_planned_hours=getattr(assignment, "allocated_planned_hours", Decimal("0")),
-        version=getattr(assignment, "version", 1),
-        response_status=getattr(assignment, "response_status", "pending"),
-        responded_at=getattr(assignment, "responded_at", None),
-    )
+    return TaskAssignmentORM(**assignment_to_row(assignment))
 
 
 def assignment_from_orm(obj: TaskAssignmentORM) -> TaskAssignment:
@@ -97,15 +105,19 @@ def assignment_from_orm(obj: TaskAssignmentORM) -> TaskAssignment:
     )
 
 
+def dependency_to_row(dependency: TaskDependency) -> dict[str, object]:
+    return {
+        "id": dependency.id,
+        "predecessor_task_id": dependency.predecessor_task_id,
+        "successor_task_id": dependency.successor_task_id,
+        "dependency_type": dependency.dependency_type,
+        "lag_days": dependency.lag_days,
+        "version": getattr(dependency, "version", 1),
+    }
+
+
 def dependency_to_orm(dependency: TaskDependency) -> TaskDependencyORM:
-    return TaskDependencyORM(
-        id=dependency.id,
-        predecessor_task_id=dependency.predecessor_task_id,
-        successor_task_id=dependency.successor_task_id,
-        dependency_type=dependency.dependency_type,
-        lag_days=dependency.lag_days,
-        version=getattr(dependency, "version", 1),
-    )
+    return TaskDependencyORM(**dependency_to_row(dependency))
 
 
 def dependency_from_orm(obj: TaskDependencyORM) -> TaskDependency:
@@ -121,9 +133,12 @@ def dependency_from_orm(obj: TaskDependencyORM) -> TaskDependency:
 
 __all__ = [
     "task_to_orm",
+    "task_to_row",
     "task_from_orm",
     "assignment_to_orm",
+    "assignment_to_row",
     "assignment_from_orm",
     "dependency_to_orm",
+    "dependency_to_row",
     "dependency_from_orm",
 ]
@@ -17,6 +17,7 @@ from src.core.modules.project_management.domain.financials.cost_entry import (
 from src.core.modules.project_management.infrastructure.persistence.mappers.cost_entry import (
     cost_entry_from_orm,
     cost_entry_to_orm,
+    cost_entry_to_row,
 )
 from src.core.modules.project_management.infrastructure.persistence.orm.cost_entry import (
     ProjectCostEntryORM,
@@ -27,12 +28,50 @@ from src.core.platform.application.tenant.tenancy.tenant_context import (
     TenantContextService,
 )
 from src.core.platform.common.exceptions import BusinessRuleError, NotFoundError
+from src.infra.persistence.db.bulk import BulkRowUpdate, bulk_insert, bulk_update
 from src.infra.persistence.db.optimistic import (
     delete_with_version_check,
     update_with_version_check,
 )
 
 
+def _cost_entry_update_values(entry: ProjectCostEntry) -> dict[str, object]:
+    return {
+        "description": entry.description,
+        "entry_kind": entry.entry_kind.value,
+        "status": entry.status.value,
+        "amount": entry.amount,
+        "currency_code": entry.currency_code,
+        "base_amount": entry.base_amount,
+        "base_currency_code": entry.base_currency_code,
+        "exchange_rate": entry.exchange_rate,
+        "exchange_rate_date": entry.exchange_rate_date,
+        "exchange_rate_source": entry.exchange_rate_source,
+        "exchange_rate_captured_at": entry.exchange_rate_captured_at,
+        "transaction_date": entry.transaction_date,
+        "posting_date": entry.posting_date,
+        "financial_period_id": entry.financial_period_id,
+        "cost_code_id": entry.cost_code_id,
+        "task_id": entry.task_id,
+        "resource_id": entry.resource_id,
+        "source_content_hash": entry.source_content_hash,
+        "reversed_by_entry_id": entry.reversed_by_entry_id,
+        "updated_by": entry.updated_by,
+        "updated_at": entry.updated_at,
+        "submitted_by": entry.submitted_by,
+        "submitted_at": entry.submitted_at,
+        "approved_by": entry.approved_by,
+        "approved_at": entry.approved_at,
+        "rejected_by": entry.rejected_by,
+        "rejected_at": entry.rejected_at,
+        "rejection_notes": entry.rejection_notes,
+        "posted_by": entry.posted_by,
+        "posted_at": entry.posted_at,
+        "reversed_by": entry.reversed_by,
+        "reversed_at": entry.reversed_at,
+    }
+
+
 class SqlAlchemyProjectCostEntryRepository(ProjectCostEntryRepository):
     def __init__(self, session: Session) -> None:
         self.session = session
@@ -44,6 +83,19 @@ class SqlAlchemyProjectCostEntryRepository(ProjectCostEntryRepository):
         self._require_project(entry.project_id, context)
         self.session.add(cost_entry_to_orm(entry))
 
+    def add_many(self, entries: list[ProjectCostEntry]) -> None:
+        if not entries:
+            return
+        context = self._context(operation_label="create project cost entries")
+        for entry in entries:
+            self._require_entity_scope(entry, context)
+        self._require_projects({entry.project_id for entry in entries}, context)
+        bulk_insert(
+            self.session,
+            ProjectCostEntryORM,
+            [cost_entry_to_row(entry) for entry in entries],
+        )
+
     def get(self, entry_id: str, *, for_update: bool = False) -> ProjectCostEntry | None:
         context = self._context(operation_label="access project cost entry")
         stmt = select(ProjectCostEntryORM).where(
@@ -124,40 +176,7 @@ class SqlAlchemyProjectCostEntryRepository(ProjectCostEntryRepository):
             ProjectCostEntryORM,
             entry.id,
             expected_row_version,
-            {
-                "description": entry.description,
-                "entry_kind": entry.entry_kind.value,
-                "status": entry.status.value,
-                "amount": entry.amount,
-                "currency_code": entry.currency_code,
-                "base_amount": entry.base_amount,
-                "base_currency_code": entry.base_currency_code,
-                "exchange_rate": entry.exchange_rate,
-                "exchange_rate_date": entry.exchange_rate_date,
-                "exchange_rate_source": entry.exchange_rate_source,
-                "exchange_rate_captured_at": entry.exchange_rate_captured_at,
-                "transaction_date": entry.transaction_date,
-                "posting_date": entry.posting_date,
-                "financial_period_id": entry.financial_period_id,
-                "cost_code_id": entry.cost_code_id,
-                "task_id": entry.task_id,
-                "resource_id": entry.resource_id,
-                "source_content_hash": entry.source_content_hash,
-                "reversed_by_entry_id": entry.reversed_by_entry_id,
-                "updated_by": entry.updated_by,
-                "updated_at": entry.updated_at,
-                "submitted_by": entry.submitted_by,
-                "submitted_at": entry.submitted_at,
-                "approved_by": entry.approved_by,
-                "approved_at": entry.approved_at,
-                "rejected_by": entry.rejected_by,
-                "rejected_at": entry.rejected_at,
-                "rejection_notes": entry.rejection_notes,
-                "posted_by": entry.posted_by,
-                "posted_at": entry.posted_at,
-                "reversed_by": entry.reversed_by,
-                "reversed_at": entry.reversed_at,
-            },
+            _cost_entry_update_values(entry),
             extra_filters={
                 "tenant_id": context.tenant_id,
                 "organization_id": context.organization_id,
@@ -167,6 +186,34 @@ class SqlAlchemyProjectCostEntryRepository(ProjectCostEntryRepository):
             stale_message="Project cost entry was updated by another user.",
         )
 
+    def update_many(self, entries: list[ProjectCostEntry]) -> None:
+        if not entries:
+            return
+        context = self._context(operation_label="update project cost entries")
+        for entry in entries:
+            self._require_entity_scope(entry, context)
+        versions = bulk_update(
+            self.session,
+            ProjectCostEntryORM,
+            [
+                BulkRowUpdate(
+                    row_id=entry.id,
+                    values=_cost_entry_update_values(entry),
+                    expected_version=entry.row_version,
+                    match={"project_id": entry.project_id},
+                )
+                for entry in entries
+            ],
+            extra_filters={
+                "tenant_id": context.tenant_id,
+                "organization_id": context.organization_id,
+            },
+            not_found_message="Project cost entry not found.",
+            stale_message="Project cost entry was updated by another user.",
+        )
+        for entry, version in zip(entries, versions):
+            entry.row_version = version
+
     def delete_draft(self, entry_id: str, *, expected_row_version: int) -> None:
         context = self._context(operation_label="delete draft project cost entry")
         delete_with_version_check(
@@ -218,5 +265,18 @@ class SqlAlchemyProjectCostEntryRepository(ProjectCostEntryRepository):
         if exists is None:
             raise NotFoundError("Project not found.")
 
+    def _require_projects(self, project_ids: set[str], context: ActiveScopeIds) -> None:
+        found = set(
+            self.session.execute(
+                select(ProjectORM.id).where(
+                    ProjectORM.id.in_(project_ids),
+                    ProjectORM.tenant_id == context.tenant_id,
+                    ProjectORM.organization_id == context.organization_id,
+                )
+            ).scalars().all()
+        )
+        if found != project_ids:
+            raise NotFoundError("Project not found.")
+
 
 __all__ = ["SqlAlchemyProjectCostEntryRepository"]
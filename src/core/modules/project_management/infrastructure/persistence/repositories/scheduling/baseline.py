@@ -14,7 +14,7 @@ from src.core.modules.project_management.infrastructure.persistence.orm.project
 from src.core.modules.project_management.infrastructure.persistence.mappers.baseline import (
     baseline_from_orm,
     baseline_task_from_orm,
-    baseline_task_to_orm,
+    baseline_task_to_row,
     baseline_to_orm,
     variance_record_from_orm,
     variance_record_to_orm,
@@ -26,6 +26,7 @@ from src.core.modules.project_management.infrastructure.persistence.orm.baseline
 )
 from src.core.platform.common.exceptions import BusinessRuleError, NotFoundError
 from src.core.platform.application.tenant.tenancy.tenant_context import ActiveScopeIds, TenantContextService
+from src.infra.persistence.db.bulk import bulk_insert
 from src.infra.persistence.db.optimistic import update_with_version_check
 
 
@@ -167,7 +168,7 @@ class SqlAlchemyBaselineRepository(BaselineRepository):
 
     def add_baseline_tasks(self, tasks: list[BaselineTask]) -> None:
         self._ensure_baselines_in_scope({task.baseline_id for task in tasks})
-        self.session.add_all([baseline_task_to_orm(task) for task in tasks])
+        bulk_insert(self.session, BaselineTaskORM, [baseline_task_to_row(task) for task in tasks])
 
     def list_tasks(self, baseline_id: str) -> list[BaselineTask]:
         stmt = select(BaselineTaskORM).where(
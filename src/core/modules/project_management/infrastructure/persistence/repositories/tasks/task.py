@@ -15,17 +15,48 @@ from src.core.modules.project_management.infrastructure.persistence.orm.resource
 from src.core.modules.project_management.infrastructure.persistence.orm.task import TaskAssignmentORM, TaskDependencyORM, TaskORM
 from src.core.platform.common.exceptions import BusinessRuleError, NotFoundError
 from src.core.platform.application.tenant.tenancy.tenant_context import ActiveScopeIds, TenantContextService
+from src.infra.persistence.db.bulk import BulkRowUpdate, bulk_insert, bulk_update
 from src.infra.persistence.db.optimistic import delete_with_version_check, update_with_version_check
 from src.core.modules.project_management.infrastructure.persistence.mappers.task import (
     assignment_from_orm,
     assignment_to_orm,
+    assignment_to_row,
     dependency_from_orm,
     dependency_to_orm,
+    dependency_to_row,
     task_from_orm,
     task_to_orm,
+    task_to_row,
 )
 
 
+def _task_update_values(task: Task) -> dict[str, object]:
+    return {
+        "project_id": task.project_id,
+        "task_code": getattr(task, "code", "") or None,
+        "parent_task_id": task.parent_task_id,
+        "wbs_code": task.wbs_code,
+        "sort_order": task.sort_order,
+        "name": task.name,
+        "description": task.description,
+        "start_date": task.start_date,
+        "end_date": task.end_date,
+        "duration_days": task.duration_days,
+        "status": task.status,
+        "priority": task.priority,
+        "percent_complete": task.percent_complete,
+        "actual_start": task.actual_start,
+        "actual_end": task.actual_end,
+        "deadline": task.deadline,
+        "constraint_type": (
+            task.constraint_type.value if task.constraint_type is not None else None
+        ),
+        "constraint_date": task.constraint_date,
+        "is_milestone": task.is_milestone,
+        "resource_leveling_not_before": task.resource_leveling_not_before,
+    }
+
+
 class SqlAlchemyTaskRepository(TaskRepository):
     def __init__(self, session: Session):
         self.session = session
@@ -68,6 +99,28 @@ class SqlAlchemyTaskRepository(TaskRepository):
         self._ensure_project_in_scope(task.project_id)
         self.session.add(task_to_orm(task))
 
+    def _ensure_projects_in_scope(self, project_ids: set[str]) -> None:
+        if not project_ids:
+            return
+        ctx = self._context()
+        found = set(
+            self.session.execute(
+                select(ProjectORM.id).where(
+                    ProjectORM.id.in_(project_ids),
+                    ProjectORM.tenant_id == ctx.tenant_id,
+                    ProjectORM.organization_id == ctx.organization_id,
+                )
+            ).scalars().all()
+        )
+        if found != project_ids:
+            raise NotFoundError("Project not found.")
+
+    def add_many(self, tasks: list[Task]) -> None:
+        if not tasks:
+            return
+        self._ensure_projects_in_scope({task.project_id for task in tasks})
+        bulk_insert(self.session, TaskORM, [task_to_row(task) for task in tasks])
+
     def update(self, task: Task) -> None:
         if self.get(task.id) is None:
             raise NotFoundError("Task not found.")
@@ -77,35 +130,40 @@ class SqlAlchemyTaskRepository(TaskRepository):
             TaskORM,
             task.id,
             getattr(task, "version", 1),
-            {
-                "project_id": task.project_id,
-                "task_code": getattr(task, "code", "") or None,
-                "parent_task_id": task.parent_task_id,
-                "wbs_code": task.wbs_code,
-                "sort_order": task.sort_order,
-                "name": task.name,
-                "description": task.description,
-                "start_date": task.start_date,
-                "end_date": task.end_date,
-                "duration_days": task.duration_days,
-                "status": task.status,
-                "priority": task.priority,
-                "percent_complete": task.percent_complete,
-                "actual_start": task.actual_start,
-                "actual_end": task.actual_end,
-                "deadline": task.deadline,
-                "constraint_type": (
-                    task.constraint_type.value if task.constraint_type is not None else None
-                ),
-                "constraint_date": task.constraint_date,
-                "is_milestone": task.is_milestone,
-                "resource_leveling_not_before": task.resource_leveling_not_before,
-            },
+            _task_update_values(task),
             extra_filters={"project_id": task.project_id},
             not_found_message="Task not found.",
             stale_message="Task was updated by another user.",
         )
 
+    def update_many(self, tasks: list[Task]) -> None:
+        if not tasks:
+            return
+        ctx = self._context()
+        self._ensure_projects_in_scope({task.project_id for task in tasks})
+        scoped_project_ids = select(ProjectORM.id).where(
+            ProjectORM.tenant_id == ctx.tenant_id,
+            ProjectORM.organization_id == ctx.organization_id,
+        )
+        versions = bulk_update(
+            self.session,
+            TaskORM,
+            [
+                BulkRowUpdate(
+                    row_id=task.id,
+                    values=_task_update_values(task),
+                    expected_version=getattr(task, "version", 1),
+                    match={"project_id": task.project_id},
+                )
+                for task in tasks
+            ],
+            scope_filters={"project_id": scoped_project_ids},
+            not_found_message="Task not found.",
+            stale_message="Task was updated by another user.",
+        )
+        for task, version in zip(tasks, versions):
+            task.version = version
+
     def delete(self, task_id: str) -> None:
         ctx = self._context()
         in_scope = (
@@ -234,6 +292,53 @@ class SqlAlchemyAssignmentRepository(AssignmentRepository):
         self._ensure_resource_in_scope(assignment.resource_id)
         self.session.add(assignment_to_orm(assignment))
 
+    def _ensure_tasks_in_scope(self, task_ids: set[str]) -> None:
+        if not task_ids:
+            return
+        ctx = self._context()
+        found = set(
+            self.session.execute(
+                select(TaskORM.id)
+                .join(ProjectORM, TaskORM.project_id == ProjectORM.id)
+                .where(
+                    TaskORM.id.in_(task_ids),
+                    ProjectORM.tenant_id == ctx.tenant_id,
+                    ProjectORM.organization_id == ctx.organization_id,
+                )
+            ).scalars().all()
+        )
+        if found != task_ids:
+            raise NotFoundError("Task not found.")
+
+    def _ensure_resources_in_scope(self, resource_ids: set[str]) -> None:
+        if not resource_ids:
+            return
+        ctx = self._context()
+        found = set(
+            self.session.execute(
+                select(ResourceORM.id).where(
+                    ResourceORM.id.in_(resource_ids),
+                    ResourceORM.tenant_id == ctx.tenant_id,
+                    ResourceORM.organization_id == ctx.organization_id,
+                )
+            ).scalars().all()
+        )
+        if found != resource_ids:
+            raise NotFoundError("Resource not found.")
+
+    def add_many(self, assignments: list[TaskAssignment]) -> None:
+        if not assignments:
+            return
+        self._ensure_tasks_in_scope({assignment.task_id for assignment in assignments})
+        self._ensure_resources_in_scope(
+            {assignment.resource_id for assignment in assignments}
+        )
+        bulk_insert(
+            self.session,
+            TaskAssignmentORM,
+            [assignment_to_row(assignment) for assignment in assignments],
+        )
+
     def get(self, assignment_id: str) -> TaskAssignment | None:
         stmt = self._project_scoped_stmt().where(TaskAssignmentORM.id == assignment_id)
         row = self.session.execute(stmt).scalar_one_or_none()
@@ -275,6 +380,37 @@ class SqlAlchemyAssignmentRepository(AssignmentRepository):
         row.response_status = assignment.response_status
         row.responded_at = assignment.responded_at
 
+    def update_many(self, assignments: list[TaskAssignment]) -> None:
+        if not assignments:
+            return
+        self._ensure_tasks_in_scope({assignment.task_id for assignment in assignments})
+        self._ensure_resources_in_scope(
+            {assignment.resource_id for assignment in assignments}
+        )
+        bulk_update(
+            self.session,
+            TaskAssignmentORM,
+            [
+                BulkRowUpdate(
+                    row_id=assignment.id,
+                    values={
+                        "task_id": assignment.task_id,
+                        "resource_id": assignment.resource_id,
+                        "allocation_percent": assignment.allocation_percent,
+                        "hours_logged": assignment.hours_logged,
+                        "allocated_planned_hours": assignment.allocated_planned_hours,
+                        "project_resource_id": assignment.project_resource_id,
+                        "response_status": assignment.response_status,
+                        "responded_at": assignment.responded_at,
+                    },
+                )
+                for assignment in assignments
+            ],
+            scope_filters={"id": self._scoped_assignment_ids()},
+            not_found_message="Assignment not found.",
+            stale_message="Assignment was updated by another user.",
+        )
+
     def update_planned_hours_with_version_check(
         self, assignment: TaskAssignment, *, expected_version: int
     ) -> TaskAssignment:
@@ -460,6 +596,83 @@ class SqlAlchemyDependencyRepository(DependencyRepository):
         self._ensure_same_project(dependency.predecessor_task_id, dependency.successor_task_id)
         self.session.add(dependency_to_orm(dependency))
 
+    def _task_projects_in_scope(self, task_ids: set[str]) -> dict[str, str]:
+        ctx = self._context()
+        rows = self.session.execute(
+            select(TaskORM.id, TaskORM.project_id)
+            .join(ProjectORM, TaskORM.project_id == ProjectORM.id)
+            .where(
+                TaskORM.id.in_(task_ids),
+                ProjectORM.tenant_id == ctx.tenant_id,
+                ProjectORM.organization_id == ctx.organization_id,
+            )
+        ).all()
+        project_by_task = {row[0]: row[1] for row in rows}
+        if set(project_by_task) != task_ids:
+            raise NotFoundError("Task not found.")
+        return project_by_task
+
+    def _ensure_batch_endpoints(self, dependencies: list[TaskDependency]) -> None:
+        """Batch form of the per-edge scope and same-project checks: one
+        SELECT over the distinct endpoints of the whole batch."""
+        project_by_task = self._task_projects_in_scope(
+            {
+                task_id
+                for dependency in dependencies
+                for task_id in (dependency.predecessor_task_id, dependency.successor_task_id)
+            }
+        )
+        for dependency in dependencies:
+            if (
+                project_by_task[dependency.predecessor_task_id]
+                != project_by_task[dependency.successor_task_id]
+            ):
+                raise BusinessRuleError(
+                    "Dependencies are allowed only between tasks in the same project.",
+                    code="DEPENDENCY_CROSS_PROJECT",
+                )
+
+    def add_many(self, dependencies: list[TaskDependency]) -> None:
+        if not dependencies:
+            return
+        self._ensure_batch_endpoints(dependencies)
+        bulk_insert(
+            self.session,
+            TaskDependencyORM,
+            [dependency_to_row(dependency) for dependency in dependencies],
+        )
+
+    def update_many(self, dependencies: list[TaskDependency]) -> None:
+        if not dependencies:
+            return
+        self._ensure_batch_endpoints(dependencies)
+        scoped_task_ids = self._scoped_task_ids()
+        versions = bulk_update(
+            self.session,
+            TaskDependencyORM,
+            [
+                BulkRowUpdate(
+                    row_id=dependency.id,
+                    values={
+                        "predecessor_task_id": dependency.predecessor_task_id,
+                        "successor_task_id": dependency.successor_task_id,
+                        "dependency_type": dependency.dependency_type,
+                        "lag_days": dependency.lag_days,
+                    },
+                    expected_version=getattr(dependency, "version", 1),
+                )
+                for dependency in dependencies
+            ],
+            scope_filters={
+                "predecessor_task_id": scoped_task_ids,
+                "successor_task_id": scoped_task_ids,
+            },
+            not_found_message="Dependency not found.",
+            stale_message="Dependency was updated by another user.",
+        )
+        for dependency, version in zip(dependencies, versions):
+            dependency.version = version
+
     def get(self, dependency_id: str) -> TaskDependency | None:
         scoped_task_ids = self._scoped_task_ids()
         obj = self.session.execute(
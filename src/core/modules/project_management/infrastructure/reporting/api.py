@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from pathlib import Path
+from time import perf_counter
 
 from src.core.modules.project_management.infrastructure.reporting.models.contexts import (
     ExcelReportContext,
@@ -14,9 +15,14 @@ from src.core.modules.project_management.infrastructure.reporting.models.context
 from src.core.modules.project_management.infrastructure.reporting.templates.definitions import register_project_management_report_definitions
 from src.core.modules.project_management.infrastructure.reporting.exporters.renderers.evm import EvmCurveRenderer
 from src.core.modules.project_management.infrastructure.reporting.exporters.renderers.excel import ExcelReportRenderer
-from src.core.modules.project_management.infrastructure.reporting.exporters.renderers.gantt import GanttPngRenderer
+from src.core.modules.project_management.infrastructure.reporting.exporters.renderers.gantt import (
+    DEFAULT_GANTT_ROWS_PER_PAGE,
+    GanttPngRenderer,
+)
 from src.core.modules.project_management.infrastructure.reporting.exporters.renderers.pdf import PdfReportRenderer
 from src.core.modules.project_management.application.financials import FinanceService
+from src.core.modules.project_management.infrastructure.reporting.builders.snapshot import OPTIONAL_REPORT_SECTION_CODES
+from src.core.modules.project_management.infrastructure.reporting.services.report_composition import ReportComposer
 from src.core.modules.project_management.infrastructure.reporting.services.reporting_service import ReportingService
 from src.core.modules.project_management.infrastructure.reporting.models.report_models import GanttTaskBar
 from src.core.platform.common.exceptions import BusinessRuleError
@@ -35,6 +41,9 @@ class GanttPngRequest:
     project_id: str
     output_path: str | Path
     bars: list[GanttTaskBar] | None = None
+    summary_level: int | None = None
+    # When set, the chart is split into pages of at most this many rows.
+    rows_per_page: int | None = None
 
 
 @dataclass(frozen=True)
@@ -57,6 +66,7 @@ class ExcelReportRequest:
     finance_period: str = "month"
     finance_ledger_offset: int = 0
     finance_ledger_limit: int = 500
+    inputs: ExcelReportContext | None = None
 
 
 @dataclass(frozen=True)
@@ -71,12 +81,13 @@ class PdfReportRequest:
     finance_period: str = "month"
     finance_ledger_offset: int = 0
     finance_ledger_limit: int = 500
+    inputs: ExcelReportContext | None = None
 
 
 _REPORT_RUNTIME: ReportRuntime | None = None
 
 
-_OPTIONAL_REPORT_CALL_CODES = frozenset({"NO_BASELINE", "PERMISSION_DENIED"})
+_OPTIONAL_REPORT_CALL_CODES = OPTIONAL_REPORT_SECTION_CODES
 
 
 def _optional_report_call(func, *args, **kwargs):
@@ -144,9 +155,47 @@ def _resolve_runtime_access_context(
     )
 
 
+def _supports_composition(reporting_service: object) -> bool:
+    return callable(getattr(reporting_service, "build_report_snapshot", None))
+
+
+def _compose_excel_context(request: ExcelReportRequest | PdfReportRequest) -> ExcelReportContext:
+    """Build the report's sections from one shared data snapshot; see
+    ``ReportComposer``. The section timings travel with the context."""
+    as_of = _resolved_as_of(request.as_of)
+    started = perf_counter()
+    finance_snapshot, finance_ledger_page = _finance_export_context(
+        request,
+        as_of=as_of,
+    )
+    finance_ms = round((perf_counter() - started) * 1000, 3)
+    report = ReportComposer(request.reporting_service).compose(
+        request.project_id,
+        baseline_id=request.baseline_id,
+        as_of=as_of,
+    )
+    return ExcelReportContext(
+        kpi=report.section("kpi"),
+        gantt=report.section("gantt"),
+        resources=report.section("resources"),
+        evm=report.section("evm"),
+        evm_series=report.section("evm_series"),
+        baseline_variance=report.section("baseline_variance"),
+        cost_breakdown=report.section("cost_breakdown"),
+        cost_sources=report.section("cost_sources"),
+        finance_snapshot=finance_snapshot,
+        finance_ledger_page=finance_ledger_page,
+        as_of=as_of,
+        generated_at=datetime.now(timezone.utc),
+        section_timings_ms={**report.timings_ms, "finance": finance_ms},
+    )
+
+
 def _build_excel_context(request: ExcelReportRequest) -> ExcelReportContext:
     as_of = _resolved_as_of(request.as_of)
     reporting_service = request.reporting_service
+    if _supports_composition(reporting_service):
+        return _compose_excel_context(request)
     get_evm = getattr(reporting_service, "get_earned_value", None)
     get_series = getattr(reporting_service, "get_evm_series", None)
     get_variance = getattr(reporting_service, "get_baseline_schedule_variance", None)
@@ -236,10 +285,48 @@ def _build_pdf_context(request: PdfReportRequest, gantt_path: Path | None) -> Pd
     )
 
 
+def _pdf_context_from_inputs(inputs: ExcelReportContext, gantt_path: Path | None) -> PdfReportContext:
+    return PdfReportContext(
+        kpi=inputs.kpi,
+        gantt_png_path=str(gantt_path) if gantt_path else "",
+        resources=inputs.resources,
+        evm=inputs.evm,
+        evm_series=inputs.evm_series,
+        baseline_variance=inputs.baseline_variance,
+        cost_breakdown=inputs.cost_breakdown,
+        cost_sources=inputs.cost_sources,
+        finance_snapshot=inputs.finance_snapshot,
+        finance_ledger_page=inputs.finance_ledger_page,
+        as_of=inputs.as_of,
+        generated_at=datetime.now(timezone.utc),
+        section_timings_ms=dict(inputs.section_timings_ms),
+    )
+
+
+def _timing_metadata(section_timings_ms: dict[str, float]) -> dict[str, object] | None:
+    return {"section_timings_ms": dict(section_timings_ms)} if section_timings_ms else None
+
+
 def _render_gantt_png(request: object) -> ExportArtifact:
     assert isinstance(request, GanttPngRequest)
     bars = request.bars if request.bars is not None else request.reporting_service.get_gantt_data(request.project_id)
-    rendered_path = GanttPngRenderer().render(bars, ensure_output_path(request.output_path))
+    if request.rows_per_page is not None:
+        page_paths = GanttPngRenderer().render_pages(
+            bars,
+            ensure_output_path(request.output_path),
+            rows_per_page=request.rows_per_page,
+            summary_level=request.summary_level,
+        )
+        return finalize_artifact(
+            page_paths[0],
+            media_type="image/png",
+            metadata={"page_paths": tuple(page_paths)},
+        )
+    rendered_path = GanttPngRenderer().render(
+        bars,
+        ensure_output_path(request.output_path),
+        summary_level=request.summary_level,
+    )
     return finalize_artifact(rendered_path, media_type="image/png")
 
 
@@ -259,11 +346,12 @@ def _render_evm_png(request: object) -> ExportArtifact:
 
 def _render_excel_report(request: object) -> ExportArtifact:
     assert isinstance(request, ExcelReportRequest)
-    ctx = _build_excel_context(request)
+    ctx = request.inputs if request.inputs is not None else _build_excel_context(request)
     rendered_path = ExcelReportRenderer().render(ctx, ensure_output_path(request.output_path))
     return finalize_artifact(
         rendered_path,
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        metadata=_timing_metadata(ctx.section_timings_ms),
     )
 
 
@@ -274,13 +362,32 @@ def _render_pdf_report(request: object) -> ExportArtifact:
     temp_dir.mkdir(parents=True, exist_ok=True)
     gantt_path: Path | None = temp_dir / f"gantt_{request.project_id}.png"
     try:
+        inputs = request.inputs
+        if inputs is None and _supports_composition(request.reporting_service):
+            inputs = _compose_excel_context(request)
+        started = perf_counter()
         try:
-            generate_gantt_png(request.reporting_service, request.project_id, gantt_path)
+            generate_gantt_png(
+                request.reporting_service,
+                request.project_id,
+                gantt_path,
+                bars=inputs.gantt if inputs is not None else None,
+            )
         except ValueError:
             gantt_path = None
-        ctx = _build_pdf_context(request, gantt_path)
+        gantt_ms = round((perf_counter() - started) * 1000, 3)
+        if inputs is not None:
+            ctx = _pdf_context_from_inputs(inputs, gantt_path)
+            if ctx.section_timings_ms:
+                ctx.section_timings_ms["gantt_png"] = gantt_ms
+        else:
+            ctx = _build_pdf_context(request, gantt_path)
         rendered_path = PdfReportRenderer().render(ctx, output_path)
-        return finalize_artifact(rendered_path, media_type="application/pdf")
+        return finalize_artifact(
+            rendered_path,
+            media_type="application/pdf",
+            metadata=_timing_metadata(ctx.section_timings_ms),
+        )
     finally:
         cleanup_temp_artifact(gantt_path, temp_dir=temp_dir)
 
@@ -302,12 +409,44 @@ def _get_report_runtime() -> ReportRuntime:
     return _REPORT_RUNTIME
 
 
+def build_report_inputs(
+    reporting_service: ReportingService,
+    project_id: str,
+    finance_service: FinanceService | None = None,
+    baseline_id: str | None = None,
+    as_of: date | None = None,
+    finance_period: str = "month",
+    finance_ledger_offset: int = 0,
+    finance_ledger_limit: int = 500,
+) -> ExcelReportContext:
+    """Read everything the Excel and PDF reports render, without rendering.
+
+    The result can be passed back as ``inputs`` to ``generate_excel_report``
+    or ``generate_pdf_report`` so a caller that inspects the data first (the
+    report scheduler fingerprints it) does not read it twice.
+    """
+    return _build_excel_context(
+        ExcelReportRequest(
+            reporting_service=reporting_service,
+            project_id=project_id,
+            output_path="",
+            finance_service=finance_service,
+            baseline_id=baseline_id,
+            as_of=as_of,
+            finance_period=finance_period,
+            finance_ledger_offset=finance_ledger_offset,
+            finance_ledger_limit=finance_ledger_limit,
+        )
+    )
+
+
 def generate_gantt_png(
     reporting_service: ReportingService,
     project_id: str,
     output_path: str | Path,
     *,
     bars: list[GanttTaskBar] | None = None,
+    summary_level: int | None = None,
     user_session: object | None = None,
     module_catalog_service: object | None = None,
 ) -> Path:
@@ -324,6 +463,7 @@ def generate_gantt_png(
                 project_id=project_id,
                 output_path=output_path,
                 bars=bars,
+                summary_level=summary_level,
             ),
             user_session=resolved_user_session,
             module_catalog_service=resolved_module_catalog_service,
@@ -331,6 +471,41 @@ def generate_gantt_png(
     )
 
 
+def generate_gantt_png_pages(
+    reporting_service: ReportingService,
+    project_id: str,
+    output_path: str | Path,
+    *,
+    rows_per_page: int = DEFAULT_GANTT_ROWS_PER_PAGE,
+    bars: list[GanttTaskBar] | None = None,
+    summary_level: int | None = None,
+    user_session: object | None = None,
+    module_catalog_service: object | None = None,
+) -> list[Path]:
+    """The Gantt chart as pages of at most ``rows_per_page`` rows on one
+    shared timeline, named ``<stem>_p001<suffix>`` and so on; keeps task
+    labels readable where ``generate_gantt_png`` would shrink the rows."""
+    resolved_user_session, resolved_module_catalog_service = _resolve_runtime_access_context(
+        reporting_service,
+        user_session=user_session,
+        module_catalog_service=module_catalog_service,
+    )
+    artifact = _get_report_runtime().render(
+        "gantt_png",
+        GanttPngRequest(
+            reporting_service=reporting_service,
+            project_id=project_id,
+            output_path=output_path,
+            bars=bars,
+            summary_level=summary_level,
+            rows_per_page=rows_per_page,
+        ),
+        user_session=resolved_user_session,
+        module_catalog_service=resolved_module_catalog_service,
+    )
+    return [Path(path) for path in artifact.metadata["page_paths"]]
+
+
 def generate_evm_png(
     reporting_service: ReportingService,
     project_id: str,
@@ -373,6 +548,7 @@ def generate_excel_report(
     finance_ledger_offset: int = 0,
     finance_ledger_limit: int = 500,
     *,
+    inputs: ExcelReportContext | None = None,
     user_session: object | None = None,
     module_catalog_service: object | None = None,
 ) -> Path:
@@ -394,6 +570,7 @@ def generate_excel_report(
                 finance_period=finance_period,
                 finance_ledger_offset=finance_ledger_offset,
                 finance_ledger_limit=finance_ledger_limit,
+                inputs=inputs,
             ),
             user_session=resolved_user_session,
             module_catalog_service=resolved_module_catalog_service,
@@ -413,6 +590,7 @@ def generate_pdf_report(
     finance_ledger_offset: int = 0,
     finance_ledger_limit: int = 500,
     *,
+    inputs: ExcelReportContext | None = None,
     user_session: object | None = None,
     module_catalog_service: object | None = None,
 ) -> Path:
@@ -435,6 +613,7 @@ def generate_pdf_report(
                 finance_period=finance_period,
                 finance_ledger_offset=finance_ledger_offset,
                 finance_ledger_limit=finance_ledger_limit,
+                inputs=inputs,
             ),
             user_session=resolved_user_session,
             module_catalog_service=resolved_module_catalog_service,
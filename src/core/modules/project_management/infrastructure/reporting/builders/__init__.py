@@ -12,11 +12,18 @@ from src.core.modules.project_management.infrastructure.reporting.builders.evm_c
 from src.core.modules.project_management.infrastructure.reporting.builders.evm_series import ReportingEvmSeriesMixin
 from src.core.modules.project_management.infrastructure.reporting.builders.kpi import ReportingKpiMixin
 from src.core.modules.project_management.infrastructure.reporting.builders.labor import ReportingLaborMixin
+from src.core.modules.project_management.infrastructure.reporting.builders.snapshot import (
+    OPTIONAL_REPORT_SECTION_CODES,
+    ReportDataSnapshot,
+    ReportingSnapshotMixin,
+)
 from src.core.modules.project_management.infrastructure.reporting.builders.variance import ReportingVarianceMixin
 
 __all__ = [
+    "OPTIONAL_REPORT_SECTION_CODES",
     "CostControlTotals",
     "CostPolicySnapshot",
+    "ReportDataSnapshot",
     "ReportingBaselineCompareMixin",
     "ReportingCostBreakdownMixin",
     "ReportingCostPolicyMixin",
@@ -25,5 +32,6 @@ __all__ = [
     "ReportingEvmSeriesMixin",
     "ReportingKpiMixin",
     "ReportingLaborMixin",
+    "ReportingSnapshotMixin",
     "ReportingVarianceMixin",
 ]
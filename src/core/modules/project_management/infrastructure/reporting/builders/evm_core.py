@@ -5,10 +5,15 @@ Business logic lives in financials/earned_value/evm_calculator.py.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import date
 
 from src.core.platform.contract.port.time_management.calendar.calendar_protocol import CalendarProtocol
 from src.core.platform.common.exceptions import BusinessRuleError
+from src.core.modules.project_management.contracts.reads.financials import EvmSeriesFacts
+from src.core.modules.project_management.application.financials.cost.engines.cost_policy_engine import (
+    CostPolicyComposition,
+)
 from src.core.modules.project_management.application.financials.earned_value.evm_calculator import (
     EarnedValueCalculator,
 )
@@ -40,6 +45,17 @@ class ReportingEvmCoreMixin(ReportingCostPolicyMixin):
             baseline_id=baseline_id,
             as_of=resolved_as_of,
         )
+        return self._earned_value_from_policy(project_id, resolved_as_of, facts, policy)
+
+    def _earned_value_from_policy(
+        self,
+        project_id: str,
+        as_of: date,
+        facts: EvmSeriesFacts,
+        policy: CostPolicyComposition,
+        *,
+        working_days_between: Callable[[date, date], int] | None = None,
+    ) -> EarnedValueMetrics:
         if policy.snapshot.unresolved_labor_rates:
             raise BusinessRuleError(
                 "Actual cost cannot be calculated because one or more labor "
@@ -48,8 +64,9 @@ class ReportingEvmCoreMixin(ReportingCostPolicyMixin):
             )
         return self._make_evm_calculator().calculate(
             project_id,
-            as_of=resolved_as_of,
+            as_of=as_of,
             prepared_facts=facts,
             actual_cost=policy.totals.actual,
             approved_forecast_etc=policy.totals.forecast_etc,
+            working_days_between=working_days_between,
         )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from src.core.platform.contract.port.time_management.calendar.calendar_protocol import CalendarProtocol
 
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import date, timedelta
 from decimal import Decimal
 
@@ -19,8 +20,15 @@ from src.core.modules.project_management.application.scheduling.services.schedul
 from src.core.modules.project_management.application.scheduling.models.cpm import CPMTaskInfo
 from src.core.modules.project_management.application.resources.resource_load_engine import (
     ResourceLoadEngine,
+    ResourceLoadMetric,
 )
+from src.core.modules.project_management.application.financials.cost.engines.cost_policy_engine import (
+    CostPolicySnapshot,
+)
+from src.core.modules.project_management.domain.projects.project import Project
 from src.core.modules.project_management.domain.tasks.hierarchy import select_leaf_tasks
+from src.core.modules.project_management.domain.resources.resource import Resource
+from src.core.modules.project_management.domain.tasks.task import Task, TaskAssignment
 from src.core.modules.project_management.infrastructure.reporting.builders.cost_policy import (
     ReportingCostPolicyMixin,
 )
@@ -49,6 +57,16 @@ class ReportingKpiMixin(ReportingCostPolicyMixin):
             raise NotFoundError("Project not found.", code="PROJECT_NOT_FOUND")
 
         cpm_result = self._scheduling_engine.recalculate_project_schedule(project_id, persist=False)
+        return self._gantt_bars(
+            cpm_result,
+            select_leaf_tasks(self._task_repo.list_by_project(project_id)),
+        )
+
+    @staticmethod
+    def _gantt_bars(
+        cpm_result: Mapping[str, CPMTaskInfo],
+        leaf_tasks: Iterable[Task],
+    ) -> list[GanttTaskBar]:
         # cpm_result: dict[task_id, CPMTaskInfo]
         bars: list[GanttTaskBar] = []
 
@@ -67,12 +85,8 @@ class ReportingKpiMixin(ReportingCostPolicyMixin):
                 )
             )
         # Also include unscheduled tasks (no ES/EF)
-        all_tasks = {
-            task.id: task
-            for task in select_leaf_tasks(self._task_repo.list_by_project(project_id))
-        }
-        for tid, t in all_tasks.items():
-            if tid not in cpm_result:
+        for t in leaf_tasks:
+            if t.id not in cpm_result:
                 bars.append(
                     GanttTaskBar(
                         task_id=t.id,
@@ -99,11 +113,6 @@ class ReportingKpiMixin(ReportingCostPolicyMixin):
             raise NotFoundError("Project not found.", code="PROJECT_NOT_FOUND")
 
         tasks = select_leaf_tasks(self._task_repo.list_by_project(project_id))
-        tasks_total = len(tasks)
-        tasks_completed = sum(1 for t in tasks if str(t.status) in ("TaskStatus.DONE", "DONE"))
-        tasks_in_progress = sum(1 for t in tasks if str(t.status) in ("TaskStatus.IN_PROGRESS", "IN_PROGRESS"))
-        task_blocked = sum(1 for t in tasks if str(t.status) in ("TaskStatus.BLOCKED", "BLOCKED"))
-        tasks_not_started = tasks_total - tasks_completed - tasks_in_progress- task_blocked
 
         # Reuse CPM data for critical & late tasks
         cpm_result: dict[str, CPMTaskInfo] = (
@@ -114,6 +123,45 @@ class ReportingKpiMixin(ReportingCostPolicyMixin):
                 persist=False,
             )
         )
+
+        # Project dates & duration
+        duration_working_days = None
+        if project.start_date and project.end_date:
+            duration_working_days = self._calendar.working_days_between(
+                project.start_date,
+                project.end_date,
+            )
+
+        cost_snapshot = (
+            self._build_cost_policy_snapshot(project_id=project_id)
+            if self._has_finance_view(project_id)
+            else None
+        )
+        return self._compose_project_kpi(
+            project,
+            tasks,
+            cpm_result,
+            duration_working_days=duration_working_days,
+            cost_snapshot=cost_snapshot,
+        )
+
+    def _compose_project_kpi(
+        self,
+        project: Project,
+        tasks: Sequence[Task],
+        cpm_result: Mapping[str, CPMTaskInfo],
+        *,
+        duration_working_days: int | None,
+        cost_snapshot: CostPolicySnapshot | None,
+    ) -> ProjectKPI:
+        """KPIs from already-read facts; cost figures only when a cost
+        snapshot is given (the caller may view finance)."""
+        tasks_total = len(tasks)
+        tasks_completed = sum(1 for t in tasks if str(t.status) in ("TaskStatus.DONE", "DONE"))
+        tasks_in_progress = sum(1 for t in tasks if str(t.status) in ("TaskStatus.IN_PROGRESS", "IN_PROGRESS"))
+        task_blocked = sum(1 for t in tasks if str(t.status) in ("TaskStatus.BLOCKED", "BLOCKED"))
+        tasks_not_started = tasks_total - tasks_completed - tasks_in_progress- task_blocked
+
         critical_tasks = sum(1 for info in cpm_result.values() if info.is_critical)
         late_tasks = sum(
             1
@@ -121,21 +169,13 @@ class ReportingKpiMixin(ReportingCostPolicyMixin):
             if info.late_by_days is not None and info.late_by_days > 0
         )
 
-        # Project dates & duration
-        start_date = project.start_date
-        end_date = project.end_date
-        duration_working_days = None
-        if start_date and end_date:
-            duration_working_days = self._calendar.working_days_between(start_date, end_date)
-
-        financial_detail_included = self._has_finance_view(project_id)
+        financial_detail_included = cost_snapshot is not None
         total_planned: Decimal | None = None
         total_committed: Decimal | None = None
         total_actual: Decimal | None = None
         cost_variance: Decimal | None = None
         committed_variance: Decimal | None = None
-        if financial_detail_included:
-            cost_snapshot = self._build_cost_policy_snapshot(project_id=project_id)
+        if cost_snapshot is not None:
             total_planned = self._sum_bucket_map(
                 cost_snapshot.planned_map,
                 cost_snapshot.project_currency,
@@ -154,8 +194,8 @@ class ReportingKpiMixin(ReportingCostPolicyMixin):
         return ProjectKPI(
             project_id=project.id,
             name=project.name,
-            start_date=start_date,
-            end_date=end_date,
+            start_date=project.start_date,
+            end_date=project.end_date,
             duration_working_days=duration_working_days,
             tasks_total=tasks_total,
             tasks_completed=tasks_completed,
@@ -190,11 +230,30 @@ class ReportingKpiMixin(ReportingCostPolicyMixin):
         Capacity-aware load summary by resource using peak concurrent allocation.
         """
         tasks = select_leaf_tasks(self._task_repo.list_by_project(project_id))
+        if not tasks:
+            return []
+
+        assignments, resources, working_dates = self._read_resource_load_facts(tasks)
+        return self._resource_load_rows(
+            ResourceLoadEngine.calculate(
+                tasks=tasks,
+                assignments=assignments,
+                resources=resources,
+                working_dates=working_dates,
+            )
+        )
+
+    def _read_resource_load_facts(
+        self,
+        tasks: Sequence[Task],
+    ) -> tuple[tuple[TaskAssignment, ...], tuple[Resource, ...], frozenset[date]]:
+        """Assignments, assigned resources and working dates over the tasks'
+        scheduled span — what ``ResourceLoadEngine`` needs besides the tasks."""
         task_ids = [t.id for t in tasks]
         if not task_ids:
-            return []
+            return (), (), frozenset()
 
-        assignments = self._assignment_repo.list_by_tasks(task_ids)
+        assignments = tuple(self._assignment_repo.list_by_tasks(task_ids))
         resource_ids = sorted({assignment.resource_id for assignment in assignments})
         resources = tuple(
             resource
@@ -214,6 +273,10 @@ class ReportingKpiMixin(ReportingCostPolicyMixin):
             if scheduled_ranges
             else frozenset()
         )
+        return assignments, resources, working_dates
+
+    @staticmethod
+    def _resource_load_rows(rows: Iterable[ResourceLoadMetric]) -> list[ResourceLoadRow]:
         return [
             ResourceLoadRow(
                 resource_id=row.resource_id,
@@ -223,12 +286,7 @@ class ReportingKpiMixin(ReportingCostPolicyMixin):
                 capacity_percent=row.capacity_percent,
                 utilization_percent=row.utilization_percent,
             )
-            for row in ResourceLoadEngine.calculate(
-                tasks=tasks,
-                assignments=assignments,
-                resources=resources,
-                working_dates=working_dates,
-            )
+            for row in rows
         ]
 
     def _working_dates_between(self, start: date, end: date) -> frozenset[date]:
@@ -0,0 +1,279 @@
+"""Report snapshot mixin — one read of everything a full project report shows.
+
+The snapshot is gathered on the calling thread, the only step that touches
+the session. Section builders then compute from it without further reads,
+so independent sections can be built concurrently.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from types import MappingProxyType
+
+from src.core.platform.contract.port.time_management.calendar.calendar_protocol import CalendarProtocol
+from src.core.platform.common.exceptions import BusinessRuleError, NotFoundError
+from src.core.modules.project_management.contracts.repositories.projects.project import ProjectRepository
+from src.core.modules.project_management.contracts.repositories.scheduling.baseline import BaselineRepository
+from src.core.modules.project_management.contracts.repositories.tasks.task import TaskRepository
+from src.core.modules.project_management.contracts.reads.financials import EvmSeriesFacts
+from src.core.modules.project_management.application.financials.cost.engines.cost_breakdown_engine import (
+    CostBreakdownEngine,
+)
+from src.core.modules.project_management.application.financials.cost.engines.cost_policy_engine import (
+    CostPolicyComposition,
+    CostPolicySnapshot,
+)
+from src.core.modules.project_management.application.financials.models.finance_models import (
+    LaborDetailsResult,
+)
+from src.core.modules.project_management.application.resources.resource_load_engine import (
+    ResourceLoadEngine,
+)
+from src.core.modules.project_management.application.scheduling.models.cpm import CPMTaskInfo
+from src.core.modules.project_management.application.scheduling.services.scheduling_engine import SchedulingEngine
+from src.core.modules.project_management.domain.projects.project import Project
+from src.core.modules.project_management.domain.resources.resource import Resource
+from src.core.modules.project_management.domain.scheduling.baseline import BaselineTask
+from src.core.modules.project_management.domain.tasks.hierarchy import select_leaf_tasks
+from src.core.modules.project_management.domain.tasks.task import Task, TaskAssignment
+from src.core.modules.project_management.infrastructure.reporting.builders.cost_policy import (
+    ReportingCostPolicyMixin,
+)
+from src.core.modules.project_management.infrastructure.reporting.models.report_models import (
+    CostBreakdownRow,
+    ResourceLoadRow,
+)
+
+# Section failures with these codes omit the section instead of failing the
+# whole report (no baseline yet, or no finance access).
+OPTIONAL_REPORT_SECTION_CODES = frozenset({"NO_BASELINE", "PERMISSION_DENIED"})
+
+
+@dataclass(frozen=True)
+class ReportDataSnapshot:
+    """
+    Everything one project report reads, taken once per report request.
+
+    The finance fields are ``None`` when the user may not view project
+    finance. The domain objects inside are shared by every section builder
+    and must be treated as read-only.
+    """
+
+    project_id: str
+    as_of: date
+    baseline_id: str | None
+    project: Project
+    tasks: tuple[Task, ...]
+    schedule: Mapping[str, CPMTaskInfo]
+    duration_working_days: int | None
+    assignments: tuple[TaskAssignment, ...]
+    resources: tuple[Resource, ...]
+    resource_working_dates: frozenset[date]
+    baseline_tasks: tuple[BaselineTask, ...]
+    kpi_cost_snapshot: CostPolicySnapshot | None = None
+    finance_policy: CostPolicyComposition | None = None
+    evm_facts: EvmSeriesFacts | None = None
+    evm_policy: CostPolicyComposition | None = None
+    evm_labor_series: Mapping[date, LaborDetailsResult] | None = None
+    evm_working_days: Callable[[date, date], int] | None = None
+
+    @property
+    def finance_visible(self) -> bool:
+        return self.evm_facts is not None
+
+    @property
+    def critical_task_ids(self) -> frozenset[str]:
+        return frozenset(info.task.id for info in self.schedule.values() if info.is_critical)
+
+
+class ReportingSnapshotMixin(ReportingCostPolicyMixin):
+    _project_repo: ProjectRepository
+    _task_repo: TaskRepository
+    _baseline_repo: BaselineRepository
+    _scheduling_engine: SchedulingEngine
+    _calendar: CalendarProtocol
+
+    def build_report_snapshot(
+        self,
+        project_id: str,
+        *,
+        baseline_id: str | None = None,
+        as_of: date | None = None,
+    ) -> ReportDataSnapshot:
+        """
+        Read the tasks, the CPM schedule, resource load facts, baseline tasks
+        and (with finance access) the cost and EVM facts a full report needs:
+        the schedule is computed once and each policy composed once, where
+        building the sections one by one repeats both.
+        """
+        self._require_view("build project report", project_id=project_id)
+        resolved_as_of = as_of or date.today()
+        project = self._project_repo.get(project_id)
+        if not project:
+            raise NotFoundError("Project not found.", code="PROJECT_NOT_FOUND")
+
+        schedule = self._scheduling_engine.recalculate_project_schedule(project_id, persist=False)
+        tasks = tuple(select_leaf_tasks(self._task_repo.list_by_project(project_id)))
+        duration_working_days = None
+        if project.start_date and project.end_date:
+            duration_working_days = self._calendar.working_days_between(
+                project.start_date,
+                project.end_date,
+            )
+        assignments, resources, resource_working_dates = self._read_resource_load_facts(tasks)
+        if baseline_id:
+            baseline_tasks = self._baseline_repo.list_tasks(baseline_id)
+        else:
+            latest = self._baseline_repo.get_latest_for_project(project_id)
+            baseline_tasks = self._baseline_repo.list_tasks(latest.id) if latest else []
+
+        finance_policies: dict[date, CostPolicyComposition] = {}
+
+        def finance_policy_at(day: date) -> CostPolicyComposition:
+            if day not in finance_policies:
+                finance_policies[day] = self._compose_finance_policy(project_id, as_of=day)[1]
+            return finance_policies[day]
+
+        # KPI cost totals are as of today, whatever the report's as-of date.
+        kpi_cost_snapshot = (
+            finance_policy_at(date.today()).snapshot if self._has_finance_view(project_id) else None
+        )
+        finance: dict[str, object] = {}
+        if self._may_view_report_finance(project_id):
+            evm_facts, evm_policy = self._compose_evm_policy(
+                project_id,
+                baseline_id=baseline_id,
+                as_of=resolved_as_of,
+            )
+            series_calculator = self._make_evm_series_calculator()
+            finance = {
+                "finance_policy": finance_policy_at(resolved_as_of),
+                "evm_facts": evm_facts,
+                "evm_policy": evm_policy,
+                "evm_labor_series": MappingProxyType(
+                    series_calculator.read_labor_series(project_id, evm_facts, as_of=resolved_as_of)
+                ),
+                "evm_working_days": series_calculator.prepare_working_days(
+                    evm_facts,
+                    as_of=resolved_as_of,
+                ),
+            }
+
+        return ReportDataSnapshot(
+            project_id=project_id,
+            as_of=resolved_as_of,
+            baseline_id=baseline_id,
+            project=project,
+            tasks=tasks,
+            schedule=MappingProxyType(dict(schedule)),
+            duration_working_days=duration_working_days,
+            assignments=assignments,
+            resources=resources,
+            resource_working_dates=resource_working_dates,
+            baseline_tasks=tuple(baseline_tasks),
+            kpi_cost_snapshot=kpi_cost_snapshot,
+            **finance,
+        )
+
+    def report_section_builders(
+        self,
+        snapshot: ReportDataSnapshot,
+    ) -> dict[str, Callable[[], object]]:
+        """
+        One zero-argument builder per report section, keyed like the
+        ``ExcelReportContext`` fields. Builders only compute from
+        ``snapshot`` and may run on any thread, so they call private methods
+        only: public ones are module-guarded, and the guard reads the session.
+        Finance sections are left out when the snapshot has no finance facts.
+        """
+        builders: dict[str, Callable[[], object]] = {
+            "kpi": partial(
+                self._compose_project_kpi,
+                snapshot.project,
+                snapshot.tasks,
+                snapshot.schedule,
+                duration_working_days=snapshot.duration_working_days,
+                cost_snapshot=snapshot.kpi_cost_snapshot,
+            ),
+            "gantt": partial(self._gantt_bars, snapshot.schedule, snapshot.tasks),
+            "resources": partial(self._snapshot_resource_load, snapshot),
+            "baseline_variance": partial(
+                self._schedule_variance_rows,
+                snapshot.baseline_tasks,
+                snapshot.tasks,
+                snapshot.critical_task_ids,
+            ),
+        }
+        if not snapshot.finance_visible:
+            return builders
+        builders.update(
+            evm=partial(
+                _optional_section,
+                self._earned_value_from_policy,
+                snapshot.project_id,
+                snapshot.as_of,
+                snapshot.evm_facts,
+                snapshot.evm_policy,
+                working_days_between=snapshot.evm_working_days,
+            ),
+            evm_series=partial(
+                _optional_section,
+                self._make_evm_series_calculator().build_series_from_facts,
+                snapshot.project_id,
+                snapshot.evm_facts,
+                as_of=snapshot.as_of,
+                labor_by_date=snapshot.evm_labor_series,
+                working_days_between=snapshot.evm_working_days,
+            ),
+            cost_breakdown=partial(self._snapshot_cost_breakdown, snapshot),
+            cost_sources=lambda: snapshot.finance_policy.source_breakdown,
+        )
+        return builders
+
+    def _may_view_report_finance(self, project_id: str) -> bool:
+        try:
+            self._require_finance_view("view report finance sections", project_id=project_id)
+        except BusinessRuleError as exc:
+            if getattr(exc, "code", None) == "PERMISSION_DENIED":
+                return False
+            raise
+        return True
+
+    def _snapshot_cost_breakdown(self, snapshot: ReportDataSnapshot) -> list[CostBreakdownRow]:
+        return CostBreakdownEngine(
+            cost_policy_engine=self._make_cost_policy_engine(),
+        ).build_breakdown_from_snapshot(
+            snapshot.evm_policy.snapshot,
+            baseline_tasks=snapshot.evm_facts.baseline_tasks,
+        )
+
+    def _snapshot_resource_load(self, snapshot: ReportDataSnapshot) -> list[ResourceLoadRow]:
+        if not snapshot.tasks:
+            return []
+        return self._resource_load_rows(
+            ResourceLoadEngine.calculate(
+                tasks=snapshot.tasks,
+                assignments=snapshot.assignments,
+                resources=snapshot.resources,
+                working_dates=snapshot.resource_working_dates,
+            )
+        )
+
+
+def _optional_section(func: Callable[..., object], *args, **kwargs) -> object | None:
+    try:
+        return func(*args, **kwargs)
+    except BusinessRuleError as exc:
+        if getattr(exc, "code", None) in OPTIONAL_REPORT_SECTION_CODES:
+            return None
+        raise
+
+
+__all__ = [
+    "OPTIONAL_REPORT_SECTION_CODES",
+    "ReportDataSnapshot",
+    "ReportingSnapshotMixin",
+]
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Collection, Iterable
+
 from src.core.modules.project_management.contracts.repositories.tasks.task import TaskRepository
 from src.core.modules.project_management.contracts.repositories.scheduling.baseline import BaselineRepository
+from src.core.modules.project_management.domain.scheduling.baseline import BaselineTask
 from src.core.modules.project_management.domain.tasks.hierarchy import select_leaf_tasks
+from src.core.modules.project_management.domain.tasks.task import Task
 from src.core.modules.project_management.infrastructure.reporting.models.report_models import (
     TaskVarianceRow,
 )
@@ -28,9 +32,8 @@ class ReportingVarianceMixin:
             latest = self._baseline_repo.get_latest_for_project(project_id)
             b_tasks = self._baseline_repo.list_tasks(latest.id) if latest else []
 
-        # Map current tasks
+        # Current tasks
         tasks = select_leaf_tasks(self._task_repo.list_by_project(project_id))
-        tasks_by_id = {t.id: t for t in tasks}
 
         # Critical tasks (optional – you already have get_critical_path)
         critical_ids = set()
@@ -40,6 +43,16 @@ class ReportingVarianceMixin:
         except Exception:
             pass
 
+        return self._schedule_variance_rows(b_tasks, tasks, critical_ids)
+
+    @staticmethod
+    def _schedule_variance_rows(
+        b_tasks: Iterable[BaselineTask],
+        tasks: Iterable[Task],
+        critical_ids: Collection[str],
+    ) -> list[TaskVarianceRow]:
+        tasks_by_id = {t.id: t for t in tasks}
+
         rows: list[TaskVarianceRow] = []
         for bt in b_tasks:
             t = tasks_by_id.get(bt.task_id)
@@ -1 +1,21 @@
 """Report delivery channels — email, webhook, storage."""
+
+from src.core.modules.project_management.infrastructure.reporting.deliveries.base import (
+    ReportDelivery,
+    ScheduledReportOutput,
+)
+from src.core.modules.project_management.infrastructure.reporting.deliveries.filesystem import (
+    FilesystemReportDelivery,
+)
+from src.core.modules.project_management.infrastructure.reporting.deliveries.notification import (
+    SCHEDULED_REPORT_NOTIFICATION_CATEGORY,
+    NotificationReportDelivery,
+)
+
+__all__ = [
+    "FilesystemReportDelivery",
+    "NotificationReportDelivery",
+    "ReportDelivery",
+    "SCHEDULED_REPORT_NOTIFICATION_CATEGORY",
+    "ScheduledReportOutput",
+]
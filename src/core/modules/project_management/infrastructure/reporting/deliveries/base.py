@@ -0,0 +1,39 @@
+"""Report delivery contract."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.modules.project_management.infrastructure.reporting.schedulers.schedule import ReportSchedule
+
+
+@dataclass(frozen=True)
+class ScheduledReportOutput:
+    """A scheduled report ready to deliver. ``reused`` is true when the
+    file came from the output cache rather than a fresh render."""
+
+    schedule: ReportSchedule
+    path: Path
+    fingerprint: str
+    generated_at: datetime
+    reused: bool = False
+
+
+class ReportDelivery(ABC):
+    """Hands a scheduled report to one destination."""
+
+    channel: str
+
+    @abstractmethod
+    def deliver(self, output: ScheduledReportOutput, services: Mapping[str, object]) -> str:
+        """Deliver ``output`` and return where it went. ``services`` is the
+        worker's own service graph for the run."""
+
+
+__all__ = ["ReportDelivery", "ScheduledReportOutput"]
@@ -0,0 +1,45 @@
+"""Local filesystem drop for scheduled reports."""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+from collections.abc import Mapping
+from pathlib import Path
+
+from src.core.modules.project_management.infrastructure.reporting.deliveries.base import (
+    ReportDelivery,
+    ScheduledReportOutput,
+)
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", value).strip("._") or "report"
+
+
+class FilesystemReportDelivery(ReportDelivery):
+    """
+    Copies each scheduled report into ``drop_dir/<schedule name>/``, named
+    after the run time, e.g. ``Weekly_pack/20261019-0600.xlsx``.
+
+    The copy is written under a temporary name and renamed, so anything
+    watching the drop never picks up a partial file.
+    """
+
+    channel = "filesystem"
+
+    def __init__(self, drop_dir: str | Path) -> None:
+        self._drop_dir = Path(drop_dir)
+
+    def deliver(self, output: ScheduledReportOutput, services: Mapping[str, object]) -> str:
+        target_dir = self._drop_dir / _slug(output.schedule.name)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        target = target_dir / f"{output.generated_at:%Y%m%d-%H%M}{output.path.suffix}"
+        temp_path = target.with_name(f".{target.name}.tmp")
+        shutil.copyfile(output.path, temp_path)
+        os.replace(temp_path, target)
+        return str(target)
+
+
+__all__ = ["FilesystemReportDelivery"]
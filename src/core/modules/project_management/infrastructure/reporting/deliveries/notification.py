@@ -0,0 +1,51 @@
+"""In-app notification delivery for scheduled reports."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from src.core.modules.project_management.infrastructure.reporting.deliveries.base import (
+    ReportDelivery,
+    ScheduledReportOutput,
+)
+
+SCHEDULED_REPORT_NOTIFICATION_CATEGORY = "report.scheduled"
+
+
+class NotificationReportDelivery(ReportDelivery):
+    """
+    Notifies each of the schedule's recipients that the report is ready,
+    through the worker's ``notification_service`` (which also fans out to
+    any external notification channels). The notification metadata carries
+    the report file path; the runner commits the worker session.
+    """
+
+    channel = "notification"
+
+    def __init__(self, *, category: str = SCHEDULED_REPORT_NOTIFICATION_CATEGORY) -> None:
+        self._category = category
+
+    def deliver(self, output: ScheduledReportOutput, services: Mapping[str, object]) -> str:
+        schedule = output.schedule
+        if not schedule.recipient_user_ids:
+            raise ValueError(f"Report schedule '{schedule.name}' has no notification recipients.")
+        notification_service = services["notification_service"]
+        for recipient_user_id in schedule.recipient_user_ids:
+            notification_service.dispatch(
+                recipient_user_id=recipient_user_id,
+                category=self._category,
+                title=f"{schedule.name} is ready",
+                body=f"Generated {output.generated_at:%Y-%m-%d %H:%M}: {output.path.name}",
+                metadata={
+                    "schedule_id": schedule.id,
+                    "report_key": schedule.report_key,
+                    "project_id": schedule.project_id,
+                    "file_path": str(output.path),
+                    "fingerprint": output.fingerprint,
+                    "reused": output.reused,
+                },
+            )
+        return f"notification:{','.join(schedule.recipient_user_ids)}"
+
+
+__all__ = ["NotificationReportDelivery", "SCHEDULED_REPORT_NOTIFICATION_CATEGORY"]
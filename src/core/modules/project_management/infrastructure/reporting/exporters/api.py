@@ -9,9 +9,11 @@ from src.core.modules.project_management.infrastructure.reporting.api import (
     GanttPngRequest,
     PdfReportRenderer,
     PdfReportRequest,
+    build_report_inputs,
     generate_evm_png,
     generate_excel_report,
     generate_gantt_png,
+    generate_gantt_png_pages,
     generate_pdf_report,
 )
 
@@ -24,8 +26,10 @@ __all__ = [
     "GanttPngRequest",
     "PdfReportRenderer",
     "PdfReportRequest",
+    "build_report_inputs",
     "generate_evm_png",
     "generate_excel_report",
     "generate_gantt_png",
+    "generate_gantt_png_pages",
     "generate_pdf_report",
 ]
@@ -1,8 +1,12 @@
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
+
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 
+from src.core.platform.application.data_operations.exporting.excel_sheet_writer import ExcelSheetWriter
 from src.core.modules.project_management.infrastructure.reporting.models.contexts import ExcelReportContext
+from src.core.modules.project_management.infrastructure.reporting.models.report_models import GanttTaskBar
 from src.core.modules.project_management.infrastructure.reporting.exporters.renderers.finance import (
     finance_ledger_headers,
     finance_ledger_values,
@@ -11,359 +15,322 @@ from src.core.modules.project_management.infrastructure.reporting.exporters.rend
     finance_summary_rows,
 )
 
+_HEADER_FONT = Font(bold=True)
+_THIN_BORDER = Border(
+    left=Side(style="thin"),
+    right=Side(style="thin"),
+    top=Side(style="thin"),
+    bottom=Side(style="thin"),
+)
+_HEADER_FILL = PatternFill("solid", fgColor="DDDDDD")
+
+# Cell styles by key; a None style key appends the bare value.
+_CELL_STYLES: dict[str, dict[str, object]] = {
+    "title": {"font": Font(bold=True, size=14)},
+    "label": {"font": _HEADER_FONT},
+    "key": {"font": _HEADER_FONT, "border": _THIN_BORDER},
+    "header": {"font": _HEADER_FONT, "fill": _HEADER_FILL, "border": _THIN_BORDER},
+    "column_header": {
+        "font": _HEADER_FONT,
+        "fill": _HEADER_FILL,
+        "border": _THIN_BORDER,
+        "alignment": Alignment(horizontal="center"),
+    },
+    "cell": {"border": _THIN_BORDER},
+}
+
+_RESTRICTED = "Restricted (finance.read required)"
+
+
+class _SheetWriter(ExcelSheetWriter):
+    """A report sheet: the shared write-only writer with this renderer's
+    cell styles and its title/label/key-value rows."""
+
+    def __init__(self, workbook: Workbook, title: str, widths: Mapping[str, float]) -> None:
+        super().__init__(workbook, title, styles=_CELL_STYLES, widths=widths)
+
+    def title(self, text: str) -> None:
+        self.append([text], "title")
+
+    def label(self, text: str) -> None:
+        self.append([text], "label")
+
+    def key_value(self, key: object, value: object) -> None:
+        self.append([key, value], ("key", "cell"))
+
 
 class ExcelReportRenderer:
+    """Project report workbook.
+
+    The workbook is opened in write-only mode and each sheet is streamed to
+    disk row by row, so memory stays flat however many tasks or ledger
+    lines are exported. Row values are produced by generators over the
+    context collections, which may themselves be iterators."""
+
     def render(self, ctx: ExcelReportContext, output_path: Path) -> Path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        wb = Workbook()
-
-        header_font = Font(bold=True)
-        title_font = Font(bold=True, size=14)
-        center = Alignment(horizontal="center")
-        thin_border = Border(
-            left=Side(style="thin"),
-            right=Side(style="thin"),
-            top=Side(style="thin"),
-            bottom=Side(style="thin"),
-        )
-        header_fill = PatternFill("solid", fgColor="DDDDDD")
-
-        # ---------------- Overview ----------------
-        ws = wb.active
-        ws.title = "Overview"
-
-        ws["A1"] = f"Project KPIs - {ctx.kpi.name}"
-        ws["A1"].font = title_font
-
-        row = 3
-
-        def kv(key, value):
-            nonlocal row
-            ws[f"A{row}"] = key
-            ws[f"B{row}"] = value
-            ws[f"A{row}"].font = header_font
-            ws[f"A{row}"].border = thin_border
-            ws[f"B{row}"].border = thin_border
-            row += 1
-
-        kv("Project ID", ctx.kpi.project_id)
-        kv("Project name", ctx.kpi.name)
-        kv("Start date", ctx.kpi.start_date)
-        kv("End date", ctx.kpi.end_date)
-        kv("Duration (working days)", ctx.kpi.duration_working_days)
-
-        row += 1
-        kv("Tasks - total", ctx.kpi.tasks_total)
-        kv("Tasks - completed", ctx.kpi.tasks_completed)
-        kv("Tasks - in progress", ctx.kpi.tasks_in_progress)
-        kv("Tasks - not started", ctx.kpi.tasks_not_started)
-        kv("Critical tasks", ctx.kpi.critical_tasks)
-        kv("Late tasks", ctx.kpi.late_tasks)
-
-        row += 1
-        _restricted = "Restricted (finance.read required)"
-        kv("Planned cost", _restricted if ctx.kpi.total_planned_cost is None else ctx.kpi.total_planned_cost)
-        kv("Actual cost", _restricted if ctx.kpi.total_actual_cost is None else ctx.kpi.total_actual_cost)
-        kv("Cost variance", _restricted if ctx.kpi.cost_variance is None else ctx.kpi.cost_variance)
-        if ctx.cost_sources:
-            row += 1
-            for src in ctx.cost_sources.rows:
-                kv(f"{src.source_label} (planned)", src.planned)
-                kv(f"{src.source_label} (committed)", src.committed)
-                kv(f"{src.source_label} (actual)", src.actual)
-            for note in ctx.cost_sources.notes:
-                kv("Cost source note", note)
-
-        ws.column_dimensions["A"].width = 30
-        ws.column_dimensions["B"].width = 25
-
-        # ---------------- Tasks ----------------
-        ws_tasks = wb.create_sheet("Tasks")
-        headers = [
-            "Task ID",
-            "WBS",
-            "Name",
-            "Start",
-            "End",
-            "Duration (days)",
-            "Critical",
-            "% complete",
-            "Status",
-        ]
-        for col_index, h in enumerate(headers, start=1):
-            cell = ws_tasks.cell(row=1, column=col_index, value=h)
-            cell.font = header_font
-            cell.alignment = center
-            cell.fill = header_fill
-            cell.border = thin_border
-
-        for row_index, b in enumerate(ctx.gantt, start=2):
-            ws_tasks.cell(row=row_index, column=1, value=b.task_id).border = thin_border
-            ws_tasks.cell(row=row_index, column=2, value=b.wbs_code).border = thin_border
-            ws_tasks.cell(row=row_index, column=3, value=b.name).border = thin_border
-            ws_tasks.cell(row=row_index, column=4, value=b.start.isoformat() if b.start else "").border = thin_border
-            ws_tasks.cell(row=row_index, column=5, value=b.end.isoformat() if b.end else "").border = thin_border
-            dur = (b.end - b.start).days + 1 if (b.start and b.end) else None
-            ws_tasks.cell(row=row_index, column=6, value=dur).border = thin_border
-            ws_tasks.cell(row=row_index, column=7, value="Yes" if b.is_critical else "No").border = thin_border
-            ws_tasks.cell(row=row_index, column=8, value=b.percent_complete).border = thin_border
-            ws_tasks.cell(row=row_index, column=9, value=getattr(b.status, "value", str(b.status))).border = thin_border
-
-        ws_tasks.column_dimensions["A"].width = 36
-        ws_tasks.column_dimensions["B"].width = 14
-        ws_tasks.column_dimensions["C"].width = 30
-        for col_letter in ("D", "E", "F", "G", "H", "I"):
-            ws_tasks.column_dimensions[col_letter].width = 15
-
-        # ---------------- Resources ----------------
-        ws_res = wb.create_sheet("Resources")
-        headers = [
-            "Resource ID",
-            "Name",
-            "Assigned (%)",
-            "Capacity (%)",
-            "Utilization (%)",
-            "Tasks count",
-        ]
-        for c, h in enumerate(headers, start=1):
-            cell = ws_res.cell(1, c, h)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = center
-            cell.border = thin_border
-
-        for r, res in enumerate(ctx.resources, start=2):
-            values = [
-                res.resource_id,
-                res.resource_name,
-                res.total_allocation_percent,
-                float(getattr(res, "capacity_percent", 100.0) or 100.0),
-                float(getattr(res, "utilization_percent", res.total_allocation_percent) or 0.0),
-                res.tasks_count,
-            ]
-            for c, v in enumerate(values, 1):
-                cell = ws_res.cell(r, c, v)
-                cell.border = thin_border
-
-        ws_res.column_dimensions["A"].width = 34
-        ws_res.column_dimensions["B"].width = 28
-        ws_res.column_dimensions["C"].width = 20
-        ws_res.column_dimensions["D"].width = 14
-        ws_res.column_dimensions["E"].width = 16
-        ws_res.column_dimensions["F"].width = 15
-
-        # ---------------- EVM ----------------
-        if ctx.evm or ctx.evm_series:
-            ws_evm = wb.create_sheet("EVM")
-            ws_evm["A1"] = "Earned Value Management"
-            ws_evm["A1"].font = title_font
-
-            if ctx.evm:
-                ws_evm["A2"], ws_evm["B2"] = ("Metric", "Value")
-                ws_evm["A2"].font = header_font
-                ws_evm["B2"].font = header_font
-                ws_evm["A2"].fill = header_fill
-                ws_evm["B2"].fill = header_fill
-                ws_evm["A2"].border = thin_border
-                ws_evm["B2"].border = thin_border
-
-                rows = [
-                    ("As of", ctx.as_of.isoformat()),
-                    ("BAC", ctx.evm.BAC),
-                    ("PV", ctx.evm.PV),
-                    ("EV", ctx.evm.EV),
-                    ("AC", ctx.evm.AC),
-                    ("SPI", ctx.evm.SPI),
-                    ("CPI", ctx.evm.CPI),
-                    ("EAC", ctx.evm.EAC),
-                    ("ETC", ctx.evm.ETC),
-                    ("VAC", ctx.evm.VAC),
-                ]
+        wb = Workbook(write_only=True)
 
-                for i, (k, v) in enumerate(rows, start=3):
-                    ws_evm[f"A{i}"] = k
-                    if isinstance(v, (int, float)):
-                        ws_evm[f"B{i}"] = float(v)
-                    elif v is None:
-                        ws_evm[f"B{i}"] = ""
-                    else:
-                        ws_evm[f"B{i}"] = str(v)
-                    ws_evm[f"A{i}"].border = thin_border
-                    ws_evm[f"B{i}"].border = thin_border
-
-                ws_evm.column_dimensions["A"].width = 22
-                ws_evm.column_dimensions["B"].width = 18
-
-            if ctx.evm_series:
-                ws_evm["D2"] = "Period End"
-                ws_evm["E2"] = "PV"
-                ws_evm["F2"] = "EV"
-                ws_evm["G2"] = "AC"
-                for col in ("D", "E", "F", "G"):
-                    ws_evm[f"{col}2"].font = header_font
-                    ws_evm[f"{col}2"].fill = header_fill
-                    ws_evm[f"{col}2"].border = thin_border
-
-                for idx, point in enumerate(ctx.evm_series, start=3):
-                    ws_evm[f"D{idx}"] = point.period_end.isoformat()
-                    ws_evm[f"E{idx}"] = float(point.PV or 0.0)
-                    ws_evm[f"F{idx}"] = float(point.EV or 0.0)
-                    ws_evm[f"G{idx}"] = float(point.AC or 0.0)
-                    for col in ("D", "E", "F", "G"):
-                        ws_evm[f"{col}{idx}"].border = thin_border
-
-                ws_evm.column_dimensions["D"].width = 14
-                ws_evm.column_dimensions["E"].width = 14
-                ws_evm.column_dimensions["F"].width = 14
-                ws_evm.column_dimensions["G"].width = 14
-
-        # ---------------- Baseline Variance ----------------
+        self._write_overview(wb, ctx)
+        self._write_tasks(wb, ctx.gantt)
+        self._write_resources(wb, ctx)
+        if ctx.evm or ctx.evm_series:
+            self._write_evm(wb, ctx)
         if ctx.baseline_variance:
-            ws_v = wb.create_sheet("Variance")
-            headers = ["Task", "Baseline Start", "Baseline Finish", "Current Start", "Current Finish", "SV days", "FV days", "Critical"]
-            for i, h in enumerate(headers, start=1):
-                cell = ws_v.cell(row=1, column=i, value=h)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center
-                cell.border = thin_border
-
-            for r_i, row in enumerate(ctx.baseline_variance, start=2):
-                ws_v.cell(r_i, 1, row.task_name).border = thin_border
-                ws_v.cell(r_i, 2, "" if not row.baseline_start else row.baseline_start.isoformat()).border = thin_border
-                ws_v.cell(r_i, 3, "" if not row.baseline_finish else row.baseline_finish.isoformat()).border = thin_border
-                ws_v.cell(r_i, 4, "" if not row.current_start else row.current_start.isoformat()).border = thin_border
-                ws_v.cell(r_i, 5, "" if not row.current_finish else row.current_finish.isoformat()).border = thin_border
-                ws_v.cell(r_i, 6, "" if row.start_variance_days is None else row.start_variance_days).border = thin_border
-                ws_v.cell(r_i, 7, "" if row.finish_variance_days is None else row.finish_variance_days).border = thin_border
-                ws_v.cell(r_i, 8, "Yes" if row.is_critical else "No").border = thin_border
-
-            ws_v.column_dimensions["A"].width = 40
-            for col in ("B", "C", "D", "E", "F", "G", "H"):
-                ws_v.column_dimensions[col].width = 15
-
-        # ---------------- Cost Breakdown ----------------
+            self._write_variance(wb, ctx)
         if ctx.cost_breakdown:
-            ws_c = wb.create_sheet("Cost Breakdown")
-            headers = ["Type", "Currency", "Planned", "Actual", "Variance"]
-            for i, h in enumerate(headers, start=1):
-                cell = ws_c.cell(row=1, column=i, value=h)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center
-                cell.border = thin_border
-
-            for r_i, row in enumerate(ctx.cost_breakdown, start=2):
-                planned = float(row.planned or 0.0)
-                actual = float(row.actual or 0.0)
-                ws_c.cell(r_i, 1, str(row.cost_type)).border = thin_border
-                ws_c.cell(r_i, 2, str(row.currency)).border = thin_border
-                ws_c.cell(r_i, 3, planned).border = thin_border
-                ws_c.cell(r_i, 4, actual).border = thin_border
-                ws_c.cell(r_i, 5, actual - planned).border = thin_border
-
-            ws_c.column_dimensions["A"].width = 18
-            ws_c.column_dimensions["B"].width = 10
-            ws_c.column_dimensions["C"].width = 14
-            ws_c.column_dimensions["D"].width = 14
-            ws_c.column_dimensions["E"].width = 14
-
-        # ---------------- Cost Sources ----------------
+            self._write_cost_breakdown(wb, ctx)
+        if ctx.cost_sources:
+            self._write_cost_sources(wb, ctx)
+        if ctx.finance_snapshot:
+            self._write_finance(wb, ctx)
+            self._write_finance_ledger(wb, ctx)
+
+        wb.save(output_path)
+        return output_path
+
+    # ---------------- Overview ----------------
+    @staticmethod
+    def _write_overview(wb: Workbook, ctx: ExcelReportContext) -> None:
+        ws = _SheetWriter(wb, "Overview", {"A": 30, "B": 25})
+        ws.title(f"Project KPIs - {ctx.kpi.name}")
+        ws.blank()
+
+        ws.key_value("Project ID", ctx.kpi.project_id)
+        ws.key_value("Project name", ctx.kpi.name)
+        ws.key_value("Start date", ctx.kpi.start_date)
+        ws.key_value("End date", ctx.kpi.end_date)
+        ws.key_value("Duration (working days)", ctx.kpi.duration_working_days)
+
+        ws.blank()
+        ws.key_value("Tasks - total", ctx.kpi.tasks_total)
+        ws.key_value("Tasks - completed", ctx.kpi.tasks_completed)
+        ws.key_value("Tasks - in progress", ctx.kpi.tasks_in_progress)
+        ws.key_value("Tasks - not started", ctx.kpi.tasks_not_started)
+        ws.key_value("Critical tasks", ctx.kpi.critical_tasks)
+        ws.key_value("Late tasks", ctx.kpi.late_tasks)
+
+        ws.blank()
+        ws.key_value("Planned cost", _RESTRICTED if ctx.kpi.total_planned_cost is None else ctx.kpi.total_planned_cost)
+        ws.key_value("Actual cost", _RESTRICTED if ctx.kpi.total_actual_cost is None else ctx.kpi.total_actual_cost)
+        ws.key_value("Cost variance", _RESTRICTED if ctx.kpi.cost_variance is None else ctx.kpi.cost_variance)
         if ctx.cost_sources:
-            ws_s = wb.create_sheet("Cost Sources")
-            headers = ["Source", "Planned", "Committed", "Actual"]
-            for i, h in enumerate(headers, start=1):
-                cell = ws_s.cell(row=1, column=i, value=h)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center
-                cell.border = thin_border
-
-            for r_i, src in enumerate(ctx.cost_sources.rows, start=2):
-                ws_s.cell(r_i, 1, src.source_label).border = thin_border
-                ws_s.cell(r_i, 2, float(src.planned or 0.0)).border = thin_border
-                ws_s.cell(r_i, 3, float(src.committed or 0.0)).border = thin_border
-                ws_s.cell(r_i, 4, float(src.actual or 0.0)).border = thin_border
-
-            note_row = len(ctx.cost_sources.rows) + 3
+            ws.blank()
+            for src in ctx.cost_sources.rows:
+                ws.key_value(f"{src.source_label} (planned)", src.planned)
+                ws.key_value(f"{src.source_label} (committed)", src.committed)
+                ws.key_value(f"{src.source_label} (actual)", src.actual)
             for note in ctx.cost_sources.notes:
-                ws_s.cell(note_row, 1, "Note").font = header_font
-                ws_s.cell(note_row, 2, note)
-                note_row += 1
+                ws.key_value("Cost source note", note)
+
+    # ---------------- Tasks ----------------
+    @staticmethod
+    def _write_tasks(wb: Workbook, bars: Iterable[GanttTaskBar]) -> None:
+        widths = {"A": 36, "B": 14, "C": 30}
+        widths.update(dict.fromkeys(("D", "E", "F", "G", "H", "I"), 15))
+        ws = _SheetWriter(wb, "Tasks", widths)
+        ws.append(
+            [
+                "Task ID",
+                "WBS",
+                "Name",
+                "Start",
+                "End",
+                "Duration (days)",
+                "Critical",
+                "% complete",
+                "Status",
+            ],
+            "column_header",
+        )
+        for values in _task_rows(bars):
+            ws.append(values)
+
+    # ---------------- Resources ----------------
+    @staticmethod
+    def _write_resources(wb: Workbook, ctx: ExcelReportContext) -> None:
+        ws = _SheetWriter(wb, "Resources", {"A": 34, "B": 28, "C": 20, "D": 14, "E": 16, "F": 15})
+        ws.append(
+            [
+                "Resource ID",
+                "Name",
+                "Assigned (%)",
+                "Capacity (%)",
+                "Utilization (%)",
+                "Tasks count",
+            ],
+            "column_header",
+        )
+        for res in ctx.resources:
+            ws.append(
+                [
+                    res.resource_id,
+                    res.resource_name,
+                    res.total_allocation_percent,
+                    float(getattr(res, "capacity_percent", 100.0) or 100.0),
+                    float(getattr(res, "utilization_percent", res.total_allocation_percent) or 0.0),
+                    res.tasks_count,
+                ]
+            )
 
-            ws_s.column_dimensions["A"].width = 24
-            ws_s.column_dimensions["B"].width = 14
-            ws_s.column_dimensions["C"].width = 14
-            ws_s.column_dimensions["D"].width = 14
+    # ---------------- EVM ----------------
+    @staticmethod
+    def _write_evm(wb: Workbook, ctx: ExcelReportContext) -> None:
+        # Metrics fill columns A:B and the period series D:G, side by side
+        # from row 2, so each written row carries both blocks.
+        widths: dict[str, float] = {}
+        metric_rows: list[tuple[str, object]] = []
+        if ctx.evm:
+            widths.update({"A": 22, "B": 18})
+            metrics = [
+                ("As of", ctx.as_of.isoformat()),
+                ("BAC", ctx.evm.BAC),
+                ("PV", ctx.evm.PV),
+                ("EV", ctx.evm.EV),
+                ("AC", ctx.evm.AC),
+                ("SPI", ctx.evm.SPI),
+                ("CPI", ctx.evm.CPI),
+                ("EAC", ctx.evm.EAC),
+                ("ETC", ctx.evm.ETC),
+                ("VAC", ctx.evm.VAC),
+            ]
+            for k, v in metrics:
+                if isinstance(v, (int, float)):
+                    v = float(v)
+                elif v is None:
+                    v = ""
+                else:
+                    v = str(v)
+                metric_rows.append((k, v))
+        series = list(ctx.evm_series or ())
+        if series:
+            widths.update(dict.fromkeys(("D", "E", "F", "G"), 14))
+
+        ws = _SheetWriter(wb, "EVM", widths)
+        ws.title("Earned Value Management")
+
+        metric_header = ["Metric", "Value"] if ctx.evm else [None, None]
+        metric_style = ["header", "header"] if ctx.evm else [None, None]
+        if series:
+            ws.append(
+                metric_header + [None, "Period End", "PV", "EV", "AC"],
+                metric_style + [None, "header", "header", "header", "header"],
+            )
+        else:
+            ws.append(metric_header, metric_style)
+
+        for index in range(max(len(metric_rows), len(series))):
+            values: list[object] = [None, None]
+            styles: list[str | None] = [None, None]
+            if index < len(metric_rows):
+                values = list(metric_rows[index])
+                styles = ["cell", "cell"]
+            if index < len(series):
+                point = series[index]
+                values += [
+                    None,
+                    point.period_end.isoformat(),
+                    float(point.PV or 0.0),
+                    float(point.EV or 0.0),
+                    float(point.AC or 0.0),
+                ]
+                styles += [None, "cell", "cell", "cell", "cell"]
+            ws.append(values, styles)
+
+    # ---------------- Baseline Variance ----------------
+    @staticmethod
+    def _write_variance(wb: Workbook, ctx: ExcelReportContext) -> None:
+        widths = {"A": 40}
+        widths.update(dict.fromkeys(("B", "C", "D", "E", "F", "G", "H"), 15))
+        ws = _SheetWriter(wb, "Variance", widths)
+        ws.append(
+            ["Task", "Baseline Start", "Baseline Finish", "Current Start", "Current Finish", "SV days", "FV days", "Critical"],
+            "column_header",
+        )
+        for row in ctx.baseline_variance:
+            ws.append(
+                [
+                    row.task_name,
+                    "" if not row.baseline_start else row.baseline_start.isoformat(),
+                    "" if not row.baseline_finish else row.baseline_finish.isoformat(),
+                    "" if not row.current_start else row.current_start.isoformat(),
+                    "" if not row.current_finish else row.current_finish.isoformat(),
+                    "" if row.start_variance_days is None else row.start_variance_days,
+                    "" if row.finish_variance_days is None else row.finish_variance_days,
+                    "Yes" if row.is_critical else "No",
+                ]
+            )
 
-        # ---------------- Finance ----------------
-        if ctx.finance_snapshot:
-            snap = ctx.finance_snapshot
-            ws_f = wb.create_sheet("Finance")
-            ws_f["A1"] = "Finance Summary"
-            ws_f["A1"].font = title_font
-
-            row = 3
-
-            def finance_kv(key, value):
-                nonlocal row
-                ws_f[f"A{row}"] = key
-                ws_f[f"B{row}"] = value
-                ws_f[f"A{row}"].font = header_font
-                ws_f[f"A{row}"].border = thin_border
-                ws_f[f"B{row}"].border = thin_border
-                row += 1
-
-            for key, value in finance_metadata_rows(ctx):
-                finance_kv(key, value)
-
-            row += 1
-            ws_f[f"A{row}"] = "Canonical Control Summary"
-            ws_f[f"A{row}"].font = header_font
-            row += 1
-            for key, value in finance_summary_rows(ctx):
-                finance_kv(key, "" if value is None else float(value))
-
-            row += 1
-            ws_f[f"A{row}"] = "Reconciliation Controls"
-            ws_f[f"A{row}"].font = header_font
-            row += 1
-            control_headers = ["Control", "Authority Total", "Ledger Total", "Delta"]
-            for idx, header in enumerate(control_headers, start=1):
-                cell = ws_f.cell(row=row, column=idx, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.border = thin_border
-            row += 1
-            for label, authority, ledger_total, delta in finance_reconciliation_rows(ctx):
-                values = [
+    # ---------------- Cost Breakdown ----------------
+    @staticmethod
+    def _write_cost_breakdown(wb: Workbook, ctx: ExcelReportContext) -> None:
+        ws = _SheetWriter(wb, "Cost Breakdown", {"A": 18, "B": 10, "C": 14, "D": 14, "E": 14})
+        ws.append(["Type", "Currency", "Planned", "Actual", "Variance"], "column_header")
+        for row in ctx.cost_breakdown:
+            planned = float(row.planned or 0.0)
+            actual = float(row.actual or 0.0)
+            ws.append([str(row.cost_type), str(row.currency), planned, actual, actual - planned])
+
+    # ---------------- Cost Sources ----------------
+    @staticmethod
+    def _write_cost_sources(wb: Workbook, ctx: ExcelReportContext) -> None:
+        ws = _SheetWriter(wb, "Cost Sources", {"A": 24, "B": 14, "C": 14, "D": 14})
+        ws.append(["Source", "Planned", "Committed", "Actual"], "column_header")
+        for src in ctx.cost_sources.rows:
+            ws.append(
+                [
+                    src.source_label,
+                    float(src.planned or 0.0),
+                    float(src.committed or 0.0),
+                    float(src.actual or 0.0),
+                ]
+            )
+        if ctx.cost_sources.notes:
+            ws.blank()
+        for note in ctx.cost_sources.notes:
+            ws.append(["Note", note], ("label", None))
+
+    # ---------------- Finance ----------------
+    @staticmethod
+    def _write_finance(wb: Workbook, ctx: ExcelReportContext) -> None:
+        snap = ctx.finance_snapshot
+        widths = {"A": 32}
+        widths.update(dict.fromkeys(("B", "C", "D", "E", "F"), 14))
+        ws = _SheetWriter(wb, "Finance", widths)
+        ws.title("Finance Summary")
+        ws.blank()
+
+        for key, value in finance_metadata_rows(ctx):
+            ws.key_value(key, value)
+
+        ws.blank()
+        ws.label("Canonical Control Summary")
+        for key, value in finance_summary_rows(ctx):
+            ws.key_value(key, "" if value is None else float(value))
+
+        ws.blank()
+        ws.label("Reconciliation Controls")
+        ws.append(["Control", "Authority Total", "Ledger Total", "Delta"], "header")
+        for label, authority, ledger_total, delta in finance_reconciliation_rows(ctx):
+            ws.append(
+                [
                     label,
                     "" if authority is None else float(authority),
                     "" if ledger_total is None else float(ledger_total),
                     "" if delta is None else float(delta),
                 ]
-                for idx, value in enumerate(values, start=1):
-                    ws_f.cell(row=row, column=idx, value=value).border = thin_border
-                row += 1
-            finance_kv(
-                "Reconciliation status",
-                "Reconciled" if snap.reconciliation.is_reconciled else "Failed",
             )
+        ws.key_value(
+            "Reconciliation status",
+            "Reconciled" if snap.reconciliation.is_reconciled else "Failed",
+        )
 
-            row += 1
-            ws_f[f"A{row}"] = "Cashflow / Forecast by Period"
-            ws_f[f"A{row}"].font = header_font
-            row += 1
-            headers = ["Period", "Planned", "Committed", "Actual", "Forecast", "Exposure"]
-            for idx, h in enumerate(headers, start=1):
-                cell = ws_f.cell(row=row, column=idx, value=h)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center
-                cell.border = thin_border
-            row += 1
-            for p in snap.cashflow:
-                values = [
+        ws.blank()
+        ws.label("Cashflow / Forecast by Period")
+        ws.append(["Period", "Planned", "Committed", "Actual", "Forecast", "Exposure"], "column_header")
+        for p in snap.cashflow:
+            ws.append(
+                [
                     p.period_key,
                     float(p.planned),
                     float(p.committed),
@@ -371,25 +338,14 @@ class ExcelReportRenderer:
                     float(p.forecast),
                     float(p.exposure),
                 ]
-                for idx, val in enumerate(values, start=1):
-                    cell = ws_f.cell(row=row, column=idx, value=val)
-                    cell.border = thin_border
-                row += 1
-
-            row += 1
-            ws_f[f"A{row}"] = "Expense Analytics (By Source)"
-            ws_f[f"A{row}"].font = header_font
-            row += 1
-            headers = ["Category", "Planned", "Committed", "Actual", "Forecast", "Exposure"]
-            for idx, h in enumerate(headers, start=1):
-                cell = ws_f.cell(row=row, column=idx, value=h)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center
-                cell.border = thin_border
-            row += 1
-            for a in snap.by_source:
-                values = [
+            )
+
+        ws.blank()
+        ws.label("Expense Analytics (By Source)")
+        ws.append(["Category", "Planned", "Committed", "Actual", "Forecast", "Exposure"], "column_header")
+        for a in snap.by_source:
+            ws.append(
+                [
                     a.label,
                     float(a.planned),
                     float(a.committed),
@@ -397,45 +353,39 @@ class ExcelReportRenderer:
                     float(a.forecast),
                     float(a.exposure),
                 ]
-                for idx, val in enumerate(values, start=1):
-                    cell = ws_f.cell(row=row, column=idx, value=val)
-                    cell.border = thin_border
-                row += 1
-
-            ws_f.column_dimensions["A"].width = 32
-            ws_f.column_dimensions["B"].width = 14
-            ws_f.column_dimensions["C"].width = 14
-            ws_f.column_dimensions["D"].width = 14
-            ws_f.column_dimensions["E"].width = 14
-            ws_f.column_dimensions["F"].width = 14
-
-            ws_ledger = wb.create_sheet("Finance Ledger")
-            ledger_headers = finance_ledger_headers()
-            for idx, h in enumerate(ledger_headers, start=1):
-                cell = ws_ledger.cell(row=1, column=idx, value=h)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = center
-                cell.border = thin_border
-
-            ledger_page = ctx.finance_ledger_page
-            if ledger_page is None:
-                raise ValueError("Finance ledger export page is required.")
-            for row_idx, row_data in enumerate(ledger_page.rows, start=2):
-                values = list(finance_ledger_values(row_data))
-                values[-2] = float(values[-2])
-                for idx, val in enumerate(values, start=1):
-                    cell = ws_ledger.cell(row=row_idx, column=idx, value=val)
-                    cell.border = thin_border
-
-            for column in ("A", "B", "C"):
-                ws_ledger.column_dimensions[column].width = 12
-            for column in ("D", "E", "F", "G", "I", "J", "M", "O", "R"):
-                ws_ledger.column_dimensions[column].width = 16
-            for column in ("H", "K", "N", "P"):
-                ws_ledger.column_dimensions[column].width = 24
-            ws_ledger.column_dimensions["L"].width = 34
-            ws_ledger.column_dimensions["Q"].width = 14
+            )
 
-        wb.save(output_path)
-        return output_path
+    @staticmethod
+    def _write_finance_ledger(wb: Workbook, ctx: ExcelReportContext) -> None:
+        ledger_page = ctx.finance_ledger_page
+        if ledger_page is None:
+            raise ValueError("Finance ledger export page is required.")
+        widths: dict[str, float] = dict.fromkeys(("A", "B", "C"), 12)
+        widths.update(dict.fromkeys(("D", "E", "F", "G", "I", "J", "M", "O", "R"), 16))
+        widths.update(dict.fromkeys(("H", "K", "N", "P"), 24))
+        widths.update({"L": 34, "Q": 14})
+        ws = _SheetWriter(wb, "Finance Ledger", widths)
+        ws.append(list(finance_ledger_headers()), "column_header")
+        for row_data in ledger_page.rows:
+            values = list(finance_ledger_values(row_data))
+            values[-2] = float(values[-2])
+            ws.append(values)
+
+
+def _task_rows(bars: Iterable[GanttTaskBar]) -> Iterator[list[object]]:
+    for b in bars:
+        dur = (b.end - b.start).days + 1 if (b.start and b.end) else None
+        yield [
+            b.task_id,
+            b.wbs_code,
+            b.name,
+            b.start.isoformat() if b.start else "",
+            b.end.isoformat() if b.end else "",
+            dur,
+            "Yes" if b.is_critical else "No",
+            b.percent_complete,
+            getattr(b.status, "value", str(b.status)),
+        ]
+
+
+__all__ = ["ExcelReportRenderer"]
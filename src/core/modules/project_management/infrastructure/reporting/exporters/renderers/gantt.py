@@ -6,6 +6,7 @@ from pathlib import Path
 import matplotlib.dates as mdates
 import matplotlib.patches as mpatches
 from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
 from matplotlib.dates import date2num
 from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
@@ -13,6 +14,9 @@ from matplotlib import ticker
 
 from src.core.modules.project_management.infrastructure.reporting.models.report_models import GanttTaskBar
 
+DEFAULT_GANTT_ROWS_PER_PAGE = 80
+
+
 class GanttPngRenderer:
     _STATUS_COLORS = {
         "DONE": "#16A34A",
@@ -24,6 +28,14 @@ class GanttPngRenderer:
     _CRITICAL_PROGRESS_COLOR = "#991B1B"
     _DEFAULT_PROGRESS_COLOR = "#1D4ED8"
     _BAR_MIN_WIDTH_DAYS = 0.6
+    _FIGURE_WIDTH_IN = 16
+    _DPI = 220
+    # Past this the rows shrink instead of the figure growing, and the DPI
+    # drops so an image never exceeds the pixel budget.
+    _MAX_FIGURE_HEIGHT_IN = 60
+    _MAX_IMAGE_PIXELS = 8_000_000
+    _MIN_LABEL_ROW_PIXELS = 9
+    _MAX_PERCENT_LABELS = 400
 
     def _normalize_status(self, status: str | None) -> str:
         if not status:
@@ -69,86 +81,169 @@ class GanttPngRenderer:
         ax.xaxis.set_minor_formatter(ticker.NullFormatter())
         ax.tick_params(axis="x", labelsize=9, rotation=25)
 
-    def render(self, bars: list[GanttTaskBar], output_path: Path) -> Path:
+    def render(
+        self,
+        bars: list[GanttTaskBar],
+        output_path: Path,
+        *,
+        summary_level: int | None = None,
+    ) -> Path:
+        """Draw every task (or WBS summary row) into one image.
+
+        Past ``_MAX_FIGURE_HEIGHT_IN`` the rows shrink instead of the image
+        growing, and task labels are left out once a row is too short to
+        read; ``render_pages`` keeps labels readable for large projects.
+        """
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        bars = [b for b in bars if b.start and b.end]
-        if not bars:
-            raise ValueError("No tasks with dates available for Gantt chart")
+        rows = self._prepare_rows(bars, summary_level)
+        self._draw_page(rows, output_path, timeline=self._timeline(rows))
+        return output_path
 
-        bars.sort(key=lambda b: (b.start, b.end or b.start))
+    def render_pages(
+        self,
+        bars: list[GanttTaskBar],
+        output_path: Path,
+        *,
+        rows_per_page: int = DEFAULT_GANTT_ROWS_PER_PAGE,
+        summary_level: int | None = None,
+    ) -> list[Path]:
+        """Draw the chart across several images of at most ``rows_per_page``
+        rows, named ``<stem>_p001<suffix>`` and so on. Every page shares the
+        same timeline so pages line up when placed side by side."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        rows = self._prepare_rows(bars, summary_level)
+        rows_per_page = max(1, int(rows_per_page))
+        timeline = self._timeline(rows)
+        page_count = (len(rows) + rows_per_page - 1) // rows_per_page
+        paths: list[Path] = []
+        for page in range(page_count):
+            page_path = output_path.with_name(f"{output_path.stem}_p{page + 1:03d}{output_path.suffix}")
+            self._draw_page(
+                rows[page * rows_per_page : (page + 1) * rows_per_page],
+                page_path,
+                timeline=timeline,
+                title_suffix=f" (page {page + 1} of {page_count})" if page_count > 1 else "",
+            )
+            paths.append(page_path)
+        return paths
+
+    def _prepare_rows(self, bars: list[GanttTaskBar], summary_level: int | None) -> list[GanttTaskBar]:
+        rows = [b for b in bars if b.start and b.end]
+        if not rows:
+            raise ValueError("No tasks with dates available for Gantt chart")
+        if summary_level is not None:
+            rows = summarize_gantt_bars(rows, summary_level)
+        rows.sort(key=lambda b: (b.start, b.end or b.start))
+        return rows
 
-        names = [b.name.strip() or "<untitled>" for b in bars]
+    def _duration(self, bar: GanttTaskBar) -> float:
         # Render bars as point-to-point intervals so an end date appears at its own
         # date tick (e.g. 23 -> 25 ends at 25 on the chart).
-        start_nums = [date2num(b.start) for b in bars]
-        durations = [
-            max(
-                self._BAR_MIN_WIDTH_DAYS,
-                (b.end - b.start).days,
-            )
-            for b in bars
-        ]
-        critical = [b.is_critical for b in bars]
-        pct = [b.percent_complete or 0.0 for b in bars]
-        statuses = [b.status for b in bars]
-        colors = [self._status_color(status, is_critical) for status, is_critical in zip(statuses, critical)]
+        return max(self._BAR_MIN_WIDTH_DAYS, (bar.end - bar.start).days)
+
+    def _timeline(self, rows: list[GanttTaskBar]) -> tuple[float, float]:
+        min_start = date2num(min(b.start for b in rows))
+        max_finish = max(date2num(b.start) + self._duration(b) for b in rows)
+        return min_start, max_finish
+
+    def _draw_page(
+        self,
+        rows: list[GanttTaskBar],
+        output_path: Path,
+        *,
+        timeline: tuple[float, float],
+        title_suffix: str = "",
+    ) -> None:
+        count = len(rows)
+        names = [b.name.strip() or "<untitled>" for b in rows]
+        start_nums = [date2num(b.start) for b in rows]
+        durations = [self._duration(b) for b in rows]
+        pct = [max(0.0, min(100.0, float(b.percent_complete or 0.0))) for b in rows]
+        colors = [self._status_color(b.status, b.is_critical) for b in rows]
 
-        fig_height = max(5.5, 2.6 + 0.48 * len(bars))
-        fig = Figure(figsize=(16, fig_height))
+        fig_height = min(self._MAX_FIGURE_HEIGHT_IN, max(5.5, 2.6 + 0.48 * count))
+        dpi = min(
+            self._DPI,
+            (self._MAX_IMAGE_PIXELS / (self._FIGURE_WIDTH_IN * fig_height)) ** 0.5,
+        )
+        row_pixels = fig_height * dpi * 0.78 / count
+        fig = Figure(figsize=(self._FIGURE_WIDTH_IN, fig_height))
         FigureCanvasAgg(fig)
         ax = fig.add_subplot(1, 1, 1)
         fig.patch.set_facecolor("#F8FAFC")
         ax.set_facecolor("white")
 
-        for i in range(len(names)):
-            if i % 2 == 0:
-                ax.axhspan(i - 0.5, i + 0.5, color="#F8FAFC", zorder=0)
-
-        for i, (s, d, c, p, color) in enumerate(zip(start_nums, durations, critical, pct, colors)):
-            p = max(0.0, min(100.0, float(p or 0.0)))
-            ax.barh(
-                i,
-                d,
-                left=s,
-                height=0.58,
-                color=color,
-                edgecolor="#0F172A",
-                linewidth=0.5,
+        # One collection per layer keeps the artist count constant however
+        # many tasks the chart has.
+        band_left, band_right = timeline[0] - 1.5, timeline[1] + 1.5
+        ax.add_collection(
+            PolyCollection(
+                [_rectangle(band_left, i, band_right - band_left, 1.0) for i in range(0, count, 2)],
+                facecolors="#F8FAFC",
+                edgecolors="none",
+                zorder=0,
+                gid="gantt-bands",
+            ),
+            autolim=False,
+        )
+        ax.add_collection(
+            PolyCollection(
+                [_rectangle(s, i, d, 0.58) for i, (s, d) in enumerate(zip(start_nums, durations))],
+                facecolors=colors,
+                edgecolors="#0F172A",
+                linewidths=0.5,
                 alpha=0.88,
                 zorder=2,
+                gid="gantt-bars",
+            ),
+            autolim=False,
+        )
+        progress = [
+            (
+                _rectangle(s, i, d * p / 100.0, 0.32),
+                self._CRITICAL_PROGRESS_COLOR if b.is_critical else self._darken(color, ratio=0.72),
             )
-            if p > 0:
-                progress_color = self._CRITICAL_PROGRESS_COLOR if c else self._darken(color, ratio=0.72)
-                ax.barh(
-                    i,
-                    d * p / 100.0,
-                    left=s,
-                    height=0.32,
-                    color=progress_color,
-                    edgecolor="none",
+            for i, (b, s, d, p, color) in enumerate(zip(rows, start_nums, durations, pct, colors))
+            if p > 0
+        ]
+        if progress:
+            ax.add_collection(
+                PolyCollection(
+                    [rect for rect, _ in progress],
+                    facecolors=[color for _, color in progress],
+                    edgecolors="none",
                     alpha=0.95,
                     zorder=3,
-                )
-            if d >= 2.0:
-                x_label = s + d - 0.2
-                ax.text(
-                    x_label,
-                    i,
-                    f"{p:.0f}%",
-                    va="center",
-                    ha="right",
-                    fontsize=8,
-                    color="#0F172A",
-                    zorder=4,
-                )
-
-        ax.set_yticks(range(len(names)))
-        ax.set_yticklabels(names, fontsize=9)
-        ax.invert_yaxis()
+                    gid="gantt-progress",
+                ),
+                autolim=False,
+            )
+
+        show_labels = row_pixels >= self._MIN_LABEL_ROW_PIXELS
+        if show_labels and count <= self._MAX_PERCENT_LABELS:
+            for i, (s, d, p) in enumerate(zip(start_nums, durations, pct)):
+                if d >= 2.0:
+                    ax.text(
+                        s + d - 0.2,
+                        i,
+                        f"{p:.0f}%",
+                        va="center",
+                        ha="right",
+                        fontsize=8,
+                        color="#0F172A",
+                        zorder=4,
+                    )
+
+        if show_labels:
+            ax.set_yticks(range(count))
+            ax.set_yticklabels(names, fontsize=9)
+        else:
+            ax.set_yticks([])
+            ax.set_ylabel(f"{count} tasks", fontsize=10, color="#475569")
+        ax.set_ylim(count - 0.5, -1.0)
         ax.tick_params(axis="y", length=0)
 
-        min_start = min(start_nums)
-        max_finish = max(s + d for s, d in zip(start_nums, durations))
+        min_start, max_finish = timeline
         ax.set_xlim(min_start - 1.5, max_finish + 1.5)
         self._configure_timeline_axis(ax, min_start, max_finish)
 
@@ -166,7 +261,13 @@ class GanttPngRenderer:
             zorder=6,
         )
 
-        ax.set_title("Project Gantt Schedule", fontsize=14, fontweight="bold", color="#0F172A", pad=14)
+        ax.set_title(
+            f"Project Gantt Schedule{title_suffix}",
+            fontsize=14,
+            fontweight="bold",
+            color="#0F172A",
+            pad=14,
+        )
         ax.set_xlabel("Timeline (Date)", fontsize=10, color="#475569", labelpad=8)
         ax.grid(True, which="major", axis="x", linestyle="-", linewidth=0.6, color="#CBD5E1", alpha=0.7)
         ax.grid(True, which="minor", axis="x", linestyle=":", linewidth=0.5, color="#E2E8F0", alpha=0.9)
@@ -192,7 +293,76 @@ class GanttPngRenderer:
         )
 
         fig.subplots_adjust(left=0.24, right=0.98, top=0.90, bottom=0.12)
-        fig.savefig(output_path, dpi=220)
+        fig.savefig(output_path, dpi=dpi)
         fig.clear()
 
-        return output_path
+
+def _rectangle(left: float, row: int, width: float, height: float) -> list[tuple[float, float]]:
+    top = row - height / 2.0
+    bottom = row + height / 2.0
+    return [(left, top), (left + width, top), (left + width, bottom), (left, bottom)]
+
+
+def _wbs_prefix(wbs_code: str, level: int) -> str | None:
+    parts = [part for part in str(wbs_code or "").strip().split(".") if part]
+    if len(parts) < level:
+        return None
+    return ".".join(parts[:level])
+
+
+def summarize_gantt_bars(bars: list[GanttTaskBar], level: int) -> list[GanttTaskBar]:
+    """Collapse tasks to one row per WBS branch at ``level`` (1 = top level).
+
+    Tasks at shallower levels, and tasks without a WBS code, are kept as
+    they are. A summary row spans its branch, is critical when any task in
+    it is, and reports duration-weighted progress. It is named after the
+    task whose WBS code is the branch code, when there is one.
+    """
+    level = max(1, int(level))
+    summarized: list[GanttTaskBar | list[GanttTaskBar]] = []
+    groups: dict[str, list[GanttTaskBar]] = {}
+    for bar in bars:
+        prefix = _wbs_prefix(bar.wbs_code, level)
+        if prefix is None:
+            summarized.append(bar)
+            continue
+        group = groups.get(prefix)
+        if group is None:
+            group = groups[prefix] = []
+            summarized.append(group)
+        group.append(bar)
+    return [
+        entry if isinstance(entry, GanttTaskBar) else _summary_bar(entry, level)
+        for entry in summarized
+    ]
+
+
+def _summary_bar(group: list[GanttTaskBar], level: int) -> GanttTaskBar:
+    prefix = _wbs_prefix(group[0].wbs_code, level)
+    if len(group) == 1:
+        return group[0]
+    head = next((bar for bar in group if bar.wbs_code.strip() == prefix), None)
+    weights = [max(1, ((bar.end or bar.start) - bar.start).days) for bar in group]
+    percent = sum(float(bar.percent_complete or 0.0) * weight for bar, weight in zip(group, weights)) / sum(weights)
+    statuses = {str(bar.status or "TODO").upper().strip() for bar in group}
+    if statuses == {"DONE"}:
+        status = "DONE"
+    elif "BLOCKED" in statuses:
+        status = "BLOCKED"
+    elif statuses & {"DONE", "IN_PROGRESS"} or percent > 0:
+        status = "IN_PROGRESS"
+    else:
+        status = "TODO"
+    return GanttTaskBar(
+        task_id=head.task_id if head is not None else f"wbs:{prefix}",
+        name=f"{prefix} {head.name.strip() if head is not None else ''}".strip() + f" ({len(group)} tasks)",
+        start=min(bar.start for bar in group),
+        end=max(bar.end or bar.start for bar in group),
+        is_critical=any(bar.is_critical for bar in group),
+        percent_complete=percent,
+        status=status,
+        wbs_code=prefix,
+    )
+
+
+__all__ = ["DEFAULT_GANTT_ROWS_PER_PAGE", "GanttPngRenderer", "summarize_gantt_bars"]
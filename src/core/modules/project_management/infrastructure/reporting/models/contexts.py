@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
 
 from src.core.modules.project_management.infrastructure.reporting.models.report_models import (
@@ -78,10 +78,13 @@ class ReportExportContext:
 @dataclass
 class ExcelReportContext(ReportExportContext):
     gantt: list[GanttTaskBar]
+    # Build time per section in milliseconds; empty when not composed.
+    section_timings_ms: dict[str, float] = field(default_factory=dict)
 
 @dataclass
 class PdfReportContext(ReportExportContext):
     gantt_png_path: str
+    section_timings_ms: dict[str, float] = field(default_factory=dict)
 
 
 __all__ = [
@@ -1 +1,33 @@
 """Scheduled report generation."""
+
+from src.core.modules.project_management.infrastructure.reporting.schedulers.cadence import ReportCadence
+from src.core.modules.project_management.infrastructure.reporting.schedulers.output_cache import (
+    ReportOutputCache,
+    report_input_fingerprint,
+)
+from src.core.modules.project_management.infrastructure.reporting.schedulers.runner import (
+    DEFAULT_SCHEDULE_POLL_SECONDS,
+    ScheduledReportRun,
+    ScheduledReportRunner,
+    ScheduledReportWorker,
+    ServiceGraphFactory,
+)
+from src.core.modules.project_management.infrastructure.reporting.schedulers.schedule import (
+    SCHEDULABLE_REPORT_KEYS,
+    ReportSchedule,
+    ReportScheduleStore,
+)
+
+__all__ = [
+    "DEFAULT_SCHEDULE_POLL_SECONDS",
+    "ReportCadence",
+    "ReportOutputCache",
+    "ReportSchedule",
+    "ReportScheduleStore",
+    "SCHEDULABLE_REPORT_KEYS",
+    "ScheduledReportRun",
+    "ScheduledReportRunner",
+    "ScheduledReportWorker",
+    "ServiceGraphFactory",
+    "report_input_fingerprint",
+]
@@ -0,0 +1,136 @@
+"""Cron-style cadences for scheduled reports."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+_DAY_NAMES = {"sun": 0, "mon": 1, "tue": 2, "wed": 3, "thu": 4, "fri": 5, "sat": 6}
+_MONTH_NAMES = {
+    name: index
+    for index, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1,
+    )
+}
+# Every weekday/day-of-month combination repeats within 28 years, so a
+# cadence with no match in that window (e.g. "0 0 31 2 *") never fires.
+_SEARCH_DAYS = 366 * 28
+
+
+def _parse_field(
+    text: str,
+    *,
+    low: int,
+    high: int,
+    names: dict[str, int] | None = None,
+) -> frozenset[int]:
+    def value(token: str) -> int:
+        key = token.strip().lower()
+        if names and key in names:
+            return names[key]
+        if not key.isdigit():
+            raise ValueError(f"Invalid cadence value '{token}'.")
+        return int(key)
+
+    values: set[int] = set()
+    for part in text.split(","):
+        base, _, step_text = part.partition("/")
+        step = value(step_text) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Invalid cadence step in '{part}'.")
+        if base == "*":
+            start, stop = low, high
+        elif "-" in base:
+            start_text, _, stop_text = base.partition("-")
+            start, stop = value(start_text), value(stop_text)
+        else:
+            start = value(base)
+            stop = high if step_text else start
+        if start < low or stop > high or start > stop:
+            raise ValueError(f"Cadence field '{part}' is outside {low}-{high}.")
+        values.update(range(start, stop + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class ReportCadence:
+    """
+    A five-field cron expression: ``minute hour day-of-month month
+    day-of-week``.
+
+    Fields accept ``*``, numbers, ``a-b`` ranges, ``,`` lists and ``/n``
+    steps; months and weekdays also accept three-letter names (``mon``,
+    ``jan``) and Sunday is ``0`` or ``7``. As in cron, when both the
+    day-of-month and the day-of-week are restricted a day matches either.
+    ``@hourly``, ``@daily``, ``@weekly`` and ``@monthly`` are accepted.
+    ``"0 6 * * mon"`` is every Monday at 06:00.
+    """
+
+    expression: str
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days_of_month: frozenset[int]
+    months: frozenset[int]
+    days_of_week: frozenset[int]
+    day_of_month_restricted: bool
+    day_of_week_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> "ReportCadence":
+        normalized = " ".join(str(expression or "").split())
+        fields = _ALIASES.get(normalized.lower(), normalized).split(" ")
+        if len(fields) != 5:
+            raise ValueError(
+                f"Cadence '{expression}' must have five fields: minute hour day month weekday."
+            )
+        minute, hour, day_of_month, month, day_of_week = fields
+        days_of_week = _parse_field(day_of_week, low=0, high=7, names=_DAY_NAMES)
+        if 7 in days_of_week:
+            days_of_week = (days_of_week - {7}) | {0}
+        return cls(
+            expression=normalized,
+            minutes=_parse_field(minute, low=0, high=59),
+            hours=_parse_field(hour, low=0, high=23),
+            days_of_month=_parse_field(day_of_month, low=1, high=31),
+            months=_parse_field(month, low=1, high=12, names=_MONTH_NAMES),
+            days_of_week=days_of_week,
+            day_of_month_restricted=not day_of_month.startswith("*"),
+            day_of_week_restricted=not day_of_week.startswith("*"),
+        )
+
+    def matches_day(self, moment: datetime) -> bool:
+        if moment.month not in self.months:
+            return False
+        day_of_month = moment.day in self.days_of_month
+        # Python's Monday is 0; cron's Sunday is 0.
+        day_of_week = (moment.weekday() + 1) % 7 in self.days_of_week
+        if self.day_of_month_restricted and self.day_of_week_restricted:
+            return day_of_month or day_of_week
+        return day_of_month and day_of_week
+
+    def next_after(self, moment: datetime) -> datetime:
+        """The first matching minute strictly after ``moment`` (same tzinfo)."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        hours = sorted(self.hours)
+        minutes = sorted(self.minutes)
+        for _ in range(_SEARCH_DAYS):
+            if self.matches_day(candidate):
+                for hour in hours:
+                    if hour < candidate.hour:
+                        continue
+                    first_minute = candidate.minute if hour == candidate.hour else 0
+                    for minute in minutes:
+                        if minute >= first_minute:
+                            return candidate.replace(hour=hour, minute=minute)
+            candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+        raise ValueError(f"Cadence '{self.expression}' never fires.")
+
+
+__all__ = ["ReportCadence"]
@@ -0,0 +1,142 @@
+"""Rendered report outputs cached by the fingerprint of their inputs."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import shutil
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+
+from src.core.modules.project_management.infrastructure.reporting.models.contexts import ExcelReportContext
+
+# Differ on every build; excluded so an unchanged project fingerprints the same.
+_VOLATILE_FIELDS = frozenset({"generated_at", "section_timings_ms"})
+
+DEFAULT_OUTPUT_CACHE_MAX_AGE = timedelta(days=30)
+DEFAULT_OUTPUT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+
+def _canonical(value: object, *, skip: frozenset[str] = _VOLATILE_FIELDS) -> object:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return [
+            type(value).__name__,
+            [
+                [item.name, _canonical(getattr(value, item.name))]
+                for item in dataclasses.fields(value)
+                if item.name not in skip
+            ],
+        ]
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, Mapping):
+        return sorted(([repr(key), _canonical(item)] for key, item in value.items()), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(item) for item in value), key=repr)
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value.normalize())
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    # Anything else fingerprints by type and str(); an object whose str()
+    # embeds its identity just never matches, which costs a re-render.
+    return [type(value).__name__, str(value)]
+
+
+def report_input_fingerprint(
+    report_key: str,
+    inputs: ExcelReportContext,
+    *,
+    parameters: Mapping[str, object] | None = None,
+) -> str:
+    """SHA-256 over the report key, the render parameters and every value
+    the report shows, excluding the build timestamp."""
+    # The context's as-of date is only printed beside the EVM metrics; every
+    # other value that depends on it is fingerprinted as data, so a report
+    # without EVM still matches yesterday's output.
+    skip = _VOLATILE_FIELDS if inputs.evm else _VOLATILE_FIELDS | {"as_of"}
+    digest = hashlib.sha256()
+    digest.update(
+        repr([report_key, _canonical(dict(parameters or {})), _canonical(inputs, skip=skip)]).encode("utf-8")
+    )
+    return digest.hexdigest()
+
+
+class ReportOutputCache:
+    """
+    One rendered file per input fingerprint under ``root``.
+
+    A scheduled run whose fingerprint is already cached reuses the stored
+    file instead of rendering the report again. ``evict`` removes files not
+    reused within ``max_age`` and then the least recently used ones until
+    the cache fits in ``max_bytes``; either limit can be ``None``.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        max_age: timedelta | None = DEFAULT_OUTPUT_CACHE_MAX_AGE,
+        max_bytes: int | None = DEFAULT_OUTPUT_CACHE_MAX_BYTES,
+    ) -> None:
+        self._root = Path(root)
+        self._max_age = max_age
+        self._max_bytes = max_bytes
+
+    def path_for(self, fingerprint: str, suffix: str) -> Path:
+        return self._root / fingerprint[:2] / f"{fingerprint}{suffix}"
+
+    def get(self, fingerprint: str, suffix: str) -> Path | None:
+        path = self.path_for(fingerprint, suffix)
+        if not path.is_file():
+            return None
+        # A hit counts as a use, so eviction goes by last reuse.
+        os.utime(path)
+        return path
+
+    def put(self, fingerprint: str, rendered_path: str | Path) -> Path:
+        source = Path(rendered_path)
+        target = self.path_for(fingerprint, source.suffix)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f"{target.name}.tmp")
+        shutil.copyfile(source, temp_path)
+        os.replace(temp_path, target)
+        return target
+
+    def evict(self, *, keep: Iterable[str | Path] = (), now: datetime | None = None) -> int:
+        """Remove expired and least recently used files, never those in
+        ``keep``, and return how many were removed."""
+        if not self._root.is_dir():
+            return 0
+        kept = {Path(path) for path in keep}
+        entries = sorted(
+            ((path.stat(), path) for path in self._root.glob("*/*") if path.is_file()),
+            key=lambda entry: entry[0].st_mtime,
+        )
+        cutoff = (now or datetime.now()).timestamp() - self._max_age.total_seconds() if self._max_age else None
+        total = sum(stat.st_size for stat, _path in entries)
+        removed = 0
+        for stat, path in entries:
+            expired = cutoff is not None and stat.st_mtime < cutoff
+            oversized = self._max_bytes is not None and total > self._max_bytes
+            if path in kept or not (expired or oversized):
+                continue
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed += 1
+        return removed
+
+
+__all__ = [
+    "DEFAULT_OUTPUT_CACHE_MAX_AGE",
+    "DEFAULT_OUTPUT_CACHE_MAX_BYTES",
+    "ReportOutputCache",
+    "report_input_fingerprint",
+]
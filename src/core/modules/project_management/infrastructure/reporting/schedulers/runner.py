@@ -0,0 +1,245 @@
+"""Background runner for scheduled reports."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterable, Mapping
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+
+from sqlalchemy.orm import Session
+
+from src.core.modules.project_management.infrastructure.reporting.api import (
+    build_report_inputs,
+    generate_excel_report,
+    generate_pdf_report,
+)
+from src.core.modules.project_management.infrastructure.reporting.deliveries.base import (
+    ReportDelivery,
+    ScheduledReportOutput,
+)
+from src.core.modules.project_management.infrastructure.reporting.schedulers.output_cache import (
+    ReportOutputCache,
+    report_input_fingerprint,
+)
+from src.core.modules.project_management.infrastructure.reporting.schedulers.schedule import (
+    ReportSchedule,
+    ReportScheduleStore,
+)
+from src.core.platform.common.periodic_worker import PeriodicWorker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEDULE_POLL_SECONDS = 60.0
+_REPORT_SUFFIXES = {"excel_report": ".xlsx", "pdf_report": ".pdf"}
+
+ServiceGraphFactory = Callable[[Session], Mapping[str, object] | None]
+
+
+@dataclass(frozen=True)
+class ScheduledReportRun:
+    schedule_id: str
+    output: ScheduledReportOutput | None
+    delivered_to: tuple[str, ...] = ()
+    error: str | None = None
+    duration_ms: float = 0.0
+
+
+class ScheduledReportRunner:
+    """
+    Renders the schedules in a ``ReportScheduleStore`` that are due.
+
+    Each run opens its own session from ``session_factory`` and builds a
+    service graph on it with ``build_services`` (which must return a graph
+    whose ``user_session`` may export reports), so a run never shares a
+    session with the UI. When ``build_services`` returns ``None`` there is
+    nobody to run as: the schedule stays due and runs on a later poll. The
+    report's data is read once and fingerprinted; when the output cache
+    already holds that fingerprint the cached file is delivered and nothing
+    is rendered. A failed run is logged and recorded on the schedule, and
+    the schedule moves on to its next slot. After a poll that ran anything
+    the cache is trimmed, keeping the outputs just delivered.
+
+    Cadences are evaluated against naive local wall-clock time.
+    """
+
+    def __init__(
+        self,
+        *,
+        store: ReportScheduleStore,
+        cache: ReportOutputCache,
+        deliveries: Iterable[ReportDelivery],
+        session_factory: Callable[[], Session],
+        build_services: ServiceGraphFactory,
+        work_dir: str | Path,
+    ) -> None:
+        self._store = store
+        self._cache = cache
+        self._deliveries = {delivery.channel: delivery for delivery in deliveries}
+        self._session_factory = session_factory
+        self._build_services = build_services
+        self._work_dir = Path(work_dir)
+
+    def run_due(self, now: datetime | None = None) -> list[ScheduledReportRun]:
+        """Run every due schedule. An enabled schedule that has never been
+        scheduled is given its next slot instead of running straight away."""
+        now = now or datetime.now()
+        runs: list[ScheduledReportRun] = []
+        for schedule in self._store.list_schedules():
+            if not schedule.enabled:
+                continue
+            if schedule.next_run_at is None:
+                self._store.save(schedule.scheduled_after(now))
+            elif schedule.is_due(now):
+                runs.append(self.run_schedule(schedule, now))
+        if runs:
+            self._cache.evict(keep=[run.output.path for run in runs if run.output is not None])
+        return runs
+
+    def run_schedule(self, schedule: ReportSchedule, now: datetime | None = None) -> ScheduledReportRun:
+        now = now or datetime.now()
+        started = perf_counter()
+        session = self._session_factory()
+        try:
+            services = self._build_services(session)
+            if services is None:
+                return ScheduledReportRun(
+                    schedule_id=schedule.id,
+                    output=None,
+                    error="No signed-in user to run the report as.",
+                    duration_ms=(perf_counter() - started) * 1000,
+                )
+            output = self._render(schedule, services, now)
+            delivered_to = tuple(
+                self._delivery(channel).deliver(output, services) for channel in schedule.deliveries
+            )
+            session.commit()
+        except Exception as exc:
+            session.rollback()
+            logger.exception("Scheduled report failed schedule_id=%s name=%s", schedule.id, schedule.name)
+            self._store.save(replace(schedule, last_run_at=now, last_error=str(exc)).scheduled_after(now))
+            return ScheduledReportRun(
+                schedule_id=schedule.id,
+                output=None,
+                error=str(exc),
+                duration_ms=(perf_counter() - started) * 1000,
+            )
+        finally:
+            session.close()
+        self._store.save(
+            replace(
+                schedule,
+                last_run_at=now,
+                last_fingerprint=output.fingerprint,
+                last_output_path=str(output.path),
+                last_error=None,
+            ).scheduled_after(now)
+        )
+        run = ScheduledReportRun(
+            schedule_id=schedule.id,
+            output=output,
+            delivered_to=delivered_to,
+            duration_ms=(perf_counter() - started) * 1000,
+        )
+        logger.info(
+            "Scheduled report delivered schedule_id=%s reused=%s duration_ms=%.1f",
+            schedule.id,
+            output.reused,
+            run.duration_ms,
+        )
+        return run
+
+    def _delivery(self, channel: str) -> ReportDelivery:
+        delivery = self._deliveries.get(channel)
+        if delivery is None:
+            raise ValueError(f"No report delivery is registered for '{channel}'.")
+        return delivery
+
+    def _render(
+        self,
+        schedule: ReportSchedule,
+        services: Mapping[str, object],
+        now: datetime,
+    ) -> ScheduledReportOutput:
+        reporting_service = services["reporting_service"]
+        finance_service = services.get("finance_service")
+        inputs = build_report_inputs(
+            reporting_service,
+            schedule.project_id,
+            finance_service=finance_service,
+            baseline_id=schedule.baseline_id,
+            as_of=now.date(),
+            finance_period=schedule.finance_period,
+        )
+        fingerprint = report_input_fingerprint(schedule.report_key, inputs)
+        suffix = _REPORT_SUFFIXES[schedule.report_key]
+        cached = self._cache.get(fingerprint, suffix)
+        if cached is not None:
+            return ScheduledReportOutput(schedule, cached, fingerprint, now, reused=True)
+
+        self._work_dir.mkdir(parents=True, exist_ok=True)
+        rendered_path = self._work_dir / f"{schedule.id}{suffix}"
+        access = {
+            "user_session": services.get("user_session"),
+            "module_catalog_service": services.get("module_catalog_service"),
+        }
+        try:
+            if schedule.report_key == "pdf_report":
+                generate_pdf_report(
+                    reporting_service,
+                    schedule.project_id,
+                    rendered_path,
+                    temp_dir=self._work_dir / schedule.id,
+                    finance_service=finance_service,
+                    inputs=inputs,
+                    **access,
+                )
+            else:
+                generate_excel_report(
+                    reporting_service,
+                    schedule.project_id,
+                    rendered_path,
+                    finance_service=finance_service,
+                    inputs=inputs,
+                    **access,
+                )
+            cached = self._cache.put(fingerprint, rendered_path)
+        finally:
+            with suppress(FileNotFoundError):
+                rendered_path.unlink()
+        return ScheduledReportOutput(schedule, cached, fingerprint, now)
+
+
+class ScheduledReportWorker(PeriodicWorker):
+    """
+    Calls ``runner.run_due`` on a daemon thread every ``poll_seconds``.
+
+    Start it once the application (or a headless host process) is up and
+    stop it on shutdown; ``stop`` waits for a run in progress to finish.
+    """
+
+    def __init__(
+        self,
+        runner: ScheduledReportRunner,
+        *,
+        poll_seconds: float = DEFAULT_SCHEDULE_POLL_SECONDS,
+        initial_delay_seconds: float = 0.0,
+    ) -> None:
+        super().__init__(
+            runner.run_due,
+            interval_seconds=poll_seconds,
+            initial_delay_seconds=initial_delay_seconds,
+            name="scheduled-reports",
+        )
+
+
+__all__ = [
+    "DEFAULT_SCHEDULE_POLL_SECONDS",
+    "ScheduledReportRun",
+    "ScheduledReportRunner",
+    "ScheduledReportWorker",
+    "ServiceGraphFactory",
+]
@@ -0,0 +1,134 @@
+"""Report schedule definitions and their file-backed store."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+
+from src.core.modules.project_management.infrastructure.reporting.schedulers.cadence import ReportCadence
+from src.core.platform.common.ids import generate_id
+
+SCHEDULABLE_REPORT_KEYS = ("excel_report", "pdf_report")
+_DATETIME_FIELDS = ("next_run_at", "last_run_at")
+
+
+@dataclass(frozen=True)
+class ReportSchedule:
+    """
+    One report to render on a cadence and where to deliver it.
+
+    ``deliveries`` names the delivery channels (``"filesystem"``,
+    ``"notification"``) registered with the runner; ``recipient_user_ids``
+    are the users a notification delivery notifies. The ``last_*`` fields
+    and ``next_run_at`` are maintained by the runner.
+    """
+
+    name: str
+    report_key: str
+    project_id: str
+    cadence: str
+    deliveries: tuple[str, ...] = ("filesystem",)
+    recipient_user_ids: tuple[str, ...] = ()
+    baseline_id: str | None = None
+    finance_period: str = "month"
+    enabled: bool = True
+    id: str = field(default_factory=generate_id)
+    next_run_at: datetime | None = None
+    last_run_at: datetime | None = None
+    last_fingerprint: str | None = None
+    last_output_path: str | None = None
+    last_error: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.report_key not in SCHEDULABLE_REPORT_KEYS:
+            raise ValueError(
+                f"Report '{self.report_key}' cannot be scheduled; "
+                f"expected one of {', '.join(SCHEDULABLE_REPORT_KEYS)}."
+            )
+        if not str(self.project_id or "").strip():
+            raise ValueError("A report schedule requires a project.")
+        if not self.deliveries:
+            raise ValueError("A report schedule requires at least one delivery.")
+        ReportCadence.parse(self.cadence)
+
+    def is_due(self, now: datetime) -> bool:
+        return self.enabled and (self.next_run_at is None or self.next_run_at <= now)
+
+    def scheduled_after(self, moment: datetime) -> "ReportSchedule":
+        return replace(self, next_run_at=ReportCadence.parse(self.cadence).next_after(moment))
+
+    def to_dict(self) -> dict[str, object]:
+        payload = asdict(self)
+        payload["deliveries"] = list(self.deliveries)
+        payload["recipient_user_ids"] = list(self.recipient_user_ids)
+        for key in _DATETIME_FIELDS:
+            value = payload[key]
+            payload[key] = value.isoformat() if value is not None else None
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, object]) -> "ReportSchedule":
+        values = dict(payload)
+        values["deliveries"] = tuple(values.get("deliveries") or ())
+        values["recipient_user_ids"] = tuple(values.get("recipient_user_ids") or ())
+        for key in _DATETIME_FIELDS:
+            value = values.get(key)
+            values[key] = datetime.fromisoformat(value) if value else None
+        return cls(**values)
+
+
+class ReportScheduleStore:
+    """
+    Report schedules kept in one JSON file.
+
+    Every write replaces the file atomically, so a worker reading the store
+    never sees a half-written file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+
+    def list_schedules(self) -> list[ReportSchedule]:
+        with self._lock:
+            return list(self._read().values())
+
+    def get(self, schedule_id: str) -> ReportSchedule | None:
+        with self._lock:
+            return self._read().get(schedule_id)
+
+    def save(self, schedule: ReportSchedule) -> ReportSchedule:
+        with self._lock:
+            schedules = self._read()
+            schedules[schedule.id] = schedule
+            self._write(schedules)
+        return schedule
+
+    def delete(self, schedule_id: str) -> None:
+        with self._lock:
+            schedules = self._read()
+            if schedules.pop(schedule_id, None) is not None:
+                self._write(schedules)
+
+    def _read(self) -> dict[str, ReportSchedule]:
+        if not self._path.exists():
+            return {}
+        payload = json.loads(self._path.read_text(encoding="utf-8") or "[]")
+        schedules = (ReportSchedule.from_dict(item) for item in payload)
+        return {schedule.id: schedule for schedule in schedules}
+
+    def _write(self, schedules: dict[str, ReportSchedule]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_name(f"{self._path.name}.tmp")
+        temp_path.write_text(
+            json.dumps([schedule.to_dict() for schedule in schedules.values()], indent=2, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(temp_path, self._path)
+
+
+__all__ = ["ReportSchedule", "ReportScheduleStore", "SCHEDULABLE_REPORT_KEYS"]
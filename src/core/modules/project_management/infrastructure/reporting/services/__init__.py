@@ -1,5 +1,9 @@
 """Reporting orchestration service."""
 
 from src.core.modules.project_management.infrastructure.reporting.services.reporting_service import ReportingService
+from src.core.modules.project_management.infrastructure.reporting.services.report_composition import (
+    ComposedReport,
+    ReportComposer,
+)
 
-__all__ = ["ReportingService"]
+__all__ = ["ComposedReport", "ReportComposer", "ReportingService"]
@@ -39,11 +39,13 @@ from src.core.modules.project_management.infrastructure.reporting.builders.evm i
 from src.core.modules.project_management.infrastructure.reporting.builders.kpi import ReportingKpiMixin
 from src.core.modules.project_management.infrastructure.reporting.builders.labor import ReportingLaborMixin
 from src.core.modules.project_management.infrastructure.reporting.builders.profitability import ReportingProfitabilityMixin
+from src.core.modules.project_management.infrastructure.reporting.builders.snapshot import ReportingSnapshotMixin
 from src.core.modules.project_management.infrastructure.reporting.builders.variance import ReportingVarianceMixin
 
 
 class ReportingService(
     ProjectManagementModuleGuardMixin,
+    ReportingSnapshotMixin,
     ReportingCostBreakdownMixin,
     ReportingBaselineCompareMixin,
     ReportingProfitabilityMixin,
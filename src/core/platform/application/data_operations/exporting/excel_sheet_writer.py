@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date, time, timedelta
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+
+# Binding one of these to a cell sets a date number format, so each type
+# gets its own template cell.
+_TEMPORAL_TYPES = (date, time, timedelta)
+
+CellStyles = Mapping[str, Mapping[str, object]]
+
+
+class ExcelSheetWriter:
+    """Appends rows to one sheet of a write-only workbook.
+
+    A write-only sheet serialises each row as it is appended, so one styled
+    ``WriteOnlyCell`` per (column, style, temporal type) is built on first
+    use and reused for every later row; styles are resolved once per column,
+    not once per cell. ``styles`` maps a style key to the cell attributes
+    (``font``, ``fill``, ``border``, ``alignment``...) it sets; a ``None``
+    style key appends the bare value."""
+
+    def __init__(
+        self,
+        workbook: Workbook,
+        title: str,
+        *,
+        styles: CellStyles,
+        widths: Mapping[str, float] | Iterable[tuple[str, float]] = (),
+    ) -> None:
+        self._sheet = workbook.create_sheet(title)
+        self._styles = styles
+        # Column dimensions are written before the first row.
+        for column, width in widths.items() if isinstance(widths, Mapping) else widths:
+            self._sheet.column_dimensions[column].width = width
+        self._templates: dict[tuple[int, str, type | None], WriteOnlyCell] = {}
+
+    def append(self, values: Sequence[object], style: str | Sequence[str | None] | None = "cell") -> None:
+        styles = [style] * len(values) if style is None or isinstance(style, str) else style
+        row: list[object] = []
+        for column, (value, style_key) in enumerate(zip(values, styles)):
+            row.append(value if style_key is None else self._styled(column, value, style_key))
+        self._sheet.append(row)
+
+    def blank(self) -> None:
+        self._sheet.append([])
+
+    def _styled(self, column: int, value: object, style_key: str) -> WriteOnlyCell:
+        key = (column, style_key, type(value) if isinstance(value, _TEMPORAL_TYPES) else None)
+        cell = self._templates.get(key)
+        if cell is None:
+            cell = WriteOnlyCell(self._sheet)
+            for attribute, style_value in self._styles[style_key].items():
+                setattr(cell, attribute, style_value)
+            self._templates[key] = cell
+        cell.value = value
+        return cell
+
+
+__all__ = ["CellStyles", "ExcelSheetWriter"]
@@ -1,6 +1,17 @@
-from src.core.platform.application.data_operations.importing.csv_import_runtime import CsvImportRuntime
+from src.core.platform.application.data_operations.importing.csv_import_runtime import (
+    DEFAULT_IMPORT_CHUNK_SIZE,
+    IMPORT_CHECKPOINT_METADATA_KEY,
+    CsvImportRuntime,
+    ImportProgressCallback,
+)
 from src.core.platform.application.data_operations.importing.import_definition_registry import (
     ImportDefinitionRegistry,
 )
 
-__all__ = ["CsvImportRuntime", "ImportDefinitionRegistry"]
+__all__ = [
+    "DEFAULT_IMPORT_CHUNK_SIZE",
+    "IMPORT_CHECKPOINT_METADATA_KEY",
+    "CsvImportRuntime",
+    "ImportDefinitionRegistry",
+    "ImportProgressCallback",
+]
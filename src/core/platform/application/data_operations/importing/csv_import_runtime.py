@@ -1,8 +1,29 @@
+"""CSV import runtime.
+
+Files are parsed incrementally with ``csv.reader`` over a file handle, so a
+preview reads only the rows it shows and an import holds one chunk of rows
+at a time. Definitions that declare a ``chunk_size`` are executed chunk by
+chunk; each chunk is committed by the definition before the next one is
+read, and only counters and row errors are kept in memory. With runtime
+tracking attached, every committed chunk records a checkpoint on the
+execution so a failed import can be resumed after the last committed chunk;
+the checkpoint records the file's size and modification time, and a resume
+against a file that no longer matches is refused.
+Definitions without a ``chunk_size`` (e.g. imports whose rows may reference
+rows later in the file) still receive every row in one call.
+"""
+
 from __future__ import annotations
 
 import csv
+import io
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict
+from itertools import islice
 from pathlib import Path
+from time import perf_counter
 
+from src.core.platform.common.exceptions import BusinessRuleError
 from src.core.platform.common.runtime_access import enforce_runtime_access
 from src.core.platform.domain.security.auth.session import UserSessionContext
 from src.core.platform.application.data_operations.importing.import_definition_registry import (
@@ -12,13 +33,94 @@ from src.core.platform.domain.data_operations.importing import (
     ImportDefinition,
     ImportFieldSpec,
     ImportPreview,
+    ImportProgress,
     ImportSourceRow,
     ImportSummary,
+    RowError,
 )
 from src.core.platform.contract.port.tenant.modules import SupportsModuleEntitlements
 from src.core.platform.application.data_operations.runtime_tracking.runtime_execution_service import (
     RuntimeExecutionService,
 )
+from src.core.platform.domain.data_operations.runtime_tracking import RuntimeExecution
+
+DEFAULT_IMPORT_CHUNK_SIZE = 1000
+IMPORT_CHECKPOINT_METADATA_KEY = "import_checkpoint"
+# Row errors listed in a checkpoint so a resumed import still reports the
+# errors of the attempt that failed. Beyond the limit only the first errors
+# are listed; the checkpoint's error count still covers every one, and the
+# resumed summary reports the rest as ``omitted_error_count``.
+_CHECKPOINT_ERROR_LIMIT = 500
+
+ImportProgressCallback = Callable[[ImportProgress], None]
+
+
+class _ByteCountingReader(io.RawIOBase):
+    def __init__(self, raw) -> None:
+        self._raw = raw
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        count = self._raw.readinto(buffer)
+        self.bytes_read += count or 0
+        return count
+
+    def close(self) -> None:
+        self._raw.close()
+        super().close()
+
+
+class _CsvSource:
+    """One pass over a CSV file: lower-cased header columns, then non-blank
+    records numbered like ``csv.DictReader`` rows (header is line 1)."""
+
+    def __init__(self, file_path: str | Path) -> None:
+        path = Path(file_path)
+        # SECURITY: Validate file path to prevent directory traversal
+        resolved_path = path.resolve()
+        if not str(resolved_path).startswith(str(Path(file_path).parent.resolve())):
+            raise ValueError(f"Invalid file path: {file_path}")
+        self.total_bytes = path.stat().st_size
+        self._counter = _ByteCountingReader(path.open("rb"))
+        self._handle = io.TextIOWrapper(
+            io.BufferedReader(self._counter),
+            encoding="utf-8-sig",
+            newline="",
+        )
+        self._reader = csv.reader(self._handle)
+        header = next(self._reader, [])
+        self._header = [str(field or "").strip().lower() for field in header]
+        self.columns = [field for field in self._header if field]
+
+    @property
+    def bytes_read(self) -> int:
+        return self._counter.bytes_read
+
+    def rows(self) -> Iterator[tuple[int, dict[str, str]]]:
+        header = self._header
+        width = len(header)
+        line_no = 1
+        for record in self._reader:
+            if not record:
+                continue
+            line_no += 1
+            if len(record) < width:
+                record = record + [""] * (width - len(record))
+            normalized = {key: record[index].strip() for index, key in enumerate(header) if key}
+            if any(normalized.values()):
+                yield line_no, normalized
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self) -> _CsvSource:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 class CsvImportRuntime:
@@ -52,8 +154,8 @@ class CsvImportRuntime:
         return tuple(definition.field_specs())
 
     def read_csv_columns(self, file_path: str | Path) -> list[str]:
-        columns, _rows = self._load_csv_source(file_path)
-        return columns
+        with _CsvSource(file_path) as source:
+            return source.columns
 
     def preview_csv(
         self,
@@ -73,12 +175,15 @@ class CsvImportRuntime:
             user_session=user_session,
             module_catalog_service=module_catalog_service,
         )
-        columns, rows, mapping = self._prepare_rows(
-            definition,
-            file_path,
-            column_mapping=column_mapping,
-        )
-        preview = definition.preview(rows[: max(1, int(max_rows))])
+        with _CsvSource(file_path) as source:
+            mapping = self._effective_mapping(
+                tuple(definition.field_specs()),
+                source.columns,
+                column_mapping,
+            )
+            rows = list(islice(self._source_rows(source.rows(), mapping), max(1, int(max_rows))))
+            columns = source.columns
+        preview = definition.preview(rows)
         preview.entity_type = normalized
         preview.available_columns = columns
         preview.mapped_columns = mapping
@@ -90,9 +195,19 @@ class CsvImportRuntime:
         file_path: str | Path,
         *,
         column_mapping: dict[str, str | None] | None = None,
+        chunk_size: int | None = None,
+        resume_execution_id: str | None = None,
+        progress_callback: ImportProgressCallback | None = None,
         user_session: UserSessionContext | None = None,
         module_catalog_service: SupportsModuleEntitlements | None = None,
     ) -> ImportSummary:
+        """Stream ``file_path`` through the definition.
+
+        ``chunk_size`` overrides the definition's chunk size (it has no
+        effect on definitions that need the whole file). ``resume_execution_id``
+        names a failed import of the same operation; rows up to its last
+        checkpoint are skipped and its counters carried over.
+        ``progress_callback`` receives throughput and ETA after each chunk."""
         normalized = self._registry.normalize_key(operation_key)
         definition = self._registry.get(normalized)
         self._authorize(
@@ -101,30 +216,60 @@ class CsvImportRuntime:
             user_session=user_session,
             module_catalog_service=module_catalog_service,
         )
+        resumed = self._resumable_execution(resume_execution_id, normalized)
+        source_identity = self._source_identity(file_path)
+        summary, committed_through_line = self._summary_from_checkpoint(normalized, resumed, source_identity)
         execution = (
             self._runtime_execution_service.start_execution(
                 operation_type="import",
                 operation_key=normalized,
                 module_code=definition.module_code,
                 input_path=file_path,
+                retry_of_execution_id=resumed.id if resumed is not None else None,
             )
             if self._runtime_execution_service is not None
             else None
         )
+        definition_chunk_size = getattr(definition, "chunk_size", None)
+        effective_chunk_size = (chunk_size or definition_chunk_size) if definition_chunk_size else None
+        started = perf_counter()
+        rows_processed = 0
         try:
-            _columns, rows, _mapping = self._prepare_rows(
-                definition,
-                file_path,
-                column_mapping=column_mapping,
-            )
-            summary = definition.execute(rows)
+            with _CsvSource(file_path) as source:
+                mapping = self._effective_mapping(
+                    tuple(definition.field_specs()),
+                    source.columns,
+                    column_mapping,
+                )
+                pending = (
+                    item for item in source.rows() if item[0] > committed_through_line
+                )
+                for chunk in self._chunks(self._source_rows(pending, mapping), effective_chunk_size):
+                    self._merge_summary(summary, definition.execute(chunk))
+                    rows_processed += len(chunk)
+                    committed_through_line = chunk[-1].line_no
+                    progress = ImportProgress(
+                        operation_key=normalized,
+                        rows_processed=rows_processed,
+                        committed_through_line=committed_through_line,
+                        bytes_read=source.bytes_read,
+                        total_bytes=source.total_bytes,
+                        elapsed_seconds=perf_counter() - started,
+                        created_count=summary.created_count,
+                        updated_count=summary.updated_count,
+                        error_count=summary.error_count,
+                    )
+                    if execution is not None:
+                        self._record_checkpoint(execution, summary, progress, source_identity)
+                    if progress_callback is not None:
+                        progress_callback(progress)
             summary.entity_type = normalized
             if execution is not None:
                 self._runtime_execution_service.complete_execution(
                     execution,
-                    created_count=getattr(summary, "created_count", 0),
-                    updated_count=getattr(summary, "updated_count", 0),
-                    error_count=len(getattr(summary, "row_errors", ()) or ()),
+                    created_count=summary.created_count,
+                    updated_count=summary.updated_count,
+                    error_count=summary.error_count,
                 )
             return summary
         except Exception as exc:
@@ -132,26 +277,128 @@ class CsvImportRuntime:
                 self._runtime_execution_service.fail_execution(execution, error_message=str(exc))
             raise
 
-    def _prepare_rows(
+    def _resumable_execution(
         self,
-        definition: ImportDefinition,
-        file_path: str | Path,
-        *,
-        column_mapping: dict[str, str | None] | None,
-    ) -> tuple[list[str], list[ImportSourceRow], dict[str, str | None]]:
-        columns, raw_rows = self._load_csv_source(file_path)
-        mapping = self._effective_mapping(tuple(definition.field_specs()), columns, column_mapping)
-        rows = [
-            ImportSourceRow(
+        execution_id: str | None,
+        operation_key: str,
+    ) -> RuntimeExecution | None:
+        if not execution_id:
+            return None
+        if self._runtime_execution_service is None:
+            raise ValueError("Resuming an import requires runtime execution tracking.")
+        previous = self._runtime_execution_service.get_execution(execution_id)
+        if previous is None:
+            raise ValueError("Runtime execution not found.")
+        if previous.operation_type != "import" or previous.operation_key != operation_key:
+            raise BusinessRuleError(
+                "Only an import of the same type can be resumed.",
+                code="IMPORT_RESUME_OPERATION_MISMATCH",
+            )
+        if previous.status == "COMPLETED":
+            raise BusinessRuleError(
+                "The import already completed; there is nothing to resume.",
+                code="IMPORT_RESUME_ALREADY_COMPLETED",
+            )
+        return previous
+
+    @staticmethod
+    def _source_identity(file_path: str | Path) -> dict[str, int]:
+        stat = Path(file_path).stat()
+        return {"source_size": stat.st_size, "source_mtime_ns": stat.st_mtime_ns}
+
+    @staticmethod
+    def _summary_from_checkpoint(
+        operation_key: str,
+        execution: RuntimeExecution | None,
+        source_identity: dict[str, int],
+    ) -> tuple[ImportSummary, int]:
+        summary = ImportSummary(entity_type=operation_key)
+        if execution is None:
+            return summary, 0
+        checkpoint = dict((execution.output_metadata or {}).get(IMPORT_CHECKPOINT_METADATA_KEY) or {})
+        committed_through_line = int(checkpoint.get("committed_through_line") or 0)
+        # Lines are skipped by number, so they must be the lines that were committed.
+        if committed_through_line and any(checkpoint.get(key) != value for key, value in source_identity.items()):
+            raise BusinessRuleError(
+                "The file changed after the failed import; start a new import instead of resuming.",
+                code="IMPORT_RESUME_SOURCE_CHANGED",
+            )
+        summary.created_count = int(checkpoint.get("created_count") or 0)
+        summary.updated_count = int(checkpoint.get("updated_count") or 0)
+        for payload in checkpoint.get("row_errors") or ():
+            summary.add_row_error(
+                line_no=int(payload.get("line_no") or 0),
+                message=str(payload.get("message") or ""),
+                field_key=payload.get("field_key"),
+                code=str(payload.get("code") or "ROW_ERROR"),
+                severity=payload.get("severity") or "error",
+            )
+        summary.omitted_error_count = max(0, int(checkpoint.get("error_count") or 0) - summary.error_count)
+        return summary, committed_through_line
+
+    def _record_checkpoint(
+        self,
+        execution: RuntimeExecution,
+        summary: ImportSummary,
+        progress: ImportProgress,
+        source_identity: dict[str, int],
+    ) -> None:
+        self._runtime_execution_service.record_progress(
+            execution,
+            created_count=summary.created_count,
+            updated_count=summary.updated_count,
+            error_count=summary.error_count,
+            output_metadata={
+                **dict(execution.output_metadata or {}),
+                IMPORT_CHECKPOINT_METADATA_KEY: {
+                    **source_identity,
+                    "committed_through_line": progress.committed_through_line,
+                    "created_count": summary.created_count,
+                    "updated_count": summary.updated_count,
+                    "error_count": summary.error_count,
+                    "row_errors": [
+                        asdict(row_error)
+                        for row_error in summary.row_errors[:_CHECKPOINT_ERROR_LIMIT]
+                    ],
+                },
+            },
+        )
+
+    @staticmethod
+    def _merge_summary(summary: ImportSummary, chunk_summary: ImportSummary) -> None:
+        summary.created_count += getattr(chunk_summary, "created_count", 0)
+        summary.updated_count += getattr(chunk_summary, "updated_count", 0)
+        summary.row_errors.extend(getattr(chunk_summary, "row_errors", ()) or ())
+        summary.error_rows.extend(getattr(chunk_summary, "error_rows", ()) or ())
+        summary.omitted_error_count += getattr(chunk_summary, "omitted_error_count", 0)
+
+    @staticmethod
+    def _chunks(
+        rows: Iterable[ImportSourceRow],
+        chunk_size: int | None,
+    ) -> Iterator[list[ImportSourceRow]]:
+        if not chunk_size:
+            everything = list(rows)
+            if everything:
+                yield everything
+            return
+        iterator = iter(rows)
+        while chunk := list(islice(iterator, max(1, int(chunk_size)))):
+            yield chunk
+
+    @staticmethod
+    def _source_rows(
+        raw_rows: Iterable[tuple[int, dict[str, str]]],
+        mapping: dict[str, str | None],
+    ) -> Iterator[ImportSourceRow]:
+        for line_no, raw in raw_rows:
+            yield ImportSourceRow(
                 line_no=line_no,
                 values={
                     key: str(raw.get(source or "", "") or "").strip() if source else ""
                     for key, source in mapping.items()
                 },
             )
-            for line_no, raw in raw_rows
-        ]
-        return columns, rows, mapping
 
     def _authorize(
         self,
@@ -198,31 +445,10 @@ class CsvImportRuntime:
             resolved[field.key] = selected if selected in available else None
         return resolved
 
-    @staticmethod
-    def _load_csv_source(file_path: str | Path) -> tuple[list[str], list[tuple[int, dict[str, str]]]]:
-        path = Path(file_path)
-        # SECURITY: Validate file path to prevent directory traversal
-        resolved_path = path.resolve()
-        if not str(resolved_path).startswith(str(Path(file_path).parent.resolve())):
-            raise ValueError(f"Invalid file path: {file_path}")
 
-        rows: list[tuple[int, dict[str, str]]] = []
-        with path.open("r", encoding="utf-8-sig", newline="") as handle:
-            reader = csv.DictReader(handle)
-            columns = [
-                str(field or "").strip().lower()
-                for field in (reader.fieldnames or [])
-                if str(field or "").strip()
-            ]
-            for idx, raw in enumerate(reader, start=2):
-                normalized = {
-                    str(key or "").strip().lower(): str(value or "").strip()
-                    for key, value in (raw or {}).items()
-                    if str(key or "").strip()
-                }
-                if any(normalized.values()):
-                    rows.append((idx, normalized))
-        return columns, rows
-
-
-__all__ = ["CsvImportRuntime"]
+__all__ = [
+    "DEFAULT_IMPORT_CHUNK_SIZE",
+    "IMPORT_CHECKPOINT_METADATA_KEY",
+    "CsvImportRuntime",
+    "ImportProgressCallback",
+]
@@ -3,6 +3,8 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from pathlib import Path
 
+from sqlalchemy.orm import Session
+
 from src.core.platform.domain.security.auth.session import UserSessionContext
 from src.core.platform.common.exceptions import BusinessRuleError
 from src.core.platform.contract.repositories.data_operations.runtime_tracking.contracts import RuntimeExecutionRepository
@@ -17,10 +19,12 @@ class RuntimeExecutionService:
         runtime_execution_repo: RuntimeExecutionRepository,
         tenant_context_service: TenantContextService,
         user_session: UserSessionContext | None = None,
+        session: Session | None = None,
     ) -> None:
         self._runtime_execution_repo = runtime_execution_repo
         self._tenant_context_service = tenant_context_service
         self._user_session = user_session
+        self._session = session
 
     def start_execution(
         self,
@@ -91,6 +95,30 @@ class RuntimeExecutionService:
         self._runtime_execution_repo.update(execution)
         return execution
 
+    def record_progress(
+        self,
+        execution: RuntimeExecution,
+        *,
+        created_count: int,
+        updated_count: int,
+        error_count: int,
+        output_metadata: dict[str, object] | None = None,
+    ) -> RuntimeExecution:
+        """Persist counters (and e.g. a resume checkpoint) for a running
+        execution. Committed immediately when a session is attached, so the
+        checkpoint survives a later failure of the operation."""
+        self._require_execution_scope(execution, operation_label="record runtime execution progress")
+        execution.created_count = created_count
+        execution.updated_count = updated_count
+        execution.error_count = error_count
+        if output_metadata is not None:
+            execution.output_metadata = output_metadata
+        execution.updated_at = datetime.now(timezone.utc)
+        self._runtime_execution_repo.update(execution)
+        if self._session is not None:
+            self._session.commit()
+        return execution
+
     def fail_execution(
         self,
         execution: RuntimeExecution,
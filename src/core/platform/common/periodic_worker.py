@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicWorker:
+    """
+    Calls ``job`` on a daemon thread every ``interval_seconds``, the first
+    time after ``initial_delay_seconds``.
+
+    Start it once the application (or a headless host process) is up and
+    stop it on shutdown; ``stop`` waits for a run in progress to finish. A
+    failing run is logged and the worker carries on with the next one.
+    """
+
+    def __init__(
+        self,
+        job: Callable[[], object],
+        *,
+        interval_seconds: float,
+        name: str,
+        initial_delay_seconds: float = 0.0,
+    ) -> None:
+        self._job = job
+        self._interval_seconds = max(0.01, float(interval_seconds))
+        self._initial_delay_seconds = max(0.0, float(initial_delay_seconds))
+        self._name = name
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._loop, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        if self._stopping.wait(self._initial_delay_seconds):
+            return
+        while not self._stopping.is_set():
+            try:
+                self._job()
+            except Exception:
+                logger.exception("Periodic job failed worker=%s", self._name)
+            self._stopping.wait(self._interval_seconds)
+
+
+__all__ = ["PeriodicWorker"]
@@ -3,6 +3,7 @@ from src.core.platform.domain.data_operations.importing.import_models import (
     ImportFieldSpec,
     ImportPreview,
     ImportPreviewRow,
+    ImportProgress,
     ImportSourceRow,
     ImportSummary,
     RowError,
@@ -13,6 +14,7 @@ __all__ = [
     "ImportFieldSpec",
     "ImportPreview",
     "ImportPreviewRow",
+    "ImportProgress",
     "ImportSourceRow",
     "ImportSummary",
     "RowError",
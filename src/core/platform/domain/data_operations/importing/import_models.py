@@ -39,6 +39,9 @@ class ImportSummary:
     updated_count: int = 0
     error_rows: list[str] = field(default_factory=list)
     row_errors: list[RowError] = field(default_factory=list)
+    # Errors counted but not listed, e.g. those a resumed import's checkpoint
+    # did not carry over.
+    omitted_error_count: int = 0
 
     def add_row_error(
         self,
@@ -62,7 +65,7 @@ class ImportSummary:
 
     @property
     def error_count(self) -> int:
-        return len(self.error_rows)
+        return len(self.error_rows) + self.omitted_error_count
 
 
 @dataclass
@@ -92,10 +95,44 @@ class ImportPreview:
         return sum(1 for row in self.rows if row.status == "READY")
 
 
+@dataclass(frozen=True)
+class ImportProgress:
+    """Snapshot reported after each committed import chunk."""
+
+    operation_key: str
+    rows_processed: int
+    committed_through_line: int
+    bytes_read: int
+    total_bytes: int
+    elapsed_seconds: float
+    created_count: int = 0
+    updated_count: int = 0
+    error_count: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_processed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def percent_complete(self) -> float:
+        if self.total_bytes <= 0:
+            return 100.0
+        return min(100.0, 100.0 * self.bytes_read / self.total_bytes)
+
+    @property
+    def eta_seconds(self) -> float | None:
+        """Remaining time extrapolated from the bytes consumed so far."""
+        if self.bytes_read <= 0 or self.elapsed_seconds <= 0:
+            return None
+        remaining = max(0, self.total_bytes - self.bytes_read)
+        return self.elapsed_seconds * remaining / self.bytes_read
+
+
 __all__ = [
     "ImportFieldSpec",
     "ImportPreview",
     "ImportPreviewRow",
+    "ImportProgress",
     "ImportSourceRow",
     "ImportSummary",
     "RowError",
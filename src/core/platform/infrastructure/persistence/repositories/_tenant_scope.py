@@ -83,6 +83,28 @@ class TenantScopedRepositorySupport:
             raise NotFoundError(not_found_message)
         return obj
 
+    def _require_all_in_scope(
+        self,
+        orm_model,
+        record_ids,
+        *,
+        operation_label: str,
+        not_found_message: str,
+    ) -> None:
+        """Batch form of ``_require_in_scope``: one SELECT over the distinct
+        ids instead of one per row."""
+        wanted = set(record_ids)
+        if not wanted:
+            return
+        ctx = self._context(operation_label=operation_label)
+        stmt = self._apply_scope(
+            select(orm_model.id).where(orm_model.id.in_(wanted)),
+            orm_model,
+            ctx,
+        )
+        if set(self.session.execute(stmt).scalars().all()) != wanted:
+            raise NotFoundError(not_found_message)
+
     def _stamp_scope(self, ctx: _ScopeIds, orm: object) -> None:
         if hasattr(orm, "organization_id"):
             organization_id = getattr(orm, "organization_id", None)
@@ -103,6 +125,27 @@ class TenantScopedRepositorySupport:
                     code="TENANT_SCOPE_VIOLATION",
                 )
 
+    def _stamp_scope_values(self, ctx: _ScopeIds, orm_model, values: dict) -> None:
+        """``_stamp_scope`` for mapper row dicts headed for a bulk insert."""
+        if hasattr(orm_model, "organization_id"):
+            organization_id = values.get("organization_id")
+            if not organization_id:
+                values["organization_id"] = ctx.organization_id
+            elif organization_id != ctx.organization_id:
+                raise BusinessRuleError(
+                    f"{self._repository_label} organization is outside the active scope.",
+                    code="ORGANIZATION_SCOPE_VIOLATION",
+                )
+        if hasattr(orm_model, "tenant_id"):
+            tenant_id = values.get("tenant_id")
+            if not tenant_id:
+                values["tenant_id"] = ctx.tenant_id
+            elif not self._tenant_in_scope(ctx, tenant_id):
+                raise BusinessRuleError(
+                    f"{self._repository_label} tenant is outside the active scope.",
+                    code="TENANT_SCOPE_VIOLATION",
+                )
+
 
 class TenantParentScopedRepositorySupport(TenantScopedRepositorySupport):
     def _scoped_stmt_for_anchor(
@@ -5,7 +5,7 @@ from time import perf_counter
 
 from src.core.platform.contract.port.time_management.calendar.calendar_protocol import CalendarProtocol
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any
 
 from sqlalchemy.orm import Session
@@ -142,10 +142,21 @@ from src.core.modules.project_management.application.resources.resource_capacity
 from src.core.modules.project_management.application.resources.enterprise_resource_availability import EnterpriseResourceAvailabilityService
 from src.core.modules.project_management.application.resources.resource_availability_service import ResourceAvailabilityService
 from src.core.modules.project_management.application.resources.portfolio_resource_pool_service import PortfolioResourcePoolService
-from src.infra.composition.inventory_registry import build_inventory_procurement_service_bundle
-from src.infra.composition.maintenance_registry import build_maintenance_service_bundle
+from src.infra.composition.inventory_registry import (
+    InventoryProcurementServiceBundle,
+    build_inventory_procurement_service_bundle,
+)
+from src.infra.composition.lazy_services import LazyServiceContainer
+from src.infra.composition.maintenance_registry import (
+    MaintenanceServiceBundle,
+    build_maintenance_service_bundle,
+)
 from src.infra.composition.platform_registry import build_platform_service_bundle
-from src.infra.composition.project_registry import build_project_management_service_bundle
+from src.infra.composition.platform_registry import PlatformServiceBundle
+from src.infra.composition.project_registry import (
+    ProjectManagementServiceBundle,
+    build_project_management_service_bundle,
+)
 from src.infra.composition.repositories import build_repository_bundle
 from src.infra.integration.delivery import SystemDeliveryClock
 from src.infra.integration.approved_time_dispatcher import ApprovedTimeFinancialDispatcher
@@ -408,208 +419,204 @@ class ServiceGraph:
         }
 
 
-def build_service_graph(session: Session) -> ServiceGraph:
-    started = perf_counter()
-    logger.debug("Service graph build begin session_type=%s", type(session).__name__)
-    repositories = build_repository_bundle(session)
-    logger.debug(
-        "Repository bundle built duration_ms=%.1f",
-        (perf_counter() - started) * 1000,
-    )
-    platform_services = build_platform_service_bundle(session, repositories)
-    logger.debug(
-        "Platform service bundle built duration_ms=%.1f",
-        (perf_counter() - started) * 1000,
-    )
-    _delivery_clock = SystemDeliveryClock()
-    _time_financial_outbox_service = IntegrationOutboxService(
-        repository=repositories.time_financial_outbox_repo,
+# ServiceGraph fields double as service-dict keys, except for these.
+_SERVICE_KEY_ALIASES = {
+    "enterprise_resource_availability": "resource_availability_service",
+}
+_BUNDLE_PROVIDERS = (
+    ("_platform_services", PlatformServiceBundle),
+    ("_inventory_procurement_services", InventoryProcurementServiceBundle),
+    ("_maintenance_services", MaintenanceServiceBundle),
+    ("_project_management_services", ProjectManagementServiceBundle),
+)
+# Module bundles register scope policies, scope resolvers and approval
+# handlers on these platform services while they are built, so the
+# services are only handed out once every module bundle exists.
+_MODULE_REGISTRATION_TARGETS = frozenset(
+    {
+        "access_service",
+        "approval_service",
+        "auth_service",
+        "department_service",
+        "role_governance_service",
+    }
+)
+
+
+def _provide_platform_services(services: LazyServiceContainer) -> PlatformServiceBundle:
+    session = services["session"]
+    repositories = services["_repositories"]
+    return build_platform_service_bundle(session, repositories)
+
+
+def _provide_time_financial_outbox(services: LazyServiceContainer) -> IntegrationOutboxService:
+    return IntegrationOutboxService(
+        repository=services["_repositories"].time_financial_outbox_repo,
         owner_module="platform_time",
-        clock=_delivery_clock,
+        clock=services["_delivery_clock"],
     )
-    _procurement_financial_outbox_service = IntegrationOutboxService(
-        repository=repositories.procurement_financial_outbox_repo,
+
+
+def _provide_procurement_financial_outbox(services: LazyServiceContainer) -> IntegrationOutboxService:
+    return IntegrationOutboxService(
+        repository=services["_repositories"].procurement_financial_outbox_repo,
         owner_module="inventory_procurement",
-        clock=_delivery_clock,
-    )
-    inventory_procurement_services = build_inventory_procurement_service_bundle(
-        platform_services,
-        procurement_financial_outbox_service=_procurement_financial_outbox_service,
-    )
-    logger.debug(
-        "Inventory/Procurement service bundle built duration_ms=%.1f",
-        (perf_counter() - started) * 1000,
-    )
-    maintenance_services = build_maintenance_service_bundle(
-        platform_services,
-        inventory_procurement_services,
+        clock=services["_delivery_clock"],
     )
-    logger.debug(
-        "Maintenance service bundle built duration_ms=%.1f",
-        (perf_counter() - started) * 1000,
-    )
-    project_management_services = build_project_management_service_bundle(
-        session,
-        repositories,
-        platform_services,
-        approved_time_outbox_service=_time_financial_outbox_service,
-    )
-    logger.debug(
-        "Project Management service bundle built duration_ms=%.1f",
-        (perf_counter() - started) * 1000,
-    )
-    _module_registry = ModuleRegistry(platform_services.module_catalog_service)
-    _integration_resolver = IntegrationResolver(_module_registry)
-    _project_finance_inbox_service = IntegrationInboxService(
-        repository=repositories.project_finance_inbox_repo,
+
+
+def _provide_project_finance_inbox(services: LazyServiceContainer) -> IntegrationInboxService:
+    return IntegrationInboxService(
+        repository=services["_repositories"].project_finance_inbox_repo,
         consumer_name="project_finance",
-        clock=_delivery_clock,
-    )
-    _approved_time_financial_dispatcher = ApprovedTimeFinancialDispatcher(
-        session=session,
-        outbox_service=_time_financial_outbox_service,
-        inbox_service=_project_finance_inbox_service,
-        consumer=project_management_services.approved_time_labor_cost_consumer,
+        clock=services["_delivery_clock"],
     )
-    _procurement_financial_dispatcher = ProcurementFinancialDispatcher(
-        session=session,
-        outbox_service=_procurement_financial_outbox_service,
-        inbox_service=_project_finance_inbox_service,
-        consumer=project_management_services.procurement_financial_consumer,
+
+
+def _provide_unwired_inventory_procurement(services: LazyServiceContainer) -> InventoryProcurementServiceBundle:
+    _procurement_financial_outbox_service = services["procurement_financial_outbox_service"]
+    return build_inventory_procurement_service_bundle(
+        services["_platform_services"],
+        procurement_financial_outbox_service=_procurement_financial_outbox_service,
     )
-    project_management_services.time_service.set_approved_time_dispatcher(
-        _approved_time_financial_dispatcher.dispatch_pending
+
+
+def _provide_unwired_project_management(services: LazyServiceContainer) -> ProjectManagementServiceBundle:
+    return build_project_management_service_bundle(
+        services["session"],
+        services["_repositories"],
+        services["_platform_services"],
+        approved_time_outbox_service=services["time_financial_outbox_service"],
     )
-    inventory_procurement_services.inventory_purchasing_service.set_procurement_financial_dispatcher(
-        _procurement_financial_dispatcher.dispatch_pending
+
+
+def _provide_approved_time_dispatcher(services: LazyServiceContainer) -> ApprovedTimeFinancialDispatcher:
+    session = services["session"]
+    dispatcher = ApprovedTimeFinancialDispatcher(
+        session=session,
+        outbox_service=services["time_financial_outbox_service"],
+        inbox_service=services["project_finance_inbox_service"],
+        consumer=services["_unwired_project_management_services"].approved_time_labor_cost_consumer,
     )
     try:
-        _approved_time_financial_dispatcher.dispatch_pending(limit=50)
+        dispatcher.dispatch_pending(limit=50)
     except Exception:
         session.rollback()
         logger.exception("Approved Time startup replay failed; durable events remain pending")
+    return dispatcher
+
+
+def _provide_procurement_dispatcher(services: LazyServiceContainer) -> ProcurementFinancialDispatcher:
+    session = services["session"]
+    dispatcher = ProcurementFinancialDispatcher(
+        session=session,
+        outbox_service=services["procurement_financial_outbox_service"],
+        inbox_service=services["project_finance_inbox_service"],
+        consumer=services["_unwired_project_management_services"].procurement_financial_consumer,
+    )
     try:
-        _procurement_financial_dispatcher.dispatch_pending(limit=50)
+        dispatcher.dispatch_pending(limit=50)
     except Exception:
         session.rollback()
         logger.exception("Procurement startup replay failed; durable events remain pending")
+    return dispatcher
+
+
+def _provide_project_management(services: LazyServiceContainer) -> ProjectManagementServiceBundle:
+    project_management_services = services["_unwired_project_management_services"]
+    project_management_services.time_service.set_approved_time_dispatcher(
+        services["approved_time_financial_dispatcher"].dispatch_pending
+    )
+    return project_management_services
+
+
+def _provide_inventory_procurement(services: LazyServiceContainer) -> InventoryProcurementServiceBundle:
+    inventory_procurement_services = services["_unwired_inventory_procurement_services"]
+    inventory_procurement_services.inventory_purchasing_service.set_procurement_financial_dispatcher(
+        services["procurement_financial_dispatcher"].dispatch_pending
+    )
+    return inventory_procurement_services
+
+
+def _provide_maintenance(services: LazyServiceContainer) -> MaintenanceServiceBundle:
+    return build_maintenance_service_bundle(
+        services["_platform_services"],
+        services["_inventory_procurement_services"],
+    )
+
+
+def _bundle_attribute_provider(bundle_key: str, attribute: str):
+    return lambda services: getattr(services[bundle_key], attribute)
+
+
+def _registration_target_provider(attribute: str):
+    def _provide(services: LazyServiceContainer) -> Any:
+        for bundle_key, _bundle_type in _BUNDLE_PROVIDERS:
+            services[bundle_key]
+        return getattr(services["_platform_services"], attribute)
+
+    return _provide
+
+
+def build_service_container(session: Session) -> LazyServiceContainer:
+    """Register every service as a lazy provider. A module bundle (and its
+    startup outbox replay) is built when one of its services, or a platform
+    service it registers against, is first requested."""
+    services = LazyServiceContainer()
+    services["session"] = session
+    services.register("_repositories", lambda _services: build_repository_bundle(session), internal=True)
+    services.register("_delivery_clock", lambda _services: SystemDeliveryClock(), internal=True)
+    services.register("_platform_services", _provide_platform_services, internal=True)
+    services.register(
+        "_unwired_inventory_procurement_services",
+        _provide_unwired_inventory_procurement,
+        internal=True,
+    )
+    services.register(
+        "_unwired_project_management_services",
+        _provide_unwired_project_management,
+        internal=True,
+    )
+    services.register("_inventory_procurement_services", _provide_inventory_procurement, internal=True)
+    services.register("_project_management_services", _provide_project_management, internal=True)
+    services.register("_maintenance_services", _provide_maintenance, internal=True)
+    services.register("time_financial_outbox_service", _provide_time_financial_outbox)
+    services.register("procurement_financial_outbox_service", _provide_procurement_financial_outbox)
+    services.register("project_finance_inbox_service", _provide_project_finance_inbox)
+    services.register("approved_time_financial_dispatcher", _provide_approved_time_dispatcher)
+    services.register("procurement_financial_dispatcher", _provide_procurement_dispatcher)
+    services.register(
+        "module_registry",
+        lambda services: ModuleRegistry(services["module_catalog_service"]),
+    )
+    services.register(
+        "integration_resolver",
+        lambda services: IntegrationResolver(services["module_registry"]),
+    )
+
+    graph_fields = {field.name for field in fields(ServiceGraph)}
+    for bundle_key, bundle_type in _BUNDLE_PROVIDERS:
+        for field in fields(bundle_type):
+            if field.name not in graph_fields or field.name in services:
+                continue
+            services.register(
+                _SERVICE_KEY_ALIASES.get(field.name, field.name),
+                _registration_target_provider(field.name)
+                if field.name in _MODULE_REGISTRATION_TARGETS
+                else _bundle_attribute_provider(bundle_key, field.name),
+            )
+    return services
+
+
+def build_service_graph(session: Session) -> ServiceGraph:
+    started = perf_counter()
+    logger.debug("Service graph build begin session_type=%s", type(session).__name__)
+    services = build_service_container(session)
     graph = ServiceGraph(
-        session=session,
-        user_session=platform_services.user_session,
-        platform_runtime_application_service=platform_services.platform_runtime_application_service,
-        module_catalog_service=platform_services.module_catalog_service,
-        module_registry=_module_registry,
-        integration_resolver=_integration_resolver,
-        time_financial_outbox_service=_time_financial_outbox_service,
-        procurement_financial_outbox_service=_procurement_financial_outbox_service,
-        project_finance_inbox_service=_project_finance_inbox_service,
-        approved_time_financial_dispatcher=_approved_time_financial_dispatcher,
-        procurement_financial_dispatcher=_procurement_financial_dispatcher,
-        time_service=project_management_services.time_service,
-        auth_service=platform_services.auth_service,
-        role_governance_service=platform_services.role_governance_service,
-        tenant_role_administration_service=(
-            platform_services.tenant_role_administration_service
-        ),
-        organization_service=platform_services.organization_service,
-        tenant_context_service=platform_services.tenant_context_service,
-        tenant_admin_service=platform_services.tenant_admin_service,
-        tenant_membership_service=platform_services.tenant_membership_service,
-        service_principal_service=platform_services.service_principal_service,
-        document_service=platform_services.document_service,
-        party_service=platform_services.party_service,
-        department_service=platform_services.department_service,
-        site_service=platform_services.site_service,
-        employee_service=platform_services.employee_service,
-        master_data_exchange_service=platform_services.master_data_exchange_service,
-        runtime_execution_service=platform_services.runtime_execution_service,
-        inventory_reference_service=inventory_procurement_services.inventory_reference_service,
-        inventory_data_exchange_service=inventory_procurement_services.inventory_data_exchange_service,
-        inventory_reporting_service=inventory_procurement_services.inventory_reporting_service,
-        inventory_item_category_service=inventory_procurement_services.inventory_item_category_service,
-        inventory_item_service=inventory_procurement_services.inventory_item_service,
-        inventory_maintenance_material_service=inventory_procurement_services.inventory_maintenance_material_service,
-        inventory_foundation_service=inventory_procurement_services.inventory_foundation_service,
-        inventory_service=inventory_procurement_services.inventory_service,
-        inventory_stock_service=inventory_procurement_services.inventory_stock_service,
-        inventory_reservation_service=inventory_procurement_services.inventory_reservation_service,
-        inventory_procurement_service=inventory_procurement_services.inventory_procurement_service,
-        inventory_purchasing_service=inventory_procurement_services.inventory_purchasing_service,
-        maintenance_runtime_contract_catalog_service=maintenance_services.maintenance_runtime_contract_catalog_service,
-        maintenance_asset_service=maintenance_services.maintenance_asset_service,
-        maintenance_asset_component_service=maintenance_services.maintenance_asset_component_service,
-        maintenance_document_service=maintenance_services.maintenance_document_service,
-        maintenance_downtime_event_service=maintenance_services.maintenance_downtime_event_service,
-        maintenance_failure_code_service=maintenance_services.maintenance_failure_code_service,
-        maintenance_integration_source_service=maintenance_services.maintenance_integration_source_service,
-        maintenance_labor_service=maintenance_services.maintenance_labor_service,
-        maintenance_location_service=maintenance_services.maintenance_location_service,
-        maintenance_preventive_generation_service=maintenance_services.maintenance_preventive_generation_service,
-        maintenance_preventive_plan_service=maintenance_services.maintenance_preventive_plan_service,
-        maintenance_preventive_plan_task_service=maintenance_services.maintenance_preventive_plan_task_service,
-        maintenance_reliability_service=maintenance_services.maintenance_reliability_service,
-        maintenance_reporting_service=maintenance_services.maintenance_reporting_service,
-        maintenance_sensor_exception_service=maintenance_services.maintenance_sensor_exception_service,
-        maintenance_sensor_service=maintenance_services.maintenance_sensor_service,
-        maintenance_sensor_reading_service=maintenance_services.maintenance_sensor_reading_service,
-        maintenance_sensor_source_mapping_service=maintenance_services.maintenance_sensor_source_mapping_service,
-        maintenance_system_service=maintenance_services.maintenance_system_service,
-        maintenance_task_step_template_service=maintenance_services.maintenance_task_step_template_service,
-        maintenance_task_template_service=maintenance_services.maintenance_task_template_service,
-        maintenance_work_request_service=maintenance_services.maintenance_work_request_service,
-        maintenance_work_order_service=maintenance_services.maintenance_work_order_service,
-        maintenance_work_order_material_requirement_service=maintenance_services.maintenance_work_order_material_requirement_service,
-        maintenance_work_order_task_service=maintenance_services.maintenance_work_order_task_service,
-        maintenance_work_order_task_step_service=maintenance_services.maintenance_work_order_task_step_service,
-        access_service=platform_services.access_service,
-        activity_service=platform_services.activity_service,
-        enterprise_audit_service=platform_services.enterprise_audit_service,
-        financial_period_service=platform_services.financial_period_service,
-        notification_service=platform_services.notification_service,
-        approval_service=platform_services.approval_service,
-        collaboration_service=project_management_services.collaboration_service,
-        project_service=project_management_services.project_service,
-        task_service=project_management_services.task_service,
-        timesheet_service=project_management_services.timesheet_service,
-        resource_service=project_management_services.resource_service,
-        financial_configuration_service=(
-            project_management_services.financial_configuration_service
-        ),
-        forecast_generation_service=project_management_services.forecast_generation_service,
-        forecast_version_service=project_management_services.forecast_version_service,
-        financial_change_service=project_management_services.financial_change_service,
-        billing_profile_service=project_management_services.billing_profile_service,
-        billing_preparation_service=project_management_services.billing_preparation_service,
-        rate_card_service=project_management_services.rate_card_service,
-        rate_card_resolver=project_management_services.rate_card_resolver,
-        budget_service=project_management_services.budget_service,
-        cost_entry_service=project_management_services.cost_entry_service,
-        commitment_service=project_management_services.commitment_service,
-        planned_cost_service=project_management_services.planned_cost_service,
-        finance_workspace_query=project_management_services.finance_workspace_query,
-        finance_service=project_management_services.finance_service,
-        work_calendar_engine=project_management_services.work_calendar_engine,
-        scheduling_engine=project_management_services.scheduling_engine,
-        reporting_service=project_management_services.reporting_service,
-        baseline_service=project_management_services.baseline_service,
-        dashboard_service=project_management_services.dashboard_service,
-        portfolio_service=project_management_services.portfolio_service,
-        register_service=project_management_services.register_service,
-        project_resource_service=project_management_services.project_resource_service,
-        data_import_service=project_management_services.data_import_service,
-        assignment_skill_validator=project_management_services.assignment_skill_validator,
-        enterprise_calendar_service=platform_services.enterprise_calendar_service,
-        working_rule_service=platform_services.working_rule_service,
-        calendar_exception_service=platform_services.calendar_exception_service,
-        recurring_event_service=platform_services.recurring_event_service,
-        shift_pattern_service=platform_services.shift_pattern_service,
-        calendar_assignment_service=platform_services.calendar_assignment_service,
-        enterprise_calendar_resolver=platform_services.enterprise_calendar_resolver,
-        working_time_calculator=platform_services.working_time_calculator,
-        resource_capacity_calculator=project_management_services.resource_capacity_calculator,
-        enterprise_resource_availability=project_management_services.enterprise_resource_availability,
-        resource_multi_project_allocation_service=project_management_services.resource_multi_project_allocation_service,
-        portfolio_resource_pool_service=project_management_services.portfolio_resource_pool_service,
+        **{
+            field.name: services[_SERVICE_KEY_ALIASES.get(field.name, field.name)]
+            for field in fields(ServiceGraph)
+        }
     )
     logger.debug(
         "Service graph build complete duration_ms=%.1f",
@@ -618,12 +625,14 @@ def build_service_graph(session: Session) -> ServiceGraph:
     return graph
 
 
-def build_service_dict(session: Session) -> dict[str, Any]:
+def build_service_dict(session: Session) -> LazyServiceContainer:
     started = perf_counter()
-    graph = build_service_graph(session)
-    services = graph.as_dict()
+    services = build_service_container(session)
+    # Login needs the platform bundle straight away, and resolving it here
+    # keeps bootstrap configuration errors failing at startup.
+    services["_platform_services"]
     logger.debug(
-        "Service dictionary build complete service_count=%s duration_ms=%.1f",
+        "Service dictionary registered service_count=%s duration_ms=%.1f",
         len(services),
         (perf_counter() - started) * 1000,
     )
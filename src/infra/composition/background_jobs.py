@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from src.core.modules.maintenance.application.reliability.sensor_retention import (
+    DEFAULT_SENSOR_RETENTION_INTERVAL,
+    MaintenanceSensorRetentionJob,
+)
+from src.core.modules.project_management.infrastructure.reporting.deliveries import (
+    FilesystemReportDelivery,
+    NotificationReportDelivery,
+)
+from src.core.modules.project_management.infrastructure.reporting.schedulers import (
+    DEFAULT_SCHEDULE_POLL_SECONDS,
+    ReportOutputCache,
+    ReportScheduleStore,
+    ScheduledReportRunner,
+    ScheduledReportWorker,
+)
+from src.core.platform.common.periodic_worker import PeriodicWorker
+from src.core.platform.domain.security.auth.session import UserSessionContext
+from src.infra.composition.app_container import build_service_dict
+from src.infra.composition.lazy_services import LazyServiceContainer
+from src.infra.persistence.db.session_factory import SessionLocal
+from src.infra.platform.path import user_data_dir
+
+_STARTUP_DELAY_SECONDS = 60.0
+
+
+def session_bound_services(
+    user_session: UserSessionContext,
+) -> Callable[[Session], LazyServiceContainer | None]:
+    """Builds a service graph on a job's own session, signed in as whoever is
+    signed in to ``user_session`` when the job runs (``None`` if nobody is)."""
+
+    def build(session: Session) -> LazyServiceContainer | None:
+        principal = user_session.principal
+        if principal is None:
+            return None
+        services = build_service_dict(session)
+        services["user_session"].set_principal(principal)
+        return services
+
+    return build
+
+
+def _interval_seconds(env_name: str, default: float) -> float:
+    try:
+        return max(60.0, float(os.getenv(env_name, "") or default))
+    except ValueError:
+        return default
+
+
+def build_scheduled_report_runner(
+    user_session: UserSessionContext,
+    *,
+    root: str | Path | None = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> ScheduledReportRunner:
+    """The report scheduler over the schedules, output cache and drop folder
+    under ``root`` (``scheduled_reports`` in the user data directory)."""
+    base = Path(root) if root is not None else user_data_dir() / "scheduled_reports"
+    return ScheduledReportRunner(
+        store=ReportScheduleStore(base / "schedules.json"),
+        cache=ReportOutputCache(base / "cache"),
+        deliveries=(FilesystemReportDelivery(base / "outbox"), NotificationReportDelivery()),
+        session_factory=session_factory,
+        build_services=session_bound_services(user_session),
+        work_dir=base / "work",
+    )
+
+
+def build_background_workers(
+    user_session: UserSessionContext,
+    *,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> tuple[PeriodicWorker, ...]:
+    """The background workers the desktop shell runs while it is open."""
+    build_services = session_bound_services(user_session)
+    sensor_retention = MaintenanceSensorRetentionJob(
+        session_factory=session_factory,
+        build_services=build_services,
+    )
+    return (
+        PeriodicWorker(
+            sensor_retention.run,
+            interval_seconds=_interval_seconds(
+                "PM_SENSOR_RETENTION_INTERVAL_SECONDS",
+                DEFAULT_SENSOR_RETENTION_INTERVAL.total_seconds(),
+            ),
+            initial_delay_seconds=_STARTUP_DELAY_SECONDS,
+            name="maintenance-sensor-retention",
+        ),
+        ScheduledReportWorker(
+            build_scheduled_report_runner(user_session, session_factory=session_factory),
+            poll_seconds=DEFAULT_SCHEDULE_POLL_SECONDS,
+            initial_delay_seconds=_STARTUP_DELAY_SECONDS,
+        ),
+    )
+
+
+__all__ = ["build_background_workers", "build_scheduled_report_runner", "session_bound_services"]
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Iterator, MutableMapping
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+ServiceFactory = Callable[["LazyServiceContainer"], Any]
+
+
+class ServiceCycleError(RuntimeError):
+    """Raised when resolving a provider re-enters a provider that is still
+    being built."""
+
+    def __init__(self, chain: tuple[str, ...]) -> None:
+        self.chain = chain
+        super().__init__("Service dependency cycle: " + " -> ".join(chain))
+
+
+@dataclass(frozen=True)
+class ServiceBuildRecord:
+    name: str
+    started_ms: float
+    duration_ms: float
+    depth: int
+    requested_by: str | None
+
+
+class LazyServiceContainer(MutableMapping[str, Any]):
+    """Service mapping whose entries are built by their provider on first
+    access.
+
+    Providers receive the container and pull their dependencies from it,
+    so construction follows the dependency order of whatever is requested
+    first. Re-entering a provider that is still being built raises
+    ``ServiceCycleError``. Internal providers (shared bundles) resolve like
+    any other entry but are left out of iteration and ``len``. Iterating
+    values/items resolves every public provider."""
+
+    def __init__(self) -> None:
+        self._providers: dict[str, ServiceFactory] = {}
+        self._internal: set[str] = set()
+        self._values: dict[str, Any] = {}
+        self._resolving: list[str] = []
+        self._records: list[ServiceBuildRecord] = []
+        self._created_at = perf_counter()
+
+    def register(self, name: str, factory: ServiceFactory, *, internal: bool = False) -> None:
+        if name in self._values or name in self._providers:
+            raise ValueError(f"Service '{name}' is already registered.")
+        self._providers[name] = factory
+        if internal:
+            self._internal.add(name)
+
+    @property
+    def created_at(self) -> float:
+        """``perf_counter()`` reading that ``started_ms`` is relative to."""
+        return self._created_at
+
+    def is_built(self, name: str) -> bool:
+        return name in self._values
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._values:
+            return self._values[name]
+        factory = self._providers.get(name)
+        if factory is None:
+            raise KeyError(name)
+        if name in self._resolving:
+            raise ServiceCycleError((*self._resolving[self._resolving.index(name):], name))
+        requested_by = self._resolving[-1] if self._resolving else None
+        depth = len(self._resolving)
+        self._resolving.append(name)
+        started = perf_counter()
+        try:
+            value = factory(self)
+        finally:
+            self._resolving.pop()
+        finished = perf_counter()
+        self._values[name] = value
+        self._records.append(
+            ServiceBuildRecord(
+                name=name,
+                started_ms=(started - self._created_at) * 1000,
+                duration_ms=(finished - started) * 1000,
+                depth=depth,
+                requested_by=requested_by,
+            )
+        )
+        return value
+
+    def __setitem__(self, name: str, value: Any) -> None:
+        self._providers.pop(name, None)
+        self._internal.discard(name)
+        self._values[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        found = name in self._values or name in self._providers
+        self._values.pop(name, None)
+        self._providers.pop(name, None)
+        self._internal.discard(name)
+        if not found:
+            raise KeyError(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._values or name in self._providers
+
+    def __iter__(self) -> Iterator[str]:
+        yield from (name for name in self._values if name not in self._internal)
+        yield from (
+            name
+            for name in self._providers
+            if name not in self._values and name not in self._internal
+        )
+
+    def __len__(self) -> int:
+        return len((self._values.keys() | self._providers.keys()) - self._internal)
+
+    def build_report(self) -> tuple[ServiceBuildRecord, ...]:
+        """Providers built so far, in completion order. ``duration_ms``
+        includes the time spent building the provider's dependencies."""
+        return tuple(self._records)
+
+    def log_build_report(
+        self,
+        log: logging.Logger | None = None,
+        *,
+        label: str = "Service",
+        slowest: int = 8,
+    ) -> None:
+        """Log a build summary with the slowest providers at INFO and one
+        line per built provider at DEBUG."""
+        target = log or logger
+        pending = [name for name in self._providers if name not in self._values]
+        ranked = sorted(self._records, key=lambda item: item.duration_ms, reverse=True)[:slowest]
+        target.info(
+            "%s providers built=%s pending=%s slowest=%s",
+            label,
+            len(self._records),
+            len(pending),
+            ", ".join(f"{record.name}:{record.duration_ms:.1f}ms" for record in ranked),
+        )
+        for record in sorted(self._records, key=lambda item: item.started_ms):
+            target.debug(
+                "%s provider built name=%s started_ms=%.1f duration_ms=%.1f depth=%s requested_by=%s",
+                label,
+                record.name,
+                record.started_ms,
+                record.duration_ms,
+                record.depth,
+                record.requested_by or "-",
+            )
+
+__all__ = [
+    "LazyServiceContainer",
+    "ServiceBuildRecord",
+    "ServiceCycleError",
+]
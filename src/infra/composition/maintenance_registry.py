@@ -47,15 +47,21 @@ from src.core.platform.infrastructure.persistence.repositories.master_data.docum
 from src.core.modules.maintenance.infrastructure.persistence.repositories import (
     SqlAlchemyMaintenanceAssetRepository,
     SqlAlchemyMaintenanceAssetComponentRepository,
+    SqlAlchemyMaintenanceAssetHierarchyRepository,
     SqlAlchemyMaintenanceDowntimeEventRepository,
     SqlAlchemyMaintenanceFailureCodeRepository,
+    SqlAlchemyMaintenanceFailureRollupRepository,
     SqlAlchemyMaintenanceIntegrationSourceRepository,
     SqlAlchemyMaintenanceLocationRepository,
+    SqlAlchemyMaintenancePlannerRepository,
+    SqlAlchemyMaintenancePreventiveGenerationRepository,
     SqlAlchemyMaintenancePreventivePlanInstanceRepository,
     SqlAlchemyMaintenancePreventivePlanRepository,
     SqlAlchemyMaintenancePreventivePlanTaskRepository,
+    SqlAlchemyMaintenanceReliabilityAnalyticsRepository,
     SqlAlchemyMaintenanceSensorExceptionRepository,
     SqlAlchemyMaintenanceSensorReadingRepository,
+    SqlAlchemyMaintenanceSensorRollupRepository,
     SqlAlchemyMaintenanceSensorRepository,
     SqlAlchemyMaintenanceSensorSourceMappingRepository,
     SqlAlchemyMaintenanceSystemRepository,
@@ -135,6 +141,10 @@ def build_maintenance_service_bundle(
         platform_services.session,
         tenant_context_service=platform_services.tenant_context_service,
     )
+    asset_hierarchy_repo = SqlAlchemyMaintenanceAssetHierarchyRepository(
+        platform_services.session,
+        tenant_context_service=platform_services.tenant_context_service,
+    )
     component_repo = SqlAlchemyMaintenanceAssetComponentRepository(
         platform_services.session,
         tenant_context_service=platform_services.tenant_context_service,
@@ -143,6 +153,22 @@ def build_maintenance_service_bundle(
         platform_services.session,
         tenant_context_service=platform_services.tenant_context_service,
     )
+    reliability_analytics_repo = SqlAlchemyMaintenanceReliabilityAnalyticsRepository(
+        platform_services.session,
+        tenant_context_service=platform_services.tenant_context_service,
+    )
+    failure_rollup_repo = SqlAlchemyMaintenanceFailureRollupRepository(
+        platform_services.session,
+        tenant_context_service=platform_services.tenant_context_service,
+    )
+    planner_repo = SqlAlchemyMaintenancePlannerRepository(
+        platform_services.session,
+        tenant_context_service=platform_services.tenant_context_service,
+    )
+    preventive_generation_repo = SqlAlchemyMaintenancePreventiveGenerationRepository(
+        platform_services.session,
+        tenant_context_service=platform_services.tenant_context_service,
+    )
     failure_code_repo = SqlAlchemyMaintenanceFailureCodeRepository(
         platform_services.session,
         tenant_context_service=platform_services.tenant_context_service,
@@ -179,6 +205,10 @@ def build_maintenance_service_bundle(
         platform_services.session,
         tenant_context_service=platform_services.tenant_context_service,
     )
+    sensor_rollup_repo = SqlAlchemyMaintenanceSensorRollupRepository(
+        platform_services.session,
+        tenant_context_service=platform_services.tenant_context_service,
+    )
     task_step_template_repo = SqlAlchemyMaintenanceTaskStepTemplateRepository(
         platform_services.session,
         tenant_context_service=platform_services.tenant_context_service,
@@ -287,6 +317,7 @@ def build_maintenance_service_bundle(
         location_repo=location_repo,
         system_repo=system_repo,
         party_repo=platform_services.party_repo,
+        hierarchy_repo=asset_hierarchy_repo,
         tenant_context_service=platform_services.tenant_context_service,
         user_session=platform_services.user_session,
     )
@@ -322,6 +353,7 @@ def build_maintenance_service_bundle(
         asset_repo=asset_repo,
         component_repo=component_repo,
         system_repo=system_repo,
+        failure_rollup_repo=failure_rollup_repo,
         tenant_context_service=platform_services.tenant_context_service,
         user_session=platform_services.user_session,
     )
@@ -366,6 +398,8 @@ def build_maintenance_service_bundle(
         work_order_repo=work_order_repo,
         failure_code_repo=failure_code_repo,
         downtime_event_repo=downtime_event_repo,
+        analytics_repo=reliability_analytics_repo,
+        failure_rollup_repo=failure_rollup_repo,
         tenant_context_service=platform_services.tenant_context_service,
         user_session=platform_services.user_session,
     )
@@ -432,6 +466,9 @@ def build_maintenance_service_bundle(
         organization_repo=platform_services.organization_repo,
         sensor_repo=sensor_repo,
         component_repo=component_repo,
+        preventive_plan_repo=preventive_plan_repo,
+        preventive_plan_task_repo=preventive_plan_task_repo,
+        sensor_rollup_repo=sensor_rollup_repo,
         sensor_exception_service=maintenance_sensor_exception_service,
         tenant_context_service=platform_services.tenant_context_service,
         user_session=platform_services.user_session,
@@ -479,8 +516,10 @@ def build_maintenance_service_bundle(
         location_repo=location_repo,
         system_repo=system_repo,
         failure_code_repo=failure_code_repo,
+        planner_repo=planner_repo,
         tenant_context_service=platform_services.tenant_context_service,
         user_session=platform_services.user_session,
+        activity_service=platform_services.activity_service,
     )
     maintenance_work_order_task_service = MaintenanceWorkOrderTaskService(
         platform_services.session,
@@ -519,8 +558,11 @@ def build_maintenance_service_bundle(
         task_step_template_repo=task_step_template_repo,
         work_order_task_service=maintenance_work_order_task_service,
         work_order_task_step_service=maintenance_work_order_task_step_service,
+        failure_rollup_repo=failure_rollup_repo,
+        planner_repo=planner_repo,
         tenant_context_service=platform_services.tenant_context_service,
         user_session=platform_services.user_session,
+        activity_service=platform_services.activity_service,
     )
     maintenance_work_order_material_requirement_service = MaintenanceWorkOrderMaterialRequirementService(
         platform_services.session,
@@ -530,6 +572,7 @@ def build_maintenance_service_bundle(
         item_service=inventory_services.inventory_item_service,
         inventory_service=inventory_services.inventory_service,
         maintenance_material_service=inventory_services.inventory_maintenance_material_service,
+        planner_repo=planner_repo,
         tenant_context_service=platform_services.tenant_context_service,
         user_session=platform_services.user_session,
     )
@@ -559,8 +602,10 @@ def build_maintenance_service_bundle(
         work_order_service=maintenance_work_order_service,
         work_order_task_service=maintenance_work_order_task_service,
         work_order_task_step_service=maintenance_work_order_task_step_service,
+        generation_repo=preventive_generation_repo,
         tenant_context_service=platform_services.tenant_context_service,
         user_session=platform_services.user_session,
+        activity_service=platform_services.activity_service,
     )
     logger.debug("Maintenance core services built")
     logger.debug(
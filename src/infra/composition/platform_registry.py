@@ -469,6 +469,7 @@ def build_platform_service_bundle(
         ),
         tenant_context_service=tenant_context_service,
         user_session=user_session,
+        session=session,
     )
     scope_exists_resolvers = {
         "organization": lambda tenant_id, organization_id: (
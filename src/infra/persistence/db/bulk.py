@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import bindparam, inspect, insert, select, update
+from sqlalchemy.orm import Session
+
+from src.core.platform.common.exceptions import ConcurrencyError, NotFoundError
+
+# Keeps every executemany batch and its ``IN (...)`` pre-check comfortably
+# below SQLite's bound-parameter limit while still amortising round trips.
+BULK_WRITE_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class BulkRowUpdate:
+    """One row of a batched UPDATE: the primary key, the values to write
+    (keyed by ORM attribute name) and, for versioned tables, the version
+    the caller last read."""
+
+    row_id: str
+    values: Mapping[str, Any]
+    expected_version: int | None = None
+    match: Mapping[str, Any] = field(default_factory=dict)
+
+
+def chunked(items: Sequence[Any], size: int = BULK_WRITE_CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def bulk_insert(
+    session: Session,
+    orm_type: type[Any],
+    rows: Sequence[Mapping[str, Any]],
+) -> int:
+    """Insert mapper rows (``*_to_row`` dicts keyed by ORM attribute name)
+    with one Core executemany INSERT per chunk.
+
+    Every row must carry the same keys. The rows never enter the identity
+    map, so callers that need ORM instances afterwards must re-read them."""
+    if not rows:
+        return 0
+    session.flush()
+    columns = {
+        attr.key: attr.columns[0].name for attr in inspect(orm_type).column_attrs
+    }
+    if any(key != name for key, name in columns.items()):
+        rows = [{columns[key]: value for key, value in row.items()} for row in rows]
+    stmt = insert(orm_type.__table__)
+    for chunk in chunked(rows):
+        session.execute(stmt, list(chunk))
+    return len(rows)
+
+
+def bulk_update(
+    session: Session,
+    orm_type: type[Any],
+    rows: Sequence[BulkRowUpdate],
+    *,
+    not_found_message: str,
+    stale_message: str,
+    extra_filters: Mapping[str, Any] | None = None,
+    scope_filters: Mapping[str, Any] | None = None,
+) -> list[int | None]:
+    """Batched counterpart of ``update_with_version_check``.
+
+    Each chunk is pre-checked with a single SELECT (existence, ``match``
+    columns and, when ``expected_version`` is given, the stored version)
+    and then written with one executemany UPDATE bound per row. Returns
+    the new version of every row in input order (``None`` for rows
+    written without a version check). ``scope_filters`` maps an attribute
+    to a scoped id subquery it must be ``IN``. A failure part-way leaves
+    earlier chunks written; callers rely on their transaction to roll
+    back.
+
+    Every row must carry the same ``values`` and ``match`` keys and either
+    all or none of them an ``expected_version``; a mixed batch raises
+    ``ValueError`` before anything is written."""
+    if not rows:
+        return []
+    _require_uniform_rows(rows)
+    session.flush()
+    mapper = inspect(orm_type)
+    table = orm_type.__table__
+    id_column = mapper.column_attrs["id"].columns[0]
+    versioned = rows[0].expected_version is not None
+    version_column = mapper.column_attrs["version"].columns[0] if versioned else None
+    value_keys = tuple(rows[0].values)
+    match_keys = tuple(rows[0].match)
+    filter_clauses = [
+        mapper.column_attrs[attr].columns[0] == value
+        for attr, value in (extra_filters or {}).items()
+    ]
+    # Scope subqueries are only evaluated by the per-chunk pre-check; the
+    # UPDATE itself is pinned to the pre-checked id/match/version values so
+    # SQLite does not re-run the subquery for every bound row.
+    scope_clauses = [
+        mapper.column_attrs[attr].columns[0].in_(subquery)
+        for attr, subquery in (scope_filters or {}).items()
+    ]
+
+    stmt = update(table).where(id_column == bindparam("b_row_id"), *filter_clauses)
+    for key in match_keys:
+        stmt = stmt.where(mapper.column_attrs[key].columns[0] == bindparam(f"b_match_{key}"))
+    assignments = {
+        mapper.column_attrs[key].columns[0].name: bindparam(f"b_value_{key}")
+        for key in value_keys
+    }
+    if versioned:
+        stmt = stmt.where(version_column == bindparam("b_expected_version"))
+        assignments[version_column.name] = bindparam("b_next_version")
+    stmt = stmt.values(assignments)
+
+    next_versions: list[int | None] = []
+    for chunk in chunked(rows):
+        _precheck_rows(
+            session,
+            mapper,
+            chunk,
+            filter_clauses=[*filter_clauses, *scope_clauses],
+            match_keys=match_keys,
+            versioned=versioned,
+            not_found_message=not_found_message,
+            stale_message=stale_message,
+        )
+        params = []
+        for row in chunk:
+            bound = {"b_row_id": row.row_id}
+            bound.update({f"b_value_{key}": row.values[key] for key in value_keys})
+            bound.update({f"b_match_{key}": row.match[key] for key in match_keys})
+            if versioned:
+                bound["b_expected_version"] = int(row.expected_version)
+                bound["b_next_version"] = int(row.expected_version) + 1
+            params.append(bound)
+        result = session.execute(stmt, params)
+        if session.get_bind().dialect.supports_sane_multi_rowcount and result.rowcount != len(params):
+            raise ConcurrencyError(stale_message, code="STALE_WRITE")
+        _expire_loaded_rows(session, mapper, chunk)
+        next_versions.extend(
+            int(row.expected_version) + 1 if versioned else None for row in chunk
+        )
+    return next_versions
+
+
+def _require_uniform_rows(rows: Sequence[BulkRowUpdate]) -> None:
+    # The statement and its bind parameters are built from the first row.
+    first = rows[0]
+    versioned = first.expected_version is not None
+    for row in rows[1:]:
+        if (row.expected_version is not None) != versioned:
+            raise ValueError(
+                "Bulk update rows must all carry an expected version or none of them; "
+                f"row {row.row_id!r} differs from row {first.row_id!r}."
+            )
+        if row.values.keys() != first.values.keys() or row.match.keys() != first.match.keys():
+            raise ValueError(
+                "Bulk update rows must all write the same values and match columns; "
+                f"row {row.row_id!r} differs from row {first.row_id!r}."
+            )
+
+
+def _expire_loaded_rows(session: Session, mapper, chunk: Sequence[BulkRowUpdate]) -> None:
+    # The table-level UPDATE does not synchronise the identity map the way
+    # ``update(OrmType)`` does, so already-loaded instances are expired and
+    # reload on next access instead of reporting pre-update values.
+    for item in chunk:
+        loaded = session.identity_map.get(mapper.identity_key_from_primary_key((item.row_id,)))
+        if loaded is not None:
+            session.expire(loaded)
+
+
+def _precheck_rows(
+    session: Session,
+    mapper,
+    chunk: Sequence[BulkRowUpdate],
+    *,
+    filter_clauses: list[Any],
+    match_keys: tuple[str, ...],
+    versioned: bool,
+    not_found_message: str,
+    stale_message: str,
+) -> None:
+    id_column = mapper.column_attrs["id"].columns[0]
+    columns = [id_column, *(mapper.column_attrs[key].columns[0] for key in match_keys)]
+    if versioned:
+        columns.append(mapper.column_attrs["version"].columns[0])
+    stored = {
+        row[0]: row
+        for row in session.execute(
+            select(*columns).where(
+                id_column.in_({item.row_id for item in chunk}),
+                *filter_clauses,
+            )
+        ).all()
+    }
+    for item in chunk:
+        current = stored.get(item.row_id)
+        if current is None:
+            raise NotFoundError(not_found_message)
+        for index, key in enumerate(match_keys, start=1):
+            if current[index] != item.match[key]:
+                raise NotFoundError(not_found_message)
+        if versioned and current[-1] != item.expected_version:
+            raise ConcurrencyError(stale_message, code="STALE_WRITE")
+
+
+__all__ = [
+    "BULK_WRITE_CHUNK_SIZE",
+    "BulkRowUpdate",
+    "bulk_insert",
+    "bulk_update",
+    "chunked",
+]
@@ -9,6 +9,7 @@ from urllib.parse import urlparse
 
 from sqlalchemy import create_engine, event
 
+from src.infra.persistence.db.sqlite_profile import install_sqlite_profile, resolve_sqlite_profile
 from src.infra.platform.env_loader import load_env_file
 from src.infra.platform.path import default_db_path
 
@@ -53,6 +54,7 @@ engine = create_engine(
     echo=False,
     future=True,
 )
+install_sqlite_profile(engine, resolve_sqlite_profile())
 
 
 @event.listens_for(engine, "before_cursor_execute")
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, replace
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORES = {"DEFAULT", "FILE", "MEMORY"}
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+_FALSE_VALUES = {"0", "false", "no", "off"}
+
+
+@dataclass(frozen=True)
+class SqliteProfile:
+    """PRAGMAs applied to every new SQLite connection.
+
+    ``None`` leaves the SQLite default in place. ``cache_size_kib`` is
+    written as a negative ``cache_size`` so it is a memory budget rather
+    than a page count."""
+
+    name: str
+    journal_mode: str | None = None
+    synchronous: str | None = None
+    cache_size_kib: int | None = None
+    mmap_size_bytes: int | None = None
+    temp_store: str | None = None
+    busy_timeout_ms: int | None = None
+    foreign_keys: bool | None = None
+
+    def pragmas(self) -> list[tuple[str, object]]:
+        # journal_mode goes first: switching to WAL needs no open
+        # transaction and determines what ``synchronous=NORMAL`` means.
+        values: list[tuple[str, object]] = []
+        if self.journal_mode is not None:
+            values.append(("journal_mode", self.journal_mode))
+        if self.synchronous is not None:
+            values.append(("synchronous", self.synchronous))
+        if self.cache_size_kib is not None:
+            values.append(("cache_size", -abs(self.cache_size_kib)))
+        if self.mmap_size_bytes is not None:
+            values.append(("mmap_size", self.mmap_size_bytes))
+        if self.temp_store is not None:
+            values.append(("temp_store", self.temp_store))
+        if self.busy_timeout_ms is not None:
+            values.append(("busy_timeout", self.busy_timeout_ms))
+        if self.foreign_keys is not None:
+            values.append(("foreign_keys", "ON" if self.foreign_keys else "OFF"))
+        return values
+
+
+SQLITE_PROFILES: dict[str, SqliteProfile] = {
+    # WAL lets readers keep working while a long recalculation writes;
+    # NORMAL is durable across application crashes in WAL mode and only
+    # risks the last commits on power loss.
+    "performance": SqliteProfile(
+        name="performance",
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size_kib=64 * 1024,
+        mmap_size_bytes=256 * 1024 * 1024,
+        temp_store="MEMORY",
+        busy_timeout_ms=5000,
+        foreign_keys=True,
+    ),
+    "safe": SqliteProfile(
+        name="safe",
+        journal_mode="WAL",
+        synchronous="FULL",
+        temp_store="DEFAULT",
+        busy_timeout_ms=5000,
+        foreign_keys=True,
+    ),
+    # Pre-profile behaviour: rollback journal and SQLite defaults.
+    "legacy": SqliteProfile(name="legacy"),
+}
+DEFAULT_SQLITE_PROFILE = "performance"
+
+_applied_lock = threading.Lock()
+_applied_profile: SqliteProfile | None = None
+_effective_pragmas: dict[str, object] | None = None
+
+
+def resolve_sqlite_profile(name: str | None = None) -> SqliteProfile:
+    """Resolve the named profile (default ``PM_SQLITE_PROFILE``) and apply
+    the per-PRAGMA ``PM_SQLITE_*`` environment overrides on top."""
+    profile_name = (name or os.getenv("PM_SQLITE_PROFILE") or DEFAULT_SQLITE_PROFILE).strip().lower()
+    profile = SQLITE_PROFILES.get(profile_name)
+    if profile is None:
+        raise ValueError(
+            f"Unsupported SQLite profile: {profile_name} "
+            f"(expected one of {', '.join(sorted(SQLITE_PROFILES))})"
+        )
+    overrides: dict[str, object] = {}
+    journal_mode = _env_choice("PM_SQLITE_JOURNAL_MODE", _JOURNAL_MODES)
+    if journal_mode is not None:
+        overrides["journal_mode"] = journal_mode
+    synchronous = _env_choice("PM_SQLITE_SYNCHRONOUS", _SYNCHRONOUS_MODES)
+    if synchronous is not None:
+        overrides["synchronous"] = synchronous
+    temp_store = _env_choice("PM_SQLITE_TEMP_STORE", _TEMP_STORES)
+    if temp_store is not None:
+        overrides["temp_store"] = temp_store
+    cache_size_kib = _env_int("PM_SQLITE_CACHE_SIZE_KIB")
+    if cache_size_kib is not None:
+        overrides["cache_size_kib"] = cache_size_kib
+    mmap_size_mb = _env_int("PM_SQLITE_MMAP_SIZE_MB")
+    if mmap_size_mb is not None:
+        overrides["mmap_size_bytes"] = mmap_size_mb * 1024 * 1024
+    busy_timeout_ms = _env_int("PM_SQLITE_BUSY_TIMEOUT_MS")
+    if busy_timeout_ms is not None:
+        overrides["busy_timeout_ms"] = busy_timeout_ms
+    foreign_keys = _env_bool("PM_SQLITE_FOREIGN_KEYS")
+    if foreign_keys is not None:
+        overrides["foreign_keys"] = foreign_keys
+    return replace(profile, **overrides) if overrides else profile
+
+
+def install_sqlite_profile(engine: Engine, profile: SqliteProfile) -> bool:
+    """Register a connect hook that applies ``profile`` to every new DBAPI
+    connection of ``engine``. Non-SQLite engines are left untouched."""
+    if engine.dialect.name != "sqlite":
+        return False
+    pragmas = profile.pragmas()
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_profile(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in pragmas:
+                cursor.execute(f"PRAGMA {pragma}={value}")
+            _record_effective_pragmas(profile, cursor)
+        finally:
+            cursor.close()
+
+    global _applied_profile, _effective_pragmas
+    with _applied_lock:
+        _applied_profile = profile
+        _effective_pragmas = None
+    logger.info("SQLite profile installed profile=%s pragmas=%s", profile.name, dict(pragmas))
+    return True
+
+
+def read_sqlite_pragmas(cursor) -> dict[str, object]:
+    values: dict[str, object] = {}
+    for pragma in (
+        "journal_mode",
+        "synchronous",
+        "cache_size",
+        "mmap_size",
+        "temp_store",
+        "busy_timeout",
+        "foreign_keys",
+    ):
+        row = cursor.execute(f"PRAGMA {pragma}").fetchone()
+        values[pragma] = row[0] if row else None
+    return values
+
+
+def sqlite_profile_report() -> dict[str, object]:
+    """Diagnostics view of the installed profile and the PRAGMA values the
+    first connection actually reported (``None`` before any connect)."""
+    with _applied_lock:
+        profile = _applied_profile
+        effective = dict(_effective_pragmas) if _effective_pragmas is not None else None
+    return {
+        "profile": asdict(profile) if profile is not None else None,
+        "effective_pragmas": effective,
+    }
+
+
+def _record_effective_pragmas(profile: SqliteProfile, cursor) -> None:
+    global _effective_pragmas
+    with _applied_lock:
+        if _applied_profile is not profile or _effective_pragmas is not None:
+            return
+    effective = read_sqlite_pragmas(cursor)
+    with _applied_lock:
+        if _applied_profile is profile:
+            _effective_pragmas = effective
+
+
+def _env_choice(name: str, choices: set[str]) -> str | None:
+    raw = (os.getenv(name) or "").strip().upper()
+    if not raw:
+        return None
+    if raw not in choices:
+        raise ValueError(f"Unsupported {name} value: {raw}")
+    return raw
+
+
+def _env_int(name: str) -> int | None:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return None
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be an integer, got {raw!r}") from exc
+
+
+def _env_bool(name: str) -> bool | None:
+    raw = (os.getenv(name) or "").strip().lower()
+    if not raw:
+        return None
+    if raw in _TRUE_VALUES:
+        return True
+    if raw in _FALSE_VALUES:
+        return False
+    raise ValueError(f"{name} must be a boolean flag, got {raw!r}")
+
+
+__all__ = [
+    "DEFAULT_SQLITE_PROFILE",
+    "SQLITE_PROFILES",
+    "SqliteProfile",
+    "install_sqlite_profile",
+    "read_sqlite_pragmas",
+    "resolve_sqlite_profile",
+    "sqlite_profile_report",
+]
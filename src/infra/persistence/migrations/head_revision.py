@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import ast
+import re
+import sys
+from pathlib import Path
+
+HEAD_REVISIONS_FILE = "alembic_head.txt"
+
+_ASSIGNMENT = re.compile(
+    r"^(?P<name>revision|down_revision)\s*(?::[^=\n]*)?=\s*(?P<value>.+?)\s*$",
+    re.MULTILINE,
+)
+
+
+def scan_head_revisions(script_location: Path) -> tuple[str, ...]:
+    """Head revisions of the migration graph, read from the ``revision`` /
+    ``down_revision`` assignments of the version scripts without importing
+    them (and without importing Alembic)."""
+    revisions: set[str] = set()
+    parents: set[str] = set()
+    for path in sorted((script_location / "versions").glob("*.py")):
+        values: dict[str, object] = {}
+        for match in _ASSIGNMENT.finditer(path.read_text(encoding="utf-8")):
+            values.setdefault(match.group("name"), _literal(match.group("value")))
+        revision = values.get("revision")
+        if not isinstance(revision, str):
+            continue
+        revisions.add(revision)
+        down_revision = values.get("down_revision")
+        if isinstance(down_revision, str):
+            parents.add(down_revision)
+        elif isinstance(down_revision, (tuple, list)):
+            parents.update(str(item) for item in down_revision)
+    return tuple(sorted(revisions - parents))
+
+
+def write_head_revisions_file(script_location: Path) -> tuple[str, ...]:
+    """Build step: record the current heads next to the migration scripts so
+    packaged builds do not rescan them on every launch."""
+    heads = scan_head_revisions(script_location)
+    (script_location / HEAD_REVISIONS_FILE).write_text("\n".join(heads) + "\n", encoding="utf-8")
+    return heads
+
+
+def resolve_head_revisions(script_location: Path) -> tuple[str, ...]:
+    # Packaged builds trust the file written at build time; a source
+    # checkout always rescans so a freshly added migration is never missed.
+    head_file = script_location / HEAD_REVISIONS_FILE
+    if getattr(sys, "frozen", False) and head_file.is_file():
+        heads = tuple(
+            sorted(line.strip() for line in head_file.read_text(encoding="utf-8").splitlines() if line.strip())
+        )
+        if heads:
+            return heads
+    return scan_head_revisions(script_location)
+
+
+def _literal(raw: str) -> object:
+    try:
+        return ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        return None
+
+
+__all__ = [
+    "HEAD_REVISIONS_FILE",
+    "resolve_head_revisions",
+    "scan_head_revisions",
+    "write_head_revisions_file",
+]
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import json
 import logging
 from pathlib import Path
 import sys
 from threading import Timer
 from time import perf_counter
 
+from src.infra.persistence.migrations.head_revision import resolve_head_revisions
+from src.infra.platform.path import user_data_dir
+
 
 logger = logging.getLogger(__name__)
 
+_UPGRADE_TIMING_FILE = "migration_timing.json"
+
 
 def _app_dir() -> Path:
     """
@@ -44,11 +50,52 @@ def _migration_candidates(app_dir: Path) -> list[Path]:
     return unique_candidates
 
 
-def run_migrations(db_url: str) -> None:
-    from alembic import command
-    from alembic.config import Config
-    from alembic.script import ScriptDirectory
+def _stored_revisions(db_url: str) -> set[str] | None:
+    from sqlalchemy import create_engine, pool, text
+    from sqlalchemy.exc import DBAPIError
+
+    precheck_engine = create_engine(db_url, future=True, poolclass=pool.NullPool)
+    try:
+        with precheck_engine.connect() as connection:
+            rows = connection.execute(text("SELECT version_num FROM alembic_version")).all()
+    except DBAPIError:
+        # Fresh database (no alembic_version yet) or unreadable: let Alembic decide.
+        return None
+    finally:
+        precheck_engine.dispose()
+    return {str(row[0]) for row in rows}
+
+
+def _upgrade_timing_path() -> Path:
+    return user_data_dir() / _UPGRADE_TIMING_FILE
+
+
+def _last_upgrade_ms() -> float | None:
+    try:
+        payload = json.loads(_upgrade_timing_path().read_text(encoding="utf-8"))
+        return float(payload["last_upgrade_ms"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
 
+def _record_upgrade_ms(duration_ms: float) -> None:
+    try:
+        _upgrade_timing_path().write_text(
+            json.dumps({"last_upgrade_ms": round(duration_ms, 1)}),
+            encoding="utf-8",
+        )
+    except OSError:
+        logger.debug("Alembic upgrade timing could not be recorded", exc_info=True)
+
+
+def database_at_head(db_url: str, script_location: Path) -> bool:
+    """True when ``alembic_version`` already holds exactly the head
+    revision(s) of ``script_location``; never imports Alembic."""
+    heads = set(resolve_head_revisions(script_location))
+    return bool(heads) and _stored_revisions(db_url) == heads
+
+
+def run_migrations(db_url: str) -> None:
     started = perf_counter()
     app_dir = _app_dir()
     candidates = _migration_candidates(app_dir)
@@ -81,6 +128,20 @@ def run_migrations(db_url: str) -> None:
         logger.critical("Alembic config missing path=%s", alembic_ini)
         raise RuntimeError(f"Alembic config missing: {alembic_ini}")
 
+    if database_at_head(db_url, script_location):
+        precheck_ms = (perf_counter() - started) * 1000
+        last_upgrade_ms = _last_upgrade_ms()
+        logger.info(
+            "Alembic upgrade skipped; database already at head precheck_ms=%.1f saved_ms=%s",
+            precheck_ms,
+            f"{max(last_upgrade_ms - precheck_ms, 0.0):.1f}" if last_upgrade_ms is not None else "unknown",
+        )
+        return
+
+    from alembic import command
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
     cfg = Config(str(alembic_ini))
     cfg.set_main_option("script_location", str(script_location))
     cfg.set_main_option("sqlalchemy.url", db_url)
@@ -114,7 +175,6 @@ def run_migrations(db_url: str) -> None:
         raise
     finally:
         slow_watchdog.cancel()
-    logger.debug(
-        "Alembic migration upgrade complete duration_ms=%.1f",
-        (perf_counter() - started) * 1000,
-    )
+    duration_ms = (perf_counter() - started) * 1000
+    _record_upgrade_ms(duration_ms)
+    logger.debug("Alembic migration upgrade complete duration_ms=%.1f", duration_ms)
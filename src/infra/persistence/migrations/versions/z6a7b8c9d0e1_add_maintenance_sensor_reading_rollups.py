@@ -0,0 +1,151 @@
+"""add maintenance sensor reading rollups
+
+Creates the per-sensor minute/hour/day rollup table that trend queries
+read instead of raw readings, and backfills it from the readings already
+stored so that pruning raw readings afterwards loses no trend history.
+Only VALID and ESTIMATED readings are rolled up, as on ingest.
+
+Revision ID: z6a7b8c9d0e1
+Revises: y5z6a7b8c9d0
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "z6a7b8c9d0e1"
+down_revision = "y5z6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+_TABLE = "maintenance_sensor_reading_rollups"
+_ROLLUP_QUALITY_STATES = ("VALID", "ESTIMATED")
+
+
+def _has_table(table_name: str) -> bool:
+    return table_name in sa.inspect(op.get_bind()).get_table_names()
+
+
+def _bucket_starts(timestamp):
+    minute = timestamp.replace(second=0, microsecond=0)
+    return (
+        ("MINUTE", minute),
+        ("HOUR", minute.replace(minute=0)),
+        ("DAY", minute.replace(hour=0, minute=0)),
+    )
+
+
+def _backfill() -> None:
+    bind = op.get_bind()
+    readings = sa.table(
+        "maintenance_sensor_readings",
+        sa.column("organization_id", sa.String()),
+        sa.column("sensor_id", sa.String()),
+        sa.column("reading_value", sa.Numeric(18, 6)),
+        sa.column("reading_timestamp", sa.DateTime()),
+        sa.column("quality_state", sa.String()),
+    )
+    rollups = sa.table(
+        _TABLE,
+        sa.column("sensor_id", sa.String()),
+        sa.column("grain", sa.String()),
+        sa.column("bucket_start", sa.DateTime()),
+        sa.column("organization_id", sa.String()),
+        sa.column("reading_count", sa.Integer()),
+        sa.column("min_value", sa.Numeric(18, 6)),
+        sa.column("max_value", sa.Numeric(18, 6)),
+        sa.column("sum_value", sa.Numeric(24, 6)),
+        sa.column("last_value", sa.Numeric(18, 6)),
+        sa.column("last_reading_at", sa.DateTime()),
+    )
+    rows = bind.execution_options(stream_results=True).execute(
+        sa.select(
+            readings.c.organization_id,
+            readings.c.sensor_id,
+            readings.c.reading_value,
+            readings.c.reading_timestamp,
+        )
+        .where(readings.c.quality_state.in_(_ROLLUP_QUALITY_STATES))
+        .order_by(readings.c.sensor_id, readings.c.reading_timestamp)
+    )
+
+    # Rows arrive grouped by sensor, so only one sensor's buckets are held
+    # in memory at a time.
+    current_sensor_id = None
+    buckets: dict[tuple[str, object], dict[str, object]] = {}
+
+    def flush() -> None:
+        if buckets:
+            bind.execute(sa.insert(rollups), list(buckets.values()))
+            buckets.clear()
+
+    for organization_id, sensor_id, value, timestamp in rows:
+        if sensor_id != current_sensor_id:
+            flush()
+            current_sensor_id = sensor_id
+        for grain, bucket_start in _bucket_starts(timestamp):
+            bucket = buckets.get((grain, bucket_start))
+            if bucket is None:
+                buckets[(grain, bucket_start)] = {
+                    "sensor_id": sensor_id,
+                    "grain": grain,
+                    "bucket_start": bucket_start,
+                    "organization_id": organization_id,
+                    "reading_count": 1,
+                    "min_value": value,
+                    "max_value": value,
+                    "sum_value": value,
+                    "last_value": value,
+                    "last_reading_at": timestamp,
+                }
+                continue
+            bucket["reading_count"] += 1
+            bucket["min_value"] = min(bucket["min_value"], value)
+            bucket["max_value"] = max(bucket["max_value"], value)
+            bucket["sum_value"] += value
+            bucket["last_value"] = value
+            bucket["last_reading_at"] = timestamp
+    flush()
+
+
+def upgrade() -> None:
+    if _has_table(_TABLE):
+        return
+    op.create_table(
+        _TABLE,
+        sa.Column("sensor_id", sa.String(), nullable=False),
+        sa.Column("grain", sa.String(length=16), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(), nullable=False),
+        sa.Column("organization_id", sa.String(), nullable=False),
+        sa.Column("reading_count", sa.Integer(), nullable=False),
+        sa.Column("min_value", sa.Numeric(18, 6), nullable=False),
+        sa.Column("max_value", sa.Numeric(18, 6), nullable=False),
+        sa.Column("sum_value", sa.Numeric(24, 6), nullable=False),
+        sa.Column("last_value", sa.Numeric(18, 6), nullable=False),
+        sa.Column("last_reading_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("sensor_id", "grain", "bucket_start"),
+        sa.ForeignKeyConstraint(
+            ["sensor_id"],
+            ["maintenance_sensors.id"],
+            name="fk_maintenance_sensor_reading_rollups_sensor_id",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["organization_id"],
+            ["organizations.id"],
+            name="fk_maintenance_sensor_reading_rollups_organization_id",
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index("ix_maintenance_sensor_reading_rollups_org", _TABLE, ["organization_id"], unique=False)
+    _backfill()
+
+
+def downgrade() -> None:
+    if not _has_table(_TABLE):
+        return
+    op.drop_index("ix_maintenance_sensor_reading_rollups_org", table_name=_TABLE)
+    op.drop_table(_TABLE)
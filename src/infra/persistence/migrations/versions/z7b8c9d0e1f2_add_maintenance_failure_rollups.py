@@ -0,0 +1,170 @@
+"""add maintenance failure rollups
+
+Creates the per-asset, per-failure-code MTBF/MTTR rollup table that the
+work-order service keeps current on completion and reopen, and backfills
+it from the completed corrective and emergency work orders already stored.
+
+Revision ID: z7b8c9d0e1f2
+Revises: z6a7b8c9d0e1
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "z7b8c9d0e1f2"
+down_revision = "z6a7b8c9d0e1"
+branch_labels = None
+depends_on = None
+
+_TABLE = "maintenance_failure_rollups"
+_FAILURE_WORK_ORDER_TYPES = ("CORRECTIVE", "EMERGENCY")
+_FAILURE_COMPLETED_STATUSES = ("COMPLETED", "VERIFIED", "CLOSED")
+
+
+def _has_table(table_name: str) -> bool:
+    return table_name in sa.inspect(op.get_bind()).get_table_names()
+
+
+def _repair_seconds(actual_start, actual_end, downtime_minutes):
+    if actual_start is not None and actual_end is not None and actual_end >= actual_start:
+        return int((actual_end - actual_start).total_seconds())
+    if downtime_minutes:
+        return downtime_minutes * 60
+    return None
+
+
+def _backfill() -> None:
+    bind = op.get_bind()
+    work_orders = sa.table(
+        "maintenance_work_orders",
+        sa.column("organization_id", sa.String()),
+        sa.column("asset_id", sa.String()),
+        sa.column("failure_code", sa.String()),
+        sa.column("work_order_type", sa.String()),
+        sa.column("status", sa.String()),
+        sa.column("actual_start", sa.DateTime()),
+        sa.column("actual_end", sa.DateTime()),
+        sa.column("created_at", sa.DateTime()),
+        sa.column("downtime_minutes", sa.Integer()),
+    )
+    rollups = sa.table(
+        _TABLE,
+        sa.column("asset_id", sa.String()),
+        sa.column("failure_code", sa.String()),
+        sa.column("organization_id", sa.String()),
+        sa.column("failure_count", sa.Integer()),
+        sa.column("repair_count", sa.Integer()),
+        sa.column("repair_seconds", sa.Integer()),
+        sa.column("uptime_seconds", sa.Integer()),
+        sa.column("last_repair_seconds", sa.Integer()),
+        sa.column("first_failure_at", sa.DateTime()),
+        sa.column("last_failure_at", sa.DateTime()),
+    )
+    rows = bind.execution_options(stream_results=True).execute(
+        sa.select(
+            work_orders.c.organization_id,
+            work_orders.c.asset_id,
+            work_orders.c.failure_code,
+            work_orders.c.actual_start,
+            work_orders.c.actual_end,
+            work_orders.c.created_at,
+            work_orders.c.downtime_minutes,
+        )
+        .where(
+            work_orders.c.work_order_type.in_(_FAILURE_WORK_ORDER_TYPES),
+            work_orders.c.status.in_(_FAILURE_COMPLETED_STATUSES),
+            work_orders.c.asset_id.is_not(None),
+            work_orders.c.failure_code != "",
+        )
+        .order_by(work_orders.c.asset_id, work_orders.c.failure_code)
+    )
+
+    # Rows arrive grouped by asset and failure code. Uptime is the span from
+    # the first to the last failure less the repairs of every failure but
+    # the last; ties put the longer repair last, as on ingest.
+    batch: list[dict[str, object]] = []
+    group_key = None
+    group: list[tuple] = []
+
+    def fold() -> None:
+        if not group:
+            return
+        organization_id = group[0][0]
+        first_at = min(event[1] for event in group)
+        _, last_at, last_repair = max(group, key=lambda event: (event[1], event[2] or 0))
+        repair_seconds = sum(event[2] or 0 for event in group)
+        rollup = {
+            "asset_id": group_key[0],
+            "failure_code": group_key[1],
+            "organization_id": organization_id,
+            "failure_count": len(group),
+            "repair_count": sum(1 for event in group if event[2] is not None),
+            "repair_seconds": repair_seconds,
+            "uptime_seconds": int((last_at - first_at).total_seconds()) - (repair_seconds - (last_repair or 0)),
+            "last_repair_seconds": last_repair or 0,
+            "first_failure_at": first_at,
+            "last_failure_at": last_at,
+        }
+        batch.append(rollup)
+        group.clear()
+        if len(batch) >= 1000:
+            bind.execute(sa.insert(rollups), batch)
+            batch.clear()
+
+    for organization_id, asset_id, failure_code, actual_start, actual_end, created_at, downtime_minutes in rows:
+        failed_at = actual_start or created_at or actual_end
+        if failed_at is None:
+            continue
+        if (asset_id, failure_code) != group_key:
+            fold()
+            group_key = (asset_id, failure_code)
+        group.append(
+            (organization_id, failed_at, _repair_seconds(actual_start, actual_end, downtime_minutes))
+        )
+    fold()
+    if batch:
+        bind.execute(sa.insert(rollups), batch)
+
+
+def upgrade() -> None:
+    if _has_table(_TABLE):
+        return
+    op.create_table(
+        _TABLE,
+        sa.Column("asset_id", sa.String(), nullable=False),
+        sa.Column("failure_code", sa.String(length=64), nullable=False),
+        sa.Column("organization_id", sa.String(), nullable=False),
+        sa.Column("failure_count", sa.Integer(), nullable=False),
+        sa.Column("repair_count", sa.Integer(), nullable=False),
+        sa.Column("repair_seconds", sa.Integer(), nullable=False),
+        sa.Column("uptime_seconds", sa.Integer(), nullable=False),
+        sa.Column("last_repair_seconds", sa.Integer(), nullable=False),
+        sa.Column("first_failure_at", sa.DateTime(), nullable=False),
+        sa.Column("last_failure_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("asset_id", "failure_code"),
+        sa.ForeignKeyConstraint(
+            ["asset_id"],
+            ["maintenance_assets.id"],
+            name="fk_maintenance_failure_rollups_asset_id",
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["organization_id"],
+            ["organizations.id"],
+            name="fk_maintenance_failure_rollups_organization_id",
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index("ix_maintenance_failure_rollups_org", _TABLE, ["organization_id"], unique=False)
+    _backfill()
+
+
+def downgrade() -> None:
+    if not _has_table(_TABLE):
+        return
+    op.drop_index("ix_maintenance_failure_rollups_org", table_name=_TABLE)
+    op.drop_table(_TABLE)
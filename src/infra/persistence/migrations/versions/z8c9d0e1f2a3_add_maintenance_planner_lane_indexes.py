@@ -0,0 +1,58 @@
+"""add maintenance planner lane indexes
+
+The planner lists work requests and work orders newest first, a page at a
+time, keyed on ``(created_at, id)`` within an organization; these indexes
+let each page seek instead of sorting the whole organization.
+
+Revision ID: z8c9d0e1f2a3
+Revises: z7b8c9d0e1f2
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "z8c9d0e1f2a3"
+down_revision = "z7b8c9d0e1f2"
+branch_labels = None
+depends_on = None
+
+_INDEXES = (
+    (
+        "maintenance_work_requests",
+        "idx_maintenance_work_requests_org_created",
+        ["organization_id", "created_at", "id"],
+    ),
+    (
+        "maintenance_work_orders",
+        "idx_maintenance_work_orders_org_created",
+        ["organization_id", "created_at", "id"],
+    ),
+)
+
+
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def _has_table(table_name: str) -> bool:
+    return table_name in _inspector().get_table_names()
+
+
+def _has_index(table_name: str, index_name: str) -> bool:
+    if not _has_table(table_name):
+        return False
+    return any(index["name"] == index_name for index in _inspector().get_indexes(table_name))
+
+
+def upgrade() -> None:
+    for table_name, index_name, columns in _INDEXES:
+        if _has_table(table_name) and not _has_index(table_name, index_name):
+            op.create_index(index_name, table_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    for table_name, index_name, _ in reversed(_INDEXES):
+        if _has_index(table_name, index_name):
+            op.drop_index(index_name, table_name=table_name)
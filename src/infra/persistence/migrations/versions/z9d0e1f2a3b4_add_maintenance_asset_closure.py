@@ -0,0 +1,127 @@
+"""add maintenance asset closure
+
+Creates the asset hierarchy closure table, one row per ancestor and
+descendant pair with the depth between them, and backfills it from the
+assets' ``parent_asset_id`` links.
+
+Revision ID: z9d0e1f2a3b4
+Revises: z8c9d0e1f2a3
+Create Date: 2026-10-19
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "z9d0e1f2a3b4"
+down_revision = "z8c9d0e1f2a3"
+branch_labels = None
+depends_on = None
+
+_TABLE = "maintenance_asset_closure"
+_BATCH_SIZE = 1000
+
+
+def _has_table(table_name: str) -> bool:
+    return table_name in sa.inspect(op.get_bind()).get_table_names()
+
+
+def _closure_rows(parents: dict[str, tuple[str, str | None]]):
+    children: dict[str, list[str]] = defaultdict(list)
+    roots: list[str] = []
+    for asset_id, (_organization_id, parent_id) in parents.items():
+        if parent_id and parent_id != asset_id and parent_id in parents:
+            children[parent_id].append(asset_id)
+        else:
+            roots.append(asset_id)
+    reached: set[str] = set()
+    for root_id in roots:
+        stack = [(root_id, ())]
+        while stack:
+            asset_id, ancestors = stack.pop()
+            reached.add(asset_id)
+            chain = ancestors + (asset_id,)
+            for depth, ancestor_id in enumerate(reversed(chain)):
+                yield {
+                    "ancestor_id": ancestor_id,
+                    "descendant_id": asset_id,
+                    "organization_id": parents[asset_id][0],
+                    "depth": depth,
+                }
+            stack.extend((child_id, chain) for child_id in children.get(asset_id, ()))
+    # Assets caught in a parent cycle only get their own row.
+    for asset_id, (organization_id, _parent_id) in parents.items():
+        if asset_id not in reached:
+            yield {
+                "ancestor_id": asset_id,
+                "descendant_id": asset_id,
+                "organization_id": organization_id,
+                "depth": 0,
+            }
+
+
+def _backfill() -> None:
+    bind = op.get_bind()
+    assets = sa.table(
+        "maintenance_assets",
+        sa.column("id", sa.String()),
+        sa.column("organization_id", sa.String()),
+        sa.column("parent_asset_id", sa.String()),
+    )
+    closure = sa.table(
+        _TABLE,
+        sa.column("ancestor_id", sa.String()),
+        sa.column("descendant_id", sa.String()),
+        sa.column("organization_id", sa.String()),
+        sa.column("depth", sa.Integer()),
+    )
+    parents = {
+        asset_id: (organization_id, parent_id)
+        for asset_id, organization_id, parent_id in bind.execute(
+            sa.select(assets.c.id, assets.c.organization_id, assets.c.parent_asset_id)
+        )
+    }
+    batch: list[dict] = []
+    for row in _closure_rows(parents):
+        batch.append(row)
+        if len(batch) >= _BATCH_SIZE:
+            bind.execute(sa.insert(closure), batch)
+            batch = []
+    if batch:
+        bind.execute(sa.insert(closure), batch)
+
+
+def upgrade() -> None:
+    if _has_table(_TABLE) or not _has_table("maintenance_assets"):
+        return
+    op.create_table(
+        _TABLE,
+        sa.Column("ancestor_id", sa.String(), nullable=False),
+        sa.Column("descendant_id", sa.String(), nullable=False),
+        sa.Column("organization_id", sa.String(), nullable=False),
+        sa.Column("depth", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["ancestor_id"], ["maintenance_assets.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["descendant_id"], ["maintenance_assets.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ancestor_id", "descendant_id"),
+    )
+    op.create_index(
+        "ix_maintenance_asset_closure_descendant",
+        _TABLE,
+        ["descendant_id", "depth"],
+        unique=False,
+    )
+    op.create_index("ix_maintenance_asset_closure_org", _TABLE, ["organization_id"], unique=False)
+    _backfill()
+
+
+def downgrade() -> None:
+    if not _has_table(_TABLE):
+        return
+    op.drop_index("ix_maintenance_asset_closure_org", table_name=_TABLE)
+    op.drop_index("ix_maintenance_asset_closure_descendant", table_name=_TABLE)
+    op.drop_table(_TABLE)
@@ -10,8 +10,10 @@ from pathlib import Path
 from uuid import uuid4
 from zipfile import ZIP_DEFLATED, ZipFile
 
+from src.infra.persistence.db.sqlite_profile import sqlite_profile_report
 from src.infra.platform.operational_support import redact_value
 from src.infra.platform.path import default_db_path, user_data_dir
+from src.infra.platform.startup_profiler import recent_trace_files
 from src.infra.platform.version import get_app_version
 
 
@@ -28,6 +30,7 @@ def build_diagnostics_bundle(
     settings_snapshot: dict[str, object] | None = None,
     include_db_copy: bool = True,
     incident_id: str | None = None,
+    include_traces: int = 5,
 ) -> DiagnosticsBundleResult:
     out_path = Path(output_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -68,6 +71,10 @@ def build_diagnostics_bundle(
             json.dumps(metadata, indent=2, sort_keys=True),
             encoding="utf-8",
         )
+        (temp_dir / "database_profile.json").write_text(
+            json.dumps(sqlite_profile_report(), indent=2, sort_keys=True, default=str),
+            encoding="utf-8",
+        )
 
         copied_any_log = False
         support_events_path: Path | None = None
@@ -101,6 +108,10 @@ def build_diagnostics_bundle(
                     f"No structured support events were found for incident '{normalized_incident}'."
                 )
 
+        if include_traces > 0:
+            for trace_file in recent_trace_files(include_traces):
+                shutil.copy2(trace_file, temp_dir / f"startup_trace_{trace_file.name}")
+
         if include_db_copy:
             if db_path.exists() and db_path.is_file():
                 # SECURITY: Database contains sensitive data (passwords, session tokens, etc.)
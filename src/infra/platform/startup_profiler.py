@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+
+from src.infra.platform.path import user_data_dir
+
+logger = logging.getLogger(__name__)
+
+TRACE_DIR_NAME = "traces"
+_TRUTHY = {"1", "true", "yes", "on"}
+_DEFAULT_TRACE_KEEP = 10
+_MODULE_LOADED = perf_counter()
+
+
+def profiling_enabled() -> bool:
+    return (os.getenv("PM_PROFILE_STARTUP") or "").strip().lower() in _TRUTHY
+
+
+def trace_keep_count() -> int:
+    raw = (os.getenv("PM_PROFILE_TRACE_KEEP") or "").strip()
+    if not raw:
+        return _DEFAULT_TRACE_KEEP
+    try:
+        return max(1, int(raw))
+    except ValueError:
+        return _DEFAULT_TRACE_KEEP
+
+
+def trace_dir() -> Path:
+    return user_data_dir() / TRACE_DIR_NAME
+
+
+class StartupProfiler:
+    """Collects named spans as Chrome trace events (``chrome://tracing`` /
+    Perfetto "JSON trace" format).
+
+    Synchronous work is wrapped in ``span()``; work that starts in one
+    callback and finishes in another (a QML ``Loader`` compiling
+    asynchronously, a controller's first load) uses ``begin()``/``end()``
+    with a key. Timestamps are microseconds since the profiler was
+    created. When disabled every call is a cheap no-op."""
+
+    def __init__(self, *, enabled: bool, origin: float | None = None) -> None:
+        self.enabled = enabled
+        self._origin = perf_counter() if origin is None else origin
+        self._lock = threading.Lock()
+        self._events: list[dict[str, object]] = []
+        self._open: dict[str, tuple[str, str, float, dict[str, object]]] = {}
+        self._finished: set[str] = set()
+        self._pid = os.getpid()
+        self.flush_count = 0
+
+    def _now_us(self) -> float:
+        return (perf_counter() - self._origin) * 1_000_000
+
+    def _append(self, event: dict[str, object]) -> None:
+        event.setdefault("pid", self._pid)
+        event.setdefault("tid", threading.get_ident())
+        with self._lock:
+            self._events.append(event)
+
+    @contextmanager
+    def span(self, name: str, *, category: str = "startup", **args: object) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        started = self._now_us()
+        try:
+            yield
+        finally:
+            self._append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": round(started, 1),
+                    "dur": round(self._now_us() - started, 1),
+                    "args": dict(args),
+                }
+            )
+
+    def record(self, name: str, *, started: float, finished: float, category: str = "startup") -> None:
+        """Record a span measured with ``perf_counter()`` before the
+        profiler existed (e.g. module imports in the entry point)."""
+        if not self.enabled:
+            return
+        self._append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((started - self._origin) * 1_000_000, 1),
+                "dur": round((finished - started) * 1_000_000, 1),
+                "args": {},
+            }
+        )
+
+    def begin(
+        self,
+        key: str,
+        name: str | None = None,
+        *,
+        category: str = "startup",
+        once: bool = False,
+        **args: object,
+    ) -> None:
+        """Open a span closed later by ``end(key)``. With ``once`` a key
+        that has already been ended is not traced again (first loads)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if once and key in self._finished:
+                return
+            self._open[key] = (name or key, category, self._now_us(), dict(args))
+
+    def end(self, key: str, **args: object) -> bool:
+        if not self.enabled:
+            return False
+        with self._lock:
+            opened = self._open.pop(key, None)
+            if opened is not None:
+                self._finished.add(key)
+        if opened is None:
+            return False
+        name, category, started, begin_args = opened
+        self._append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round(started, 1),
+                "dur": round(self._now_us() - started, 1),
+                "args": {**begin_args, **args},
+            }
+        )
+        return True
+
+    def is_open(self, key: str) -> bool:
+        with self._lock:
+            return key in self._open
+
+    def mark(self, name: str, *, category: str = "startup", **args: object) -> None:
+        if not self.enabled:
+            return
+        self._append(
+            {"name": name, "cat": category, "ph": "i", "s": "p", "ts": round(self._now_us(), 1), "args": dict(args)}
+        )
+
+    def trace_events(self) -> list[dict[str, object]]:
+        with self._lock:
+            return list(self._events)
+
+    def flush(self, label: str, *, directory: Path | None = None, keep: int | None = None) -> Path | None:
+        """Write the events recorded since the last flush to
+        ``<timestamp>_<label>.json`` and prune the oldest traces beyond
+        ``keep``. Spans still open stay pending for the next flush."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            events, self._events = self._events, []
+        if not events:
+            return None
+        self.flush_count += 1
+        target_dir = directory or trace_dir()
+        payload = {
+            "traceEvents": [
+                {"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": "ProjectManagerLite"}},
+                *sorted(events, key=lambda event: float(event.get("ts") or 0.0)),
+            ],
+            "displayTimeUnit": "ms",
+            "otherData": {"label": label, "recorded_at": datetime.now().isoformat(timespec="seconds")},
+        }
+        try:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+            path = target_dir / f"{stamp}_{_safe_label(label)}.json"
+            path.write_text(json.dumps(payload), encoding="utf-8")
+            _prune_traces(target_dir, keep=keep or trace_keep_count())
+        except OSError:
+            logger.warning("Startup trace could not be written directory=%s", target_dir, exc_info=True)
+            return None
+        logger.info("Startup trace written path=%s events=%s", path, len(events))
+        return path
+
+
+def recent_trace_files(limit: int | None = None, *, directory: Path | None = None) -> list[Path]:
+    """Trace files, newest first (names start with their timestamp)."""
+    target_dir = directory or trace_dir()
+    if not target_dir.is_dir():
+        return []
+    files = sorted(
+        (path for path in target_dir.glob("*.json") if path.is_file()),
+        key=lambda path: path.name,
+        reverse=True,
+    )
+    return files[:limit] if limit is not None else files
+
+
+def _prune_traces(directory: Path, *, keep: int) -> None:
+    for stale in recent_trace_files(directory=directory)[keep:]:
+        try:
+            stale.unlink()
+        except OSError:
+            continue
+
+
+def _safe_label(label: str) -> str:
+    safe = "".join(ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in label.strip())
+    return safe.strip("_") or "trace"
+
+
+_profiler: StartupProfiler | None = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Process-wide profiler; enabled by ``PM_PROFILE_STARTUP``."""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler(enabled=profiling_enabled(), origin=_MODULE_LOADED)
+    return _profiler
+
+
+def trace_span(name: str, *, category: str = "startup", **args: object):
+    return get_startup_profiler().span(name, category=category, **args)
+
+
+def trace_first_load(owner: object, *, loading: bool) -> None:
+    """Trace a workspace controller's first load: from the first time it
+    reports loading until that load finishes. Later reloads are ignored."""
+    profiler = get_startup_profiler()
+    if not profiler.enabled:
+        return
+    key = f"first_load:{type(owner).__name__}:{id(owner)}"
+    if loading:
+        profiler.begin(key, f"{type(owner).__name__}.first_load", category="workspace", once=True)
+    else:
+        profiler.end(key)
+
+
+__all__ = [
+    "StartupProfiler",
+    "TRACE_DIR_NAME",
+    "get_startup_profiler",
+    "profiling_enabled",
+    "recent_trace_files",
+    "trace_dir",
+    "trace_first_load",
+    "trace_keep_count",
+    "trace_span",
+]
@@ -331,8 +331,18 @@ def test_runtime_composition_and_desktop_proof_remain_present() -> None:
 
 
 def test_evm_series_keeps_bounded_reader_and_policy_ownership() -> None:
-    source = inspect.getsource(EarnedValueSeriesCalculator.build_series)
+    read_source = inspect.getsource(EarnedValueSeriesCalculator.build_series)
+    source = "".join(
+        inspect.getsource(method)
+        for method in (
+            EarnedValueSeriesCalculator.build_series,
+            EarnedValueSeriesCalculator.build_series_from_facts,
+            EarnedValueSeriesCalculator.read_labor_series,
+        )
+    )
 
+    assert read_source.count("self._reader.read_facts(") == 1
+    assert "self.build_series_from_facts(" in read_source
     assert source.count("self._reader.read_facts(") == 1
     assert source.count("calculate_project_labor_series(") == 1
     assert source.count("prepare_working_days(") == 1
@@ -366,6 +376,7 @@ def test_reporting_financial_reads_use_one_facts_policy_composition() -> None:
     sources_source = inspect.getsource(ReportingCostPolicyMixin.get_project_cost_source_breakdown)
     breakdown_source = inspect.getsource(ReportingCostBreakdownMixin.get_cost_breakdown)
     earned_value_source = inspect.getsource(ReportingEvmCoreMixin.get_earned_value)
+    earned_value_policy_source = inspect.getsource(ReportingEvmCoreMixin._earned_value_from_policy)
 
     assert finance_source.count("self._finance_snapshot_reader.read_facts(") == 1
     assert evm_source.count("self._evm_series_reader.read_facts(") == 1
@@ -392,8 +403,9 @@ def test_reporting_financial_reads_use_one_facts_policy_composition() -> None:
     assert "_compose_evm_policy(" in breakdown_source
     assert "build_breakdown_from_snapshot(" in breakdown_source
     assert "_compose_evm_policy(" in earned_value_source
-    assert "prepared_facts=facts" in earned_value_source
-    assert "ACTUAL_COST_INCOMPLETE" in earned_value_source
+    assert "_earned_value_from_policy(" in earned_value_source
+    assert "prepared_facts=facts" in earned_value_policy_source
+    assert "ACTUAL_COST_INCOMPLETE" in earned_value_policy_source
 
 
 def test_reporting_financial_runtime_reader_proof_remains_present() -> None:
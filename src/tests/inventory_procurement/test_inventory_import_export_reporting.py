@@ -223,6 +223,13 @@ def test_inventory_reporting_service_generates_stock_and_procurement_reports(ser
     assert receipt.receipt_number in procurement_text
     assert {"Summary", "Balances"} <= set(stock_workbook.sheetnames)
     assert {"Summary", "Requisitions", "Purchase Orders", "Receipts"} <= set(procurement_workbook.sheetnames)
+    summary = stock_workbook["Summary"]
+    assert summary["A1"].font.sz == 14 and summary.column_dimensions["A"].width == 30
+    balances = stock_workbook["Balances"]
+    assert balances["A1"].value == "Item Code" and balances["A1"].alignment.horizontal == "center"
+    assert balances["A1"].fill.fgColor.rgb == "00DDE7F5"
+    assert balances["A2"].value == item.item_code and balances["A2"].border.left.style == "thin"
+    assert balances.column_dimensions["N"].width == 22
 
 
 def test_inventory_import_and_reporting_services_require_runtime_permissions(services, tmp_path):
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from src.application.runtime import build_desktop_api_registry
 from src.core.platform.domain.master_data.party import PartyType
 from src.ui_qml.modules.inventory_procurement.context import InventoryProcurementWorkspaceCatalog
@@ -149,3 +151,140 @@ def test_inventory_qml_inventory_presenter_exposes_foundation_snapshot(services)
     assert snapshot.foundation.locations[0].title == "BIN-P1 - Presenter Bin"
     module_status = {entry.code: entry.is_enabled for entry in snapshot.foundation.module_links}
     assert module_status["project_management"] is True
+
+
+def test_inventory_movements_table_pages_transactions_from_sql(services) -> None:
+    site = services["site_service"].create_site(
+        site_code="INV-PAGE",
+        name="Paging Site",
+        city="Bremen",
+        currency_code="EUR",
+    )
+    manager = services["party_service"].create_party(
+        party_code="INV-PAGE-MGR",
+        party_name="Paging Manager",
+        party_type=PartyType.CONTRACTOR,
+    )
+    storerooms = [
+        services["inventory_service"].create_storeroom(
+            storeroom_code=f"INV-PAGE-{index}",
+            name=f"Paging Store {index}",
+            site_id=site.id,
+            status="ACTIVE",
+            storeroom_type="MAIN",
+            manager_party_id=manager.id,
+        )
+        for index in range(2)
+    ]
+    items = [
+        services["inventory_item_service"].create_item(
+            item_code=f"INV-PAGE-ITEM-{index}",
+            name=f"Paging Item {index}",
+            status="ACTIVE",
+            stock_uom="EA",
+        )
+        for index in range(3)
+    ]
+    for storeroom in storerooms:
+        for item in items:
+            services["inventory_stock_service"].post_opening_balance(
+                stock_item_id=item.id,
+                storeroom_id=storeroom.id,
+                quantity=5,
+                uom="EA",
+                unit_cost=1.0,
+            )
+    registry = build_desktop_api_registry(services)
+    presenter = InventoryInventoryWorkspacePresenter(
+        desktop_api=registry.inventory_procurement_inventory
+    )
+
+    filters = presenter.build_transaction_page_filters(storeroom_filter=storerooms[1].id)
+    first, has_more = presenter.fetch_transaction_page(offset=0, limit=2, filters=filters)
+    second, has_more_after = presenter.fetch_transaction_page(offset=2, limit=2, filters=filters)
+    assert has_more is True
+    assert len(first) == 2 and len(second) == 1 and has_more_after is False
+    assert all("Paging Store 1" in row.subtitle for row in (*first, *second))
+
+    searched, _ = presenter.fetch_transaction_page(
+        offset=0,
+        limit=50,
+        sort_key="title",
+        ascending=True,
+        filters=presenter.build_transaction_page_filters(search_text="page-item-2"),
+    )
+    assert len(searched) == 2
+    assert [row.title for row in searched] == sorted(row.title for row in searched)
+
+    by_item, _ = presenter.fetch_transaction_page(offset=0, limit=50, sort_key="subtitle", ascending=False)
+    assert [row.subtitle for row in by_item] == sorted((row.subtitle for row in by_item), reverse=True)
+    with pytest.raises(ValueError, match="cannot be sorted by 'metaText'"):
+        presenter.fetch_transaction_page(offset=0, limit=50, sort_key="metaText")
+
+    catalog = InventoryProcurementWorkspaceCatalog(desktop_api_registry=registry)
+    workspace = catalog.inventoryWorkspace
+    table_model = workspace.transactionsTableModel
+    assert table_model.rowCount() == 6
+    assert workspace.movementTotalCount == 6
+    workspace.setStoreroomFilter(storerooms[0].id)
+    assert table_model.rowCount() == 3
+    assert workspace.movementTotalCount == 3
+    table_model.toggleSort("metaText")
+    assert table_model.rowCount() == 3 and workspace.errorMessage == ""
+
+
+def test_inventory_workspace_counts_movements_without_loading_them(services, monkeypatch) -> None:
+    site = services["site_service"].create_site(
+        site_code="INV-COUNT",
+        name="Counting Site",
+        city="Kiel",
+        currency_code="EUR",
+    )
+    storeroom = services["inventory_service"].create_storeroom(
+        storeroom_code="INV-COUNT-MAIN",
+        name="Counting Main",
+        site_id=site.id,
+        status="ACTIVE",
+        storeroom_type="MAIN",
+    )
+    for index in range(3):
+        item = services["inventory_item_service"].create_item(
+            item_code=f"INV-COUNT-ITEM-{index}",
+            name=f"Counting Item {index}",
+            status="ACTIVE",
+            stock_uom="EA",
+        )
+        services["inventory_stock_service"].post_opening_balance(
+            stock_item_id=item.id,
+            storeroom_id=storeroom.id,
+            quantity=1,
+            uom="EA",
+            unit_cost=1.0,
+        )
+    desktop_api = build_desktop_api_registry(services).inventory_procurement_inventory
+    presenter = InventoryInventoryWorkspacePresenter(desktop_api=desktop_api)
+
+    def _eager_load(**_kwargs):
+        raise AssertionError("the workspace must not load the movement register eagerly")
+
+    monkeypatch.setattr(desktop_api, "list_transactions", _eager_load)
+    snapshot = presenter.build_workspace_state(site_filter=site.id)
+
+    assert snapshot.movement_count == 3
+    movements = next(metric for metric in snapshot.overview.metrics if metric.label == "Stock movements")
+    assert movements.value == "3"
+
+    label_loads: list[object] = []
+    original = desktop_api.list_transaction_labels
+    monkeypatch.setattr(
+        desktop_api,
+        "list_transaction_labels",
+        lambda: label_loads.append(None) or original(),
+    )
+    presenter.fetch_transaction_page(offset=0, limit=2)
+    presenter.fetch_transaction_page(offset=2, limit=2)
+    assert len(label_loads) == 1
+    presenter.reset_transaction_pages()
+    first, _ = presenter.fetch_transaction_page(offset=0, limit=2)
+    assert len(label_loads) == 2
+    assert first[0].subtitle.endswith("INV-COUNT-MAIN - Counting Main")
@@ -0,0 +1,67 @@
+"""Local stand-in for an IoT gateway pushing sensor readings.
+
+Produces reading payloads shaped like ``record_reading`` keyword arguments
+for a set of sensors: a seeded random walk per sensor with strictly
+increasing timestamps, and an occasional STALE reading. Used by the batch
+ingest tests and benchmark.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from src.core.modules.maintenance.domain import MaintenanceSensor
+
+
+class SensorGatewaySimulator:
+    def __init__(
+        self,
+        sensors: Sequence[MaintenanceSensor],
+        *,
+        seed: int = 0,
+        start: datetime | None = None,
+        interval: timedelta = timedelta(seconds=1),
+        stale_rate: float = 0.0,
+        source_name: str = "Simulated Gateway",
+    ) -> None:
+        if not sensors:
+            raise ValueError("The gateway simulator needs at least one sensor.")
+        self._sensors = tuple(sensors)
+        self._random = random.Random(seed)
+        self._clock = start or datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self._interval = interval
+        self._stale_rate = stale_rate
+        self._source_name = source_name
+        self._values = {sensor.id: Decimal(sensor.current_value or 100) for sensor in self._sensors}
+        self._sequence = 0
+
+    def readings(self, count: int) -> list[dict[str, object]]:
+        """The next ``count`` readings, round-robin across the sensors."""
+        payloads: list[dict[str, object]] = []
+        for _ in range(count):
+            sensor = self._sensors[self._sequence % len(self._sensors)]
+            self._sequence += 1
+            self._clock += self._interval
+            value = self._values[sensor.id] + Decimal(self._random.randint(-50, 50)) / 10
+            self._values[sensor.id] = value
+            payloads.append(
+                {
+                    "sensor_id": sensor.id,
+                    "reading_value": str(value),
+                    "reading_unit": sensor.unit,
+                    "reading_timestamp": self._clock,
+                    "quality_state": "STALE" if self._random.random() < self._stale_rate else "VALID",
+                    "source_name": self._source_name,
+                    "raw_payload_ref": f"gateway/{self._sequence}",
+                }
+            )
+        return payloads
+
+    def batches(self, batch_count: int, batch_size: int) -> list[list[dict[str, object]]]:
+        return [self.readings(batch_size) for _ in range(batch_count)]
+
+
+__all__ = ["SensorGatewaySimulator"]
@@ -7,6 +7,7 @@ from src.core.modules.maintenance.api.desktop import (
     MaintenanceDashboardSnapshotDescriptor,
     MaintenanceLocationCreateCommand,
     MaintenanceReliabilitySnapshotDescriptor,
+    MaintenanceSensorTrendDescriptor,
     MaintenanceSystemCreateCommand,
     MaintenanceWorkOrderCreateCommand,
     MaintenanceWorkOrderUpdateCommand,
@@ -85,6 +86,8 @@ def _build_reliability_api(services):
         asset_service=services["maintenance_asset_service"],
         location_service=services["maintenance_location_service"],
         system_service=services["maintenance_system_service"],
+        sensor_service=services["maintenance_sensor_service"],
+        sensor_reading_service=services["maintenance_sensor_reading_service"],
     )
 
 
@@ -255,3 +258,43 @@ def test_maintenance_reliability_desktop_api_builds_analysis_snapshot(services)
     assert snapshot.suggestion_rows[0].root_cause_name == "Misalignment"
     assert snapshot.root_cause_rows[0].failure_name == "Seal Leak"
     assert snapshot.recurring_rows[0].anchor_label == "AST-REL - Pump 501"
+
+
+def test_maintenance_reliability_desktop_api_builds_sensor_trend(services) -> None:
+    api = _build_reliability_api(services)
+    context = _create_maintenance_reliability_context(services)
+    sensor = services["maintenance_sensor_service"].create_sensor(
+        site_id=context["site"].id,
+        sensor_code="SEN-REL",
+        sensor_name="Bearing Temperature",
+        asset_id=context["asset"].id,
+        sensor_type="TEMPERATURE",
+        source_type="IOT_GATEWAY",
+        unit="C",
+    )
+    window_end = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    services["maintenance_sensor_reading_service"].record_readings(
+        [
+            {
+                "sensor_id": sensor.id,
+                "reading_value": value,
+                "reading_timestamp": window_end - timedelta(days=days, hours=hours),
+            }
+            for days, hours, value in ((2, 6, "40"), (2, 5, "60"), (1, 1, "55"))
+        ]
+    )
+
+    trend = api.build_sensor_trend(sensor.id, days=30, window_end=window_end, max_points=30)
+    empty = api.build_sensor_trend(sensor.id, days=30, window_end=window_end - timedelta(days=60))
+
+    assert isinstance(trend, MaintenanceSensorTrendDescriptor)
+    assert trend.sensor_label == "SEN-REL - Bearing Temperature"
+    assert trend.unit == "C"
+    assert trend.grain_label == "Daily"
+    assert [(point.reading_count, point.max_value, point.last_value) for point in trend.points] == [
+        (2, 60.0, 60.0),
+        (1, 55.0, 55.0),
+    ]
+    assert trend.empty_state == ""
+    assert empty.points == ()
+    assert empty.empty_state == "No sensor readings fall in this window."
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from src.core.modules.maintenance.api.desktop import (
     MaintenanceAssetCreateCommand,
     MaintenanceLocationCreateCommand,
@@ -13,6 +15,12 @@ from src.core.modules.maintenance.api.desktop import (
     build_maintenance_work_orders_desktop_api,
     build_maintenance_work_requests_desktop_api,
 )
+from src.core.modules.maintenance.api.desktop.planner import (
+    MAINTENANCE_PLANNER_MATERIAL_LANE,
+    MAINTENANCE_PLANNER_REQUEST_LANE,
+    MAINTENANCE_PLANNER_WORK_ORDER_LANE,
+)
+from src.core.platform.common.exceptions import ValidationError
 from src.core.platform.domain.master_data.party import PartyType
 
 
@@ -298,3 +306,123 @@ def test_maintenance_planner_desktop_api_builds_snapshot_from_live_services(serv
     assert snapshot.preventive_rows[0].due_state == "DUE"
     assert snapshot.recurring_rows[0].occurrence_count == 2
     assert snapshot.recurring_rows[0].failure_name == "Planner Vibration"
+
+
+def test_maintenance_planner_lanes_page_with_continuation_tokens(services, monkeypatch) -> None:
+    site, manufacturer, supplier = _create_shared_maintenance_references(services)
+    assets_api = _build_assets_api(services)
+    work_requests_api = _build_work_requests_api(services)
+    work_orders_api = _build_work_orders_api(services)
+    planner_api = _build_planner_api(services)
+
+    location = assets_api.create_location(
+        MaintenanceLocationCreateCommand(
+            site_id=site.id,
+            location_code="LOC-PAGE",
+            name="Paging Area",
+            location_type="PRODUCTION",
+        )
+    )
+    asset = assets_api.create_asset(
+        MaintenanceAssetCreateCommand(
+            site_id=site.id,
+            location_id=location.id,
+            asset_code="AST-PAGE",
+            name="Paging Pump",
+            manufacturer_party_id=manufacturer.id,
+            supplier_party_id=supplier.id,
+        )
+    )
+    for index in range(5):
+        work_requests_api.create_work_request(
+            MaintenanceWorkRequestCreateCommand(
+                site_id=site.id,
+                work_request_code=f"WR-PAGE-{index:03d}",
+                source_type="MANUAL",
+                request_type="CORRECTIVE",
+                asset_id=asset.id,
+                location_id=location.id,
+                title=f"Paging request {index}",
+                priority="MEDIUM",
+            )
+        )
+    work_orders = [
+        work_orders_api.create_work_order(
+            MaintenanceWorkOrderCreateCommand(
+                site_id=site.id,
+                work_order_code=f"WO-PAGE-{index:03d}",
+                work_order_type="CORRECTIVE",
+                asset_id=asset.id,
+                location_id=location.id,
+                title="Seal leak" if index % 2 else "Pump overhaul",
+                priority="MEDIUM",
+            )
+        )
+        for index in range(5)
+    ]
+    for work_order in work_orders:
+        services["maintenance_work_order_material_requirement_service"].create_requirement(
+            work_order_id=work_order.id,
+            description=f"Kit for {work_order.work_order_code}",
+            required_qty="1",
+            required_uom="EA",
+            is_stock_item=False,
+        )
+
+    snapshot = planner_api.build_snapshot(site_id=site.id, page_size=2)
+
+    metrics = {metric.label: metric.value for metric in snapshot.overview.metrics}
+    assert metrics["Open Requests"] == "5"
+    assert metrics["Backlog Orders"] == "5"
+    assert metrics["Material Risks"] == "5"
+    assert (snapshot.request_total, snapshot.work_order_total, snapshot.material_total) == (5, 5, 5)
+    assert len(snapshot.request_rows) == len(snapshot.work_order_rows) == len(snapshot.material_rows) == 2
+
+    def drain(lane: str, rows, token: str) -> list:
+        loaded = list(rows)
+        while token:
+            page = planner_api.load_lane_page(lane, page_token=token, site_id=site.id, page_size=2)
+            assert page.total == 5
+            loaded.extend(page.rows)
+            token = page.next_token
+        return loaded
+
+    work_order_service = services["maintenance_work_order_service"]
+    label_batches: list[set[str]] = []
+    load_work_orders = work_order_service.get_work_orders
+
+    def counting_get_work_orders(work_order_ids):
+        label_batches.append(set(work_order_ids))
+        return load_work_orders(work_order_ids)
+
+    def fail_get_work_order(work_order_id):
+        raise AssertionError("material labels must be loaded in one batch")
+
+    monkeypatch.setattr(work_order_service, "get_work_orders", counting_get_work_orders)
+    monkeypatch.setattr(work_order_service, "get_work_order", fail_get_work_order)
+
+    request_rows = drain(MAINTENANCE_PLANNER_REQUEST_LANE, snapshot.request_rows, snapshot.request_next_token)
+    work_order_rows = drain(MAINTENANCE_PLANNER_WORK_ORDER_LANE, snapshot.work_order_rows, snapshot.work_order_next_token)
+    material_rows = drain(MAINTENANCE_PLANNER_MATERIAL_LANE, snapshot.material_rows, snapshot.material_next_token)
+    # One label query per material page (pages 2 and 3), never one per row.
+    assert [len(batch) for batch in label_batches] == [2, 1]
+    monkeypatch.undo()
+    # Requests and work orders newest first, material risks oldest first.
+    assert [row.request_label.split(" - ")[0] for row in request_rows] == [f"WR-PAGE-{index:03d}" for index in reversed(range(5))]
+    assert [row.work_order_label.split(" - ")[0] for row in work_order_rows] == [f"WO-PAGE-{index:03d}" for index in reversed(range(5))]
+    assert [row.material_label for row in material_rows] == [f"Kit for WO-PAGE-{index:03d}" for index in range(5)]
+    assert all(row.work_order_label.startswith("WO-PAGE-") for row in material_rows)
+
+    searched = planner_api.build_snapshot(site_id=site.id, search_text="SEAL", page_size=2)
+    assert (searched.request_total, searched.work_order_total, searched.material_total) == (0, 2, 2)
+    assert searched.work_order_next_token == ""
+
+    sql_lane = work_order_service.list_work_order_lane(site_id=site.id, search_text="pump", page_size=2)
+    monkeypatch.setattr(work_order_service, "_planner_repo", None)
+    loaded_lane = work_order_service.list_work_order_lane(site_id=site.id, search_text="pump", page_size=2)
+    assert loaded_lane == sql_lane
+    assert sql_lane.total == 3
+    assert sql_lane.status_counts == {"DRAFT": 3}
+
+    with pytest.raises(ValidationError):
+        planner_api.load_lane_page(MAINTENANCE_PLANNER_WORK_ORDER_LANE, page_token="not-a-token", site_id=site.id)
@@ -165,6 +165,8 @@ class _WorkRequestRepo(MaintenanceWorkRequestRepository):
     def get(self, work_request_id): return self._rows.get(work_request_id)
     def get_by_code(self, organization_id, work_request_code):
         return next((r for r in self._rows.values() if r.organization_id == organization_id and r.work_request_code == work_request_code), None)
+    def list_by_codes(self, organization_id, work_request_codes):
+        return [r for r in self._rows.values() if r.organization_id == organization_id and r.work_request_code in work_request_codes]
     def list_for_organization(self, organization_id, *, site_id=None, asset_id=None, component_id=None, system_id=None, location_id=None, status=None, priority=None, requested_by_user_id=None, triaged_by_user_id=None):
         rows = [r for r in self._rows.values() if r.organization_id == organization_id]
         if site_id is not None: rows = [r for r in rows if r.site_id == site_id]
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import copy
+from time import perf_counter
+
+import pytest
+from sqlalchemy import delete
+
+from src.application.runtime import build_desktop_api_registry
+from src.core.modules.maintenance.domain import MaintenanceAsset
+from src.core.modules.maintenance.domain.assets import iter_asset_closure
+from src.core.modules.maintenance.infrastructure.persistence.mappers import maintenance_asset_to_orm
+from src.core.modules.maintenance.infrastructure.persistence.orm.asset_hierarchy_models import (
+    MaintenanceAssetClosureORM,
+)
+from src.core.modules.maintenance.infrastructure.persistence.orm.models import MaintenanceAssetORM
+from src.core.platform.common.exceptions import BusinessRuleError
+from src.tests.perf_flags import skip_unless_perf_tests
+from src.ui_qml.modules.maintenance.presenters import (
+    MaintenanceAssetsWorkspacePresenter,
+    MaintenanceWorkOrdersWorkspacePresenter,
+)
+
+
+def _site_and_location(services, code: str):
+    site = services["site_service"].create_site(site_code=f"MNT-{code}", name=f"{code.title()} Plant")
+    location = services["maintenance_location_service"].create_location(
+        site_id=site.id,
+        location_code=f"{code.lower()}-area",
+        name=f"{code.title()} Area",
+    )
+    return site, location
+
+
+def _create(services, site, location, code: str, parent: MaintenanceAsset | None = None) -> MaintenanceAsset:
+    return services["maintenance_asset_service"].create_asset(
+        site_id=site.id,
+        location_id=location.id,
+        asset_code=code,
+        name=code.replace("-", " ").title(),
+        parent_asset_id=parent.id if parent is not None else None,
+    )
+
+
+def _walk_fallback(service):
+    fallback = copy.copy(service)
+    fallback._hierarchy_repo = None
+    return fallback
+
+
+def test_asset_closure_follows_create_and_reparent(services):
+    service = services["maintenance_asset_service"]
+    site, location = _site_and_location(services, "TREE")
+    plant = _create(services, site, location, "plant")
+    line_a = _create(services, site, location, "line-a", plant)
+    line_b = _create(services, site, location, "line-b", plant)
+    pump = _create(services, site, location, "pump", line_a)
+    motor = _create(services, site, location, "motor", pump)
+
+    assert [row.id for row in service.list_asset_subtree(plant.id)] == [
+        plant.id,
+        line_a.id,
+        line_b.id,
+        pump.id,
+        motor.id,
+    ]
+    assert [row.id for row in service.list_asset_subtree(plant.id, include_self=False, max_depth=1)] == [
+        line_a.id,
+        line_b.id,
+    ]
+    assert service.list_asset_ancestor_ids(motor.id) == [pump.id, line_a.id, plant.id]
+
+    moved = service.update_asset(pump.id, parent_asset_id=line_b.id, expected_version=pump.version)
+
+    assert moved.parent_asset_id == line_b.id
+    assert [row.id for row in service.list_asset_subtree(line_a.id)] == [line_a.id]
+    assert [row.id for row in service.list_asset_subtree(line_b.id)] == [line_b.id, pump.id, motor.id]
+    assert service.list_asset_ancestor_ids(motor.id) == [pump.id, line_b.id, plant.id]
+    fallback = _walk_fallback(service)
+    for asset in (plant, line_a, line_b, pump, motor):
+        assert fallback.list_asset_subtree(asset.id) == service.list_asset_subtree(asset.id)
+        assert fallback.list_asset_ancestor_ids(asset.id) == service.list_asset_ancestor_ids(asset.id)
+
+    line_b = service.get_asset(line_b.id)
+    with pytest.raises(BusinessRuleError) as exc_info:
+        service.update_asset(line_b.id, parent_asset_id=motor.id, expected_version=line_b.version)
+    assert exc_info.value.code == "MAINTENANCE_ASSET_PARENT_CYCLE"
+    with pytest.raises(BusinessRuleError):
+        fallback.update_asset(line_b.id, parent_asset_id=motor.id, expected_version=line_b.version)
+
+    moved = service.update_asset(pump.id, parent_asset_id="", expected_version=moved.version)
+
+    assert moved.parent_asset_id is None
+    assert service.list_asset_ancestor_ids(motor.id) == [pump.id]
+    assert [row.id for row in service.list_asset_subtree(plant.id)] == [plant.id, line_a.id, line_b.id]
+    assert service.check_asset_hierarchy() == []
+
+
+def test_asset_subtree_summary_and_closure_repair(services, session):
+    service = services["maintenance_asset_service"]
+    site, location = _site_and_location(services, "ROLL")
+    plant = _create(services, site, location, "roll-plant")
+    line = _create(services, site, location, "roll-line", plant)
+    pump = _create(services, site, location, "roll-pump", line)
+    work_order = services["maintenance_work_order_service"].create_work_order(
+        site_id=site.id,
+        work_order_code="wo-roll-1",
+        work_order_type="corrective",
+        source_type="manual",
+        asset_id=pump.id,
+        location_id=location.id,
+        title="Pump seal",
+    )
+    services["maintenance_downtime_event_service"].create_downtime_event(
+        work_order_id=work_order.id,
+        started_at="2026-04-03T08:00:00+00:00",
+        ended_at="2026-04-03T09:15:00+00:00",
+        downtime_type="unplanned",
+    )
+    services["maintenance_work_order_material_requirement_service"].create_requirement(
+        work_order_id=work_order.id,
+        description="Seal kit",
+        required_qty="1",
+        required_uom="EA",
+        is_stock_item=False,
+    )
+
+    summary = service.summarize_asset_subtree(plant.id)
+
+    assert summary.asset_count == 3
+    assert summary.max_depth == 2
+    assert summary.work_order_count == 1
+    assert summary.open_work_order_count == 1
+    assert summary.downtime_minutes == 75
+    assert summary.material_requirement_count == 1
+    assert service.summarize_asset_subtree(pump.id).asset_count == 1
+
+    session.execute(
+        delete(MaintenanceAssetClosureORM).where(
+            MaintenanceAssetClosureORM.ancestor_id == plant.id,
+            MaintenanceAssetClosureORM.descendant_id == pump.id,
+        )
+    )
+    session.commit()
+
+    (drift,) = service.check_asset_hierarchy()
+    assert (drift.ancestor_id, drift.descendant_id) == (plant.id, pump.id)
+    assert (drift.expected_depth, drift.stored_depth) == (2, None)
+
+    assert service.rebuild_asset_hierarchy() == 6
+    assert service.check_asset_hierarchy() == []
+    assert service.summarize_asset_subtree(plant.id).asset_count == 3
+
+
+def test_work_orders_and_downtime_filter_by_asset_subtree(services):
+    site, location = _site_and_location(services, "UNDER")
+    plant = _create(services, site, location, "under-plant")
+    line = _create(services, site, location, "under-line", plant)
+    pump = _create(services, site, location, "under-pump", line)
+    other = _create(services, site, location, "under-other")
+    work_orders = services["maintenance_work_order_service"]
+    downtime = services["maintenance_downtime_event_service"]
+    codes = {}
+    for asset in (line, pump, other):
+        codes[asset.id] = work_orders.create_work_order(
+            site_id=site.id,
+            work_order_code=f"wo-{asset.asset_code}",
+            work_order_type="corrective",
+            source_type="manual",
+            asset_id=asset.id,
+            location_id=location.id,
+            title=f"Fix {asset.name}",
+        ).work_order_code
+        downtime.create_downtime_event(
+            asset_id=asset.id,
+            started_at="2026-04-03T08:00:00+00:00",
+            ended_at="2026-04-03T08:30:00+00:00",
+            downtime_type="unplanned",
+        )
+
+    under_plant = work_orders.list_work_orders(under_asset_id=plant.id)
+    assert sorted(row.work_order_code for row in under_plant) == sorted([codes[line.id], codes[pump.id]])
+    searched = work_orders.search_work_orders(under_asset_id=line.id, search_text="pump")
+    assert [row.work_order_code for row in searched] == [codes[pump.id]]
+    assert [row.asset_id for row in work_orders.list_work_orders(under_asset_id=pump.id)] == [pump.id]
+    assert {row.asset_id for row in downtime.list_downtime_events(under_asset_id=plant.id)} == {line.id, pump.id}
+    assert [row.asset_id for row in downtime.search_downtime_events(under_asset_id=other.id)] == [other.id]
+
+    registry = build_desktop_api_registry(services)
+    rows = registry.maintenance_work_orders.list_work_orders(under_asset_id=line.id)
+    assert {row.asset_id for row in rows} == {line.id, pump.id}
+    subtree = registry.maintenance_assets.summarize_asset_subtree(plant.id)
+    assert (subtree.asset_count, subtree.work_order_count, subtree.downtime_minutes) == (3, 2, 60)
+
+    workspace = MaintenanceWorkOrdersWorkspacePresenter(
+        desktop_api=registry.maintenance_work_orders
+    ).build_workspace_state(asset_filter=plant.id)
+    assert sorted(row.title for row in workspace.work_orders) == sorted([codes[line.id], codes[pump.id]])
+    assets = MaintenanceAssetsWorkspacePresenter(desktop_api=registry.maintenance_assets).build_workspace_state(
+        selected_asset_id=plant.id
+    )
+    tree = next(field for field in assets.selected_asset_detail.fields if field.label == "Asset tree")
+    assert tree.value == "2 assets below | 2 of 2 work orders open"
+
+
+def test_asset_closure_walk_handles_orphans_and_legacy_cycles():
+    parents = {
+        "plant": ("org", None),
+        "line": ("org", "plant"),
+        "pump": ("org", "line"),
+        "stray": ("org", "missing"),
+        "loop-a": ("org", "loop-b"),
+        "loop-b": ("org", "loop-a"),
+    }
+
+    closure = {entry.key: entry.depth for entry in iter_asset_closure(parents)}
+
+    assert closure == {
+        ("plant", "plant"): 0,
+        ("line", "line"): 0,
+        ("plant", "line"): 1,
+        ("pump", "pump"): 0,
+        ("line", "pump"): 1,
+        ("plant", "pump"): 2,
+        ("stray", "stray"): 0,
+        ("loop-a", "loop-a"): 0,
+        ("loop-b", "loop-b"): 0,
+    }
+
+
+def test_asset_closure_benchmark_on_200k_asset_hierarchy(services, session):
+    skip_unless_perf_tests()
+
+    service = services["maintenance_asset_service"]
+    site, location = _site_and_location(services, "BIG")
+    root = _create(services, site, location, "big-root")
+    tenant_id = session.get(MaintenanceAssetORM, root.id).tenant_id
+    # 20 plants x 10 lines x 10 units x 100 parts: 202,220 assets, 4 deep.
+    plant_ids: list[str] = []
+    level: list[str | None] = [None]
+    for depth, fan_out in enumerate((20, 10, 10, 100)):
+        next_level: list[str] = []
+        batch = []
+        for parent_id in level:
+            for index in range(fan_out):
+                asset = MaintenanceAsset.create(
+                    organization_id=root.organization_id,
+                    site_id=site.id,
+                    location_id=location.id,
+                    asset_code=f"BIG-{depth}-{len(next_level)}",
+                    name=f"Big {depth} {index}",
+                    parent_asset_id=parent_id,
+                )
+                orm = maintenance_asset_to_orm(asset)
+                orm.tenant_id = tenant_id
+                batch.append(orm)
+                next_level.append(asset.id)
+        session.add_all(batch)
+        session.flush()
+        if depth == 0:
+            plant_ids = list(next_level)
+        level = next_level
+    session.commit()
+
+    started = perf_counter()
+    written = service.rebuild_asset_hierarchy()
+    rebuild_ms = (perf_counter() - started) * 1000.0
+    started = perf_counter()
+    summary = service.summarize_asset_subtree(plant_ids[0])
+    summary_ms = (perf_counter() - started) * 1000.0
+    started = perf_counter()
+    subtree = service.list_asset_subtree(plant_ids[0])
+    subtree_ms = (perf_counter() - started) * 1000.0
+    started = perf_counter()
+    expected = _walk_fallback(service).list_asset_subtree(plant_ids[0])
+    walk_ms = (perf_counter() - started) * 1000.0
+    started = perf_counter()
+    drift = service.check_asset_hierarchy()
+    verify_ms = (perf_counter() - started) * 1000.0
+    print(
+        f"Asset closure over 202221 assets: rows={written} rebuild_ms={rebuild_ms:.1f} "
+        f"summary_ms={summary_ms:.1f} subtree_ms={subtree_ms:.1f} walk_ms={walk_ms:.1f} "
+        f"verify_ms={verify_ms:.1f}"
+    )
+
+    assert summary.asset_count == 1 + 10 + 100 + 10_000
+    assert [row.id for row in subtree] == [row.id for row in expected]
+    assert drift == []
+    assert subtree_ms < walk_ms
@@ -1,5 +1,20 @@
 from __future__ import annotations
 
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from time import perf_counter
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.core.modules.maintenance.application.reliability.sensor_retention import MaintenanceSensorRetentionJob
+from src.core.modules.maintenance.domain import MaintenanceSensorRollupGrain
+from src.core.platform.common.exceptions import ValidationError
+from ._sensor_gateway_simulator import SensorGatewaySimulator
+from src.infra.composition.background_jobs import session_bound_services
+from src.tests.perf_flags import skip_unless_perf_tests
+
 
 def test_maintenance_material_requirements_persist_and_escalate_via_service_graph(services):
     site = services["site_service"].create_site(
@@ -275,3 +290,345 @@ def test_maintenance_preventive_templates_and_plans_persist_via_service_graph(se
     assert step_rows[0].requires_confirmation is True
     assert [row.id for row in plan_task_rows] == [plan_task.id]
     assert plan_task_rows[0].trigger_scope.value == "INHERIT_PLAN"
+
+
+def _batch_sensor_fixture(services, *, sensor_count: int):
+    site = services["site_service"].create_site(site_code="MNT-BATCH", name="Batch Sensor Plant")
+    location = services["maintenance_location_service"].create_location(
+        site_id=site.id,
+        location_code="batch-area",
+        name="Batch Area",
+    )
+    asset = services["maintenance_asset_service"].create_asset(
+        site_id=site.id,
+        location_id=location.id,
+        asset_code="batch-asset",
+        name="Batch Asset",
+    )
+    sensors = [
+        services["maintenance_sensor_service"].create_sensor(
+            site_id=site.id,
+            sensor_code=f"batch-{index}",
+            sensor_name=f"Batch Sensor {index}",
+            asset_id=asset.id,
+            sensor_type="TEMPERATURE",
+            source_type="IOT_GATEWAY",
+            unit="C",
+        )
+        for index in range(sensor_count)
+    ]
+    return site, asset, sensors
+
+
+def test_sensor_reading_batch_persists_and_evaluates_triggers_on_batch_peak(services):
+    site, asset, (hot, cold) = _batch_sensor_fixture(services, sensor_count=2)
+    plan = services["maintenance_preventive_plan_service"].create_preventive_plan(
+        site_id=site.id,
+        plan_code="batch-plan",
+        name="Overheat Inspection",
+        asset_id=asset.id,
+        status="active",
+        trigger_mode="sensor",
+        sensor_id=hot.id,
+        sensor_threshold="90",
+        sensor_direction="greater_or_equal",
+    )
+    started = datetime(2026, 3, 1, 8, tzinfo=timezone.utc)
+    readings = [
+        {"sensor_id": hot.id, "reading_value": "70", "reading_timestamp": started},
+        {"sensor_id": cold.id, "reading_value": "4", "reading_timestamp": started},
+        {"sensor_id": hot.id, "reading_value": "95", "reading_timestamp": started + timedelta(minutes=1)},
+        {"sensor_id": hot.id, "reading_value": "80", "reading_timestamp": started + timedelta(minutes=2)},
+        {
+            "sensor_id": cold.id,
+            "reading_value": "5",
+            "reading_timestamp": started + timedelta(minutes=1),
+            "quality_state": "STALE",
+        },
+    ]
+
+    result = services["maintenance_sensor_reading_service"].record_readings(
+        readings,
+        source_name="Gateway B",
+        source_batch_id="SYNC-200",
+    )
+
+    listed = services["maintenance_sensor_reading_service"].list_readings(source_batch_id="SYNC-200")
+    reloaded_hot = services["maintenance_sensor_service"].find_sensor_by_code("BATCH-0")
+    exceptions = services["maintenance_sensor_exception_service"].list_exceptions()
+
+    assert len(result.readings) == len(listed) == 5
+    assert {row.source_name for row in listed} == {"Gateway B"}
+    assert set(result.refreshed_sensor_ids) == {hot.id, cold.id}
+    assert reloaded_hot.current_value == Decimal("80")
+    assert reloaded_hot.last_read_at == started + timedelta(minutes=2)
+    assert [check.plan_id for check in result.trigger_checks] == [plan.id]
+    assert result.trigger_checks[0].evaluated_value == Decimal("95")
+    assert result.due_plan_ids == (plan.id,)
+    assert sum(row.sensor_id == cold.id and row.exception_type.value == "STALE_READING" for row in exceptions) == 1
+
+
+def test_sensor_reading_batch_evaluates_only_plans_and_task_overrides_on_batch_sensors(services):
+    site, asset, (hot, vibration, idle) = _batch_sensor_fixture(services, sensor_count=3)
+    plan_service = services["maintenance_preventive_plan_service"]
+    hot_plan = plan_service.create_preventive_plan(
+        site_id=site.id,
+        plan_code="batch-hot",
+        name="Overheat Inspection",
+        asset_id=asset.id,
+        status="active",
+        trigger_mode="sensor",
+        sensor_id=hot.id,
+        sensor_threshold="90",
+        sensor_direction="greater_or_equal",
+    )
+    plan_service.create_preventive_plan(
+        site_id=site.id,
+        plan_code="batch-idle",
+        name="Idle Sensor Plan",
+        asset_id=asset.id,
+        status="active",
+        trigger_mode="sensor",
+        sensor_id=idle.id,
+        sensor_threshold="1",
+        sensor_direction="greater_or_equal",
+    )
+    calendar_plan = plan_service.create_preventive_plan(
+        site_id=site.id,
+        plan_code="batch-monthly",
+        name="Monthly Service",
+        asset_id=asset.id,
+        status="active",
+        trigger_mode="calendar",
+        calendar_frequency_unit="monthly",
+        calendar_frequency_value=1,
+    )
+    task_template = services["maintenance_task_template_service"].create_task_template(
+        task_template_code="batch-vibe",
+        name="Check Bearing Vibration",
+        maintenance_type="preventive",
+        template_status="active",
+    )
+    override = services["maintenance_preventive_plan_task_service"].create_plan_task(
+        plan_id=calendar_plan.id,
+        task_template_id=task_template.id,
+        trigger_scope="task_override",
+        trigger_mode_override="sensor",
+        sensor_id_override=vibration.id,
+        sensor_threshold_override="10",
+        sensor_direction_override="greater_or_equal",
+    )
+    started = datetime(2026, 3, 1, 8, tzinfo=timezone.utc)
+
+    result = services["maintenance_sensor_reading_service"].record_readings(
+        [
+            {"sensor_id": hot.id, "reading_value": "60", "reading_timestamp": started},
+            {"sensor_id": vibration.id, "reading_value": "12", "reading_timestamp": started},
+            {"sensor_id": vibration.id, "reading_value": "3", "reading_timestamp": started + timedelta(minutes=1)},
+        ],
+        source_batch_id="SYNC-300",
+    )
+
+    checks = {(check.plan_id, check.plan_task_id): check for check in result.trigger_checks}
+    assert set(checks) == {(hot_plan.id, None), (calendar_plan.id, override.id)}
+    assert checks[(hot_plan.id, None)].evaluation.due is False
+    assert checks[(calendar_plan.id, override.id)].sensor_id == vibration.id
+    assert checks[(calendar_plan.id, override.id)].evaluated_value == Decimal("12")
+    assert result.due_plan_ids == (calendar_plan.id,)
+
+
+def test_sensor_reading_batch_rejects_every_reading_when_one_is_invalid(services):
+    _site, _asset, (sensor,) = _batch_sensor_fixture(services, sensor_count=1)
+
+    with pytest.raises(ValidationError) as exc_info:
+        services["maintenance_sensor_reading_service"].record_readings(
+            [
+                {"sensor_id": sensor.id, "reading_value": "10", "reading_unit": "C"},
+                {"sensor_id": sensor.id, "reading_value": "11", "reading_unit": "F"},
+            ],
+            source_batch_id="SYNC-BAD",
+        )
+
+    assert exc_info.value.code == "MAINTENANCE_SENSOR_READING_UNIT_MISMATCH"
+    assert services["maintenance_sensor_reading_service"].list_readings(source_batch_id="SYNC-BAD") == []
+
+
+def test_sensor_reading_batch_ingest_benchmark(services):
+    skip_unless_perf_tests()
+
+    _site, _asset, sensors = _batch_sensor_fixture(services, sensor_count=50)
+    reading_service = services["maintenance_sensor_reading_service"]
+    gateway = SensorGatewaySimulator(sensors, seed=7, stale_rate=0.01)
+    single = gateway.readings(500)
+    batches = gateway.batches(10, 500)
+
+    started = perf_counter()
+    for payload in single:
+        reading_service.record_reading(**payload)
+    single_per_reading_ms = (perf_counter() - started) * 1000 / len(single)
+    started = perf_counter()
+    for batch in batches:
+        reading_service.record_readings(batch)
+    batch_per_reading_ms = (perf_counter() - started) * 1000 / sum(len(batch) for batch in batches)
+    print(
+        f"Sensor ingest over {len(sensors)} sensors: "
+        f"single_ms_per_reading={single_per_reading_ms:.3f} "
+        f"batch_ms_per_reading={batch_per_reading_ms:.3f}"
+    )
+    assert batch_per_reading_ms < single_per_reading_ms
+
+
+def test_sensor_trend_reads_rollups_maintained_on_ingest_and_survives_pruning(services):
+    _site, _asset, (sensor,) = _batch_sensor_fixture(services, sensor_count=1)
+    reading_service = services["maintenance_sensor_reading_service"]
+    started = datetime(2026, 2, 1, 9, 58, tzinfo=timezone.utc)
+    reading_service.record_readings(
+        [
+            {"sensor_id": sensor.id, "reading_value": "20", "reading_timestamp": started},
+            {"sensor_id": sensor.id, "reading_value": "30", "reading_timestamp": started + timedelta(minutes=1)},
+            {"sensor_id": sensor.id, "reading_value": "40", "reading_timestamp": started + timedelta(minutes=3)},
+        ]
+    )
+    reading_service.record_reading(
+        sensor_id=sensor.id,
+        reading_value="10",
+        reading_timestamp=started + timedelta(minutes=1, seconds=30),
+    )
+    reading_service.record_reading(
+        sensor_id=sensor.id,
+        reading_value="500",
+        reading_timestamp=started + timedelta(minutes=2),
+        quality_state="ERROR",
+    )
+
+    hourly = reading_service.read_trend(
+        sensor.id,
+        window_start=started,
+        window_end=started + timedelta(hours=2),
+        resolution=timedelta(hours=1),
+    )
+    yearly = reading_service.read_trend(
+        sensor.id,
+        window_start=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        window_end=datetime(2027, 1, 1, tzinfo=timezone.utc),
+    )
+    raw = reading_service.read_trend(
+        sensor.id,
+        window_start=started,
+        window_end=started + timedelta(minutes=5),
+    )
+    pruned = reading_service.prune_raw_readings(
+        older_than=timedelta(days=30),
+        as_of=started + timedelta(days=40),
+    )
+    after_prune = reading_service.read_trend(
+        sensor.id,
+        window_start=started,
+        window_end=started + timedelta(hours=2),
+        resolution=timedelta(hours=1),
+    )
+
+    assert hourly.grain.value == "HOUR"
+    assert [(point.reading_count, point.min_value, point.max_value, point.last_value) for point in hourly.points] == [
+        (3, Decimal("10"), Decimal("30"), Decimal("10")),
+        (1, Decimal("40"), Decimal("40"), Decimal("40")),
+    ]
+    assert hourly.points[0].avg_value == Decimal("20")
+    assert yearly.grain.value == "DAY"
+    assert len(yearly.points) == 1
+    assert sum(point.reading_count for point in yearly.points) == 4
+    assert raw.grain is None
+    assert [point.last_value for point in raw.points] == [Decimal(v) for v in ("20", "30", "10", "40")]
+    assert pruned == 5
+    assert reading_service.list_readings(sensor_id=sensor.id) == []
+    assert after_prune.points == hourly.points
+
+
+def test_sensor_retention_job_prunes_raw_readings_as_the_signed_in_user(session, services, anonymous_services):
+    _site, _asset, (sensor,) = _batch_sensor_fixture(services, sensor_count=1)
+    reading_service = services["maintenance_sensor_reading_service"]
+    now = datetime.now(timezone.utc)
+    reading_service.record_readings(
+        [
+            {"sensor_id": sensor.id, "reading_value": "20", "reading_timestamp": now - timedelta(days=45)},
+            {"sensor_id": sensor.id, "reading_value": "25", "reading_timestamp": now - timedelta(hours=1)},
+        ]
+    )
+    session_factory = sessionmaker(bind=session.get_bind(), autoflush=False, expire_on_commit=False)
+
+    signed_out = MaintenanceSensorRetentionJob(
+        session_factory=session_factory,
+        build_services=session_bound_services(anonymous_services["user_session"]),
+        older_than=timedelta(days=30),
+    ).run()
+    pruned = MaintenanceSensorRetentionJob(
+        session_factory=session_factory,
+        build_services=session_bound_services(services["user_session"]),
+        older_than=timedelta(days=30),
+    ).run()
+    session.expire_all()
+
+    assert signed_out == 0
+    assert pruned == 1
+    assert [row.reading_value for row in reading_service.list_readings(sensor_id=sensor.id)] == [Decimal("25")]
+
+
+def test_sensor_trend_rejects_an_empty_window(services):
+    _site, _asset, (sensor,) = _batch_sensor_fixture(services, sensor_count=1)
+    moment = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+    with pytest.raises(ValidationError) as exc_info:
+        services["maintenance_sensor_reading_service"].read_trend(sensor.id, window_start=moment, window_end=moment)
+
+    assert exc_info.value.code == "MAINTENANCE_SENSOR_TREND_WINDOW_INVALID"
+
+
+def test_sensor_trend_year_of_one_hertz_data_benchmark(services):
+    skip_unless_perf_tests()
+
+    _site, _asset, (sensor,) = _batch_sensor_fixture(services, sensor_count=1)
+    reading_service = services["maintenance_sensor_reading_service"]
+    year_start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    # One 1 Hz day, rolled up on ingest through the batch API ...
+    gateway = SensorGatewaySimulator([sensor], seed=3, start=year_start - timedelta(seconds=1))
+    started = perf_counter()
+    for batch in gateway.batches(86, 1000):
+        reading_service.record_readings(batch)
+    ingest_ms_per_reading = (perf_counter() - started) * 1000 / 86_000
+    # ... and the rest of the year's hour and day buckets as 1 Hz ingest
+    # would have left them (3600 and 86400 readings each).
+    rollup_repo = reading_service._sensor_rollup_repo
+    stored = rollup_repo.list_for_sensor(sensor.organization_id, sensor.id, grain=MaintenanceSensorRollupGrain.DAY)
+    template = stored[0]
+    rollups = [
+        replace(
+            template,
+            grain=grain,
+            bucket_start=year_start + offset * width,
+            reading_count=count,
+            sum_value=template.avg_value * count,
+            last_reading_at=year_start + (offset + 1) * width - timedelta(seconds=1),
+        )
+        for grain, width, count, buckets in (
+            (MaintenanceSensorRollupGrain.HOUR, timedelta(hours=1), 3600, 24 * 365),
+            (MaintenanceSensorRollupGrain.DAY, timedelta(days=1), 86_400, 365),
+        )
+        for offset in range(1 if grain == MaintenanceSensorRollupGrain.DAY else 24, buckets)
+    ]
+    rollup_repo.merge_many(rollups)
+    services["maintenance_sensor_reading_service"]._session.commit()
+
+    started = perf_counter()
+    trend = reading_service.read_trend(
+        sensor.id,
+        window_start=year_start,
+        window_end=year_start + timedelta(days=365),
+    )
+    trend_ms = (perf_counter() - started) * 1000
+    print(
+        f"Sensor trend over one year at 1 Hz: grain={trend.grain.value} points={len(trend.points)} "
+        f"trend_ms={trend_ms:.1f} ingest_ms_per_reading={ingest_ms_per_reading:.3f}"
+    )
+    assert trend.grain == MaintenanceSensorRollupGrain.DAY
+    assert len(trend.points) == 365
+    assert sum(point.reading_count for point in trend.points) >= 365 * 86_000
@@ -1,5 +1,25 @@
 ﻿from __future__ import annotations
 
+import copy
+import random
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+
+from src.core.modules.maintenance.domain import (
+    MaintenanceDowntimeEvent,
+    MaintenanceFailureOccurrence,
+    MaintenanceWorkOrder,
+    MaintenanceWorkOrderStatus,
+)
+from src.core.modules.maintenance.domain.reliability import rollup_failure_occurrences
+from src.core.modules.maintenance.domain.reliability.failure_rollups import FAILURE_COMPLETED_STATUSES
+from src.core.modules.maintenance.infrastructure.persistence.repositories import (
+    SqlAlchemyMaintenanceDowntimeEventRepository,
+    SqlAlchemyMaintenanceWorkOrderRepository,
+)
+from src.tests.perf_flags import skip_unless_perf_tests
+
 
 def test_maintenance_failure_codes_and_downtime_events_persist_via_service_graph(services):
     site = services["site_service"].create_site(site_code="MNT-RLY", name="Reliability Plant")
@@ -164,3 +184,343 @@ def test_maintenance_reliability_service_summarizes_persisted_patterns(services)
     assert recurring[0].occurrence_count == 2
     assert recurring[0].leading_root_cause_code == cause_code.failure_code
     assert suggestions[0].root_cause_code == cause_code.failure_code
+
+
+def _seed_failure_history(services, session, *, count: int, seed: int = 11):
+    """``count`` work orders over the past year spread across two asset
+    categories plus system- and location-only anchors, written straight
+    through the repositories so their timestamps can be back-dated."""
+    site = services["site_service"].create_site(site_code="MNT-HIST", name="History Plant")
+    location = services["maintenance_location_service"].create_location(
+        site_id=site.id,
+        location_code="hist-area",
+        name="History Area",
+    )
+    system = services["maintenance_system_service"].create_system(
+        site_id=site.id,
+        system_code="hist-sys",
+        name="History System",
+        location_id=location.id,
+    )
+    assets = [
+        services["maintenance_asset_service"].create_asset(
+            site_id=site.id,
+            location_id=location.id,
+            system_id=system.id,
+            asset_code=f"hist-{category.lower()}-{index}",
+            name=f"{category.title()} {index}",
+            asset_category=category,
+        )
+        for category in ("PUMP", "FAN")
+        for index in range(2)
+    ]
+    for code, code_type in (("seal-leak", "symptom"), ("overheat", "symptom"), ("wear", "cause"), ("lube-loss", "cause")):
+        services["maintenance_failure_code_service"].create_failure_code(
+            failure_code=code,
+            name=code.replace("-", " ").title(),
+            code_type=code_type,
+        )
+
+    organization_id = assets[0].organization_id
+    tenant_context_service = services["tenant_context_service"]
+    work_order_repo = SqlAlchemyMaintenanceWorkOrderRepository(session, tenant_context_service=tenant_context_service)
+    downtime_repo = SqlAlchemyMaintenanceDowntimeEventRepository(session, tenant_context_service=tenant_context_service)
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    statuses = list(MaintenanceWorkOrderStatus)
+    for index in range(count):
+        anchor = rng.choice([*assets, *assets, "system", "location"])
+        work_order = MaintenanceWorkOrder.create(
+            organization_id=organization_id,
+            site_id=site.id,
+            work_order_code=f"WO-HIST-{index}",
+            work_order_type="CORRECTIVE",
+            source_type="MANUAL",
+            asset_id=anchor.id if anchor not in ("system", "location") else None,
+            system_id=system.id if anchor != "location" else None,
+            location_id=location.id,
+            title=f"History {index}",
+        )
+        started_at = now - timedelta(days=rng.randint(0, 400), minutes=rng.randint(0, 1440))
+        work_order.status = rng.choice(statuses)
+        work_order.priority = rng.choice(["LOW", "MEDIUM", "HIGH"])
+        work_order.failure_code = rng.choice(["SEAL-LEAK", "OVERHEAT", "SEAL-LEAK", ""])
+        work_order.root_cause_code = rng.choice(["WEAR", "LUBE-LOSS", ""])
+        work_order.downtime_minutes = rng.choice([None, 0, 30, 45, 120])
+        work_order.actual_start = started_at if rng.random() < 0.8 else None
+        work_order.actual_end = (
+            started_at + timedelta(minutes=rng.randint(10, 600)) if work_order.actual_start and rng.random() < 0.7 else None
+        )
+        work_order.closed_at = work_order.actual_end if work_order.status == MaintenanceWorkOrderStatus.CLOSED else None
+        work_order.planned_end = started_at + timedelta(days=rng.randint(-5, 5))
+        work_order_repo.add(work_order)
+        if rng.random() < 0.3:
+            session.flush()
+            downtime_repo.add(
+                MaintenanceDowntimeEvent.create(
+                    organization_id=organization_id,
+                    work_order_id=work_order.id if rng.random() < 0.5 else None,
+                    asset_id=work_order.asset_id,
+                    system_id=work_order.system_id,
+                    started_at=started_at,
+                    ended_at=started_at + timedelta(minutes=90) if rng.random() < 0.8 else None,
+                    duration_minutes=90,
+                    downtime_type=rng.choice(["UNPLANNED", "PLANNED"]),
+                    reason_code="SEAL-LEAK",
+                )
+            )
+    session.commit()
+    return site, system, assets
+
+
+def _python_fallback(service):
+    fallback = copy.copy(service)
+    fallback._analytics_repo = None
+    return fallback
+
+
+def _pattern_key(pattern):
+    return (pattern.anchor_type, pattern.anchor_id, pattern.failure_code, pattern.leading_root_cause_code)
+
+
+def test_reliability_sql_aggregates_match_in_memory_analysis(services, session):
+    site, system, assets = _seed_failure_history(services, session, count=240)
+    service = services["maintenance_reliability_service"]
+    fallback = _python_fallback(service)
+    as_of = datetime.now(timezone.utc) - timedelta(days=30)
+
+    for filters in (
+        {},
+        {"site_id": site.id, "days": 365},
+        {"asset_id": assets[0].id, "days": 400},
+        {"system_id": system.id, "days": 120, "as_of": as_of},
+        {"asset_category": "PUMP", "days": 365},
+    ):
+        dashboard = service.build_reliability_dashboard(**filters, limit=100)
+        expected = fallback.build_reliability_dashboard(**filters, limit=100)
+        assert dashboard.summary == expected.summary, filters
+        assert dashboard.backlog_by_status == expected.backlog_by_status
+        assert dashboard.backlog_by_priority == expected.backlog_by_priority
+        assert dashboard.downtime_by_type == expected.downtime_by_type
+        assert sorted(dashboard.top_root_causes, key=lambda row: (row.failure_code, row.root_cause_code)) == sorted(
+            expected.top_root_causes, key=lambda row: (row.failure_code, row.root_cause_code)
+        )
+        assert sorted(dashboard.recurring_failures, key=_pattern_key) == sorted(
+            expected.recurring_failures, key=_pattern_key
+        )
+
+    for scope in ({"asset_id": assets[1].id}, {"system_id": system.id}, {"asset_category": "FAN"}, {}):
+        assert service.suggest_root_causes(failure_code="seal-leak", **scope) == fallback.suggest_root_causes(
+            failure_code="seal-leak", **scope
+        )
+
+    summary = {metric.label: metric.value for metric in service.build_reliability_dashboard(days=400).summary}
+    assert summary["MTBF hours"] != "n/a"
+    assert summary["MTTR hours"] != "n/a"
+    pump_ids = {asset.id for asset in assets if asset.asset_category == "PUMP"}
+    assert {
+        pattern.anchor_id
+        for pattern in service.list_recurring_failure_patterns(asset_category="PUMP", days=400, limit=100)
+    } <= pump_ids
+
+
+def test_reliability_dashboard_aggregation_benchmark(services, session):
+    skip_unless_perf_tests()
+
+    _seed_failure_history(services, session, count=20_000)
+    service = services["maintenance_reliability_service"]
+    fallback = _python_fallback(service)
+
+    started = perf_counter()
+    dashboard = service.build_reliability_dashboard(days=365)
+    sql_ms = (perf_counter() - started) * 1000.0
+    started = perf_counter()
+    expected = fallback.build_reliability_dashboard(days=365)
+    python_ms = (perf_counter() - started) * 1000.0
+    print(f"Reliability dashboard over 20000 work orders: sql_ms={sql_ms:.1f} python_ms={python_ms:.1f}")
+
+    assert dashboard.summary == expected.summary
+    assert sql_ms < python_ms
+
+
+def _rollup_fallback(service):
+    fallback = copy.copy(service)
+    fallback._failure_rollup_repo = None
+    return fallback
+
+
+def test_failure_rollup_folding_is_order_independent():
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    occurrences = [
+        MaintenanceFailureOccurrence("org", "asset", "SEAL-LEAK", started + timedelta(hours=hours), repair)
+        for hours, repair in ((0, 3600), (100, None), (40, 1800), (100, 600), (250, 7200))
+    ]
+    expected = rollup_failure_occurrences(occurrences)
+    for seed in range(5):
+        shuffled = list(occurrences)
+        random.Random(seed).shuffle(shuffled)
+        assert rollup_failure_occurrences(shuffled) == expected
+
+    (rollup,) = expected
+    assert rollup.failure_count == 5
+    assert rollup.repair_count == 4
+    # 250 hours from first to last failure, less every repair but the last.
+    assert rollup.uptime_seconds == 250 * 3600 - (3600 + 1800 + 600)
+    assert rollup.mttr_seconds == (3600 + 1800 + 600 + 7200) / 4
+
+
+def test_failure_rollups_follow_work_order_completion_and_reopen(services):
+    work_order_service = services["maintenance_work_order_service"]
+    reliability_service = services["maintenance_reliability_service"]
+    site = services["site_service"].create_site(site_code="MNT-ROLL", name="Rollup Plant")
+    location = services["maintenance_location_service"].create_location(
+        site_id=site.id,
+        location_code="roll-area",
+        name="Rollup Area",
+    )
+    asset = services["maintenance_asset_service"].create_asset(
+        site_id=site.id,
+        location_id=location.id,
+        asset_code="roll-pump",
+        name="Rollup Pump",
+    )
+    services["maintenance_failure_code_service"].create_failure_code(
+        failure_code="seal-leak",
+        name="Seal Leak",
+        code_type="symptom",
+    )
+
+    def run_to(work_order, *statuses, **changes):
+        for status in statuses:
+            work_order = work_order_service.update_work_order(
+                work_order.id,
+                status=status,
+                expected_version=work_order.version,
+                **(changes if status == statuses[-1] else {}),
+            )
+        return work_order
+
+    completed = []
+    for index in range(3):
+        work_order = work_order_service.create_work_order(
+            site_id=site.id,
+            work_order_code=f"wo-roll-{index}",
+            work_order_type="corrective",
+            source_type="manual",
+            asset_id=asset.id,
+        )
+        completed.append(
+            run_to(
+                work_order,
+                "planned",
+                "released",
+                "in_progress",
+                "completed",
+                failure_code="seal-leak",
+                downtime_minutes=45,
+            )
+        )
+
+    (row,) = reliability_service.list_asset_reliability(site_id=site.id)
+    assert row.asset_code == "ROLL-PUMP"
+    assert row.failure_count == 3
+    assert row.failure_mode_count == 1
+    assert row.leading_failure_code == "SEAL-LEAK"
+    assert row.mtbf_hours is not None
+    assert reliability_service.check_failure_rollups() == []
+
+    verified = run_to(completed[0], "verified")
+    assert reliability_service.list_asset_reliability(site_id=site.id)[0].failure_count == 3
+
+    reopened = run_to(verified, "in_progress")
+    assert reopened.actual_end is None
+    assert reliability_service.list_asset_reliability(site_id=site.id)[0].failure_count == 2
+    assert reliability_service.check_failure_rollups() == []
+
+    run_to(reopened, "completed")
+    run_to(completed[1], "in_progress")
+    run_to(completed[2], "in_progress")
+    (row,) = reliability_service.list_asset_reliability(site_id=site.id)
+    assert row.failure_count == 1
+    assert row.mtbf_hours is None
+    assert reliability_service.check_failure_rollups() == []
+
+
+def test_downtime_events_keep_failure_rollups_in_step(services, session):
+    _seed_failure_history(services, session, count=80)
+    reliability_service = services["maintenance_reliability_service"]
+    downtime_service = services["maintenance_downtime_event_service"]
+    reliability_service.rebuild_failure_rollups()
+
+    # Without an actual start and end the booked downtime is the repair time.
+    repairs = [
+        row
+        for row in services["maintenance_work_order_service"].list_work_orders()
+        if row.status in FAILURE_COMPLETED_STATUSES and row.asset_id and row.failure_code and row.actual_end is None
+    ]
+    assert repairs
+    started_at = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(days=2)
+    for work_order in repairs[:3]:
+        event = downtime_service.create_downtime_event(
+            work_order_id=work_order.id,
+            started_at=started_at,
+            ended_at=started_at + timedelta(minutes=95),
+            downtime_type="unplanned",
+        )
+        assert reliability_service.check_failure_rollups() == []
+        downtime_service.update_downtime_event(
+            event.id,
+            ended_at=started_at + timedelta(minutes=20),
+            expected_version=event.version,
+        )
+        assert reliability_service.check_failure_rollups() == []
+
+
+def test_failure_rollup_rebuild_backfills_and_matches_work_orders(services, session):
+    site, system, assets = _seed_failure_history(services, session, count=240)
+    service = services["maintenance_reliability_service"]
+    fallback = _rollup_fallback(service)
+
+    # Seeded straight through the repositories, so nothing is rolled up yet.
+    drift = service.check_failure_rollups()
+    assert drift
+    assert all(row.stored is None for row in drift)
+
+    written = service.rebuild_failure_rollups()
+    assert written == len(drift)
+    assert service.check_failure_rollups() == []
+
+    for filters in (
+        {},
+        {"site_id": site.id},
+        {"asset_id": assets[0].id},
+        {"asset_category": "PUMP"},
+        {"failure_code": "seal-leak"},
+    ):
+        assert service.list_asset_reliability(**filters) == fallback.list_asset_reliability(**filters), filters
+    assert {row.asset_id for row in service.list_asset_reliability()} <= {asset.id for asset in assets}
+
+
+def test_asset_reliability_rollup_benchmark(services, session):
+    skip_unless_perf_tests()
+
+    _seed_failure_history(services, session, count=20_000)
+    service = services["maintenance_reliability_service"]
+    fallback = _rollup_fallback(service)
+    started = perf_counter()
+    service.rebuild_failure_rollups()
+    rebuild_ms = (perf_counter() - started) * 1000.0
+
+    started = perf_counter()
+    rows = service.list_asset_reliability()
+    rollup_ms = (perf_counter() - started) * 1000.0
+    started = perf_counter()
+    expected = fallback.list_asset_reliability()
+    python_ms = (perf_counter() - started) * 1000.0
+    print(
+        "Asset reliability over 20000 work orders: "
+        f"rebuild_ms={rebuild_ms:.1f} rollup_ms={rollup_ms:.1f} python_ms={python_ms:.1f}"
+    )
+
+    assert rows == expected
+    assert rollup_ms < python_ms
@@ -127,6 +127,7 @@ class _PreventivePlanRepo(MaintenancePreventivePlanRepository):
         plan_type=None,
         trigger_mode=None,
         sensor_id=None,
+        sensor_ids=None,
     ):
         rows = [row for row in self._rows.values() if row.organization_id == organization_id]
         if active_only is not None:
@@ -147,6 +148,8 @@ class _PreventivePlanRepo(MaintenancePreventivePlanRepository):
             rows = [row for row in rows if row.trigger_mode == trigger_mode]
         if sensor_id is not None:
             rows = [row for row in rows if row.sensor_id == sensor_id]
+        if sensor_ids is not None:
+            rows = [row for row in rows if row.sensor_id in set(sensor_ids)]
         return rows
 
 
@@ -164,12 +167,14 @@ class _PreventivePlanTaskRepo(MaintenancePreventivePlanTaskRepository):
     def get(self, preventive_plan_task_id: str):
         return self._rows.get(preventive_plan_task_id)
 
-    def list_for_organization(self, organization_id: str, *, plan_id=None, task_template_id=None):
+    def list_for_organization(self, organization_id: str, *, plan_id=None, task_template_id=None, sensor_ids=None):
         rows = [row for row in self._rows.values() if row.organization_id == organization_id]
         if plan_id is not None:
             rows = [row for row in rows if row.plan_id == plan_id]
         if task_template_id is not None:
             rows = [row for row in rows if row.task_template_id == task_template_id]
+        if sensor_ids is not None:
+            rows = [row for row in rows if row.sensor_id_override in set(sensor_ids)]
         return rows
 
 
@@ -1,7 +1,24 @@
 from __future__ import annotations
 
+import copy
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from time import perf_counter
+
+import pytest
+
+from src.core.modules.maintenance.api.desktop import build_maintenance_preventive_desktop_api
+from src.core.modules.maintenance.application.preventive.utils.date_utils import resolve_as_of
+from src.core.modules.maintenance.domain import (
+    MaintenancePreventivePlan,
+    MaintenanceWorkOrder,
+    MaintenanceWorkRequest,
+)
+from src.core.modules.maintenance.infrastructure.persistence.mappers import maintenance_preventive_plan_to_orm
+from src.core.modules.maintenance.infrastructure.persistence.orm.models import MaintenancePreventivePlanORM
+from src.core.platform.common.exceptions import ConcurrencyError, ValidationError
+from src.tests.perf_flags import skip_unless_perf_tests
 
 
 def test_preventive_generation_creates_work_order_and_copies_templates(services):
@@ -359,3 +376,394 @@ def test_preventive_request_conversion_completion_updates_preventive_instance(se
     assert matching_rows[0].instance_status == "COMPLETED"
     assert matching_rows[0].completed_at is not None
 
+
+
+def _batch_site(services, code: str):
+    site = services["site_service"].create_site(site_code=f"MNT-{code}", name=f"{code.title()} Plant")
+    location = services["maintenance_location_service"].create_location(
+        site_id=site.id,
+        location_code=f"{code.lower()}-area",
+        name=f"{code.title()} Area",
+    )
+    asset = services["maintenance_asset_service"].create_asset(
+        site_id=site.id,
+        location_id=location.id,
+        asset_code=f"{code.lower()}-asset",
+        name=f"{code.title()} Asset",
+    )
+    sensor = services["maintenance_sensor_service"].create_sensor(
+        site_id=site.id,
+        sensor_code=f"{code.lower()}-hours",
+        sensor_name="Run Hours",
+        asset_id=asset.id,
+        sensor_type="RUN_HOURS",
+        unit="H",
+        current_value="300",
+        last_read_at=datetime.now(timezone.utc),
+        last_quality_state="VALID",
+    )
+    task_template = services["maintenance_task_template_service"].create_task_template(
+        task_template_code=f"{code.lower()}-task",
+        name="Inspect guards",
+        maintenance_type="preventive",
+        template_status="active",
+    )
+    plan_service = services["maintenance_preventive_plan_service"]
+    now = datetime.now(timezone.utc)
+    calendar = {
+        "asset_id": asset.id,
+        "status": "active",
+        "plan_type": "preventive",
+        "trigger_mode": "calendar",
+        "calendar_frequency_unit": "monthly",
+        "calendar_frequency_value": 1,
+    }
+    plans = {
+        "request": plan_service.create_preventive_plan(
+            site_id=site.id, plan_code=f"{code}-wr", name="Overdue request", next_due_at=now - timedelta(days=2),
+            auto_generate_work_order=False, **calendar,
+        ),
+        "order": plan_service.create_preventive_plan(
+            site_id=site.id, plan_code=f"{code}-wo", name="Overdue order", next_due_at=now - timedelta(days=1),
+            auto_generate_work_order=True, **calendar,
+        ),
+        "future": plan_service.create_preventive_plan(
+            site_id=site.id, plan_code=f"{code}-later", name="Not yet due", next_due_at=now + timedelta(days=40),
+            auto_generate_work_order=True, **calendar,
+        ),
+        "sensor": plan_service.create_preventive_plan(
+            site_id=site.id, plan_code=f"{code}-meter", name="Meter plan", asset_id=asset.id, status="active",
+            plan_type="preventive", trigger_mode="sensor", sensor_id=sensor.id, sensor_threshold="250",
+            sensor_direction="greater_or_equal", auto_generate_work_order=True,
+        ),
+        "package": plan_service.create_preventive_plan(
+            site_id=site.id, plan_code=f"{code}-pkg", name="Packaged order", next_due_at=now - timedelta(days=3),
+            auto_generate_work_order=True, **calendar,
+        ),
+    }
+    services["maintenance_preventive_plan_task_service"].create_plan_task(
+        plan_id=plans["package"].id,
+        task_template_id=task_template.id,
+        sequence_no=1,
+        trigger_scope="inherit_plan",
+    )
+    return site, plans
+
+
+def _generation_outcome(services, plans):
+    service = services["maintenance_preventive_generation_service"]
+    plan_service = services["maintenance_preventive_plan_service"]
+    outcome = {}
+    for key, plan in plans.items():
+        refreshed = plan_service.get_preventive_plan(plan.id)
+        instances = service._scheduler.list_instances(refreshed)
+        # Each site's plans start from their own "now"; compare offsets.
+        start = plan.next_due_at or datetime.now(timezone.utc)
+        outcome[key] = (
+            refreshed.last_generated_at is not None,
+            resolve_as_of(refreshed.next_due_at) - start if refreshed.next_due_at else None,
+            refreshed.next_due_counter,
+            sorted((row.due_at - start, row.status.value) for row in instances),
+        )
+    return outcome
+
+
+def test_batched_generation_matches_per_plan_generation(services):
+    service = services["maintenance_preventive_generation_service"]
+    batch_site, batch_plans = _batch_site(services, "BATCHA")
+    loop_site, loop_plans = _batch_site(services, "BATCHB")
+    as_of = datetime.now(timezone.utc)
+    chunks = []
+
+    report = service.generate_due_work_in_batches(
+        as_of=as_of, site_id=batch_site.id, chunk_size=2, on_chunk=chunks.append
+    )
+    per_plan = copy.copy(service)
+    per_plan._generation_repo = None
+    fallback = per_plan.generate_due_work_in_batches(as_of=as_of, site_id=loop_site.id, chunk_size=2)
+
+    assert [chunk.plan_count for chunk in chunks] == [2, 2, 1]
+    assert list(report.chunks) == chunks
+    assert report.resume_after_plan_id == max(plan.id for plan in batch_plans.values())
+    assert report.generated_count == fallback.generated_count == 4
+    by_plan = {row.plan_id: row for row in report.results}
+    assert by_plan[batch_plans["request"].id].generated_work_request_id is not None
+    assert by_plan[batch_plans["order"].id].generated_work_order_id is not None
+    assert by_plan[batch_plans["sensor"].id].generated_work_order_id is not None
+    assert by_plan[batch_plans["future"].id].skipped_reason
+    assert len(by_plan[batch_plans["package"].id].generated_task_ids) == 1
+
+    batch_outcome = _generation_outcome(services, batch_plans)
+    loop_outcome = _generation_outcome(services, loop_plans)
+    for key in batch_plans:
+        generated, next_due_at, next_due_counter, instances = batch_outcome[key]
+        assert generated == loop_outcome[key][0]
+        assert next_due_counter == loop_outcome[key][2]
+        assert [status for _due_at, status in instances] == [status for _due_at, status in loop_outcome[key][3]]
+        if key != "sensor":
+            # The sensor plan's next due date is taken from the wall clock.
+            assert next_due_at == loop_outcome[key][1]
+            assert [due_at for due_at, _status in instances] == [due_at for due_at, _status in loop_outcome[key][3]]
+    assert [status for _due_at, status in batch_outcome["order"][3]].count("GENERATED") == 1
+    assert sum(status == "PLANNED" for _due_at, status in batch_outcome["order"][3]) == 13
+
+    request = services["maintenance_work_request_service"].get_work_request(
+        by_plan[batch_plans["request"].id].generated_work_request_id
+    )
+    work_order = services["maintenance_work_order_service"].get_work_order(
+        by_plan[batch_plans["order"].id].generated_work_order_id
+    )
+    assert request.source_id == batch_plans["request"].id
+    assert work_order.source_type == "PREVENTIVE_PLAN"
+    assert work_order.is_preventive is True
+    assert (
+        service._preventive_plan_instance_repo.get_by_generated_work_order_id(
+            work_order.organization_id, work_order.id
+        ).status.value
+        == "GENERATED"
+    )
+
+    rerun = service.generate_due_work_in_batches(as_of=as_of, site_id=batch_site.id)
+    assert rerun.generated_count == 0
+
+
+def test_batched_generation_validates_and_records_work_orders_like_create_work_order(services):
+    service = services["maintenance_preventive_generation_service"]
+    work_order_service = services["maintenance_work_order_service"]
+    site, plans = _batch_site(services, "BATCHV")
+    asset_id = plans["order"].asset_id
+    component = services["maintenance_asset_component_service"].create_component(
+        asset_id=asset_id,
+        component_code="batchv-bearing",
+        name="Drive bearing",
+    )
+    component_plan = services["maintenance_preventive_plan_service"].create_preventive_plan(
+        site_id=site.id,
+        plan_code="BATCHV-cmp",
+        name="Component order",
+        component_id=component.id,
+        status="active",
+        plan_type="preventive",
+        trigger_mode="calendar",
+        calendar_frequency_unit="monthly",
+        calendar_frequency_value=1,
+        next_due_at=datetime.now(timezone.utc) - timedelta(days=1),
+        auto_generate_work_order=True,
+    )
+
+    report = service.generate_due_work_in_batches(site_id=site.id)
+
+    by_plan = {row.plan_id: row for row in report.results}
+    generated = work_order_service.get_work_order(by_plan[component_plan.id].generated_work_order_id)
+    assert generated.component_id == component.id
+    assert generated.asset_id == asset_id
+    created = services["activity_service"].list_recent(
+        entity_type="maintenance_work_order",
+        entity_id=generated.id,
+        action_prefix="maintenance_work_order.create",
+    )
+    assert len(created) == 1
+
+    def draft(code: str, **references) -> MaintenanceWorkOrder:
+        return MaintenanceWorkOrder.create(
+            organization_id=generated.organization_id,
+            site_id=site.id,
+            work_order_code=code,
+            work_order_type="PREVENTIVE",
+            source_type="PREVENTIVE_PLAN",
+            **references,
+        )
+
+    with pytest.raises(ValidationError) as existing:
+        work_order_service.prepare_new_work_orders([draft(generated.work_order_code)])
+    assert existing.value.code == "MAINTENANCE_WORK_ORDER_CODE_EXISTS"
+    with pytest.raises(ValidationError) as repeated:
+        work_order_service.prepare_new_work_orders([draft("BATCHV-NEW"), draft("BATCHV-NEW")])
+    assert repeated.value.code == "MAINTENANCE_WORK_ORDER_CODE_EXISTS"
+    other_site, _ = _batch_site(services, "BATCHW")
+    with pytest.raises(ValidationError) as mismatch:
+        work_order_service.prepare_new_work_orders(
+            [replace(draft("BATCHV-OTHER", component_id=component.id), site_id=other_site.id)]
+        )
+    assert mismatch.value.code == "MAINTENANCE_WORK_ORDER_SITE_MISMATCH"
+
+
+def test_batched_generation_validates_and_records_work_requests_like_create_work_request(services):
+    service = services["maintenance_preventive_generation_service"]
+    work_request_service = services["maintenance_work_request_service"]
+    site, plans = _batch_site(services, "BATCHR")
+    asset_id = plans["request"].asset_id
+    component = services["maintenance_asset_component_service"].create_component(
+        asset_id=asset_id,
+        component_code="batchr-seal",
+        name="Shaft seal",
+    )
+    component_plan = services["maintenance_preventive_plan_service"].create_preventive_plan(
+        site_id=site.id,
+        plan_code="BATCHR-cmp",
+        name="Component request",
+        component_id=component.id,
+        status="active",
+        plan_type="preventive",
+        trigger_mode="calendar",
+        calendar_frequency_unit="monthly",
+        calendar_frequency_value=1,
+        next_due_at=datetime.now(timezone.utc) - timedelta(days=1),
+        auto_generate_work_order=False,
+    )
+
+    report = service.generate_due_work_in_batches(site_id=site.id)
+
+    by_plan = {row.plan_id: row for row in report.results}
+    for plan in (plans["request"], component_plan):
+        generated = work_request_service.get_work_request(by_plan[plan.id].generated_work_request_id)
+        created = services["activity_service"].list_recent(
+            entity_type="maintenance_work_request",
+            entity_id=generated.id,
+            action_prefix="maintenance_work_request.create",
+        )
+        assert len(created) == 1
+    assert generated.component_id == component.id
+    assert generated.asset_id == asset_id
+
+    def draft(code: str, source_id: str | None = component_plan.id, **references) -> MaintenanceWorkRequest:
+        return MaintenanceWorkRequest.create(
+            organization_id=generated.organization_id,
+            site_id=site.id,
+            work_request_code=code,
+            request_type="PREVENTIVE",
+            source_type="PREVENTIVE_PLAN",
+            source_id=source_id,
+            **references,
+        )
+
+    with pytest.raises(ValidationError) as existing:
+        work_request_service.prepare_new_work_requests([draft(generated.work_request_code)])
+    assert existing.value.code == "MAINTENANCE_WORK_REQUEST_CODE_EXISTS"
+    with pytest.raises(ValidationError) as repeated:
+        work_request_service.prepare_new_work_requests([draft("BATCHR-NEW"), draft("BATCHR-NEW")])
+    assert repeated.value.code == "MAINTENANCE_WORK_REQUEST_CODE_EXISTS"
+    with pytest.raises(ValidationError) as sourceless:
+        work_request_service.prepare_new_work_requests([draft("BATCHR-NOSRC", source_id=None)])
+    assert sourceless.value.code == "MAINTENANCE_WORK_REQUEST_SOURCE_REQUIRED"
+    other_site, _ = _batch_site(services, "BATCHS")
+    with pytest.raises(ValidationError) as mismatch:
+        work_request_service.prepare_new_work_requests(
+            [replace(draft("BATCHR-OTHER", component_id=component.id), site_id=other_site.id)]
+        )
+    assert mismatch.value.code == "MAINTENANCE_WORK_REQUEST_SITE_MISMATCH"
+
+
+def test_preventive_desktop_api_generates_all_due_work_in_batches(services, monkeypatch):
+    service = services["maintenance_preventive_generation_service"]
+    site, plans = _batch_site(services, "BATCHD")
+    api = build_maintenance_preventive_desktop_api(
+        site_service=services["site_service"],
+        asset_service=services["maintenance_asset_service"],
+        component_service=services["maintenance_asset_component_service"],
+        system_service=services["maintenance_system_service"],
+        sensor_service=services["maintenance_sensor_service"],
+        task_template_service=services["maintenance_task_template_service"],
+        task_step_template_service=services["maintenance_task_step_template_service"],
+        preventive_plan_service=services["maintenance_preventive_plan_service"],
+        preventive_plan_task_service=services["maintenance_preventive_plan_task_service"],
+        preventive_generation_service=service,
+    )
+
+    def per_plan_generation(**_kwargs):
+        raise AssertionError("generate all must run through the batched path")
+
+    monkeypatch.setattr(service, "generate_due_work", per_plan_generation)
+    rows = api.generate_all_due_work(site_id=site.id)
+
+    assert sorted(row.plan_code for row in rows) == sorted(
+        plans[key].plan_code for key in ("request", "order", "sensor", "package")
+    )
+    assert all(not row.skipped_reason for row in rows)
+
+
+def test_batched_generation_resumes_after_failed_chunk(services):
+    service = services["maintenance_preventive_generation_service"]
+    site, plans = _batch_site(services, "BATCHC")
+    ordered = sorted(plans.values(), key=lambda row: row.id)
+    # The last of the plans written through the bulk path, so at least one
+    # chunk commits before it.
+    edited = max((plans[key] for key in ("request", "order", "sensor")), key=lambda row: row.id)
+    plan_service = services["maintenance_preventive_plan_service"]
+    as_of = datetime.now(timezone.utc)
+    committed = []
+
+    def edit_plan_mid_run(chunk):
+        committed.append(chunk)
+        if len(committed) == 1:
+            latest = plan_service.get_preventive_plan(edited.id)
+            plan_service.update_preventive_plan(latest.id, notes="Edited mid-run", expected_version=latest.version)
+
+    with pytest.raises(ConcurrencyError):
+        service.generate_due_work_in_batches(
+            as_of=as_of, site_id=site.id, chunk_size=1, on_chunk=edit_plan_mid_run
+        )
+
+    failed_index = ordered.index(edited)
+    assert [chunk.last_plan_id for chunk in committed] == [row.id for row in ordered[:failed_index]]
+    assert plan_service.get_preventive_plan(edited.id).last_generated_at is None
+
+    resumed = service.generate_due_work_in_batches(
+        as_of=as_of, site_id=site.id, resume_after_plan_id=committed[-1].last_plan_id
+    )
+
+    assert [row.plan_id for row in resumed.results] == [row.id for row in ordered[failed_index:]]
+    assert plan_service.get_preventive_plan(edited.id).last_generated_at is not None
+    assert sum(chunk.generated_count for chunk in committed) + resumed.generated_count == 4
+
+
+def test_batched_generation_benchmark_against_per_plan_loop(services, session):
+    skip_unless_perf_tests()
+
+    service = services["maintenance_preventive_generation_service"]
+    plan_count = 2000
+    sites = {}
+    for code in ("BENCHA", "BENCHB"):
+        site, plans = _batch_site(services, code)
+        template = plans["order"]
+        tenant_id = session.get(MaintenancePreventivePlanORM, template.id).tenant_id
+        due = datetime.now(timezone.utc) - timedelta(days=1)
+        rows = []
+        for index in range(plan_count):
+            plan = MaintenancePreventivePlan.create(
+                organization_id=template.organization_id,
+                site_id=site.id,
+                plan_code=f"{code}-{index:05d}",
+                name=f"Bench plan {index}",
+                asset_id=template.asset_id,
+                status="active",
+                trigger_mode="calendar",
+                calendar_frequency_unit="monthly",
+                calendar_frequency_value=1,
+                # Half are overdue, half a month out; alternate targets.
+                next_due_at=due if index % 2 == 0 else due + timedelta(days=30),
+                auto_generate_work_order=index % 4 == 0,
+            )
+            orm = maintenance_preventive_plan_to_orm(plan)
+            orm.tenant_id = tenant_id
+            rows.append(orm)
+        session.add_all(rows)
+        session.commit()
+        sites[code] = site
+
+    as_of = datetime.now(timezone.utc)
+    started = perf_counter()
+    batched = service.generate_due_work_in_batches(as_of=as_of, site_id=sites["BENCHA"].id)
+    batch_ms = (perf_counter() - started) * 1000.0
+    per_plan = copy.copy(service)
+    per_plan._generation_repo = None
+    started = perf_counter()
+    looped = per_plan.generate_due_work_in_batches(as_of=as_of, site_id=sites["BENCHB"].id)
+    loop_ms = (perf_counter() - started) * 1000.0
+    print(
+        f"Preventive generation over {plan_count + 5} plans: batch_ms={batch_ms:.1f} "
+        f"per_plan_ms={loop_ms:.1f} chunks={len(batched.chunks)} generated={batched.generated_count}"
+    )
+
+    assert batched.generated_count == looped.generated_count == plan_count // 2 + 4
+    assert batch_ms < loop_ms
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
 from calendar import monthrange
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from src.core.modules.maintenance.application.preventive.schedulers import (
+    PreventiveBlackoutCalendar,
+    PreventiveInstanceScheduler,
+)
+from src.core.modules.maintenance.domain import MaintenanceBlackoutWindow, MaintenancePreventivePlan
+from src.core.platform.common.exceptions import ValidationError
 
 
 def _add_months(anchor: datetime, months: int) -> datetime:
@@ -184,6 +193,38 @@ def test_floating_preventive_schedule_recalculates_future_instances_from_complet
     ]
 
 
+def test_completed_preventive_work_order_cannot_be_reopened(services):
+    plan, first_due = _build_calendar_plan(services, plan_code="SCH-350", schedule_policy="floating")
+    generation_service = services["maintenance_preventive_generation_service"]
+    generation_service.refresh_schedule(plan_id=plan.id, as_of=first_due)
+    generation = generation_service.generate_due_work(plan_id=plan.id, as_of=first_due)[0]
+    completed = _complete_generated_work_order(services, generation.generated_work_order_id)
+    completed_plan = services["maintenance_preventive_plan_service"].find_preventive_plan_by_code("SCH-350")
+
+    def planned_ids() -> list[str]:
+        return [
+            row.id for row in generation_service.list_plan_instances(plan_id=plan.id) if row.status.value == "PLANNED"
+        ]
+
+    planned_before = planned_ids()
+
+    with pytest.raises(ValidationError) as exc_info:
+        services["maintenance_work_order_service"].update_work_order(
+            completed.id,
+            status="IN_PROGRESS",
+            expected_version=completed.version,
+        )
+
+    assert exc_info.value.code == "MAINTENANCE_WORK_ORDER_PREVENTIVE_REOPEN"
+    reloaded = services["maintenance_preventive_plan_service"].find_preventive_plan_by_code("SCH-350")
+    assert (reloaded.last_completed_at, reloaded.next_due_at) == (
+        completed_plan.last_completed_at,
+        completed_plan.next_due_at,
+    )
+    assert planned_ids() == planned_before
+    assert services["maintenance_work_order_service"].get_work_order(completed.id).status.value == "COMPLETED"
+
+
 def test_preventive_schedule_enters_due_state_when_generation_lead_window_opens(services):
     plan, first_due = _build_calendar_plan(
         services,
@@ -257,3 +298,78 @@ def test_preventive_forecast_preview_exposes_generation_window_and_regeneration_
     assert preview[0].planner_state == "READY_WINDOW"
     assert preview[1].planner_state == "UPCOMING"
 
+
+def _blackout(start: str, end: str, *, recurrence: str = "NONE", is_active: bool = True) -> MaintenanceBlackoutWindow:
+    window = MaintenanceBlackoutWindow.create(
+        organization_id="org-1",
+        preventive_plan_id="plan-1",
+        name=f"Blackout {start}",
+        start_date=start,
+        end_date=end,
+        recurrence=recurrence,
+    )
+    window.is_active = is_active
+    return window
+
+
+def test_blackout_calendar_merges_windows_and_agrees_with_window_covers():
+    windows = [
+        _blackout("2026-03-01", "2026-03-10"),
+        _blackout("2026-03-05", "2026-03-20"),
+        _blackout("2026-03-21", "2026-03-25"),
+        _blackout("2026-06-01", "2026-06-30", is_active=False),
+        _blackout("2025-12-20", "2026-01-05", recurrence="annual"),
+        _blackout("2024-02-29", "2024-03-02", recurrence="annual"),
+    ]
+    blackouts = PreventiveBlackoutCalendar(windows)
+
+    # Overlapping and back-to-back windows end together.
+    assert blackouts.blackout_end(date(2026, 3, 2)) == date(2026, 3, 25)
+    assert blackouts.blackout_end(date(2026, 3, 26)) is None
+    assert blackouts.blackout_end(date(2026, 6, 15)) is None
+    # Annual windows wrap over New Year and clamp 29 February.
+    assert blackouts.blackout_end(date(2028, 1, 3)) == date(2028, 1, 5)
+    assert blackouts.blackout_end(date(2027, 12, 24)) == date(2028, 1, 5)
+    assert blackouts.blackout_end(date(2027, 2, 28)) == date(2027, 3, 2)
+    assert not PreventiveBlackoutCalendar()
+
+    day = date(2025, 1, 1)
+    while day < date(2029, 1, 1):
+        assert blackouts.covers(day) == any(window.covers(day) for window in windows), day
+        day += timedelta(days=1)
+
+
+def test_planned_due_dates_roll_past_blackouts_on_the_plan_cadence():
+    plan = MaintenancePreventivePlan.create(
+        organization_id="org-1",
+        site_id="site-1",
+        plan_code="BLK-100",
+        name="Blackout plan",
+        status="active",
+        trigger_mode="calendar",
+        calendar_frequency_unit="weekly",
+        calendar_frequency_value=1,
+        generation_horizon_count=6,
+        next_due_at=datetime(2026, 12, 1, 8, 0, tzinfo=timezone.utc),
+    )
+    scheduler = PreventiveInstanceScheduler(None, instance_repo=None, plan_repo=None)
+    blackouts = PreventiveBlackoutCalendar(
+        [
+            _blackout("2025-12-14", "2026-01-05", recurrence="annual"),
+            _blackout("2027-01-06", "2027-01-07"),
+        ]
+    )
+
+    due_dates = scheduler.build_planned_due_dates(plan, plan.next_due_at, blackouts=blackouts)
+
+    assert [value.date() for value in due_dates] == [
+        date(2026, 12, 1),
+        date(2026, 12, 8),
+        date(2027, 1, 12),
+        date(2027, 1, 19),
+        date(2027, 1, 26),
+        date(2027, 2, 2),
+    ]
+    assert scheduler.build_planned_due_dates(plan, plan.next_due_at) == [
+        datetime(2026, 12, 1, 8, 0, tzinfo=timezone.utc) + timedelta(weeks=week) for week in range(6)
+    ]
@@ -168,6 +168,12 @@ class _WorkOrderRepo(MaintenanceWorkOrderRepository):
                 return row
         return None
 
+    def list_by_ids(self, organization_id: str, work_order_ids):
+        return [row for row in self._rows.values() if row.organization_id == organization_id and row.id in work_order_ids]
+
+    def list_by_codes(self, organization_id: str, work_order_codes):
+        return [row for row in self._rows.values() if row.organization_id == organization_id and row.work_order_code in work_order_codes]
+
     def list_for_organization(
         self,
         organization_id: str,
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
-from src.core.modules.maintenance.domain import MaintenanceAsset, MaintenanceLocation, MaintenanceSensor, MaintenanceSensorReading
+from src.core.modules.maintenance.domain import (
+    MaintenanceAsset,
+    MaintenanceLocation,
+    MaintenanceSensor,
+    MaintenanceSensorReading,
+    MaintenanceSensorRollupGrain,
+)
+from src.core.modules.maintenance.domain.reliability import rollup_sensor_readings, sensor_rollup_grain_for
 from src.core.modules.maintenance.contracts.repositories import MaintenanceSensorReadingRepository, MaintenanceSensorRepository
 from src.core.modules.maintenance import MaintenanceSensorReadingService, MaintenanceSensorService
 from src.core.platform.domain.master_data.org import Organization
@@ -76,6 +84,10 @@ class _SensorReadingRepo(MaintenanceSensorReadingRepository):
     def add(self, sensor_reading: MaintenanceSensorReading) -> None:
         self._rows[sensor_reading.id] = sensor_reading
 
+    def add_many(self, sensor_readings: list[MaintenanceSensorReading]) -> None:
+        for sensor_reading in sensor_readings:
+            self.add(sensor_reading)
+
     def get(self, sensor_reading_id: str):
         return self._rows.get(sensor_reading_id)
 
@@ -102,6 +114,18 @@ class _SensorReadingRepo(MaintenanceSensorReadingRepository):
             rows = [row for row in rows if row.reading_timestamp <= reading_to]
         return sorted(rows, key=lambda row: row.reading_timestamp, reverse=True)
 
+    def delete_before(self, organization_id: str, cutoff, *, sensor_id=None) -> int:
+        doomed = [
+            row.id
+            for row in self._rows.values()
+            if row.organization_id == organization_id
+            and row.reading_timestamp < cutoff
+            and (sensor_id is None or row.sensor_id == sensor_id)
+        ]
+        for row_id in doomed:
+            del self._rows[row_id]
+        return len(doomed)
+
 
 def test_maintenance_sensor_service_creates_asset_anchored_sensors(session) -> None:
     organization = Organization.create("ORG", "Org")
@@ -211,3 +235,48 @@ def test_maintenance_sensor_reading_service_updates_sensor_snapshot(session) ->
     assert refreshed_sensor.last_read_at == reading.reading_timestamp
     assert rows[0].id == reading.id
 
+
+
+def test_sensor_rollups_aggregate_valid_readings_per_bucket() -> None:
+    started = datetime(2026, 5, 4, 10, 59, 30, tzinfo=timezone.utc)
+    readings = [
+        MaintenanceSensorReading.create(
+            organization_id="org",
+            sensor_id="sensor",
+            reading_value=value,
+            reading_unit="C",
+            reading_timestamp=started + timedelta(seconds=offset),
+            quality_state=quality,
+        )
+        for value, offset, quality in (
+            ("10", 0, "VALID"),
+            ("14", 20, "ESTIMATED"),
+            ("99", 25, "ERROR"),
+            ("12", 40, "VALID"),
+        )
+    ]
+
+    rollups = {
+        (rollup.grain, rollup.bucket_start): rollup
+        for rollup in rollup_sensor_readings(readings)
+    }
+    hour = rollups[(MaintenanceSensorRollupGrain.HOUR, started.replace(minute=0, second=0))]
+    first_minute = rollups[(MaintenanceSensorRollupGrain.MINUTE, started.replace(second=0))]
+
+    assert len(rollups) == 5
+    assert (hour.reading_count, hour.min_value, hour.max_value, hour.last_value) == (
+        2,
+        Decimal("10"),
+        Decimal("14"),
+        Decimal("14"),
+    )
+    assert first_minute.reading_count == 2
+    assert first_minute.avg_value == Decimal("12")
+    assert first_minute.last_value == Decimal("14")
+    assert rollups[(MaintenanceSensorRollupGrain.DAY, started.replace(hour=0, minute=0, second=0))].reading_count == 3
+    assert sensor_rollup_grain_for(timedelta(seconds=30)) is None
+    assert sensor_rollup_grain_for(timedelta(minutes=1)) == MaintenanceSensorRollupGrain.MINUTE
+    assert sensor_rollup_grain_for(timedelta(minutes=59)) == MaintenanceSensorRollupGrain.HOUR
+    assert sensor_rollup_grain_for(timedelta(hours=1)) == MaintenanceSensorRollupGrain.HOUR
+    assert sensor_rollup_grain_for(timedelta(hours=9)) == MaintenanceSensorRollupGrain.DAY
+    assert sensor_rollup_grain_for(timedelta(days=2)) == MaintenanceSensorRollupGrain.DAY
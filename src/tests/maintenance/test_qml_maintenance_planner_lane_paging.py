@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from src.ui_qml.modules.maintenance.controllers.planner.planner_workspace_controller import (
+    MaintenancePlannerWorkspaceController,
+)
+from src.ui_qml.modules.maintenance.presenters import MaintenanceWorkspacePresenter
+from src.ui_qml.modules.maintenance.view_models.planner import (
+    MaintenancePlannerLanePageViewModel,
+    MaintenancePlannerOverviewViewModel,
+    MaintenancePlannerWorkOrderRowViewModel,
+    MaintenancePlannerWorkspaceViewModel,
+)
+
+
+def _work_order_row(index: int) -> MaintenancePlannerWorkOrderRowViewModel:
+    return MaintenancePlannerWorkOrderRowViewModel(
+        id=f"wo-{index}",
+        work_order_label=f"WO-{index:03d} - Repair",
+        work_order_type_label="Corrective",
+        status_label="Draft",
+        priority_label="Medium",
+        plan_window_label="Not scheduled",
+    )
+
+
+class _FakePlannerPresenter:
+    def __init__(self) -> None:
+        self.page_calls: list[tuple[str, str, str]] = []
+
+    def build_workspace_state(self, **_filters) -> MaintenancePlannerWorkspaceViewModel:
+        return MaintenancePlannerWorkspaceViewModel(
+            overview=MaintenancePlannerOverviewViewModel(title="Planner", subtitle=""),
+            selected_work_order_queue="BACKLOG",
+            work_order_rows=(_work_order_row(0), _work_order_row(1)),
+            work_order_total=3,
+            work_order_next_token="page-2",
+        )
+
+    def load_lane_page(self, lane: str, *, page_token: str, **filters) -> MaintenancePlannerLanePageViewModel:
+        self.page_calls.append((lane, page_token, filters["work_order_queue"]))
+        return MaintenancePlannerLanePageViewModel(
+            lane=lane,
+            work_order_rows=(_work_order_row(2),),
+            total=3,
+            next_token="",
+        )
+
+
+def test_planner_controller_appends_lane_pages_until_the_token_runs_out() -> None:
+    presenter = _FakePlannerPresenter()
+    controller = MaintenancePlannerWorkspaceController(
+        workspace_presenter=MaintenanceWorkspacePresenter("maintenance_management.planner"),
+        planner_workspace_presenter=presenter,
+    )
+
+    assert [row["id"] for row in controller.workOrderRows] == ["wo-0", "wo-1"]
+    assert controller.workOrderTotal == 3
+    assert controller.canLoadMoreWorkOrders is True
+    assert controller.canLoadMoreRequests is False
+
+    controller.loadMoreLane("work_orders")
+
+    assert presenter.page_calls == [("work_orders", "page-2", "BACKLOG")]
+    assert [row["id"] for row in controller.workOrderRows] == ["wo-0", "wo-1", "wo-2"]
+    assert controller.canLoadMoreWorkOrders is False
+    assert controller.errorMessage == ""
+
+    controller.loadMoreLane("work_orders")
+    controller.loadMoreLane("requests")
+
+    assert len(presenter.page_calls) == 1
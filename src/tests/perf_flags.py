@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+PERF_TESTS_ENV = "PM_RUN_PERF_TESTS"
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def skip_unless_perf_tests() -> None:
+    if not env_flag(PERF_TESTS_ENV, default=False):
+        pytest.skip(f"Set {PERF_TESTS_ENV}=1 to run large-scale performance tests.")
+
+
+__all__ = ["PERF_TESTS_ENV", "env_flag", "skip_unless_perf_tests"]
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import threading
+
+from src.core.platform.common.periodic_worker import PeriodicWorker
+
+
+def test_periodic_worker_repeats_its_job_past_failures_until_stopped() -> None:
+    runs: list[int] = []
+    third_run = threading.Event()
+
+    def job() -> None:
+        runs.append(len(runs))
+        if len(runs) == 3:
+            third_run.set()
+        if len(runs) == 1:
+            raise RuntimeError("transient failure")
+
+    worker = PeriodicWorker(job, interval_seconds=0.01, name="test-periodic-worker")
+    worker.start()
+    assert third_run.wait(5)
+    worker.stop(timeout=5)
+    stopped_at = len(runs)
+
+    assert worker.is_running is False
+    assert stopped_at >= 3
+    assert len(runs) == stopped_at
+
+
+def test_periodic_worker_stopped_during_its_initial_delay_never_runs() -> None:
+    runs: list[int] = []
+    worker = PeriodicWorker(
+        lambda: runs.append(1),
+        interval_seconds=60,
+        initial_delay_seconds=60,
+        name="test-periodic-worker-delayed",
+    )
+
+    worker.start()
+    assert worker.is_running is True
+    worker.stop(timeout=5)
+
+    assert worker.is_running is False
+    assert runs == []
@@ -46,6 +46,7 @@ def test_diagnostics_bundle_includes_metadata(tmp_path):
     with ZipFile(out_path) as bundle:
         names = set(bundle.namelist())
     assert "metadata.json" in names
+    assert "database_profile.json" in names
 
 
 def test_default_manifest_source_uses_env_override(monkeypatch):
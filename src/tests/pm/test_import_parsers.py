@@ -1,10 +1,14 @@
 """Unit tests for MSProjectXmlParser and P6Parser — no DB, no Qt."""
 from __future__ import annotations
 
+import io
 import textwrap
+import tracemalloc
+from time import perf_counter
 
 import pytest
 
+from src.core.modules.project_management.domain.enums import DependencyType
 from src.core.modules.project_management.infrastructure.importers.models.import_models import (
     ImportFieldMapping,
     ImportMappingProfile,
@@ -12,9 +16,20 @@ from src.core.modules.project_management.infrastructure.importers.models.import_
 from src.core.modules.project_management.infrastructure.importers.scheduling.mpp.mpp_parser import (
     MSProjectXmlParser,
 )
+from src.core.modules.project_management.infrastructure.importers.scheduling.mpp import mpp_stream_parser
+from src.core.modules.project_management.infrastructure.importers.scheduling.mpp.mpp_stream_parser import (
+    MSProjectXmlStreamingParser,
+)
 from src.core.modules.project_management.infrastructure.importers.scheduling.primavera.p6_parser import (
     P6Parser,
 )
+from src.core.modules.project_management.infrastructure.importers.scheduling.primavera.p6_stream_parser import (
+    P6StreamingParser,
+)
+from src.core.modules.project_management.infrastructure.importers.services.validation import (
+    ImportValidationService,
+)
+from src.tests.perf_flags import skip_unless_perf_tests
 
 
 # ── MS Project XML ────────────────────────────────────────────────────────────
@@ -155,6 +170,186 @@ class TestMSProjectXmlParserDetectHeaders:
         assert "Name" in headers
 
 
+# ── MS Project XML streaming ──────────────────────────────────────────────────
+
+_MSP_XML_FULL = textwrap.dedent(f"""\
+<?xml version="1.0" encoding="UTF-8"?>
+<Project xmlns="{_MSP_NS}">
+  <Name>Plant Shutdown</Name>
+  <Calendars>
+    <Calendar><UID>1</UID><Name>Standard</Name></Calendar>
+  </Calendars>
+  <Tasks>
+    <Task><UID>0</UID><Name>Project Summary</Name></Task>
+    <Task>
+      <UID>1</UID>
+      <Name>Isolate \u00e9quipement</Name>
+      <Start>2026-06-01T08:00:00</Start>
+      <ExtendedAttribute><FieldID>188743731</FieldID><Value>A</Value></ExtendedAttribute>
+    </Task>
+    <Task>
+      <UID>2</UID>
+      <Name>Inspect</Name>
+      <PredecessorLink><PredecessorUID>1</PredecessorUID><Type>1</Type><LinkLag>4800</LinkLag></PredecessorLink>
+      <PredecessorLink><PredecessorUID>3</PredecessorUID><Type></Type></PredecessorLink>
+    </Task>
+    <Task><UID>3</UID><Name>Restore</Name><Notes>  Sign-off required  </Notes></Task>
+    <Task><UID>4</UID><Name>Removed</Name><IsNull>1</IsNull></Task>
+  </Tasks>
+  <Resources>
+    <Resource><UID>1</UID><Name>Fitter</Name></Resource>
+  </Resources>
+  <Assignments>
+    <Assignment><UID>7</UID><TaskUID>1</TaskUID><ResourceUID>1</ResourceUID><Units>1</Units></Assignment>
+  </Assignments>
+</Project>
+""")
+
+_MSP_FIXTURES = {
+    "basic": _MSP_XML,
+    "full": _MSP_XML_FULL,
+    "empty_tasks": f'<Project xmlns="{_MSP_NS}"><Tasks></Tasks></Project>',
+    "no_namespace": "<Project><Tasks><Task><UID>1</UID><Name>A</Name></Task></Tasks></Project>",
+}
+
+
+def _msp_row_tuples(rows):
+    return [(row.row_number, row.source_data, row.mapped_data) for row in rows]
+
+
+class TestMSProjectXmlStreamingParserParity:
+    @pytest.mark.parametrize("fixture", sorted(_MSP_FIXTURES))
+    def test_rows_match_the_fallback_parser(self, fixture, tmp_path):
+        text = _MSP_FIXTURES[fixture]
+        expected = _msp_row_tuples(MSProjectXmlParser().parse(text.encode("utf-8")))
+        path = tmp_path / "export.xml"
+        path.write_bytes(text.encode("utf-8"))
+        streaming = MSProjectXmlStreamingParser(batch_size=2)
+
+        assert _msp_row_tuples(streaming.parse(text.encode("utf-8"))) == expected
+        assert _msp_row_tuples(streaming.parse(text)) == expected
+        assert _msp_row_tuples(streaming.parse(path)) == expected
+        assert streaming.detect_headers(path) == MSProjectXmlParser().detect_headers(text)
+
+    def test_mapping_profile_and_errors_match_the_fallback_parser(self):
+        profile = ImportMappingProfile.create("msp custom", "ms_project_xml")
+        profile.field_mappings.append(ImportFieldMapping(source_field="Name", target_field="name"))
+        profile.field_mappings.append(
+            ImportFieldMapping(source_field="Predecessors", target_field="deps", default_value="")
+        )
+        assert _msp_row_tuples(MSProjectXmlStreamingParser().parse(_MSP_XML_FULL, mapping=profile)) == (
+            _msp_row_tuples(MSProjectXmlParser().parse(_MSP_XML_FULL, mapping=profile))
+        )
+        with pytest.raises(ValueError, match="MS Project XML parse error"):
+            MSProjectXmlStreamingParser().parse(_MSP_INVALID_XML)
+        assert MSProjectXmlStreamingParser().detect_headers(_MSP_INVALID_XML) == (
+            MSProjectXmlParser().detect_headers(_MSP_INVALID_XML)
+        )
+
+    def test_row_batches_are_bounded(self):
+        batches = list(MSProjectXmlStreamingParser(batch_size=2).iter_row_batches(_MSP_XML_FULL))
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert batches[0][1].source_data["Predecessors"] == "1:1:4800;3:0:0"
+
+    def test_element_batches_cover_tasks_resources_and_assignments(self):
+        batches = list(MSProjectXmlStreamingParser(batch_size=2).iter_element_batches(_MSP_XML_FULL))
+        assert [(element, len(records)) for element, records in batches] == [
+            ("Task", 2),
+            ("Task", 1),
+            ("Resource", 1),
+            ("Assignment", 1),
+        ]
+        assert batches[3][1][0] == {"UID": "7", "TaskUID": "1", "ResourceUID": "1", "Units": "1"}
+
+    def test_elements_outside_the_mapped_set_are_cleared_as_they_close(self, monkeypatch):
+        widest = {"collection": 0}
+        iterparse = mpp_stream_parser.ET.iterparse
+
+        def _watching_iterparse(source, events):
+            root = None
+            for event, element in iterparse(source, events=events):
+                if root is None:
+                    root = element
+                for collection in root:
+                    widest["collection"] = max(widest["collection"], len(collection))
+                yield event, element
+
+        class _TrickleReader(io.StringIO):
+            # iterparse builds the tree ahead of its events by whatever one
+            # read returns; small reads keep that look-ahead to an element.
+            def read(self, size=-1):
+                return super().read(32)
+
+        monkeypatch.setattr(mpp_stream_parser.ET, "iterparse", _watching_iterparse)
+        source = _TrickleReader(_MSP_XML_FULL)
+        records = list(mpp_stream_parser.iter_msp_records(source, elements=("Assignment",)))
+
+        assert [record.element for record in records] == ["Assignment"]
+        assert widest["collection"] <= 2
+
+    def test_import_batches_preview_tasks_and_count_other_records(self):
+        parser = MSProjectXmlStreamingParser(batch_size=2)
+        builder = ImportValidationService().preview_builder(sample_size=1)
+        for element, batch in parser.iter_import_batches(_MSP_XML_FULL):
+            if element == "Task":
+                builder.add_rows(batch)
+            else:
+                builder.count_records(element, len(batch))
+        preview = builder.build()
+
+        assert preview.total_rows == 3 and preview.valid_rows == 3
+        assert [row.row_number for row in preview.rows] == [1]
+        assert preview.record_counts == {"Resource": 1, "Assignment": 1}
+
+    def test_large_export_benchmark(self, tmp_path):
+        skip_unless_perf_tests()
+
+        count = 100_000
+        path = tmp_path / "large.xml"
+        with path.open("w", encoding="utf-8") as handle:
+            handle.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<Project xmlns="{_MSP_NS}">\n<Tasks>\n')
+            for index in range(1, count + 1):
+                handle.write(
+                    f"<Task><UID>{index}</UID><ID>{index}</ID><Name>Activity {index}</Name>"
+                    "<Duration>PT16H0M0S</Duration><Start>2026-06-01T08:00:00</Start>"
+                    f"<Finish>2026-06-02T17:00:00</Finish><OutlineNumber>{index}</OutlineNumber>"
+                )
+                if index > 1:
+                    handle.write(
+                        f"<PredecessorLink><PredecessorUID>{index - 1}</PredecessorUID>"
+                        "<Type>1</Type><LinkLag>0</LinkLag></PredecessorLink>"
+                    )
+                handle.write("</Task>\n")
+            handle.write("</Tasks>\n<Assignments>\n")
+            for index in range(1, count + 1):
+                handle.write(
+                    f"<Assignment><UID>{index}</UID><TaskUID>{index}</TaskUID>"
+                    "<ResourceUID>1</ResourceUID></Assignment>\n"
+                )
+            handle.write("</Assignments>\n</Project>\n")
+
+        tracemalloc.start()
+        started = perf_counter()
+        written = {"Task": 0, "Resource": 0, "Assignment": 0}
+        for element, records in MSProjectXmlStreamingParser().iter_element_batches(path):
+            written[element] += len(records)
+        streaming_ms = (perf_counter() - started) * 1000
+        _, streaming_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        started = perf_counter()
+        legacy = len(MSProjectXmlParser().parse(path.read_bytes()))
+        legacy_ms = (perf_counter() - started) * 1000
+        _, legacy_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"MS Project XML {count} tasks ({path.stat().st_size // 1024} KiB): "
+            f"streaming_ms={streaming_ms:.1f} streaming_peak_kib={streaming_peak // 1024} "
+            f"legacy_ms={legacy_ms:.1f} legacy_peak_kib={legacy_peak // 1024}"
+        )
+        assert written["Task"] == written["Assignment"] == legacy == count
+        assert streaming_peak < legacy_peak // 10
+
+
 # ── P6 XER ───────────────────────────────────────────────────────────────────
 
 _P6_XER = textwrap.dedent("""\
@@ -250,3 +445,165 @@ class TestP6ParserDetectHeaders:
     def test_empty_xer_returns_canonical_defaults(self, p6_parser):
         headers = p6_parser.detect_headers("")
         assert "task_id" in headers
+
+
+# ── P6 XER streaming ─────────────────────────────────────────────────────────
+
+_P6_XER_FULL = textwrap.dedent("""\
+ERMHDR\t19.12\t2026-05-27\tProject\tadmin\tadmin\t25\tC
+%T\tCALENDAR
+%F\tclndr_id\tclndr_name\tday_hr_cnt
+%R\tCAL-1\tStandard\t8
+%E
+%T\tTASK
+%F\ttask_id\tproj_id\ttask_code\ttask_name\tstart_date
+%R\tT1\tP1\tA1\tSurvey\t2026-06-01 08:00
+%R\tT2\tP1\tA2\tCaf\xe9 fit-out
+%R\tT3\tP1\tA3\tHandover\t2026-06-20 08:00
+%E
+%T\tTASKRSRC
+%F\ttaskrsrc_id\ttask_id\trsrc_id\ttarget_qty
+%R\tTR1\tT1\tR1\t16
+%E
+%T\tTASKPRED
+%F\ttask_pred_id\ttask_id\tpred_task_id\tpred_type\tlag_hr_cnt
+%R\tTP1\tT2\tT1\tPR_FS\t0
+%R\tTP2\tT3\tT1\tPR_SS\t8
+%R\tTP3\tT3\tT2\tPR_FS\t0
+%E
+""")
+
+_P6_FIXTURES = {
+    "basic": _P6_XER,
+    "empty_task": _P6_XER_EMPTY_TASK,
+    "full": _P6_XER_FULL,
+    "crlf": _P6_XER_FULL.replace("\n", "\r\n"),
+    "empty": "",
+}
+
+
+def _row_tuples(rows):
+    return [(row.row_number, row.source_data, row.mapped_data) for row in rows]
+
+
+class TestP6StreamingParserParity:
+    @pytest.mark.parametrize("fixture", sorted(_P6_FIXTURES))
+    def test_rows_match_the_fallback_parser(self, fixture, tmp_path):
+        text = _P6_FIXTURES[fixture]
+        expected = _row_tuples(P6Parser().parse(text.encode("latin-1")))
+        path = tmp_path / "export.xer"
+        path.write_bytes(text.encode("latin-1"))
+        streaming = P6StreamingParser(batch_size=2)
+
+        assert _row_tuples(streaming.parse(text.encode("latin-1"))) == expected
+        assert _row_tuples(streaming.parse(text)) == expected
+        assert _row_tuples(streaming.parse(path)) == expected
+        assert streaming.detect_headers(path) == P6Parser().detect_headers(text)
+
+    def test_mapping_profile_matches_the_fallback_parser(self):
+        profile = ImportMappingProfile.create("p6 custom", "p6_xer")
+        profile.field_mappings.append(ImportFieldMapping(source_field="task_name", target_field="name"))
+        profile.field_mappings.append(
+            ImportFieldMapping(source_field="predecessors", target_field="deps", default_value="")
+        )
+        assert _row_tuples(P6StreamingParser().parse(_P6_XER_FULL, mapping=profile)) == _row_tuples(
+            P6Parser().parse(_P6_XER_FULL, mapping=profile)
+        )
+
+    def test_row_batches_are_bounded(self):
+        batches = list(P6StreamingParser(batch_size=2).iter_row_batches(_P6_XER_FULL))
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert batches[1][0].source_data["predecessors"] == "T1:PR_SS:8;T2:PR_FS:0"
+
+    def test_table_batches_cover_mapped_tables(self):
+        batches = list(P6StreamingParser(batch_size=2).iter_table_batches(_P6_XER_FULL))
+        assert [(table, len(records)) for table, records in batches] == [
+            ("CALENDAR", 1),
+            ("TASK", 2),
+            ("TASK", 1),
+            ("TASKRSRC", 1),
+            ("TASKPRED", 2),
+            ("TASKPRED", 1),
+        ]
+        assert batches[3][1][0] == {"taskrsrc_id": "TR1", "task_id": "T1", "rsrc_id": "R1", "target_qty": "16"}
+
+    def test_import_batches_map_relationships_calendars_and_assignments(self):
+        batches = list(P6StreamingParser(batch_size=2).iter_import_batches(_P6_XER_FULL))
+        assert [(table, len(records)) for table, records in batches] == [
+            ("CALENDAR", 1),
+            ("TASK", 2),
+            ("TASK", 1),
+            ("TASKRSRC", 1),
+            ("TASKPRED", 2),
+            ("TASKPRED", 1),
+        ]
+        assert batches[0][1][0] == {
+            "source_id": "CAL-1",
+            "name": "Standard",
+            "is_default": False,
+            "calendar_type": "",
+            "hours_per_day": 8.0,
+        }
+        assert [row.row_number for row in batches[2][1]] == [3]
+        assert batches[2][1][0].source_data["predecessors"] == "T1:PR_SS:8;T2:PR_FS:0"
+        assert batches[3][1][0] == {
+            "source_id": "TR1",
+            "task_id": "T1",
+            "resource_id": "R1",
+            "allocation_percent": 100.0,
+            "allocated_planned_hours": 16.0,
+        }
+        assert batches[4][1][1] == {
+            "source_id": "TP2",
+            "predecessor_task_id": "T1",
+            "successor_task_id": "T3",
+            "dependency_type": DependencyType.START_TO_START,
+            "lag_days": 1,
+        }
+
+    def test_import_batches_preview_activities_and_count_other_tables(self, tmp_path):
+        path = tmp_path / "export.xer"
+        path.write_bytes(_P6_XER_FULL.encode("latin-1"))
+        builder = ImportValidationService().preview_builder()
+        for table, batch in P6StreamingParser(batch_size=2).iter_import_batches(path):
+            if table == "TASK":
+                builder.add_rows(batch)
+            else:
+                builder.count_records(table, len(batch))
+        preview = builder.build()
+
+        assert preview.total_rows == 3
+        assert preview.record_counts == {"CALENDAR": 1, "TASKRSRC": 1, "TASKPRED": 3}
+
+    def test_large_export_benchmark(self, tmp_path):
+        skip_unless_perf_tests()
+
+        count = 200_000
+        path = tmp_path / "large.xer"
+        with path.open("w", encoding="latin-1", newline="") as handle:
+            handle.write("%T\tTASK\n%F\ttask_id\tproj_id\ttask_code\ttask_name\tstart_date\tend_date\n")
+            for index in range(count):
+                handle.write(f"%R\tT{index}\tP1\tA{index}\tActivity {index}\t2026-06-01 08:00\t2026-06-05 17:00\n")
+            handle.write("%E\n%T\tTASKPRED\n%F\ttask_pred_id\ttask_id\tpred_task_id\tpred_type\tlag_hr_cnt\n")
+            for index in range(1, count):
+                handle.write(f"%R\tTP{index}\tT{index}\tT{index - 1}\tPR_FS\t0\n")
+            handle.write("%E\n")
+
+        tracemalloc.start()
+        started = perf_counter()
+        streamed = sum(len(batch) for batch in P6StreamingParser().iter_row_batches(path))
+        streaming_ms = (perf_counter() - started) * 1000
+        _, streaming_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        started = perf_counter()
+        legacy = len(P6Parser().parse(path.read_bytes()))
+        legacy_ms = (perf_counter() - started) * 1000
+        _, legacy_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"P6 XER {count} activities ({path.stat().st_size // 1024} KiB): "
+            f"streaming_ms={streaming_ms:.1f} streaming_peak_kib={streaming_peak // 1024} "
+            f"legacy_ms={legacy_ms:.1f} legacy_peak_kib={legacy_peak // 1024}"
+        )
+        assert streamed == legacy == count
+        assert streaming_peak < legacy_peak
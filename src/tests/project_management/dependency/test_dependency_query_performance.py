@@ -12,6 +12,20 @@ from src.core.modules.project_management.domain.enums import DependencyType
 from src.tests.project_management._sql_measurement_helpers import count_calls
 
 
+def _record_persisted_task_ids(monkeypatch, task_repo) -> list[str]:
+    """Recalculation persists moved tasks through one batched
+    ``update_many``; record the ids it writes."""
+    persisted: list[str] = []
+    original = task_repo.update_many
+
+    def _update_many(tasks):
+        tasks = list(tasks)
+        persisted.extend(task.id for task in tasks)
+        return original(tasks)
+
+    monkeypatch.setattr(task_repo, "update_many", _update_many)
+    return persisted
+
 
 def test_list_project_dependencies_is_one_query_not_per_task_loop(services):
     ps = services["project_service"]
@@ -49,7 +63,7 @@ def test_application_layer_method_is_permission_checked(services):
     assert result == []
 
 
-def test_recalculation_only_persists_tasks_whose_dates_actually_changed(services):
+def test_recalculation_only_persists_tasks_whose_dates_actually_changed(services, monkeypatch):
     """Phase L1: a re-run of recalculate_project_schedule() that reproduces
     the same CPM dates for every task must not re-issue a repository update
     for any of them. Before this fix, every leaf task in the project was
@@ -79,14 +93,16 @@ def test_recalculation_only_persists_tasks_whose_dates_actually_changed(services
     sched.recalculate_project_schedule(project.id)
 
     task_repo = sched._task_repo
+    persisted = _record_persisted_task_ids(monkeypatch, task_repo)
     with count_calls([(task_repo, "update", "update")]) as counts:
         result = sched.recalculate_project_schedule(project.id)
 
     assert len(result) == len(tasks)
     assert counts["update"] == 0
+    assert persisted == []
 
 
-def test_recalculation_persists_only_the_tasks_whose_dates_shift(services):
+def test_recalculation_persists_only_the_tasks_whose_dates_shift(services, monkeypatch):
     """A change that shifts a dependency chain's root must persist the
     tasks whose dates actually move, and the mechanism must be driven by
     real date deltas rather than being an unconditional no-op."""
@@ -117,8 +133,10 @@ def test_recalculation_persists_only_the_tasks_whose_dates_shift(services):
     ts.update_task(tasks[0].id, start_date=date(2023, 11, 13))
 
     task_repo = sched._task_repo
+    persisted = _record_persisted_task_ids(monkeypatch, task_repo)
     with count_calls([(task_repo, "update", "update")]) as counts:
         result = sched.recalculate_project_schedule(project.id)
 
     assert len(result) == len(tasks)
-    assert counts["update"] == len(tasks) - 1
+    assert counts["update"] == 0
+    assert sorted(persisted) == sorted(task.id for task in tasks[1:])
@@ -0,0 +1,90 @@
+"""Entity-scoped domain refresh for the scheduling workspace: domain events
+only re-query the sections built from the changed entity types, and task
+changes in other projects do not reload the workspace at all."""
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import MagicMock
+
+from sqlalchemy import event
+
+from src.application.runtime import build_desktop_api_registry
+from src.core.shared.events.domain_events import domain_events
+from src.ui_qml.modules.project_management.controllers.common import DomainRefreshDelta
+from src.ui_qml.modules.project_management.controllers.scheduling.domain_event_binder import (
+    stale_scheduling_sections,
+)
+from src.ui_qml.modules.project_management.controllers.scheduling.scheduling_workspace_controller import (
+    ProjectManagementSchedulingWorkspaceController,
+)
+from src.ui_qml.modules.project_management.presenters.scheduling.scheduling_workspace_presenter import (
+    ProjectSchedulingWorkspacePresenter,
+)
+
+
+def _controller(services):
+    desktop_api = build_desktop_api_registry(services).project_management_scheduling
+    return ProjectManagementSchedulingWorkspaceController(
+        workspace_presenter=MagicMock(),
+        scheduling_workspace_presenter=ProjectSchedulingWorkspacePresenter(desktop_api=desktop_api),
+    )
+
+
+def _count_queries(session, fn) -> int:
+    statements: list[str] = []
+
+    def _listener(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _listener)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _listener)
+    return len(statements)
+
+
+def test_domain_events_refresh_only_the_changed_sections(qapp, services, session):
+    project_service = services["project_service"]
+    task_service = services["task_service"]
+    project = project_service.create_project("Delta Refresh", "")
+    other = project_service.create_project("Delta Refresh Other", "")
+    for index in range(3):
+        task_service.create_task(
+            project.id, f"Task {index}", start_date=date(2026, 9, 7), duration_days=2
+        )
+    for name in ("BL1", "BL2"):
+        services["baseline_service"].create_baseline(project.id, name, rate_as_of=date.today())
+    ctrl = _controller(services)
+    ctrl.selectProject(project.id)
+
+    full = _count_queries(session, ctrl.refresh)
+    other_project = _count_queries(session, lambda: domain_events.tasks_changed.emit(other.id))
+    same_project = _count_queries(session, lambda: domain_events.tasks_changed.emit(project.id))
+    baseline_only = _count_queries(session, lambda: domain_events.baseline_changed.emit(project.id))
+    calendar_only = _count_queries(session, lambda: domain_events.calendars_changed.emit("default"))
+
+    print(
+        f"Scheduling refresh queries: full={full} same_project_tasks={same_project} "
+        f"other_project_tasks={other_project} baseline={baseline_only} calendar={calendar_only}"
+    )
+    assert other_project == 0
+    assert 0 < same_project < full
+    assert 0 < baseline_only < same_project
+    assert calendar_only < baseline_only
+
+    task_service.create_task(project.id, "Added", start_date=date(2026, 9, 9), duration_days=1)
+    assert ctrl.activityTotalCount == 4
+
+
+def test_explicit_refresh_requests_reload_every_section():
+    sections = stale_scheduling_sections(
+        DomainRefreshDelta(full=True),
+        selected_project_id="project-1",
+    )
+    assert sections == {"projects", "calendars", "baselines", "schedule"}
+
+    delta = DomainRefreshDelta(changed={"project": frozenset({"project-2"})})
+    assert stale_scheduling_sections(delta, selected_project_id="project-1") == {"projects"}
+    assert stale_scheduling_sections(delta, selected_project_id="project-2") == {"projects", "schedule"}
@@ -0,0 +1,148 @@
+"""Gantt timeline list model: packed bar geometry for every filtered
+activity, range queries over rows and time, and connectors resolved for
+the visible rows only."""
+from __future__ import annotations
+
+from datetime import date
+from time import perf_counter
+from unittest.mock import MagicMock
+
+
+from src.application.runtime import build_desktop_api_registry
+from src.ui_qml.modules.project_management.controllers.scheduling.scheduling_workspace_controller import (
+    ProjectManagementSchedulingWorkspaceController,
+)
+from src.ui_qml.modules.project_management.controllers.scheduling.timeline_model import (
+    FLAG_CRITICAL,
+    FLAG_UNSCHEDULED,
+    SchedulingTimelineModel,
+)
+from src.ui_qml.modules.project_management.presenters.scheduling.scheduling_workspace_presenter import (
+    ProjectSchedulingWorkspacePresenter,
+)
+from src.ui_qml.modules.project_management.view_models.scheduling import (
+    SchedulingTimelineBarViewModel,
+    SchedulingTimelineLinkViewModel,
+)
+from src.tests.perf_flags import skip_unless_perf_tests
+
+_ORIGIN = date(2026, 1, 5).toordinal()
+
+
+def _bars(count: int, *, unscheduled: set[int] = frozenset()) -> list[SchedulingTimelineBarViewModel]:
+    return [
+        SchedulingTimelineBarViewModel(
+            id=f"task-{index}",
+            title=f"Task {index}",
+            start_ordinal=0 if index in unscheduled else _ORIGIN + index * 2,
+            finish_ordinal=0 if index in unscheduled else _ORIGIN + index * 2 + 1,
+            critical=index % 2 == 0,
+        )
+        for index in range(count)
+    ]
+
+
+def _chain(count: int) -> list[SchedulingTimelineLinkViewModel]:
+    return [
+        SchedulingTimelineLinkViewModel(f"task-{index}", f"task-{index + 1}", "FS")
+        for index in range(count - 1)
+    ]
+
+
+def test_timeline_model_answers_row_and_time_range_queries(qapp):
+    model = SchedulingTimelineModel()
+    model.set_timeline(_bars(10, unscheduled={5}), _chain(10))
+
+    assert model.rowCount() == 10
+    assert model.data(model.index(3), SchedulingTimelineModel.StartOrdinalRole) == _ORIGIN + 6
+    assert model.data(model.index(2), SchedulingTimelineModel.FlagsRole) & FLAG_CRITICAL
+    assert model.data(model.index(5), SchedulingTimelineModel.FlagsRole) & FLAG_UNSCHEDULED
+    assert model.windowStartOrdinal == _ORIGIN
+    assert model.windowFinishOrdinal == _ORIGIN + 19
+    assert model.rowForTask("task-7") == 7
+
+    # Rows 2..8 intersecting days 8..13 of the window; row 5 has no dates.
+    assert model.visibleBars(2, 8, _ORIGIN + 8, _ORIGIN + 13) == [4, 6]
+
+    connectors = model.connectorsForRows(3, 4)
+    assert [(c["fromRow"], c["toRow"]) for c in connectors] == [(2, 3), (3, 4)]
+    assert connectors[0]["fromOrdinal"] == _ORIGIN + 5
+    assert connectors[0]["toOrdinal"] == _ORIGIN + 6
+    # The link into the unscheduled row 5 has no geometry to draw.
+    assert all(c["toRow"] != 5 for c in model.connectorsForRows(0, 9))
+
+
+def test_timeline_model_updates_in_place_when_rows_are_unchanged(qapp):
+    model = SchedulingTimelineModel()
+    model.set_timeline(_bars(4))
+    resets: list[bool] = []
+    changes: list[tuple[int, int]] = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.dataChanged.connect(lambda first, last, roles=(): changes.append((first.row(), last.row())))
+
+    model.set_timeline(_bars(4))
+    assert (resets, changes) == ([], [])
+
+    shifted = [
+        SchedulingTimelineBarViewModel(
+            id=bar.id,
+            title=bar.title,
+            start_ordinal=bar.start_ordinal + 1,
+            finish_ordinal=bar.finish_ordinal + 1,
+        )
+        for bar in _bars(4)
+    ]
+    model.set_timeline(shifted)
+    assert resets == [] and changes == [(0, 3)]
+
+    model.set_timeline(_bars(3))
+    assert resets == [True]
+    assert model.count == 3
+
+
+def test_scheduling_controller_exposes_every_filtered_activity_to_the_timeline(qapp, services):
+    project = services["project_service"].create_project("Timeline Model", "")
+    task_service = services["task_service"]
+    for index in range(12):
+        task_service.create_task(
+            project.id, f"Task {index:02d}", start_date=date(2026, 9, 7), duration_days=2
+        )
+    desktop_api = build_desktop_api_registry(services).project_management_scheduling
+    ctrl = ProjectManagementSchedulingWorkspaceController(
+        workspace_presenter=MagicMock(),
+        scheduling_workspace_presenter=ProjectSchedulingWorkspacePresenter(desktop_api=desktop_api),
+    )
+    ctrl.selectProject(project.id)
+    ctrl.setActivityPageSize(10)
+
+    model = ctrl.timelineBarModel
+    assert ctrl.activityTotalCount == 12
+    assert model.count == 12
+    assert model.windowStartLabel == "2026-09-07"
+
+
+def test_timeline_model_large_project_benchmark(qapp):
+    skip_unless_perf_tests()
+
+    bars = _bars(10_000)
+    links = _chain(10_000)
+    model = SchedulingTimelineModel()
+
+    started = perf_counter()
+    model.set_timeline(bars, links)
+    load_ms = (perf_counter() - started) * 1000
+
+    started = perf_counter()
+    for first_row in range(0, 10_000, 30):
+        model.visibleBars(first_row, first_row + 30, _ORIGIN, _ORIGIN + 20_000)
+        model.connectorsForRows(first_row, first_row + 30)
+    scroll_ms = (perf_counter() - started) * 1000
+
+    started = perf_counter()
+    model.set_timeline(bars, links)
+    unchanged_refresh_ms = (perf_counter() - started) * 1000
+    print(
+        f"Timeline model 10k bars: load_ms={load_ms:.1f} scroll_ms={scroll_ms:.1f} "
+        f"unchanged_refresh_ms={unchanged_refresh_ms:.1f}"
+    )
+    assert model.count == 10_000
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from src.core.modules.project_management.domain.enums import DependencyType
+from src.core.modules.project_management.domain.tasks.task import Task, TaskAssignment, TaskDependency
+from src.core.modules.project_management.infrastructure.persistence.orm.task import TaskORM
+from src.core.platform.common.exceptions import ConcurrencyError, NotFoundError
+from src.infra.persistence.db.bulk import BulkRowUpdate, bulk_update
+from src.tests.project_management._sql_measurement_helpers import measure_sql
+from src.tests.project_management._test_repository_tenant_hardening_helpers import (
+    _seed_priority_pm_rows,
+)
+
+
+def _bulk_tasks(project_id: str, count: int, *, prefix: str = "bulk") -> list[Task]:
+    return [
+        Task(
+            id=f"{prefix}-task-{index}",
+            project_id=project_id,
+            name=f"Bulk task {index}",
+            wbs_code=f"9.{index}",
+            sort_order=index,
+        )
+        for index in range(count)
+    ]
+
+
+def test_task_add_many_inserts_with_constant_statement_count(services):
+    seeded = _seed_priority_pm_rows(services)
+    session = services["session"]
+    task_repo = services["task_service"]._task_repo
+    tasks = _bulk_tasks(seeded["project_a"], 2500)
+
+    with measure_sql(session) as stats:
+        task_repo.add_many(tasks)
+    session.commit()
+
+    # One project-scope check plus one executemany INSERT per 1000-row chunk.
+    assert stats.total_statements <= 4
+    stored = {task.id: task for task in task_repo.list_by_project(seeded["project_a"])}
+    assert {task.id for task in tasks} <= set(stored)
+    assert stored["bulk-task-7"].wbs_code == "9.7"
+    assert stored["bulk-task-7"].version == 1
+
+
+def test_task_update_many_bumps_versions_and_rejects_stale_rows(services):
+    seeded = _seed_priority_pm_rows(services)
+    session = services["session"]
+    task_repo = services["task_service"]._task_repo
+    task_repo.add_many(_bulk_tasks(seeded["project_a"], 5))
+    session.commit()
+
+    loaded = task_repo.list_by_ids([f"bulk-task-{index}" for index in range(5)])
+    stale = [replace(task) for task in loaded]
+    for task in loaded:
+        task.name = f"{task.name} (renamed)"
+    task_repo.update_many(loaded)
+    session.commit()
+
+    assert {task.version for task in loaded} == {2}
+    assert {task.name for task in task_repo.list_by_ids([task.id for task in loaded])} == {
+        f"Bulk task {index} (renamed)" for index in range(5)
+    }
+
+    with pytest.raises(ConcurrencyError) as exc:
+        task_repo.update_many(stale)
+    session.rollback()
+    assert exc.value.code == "STALE_WRITE"
+
+
+def test_bulk_update_rejects_rows_that_disagree_on_versioning(services):
+    seeded = _seed_priority_pm_rows(services)
+    session = services["session"]
+    task_repo = services["task_service"]._task_repo
+    task_repo.add_many(_bulk_tasks(seeded["project_a"], 2))
+    session.commit()
+
+    for second in (
+        BulkRowUpdate(row_id="bulk-task-1", values={"name": "Renamed"}),
+        BulkRowUpdate(row_id="bulk-task-1", values={"sort_order": 9}, expected_version=1),
+    ):
+        with pytest.raises(ValueError):
+            bulk_update(
+                session,
+                TaskORM,
+                [BulkRowUpdate(row_id="bulk-task-0", values={"name": "Renamed"}, expected_version=1), second],
+                not_found_message="Task not found.",
+                stale_message="Task was updated by another user.",
+            )
+    assert {task.name for task in task_repo.list_by_ids(["bulk-task-0", "bulk-task-1"])} == {
+        "Bulk task 0",
+        "Bulk task 1",
+    }
+
+
+def test_bulk_writes_reject_out_of_scope_anchors(services):
+    seeded = _seed_priority_pm_rows(services)
+    session = services["session"]
+    task_repo = services["task_service"]._task_repo
+    assignment_repo = services["task_service"]._assignment_repo
+    dependency_repo = services["task_service"]._dependency_repo
+
+    with pytest.raises(NotFoundError):
+        task_repo.add_many(
+            _bulk_tasks(seeded["project_a"], 2) + _bulk_tasks(seeded["project_b"], 1, prefix="other")
+        )
+    with pytest.raises(NotFoundError):
+        assignment_repo.add_many(
+            [
+                TaskAssignment(
+                    id="bulk-assignment-blocked",
+                    task_id=seeded["task_a1"],
+                    resource_id=seeded["resource_b"],
+                    allocation_percent=50.0,
+                )
+            ]
+        )
+    with pytest.raises(NotFoundError):
+        dependency_repo.add_many(
+            [
+                TaskDependency(
+                    id="bulk-dependency-cross",
+                    predecessor_task_id=seeded["task_a1"],
+                    successor_task_id="task-a-2",
+                    dependency_type=DependencyType.FINISH_TO_START,
+                ),
+                TaskDependency(
+                    id="bulk-dependency-foreign",
+                    predecessor_task_id=seeded["task_a1"],
+                    successor_task_id=seeded["task_b1"],
+                    dependency_type=DependencyType.FINISH_TO_START,
+                ),
+            ]
+        )
+    session.rollback()
+    assert task_repo.list_by_ids(["bulk-task-0", "other-task-0"]) == []
+
+
+def test_assignment_and_dependency_bulk_round_trip(services):
+    seeded = _seed_priority_pm_rows(services)
+    session = services["session"]
+    task_repo = services["task_service"]._task_repo
+    assignment_repo = services["task_service"]._assignment_repo
+    dependency_repo = services["task_service"]._dependency_repo
+    tasks = _bulk_tasks(seeded["project_a"], 4)
+    task_repo.add_many(tasks)
+    dependency_repo.add_many(
+        [
+            TaskDependency(
+                id=f"bulk-dependency-{index}",
+                predecessor_task_id=tasks[index].id,
+                successor_task_id=tasks[index + 1].id,
+                dependency_type=DependencyType.FINISH_TO_START,
+            )
+            for index in range(3)
+        ]
+    )
+    assignment_repo.add_many(
+        [
+            TaskAssignment(
+                id=f"bulk-assignment-{index}",
+                task_id=task.id,
+                resource_id=seeded["resource_a"],
+                allocation_percent=25.0,
+            )
+            for index, task in enumerate(tasks)
+        ]
+    )
+    session.commit()
+
+    dependencies = dependency_repo.list_by_project(seeded["project_a"])
+    assert {dependency.id for dependency in dependencies} >= {
+        f"bulk-dependency-{index}" for index in range(3)
+    }
+    assignments = assignment_repo.list_by_tasks([task.id for task in tasks])
+    assert len(assignments) == 4
+
+    for assignment in assignments:
+        assignment.allocation_percent = 75.0
+    assignment_repo.update_many(assignments)
+    bulk_dependencies = [d for d in dependencies if d.id.startswith("bulk-")]
+    for dependency in bulk_dependencies:
+        dependency.lag_days = 2
+    dependency_repo.update_many(bulk_dependencies)
+    session.commit()
+
+    assert {
+        assignment.allocation_percent
+        for assignment in assignment_repo.list_by_tasks([task.id for task in tasks])
+    } == {75.0}
+    assert {dependency.version for dependency in bulk_dependencies} == {2}
+    assert {
+        dependency.lag_days
+        for dependency in dependency_repo.list_by_project(seeded["project_a"])
+        if dependency.id.startswith("bulk-")
+    } == {2}
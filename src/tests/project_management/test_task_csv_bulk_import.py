@@ -0,0 +1,208 @@
+"""Task CSV import writes each project's rows as one batch: the project's
+tasks are loaded once, rows are staged in memory and written together, and
+the schedule is recalculated once per project rather than once per row."""
+from __future__ import annotations
+
+from datetime import date
+from time import perf_counter
+
+
+from src.core.modules.project_management.domain.enums import ConstraintType, TaskStatus
+from src.core.modules.project_management.infrastructure.importers.tasks.csv.task_csv_importer import (
+    import_tasks,
+    preview_tasks,
+)
+from src.tests.perf_flags import skip_unless_perf_tests
+
+
+def _rows(project_id: str, count: int, *, first_line: int = 2) -> list[tuple[int, dict[str, str]]]:
+    rows: list[tuple[int, dict[str, str]]] = []
+    for index in range(count):
+        package = index // 10 + 1
+        if index % 10 == 0:
+            rows.append(
+                (
+                    first_line + len(rows),
+                    {"project_id": project_id, "name": f"Package {package}", "wbs_code": str(package)},
+                )
+            )
+        rows.append(
+            (
+                first_line + len(rows),
+                {
+                    "project_id": project_id,
+                    "name": f"Activity {index:05d}",
+                    "parent_wbs_code": str(package),
+                    "start_date": "2026-09-07",
+                    "duration_days": "3",
+                },
+            )
+        )
+    return rows
+
+
+def _count_calls(monkeypatch, target, name: str) -> list[object]:
+    calls: list[object] = []
+    original = getattr(target, name)
+
+    def _wrapped(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(target, name, _wrapped)
+    return calls
+
+
+def test_task_csv_import_loads_and_recalculates_each_project_once(services, monkeypatch) -> None:
+    project_service = services["project_service"]
+    task_service = services["task_service"]
+    project = project_service.create_project("Bulk Import", "")
+    task_loads = _count_calls(monkeypatch, task_service._task_repo, "list_by_project")
+    recalculations = _count_calls(monkeypatch, task_service, "_sync_project_schedule")
+    inserts = _count_calls(monkeypatch, task_service._task_repo, "add")
+
+    rows = _rows(project.id, 30)
+    summary = import_tasks(rows, project_service=project_service, task_service=task_service)
+
+    assert (summary.created_count, summary.error_count) == (len(rows), 0)
+    assert len(task_loads) <= 2
+    assert len(recalculations) == 1
+    assert inserts == []
+    nodes = task_service.list_task_hierarchy(project.id)
+    assert [(node.task.wbs_code, node.depth) for node in nodes[:3]] == [("1", 0), ("1.1", 1), ("1.2", 1)]
+    assert len({node.task.code for node in nodes}) == len(rows)
+
+
+def test_task_csv_import_reports_bad_rows_and_applies_the_rest(services) -> None:
+    project_service = services["project_service"]
+    task_service = services["task_service"]
+    project = project_service.create_project("Bulk Import Mixed", "")
+    existing = task_service.create_task(project.id, "Existing", code="EXIST-1", duration_days=2)
+
+    summary = import_tasks(
+        [
+            (2, {"project_id": project.id, "name": "Existing", "percent_complete": "40"}),
+            (3, {"project_id": project.id, "name": "Fresh", "task_code": "exist-1"}),
+            (4, {"project_id": project.id, "name": "Orphan", "parent_wbs_code": "9"}),
+            (5, {"project_id": project.id, "name": "Done", "percent_complete": "100"}),
+        ],
+        project_service=project_service,
+        task_service=task_service,
+    )
+
+    assert (summary.created_count, summary.updated_count) == (1, 1)
+    assert [error.line_no for error in summary.row_errors] == [3, 4]
+    assert "Parent WBS code '9'" in summary.row_errors[1].message
+    tasks = {task.name: task for task in task_service.list_tasks_for_project(project.id)}
+    assert tasks["Existing"].id == existing.id
+    assert (tasks["Existing"].percent_complete, tasks["Existing"].status) == (40, TaskStatus.IN_PROGRESS)
+    assert tasks["Done"].status == TaskStatus.DONE
+    assert "Fresh" not in tasks
+
+
+def test_task_csv_import_applies_milestone_and_constraint_rules(services) -> None:
+    project_service = services["project_service"]
+    task_service = services["task_service"]
+    project = project_service.create_project("Bulk Import Rules", "")
+    existing = task_service.create_task(project.id, "Existing", start_date=date(2026, 9, 7), duration_days=2)
+    row = {"project_id": project.id, "start_date": "2026-09-07", "duration_days": "5"}
+
+    summary = import_tasks(
+        [
+            (2, {**row, "name": "Gate", "is_milestone": "yes"}),
+            (3, {**row, "name": "Pinned", "constraint_type": "MUST_START_ON", "constraint_date": "2026-09-08"}),
+            (4, {**row, "name": "Weekend", "constraint_type": "must_start_on", "constraint_date": "2026-09-05"}),
+            (5, {**row, "name": "Existing", "constraint_type": "must_start_on", "constraint_date": "2026-09-08"}),
+            (6, {"project_id": project.id, "name": "Existing", "is_milestone": "true"}),
+        ],
+        project_service=project_service,
+        task_service=task_service,
+    )
+
+    assert (summary.created_count, summary.updated_count) == (2, 1)
+    assert [error.line_no for error in summary.row_errors] == [4, 5]
+    assert "not a working day" in summary.row_errors[0].message
+    assert "constraint command" in summary.row_errors[1].message
+    tasks = {task.name: task for task in task_service.list_tasks_for_project(project.id)}
+    assert (tasks["Gate"].is_milestone, tasks["Gate"].duration_days, tasks["Gate"].end_date) == (
+        True,
+        0,
+        date(2026, 9, 7),
+    )
+    assert (tasks["Pinned"].constraint_type, tasks["Pinned"].constraint_date) == (
+        ConstraintType.MUST_START_ON,
+        date(2026, 9, 8),
+    )
+    assert tasks["Existing"].id == existing.id
+    assert (tasks["Existing"].is_milestone, tasks["Existing"].duration_days) == (True, 0)
+    assert tasks["Existing"].constraint_type is None
+
+
+def test_task_csv_import_moves_tasks_in_its_own_transaction_with_per_task_activity(
+    services,
+    monkeypatch,
+) -> None:
+    project_service = services["project_service"]
+    task_service = services["task_service"]
+    project = project_service.create_project("Bulk Import Moves", "")
+    phase_a = task_service.create_task(project.id, "Phase A")
+    task_service.create_task(project.id, "Phase B")
+    leaf = task_service.create_task(project.id, "Leaf", parent_task_id=phase_a.id, duration_days=2)
+    task_service.create_task(project.id, "Sibling", parent_task_id=phase_a.id, duration_days=2)
+    move_calls = _count_calls(monkeypatch, task_service, "move_task")
+    commits = _count_calls(monkeypatch, task_service._session, "commit")
+
+    summary = import_tasks(
+        [
+            (2, {"project_id": project.id, "name": "Leaf", "parent_wbs_code": "2", "priority": "3"}),
+            (3, {"project_id": project.id, "name": "Fresh", "parent_wbs_code": "2"}),
+        ],
+        project_service=project_service,
+        task_service=task_service,
+    )
+
+    assert (summary.created_count, summary.updated_count, summary.error_count) == (1, 1, 0)
+    assert move_calls == []
+    assert len(commits) <= 2
+    nodes = task_service.list_task_hierarchy(project.id)
+    assert [(node.task.name, node.task.wbs_code, node.task.sort_order) for node in nodes] == [
+        ("Phase A", "1", 0),
+        ("Sibling", "1.2", 0),
+        ("Phase B", "2", 1),
+        ("Leaf", "2.1", 0),
+        ("Fresh", "2.2", 1),
+    ]
+    activity = services["activity_service"]
+    assert not activity.list_recent(workspace_id=project.id, action_prefix="task.import")
+    leaf_actions = {entry.action for entry in activity.list_recent(entity_type="task", entity_id=leaf.id)}
+    assert {"task.update", "task.wbs_move"} <= leaf_actions
+    fresh = next(node.task for node in nodes if node.task.name == "Fresh")
+    assert [entry.action for entry in activity.list_recent(entity_type="task", entity_id=fresh.id)] == [
+        "task.create"
+    ]
+
+
+def test_task_csv_preview_loads_each_project_once(services, monkeypatch) -> None:
+    project_service = services["project_service"]
+    task_service = services["task_service"]
+    project = project_service.create_project("Bulk Preview", "")
+    task_loads = _count_calls(monkeypatch, task_service, "list_tasks_for_project")
+
+    preview = preview_tasks(_rows(project.id, 25), project_service=project_service, task_service=task_service)
+
+    assert preview.created_count == 28
+    assert len(task_loads) == 1
+
+
+def test_task_csv_import_large_file_benchmark(services) -> None:
+    skip_unless_perf_tests()
+
+    project_service = services["project_service"]
+    project = project_service.create_project("Bulk Import Benchmark", "")
+    rows = _rows(project.id, 10_000)
+
+    started = perf_counter()
+    summary = import_tasks(rows, project_service=project_service, task_service=services["task_service"])
+    import_ms = (perf_counter() - started) * 1000
+    print(f"Task CSV import {len(rows)} rows: import_ms={import_ms:.1f}")
+    assert summary.created_count == len(rows)
@@ -36,6 +36,149 @@ def test_dynamic_table_model_skips_reset_for_identical_rows_and_columns() -> Non
 
     model.rows = rows + [{"id": "task-3", "title": "Closeout", "statusLabel": "Done"}]
 
-    assert resets == ["reset", "reset", "reset"]
+    assert resets == ["reset", "reset"]
     assert row_events == ["rows", "rows"]
+    assert model.rowCount() == 3
+
+
+
+def _task_rows(count: int) -> list[dict]:
+    return [
+        {"id": f"task-{index}", "title": f"Task {index}", "statusLabel": "Todo"}
+        for index in range(count)
+    ]
+
+
+def _keyed_model(rows: list[dict]) -> tuple[DynamicTableModel, list[tuple]]:
+    model = DynamicTableModel()
+    model.columns = [
+        {"key": "title", "label": "Task"},
+        {"key": "statusLabel", "label": "Status"},
+    ]
+    model.set_rows(rows)
+    events: list[tuple] = []
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    model.layoutChanged.connect(lambda *_: events.append(("layout",)))
+    model.rowsRemoved.connect(lambda _parent, first, last: events.append(("removed", first, last)))
+    model.rowsInserted.connect(lambda _parent, first, last: events.append(("inserted", first, last)))
+    model.rowsMoved.connect(lambda *_: events.append(("moved",)))
+    model.dataChanged.connect(
+        lambda top_left, bottom_right, roles: events.append(
+            ("changed", top_left.row(), bottom_right.row(), tuple(int(role) for role in roles))
+        )
+    )
+    return model, events
+
+
+def test_dynamic_table_model_applies_keyed_rows_as_a_row_diff(qapp) -> None:
+    from PySide6.QtCore import Qt
+    from PySide6.QtTest import QAbstractItemModelTester
+
+    rows = _task_rows(8)
+    model, events = _keyed_model(rows)
+    tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+
+    updated = [dict(row) for row in rows]
+    updated[3]["statusLabel"] = "Done"
+    model.rows = updated
+    assert events == [
+        ("changed", 3, 3, (int(DynamicTableModel.RowDataRole), int(Qt.DisplayRole), int(DynamicTableModel.RawValueRole))),
+    ]
+
+    events.clear()
+    reshaped = [updated[0], updated[5], *updated[1:5], {"id": "task-new", "title": "New", "statusLabel": "Todo"}, updated[7]]
+    model.rows = reshaped
+
+    kinds = [event[0] for event in events]
+    assert "reset" not in kinds
+    assert ("removed", 6, 6) in events
+    assert kinds.count("moved") == 1
+    assert ("inserted", 6, 6) in events
+    assert [model.rowId(index) for index in range(model.rowCount())] == [row["id"] for row in reshaped]
+    assert model.data(model.index(1, 0), DynamicTableModel.RowIndexRole) == 1
+    del tester
+
+
+def test_dynamic_table_model_relayouts_large_reorders_and_resets_unkeyed_rows(qapp) -> None:
+    from PySide6.QtCore import QPersistentModelIndex
+
+    rows = _task_rows(400)
+    model, events = _keyed_model(rows)
+    selected = QPersistentModelIndex(model.index(0, 1))
+
+    model.rows = list(reversed(rows))
+
+    assert events == [("layout",)]
+    assert model.rowId(0) == "task-399"
+    assert selected.row() == 399
+
+    events.clear()
+    model.rows = [{"title": "No id"}, {"title": "Also no id"}]
+    assert events == [("reset",)]
+
+
+def test_dynamic_table_model_delegate_churn_benchmark(qapp) -> None:
+    from time import perf_counter
+
+    from src.tests.perf_flags import skip_unless_perf_tests
+
+    skip_unless_perf_tests()
+
+    from PySide6.QtCore import QUrl
+    from PySide6.QtQml import QQmlComponent, QQmlEngine
+
+    engine = QQmlEngine()
+    component = QQmlComponent(engine)
+    component.setData(
+        b"""
+        import QtQuick
+        Window {
+            id: host
+            visible: true
+            width: 1200; height: 900
+            property var tableModel
+            property int created: 0
+            TableView {
+                anchors.fill: parent
+                model: host.tableModel
+                delegate: Rectangle {
+                    required property string display
+                    implicitWidth: 120
+                    implicitHeight: 24
+                    Text { text: parent.display }
+                    Component.onCompleted: host.created += 1
+                }
+            }
+        }
+        """,
+        QUrl(),
+    )
+    results: dict[str, dict[str, float]] = {}
+    for mode in ("reset", "diff"):
+        rows = _task_rows(20_000)
+        model, _events = _keyed_model(rows)
+        root = component.create()
+        assert root is not None, component.errorString()
+        root.setProperty("tableModel", model)
+        qapp.processEvents()
+        created_before = root.property("created")
+        updated = list(rows)
+        updated[10] = {**rows[10], "statusLabel": "Done"}
+        started = perf_counter()
+        if mode == "reset":
+            model.beginResetModel()
+            model._rows = updated  # noqa: SLF001 - baseline: the previous full reset
+            model.endResetModel()
+        else:
+            model.rows = updated
+        qapp.processEvents()
+        results[mode] = {
+            "apply_ms": (perf_counter() - started) * 1000,
+            "delegates_recreated": float(root.property("created") - created_before),
+        }
+        root.deleteLater()
+        qapp.processEvents()
+    print(f"DynamicTableModel 20k-row single-change benchmark: {results}")
 
+    assert results["diff"]["delegates_recreated"] == 0
+    assert results["reset"]["delegates_recreated"] > 0
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from datetime import date
+import tracemalloc
+from datetime import date, datetime
 from pathlib import Path
+from time import perf_counter
 
 import pytest
 from openpyxl import load_workbook
@@ -10,7 +12,14 @@ from src.core.platform.domain.security.auth.session import UserSessionPrincipal
 from src.core.platform.common.exceptions import BusinessRuleError
 from src.core.modules.project_management.domain.enums import DependencyType
 from src.core.modules.project_management.infrastructure.reporting import api as reporting_api
+from src.core.modules.project_management.infrastructure.reporting.exporters.renderers.excel import (
+    ExcelReportRenderer,
+)
+from src.core.modules.project_management.infrastructure.reporting.services.report_composition import (
+    ReportComposer,
+)
 from src.core.modules.project_management.infrastructure.reporting.models.contexts import (
+    ExcelReportContext,
     FinanceLedgerExportPage,
     MAX_FINANCE_LEDGER_EXPORT_ROWS,
 )
@@ -25,6 +34,7 @@ from src.core.modules.project_management.infrastructure.reporting.models import
     ResourceLoadRow,
     TaskVarianceRow,
 )
+from src.tests.perf_flags import skip_unless_perf_tests
 
 
 def _setup_report_project(services):
@@ -399,6 +409,85 @@ def test_excel_export_omits_finance_sections_without_finance_read(services, tmp_
     assert restricted_value == "Restricted (finance.read required)"
 
 
+def test_composed_report_matches_section_by_section_reads(services, monkeypatch):
+    pid, baseline_id = _setup_report_project(services)
+    reporting = services["reporting_service"]
+    as_of = date(2023, 11, 30)
+    engine = reporting._scheduling_engine
+    recalculate = engine.recalculate_project_schedule
+    cpm_runs = []
+
+    def _counting_recalculate(*args, **kwargs):
+        cpm_runs.append(args)
+        return recalculate(*args, **kwargs)
+
+    monkeypatch.setattr(engine, "recalculate_project_schedule", _counting_recalculate)
+    report = ReportComposer(reporting).compose(pid, baseline_id=baseline_id, as_of=as_of)
+    assert len(cpm_runs) == 1
+    monkeypatch.undo()
+
+    assert report.section("kpi") == reporting.get_project_kpis(pid)
+    assert report.section("gantt") == reporting.get_gantt_data(pid)
+    assert report.section("resources") == reporting.get_resource_load_summary(pid)
+    assert report.section("baseline_variance") == reporting.get_baseline_schedule_variance(
+        pid, baseline_id=baseline_id
+    )
+    assert report.section("evm") == reporting.get_earned_value(pid, as_of=as_of, baseline_id=baseline_id)
+    assert report.section("evm_series") == reporting.get_evm_series(pid, baseline_id=baseline_id, as_of=as_of)
+    assert report.section("cost_breakdown") == reporting.get_cost_breakdown(
+        pid, as_of=as_of, baseline_id=baseline_id
+    )
+    assert report.section("cost_sources") == reporting.get_project_cost_source_breakdown(pid, as_of=as_of)
+    assert set(report.timings_ms) == {"snapshot", *report.sections}
+
+
+def test_composed_report_without_finance_read_omits_finance_sections(services):
+    pid, baseline_id = _setup_report_project(services)
+    tenant_id = services["user_session"].stored_active_tenant_id()
+    organization_id = services["user_session"].stored_active_organization_id()
+    services["user_session"].set_principal(
+        UserSessionPrincipal(
+            user_id="compose-no-finance",
+            username="compose-no-finance",
+            display_name="Compose No Finance",
+            role_names=frozenset({"viewer"}),
+            permissions=frozenset({"report.view"}),
+            active_tenant_id=tenant_id,
+            active_organization_id=organization_id,
+        )
+    )
+
+    report = ReportComposer(services["reporting_service"], max_workers=1).compose(
+        pid, baseline_id=baseline_id, as_of=date(2023, 11, 30)
+    )
+
+    assert set(report.sections) == {"kpi", "gantt", "resources", "baseline_variance"}
+    assert report.section("evm") is None
+    assert report.section("kpi").financial_detail_included is False
+
+
+def test_excel_report_artifact_records_section_timings(services, tmp_path):
+    pid, baseline_id = _setup_report_project(services)
+
+    artifact = reporting_api._get_report_runtime().render(
+        "excel_report",
+        reporting_api.ExcelReportRequest(
+            reporting_service=services["reporting_service"],
+            project_id=pid,
+            output_path=tmp_path / "timed.xlsx",
+            finance_service=services["finance_service"],
+            baseline_id=baseline_id,
+            as_of=date(2023, 11, 30),
+        ),
+        user_session=services["user_session"],
+        module_catalog_service=services["module_catalog_service"],
+    )
+
+    timings = artifact.metadata["section_timings_ms"]
+    assert {"snapshot", "finance", "kpi", "gantt", "evm", "evm_series"}.issubset(timings)
+    assert all(value >= 0 for value in timings.values())
+
+
 def test_finance_ledger_export_page_rejects_unbounded_requests():
     with pytest.raises(ValueError, match="non-negative"):
         FinanceLedgerExportPage.build([], offset=-1, limit=1)
@@ -409,3 +498,127 @@ def test_finance_ledger_export_page_rejects_unbounded_requests():
             offset=0,
             limit=MAX_FINANCE_LEDGER_EXPORT_ROWS + 1,
         )
+
+
+def _streamed_bars(count: int):
+    for index in range(count):
+        scheduled = index % 3 != 2
+        yield GanttTaskBar(
+            task_id=f"task-{index}",
+            name=f"Activity {index}",
+            start=date(2026, 6, 1) if scheduled else None,
+            end=date(2026, 6, 1 + index % 20) if scheduled else None,
+            is_critical=index % 2 == 0,
+            percent_complete=float(index % 101),
+            status="IN_PROGRESS",
+            wbs_code=f"1.{index + 1}",
+        )
+
+
+def _excel_context(bars, *, evm_series=None, cost_sources=None) -> ExcelReportContext:
+    kpi = ProjectKPI(
+        project_id="p1",
+        name="Streamed",
+        start_date=date(2026, 6, 1),
+        end_date=date(2026, 6, 30),
+        duration_working_days=22,
+        tasks_total=3,
+        tasks_completed=0,
+        tasks_in_progress=3,
+        task_blocked=0,
+        tasks_not_started=0,
+        critical_tasks=2,
+        late_tasks=0,
+        total_planned_cost=None,
+        total_actual_cost=50.0,
+        cost_variance=-50.0,
+        total_committed_cost=60.0,
+        committment_variance=-40.0,
+    )
+    return ExcelReportContext(
+        kpi=kpi,
+        resources=[],
+        evm=None,
+        evm_series=evm_series,
+        baseline_variance=None,
+        cost_breakdown=None,
+        cost_sources=cost_sources,
+        finance_snapshot=None,
+        finance_ledger_page=None,
+        as_of=date(2026, 6, 30),
+        generated_at=datetime(2026, 6, 30, 12, 0),
+        gantt=bars,
+    )
+
+
+def test_excel_renderer_streams_rows_with_the_report_layout(tmp_path):
+    series = [
+        EvmSeriesPoint(period_end=date(2026, 6, day), PV=1.0, EV=None, AC=0.5, BAC=10.0, CPI=1.0, SPI=1.0)
+        for day in (7, 14, 21)
+    ]
+    cost_sources = CostSourceBreakdown(
+        project_id="p1",
+        project_currency="USD",
+        rows=[CostSourceRow(source_key="DIRECT_COST", source_label="Direct Cost", planned=10.0, committed=0.0, actual=4.0, forecast=0.0)],
+        total_planned=10.0,
+        total_committed=0.0,
+        total_actual=4.0,
+        notes=["Labor is computed from timesheets."],
+    )
+    output = ExcelReportRenderer().render(
+        _excel_context(_streamed_bars(3), evm_series=series, cost_sources=cost_sources),
+        tmp_path / "streamed.xlsx",
+    )
+
+    wb = load_workbook(output)
+    assert wb.sheetnames == ["Overview", "Tasks", "Resources", "EVM", "Cost Sources"]
+
+    overview = wb["Overview"]
+    assert overview["A1"].font.b and overview["A1"].font.sz == 14
+    assert (overview["A5"].value, overview["B5"].value) == ("Start date", datetime(2026, 6, 1))
+    assert overview["B5"].is_date
+    # The duration after the dates keeps a plain number format.
+    assert overview["B7"].value == 22 and not overview["B7"].is_date
+    assert overview["B16"].value == "Restricted (finance.read required)"
+    assert overview.column_dimensions["A"].width == 30
+
+    tasks = wb["Tasks"]
+    assert [cell.value for cell in tasks[1]] == [
+        "Task ID", "WBS", "Name", "Start", "End", "Duration (days)", "Critical", "% complete", "Status",
+    ]
+    assert tasks["A1"].font.b and tasks["A1"].alignment.horizontal == "center"
+    assert tasks["A1"].fill.fgColor.rgb == "00DDDDDD"
+    assert [cell.value for cell in tasks[2]] == [
+        "task-0", "1.1", "Activity 0", "2026-06-01", "2026-06-01", 1, "Yes", 0, "IN_PROGRESS",
+    ]
+    # An unscheduled task keeps a bordered, empty duration cell.
+    assert tasks["F4"].value is None and tasks["F4"].border.left.style == "thin"
+    assert tasks.max_row == 4
+
+    evm = wb["EVM"]
+    assert evm["A2"].value is None and evm["D2"].value == "Period End"
+    assert [evm[f"D{row}"].value for row in (3, 4, 5)] == ["2026-06-07", "2026-06-14", "2026-06-21"]
+    assert evm["F3"].value == 0
+
+    sources = wb["Cost Sources"]
+    assert sources["A2"].value == "Direct Cost"
+    assert sources["A3"].value is None
+    assert (sources["A4"].value, sources["B4"].value) == ("Note", "Labor is computed from timesheets.")
+
+
+def test_excel_renderer_large_export_benchmark(tmp_path):
+    skip_unless_perf_tests()
+
+    count = 200_000
+    output = tmp_path / "large.xlsx"
+    tracemalloc.start()
+    started = perf_counter()
+    ExcelReportRenderer().render(_excel_context(_streamed_bars(count)), output)
+    elapsed_ms = (perf_counter() - started) * 1000
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"Excel report {count} task rows ({output.stat().st_size // 1024} KiB): "
+        f"elapsed_ms={elapsed_ms:.1f} peak_kib={peak_bytes // 1024}"
+    )
+    assert peak_bytes < 32 * 1024 * 1024
@@ -1,14 +1,41 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
+from time import perf_counter
 
 import pytest
 from matplotlib.axes import Axes
 from matplotlib.dates import date2num
+from matplotlib.figure import Figure
 
 from src.core.platform.common.exceptions import BusinessRuleError
 from src.core.modules.project_management.infrastructure.reporting import api as reporting_api
-from src.core.modules.project_management.infrastructure.reporting.models import EvmSeriesPoint
+from src.core.modules.project_management.infrastructure.reporting.exporters.renderers.gantt import (
+    GanttPngRenderer,
+    summarize_gantt_bars,
+)
+from src.core.modules.project_management.infrastructure.reporting.models import EvmSeriesPoint, GanttTaskBar
+from src.tests.perf_flags import skip_unless_perf_tests
+
+
+def _spy_collections(monkeypatch) -> dict[str, object]:
+    collections: dict[str, object] = {}
+    original_add_collection = Axes.add_collection
+
+    def _spy_add_collection(self, collection, *args, **kwargs):
+        collections[collection.get_gid()] = collection
+        return original_add_collection(self, collection, *args, **kwargs)
+
+    monkeypatch.setattr(Axes, "add_collection", _spy_add_collection)
+    return collections
+
+
+def _bar_spans(collection) -> list[tuple[float, float]]:
+    spans = []
+    for path in collection.get_paths():
+        xs = [float(x) for x, _ in path.vertices]
+        spans.append((min(xs), max(xs)))
+    return spans
 
 
 def test_gantt_export_inclusive_duration_for_one_day_tasks(services, tmp_path, monkeypatch):
@@ -19,22 +46,15 @@ def test_gantt_export_inclusive_duration_for_one_day_tasks(services, tmp_path, m
     pid = project.id
     ts.create_task(pid, "One Day Task", start_date=date(2023, 11, 6), duration_days=1)
 
-    widths = []
-    original_barh = Axes.barh
-
-    def _spy_barh(self, *args, **kwargs):
-        width = args[1] if len(args) > 1 else kwargs.get("width")
-        widths.append(width)
-        return original_barh(self, *args, **kwargs)
-
-    monkeypatch.setattr(Axes, "barh", _spy_barh)
+    collections = _spy_collections(monkeypatch)
 
     output = tmp_path / "gantt.png"
     reporting_api.generate_gantt_png(services["reporting_service"], pid, output)
 
     assert output.exists()
     assert output.stat().st_size > 0
-    assert any(float(w) >= 0.5 for w in widths if w is not None)
+    widths = [right - left for left, right in _bar_spans(collections["gantt-bars"])]
+    assert any(width >= 0.5 for width in widths)
 
 
 def test_gantt_render_uses_day_cell_alignment_for_inclusive_finish(services, tmp_path, monkeypatch):
@@ -46,14 +66,7 @@ def test_gantt_render_uses_day_cell_alignment_for_inclusive_finish(services, tmp
     pid = project.id
     task = ts.create_task(pid, "Aligned Task", start_date=date(2023, 11, 6), duration_days=3)
 
-    calls = []
-    original_barh = Axes.barh
-
-    def _spy_barh(self, *args, **kwargs):
-        calls.append((args, kwargs))
-        return original_barh(self, *args, **kwargs)
-
-    monkeypatch.setattr(Axes, "barh", _spy_barh)
+    collections = _spy_collections(monkeypatch)
 
     output = tmp_path / "gantt_aligned.png"
     reporting_api.generate_gantt_png(services["reporting_service"], pid, output)
@@ -62,17 +75,8 @@ def test_gantt_render_uses_day_cell_alignment_for_inclusive_finish(services, tmp
     bars = rp.get_gantt_data(pid)
     bar = next(b for b in bars if b.task_id == task.id)
 
-    # Main bars have dark edge color; progress overlays do not.
-    main = next(
-        (entry for entry in calls if entry[1].get("edgecolor") == "#0F172A"),
-        None,
-    )
-    assert main is not None
-    args, kwargs = main
-    width = float(args[1])
-    left = float(kwargs.get("left"))
-
-    right = left + width
+    # Main bars are drawn in their own collection; progress overlays in another.
+    (left, right), = _bar_spans(collections["gantt-bars"])
     start_num = date2num(bar.start)
     end_num = date2num(bar.end)
 
@@ -81,6 +85,109 @@ def test_gantt_render_uses_day_cell_alignment_for_inclusive_finish(services, tmp
     assert (end_num - 0.05) <= right <= (end_num + 0.2)
 
 
+def _synthetic_bars(count: int) -> list[GanttTaskBar]:
+    statuses = ("TODO", "IN_PROGRESS", "DONE", "BLOCKED")
+    return [
+        GanttTaskBar(
+            task_id=f"t{index}",
+            name=f"Task {index}",
+            start=date(2026, 1, 5) + timedelta(days=index % 300),
+            end=date(2026, 1, 5) + timedelta(days=index % 300 + index % 20),
+            is_critical=index % 9 == 0,
+            percent_complete=float(index % 5 * 25),
+            status=statuses[index % 4],
+            wbs_code=f"{index % 4 + 1}.{index % 10 + 1}.{index}",
+        )
+        for index in range(count)
+    ]
+
+
+def test_gantt_renderer_draws_one_collection_per_layer(tmp_path, monkeypatch):
+    collections = _spy_collections(monkeypatch)
+    bars = _synthetic_bars(600)
+
+    GanttPngRenderer().render(bars, tmp_path / "gantt_large.png")
+
+    assert set(collections) == {"gantt-bands", "gantt-bars", "gantt-progress"}
+    assert len(collections["gantt-bars"].get_paths()) == 600
+    assert len(collections["gantt-bands"].get_paths()) == 300
+    assert len(collections["gantt-progress"].get_paths()) == sum(1 for bar in bars if bar.percent_complete > 0)
+
+
+def test_gantt_renderer_pages_share_one_timeline(tmp_path, monkeypatch):
+    pages = []
+    original_savefig = Figure.savefig
+
+    def _spy_savefig(self, *args, **kwargs):
+        axes = self.axes[0]
+        bars = next(item for item in axes.collections if item.get_gid() == "gantt-bars")
+        pages.append((axes.get_title(), axes.get_xlim(), len(bars.get_paths())))
+        return original_savefig(self, *args, **kwargs)
+
+    monkeypatch.setattr(Figure, "savefig", _spy_savefig)
+
+    paths = GanttPngRenderer().render_pages(_synthetic_bars(25), tmp_path / "gantt.png", rows_per_page=10)
+
+    assert [path.name for path in paths] == ["gantt_p001.png", "gantt_p002.png", "gantt_p003.png"]
+    assert all(path.stat().st_size > 0 for path in paths)
+    assert [rows for _, _, rows in pages] == [10, 10, 5]
+    assert len({xlim for _, xlim, _ in pages}) == 1
+    assert [title for title, _, _ in pages][0] == "Project Gantt Schedule (page 1 of 3)"
+
+
+def test_gantt_pages_export_through_the_reporting_api(tmp_path):
+    class GanttService:
+        def get_gantt_data(self, _project_id):
+            return _synthetic_bars(25)
+
+    paths = reporting_api.generate_gantt_png_pages(
+        GanttService(),
+        "p1",
+        tmp_path / "gantt.png",
+        rows_per_page=10,
+    )
+
+    assert [path.name for path in paths] == ["gantt_p001.png", "gantt_p002.png", "gantt_p003.png"]
+    assert all(path.stat().st_size > 0 for path in paths)
+
+
+def test_summarize_gantt_bars_collapses_wbs_branches():
+    bars = [
+        GanttTaskBar("p", "Phase", date(2026, 1, 1), date(2026, 1, 20), False, 0.0, "TODO", "1"),
+        GanttTaskBar("a", "Design", date(2026, 1, 1), date(2026, 1, 11), False, 100.0, "DONE", "1.1"),
+        GanttTaskBar("b", "Draw", date(2026, 1, 2), date(2026, 1, 4), True, 0.0, "TODO", "1.1.1"),
+        GanttTaskBar("c", "Build", date(2026, 1, 12), date(2026, 1, 20), False, 0.0, "TODO", "1.2"),
+        GanttTaskBar("d", "Loose", date(2026, 1, 5), date(2026, 1, 6), False, 0.0, "TODO", ""),
+    ]
+
+    summarized = summarize_gantt_bars(bars, 2)
+
+    assert [bar.task_id for bar in summarized] == ["p", "a", "c", "d"]
+    design = summarized[1]
+    assert design.name == "1.1 Design (2 tasks)"
+    assert (design.start, design.end) == (date(2026, 1, 1), date(2026, 1, 11))
+    assert design.is_critical
+    assert design.status == "IN_PROGRESS"
+    assert design.percent_complete == pytest.approx(100.0 * 10 / 12)
+    assert summarized[2] is bars[3]
+    assert [bar.wbs_code for bar in summarize_gantt_bars(bars, 1)] == ["1", ""]
+
+
+def test_gantt_renderer_large_project_benchmark(tmp_path):
+    skip_unless_perf_tests()
+
+    bars = _synthetic_bars(10_000)
+    renderer = GanttPngRenderer()
+    started = perf_counter()
+    renderer.render(bars, tmp_path / "gantt_10k.png")
+    single_ms = (perf_counter() - started) * 1000
+    started = perf_counter()
+    renderer.render(bars, tmp_path / "gantt_10k_summary.png", summary_level=2)
+    summary_ms = (perf_counter() - started) * 1000
+    print(f"Gantt PNG 10k tasks: single_ms={single_ms:.1f} summary_level_2_ms={summary_ms:.1f}")
+    assert single_ms < 20_000
+
+
 def test_evm_export_png_is_skipped_when_no_series_data(tmp_path):
     class EmptySeriesService:
         def get_evm_series(self, _project_id, baseline_id=None, as_of=None):
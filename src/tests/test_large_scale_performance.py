@@ -8,6 +8,7 @@ from datetime import date, timedelta
 import pytest
 
 from src.core.modules.project_management.domain.enums import DependencyType
+from src.tests.perf_flags import skip_unless_perf_tests
 
 
 @dataclass(frozen=True)
@@ -33,13 +34,6 @@ class SeedResult:
     assignment_count: int
 
 
-def _env_flag(name: str, default: bool = False) -> bool:
-    raw = os.getenv(name)
-    if raw is None:
-        return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
-
-
 def _env_int(name: str, default: int) -> int:
     raw = os.getenv(name)
     if raw is None or not raw.strip():
@@ -194,8 +188,7 @@ def _assert_slas(metrics: dict[str, float], config: PerfConfig) -> None:
 
 
 def test_large_scale_performance_workflow(services):
-    if not _env_flag("PM_RUN_PERF_TESTS", default=False):
-        pytest.skip("Set PM_RUN_PERF_TESTS=1 to run large-scale performance tests.")
+    skip_unless_perf_tests()
 
     config = _load_config()
     assert config.tasks >= 200, "Large-scale performance test expects at least 200 tasks."
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+
+from src.application.runtime import LazyProxy, build_desktop_api_registry, is_lazy_resolved, resolve_lazy
+from src.infra.composition.app_container import build_service_dict, build_service_graph
+from src.infra.composition.lazy_services import LazyServiceContainer, ServiceCycleError
+
+
+def test_providers_build_once_in_dependency_order_and_are_reported():
+    calls: list[str] = []
+    services = LazyServiceContainer()
+
+    def _provide(name: str, *dependencies: str):
+        def _factory(container: LazyServiceContainer) -> str:
+            for dependency in dependencies:
+                container[dependency]
+            calls.append(name)
+            return f"{name}-instance"
+
+        return _factory
+
+    services.register("_repositories", _provide("_repositories"), internal=True)
+    services.register("clock", _provide("clock"))
+    services.register("task_service", _provide("task_service", "_repositories", "clock"))
+    services.register("report_service", _provide("report_service", "task_service"))
+
+    assert calls == []
+    assert len(services) == 3
+    assert "_repositories" in services and "_repositories" not in list(services)
+
+    assert services["report_service"] == "report_service-instance"
+    assert services["task_service"] == "task_service-instance"
+    assert calls == ["_repositories", "clock", "task_service", "report_service"]
+    report = {record.name: record for record in services.build_report()}
+    assert report["report_service"].depth == 0
+    assert report["task_service"].requested_by == "report_service"
+    assert report["clock"].depth == 2
+
+
+def test_cycles_are_reported_with_the_full_chain():
+    services = LazyServiceContainer()
+    services.register("a", lambda container: container["b"])
+    services.register("b", lambda container: container["c"])
+    services.register("c", lambda container: container["a"])
+
+    with pytest.raises(ServiceCycleError) as exc:
+        services["a"]
+
+    assert exc.value.chain == ("a", "b", "c", "a")
+    assert not services.is_built("a")
+
+
+def test_service_dict_defers_module_bundles_until_requested(session):
+    services = build_service_dict(session)
+
+    assert set(services) == set(build_service_graph(session).as_dict())
+    assert [record.name for record in services.build_report()] == [
+        "_repositories",
+        "_platform_services",
+    ]
+
+    services["site_service"]
+    assert not services.is_built("_maintenance_services")
+    assert not services.is_built("_project_management_services")
+
+    # Platform services that modules register policies/handlers against
+    # are only handed out after every module bundle has been built.
+    services["approval_service"]
+    assert services.is_built("_maintenance_services")
+    assert services.is_built("_inventory_procurement_services")
+    assert services.is_built("_project_management_services")
+
+
+def test_lazy_proxy_builds_its_target_once_on_first_use():
+    built: list[str] = []
+
+    class _Target:
+        label = "ready"
+
+    def _factory():
+        built.append("target")
+        return _Target()
+
+    proxy = LazyProxy(_factory, label="target")
+
+    assert not is_lazy_resolved(proxy)
+    assert "unresolved" in repr(proxy)
+    assert proxy.label == "ready"
+    proxy.label = "changed"
+    assert resolve_lazy(proxy).label == "changed"
+    assert built == ["target"]
+    assert resolve_lazy("plain") == "plain"
+
+
+def test_desktop_api_registry_defers_module_apis_until_first_use(session):
+    services = build_service_dict(session)
+    registry = build_desktop_api_registry(services)
+
+    assert not is_lazy_resolved(registry.maintenance_assets)
+    assert not services.is_built("_maintenance_services")
+
+    registry.maintenance_assets.list_lifecycle_statuses()
+    assert services.is_built("_maintenance_services")
+    assert is_lazy_resolved(registry.maintenance_assets)
+    assert not is_lazy_resolved(registry.project_management_projects)
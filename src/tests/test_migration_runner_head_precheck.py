@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, text
+
+from src.infra.persistence.migrations import runner
+from src.infra.persistence.migrations.head_revision import (
+    HEAD_REVISIONS_FILE,
+    resolve_head_revisions,
+    scan_head_revisions,
+    write_head_revisions_file,
+)
+
+_SCRIPT_LOCATION = Path(runner.__file__).resolve().parent
+
+
+def test_scanned_heads_match_alembic_script_directory():
+    cfg = Config(str(_SCRIPT_LOCATION / "alembic.ini"))
+    cfg.set_main_option("script_location", str(_SCRIPT_LOCATION))
+
+    assert scan_head_revisions(_SCRIPT_LOCATION) == tuple(
+        sorted(ScriptDirectory.from_config(cfg).get_heads())
+    )
+
+
+def test_frozen_build_reads_heads_from_build_time_file(tmp_path, monkeypatch):
+    (tmp_path / "versions").mkdir()
+    (tmp_path / "versions" / "a1_initial.py").write_text(
+        'revision = "a1"\ndown_revision = None\n', encoding="utf-8"
+    )
+    (tmp_path / "versions" / "b2_next.py").write_text(
+        'revision: str = "b2"\ndown_revision: str | None = "a1"\n', encoding="utf-8"
+    )
+
+    assert write_head_revisions_file(tmp_path) == ("b2",)
+    (tmp_path / HEAD_REVISIONS_FILE).write_text("built-head\n", encoding="utf-8")
+    assert resolve_head_revisions(tmp_path) == ("b2",)
+    monkeypatch.setattr(runner.sys, "frozen", True, raising=False)
+    assert resolve_head_revisions(tmp_path) == ("built-head",)
+
+
+def test_run_migrations_skips_alembic_when_database_is_at_head(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(runner, "user_data_dir", lambda: tmp_path)
+    db_url = f"sqlite:///{(tmp_path / 'startup.db').as_posix()}"
+
+    assert runner.database_at_head(db_url, _SCRIPT_LOCATION) is False
+    runner.run_migrations(db_url)
+    assert (tmp_path / "migration_timing.json").exists()
+    assert runner.database_at_head(db_url, _SCRIPT_LOCATION) is True
+
+    def _unexpected_upgrade(*_args, **_kwargs):
+        raise AssertionError("Alembic upgrade should be skipped at head")
+
+    monkeypatch.setattr(command, "upgrade", _unexpected_upgrade)
+    with caplog.at_level("INFO", logger=runner.logger.name):
+        runner.run_migrations(db_url)
+    assert "Alembic upgrade skipped" in caplog.text
+
+    engine = create_engine(db_url, future=True)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE alembic_version SET version_num = 'older-revision'"))
+    finally:
+        engine.dispose()
+    assert runner.database_at_head(db_url, _SCRIPT_LOCATION) is False
+    with pytest.raises(AssertionError, match="should be skipped"):
+        runner.run_migrations(db_url)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from src.ui_qml.shared.models.paged_table_model import (
+    PagedTableModel,
+    TablePage,
+    TablePageRequest,
+)
+
+
+class _ListSource:
+    def __init__(self, count: int) -> None:
+        self.rows = [{"id": f"row-{index:05d}", "title": f"Movement {index:05d}"} for index in range(count)]
+        self.requests: list[TablePageRequest] = []
+
+    def __call__(self, request: TablePageRequest) -> TablePage:
+        self.requests.append(request)
+        rows = self.rows
+        if request.filters.get("prefix"):
+            rows = [row for row in rows if row["title"].startswith(str(request.filters["prefix"]))]
+        if request.sort_key:
+            rows = sorted(rows, key=lambda row: row[request.sort_key], reverse=not request.ascending)
+        page = rows[request.offset:request.offset + request.limit]
+        return TablePage(
+            rows=[dict(row) for row in page],
+            next_offset=request.offset + request.limit,
+            has_more=request.offset + request.limit < len(rows),
+        )
+
+
+def _paged_model(source: _ListSource, **kwargs) -> PagedTableModel:
+    model = PagedTableModel(**kwargs)
+    model.columns = [{"key": "title", "label": "Movement"}]
+    model.set_page_source(source)
+    return model
+
+
+def test_paged_table_model_fetches_pages_as_the_view_scrolls(qapp) -> None:
+    source = _ListSource(45)
+    model = _paged_model(source, page_size=20, prefetch_rows=5)
+
+    assert model.rowCount() == 20
+    assert model.canFetchMore() is True
+
+    model.fetchMoreIfNeeded(10)
+    assert model.rowCount() == 20
+    model.fetchMoreIfNeeded(15)
+    assert model.rowCount() == 40
+    model.fetchMore()
+    assert model.rowCount() == 45
+    assert model.canFetchMore() is False
+    assert [request.offset for request in source.requests] == [0, 20, 40]
+    assert model.rowId(44) == "row-00044"
+
+
+def test_paged_table_model_evicts_pages_outside_the_window_and_refetches(qapp) -> None:
+    source = _ListSource(100)
+    model = _paged_model(source, page_size=10, window_pages=3)
+    while model.canFetchMore():
+        model.fetchMore()
+
+    assert model.rowCount() == 100
+    assert model.resident_row_count() == 30
+
+    source.requests.clear()
+    assert model.data(model.index(3, 0)) == "Movement 00003"
+    assert [request.offset for request in source.requests] == [0]
+    assert model.resident_row_count() == 30
+
+
+def test_paged_table_model_sorts_and_filters_through_the_source(qapp) -> None:
+    source = _ListSource(30)
+    model = _paged_model(source, page_size=10)
+
+    model.toggleSort("title")
+    model.toggleSort("title")
+    assert source.requests[-1].sort_key == "title"
+    assert source.requests[-1].ascending is False
+    assert model.rowId(0) == "row-00029"
+
+    assert model.set_filters({"prefix": "Movement 0001"}) is True
+    assert model.rowCount() == 10
+    assert model.canFetchMore() is False
+    assert model.set_filters({"prefix": "Movement 0001"}) is False
+
+    model.set_rows([{"id": "pushed", "title": "Pushed"}])
+    assert model.has_page_source() is False
+    assert model.rowId(0) == "pushed"
+
+
+def test_paged_table_model_ignores_columns_the_source_cannot_sort(qapp) -> None:
+    source = _ListSource(30)
+    model = PagedTableModel(page_size=10)
+    model.columns = [{"key": "title", "label": "Movement"}, {"key": "id", "label": "Id"}]
+    model.set_page_source(source, sort_keys={"title"})
+
+    model.toggleSort("id")
+    assert len(source.requests) == 1
+    assert source.requests[-1].sort_key == ""
+    model.toggleSort("title")
+    assert source.requests[-1].sort_key == "title"
+
+
+def test_paged_table_model_open_benchmark(qapp) -> None:
+    from time import perf_counter
+
+    from src.tests.perf_flags import skip_unless_perf_tests
+
+    skip_unless_perf_tests()
+
+    from src.ui_qml.shared.models.data_table_model import DynamicTableModel
+
+    source = _ListSource(50_000)
+    results: dict[str, dict[str, float]] = {}
+
+    started = perf_counter()
+    eager = DynamicTableModel()
+    eager.columns = [{"key": "title", "label": "Movement"}]
+    eager.set_rows(source(TablePageRequest(offset=0, limit=50_000)).rows)
+    results["eager"] = {"open_ms": (perf_counter() - started) * 1000, "rows_held": eager.rowCount()}
+
+    started = perf_counter()
+    paged = _paged_model(source)
+    results["paged"] = {"open_ms": (perf_counter() - started) * 1000, "rows_held": paged.resident_row_count()}
+
+    started = perf_counter()
+    for last_visible in range(0, 50_000, 40):
+        paged.fetchMoreIfNeeded(last_visible)
+    results["paged"]["scroll_to_end_ms"] = (perf_counter() - started) * 1000
+    results["paged"]["rows_held_after_scroll"] = paged.resident_row_count()
+    print(f"PagedTableModel 50k-row open benchmark: {results}")
+
+    assert paged.rowCount() == 50_000
+    assert results["paged"]["rows_held"] <= 200
+    assert results["paged"]["rows_held_after_scroll"] <= 8 * 200
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.core.modules.project_management.infrastructure.reporting.deliveries import (
+    SCHEDULED_REPORT_NOTIFICATION_CATEGORY,
+    FilesystemReportDelivery,
+    NotificationReportDelivery,
+)
+from src.core.modules.project_management.infrastructure.reporting.api import build_report_inputs
+from src.core.modules.project_management.infrastructure.reporting.exporters.renderers.excel import (
+    ExcelReportRenderer,
+)
+from src.core.modules.project_management.infrastructure.reporting.schedulers import (
+    ReportCadence,
+    ReportOutputCache,
+    ReportSchedule,
+    ReportScheduleStore,
+    ScheduledReportRunner,
+    ScheduledReportWorker,
+    report_input_fingerprint,
+)
+from src.infra.composition.app_container import build_service_dict
+from src.infra.composition.background_jobs import build_background_workers, build_scheduled_report_runner
+
+
+def test_report_cadence_finds_the_next_matching_minute():
+    monday_six = ReportCadence.parse("0 6 * * mon")
+    assert monday_six.next_after(datetime(2026, 10, 18, 23, 0)) == datetime(2026, 10, 19, 6, 0)
+    assert monday_six.next_after(datetime(2026, 10, 19, 6, 0)) == datetime(2026, 10, 26, 6, 0)
+
+    office_hours = ReportCadence.parse("*/15 9-17 * * 1-5")
+    assert office_hours.next_after(datetime(2026, 10, 19, 9, 7, 30)) == datetime(2026, 10, 19, 9, 15)
+    assert office_hours.next_after(datetime(2026, 10, 23, 17, 45)) == datetime(2026, 10, 26, 9, 0)
+
+    # Restricted day-of-month and weekday match either, as in cron.
+    assert ReportCadence.parse("0 0 1 * fri").next_after(datetime(2026, 10, 19)) == datetime(2026, 10, 23)
+    assert ReportCadence.parse("@monthly").next_after(datetime(2026, 12, 5)) == datetime(2027, 1, 1)
+    assert ReportCadence.parse("0 12 29 feb 7").next_after(datetime(2026, 3, 1)) == datetime(2027, 2, 7, 12, 0)
+
+    for expression in ("0 6 * *", "61 * * * *", "0 6 * * funday", "*/0 * * * *"):
+        with pytest.raises(ValueError):
+            ReportCadence.parse(expression)
+    with pytest.raises(ValueError, match="never fires"):
+        ReportCadence.parse("0 0 31 2 *").next_after(datetime(2026, 1, 1))
+
+
+def test_report_schedule_store_round_trips_schedules(tmp_path):
+    store = ReportScheduleStore(tmp_path / "schedules.json")
+    schedule = store.save(
+        ReportSchedule(
+            name="Weekly pack",
+            report_key="pdf_report",
+            project_id="project-1",
+            cadence="0 6 * * mon",
+            deliveries=("filesystem", "notification"),
+            recipient_user_ids=("user-1",),
+        ).scheduled_after(datetime(2026, 10, 19, 7, 0))
+    )
+
+    reloaded = ReportScheduleStore(tmp_path / "schedules.json").get(schedule.id)
+    assert reloaded == schedule
+    assert reloaded.next_run_at == datetime(2026, 10, 26, 6, 0)
+    store.delete(schedule.id)
+    assert store.list_schedules() == []
+
+    with pytest.raises(ValueError, match="cannot be scheduled"):
+        ReportSchedule(name="Gantt", report_key="gantt_png", project_id="project-1", cadence="@daily")
+    with pytest.raises(ValueError):
+        ReportSchedule(name="Bad", report_key="excel_report", project_id="project-1", cadence="daily")
+
+
+def _worker_services(session):
+    """The runner's own session on the test database, logged in as admin."""
+    worker_session = sessionmaker(bind=session.get_bind(), autoflush=False, expire_on_commit=False)
+
+    def build_services(own_session):
+        graph = build_service_dict(own_session)
+        admin = graph["auth_service"].authenticate("admin", "ChangeMe123!")
+        graph["user_session"].set_principal(graph["auth_service"].build_principal(admin))
+        return graph
+
+    return worker_session, build_services
+
+
+def _runner(session, tmp_path, store):
+    session_factory, build_services = _worker_services(session)
+    return ScheduledReportRunner(
+        store=store,
+        cache=ReportOutputCache(tmp_path / "cache"),
+        deliveries=(FilesystemReportDelivery(tmp_path / "drop"), NotificationReportDelivery()),
+        session_factory=session_factory,
+        build_services=build_services,
+        work_dir=tmp_path / "work",
+    )
+
+
+def test_scheduled_report_runner_renders_delivers_and_reuses_unchanged_outputs(
+    session, services, tmp_path, monkeypatch
+):
+    project = services["project_service"].create_project("Scheduled Pack", "", start_date=date(2026, 10, 5))
+    task = services["task_service"].create_task(project.id, "Survey", start_date=date(2026, 10, 5), duration_days=3)
+    session.commit()
+    admin_id = services["user_session"].principal.user_id
+    store = ReportScheduleStore(tmp_path / "schedules.json")
+    schedule = store.save(
+        ReportSchedule(
+            name="Weekly pack",
+            report_key="excel_report",
+            project_id=project.id,
+            cadence="0 6 * * mon",
+            deliveries=("filesystem", "notification"),
+            recipient_user_ids=(admin_id,),
+        )
+    )
+    renders = []
+    original_render = ExcelReportRenderer.render
+    monkeypatch.setattr(
+        ExcelReportRenderer,
+        "render",
+        lambda self, ctx, path: renders.append(path) or original_render(self, ctx, path),
+    )
+    runner = _runner(session, tmp_path, store)
+
+    # A new schedule is given its next slot rather than running at once.
+    assert runner.run_due(datetime(2026, 10, 18, 20, 0)) == []
+    assert store.get(schedule.id).next_run_at == datetime(2026, 10, 19, 6, 0)
+    assert runner.run_due(datetime(2026, 10, 19, 5, 59)) == []
+
+    first = runner.run_due(datetime(2026, 10, 19, 6, 0))
+    assert [run.error for run in first] == [None]
+    assert len(renders) == 1
+    assert not first[0].output.reused
+    dropped = tmp_path / "drop" / "Weekly_pack" / "20261019-0600.xlsx"
+    assert first[0].delivered_to == (str(dropped), f"notification:{admin_id}")
+    assert dropped.read_bytes() == first[0].output.path.read_bytes()
+    saved = store.get(schedule.id)
+    assert saved.next_run_at == datetime(2026, 10, 26, 6, 0)
+    assert saved.last_fingerprint == first[0].output.fingerprint
+    notifications = services["notification_service"].list_my_notifications()
+    assert [item.category for item in notifications] == [SCHEDULED_REPORT_NOTIFICATION_CATEGORY]
+    assert notifications[0].metadata["file_path"] == str(first[0].output.path)
+
+    # Same data and the same as-of date: the cached output is delivered.
+    rerun = runner.run_schedule(store.get(schedule.id), datetime(2026, 10, 19, 6, 30))
+    assert rerun.output.reused
+    assert rerun.output.path == first[0].output.path
+    assert len(renders) == 1
+
+    services["task_service"].update_progress(task.id, percent_complete=40.0)
+    session.commit()
+    changed = runner.run_schedule(store.get(schedule.id), datetime(2026, 10, 19, 7, 0))
+    assert not changed.output.reused
+    assert changed.output.fingerprint != first[0].output.fingerprint
+    assert len(renders) == 2
+
+
+def test_scheduled_report_runner_records_failures_and_moves_on(session, services, tmp_path):
+    project = services["project_service"].create_project("Scheduled Failure", "")
+    session.commit()
+    store = ReportScheduleStore(tmp_path / "schedules.json")
+    schedule = store.save(
+        ReportSchedule(
+            name="Nobody to notify",
+            report_key="excel_report",
+            project_id=project.id,
+            cadence="@daily",
+            deliveries=("notification",),
+            next_run_at=datetime(2026, 10, 19, 0, 0),
+        )
+    )
+
+    runs = _runner(session, tmp_path, store).run_due(datetime(2026, 10, 19, 0, 5))
+
+    assert runs[0].output is None
+    assert "no notification recipients" in runs[0].error
+    saved = store.get(schedule.id)
+    assert saved.last_error == runs[0].error
+    assert saved.last_run_at == datetime(2026, 10, 19, 0, 5)
+    assert saved.next_run_at == datetime(2026, 10, 20, 0, 0)
+
+
+def test_scheduled_report_worker_polls_until_stopped():
+    polled = threading.Event()
+
+    class _Runner:
+        calls = 0
+
+        def run_due(self):
+            self.calls += 1
+            polled.set()
+            raise RuntimeError("transient")
+
+    runner = _Runner()
+    worker = ScheduledReportWorker(runner, poll_seconds=0.01)
+    worker.start()
+    assert polled.wait(5)
+    worker.stop(timeout=5)
+
+    assert not worker.is_running
+    assert runner.calls >= 1
+
+
+def test_report_input_fingerprint_ignores_the_as_of_date_only_where_it_is_not_printed(session, services):
+    project = services["project_service"].create_project("Fingerprinted", "", start_date=date(2026, 10, 5))
+    services["task_service"].create_task(project.id, "Survey", start_date=date(2026, 10, 5), duration_days=3)
+    session.commit()
+
+    def fingerprint(as_of, **kwargs):
+        inputs = build_report_inputs(services["reporting_service"], project.id, as_of=as_of, **kwargs)
+        return report_input_fingerprint("excel_report", inputs)
+
+    # Without EVM or a finance snapshot the date appears nowhere in the
+    # report; the finance snapshot prints its own as-of date.
+    assert fingerprint(date(2026, 10, 19)) == fingerprint(date(2026, 10, 20))
+    finance = {"finance_service": services["finance_service"]}
+    assert fingerprint(date(2026, 10, 19), **finance) != fingerprint(date(2026, 10, 20), **finance)
+
+
+def test_report_output_cache_evicts_expired_then_least_recently_used_files(tmp_path):
+    source = tmp_path / "rendered.xlsx"
+    now = datetime(2026, 10, 19, 12, 0)
+    cache = ReportOutputCache(tmp_path / "cache", max_age=timedelta(days=7), max_bytes=250)
+    paths = {}
+    for fingerprint, size, age in (("aa01", 100, 10), ("bb02", 100, 3), ("cc03", 100, 2), ("dd04", 100, 1)):
+        source.write_bytes(b"x" * size)
+        paths[fingerprint] = cache.put(fingerprint, source)
+        stamp = (now - timedelta(days=age)).timestamp()
+        os.utime(paths[fingerprint], (stamp, stamp))
+
+    removed = cache.evict(keep=[paths["bb02"]], now=now)
+
+    # aa01 expired; cc03 is then the least recently used file not kept.
+    assert removed == 2
+    assert [fingerprint for fingerprint, path in paths.items() if path.exists()] == ["bb02", "dd04"]
+    assert cache.get("bb02", ".xlsx") == paths["bb02"]
+    assert cache.get("aa01", ".xlsx") is None
+
+
+def test_background_workers_run_scheduled_reports_as_the_signed_in_user(
+    session, services, anonymous_services, tmp_path
+):
+    project = services["project_service"].create_project("Composed Pack", "")
+    session.commit()
+    session_factory, _build_services = _worker_services(session)
+    signed_out = build_scheduled_report_runner(
+        anonymous_services["user_session"], root=tmp_path / "signed-out", session_factory=session_factory
+    )
+    signed_in = build_scheduled_report_runner(
+        services["user_session"], root=tmp_path / "signed-in", session_factory=session_factory
+    )
+    schedule = ReportSchedule(
+        name="Daily pack",
+        report_key="excel_report",
+        project_id=project.id,
+        cadence="@daily",
+        deliveries=("filesystem",),
+        next_run_at=datetime(2026, 10, 19, 0, 0),
+    )
+    signed_out._store.save(schedule)
+    signed_in._store.save(schedule)
+
+    skipped = signed_out.run_due(datetime(2026, 10, 19, 0, 5))
+    delivered = signed_in.run_due(datetime(2026, 10, 19, 0, 5))
+
+    assert skipped[0].error == "No signed-in user to run the report as."
+    assert signed_out._store.get(schedule.id).next_run_at == datetime(2026, 10, 19, 0, 0)
+    assert delivered[0].error is None
+    assert delivered[0].delivered_to == (str(tmp_path / "signed-in" / "outbox" / "Daily_pack" / "20261019-0005.xlsx"),)
+    assert [worker.name for worker in build_background_workers(services["user_session"])] == [
+        "maintenance-sensor-retention",
+        "scheduled-reports",
+    ]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.infra.persistence.db import sqlite_profile
+from src.infra.persistence.db.sqlite_profile import (
+    SQLITE_PROFILES,
+    install_sqlite_profile,
+    resolve_sqlite_profile,
+    sqlite_profile_report,
+)
+from src.tests.perf_flags import skip_unless_perf_tests
+
+
+@pytest.fixture(autouse=True)
+def _isolated_profile_state(monkeypatch):
+    for name in list(os.environ):
+        if name.startswith("PM_SQLITE_"):
+            monkeypatch.delenv(name)
+    monkeypatch.setattr(sqlite_profile, "_applied_profile", None)
+    monkeypatch.setattr(sqlite_profile, "_effective_pragmas", None)
+
+
+def _file_engine(tmp_path, profile_name: str):
+    engine = create_engine(f"sqlite:///{(tmp_path / 'profile.db').as_posix()}", future=True)
+    install_sqlite_profile(engine, resolve_sqlite_profile(profile_name))
+    return engine
+
+
+def test_performance_profile_is_applied_on_every_connection(tmp_path):
+    engine = _file_engine(tmp_path, "performance")
+    try:
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == -65536
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+    finally:
+        engine.dispose()
+
+    report = sqlite_profile_report()
+    assert report["profile"]["name"] == "performance"
+    assert report["effective_pragmas"]["journal_mode"] == "wal"
+    assert report["effective_pragmas"]["foreign_keys"] == 1
+
+
+def test_profile_is_selectable_and_overridable_from_environment(monkeypatch):
+    assert resolve_sqlite_profile().name == "performance"
+    assert resolve_sqlite_profile("legacy").pragmas() == []
+
+    monkeypatch.setenv("PM_SQLITE_PROFILE", "safe")
+    monkeypatch.setenv("PM_SQLITE_CACHE_SIZE_KIB", "8192")
+    monkeypatch.setenv("PM_SQLITE_MMAP_SIZE_MB", "16")
+    monkeypatch.setenv("PM_SQLITE_SYNCHRONOUS", "normal")
+
+    profile = resolve_sqlite_profile()
+
+    assert profile.name == "safe"
+    assert profile.synchronous == "NORMAL"
+    assert profile.cache_size_kib == 8192
+    assert profile.mmap_size_bytes == 16 * 1024 * 1024
+    assert ("cache_size", -8192) in profile.pragmas()
+
+    monkeypatch.setenv("PM_SQLITE_JOURNAL_MODE", "sideways")
+    with pytest.raises(ValueError, match="PM_SQLITE_JOURNAL_MODE"):
+        resolve_sqlite_profile()
+    with pytest.raises(ValueError, match="Unsupported SQLite profile"):
+        resolve_sqlite_profile("turbo")
+
+
+def _read_during_write(engine, *, write_batches: int, rows_per_batch: int) -> dict[str, float]:
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE IF NOT EXISTS bench (id INTEGER PRIMARY KEY, payload TEXT)"))
+        conn.execute(
+            text("INSERT INTO bench (payload) VALUES (:payload)"),
+            [{"payload": "seed" * 16} for _ in range(rows_per_batch)],
+        )
+    writer_done = threading.Event()
+    read_latencies: list[float] = []
+    read_errors: list[Exception] = []
+
+    def _writer() -> None:
+        try:
+            for _ in range(write_batches):
+                with engine.begin() as conn:
+                    conn.execute(
+                        text("INSERT INTO bench (payload) VALUES (:payload)"),
+                        [{"payload": "x" * 64} for _ in range(rows_per_batch)],
+                    )
+        finally:
+            writer_done.set()
+
+    def _reader() -> None:
+        while not writer_done.is_set():
+            started = time.perf_counter()
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT COUNT(*) FROM bench")).scalar()
+            except Exception as exc:  # pragma: no cover - reported via read_errors
+                read_errors.append(exc)
+                continue
+            read_latencies.append(time.perf_counter() - started)
+
+    threads = [threading.Thread(target=_writer), threading.Thread(target=_reader)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    read_latencies.sort()
+    return {
+        "elapsed_s": elapsed,
+        "reads": float(len(read_latencies)),
+        "read_errors": float(len(read_errors)),
+        "read_p95_ms": read_latencies[int(len(read_latencies) * 0.95)] * 1000 if read_latencies else 0.0,
+        "read_max_ms": read_latencies[-1] * 1000 if read_latencies else 0.0,
+    }
+
+
+def test_sqlite_profile_read_during_write_benchmark(tmp_path):
+    skip_unless_perf_tests()
+
+    results: dict[str, dict[str, float]] = {}
+    for profile_name in ("legacy", "performance"):
+        workdir = tmp_path / profile_name
+        workdir.mkdir()
+        engine = _file_engine(workdir, profile_name)
+        try:
+            results[profile_name] = _read_during_write(engine, write_batches=200, rows_per_batch=500)
+        finally:
+            engine.dispose()
+    print(f"sqlite read-during-write benchmark: {results}")
+
+    assert set(SQLITE_PROFILES) >= set(results)
+    assert results["performance"]["read_errors"] == 0
+    assert results["performance"]["reads"] >= results["legacy"]["reads"]
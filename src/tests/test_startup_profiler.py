@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+from zipfile import ZipFile
+
+from src.infra.platform import diagnostics, startup_profiler
+from src.infra.platform.startup_profiler import StartupProfiler, recent_trace_files
+
+
+def test_profiler_writes_chrome_trace_and_keeps_last_n(tmp_path):
+    profiler = StartupProfiler(enabled=True)
+
+    with profiler.span("startup.migrations"):
+        pass
+    profiler.begin("first_load:Tasks", "TasksController.first_load", category="workspace", once=True)
+    profiler.begin("workspace.open", route_id="pm.tasks")
+    assert profiler.end("first_load:Tasks") is True
+    profiler.begin("first_load:Tasks", once=True)
+    assert profiler.is_open("first_load:Tasks") is False
+    profiler.mark("startup.first_paint")
+
+    path = profiler.flush("startup", directory=tmp_path, keep=2)
+
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    events = {event["name"]: event for event in payload["traceEvents"]}
+    assert events["startup.migrations"]["ph"] == "X"
+    assert events["TasksController.first_load"]["cat"] == "workspace"
+    assert events["startup.first_paint"]["ph"] == "i"
+    assert "workspace.open" not in events
+    assert payload["otherData"]["label"] == "startup"
+
+    # Spans still open are written by the next flush.
+    assert profiler.end("workspace.open") is True
+    second = profiler.flush("workspace-pm.tasks", directory=tmp_path, keep=2)
+    assert json.loads(second.read_text(encoding="utf-8"))["traceEvents"][1]["args"] == {"route_id": "pm.tasks"}
+    profiler.mark("later")
+    third = profiler.flush("session", directory=tmp_path, keep=2)
+    assert recent_trace_files(directory=tmp_path) == [third, second]
+    assert profiler.flush("empty", directory=tmp_path) is None
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    profiler = StartupProfiler(enabled=False)
+    with profiler.span("startup.migrations"):
+        pass
+    profiler.begin("workspace.open")
+
+    assert profiler.end("workspace.open") is False
+    assert profiler.trace_events() == []
+    assert profiler.flush("startup", directory=tmp_path) is None
+
+
+def test_diagnostics_bundle_includes_recent_traces(tmp_path, monkeypatch):
+    monkeypatch.setattr(startup_profiler, "user_data_dir", lambda: tmp_path)
+    profiler = StartupProfiler(enabled=True)
+    for label in ("first", "second", "third"):
+        profiler.mark(label)
+        profiler.flush(label)
+
+    result = diagnostics.build_diagnostics_bundle(
+        tmp_path / "diag.zip",
+        include_db_copy=False,
+        include_traces=2,
+    )
+
+    with ZipFile(result.output_path) as bundle:
+        traces = sorted(name for name in bundle.namelist() if name.startswith("startup_trace_"))
+    assert len(traces) == 2
+    assert traces[0].endswith("_second.json")
+    assert traces[1].endswith("_third.json")
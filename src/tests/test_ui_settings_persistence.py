@@ -11,6 +11,7 @@ import main_qt
 import src.ui_qml.modules.project_management.controllers.common.workspace_controller_base as pm_workspace_controller_base
 import src.ui_qml.shell.app as shell_app
 from src.infra.platform.app_settings import AppSettingsStore
+from src.application.runtime import resolve_lazy
 
 
 def _store_with_ini(root: Path):
@@ -236,7 +237,13 @@ def test_main_qt_skip_login_does_not_bypass_unauthenticated_services(
             return 0
 
     def _fake_prompt_for_login_qml(*, auth_service, user_session):
-        calls.append(("login", auth_service is anonymous_services["auth_service"], user_session.is_authenticated()))
+        calls.append(
+            (
+                "login",
+                resolve_lazy(auth_service) is anonymous_services["auth_service"],
+                user_session.is_authenticated(),
+            )
+        )
         return False
 
     monkeypatch.setenv("PM_SKIP_LOGIN", "1")
@@ -8,6 +8,7 @@ from src.ui_qml.modules.inventory_procurement.controllers.common import (
     serialize_selector_options,
     serialize_workspace_view_model,
 )
+from src.ui_qml.shared.models.paged_table_model import TablePage, TablePageRequest
 
 
 def refresh(ctrl) -> None:
@@ -83,12 +84,53 @@ def refresh(ctrl) -> None:
                 "title": "Recent Movements",
                 "subtitle": "Opening balances, adjustments, issues, returns, and transfer history.",
                 "emptyState": workspace_state.empty_state,
-                "items": serialize_record_view_models(workspace_state.transactions),
+                "totalCount": workspace_state.movement_count,
             }
         )
+        refresh_transaction_pages(ctrl)
         ctrl._set_foundation(serialize_foundation_view_model(workspace_state.foundation))
         ctrl._set_empty_state(workspace_state.empty_state)
     except Exception as exc:  # pragma: no cover - defensive fallback
         ctrl._set_error_message(str(exc))
     finally:
         ctrl._set_is_loading(False)
+
+
+def refresh_transaction_pages(ctrl) -> None:
+    """Re-query the movements table from its first page with the current
+    filters; further pages are fetched as the table scrolls."""
+    presenter = ctrl._inventory_workspace_presenter
+    filters = presenter.build_transaction_page_filters(
+        search_text=ctrl._search_text,
+        site_filter=ctrl._selected_site_filter,
+        active_filter=ctrl._selected_active_filter,
+        storeroom_filter=ctrl._selected_storeroom_filter,
+        item_filter=ctrl._selected_item_filter,
+        transaction_type_filter=ctrl._selected_transaction_type_filter,
+    )
+    presenter.reset_transaction_pages()
+    table_model = ctrl._transactions_table_model
+    if not table_model.has_page_source():
+
+        def _fetch(request: TablePageRequest) -> TablePage:
+            rows, has_more = presenter.fetch_transaction_page(
+                offset=request.offset,
+                limit=request.limit,
+                sort_key=request.sort_key,
+                ascending=request.ascending,
+                filters=dict(request.filters),
+            )
+            return TablePage(
+                rows=serialize_record_view_models(rows),
+                next_offset=request.offset + request.limit,
+                has_more=has_more,
+            )
+
+        table_model.set_page_source(
+            _fetch,
+            filters=filters,
+            ascending=False,
+            sort_keys=presenter.transaction_sort_columns,
+        )
+    elif not table_model.set_filters(filters):
+        table_model.reload()
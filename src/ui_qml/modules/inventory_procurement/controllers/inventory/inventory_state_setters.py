@@ -162,7 +162,6 @@ def set_transactions(ctrl, transactions: dict[str, object]) -> None:
     if transactions == ctrl._transactions:
         return
     ctrl._transactions = transactions
-    ctrl._transactions_table_model.set_rows(transactions.get("items", []))
     ctrl.transactionsChanged.emit()
 
 
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from src.ui_qml.shared.models.data_table_model import DynamicTableModel
+from src.ui_qml.shared.models.paged_table_model import PagedTableModel
 
 
 def create_inventory_table_models(
     parent,
-) -> tuple[DynamicTableModel, DynamicTableModel, DynamicTableModel, DynamicTableModel]:
+) -> tuple[DynamicTableModel, DynamicTableModel, PagedTableModel, DynamicTableModel]:
     return (
         DynamicTableModel(parent),  # storerooms
         DynamicTableModel(parent),  # balances
-        DynamicTableModel(parent),  # transactions
+        PagedTableModel(parent),  # transactions (fetched page by page)
         DynamicTableModel(parent),  # foundation
     )
@@ -366,7 +366,7 @@ class InventoryProcurementInventoryWorkspaceController(
 
     @Property(int, notify=transactionsChanged)
     def movementTotalCount(self) -> int:
-        return len(self._transactions.get("items", []))
+        return int(self._transactions.get("totalCount", 0) or 0)
 
     @Property(int, notify=locationPageChanged)
     def locationPage(self) -> int:
@@ -23,10 +23,6 @@ def matches_item(stock_item_id: str, item_filter: str) -> bool:
     return item_filter == "all" or stock_item_id == item_filter
 
 
-def matches_transaction_type(transaction_type: str, filter_value: str) -> bool:
-    return filter_value == "all" or transaction_type == filter_value
-
-
 def matches_search(search_text: str, *values: str) -> bool:
     if not search_text:
         return True
@@ -6,6 +6,9 @@ from src.core.modules.inventory_procurement.api.desktop import (
     InventoryProcurementInventoryDesktopApi,
     build_inventory_procurement_inventory_desktop_api,
 )
+from src.ui_qml.modules.inventory_procurement.view_models.catalog import (
+    InventoryRecordViewModel,
+)
 from src.ui_qml.modules.inventory_procurement.view_models.inventory import (
     InventoryInventoryWorkspaceViewModel,
 )
@@ -26,6 +29,11 @@ from .storeroom_command_handler import (
     toggle_storeroom_active,
     update_storeroom,
 )
+from .transaction_pages import (
+    TRANSACTION_SORT_COLUMNS,
+    build_transaction_page_filters,
+    fetch_transaction_page,
+)
 from .workspace_builder import build_workspace_state
 
 class InventoryInventoryWorkspacePresenter:
@@ -35,6 +43,7 @@ class InventoryInventoryWorkspacePresenter:
         desktop_api: InventoryProcurementInventoryDesktopApi | None = None,
     ) -> None:
         self._desktop_api = desktop_api or build_inventory_procurement_inventory_desktop_api()
+        self._transaction_labels = None
 
     def build_workspace_state(
         self,
@@ -60,6 +69,56 @@ class InventoryInventoryWorkspacePresenter:
             selected_balance_id=selected_balance_id,
         )
 
+    def build_transaction_page_filters(
+        self,
+        *,
+        search_text: str = "",
+        site_filter: str = "all",
+        active_filter: str = "all",
+        storeroom_filter: str = "all",
+        item_filter: str = "all",
+        transaction_type_filter: str = "all",
+    ) -> dict[str, object]:
+        return build_transaction_page_filters(
+            self._desktop_api,
+            search_text=search_text,
+            site_filter=site_filter,
+            active_filter=active_filter,
+            storeroom_filter=storeroom_filter,
+            item_filter=item_filter,
+            transaction_type_filter=transaction_type_filter,
+        )
+
+    @property
+    def transaction_sort_columns(self) -> frozenset[str]:
+        return TRANSACTION_SORT_COLUMNS
+
+    def reset_transaction_pages(self) -> None:
+        """Forget the item/storeroom labels cached for the movement pages;
+        the next page reloads them."""
+        self._transaction_labels = None
+
+    def fetch_transaction_page(
+        self,
+        *,
+        offset: int,
+        limit: int,
+        sort_key: str = "",
+        ascending: bool = False,
+        filters: dict[str, object] | None = None,
+    ) -> tuple[tuple[InventoryRecordViewModel, ...], bool]:
+        if self._transaction_labels is None:
+            self._transaction_labels = self._desktop_api.list_transaction_labels()
+        return fetch_transaction_page(
+            self._desktop_api,
+            offset=offset,
+            limit=limit,
+            sort_key=sort_key,
+            ascending=ascending,
+            filters=filters,
+            labels=self._transaction_labels,
+        )
+
     def suggest_storeroom_code(self, payload: dict[str, Any]) -> str:
         return suggest_storeroom_code(self._desktop_api, payload)
 
@@ -12,7 +12,7 @@ def build_overview(
     all_balances,
     filtered_storerooms,
     filtered_balances,
-    filtered_transactions,
+    movement_count: int,
 ) -> InventoryCatalogOverviewViewModel:
     active_storerooms = sum(1 for row in all_storerooms if row.is_active)
     low_stock_count = sum(1 for row in all_balances if row.reorder_required)
@@ -42,9 +42,9 @@ def build_overview(
                 supporting_text="Balances currently below reorder expectations.",
             ),
             InventoryCatalogMetricViewModel(
-                label="Recent movements",
-                value=str(len(filtered_transactions)),
-                supporting_text="Latest stock transactions visible in the movement feed.",
+                label="Stock movements",
+                value=str(movement_count),
+                supporting_text="Stock transactions matching the current filters.",
             ),
         ),
     )
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from src.ui_qml.modules.inventory_procurement.view_models.catalog import (
+    InventoryRecordViewModel,
+)
+
+from .filtering import matches_active, matches_site, matches_storeroom_filter
+from .transaction_mapper import to_transaction_record_view_model
+
+# Table column key -> repository sort key. Every column of the movements
+# table sorts in SQL; other keys are rejected rather than silently ignored.
+_TRANSACTION_SORT_KEYS = {
+    "title": "transaction_number",
+    "subtitle": "stock_item",
+    "statusLabel": "transaction_type",
+    "supportingText": "transaction_at",
+}
+TRANSACTION_SORT_COLUMNS = frozenset(_TRANSACTION_SORT_KEYS)
+
+
+def build_transaction_page_filters(
+    desktop_api,
+    *,
+    search_text: str = "",
+    site_filter: str = "all",
+    active_filter: str = "all",
+    storeroom_filter: str = "all",
+    item_filter: str = "all",
+    transaction_type_filter: str = "all",
+    storerooms: Iterable | None = None,
+) -> dict[str, object]:
+    """Translate the workspace filters (already normalized) into the query
+    arguments of ``list_transactions_page``. ``storerooms`` spares the
+    storeroom lookup when the caller already holds them."""
+    storeroom_ids: tuple[str, ...] | None = None
+    if (site_filter, active_filter, storeroom_filter) != ("all", "all", "all"):
+        if storerooms is None:
+            storerooms = desktop_api.list_storerooms(active_only=None)
+        storeroom_ids = tuple(
+            storeroom.id
+            for storeroom in storerooms
+            if matches_active(storeroom.is_active, active_filter)
+            and matches_site(storeroom.site_id, site_filter)
+            and matches_storeroom_filter(storeroom.id, storeroom_filter)
+        )
+    return {
+        "storeroom_ids": storeroom_ids,
+        "stock_item_id": None if item_filter == "all" else item_filter,
+        "transaction_type": (
+            None if transaction_type_filter == "all" else transaction_type_filter
+        ),
+        "search_text": (search_text or "").strip() or None,
+    }
+
+
+def fetch_transaction_page(
+    desktop_api,
+    *,
+    offset: int,
+    limit: int,
+    sort_key: str = "",
+    ascending: bool = False,
+    filters: dict[str, object] | None = None,
+    labels=None,
+) -> tuple[tuple[InventoryRecordViewModel, ...], bool]:
+    """One page of movement rows; an empty ``sort_key`` keeps the register's
+    natural order (newest movement first)."""
+    repository_sort_key = None
+    if sort_key:
+        repository_sort_key = _TRANSACTION_SORT_KEYS.get(sort_key)
+        if repository_sort_key is None:
+            raise ValueError(f"The movements table cannot be sorted by '{sort_key}'.")
+    rows, has_more = desktop_api.list_transactions_page(
+        offset=offset,
+        limit=limit,
+        sort_key=repository_sort_key,
+        ascending=ascending if repository_sort_key else False,
+        labels=labels,
+        **(filters or {}),
+    )
+    return tuple(to_transaction_record_view_model(row) for row in rows), has_more
+
+
+__all__ = [
+    "TRANSACTION_SORT_COLUMNS",
+    "build_transaction_page_filters",
+    "fetch_transaction_page",
+]
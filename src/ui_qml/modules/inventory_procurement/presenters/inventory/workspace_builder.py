@@ -15,7 +15,6 @@ from .filtering import (
     matches_search,
     matches_site,
     matches_storeroom_filter,
-    matches_transaction_type,
     normalize_active_filter,
     normalize_filter,
 )
@@ -23,7 +22,7 @@ from .foundation_builder import build_foundation
 from .overview_builder import build_overview
 from .selection import resolve_selected_id
 from .storeroom_mapper import to_storeroom_record_view_model
-from .transaction_mapper import to_transaction_record_view_model
+from .transaction_pages import build_transaction_page_filters
 
 
 def build_workspace_state(
@@ -42,7 +41,6 @@ def build_workspace_state(
     all_storerooms = desktop_api.list_storerooms(active_only=None)
     all_items = desktop_api.list_items(active_only=None)
     all_balances = desktop_api.list_balances()
-    all_transactions = desktop_api.list_transactions(limit=200)
 
     site_options = (
         InventorySelectorOptionViewModel(value="all", label="All sites"),
@@ -128,25 +126,16 @@ def build_workspace_state(
             balance.uom,
         )
     )
-    filtered_transactions = tuple(
-        transaction
-        for transaction in all_transactions
-        if transaction.storeroom_id in allowed_storeroom_ids
-        and matches_item(transaction.stock_item_id, normalized_item_filter)
-        and matches_transaction_type(
-            transaction.transaction_type,
-            normalized_transaction_type_filter,
-        )
-        and matches_search(
-            normalized_search,
-            transaction.transaction_number,
-            transaction.stock_item_label,
-            transaction.storeroom_label,
-            transaction.reference_type,
-            transaction.reference_id,
-            transaction.performed_by_username,
-            transaction.notes,
-            transaction.transaction_type_label,
+    movement_count = desktop_api.count_transactions(
+        **build_transaction_page_filters(
+            desktop_api,
+            search_text=normalized_search,
+            site_filter=normalized_site_filter,
+            active_filter=normalized_active_filter,
+            storeroom_filter=normalized_storeroom_filter,
+            item_filter=normalized_item_filter,
+            transaction_type_filter=normalized_transaction_type_filter,
+            storerooms=all_storerooms,
         )
     )
 
@@ -178,7 +167,7 @@ def build_workspace_state(
             all_balances=all_balances,
             filtered_storerooms=filtered_storerooms,
             filtered_balances=filtered_balances,
-            filtered_transactions=filtered_transactions,
+            movement_count=movement_count,
         ),
         site_options=site_options,
         active_options=active_options,
@@ -201,9 +190,7 @@ def build_workspace_state(
         balances=tuple(to_balance_record_view_model(row) for row in filtered_balances),
         selected_balance_id=resolved_selected_balance_id,
         selected_balance_detail=build_balance_detail(selected_balance),
-        transactions=tuple(
-            to_transaction_record_view_model(row) for row in filtered_transactions
-        ),
+        movement_count=movement_count,
         foundation=build_foundation(
             desktop_api,
             site_filter=normalized_site_filter,
@@ -27,7 +27,7 @@ AppLayouts.WorkspaceFrame {
         { "key": "title",       "label": "Movement",        "flex": 2,   "sortable": true  },
         { "key": "subtitle",    "label": "Item / Storeroom","flex": 1.5 },
         { "key": "statusLabel", "label": "Type",            "flex": 0,   "minWidth": 110, "type": "status" },
-        { "key": "metaText",    "label": "Qty / Date",      "flex": 1 }
+        { "key": "supportingText", "label": "Qty / Date",   "flex": 1 }
     ]
 
     function _optionIndexForValue(options, value) {
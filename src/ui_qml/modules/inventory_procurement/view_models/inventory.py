@@ -47,7 +47,7 @@ class InventoryInventoryWorkspaceViewModel:
     selected_balance_detail: InventoryDetailViewModel = field(
         default_factory=InventoryDetailViewModel
     )
-    transactions: tuple[InventoryRecordViewModel, ...] = field(default_factory=tuple)
+    movement_count: int = 0
     foundation: InventoryInventoryFoundationViewModel = field(
         default_factory=lambda: InventoryInventoryFoundationViewModel(
             title="Enterprise Inventory Backbone",
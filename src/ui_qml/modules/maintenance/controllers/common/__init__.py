@@ -4,6 +4,7 @@ from src.ui_qml.modules.maintenance.controllers.common.mutation_runner import (
 from src.ui_qml.modules.maintenance.controllers.common.serializers import (
     serialize_assets_workspace_state,
     serialize_dashboard_workspace_state,
+    serialize_planner_lane_page,
     serialize_planner_workspace_state,
     serialize_preventive_workspace_state,
     serialize_reliability_workspace_state,
@@ -21,6 +22,7 @@ __all__ = [
     "run_mutation",
     "serialize_assets_workspace_state",
     "serialize_dashboard_workspace_state",
+    "serialize_planner_lane_page",
     "serialize_planner_workspace_state",
     "serialize_preventive_workspace_state",
     "serialize_reliability_workspace_state",
@@ -1,6 +1,6 @@
 from .assets_serializer import serialize_assets_workspace_state
 from .dashboard_serializer import serialize_dashboard_workspace_state
-from .planner_serializer import serialize_planner_workspace_state
+from .planner_serializer import serialize_planner_lane_page, serialize_planner_workspace_state
 from .preventive_serializer import serialize_preventive_workspace_state
 from .reliability_serializer import serialize_reliability_workspace_state
 from .selector_serializer import serialize_selector_options
@@ -11,6 +11,7 @@ from .workspace_serializer import serialize_workspace_view_model
 __all__ = [
     "serialize_assets_workspace_state",
     "serialize_dashboard_workspace_state",
+    "serialize_planner_lane_page",
     "serialize_planner_workspace_state",
     "serialize_preventive_workspace_state",
     "serialize_reliability_workspace_state",
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 from src.ui_qml.modules.maintenance.view_models.planner import (
+    MaintenancePlannerLanePageViewModel,
+    MaintenancePlannerMaterialRiskRowViewModel,
+    MaintenancePlannerRequestRowViewModel,
+    MaintenancePlannerWorkOrderRowViewModel,
     MaintenancePlannerWorkspaceViewModel,
 )
 
@@ -38,51 +42,9 @@ def serialize_planner_workspace_state(
         ),
         "selectedWorkOrderQueue": view_model.selected_work_order_queue,
         "searchText": view_model.search_text,
-        "requestRows": [
-            {
-                "id": row.id,
-                "title": row.request_label,
-                "subtitle": row.anchor_label,
-                "statusLabel": row.status_label,
-                "supportingText": f"Priority: {row.priority_label}",
-                "metaText": "",
-                "canPrimaryAction": False,
-                "canSecondaryAction": False,
-                "canTertiaryAction": False,
-                "state": {},
-            }
-            for row in view_model.request_rows
-        ],
-        "workOrderRows": [
-            {
-                "id": row.id,
-                "title": row.work_order_label,
-                "subtitle": row.work_order_type_label,
-                "statusLabel": row.status_label,
-                "supportingText": f"Priority: {row.priority_label}",
-                "metaText": f"Plan window: {row.plan_window_label}",
-                "canPrimaryAction": False,
-                "canSecondaryAction": False,
-                "canTertiaryAction": False,
-                "state": {},
-            }
-            for row in view_model.work_order_rows
-        ],
-        "materialRows": [
-            {
-                "id": row.id,
-                "title": row.material_label,
-                "subtitle": row.work_order_label,
-                "statusLabel": row.procurement_status_label,
-                "supportingText": f"Quantity: {row.quantity_label}",
-                "metaText": f"Storeroom: {row.storeroom_label}",
-                "canPrimaryAction": False,
-                "canSecondaryAction": False,
-                "canTertiaryAction": False,
-                "state": {},
-            }
-            for row in view_model.material_rows
-        ],
+        "requestRows": _serialize_request_rows(view_model.request_rows),
+        "workOrderRows": _serialize_work_order_rows(view_model.work_order_rows),
+        "materialRows": _serialize_material_rows(view_model.material_rows),
         "preventiveRows": [
             {
                 "id": row.plan_id,
@@ -122,8 +84,89 @@ def serialize_planner_workspace_state(
             }
             for row in view_model.recurring_rows
         ],
+        "requestTotal": view_model.request_total,
+        "requestNextToken": view_model.request_next_token,
+        "workOrderTotal": view_model.work_order_total,
+        "workOrderNextToken": view_model.work_order_next_token,
+        "materialTotal": view_model.material_total,
+        "materialNextToken": view_model.material_next_token,
         "emptyState": view_model.empty_state,
     }
 
 
-__all__ = ["serialize_planner_workspace_state"]
+def serialize_planner_lane_page(
+    view_model: MaintenancePlannerLanePageViewModel,
+) -> dict[str, object]:
+    return {
+        "lane": view_model.lane,
+        "rows": (
+            _serialize_request_rows(view_model.request_rows)
+            + _serialize_work_order_rows(view_model.work_order_rows)
+            + _serialize_material_rows(view_model.material_rows)
+        ),
+        "total": view_model.total,
+        "nextToken": view_model.next_token,
+    }
+
+
+def _serialize_request_rows(
+    rows: tuple[MaintenancePlannerRequestRowViewModel, ...],
+) -> list[dict[str, object]]:
+    return [
+        {
+            "id": row.id,
+            "title": row.request_label,
+            "subtitle": row.anchor_label,
+            "statusLabel": row.status_label,
+            "supportingText": f"Priority: {row.priority_label}",
+            "metaText": "",
+            "canPrimaryAction": False,
+            "canSecondaryAction": False,
+            "canTertiaryAction": False,
+            "state": {},
+        }
+        for row in rows
+    ]
+
+
+def _serialize_work_order_rows(
+    rows: tuple[MaintenancePlannerWorkOrderRowViewModel, ...],
+) -> list[dict[str, object]]:
+    return [
+        {
+            "id": row.id,
+            "title": row.work_order_label,
+            "subtitle": row.work_order_type_label,
+            "statusLabel": row.status_label,
+            "supportingText": f"Priority: {row.priority_label}",
+            "metaText": f"Plan window: {row.plan_window_label}",
+            "canPrimaryAction": False,
+            "canSecondaryAction": False,
+            "canTertiaryAction": False,
+            "state": {},
+        }
+        for row in rows
+    ]
+
+
+def _serialize_material_rows(
+    rows: tuple[MaintenancePlannerMaterialRiskRowViewModel, ...],
+) -> list[dict[str, object]]:
+    return [
+        {
+            "id": row.id,
+            "title": row.material_label,
+            "subtitle": row.work_order_label,
+            "statusLabel": row.procurement_status_label,
+            "supportingText": f"Quantity: {row.quantity_label}",
+            "metaText": f"Storeroom: {row.storeroom_label}",
+            "canPrimaryAction": False,
+            "canSecondaryAction": False,
+            "canTertiaryAction": False,
+            "state": {},
+        }
+        for row in rows
+    ]
+
+
+__all__ = ["serialize_planner_lane_page", "serialize_planner_workspace_state"]
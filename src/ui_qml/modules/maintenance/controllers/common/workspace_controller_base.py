@@ -12,6 +12,7 @@ from src.core.shared.events.domain_events import (
     domain_events,
 )
 from src.core.shared.events.signal import Signal as DomainSignal
+from src.infra.platform.startup_profiler import trace_first_load
 
 QML_IMPORT_NAME = "Maintenance.Controllers"
 QML_IMPORT_MAJOR_VERSION = 1
@@ -96,6 +97,7 @@ class MaintenanceWorkspaceControllerBase(QObject):
             return
         self._is_loading = value
         self.isLoadingChanged.emit()
+        trace_first_load(self, loading=value)
         if not value:
             self._flush_pending_domain_refresh()
 
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from src.core.modules.maintenance.api.desktop.planner import (
+    MAINTENANCE_PLANNER_MATERIAL_LANE,
+    MAINTENANCE_PLANNER_REQUEST_LANE,
+    MAINTENANCE_PLANNER_WORK_ORDER_LANE,
+)
+from src.ui_qml.modules.maintenance.controllers.common import (
+    serialize_planner_lane_page,
+)
+
+from .planner_helpers import normalized_filter
+from .planner_property_updates import (
+    set_lane_state,
+    set_material_rows,
+    set_request_rows,
+    set_work_order_rows,
+)
+
+_LANE_ROWS = {
+    MAINTENANCE_PLANNER_REQUEST_LANE: ("_request_rows", set_request_rows),
+    MAINTENANCE_PLANNER_WORK_ORDER_LANE: ("_work_order_rows", set_work_order_rows),
+    MAINTENANCE_PLANNER_MATERIAL_LANE: ("_material_rows", set_material_rows),
+}
+
+
+def load_more_lane(controller, lane: str) -> None:
+    """Append the next page of ``lane`` to its rows, continuing from the
+    token the last snapshot or page left."""
+    page_token = controller._lane_next_tokens.get(lane, "")
+    if lane not in _LANE_ROWS or not page_token or controller._is_busy:
+        return
+    rows_attr, set_rows = _LANE_ROWS[lane]
+    controller._set_is_busy(True)
+    try:
+        controller._set_error_message("")
+        page = serialize_planner_lane_page(
+            controller._planner_workspace_presenter.load_lane_page(
+                lane,
+                page_token=page_token,
+                site_id=normalized_filter(controller._selected_site_filter),
+                asset_id=normalized_filter(controller._selected_asset_filter),
+                system_id=normalized_filter(controller._selected_system_filter),
+                request_queue=controller._selected_request_queue,
+                work_order_queue=controller._selected_work_order_queue,
+                search_text=controller._search_text,
+            )
+        )
+        set_rows(controller, [*getattr(controller, rows_attr), *page["rows"]])
+        set_lane_state(
+            controller,
+            lane,
+            total=int(page["total"]),
+            next_token=str(page["nextToken"]),
+        )
+    except Exception as exc:  # pragma: no cover - defensive fallback
+        controller._set_error_message(str(exc))
+    finally:
+        controller._set_is_busy(False)
@@ -121,3 +121,21 @@ def set_recurring_rows(controller, rows: list) -> None:
         return
     controller._recurring_rows = rows
     controller.recurringRowsChanged.emit()
+
+
+_LANE_SIGNALS = {
+    "requests": "requestLaneChanged",
+    "work_orders": "workOrderLaneChanged",
+    "materials": "materialLaneChanged",
+}
+
+
+def set_lane_state(controller, lane: str, *, total: int, next_token: str) -> None:
+    if (
+        controller._lane_totals.get(lane) == total
+        and controller._lane_next_tokens.get(lane) == next_token
+    ):
+        return
+    controller._lane_totals[lane] = total
+    controller._lane_next_tokens[lane] = next_token
+    getattr(controller, _LANE_SIGNALS[lane]).emit()
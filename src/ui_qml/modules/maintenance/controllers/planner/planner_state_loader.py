@@ -8,6 +8,7 @@ from src.ui_qml.modules.maintenance.controllers.common import (
 from .planner_helpers import normalized_filter
 from .planner_property_updates import (
     set_asset_options,
+    set_lane_state,
     set_material_rows,
     set_overview,
     set_preventive_rows,
@@ -64,6 +65,17 @@ def load_workspace_state(controller) -> None:
         set_material_rows(controller, state["materialRows"])
         set_preventive_rows(controller, state["preventiveRows"])
         set_recurring_rows(controller, state["recurringRows"])
+        for lane, prefix in (
+            ("requests", "request"),
+            ("work_orders", "workOrder"),
+            ("materials", "material"),
+        ):
+            set_lane_state(
+                controller,
+                lane,
+                total=int(state[f"{prefix}Total"]),
+                next_token=str(state[f"{prefix}NextToken"]),
+            )
         controller._set_empty_state(str(state["emptyState"]))
     except Exception as exc:  # pragma: no cover - defensive fallback
         controller._set_error_message(str(exc))
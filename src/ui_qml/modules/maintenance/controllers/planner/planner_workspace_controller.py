@@ -18,6 +18,7 @@ from .planner_filter_actions import (
     apply_system_filter,
     apply_work_order_queue,
 )
+from .planner_lane_loader import load_more_lane
 from .planner_state_loader import load_workspace_state
 
 QML_IMPORT_NAME = "Maintenance.Controllers"
@@ -44,6 +45,9 @@ class MaintenancePlannerWorkspaceController(MaintenanceWorkspaceControllerBase):
     materialRowsChanged = Signal()
     preventiveRowsChanged = Signal()
     recurringRowsChanged = Signal()
+    requestLaneChanged = Signal()
+    workOrderLaneChanged = Signal()
+    materialLaneChanged = Signal()
 
     def __init__(
         self,
@@ -76,6 +80,8 @@ class MaintenancePlannerWorkspaceController(MaintenanceWorkspaceControllerBase):
         self._material_rows: list[dict[str, object]] = []
         self._preventive_rows: list[dict[str, object]] = []
         self._recurring_rows: list[dict[str, object]] = []
+        self._lane_totals: dict[str, int] = {}
+        self._lane_next_tokens: dict[str, str] = {}
         self._bind_domain_events()
         self.refresh()
 
@@ -149,6 +155,30 @@ class MaintenancePlannerWorkspaceController(MaintenanceWorkspaceControllerBase):
     def recurringRows(self) -> list[dict[str, object]]:
         return self._recurring_rows
 
+    @Property(int, notify=requestLaneChanged)
+    def requestTotal(self) -> int:
+        return self._lane_totals.get("requests", 0)
+
+    @Property(bool, notify=requestLaneChanged)
+    def canLoadMoreRequests(self) -> bool:
+        return bool(self._lane_next_tokens.get("requests"))
+
+    @Property(int, notify=workOrderLaneChanged)
+    def workOrderTotal(self) -> int:
+        return self._lane_totals.get("work_orders", 0)
+
+    @Property(bool, notify=workOrderLaneChanged)
+    def canLoadMoreWorkOrders(self) -> bool:
+        return bool(self._lane_next_tokens.get("work_orders"))
+
+    @Property(int, notify=materialLaneChanged)
+    def materialTotal(self) -> int:
+        return self._lane_totals.get("materials", 0)
+
+    @Property(bool, notify=materialLaneChanged)
+    def canLoadMoreMaterials(self) -> bool:
+        return bool(self._lane_next_tokens.get("materials"))
+
     # --- Slots ---
 
     @Slot()
@@ -179,6 +209,10 @@ class MaintenancePlannerWorkspaceController(MaintenanceWorkspaceControllerBase):
     def setSearchText(self, search_text: str) -> None:
         apply_search_text(self, search_text)
 
+    @Slot(str)
+    def loadMoreLane(self, lane: str) -> None:
+        load_more_lane(self, lane)
+
     # --- Domain event wiring ---
 
     def _bind_domain_events(self) -> None:
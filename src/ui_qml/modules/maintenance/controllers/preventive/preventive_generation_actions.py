@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from .preventive_helpers import normalize_id
+from .preventive_helpers import normalize_filter, normalize_id
 
 
 def regenerate_plan_schedule(controller, plan_id: str) -> dict:
@@ -46,3 +46,27 @@ def generate_due_work(controller, plan_id: str) -> dict:
         return {"ok": False, "message": str(exc)}
     finally:
         controller._set_is_busy(False)
+
+
+def generate_all_due_work(controller) -> dict:
+    site_filter = normalize_filter(controller._queue_site_filter)
+    controller._set_is_busy(True)
+    controller._set_error_message("")
+    try:
+        controller._latest_generation_results = (
+            controller._preventive_workspace_presenter.generate_all_due_work(
+                site_id="" if site_filter == "all" else site_filter
+            )
+        )
+        controller.refresh()
+        message = (
+            f"Due work generated for {len(controller._latest_generation_results)} plan(s)."
+        )
+        controller._set_feedback_message(message)
+        return {"ok": True, "message": message}
+    except Exception as exc:
+        controller._set_feedback_message("")
+        controller._set_error_message(str(exc))
+        return {"ok": False, "message": str(exc)}
+    finally:
+        controller._set_is_busy(False)
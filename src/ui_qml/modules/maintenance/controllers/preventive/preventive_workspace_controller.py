@@ -11,6 +11,7 @@ from src.ui_qml.modules.maintenance.presenters import (
     MaintenanceWorkspacePresenter,
 )
 from .preventive_generation_actions import (
+    generate_all_due_work,
     generate_due_work,
     regenerate_plan_schedule,
 )
@@ -179,6 +180,10 @@ class MaintenancePreventiveWorkspaceController(MaintenanceWorkspaceControllerBas
     def generateDueWork(self, plan_id: str) -> dict[str, object]:
         return generate_due_work(self, plan_id)
 
+    @Slot(result="QVariantMap")
+    def generateAllDueWork(self) -> dict[str, object]:
+        return generate_all_due_work(self)
+
     @Slot(str)
     def setPlanSiteFilter(self, site_id: str) -> None:
         apply_plan_site_filter(self, site_id)
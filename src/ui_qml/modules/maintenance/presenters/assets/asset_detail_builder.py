@@ -9,7 +9,7 @@ from .asset_mapper import to_asset_record_view_model
 from .formatting import number_text
 
 
-def build_asset_detail(row) -> MaintenanceAssetLibraryDetailViewModel:
+def build_asset_detail(row, subtree=None) -> MaintenanceAssetLibraryDetailViewModel:
     if row is None:
         return MaintenanceAssetLibraryDetailViewModel(
             title="No asset selected",
@@ -61,6 +61,7 @@ def build_asset_detail(row) -> MaintenanceAssetLibraryDetailViewModel:
                     f"Warranty: {row.warranty_start or '-'} to {row.warranty_end or '-'}"
                 ),
             ),
+            *_subtree_fields(subtree),
             MaintenanceAssetLibraryDetailFieldViewModel(
                 label="Notes",
                 value=row.notes or "-",
@@ -77,3 +78,21 @@ def build_asset_detail(row) -> MaintenanceAssetLibraryDetailViewModel:
         ),
         state=to_asset_record_view_model(row).state,
     )
+
+
+def _subtree_fields(subtree) -> tuple[MaintenanceAssetLibraryDetailFieldViewModel, ...]:
+    if subtree is None:
+        return ()
+    return (
+        MaintenanceAssetLibraryDetailFieldViewModel(
+            label="Asset tree",
+            value=(
+                f"{subtree.asset_count - 1} assets below | "
+                f"{subtree.open_work_order_count} of {subtree.work_order_count} work orders open"
+            ),
+            supporting_text=(
+                f"Depth: {subtree.max_depth} | Downtime: {subtree.downtime_minutes} min | "
+                f"Material lines: {subtree.material_requirement_count}"
+            ),
+        ),
+    )
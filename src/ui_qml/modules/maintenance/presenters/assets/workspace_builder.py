@@ -353,7 +353,10 @@ def build_workspace_state(
         selected_component_id=resolved_component_id,
         selected_location_detail=build_location_detail(selected_location),
         selected_system_detail=build_system_detail(selected_system),
-        selected_asset_detail=build_asset_detail(selected_asset),
+        selected_asset_detail=build_asset_detail(
+            selected_asset,
+            desktop_api.summarize_asset_subtree(selected_asset.id) if selected_asset is not None else None,
+        ),
         selected_component_detail=build_component_detail(selected_component),
         form_site_options=form_site_options,
         form_location_options=form_location_options,
@@ -5,10 +5,11 @@ from src.core.modules.maintenance.api.desktop import (
     build_maintenance_planner_desktop_api,
 )
 from src.ui_qml.modules.maintenance.view_models.planner import (
+    MaintenancePlannerLanePageViewModel,
     MaintenancePlannerWorkspaceViewModel,
 )
 
-from .workspace_builder import build_workspace_state
+from .workspace_builder import build_lane_page, build_workspace_state
 
 
 class MaintenancePlannerWorkspacePresenter:
@@ -39,5 +40,29 @@ class MaintenancePlannerWorkspacePresenter:
             search_text=search_text,
         )
 
+    def load_lane_page(
+        self,
+        lane: str,
+        *,
+        page_token: str,
+        site_id: str | None = None,
+        asset_id: str | None = None,
+        system_id: str | None = None,
+        request_queue: str = "",
+        work_order_queue: str = "",
+        search_text: str = "",
+    ) -> MaintenancePlannerLanePageViewModel:
+        return build_lane_page(
+            self._desktop_api,
+            lane,
+            page_token=page_token,
+            site_id=site_id,
+            asset_id=asset_id,
+            system_id=system_id,
+            request_queue=request_queue,
+            work_order_queue=work_order_queue,
+            search_text=search_text,
+        )
+
 
 __all__ = ["MaintenancePlannerWorkspacePresenter"]
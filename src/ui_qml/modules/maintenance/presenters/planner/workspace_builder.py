@@ -1,6 +1,14 @@
 from __future__ import annotations
 
+from src.core.modules.maintenance.api.desktop.planner import (
+    MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS,
+    MAINTENANCE_PLANNER_MATERIAL_LANE,
+    MAINTENANCE_PLANNER_OPEN_REQUESTS,
+    MAINTENANCE_PLANNER_REQUEST_LANE,
+    MAINTENANCE_PLANNER_WORK_ORDER_LANE,
+)
 from src.ui_qml.modules.maintenance.view_models.planner import (
+    MaintenancePlannerLanePageViewModel,
     MaintenancePlannerWorkspaceViewModel,
 )
 
@@ -55,5 +63,55 @@ def build_workspace_state(
         material_rows=tuple(material_risk_row(row) for row in snapshot.material_rows),
         preventive_rows=tuple(preventive_row(row) for row in snapshot.preventive_rows),
         recurring_rows=tuple(recurring_row(row) for row in snapshot.recurring_rows),
+        request_total=snapshot.request_total,
+        request_next_token=snapshot.request_next_token,
+        work_order_total=snapshot.work_order_total,
+        work_order_next_token=snapshot.work_order_next_token,
+        material_total=snapshot.material_total,
+        material_next_token=snapshot.material_next_token,
         empty_state=snapshot.empty_state,
     )
+
+
+def build_lane_page(
+    desktop_api,
+    lane: str,
+    *,
+    page_token: str,
+    site_id: str | None = None,
+    asset_id: str | None = None,
+    system_id: str | None = None,
+    request_queue: str = "",
+    work_order_queue: str = "",
+    search_text: str = "",
+) -> MaintenancePlannerLanePageViewModel:
+    page = desktop_api.load_lane_page(
+        lane,
+        page_token=page_token,
+        site_id=site_id or None,
+        asset_id=asset_id or None,
+        system_id=system_id or None,
+        request_queue=request_queue or MAINTENANCE_PLANNER_OPEN_REQUESTS,
+        work_order_queue=work_order_queue or MAINTENANCE_PLANNER_BACKLOG_WORK_ORDERS,
+        search_text=search_text,
+    )
+    return MaintenancePlannerLanePageViewModel(
+        lane=page.lane,
+        request_rows=(
+            tuple(request_row(row) for row in page.rows)
+            if page.lane == MAINTENANCE_PLANNER_REQUEST_LANE
+            else ()
+        ),
+        work_order_rows=(
+            tuple(work_order_row(row) for row in page.rows)
+            if page.lane == MAINTENANCE_PLANNER_WORK_ORDER_LANE
+            else ()
+        ),
+        material_rows=(
+            tuple(material_risk_row(row) for row in page.rows)
+            if page.lane == MAINTENANCE_PLANNER_MATERIAL_LANE
+            else ()
+        ),
+        total=page.total,
+        next_token=page.next_token,
+    )
@@ -6,3 +6,8 @@ from .generation_result_mapper import generation_result_record
 def generate_due_work(desktop_api, *, plan_id: str) -> list[dict]:
     rows = desktop_api.generate_due_work(plan_id=plan_id)
     return [generation_result_record(row) for row in rows]
+
+
+def generate_all_due_work(desktop_api, *, site_id: str) -> list[dict]:
+    rows = desktop_api.generate_all_due_work(site_id=site_id or None)
+    return [generation_result_record(row) for row in rows]
@@ -143,6 +143,9 @@ class MaintenancePreventiveWorkspacePresenter:
     def generate_due_work(self, *, plan_id: str) -> list[dict[str, object]]:
         return _gen.generate_due_work(self._desktop_api, plan_id=plan_id)
 
+    def generate_all_due_work(self, *, site_id: str = "") -> list[dict[str, object]]:
+        return _gen.generate_all_due_work(self._desktop_api, site_id=site_id)
+
     def regenerate_plan_schedule(self, *, plan_id: str) -> None:
         _plan.regenerate_plan_schedule(self._desktop_api, plan_id=plan_id)
 
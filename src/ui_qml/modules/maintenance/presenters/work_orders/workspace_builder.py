@@ -106,7 +106,7 @@ def build_workspace_state(
         status=None if normalized_status_filter == "all" else normalized_status_filter,
         priority=None if normalized_priority_filter == "all" else normalized_priority_filter,
         work_order_type=None if normalized_work_order_type_filter == "all" else normalized_work_order_type_filter,
-        asset_id=None if normalized_asset_filter == "all" else normalized_asset_filter,
+        under_asset_id=None if normalized_asset_filter == "all" else normalized_asset_filter,
     )
     if normalized_search:
         filtered_rows = tuple(
@@ -22,6 +22,7 @@ Item {
     property bool secondaryDanger: false
     property bool tertiaryDanger: false
     property bool actionsEnabled: true
+    property bool canLoadMore: false
     property string selectedItemId: ""
     property var items: []
 
@@ -30,9 +31,11 @@ Item {
     signal primaryActionRequested(var itemData)
     signal secondaryActionRequested(var itemData)
     signal tertiaryActionRequested(var itemData)
+    signal loadMoreRequested()
 
     implicitWidth: 420
     implicitHeight: headerCol.implicitHeight + listCol.implicitHeight
+        + (loadMoreButton.visible ? loadMoreButton.implicitHeight + Theme.AppTheme.spacingSm : 0)
 
     ColumnLayout {
         anchors.fill: parent
@@ -226,5 +229,15 @@ Item {
                 }
             }
         }
+
+        AppControls.SecondaryButton {
+            id: loadMoreButton
+            Layout.alignment: Qt.AlignHCenter
+            Layout.topMargin: Theme.AppTheme.spacingSm
+            visible: root.canLoadMore
+            enabled: root.actionsEnabled
+            text: "Load more"
+            onClicked: root.loadMoreRequested()
+        }
     }
 }
@@ -123,18 +123,39 @@ AppLayouts.WorkspaceFrame {
                 Layout.fillWidth: true
                 items: root.workspaceController ? root.workspaceController.requestRows : []
                 emptyState: root.workspaceController ? root.workspaceController.emptyState : ""
+                canLoadMore: root.workspaceController ? root.workspaceController.canLoadMoreRequests : false
+                actionsEnabled: root.workspaceController ? !root.workspaceController.isBusy : false
+                onLoadMoreRequested: function() {
+                    if (root.workspaceController) {
+                        root.workspaceController.loadMoreLane("requests")
+                    }
+                }
             }
 
             Sections.PlannerBacklogSection {
                 Layout.fillWidth: true
                 items: root.workspaceController ? root.workspaceController.workOrderRows : []
                 emptyState: root.workspaceController ? root.workspaceController.emptyState : ""
+                canLoadMore: root.workspaceController ? root.workspaceController.canLoadMoreWorkOrders : false
+                actionsEnabled: root.workspaceController ? !root.workspaceController.isBusy : false
+                onLoadMoreRequested: function() {
+                    if (root.workspaceController) {
+                        root.workspaceController.loadMoreLane("work_orders")
+                    }
+                }
             }
 
             Sections.PlannerMaterialRisksSection {
                 Layout.fillWidth: true
                 items: root.workspaceController ? root.workspaceController.materialRows : []
                 emptyState: root.workspaceController ? root.workspaceController.emptyState : ""
+                canLoadMore: root.workspaceController ? root.workspaceController.canLoadMoreMaterials : false
+                actionsEnabled: root.workspaceController ? !root.workspaceController.isBusy : false
+                onLoadMoreRequested: function() {
+                    if (root.workspaceController) {
+                        root.workspaceController.loadMoreLane("materials")
+                    }
+                }
             }
 
             Sections.PlannerPreventiveSection {
@@ -149,6 +149,12 @@ AppLayouts.WorkspaceFrame {
                             root.workspaceController.generateDueWork(planId)
                         }
                     }
+
+                    onGenerateAllRequested: function() {
+                        if (root.workspaceController !== null) {
+                            root.workspaceController.generateAllDueWork()
+                        }
+                    }
                 }
 
                 Sections.PreventivePlansSection {
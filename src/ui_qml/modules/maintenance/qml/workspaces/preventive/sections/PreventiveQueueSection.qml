@@ -29,6 +29,7 @@ ColumnLayout {
     signal planSelected(string planId)
     signal regenerateRequested(string planId)
     signal generateRequested(string planId)
+    signal generateAllRequested()
 
     function indexOfValue(options, value) {
         for (let index = 0; index < options.length; index += 1) {
@@ -103,6 +104,13 @@ ColumnLayout {
                     onClicked: root.refreshRequested()
                 }
 
+                AppControls.SecondaryButton {
+                    text: "Generate All Due"
+                    iconName: "add"
+                    enabled: !root.isBusy
+                    onClicked: root.generateAllRequested()
+                }
+
                 Item { Layout.fillWidth: true }
             }
         }
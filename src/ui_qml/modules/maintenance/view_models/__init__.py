@@ -20,6 +20,7 @@ from src.ui_qml.modules.maintenance.view_models.dashboard import (
     MaintenanceOptionViewModel,
 )
 from src.ui_qml.modules.maintenance.view_models.planner import (
+    MaintenancePlannerLanePageViewModel,
     MaintenancePlannerMaterialRiskRowViewModel,
     MaintenancePlannerMetricViewModel,
     MaintenancePlannerOptionViewModel,
@@ -84,6 +85,7 @@ __all__ = [
     "MaintenanceFailureSymptomOptionViewModel",
     "MaintenanceMetricViewModel",
     "MaintenanceOptionViewModel",
+    "MaintenancePlannerLanePageViewModel",
     "MaintenancePlannerMaterialRiskRowViewModel",
     "MaintenancePlannerMetricViewModel",
     "MaintenancePlannerOptionViewModel",
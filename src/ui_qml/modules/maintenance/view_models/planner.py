@@ -118,10 +118,33 @@ class MaintenancePlannerWorkspaceViewModel:
     recurring_rows: tuple[MaintenancePlannerRecurringRowViewModel, ...] = field(
         default_factory=tuple
     )
+    request_total: int = 0
+    request_next_token: str = ""
+    work_order_total: int = 0
+    work_order_next_token: str = ""
+    material_total: int = 0
+    material_next_token: str = ""
     empty_state: str = ""
 
 
+@dataclass(frozen=True)
+class MaintenancePlannerLanePageViewModel:
+    lane: str
+    request_rows: tuple[MaintenancePlannerRequestRowViewModel, ...] = field(
+        default_factory=tuple
+    )
+    work_order_rows: tuple[MaintenancePlannerWorkOrderRowViewModel, ...] = field(
+        default_factory=tuple
+    )
+    material_rows: tuple[MaintenancePlannerMaterialRiskRowViewModel, ...] = field(
+        default_factory=tuple
+    )
+    total: int = 0
+    next_token: str = ""
+
+
 __all__ = [
+    "MaintenancePlannerLanePageViewModel",
     "MaintenancePlannerMaterialRiskRowViewModel",
     "MaintenancePlannerMetricViewModel",
     "MaintenancePlannerOptionViewModel",
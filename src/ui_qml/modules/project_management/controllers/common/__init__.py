@@ -84,6 +84,9 @@ from src.ui_qml.modules.project_management.controllers.common.undo_stack import
     ProjectManagementUndoCommand,
     ProjectManagementUndoStack,
 )
+from src.ui_qml.modules.project_management.controllers.common.domain_refresh import (
+    DomainRefreshDelta,
+)
 from src.ui_qml.modules.project_management.controllers.common.runtime_context import (
     resolve_active_organization_id_from_runtime_api,
 )
@@ -98,6 +101,7 @@ from src.ui_qml.modules.project_management.controllers.common.pm_workspace_navig
 )
 
 __all__ = [
+    "DomainRefreshDelta",
     "PMCapabilityController",
     "PMWorkspaceNavigationController",
     "ProjectManagementWorkspaceControllerBase",
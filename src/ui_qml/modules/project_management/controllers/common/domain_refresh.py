@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class DomainRefreshDelta:
+    """Entity changes collected between two debounced domain refreshes.
+
+    ``changed`` maps entity type to the ids reported by the events. A
+    ``full`` delta comes from an explicit refresh request (e.g. after a
+    mutation) and invalidates everything."""
+
+    changed: Mapping[str, frozenset[str]] = field(default_factory=dict)
+    full: bool = False
+
+    @property
+    def entity_types(self) -> frozenset[str]:
+        return frozenset(self.changed)
+
+    def ids(self, entity_type: str) -> frozenset[str]:
+        return self.changed.get(entity_type, frozenset())
+
+    def touches(self, *entity_types: str) -> bool:
+        return self.full or any(entity_type in self.changed for entity_type in entity_types)
+
+    def stale_sections(self, section_dependencies: Mapping[str, Iterable[str]]) -> frozenset[str]:
+        """Sections whose declared entity types changed (all of them for a
+        full delta)."""
+        if self.full:
+            return frozenset(section_dependencies)
+        return frozenset(
+            section
+            for section, entity_types in section_dependencies.items()
+            if any(entity_type in self.changed for entity_type in entity_types)
+        )
+
+
+__all__ = ["DomainRefreshDelta"]
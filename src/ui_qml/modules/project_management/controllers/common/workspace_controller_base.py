@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Mapping
+from typing import Any, ClassVar
 
 from PySide6.QtCore import QCoreApplication, Property, QObject, QTimer, Signal, Slot
 from PySide6.QtQml import QmlElement, QmlUncreatable
@@ -10,6 +10,10 @@ from PySide6.QtQml import QmlElement, QmlUncreatable
 from src.core.shared.events.domain_events import DomainChangeEvent, domain_events
 from src.core.shared.events.signal import Signal as DomainSignal
 from src.infra.platform.app_settings import AppSettingsStore
+from src.infra.platform.startup_profiler import trace_first_load
+from src.ui_qml.modules.project_management.controllers.common.domain_refresh import (
+    DomainRefreshDelta,
+)
 from src.ui_qml.modules.project_management.controllers.common.runtime_context import (
     resolve_active_organization_id_from_runtime_api,
 )
@@ -31,6 +35,11 @@ class ProjectManagementWorkspaceControllerBase(QObject):
     emptyStateChanged = Signal()
     sectionErrorsChanged = Signal()
 
+    # Section name -> entity types it is built from. Controllers that
+    # declare sections and implement ``refresh_changed(delta)`` get
+    # entity-scoped refreshes for domain events; others reload fully.
+    domain_refresh_sections: ClassVar[Mapping[str, frozenset[str]]] = {}
+
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._app_settings = AppSettingsStore()
@@ -48,6 +57,9 @@ class ProjectManagementWorkspaceControllerBase(QObject):
         self._empty_state = ""
         self._section_errors: dict[str, str] = {}
         self._pending_domain_refresh = False
+        self._pending_domain_changes: dict[str, set[str]] = {}
+        self._pending_full_domain_refresh = False
+        self._handling_domain_event = False
         self._domain_refresh_scheduled = False
         self._domain_refresh_timer = QTimer(self)
         self._domain_refresh_timer.setSingleShot(True)
@@ -140,6 +152,7 @@ class ProjectManagementWorkspaceControllerBase(QObject):
             return
         self._is_loading = value
         self.isLoadingChanged.emit()
+        trace_first_load(self, loading=value)
         if not value:
             self._flush_pending_domain_refresh()
 
@@ -230,7 +243,7 @@ class ProjectManagementWorkspaceControllerBase(QObject):
                 event.scope_code,
                 event.category,
             )
-            self._request_domain_refresh()
+            self._request_domain_change_refresh(event)
 
         self._subscribe_domain_signal(domain_events.domain_changed, _handler)
         logger.debug(
@@ -241,7 +254,21 @@ class ProjectManagementWorkspaceControllerBase(QObject):
             category or "-",
         )
 
+    def _request_domain_change_refresh(self, event: DomainChangeEvent) -> None:
+        ids = self._pending_domain_changes.setdefault(event.entity_type, set())
+        if event.entity_id:
+            ids.add(event.entity_id)
+        self._handling_domain_event = True
+        try:
+            self._request_domain_refresh()
+        finally:
+            self._handling_domain_event = False
+
     def _request_domain_refresh(self) -> None:
+        # Explicit requests (e.g. after a mutation) reload everything; the
+        # ones queued for a matched domain event can be entity-scoped.
+        if not self._handling_domain_event:
+            self._pending_full_domain_refresh = True
         self._pending_domain_refresh = True
         if self._is_loading or self._is_busy:
             logger.debug(
@@ -277,11 +304,35 @@ class ProjectManagementWorkspaceControllerBase(QObject):
         if self._is_loading or self._is_busy or not self._pending_domain_refresh:
             return
         self._pending_domain_refresh = False
+        delta = self._take_domain_refresh_delta()
+        refresh_changed = getattr(self, "refresh_changed", None)
+        if not delta.full and self.domain_refresh_sections and callable(refresh_changed):
+            logger.debug(
+                "Domain delta refresh executing context=%s entity_types=%s",
+                self._diagnostic_context(),
+                sorted(delta.entity_types),
+            )
+            refresh_changed(delta)
+            return
         refresh = getattr(self, "refresh", None)
         if callable(refresh):
             logger.debug("Domain refresh executing context=%s", self._diagnostic_context())
             refresh()
 
+    def _take_domain_refresh_delta(self) -> DomainRefreshDelta:
+        if self._pending_full_domain_refresh:
+            delta = DomainRefreshDelta(full=True)
+        else:
+            delta = DomainRefreshDelta(
+                changed={
+                    entity_type: frozenset(ids)
+                    for entity_type, ids in self._pending_domain_changes.items()
+                }
+            )
+        self._pending_domain_changes = {}
+        self._pending_full_domain_refresh = False
+        return delta
+
     def _disconnect_domain_event_subscriptions(
         self,
         _object: QObject | None = None,
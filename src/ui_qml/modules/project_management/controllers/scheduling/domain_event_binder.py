@@ -1,5 +1,26 @@
 from __future__ import annotations
 
+from src.ui_qml.modules.project_management.controllers.common import DomainRefreshDelta
+from src.ui_qml.modules.project_management.presenters.scheduling.section_cache import (
+    BASELINES_SECTION,
+    CALENDARS_SECTION,
+    PROJECTS_SECTION,
+    SCHEDULE_SECTION,
+)
+
+# Which scheduling sections are built from which domain entity types.
+SCHEDULING_DOMAIN_REFRESH_SECTIONS: dict[str, frozenset[str]] = {
+    PROJECTS_SECTION: frozenset({"project"}),
+    CALENDARS_SECTION: frozenset({"working_calendar"}),
+    BASELINES_SECTION: frozenset({"project_baseline"}),
+    SCHEDULE_SECTION: frozenset({"project", "project_tasks", "resource"}),
+}
+
+# Events of these types carry the id of the project they changed, so
+# changes to other projects leave the project-bound sections alone.
+_PROJECT_SCOPED_ENTITY_TYPES = frozenset({"project", "project_tasks", "project_baseline"})
+_PROJECT_BOUND_SECTIONS = frozenset({BASELINES_SECTION, SCHEDULE_SECTION})
+
 
 def bind_scheduling_domain_events(controller: object) -> None:
     controller._subscribe_domain_change(
@@ -16,4 +37,27 @@ def bind_scheduling_domain_events(controller: object) -> None:
     )
 
 
-__all__ = ["bind_scheduling_domain_events"]
+def stale_scheduling_sections(
+    delta: DomainRefreshDelta,
+    *,
+    selected_project_id: str,
+) -> frozenset[str]:
+    stale = set(delta.stale_sections(SCHEDULING_DOMAIN_REFRESH_SECTIONS))
+    if delta.full or not selected_project_id:
+        return frozenset(stale)
+    for section in _PROJECT_BOUND_SECTIONS & stale:
+        entity_types = SCHEDULING_DOMAIN_REFRESH_SECTIONS[section] & delta.entity_types
+        if entity_types <= _PROJECT_SCOPED_ENTITY_TYPES and not any(
+            # An event without an id cannot be scoped; treat it as a match.
+            not delta.ids(entity_type) or selected_project_id in delta.ids(entity_type)
+            for entity_type in entity_types
+        ):
+            stale.discard(section)
+    return frozenset(stale)
+
+
+__all__ = [
+    "SCHEDULING_DOMAIN_REFRESH_SECTIONS",
+    "bind_scheduling_domain_events",
+    "stale_scheduling_sections",
+]
@@ -82,6 +82,7 @@ def load_workspace_state(controller) -> None:
             selected_activity_id=controller._selected_activity_id or None,
             include_unchanged=bool(controller._baselines.get("includeUnchanged", False)),
             activity_log=tuple(controller._activity_log_svc.log),
+            section_cache=controller._section_cache,
         )
         set_overview(controller, serialize_scheduling_overview_view_model(ws.overview))
         set_project_options(controller, serialize_selector_options(ws.project_options))
@@ -109,6 +110,7 @@ def load_workspace_state(controller) -> None:
         set_selected_activity_id(controller, ws.selected_activity_id)
         panels = serialize_workspace_panels(ws)
         hydrate_visible_panel_models(controller, panels)
+        controller._timeline_bar_model.set_timeline(ws.timeline_bars, ws.timeline_links)
         set_selected_activity(
             controller,
             serialize_scheduling_detail_view_model(ws.selected_activity_detail),
@@ -4,16 +4,22 @@ from PySide6.QtCore import Property, QObject, Signal, Slot
 from PySide6.QtQml import QmlElement, QmlUncreatable
 
 from src.ui_qml.modules.project_management.controllers.common import (
+    DomainRefreshDelta,
     ProjectManagementWorkspaceControllerBase,
 )
 from src.ui_qml.modules.project_management.presenters import (
     ProjectManagementWorkspacePresenter,
     ProjectSchedulingWorkspacePresenter,
 )
+from src.ui_qml.modules.project_management.presenters.scheduling import SchedulingSectionCache
 from src.ui_qml.shared.models.data_table_model import DynamicTableModel
 
 from .activity_log_service import ActivityLogService
-from .domain_event_binder import bind_scheduling_domain_events
+from .domain_event_binder import (
+    SCHEDULING_DOMAIN_REFRESH_SECTIONS,
+    bind_scheduling_domain_events,
+    stale_scheduling_sections,
+)
 from .filter_service import filter_rows
 from .leveling_actions import apply_resource_leveling, preview_resource_leveling
 from .mutation_handler import SchedulingMutationHandler
@@ -106,6 +112,7 @@ from .state import (
     default_selected_activity,
 )
 from .table_models import create_scheduling_table_models
+from .timeline_model import SchedulingTimelineModel
 
 QML_IMPORT_NAME = "ProjectManagement.Controllers"
 QML_IMPORT_MAJOR_VERSION = 1
@@ -176,6 +183,8 @@ class ProjectManagementSchedulingWorkspaceController(
     levelingProposalChanged = Signal()
     levelingMoveRowsChanged = Signal()
 
+    domain_refresh_sections = SCHEDULING_DOMAIN_REFRESH_SECTIONS
+
     def __init__(
         self,
         *,
@@ -191,7 +200,9 @@ class ProjectManagementSchedulingWorkspaceController(
             scheduling_workspace_presenter or ProjectSchedulingWorkspacePresenter()
         )
         self._table_models = create_scheduling_table_models(self)
+        self._timeline_bar_model = SchedulingTimelineModel(self)
         self._activity_log_svc = ActivityLogService()
+        self._section_cache = SchedulingSectionCache()
         self._mutations = SchedulingMutationHandler(
             presenter=self._scheduling_workspace_presenter,
             activity_log_service=self._activity_log_svc,
@@ -534,6 +545,10 @@ class ProjectManagementSchedulingWorkspaceController(
     def holidayTableModel(self) -> DynamicTableModel:
         return self._table_models.holiday
 
+    @Property(QObject, constant=True)
+    def timelineBarModel(self) -> SchedulingTimelineModel:
+        return self._timeline_bar_model
+
     # ── Activity / calculator / impact properties ─────────────────────
 
     @Property("QVariantMap", notify=selectedActivityChanged)
@@ -572,6 +587,16 @@ class ProjectManagementSchedulingWorkspaceController(
 
     @Slot()
     def refresh(self) -> None:
+        self._section_cache.clear()
+        load_workspace_state(self)
+
+    def refresh_changed(self, delta: DomainRefreshDelta) -> None:
+        """Reload only the sections built from the changed entities;
+        events for other projects are ignored entirely."""
+        stale = stale_scheduling_sections(delta, selected_project_id=self._selected_project_id)
+        if not stale:
+            return
+        self._section_cache.invalidate(stale)
         load_workspace_state(self)
 
     # ── Panel / filter / selection slots ─────────────────────────────
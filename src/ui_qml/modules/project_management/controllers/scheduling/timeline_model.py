@@ -0,0 +1,363 @@
+"""List model behind the scheduling Gantt timeline.
+
+One row per activity in table order. Bar geometry is held in packed
+arrays (day ordinals, flag bits, progress) rather than per-row dicts, so a
+10k-activity project costs a few hundred kilobytes and a refresh that keeps
+the same rows only emits ``dataChanged``. The QML ListView instantiates
+delegates for the visible rows only; ``visibleBars`` narrows a row range to
+the bars that intersect a time window and ``connectorsForRows`` resolves
+dependency connectors for the visible rows only.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from datetime import date
+
+from PySide6.QtCore import (
+    Property,
+    QAbstractListModel,
+    QByteArray,
+    QModelIndex,
+    Qt,
+    Signal,
+    Slot,
+)
+
+from src.ui_qml.modules.project_management.view_models.scheduling import (
+    SchedulingTimelineBarViewModel,
+    SchedulingTimelineLinkViewModel,
+)
+
+FLAG_CRITICAL = 1
+FLAG_MILESTONE = 2
+FLAG_DELAYED = 4
+FLAG_UNSCHEDULED = 8
+
+_DEPENDENCY_TYPES = ("FS", "SS", "FF", "SF")
+
+
+def _bar_flags(bar: SchedulingTimelineBarViewModel) -> int:
+    flags = 0
+    if bar.critical:
+        flags |= FLAG_CRITICAL
+    if bar.milestone:
+        flags |= FLAG_MILESTONE
+    if bar.delayed:
+        flags |= FLAG_DELAYED
+    if not bar.start_ordinal or not bar.finish_ordinal:
+        flags |= FLAG_UNSCHEDULED
+    return flags
+
+
+def _ordinal_label(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat() if ordinal > 0 else ""
+
+
+class SchedulingTimelineModel(QAbstractListModel):
+    TaskIdRole = Qt.UserRole + 1
+    TitleRole = Qt.UserRole + 2
+    StartOrdinalRole = Qt.UserRole + 3
+    FinishOrdinalRole = Qt.UserRole + 4
+    RowIndexRole = Qt.UserRole + 5
+    FlagsRole = Qt.UserRole + 6
+    CriticalRole = Qt.UserRole + 7
+    MilestoneRole = Qt.UserRole + 8
+    ProgressRole = Qt.UserRole + 9
+
+    countChanged = Signal()
+    windowChanged = Signal()
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._ids: list[str] = []
+        self._titles: list[str] = []
+        self._starts = array("i")
+        self._finishes = array("i")
+        self._flags = array("B")
+        self._progress = array("B")
+        self._row_by_id: dict[str, int] = {}
+        # Links as (predecessor row, successor row) pairs plus an index into
+        # _DEPENDENCY_TYPES. The links touching row r are
+        # _row_links[_row_link_offsets[r]:_row_link_offsets[r + 1]].
+        self._link_rows = array("i")
+        self._link_types = array("B")
+        self._row_link_offsets = array("i", (0,))
+        self._row_links = array("i")
+        self._window_start = 0
+        self._window_finish = 0
+        self._today = date.today().toordinal()
+
+    # ── Qt model interface ───────────────────────────────────────────
+
+    def roleNames(self) -> dict[int, QByteArray]:
+        return {
+            self.TaskIdRole: QByteArray(b"taskId"),
+            self.TitleRole: QByteArray(b"title"),
+            self.StartOrdinalRole: QByteArray(b"startOrdinal"),
+            self.FinishOrdinalRole: QByteArray(b"finishOrdinal"),
+            self.RowIndexRole: QByteArray(b"rowIndex"),
+            self.FlagsRole: QByteArray(b"flags"),
+            self.CriticalRole: QByteArray(b"critical"),
+            self.MilestoneRole: QByteArray(b"milestone"),
+            self.ProgressRole: QByteArray(b"progress"),
+        }
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if row < 0 or row >= len(self._ids):
+            return None
+        if role in (Qt.DisplayRole, self.TitleRole):
+            return self._titles[row]
+        if role == self.TaskIdRole:
+            return self._ids[row]
+        if role == self.StartOrdinalRole:
+            return self._starts[row]
+        if role == self.FinishOrdinalRole:
+            return self._finishes[row]
+        if role == self.RowIndexRole:
+            return row
+        if role == self.FlagsRole:
+            return self._flags[row]
+        if role == self.CriticalRole:
+            return bool(self._flags[row] & FLAG_CRITICAL)
+        if role == self.MilestoneRole:
+            return bool(self._flags[row] & FLAG_MILESTONE)
+        if role == self.ProgressRole:
+            return self._progress[row]
+        return None
+
+    # ── Python API ───────────────────────────────────────────────────
+
+    def set_timeline(
+        self,
+        bars: Sequence[SchedulingTimelineBarViewModel],
+        links: Sequence[SchedulingTimelineLinkViewModel] = (),
+    ) -> None:
+        ids = [bar.id for bar in bars]
+        titles = [bar.title for bar in bars]
+        starts = array("i", (bar.start_ordinal for bar in bars))
+        finishes = array("i", (bar.finish_ordinal for bar in bars))
+        flags = array("B", (_bar_flags(bar) for bar in bars))
+        progress = array("B", (bar.progress_percent for bar in bars))
+
+        same_rows = ids == self._ids
+        if same_rows:
+            changed = (
+                titles != self._titles
+                or starts != self._starts
+                or finishes != self._finishes
+                or flags != self._flags
+                or progress != self._progress
+            )
+            self._store_rows(ids, titles, starts, finishes, flags, progress)
+            if changed and ids:
+                self.dataChanged.emit(self.index(0), self.index(len(ids) - 1))
+        else:
+            previous_count = len(self._ids)
+            self.beginResetModel()
+            self._store_rows(ids, titles, starts, finishes, flags, progress)
+            self.endResetModel()
+            if previous_count != len(ids):
+                self.countChanged.emit()
+        self._store_links(links)
+        self._update_window()
+
+    def task_id(self, row: int) -> str:
+        return self._ids[row] if 0 <= row < len(self._ids) else ""
+
+    def _store_rows(self, ids, titles, starts, finishes, flags, progress) -> None:
+        self._ids = ids
+        self._titles = titles
+        self._starts = starts
+        self._finishes = finishes
+        self._flags = flags
+        self._progress = progress
+        self._row_by_id = {task_id: row for row, task_id in enumerate(ids)}
+
+    def _store_links(self, links: Sequence[SchedulingTimelineLinkViewModel]) -> None:
+        link_rows = array("i")
+        link_types = array("B")
+        row_count = len(self._ids)
+        degrees = [0] * (row_count + 1)
+        for link in links:
+            # Links to activities outside the current filter have no row.
+            predecessor_row = self._row_by_id.get(link.predecessor_id)
+            successor_row = self._row_by_id.get(link.successor_id)
+            if predecessor_row is None or successor_row is None:
+                continue
+            link_rows.append(predecessor_row)
+            link_rows.append(successor_row)
+            link_types.append(
+                _DEPENDENCY_TYPES.index(link.dependency_type)
+                if link.dependency_type in _DEPENDENCY_TYPES
+                else 0
+            )
+            degrees[predecessor_row + 1] += 1
+            if successor_row != predecessor_row:
+                degrees[successor_row + 1] += 1
+        for row in range(row_count):
+            degrees[row + 1] += degrees[row]
+        offsets = array("i", degrees)
+        row_links = array("i", bytes(offsets.itemsize * degrees[-1]))
+        cursor = degrees[:-1]
+        for link_index in range(len(link_types)):
+            predecessor_row = link_rows[link_index * 2]
+            successor_row = link_rows[link_index * 2 + 1]
+            row_links[cursor[predecessor_row]] = link_index
+            cursor[predecessor_row] += 1
+            if successor_row != predecessor_row:
+                row_links[cursor[successor_row]] = link_index
+                cursor[successor_row] += 1
+        self._link_rows = link_rows
+        self._link_types = link_types
+        self._row_link_offsets = offsets
+        self._row_links = row_links
+
+    def _update_window(self) -> None:
+        window_start = 0
+        window_finish = 0
+        for row, row_flags in enumerate(self._flags):
+            if row_flags & FLAG_UNSCHEDULED:
+                continue
+            start = self._starts[row]
+            finish = self._finishes[row]
+            if not window_start or start < window_start:
+                window_start = start
+            if finish > window_finish:
+                window_finish = finish
+        today = date.today().toordinal()
+        if (window_start, window_finish, today) != (
+            self._window_start,
+            self._window_finish,
+            self._today,
+        ):
+            self._window_start = window_start
+            self._window_finish = window_finish
+            self._today = today
+            self.windowChanged.emit()
+
+    # ── QML API ──────────────────────────────────────────────────────
+
+    @Property(int, notify=countChanged)
+    def count(self) -> int:
+        return len(self._ids)
+
+    @Property(int, notify=windowChanged)
+    def windowStartOrdinal(self) -> int:
+        return self._window_start
+
+    @Property(int, notify=windowChanged)
+    def windowFinishOrdinal(self) -> int:
+        return self._window_finish
+
+    @Property(int, notify=windowChanged)
+    def windowDays(self) -> int:
+        if not self._window_start:
+            return 1
+        return max(1, self._window_finish - self._window_start + 1)
+
+    @Property(str, notify=windowChanged)
+    def windowStartLabel(self) -> str:
+        return _ordinal_label(self._window_start)
+
+    @Property(str, notify=windowChanged)
+    def windowFinishLabel(self) -> str:
+        return _ordinal_label(self._window_finish)
+
+    @Property(int, notify=windowChanged)
+    def todayOrdinal(self) -> int:
+        return self._today
+
+    @Slot(str, result=int)
+    def rowForTask(self, task_id: str) -> int:
+        return self._row_by_id.get(task_id, -1)
+
+    @Slot(int, int, int, int, result="QVariantList")
+    def visibleBars(
+        self,
+        first_row: int,
+        last_row: int,
+        start_ordinal: int,
+        finish_ordinal: int,
+    ) -> list[int]:
+        """Rows in ``first_row..last_row`` whose bar intersects the
+        ``start_ordinal..finish_ordinal`` window."""
+        first = max(0, first_row)
+        last = min(len(self._ids) - 1, last_row)
+        starts = self._starts
+        finishes = self._finishes
+        flags = self._flags
+        return [
+            row
+            for row in range(first, last + 1)
+            if not flags[row] & FLAG_UNSCHEDULED
+            and finishes[row] >= start_ordinal
+            and starts[row] <= finish_ordinal
+        ]
+
+    @Slot(int, int, result="QVariantList")
+    def connectorsForRows(self, first_row: int, last_row: int) -> list[dict[str, object]]:
+        """Dependency connectors with at least one end in
+        ``first_row..last_row``. Each connector runs from the predecessor's
+        finish (start for SS/SF) to the successor's start (finish for
+        FF/SF)."""
+        first = max(0, first_row)
+        last = min(len(self._ids) - 1, last_row)
+        seen: set[int] = set()
+        connectors: list[dict[str, object]] = []
+        for row in range(first, last + 1):
+            for link_index in self._row_links[
+                self._row_link_offsets[row]:self._row_link_offsets[row + 1]
+            ]:
+                if link_index in seen:
+                    continue
+                seen.add(link_index)
+                connector = self._connector(link_index)
+                if connector is not None:
+                    connectors.append(connector)
+        return connectors
+
+    def _connector(self, link_index: int) -> dict[str, object] | None:
+        predecessor_row = self._link_rows[link_index * 2]
+        successor_row = self._link_rows[link_index * 2 + 1]
+        if (self._flags[predecessor_row] | self._flags[successor_row]) & FLAG_UNSCHEDULED:
+            return None
+        dependency_type = _DEPENDENCY_TYPES[self._link_types[link_index]]
+        from_ordinal = (
+            self._starts[predecessor_row]
+            if dependency_type in ("SS", "SF")
+            else self._finishes[predecessor_row]
+        )
+        to_ordinal = (
+            self._finishes[successor_row]
+            if dependency_type in ("FF", "SF")
+            else self._starts[successor_row]
+        )
+        return {
+            "fromRow": predecessor_row,
+            "toRow": successor_row,
+            "fromOrdinal": from_ordinal,
+            "toOrdinal": to_ordinal,
+            "type": dependency_type,
+            "critical": bool(
+                self._flags[predecessor_row] & self._flags[successor_row] & FLAG_CRITICAL
+            ),
+        }
+
+
+__all__ = [
+    "FLAG_CRITICAL",
+    "FLAG_DELAYED",
+    "FLAG_MILESTONE",
+    "FLAG_UNSCHEDULED",
+    "SchedulingTimelineModel",
+]
@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from src.core.modules.project_management.application.imports import (
     CsvImportParser,
     ImportValidationService,
     ImportValidationSeverity,
     MSProjectXmlParser,
+    MSProjectXmlStreamingParser,
     P6Parser,
+    P6StreamingParser,
 )
 from src.ui_qml.modules.project_management.utils.file_paths import local_path_from_qml_file_url
 
 _PARSERS = {
     "csv": CsvImportParser,
-    "ms_project_xml": MSProjectXmlParser,
-    "p6_xer": P6Parser,
+    "ms_project_xml": MSProjectXmlStreamingParser,
+    "ms_project_xml_legacy": MSProjectXmlParser,
+    "p6_xer": P6StreamingParser,
+    "p6_xer_legacy": P6Parser,
 }
+# Parsers that read the file themselves, in batches, instead of taking its bytes.
+_STREAMING_PARSERS = (MSProjectXmlStreamingParser, P6StreamingParser)
+_PREVIEW_ROW_LIMIT = 50
 
 
 def preview_import(
@@ -30,20 +39,35 @@ def preview_import(
             f"Unsupported import format: '{source_format}'. "
             "Supported formats: csv, ms_project_xml, p6_xer."
         )
+    svc = ImportValidationService()
     try:
-        with open(normalized_path, "rb") as fh:
-            source_bytes = fh.read()
+        if issubclass(parser_cls, _STREAMING_PARSERS):
+            preview = _stream_preview(svc, parser_cls(), Path(normalized_path))
+        else:
+            with open(normalized_path, "rb") as fh:
+                source_bytes = fh.read()
+            rows = parser_cls().parse(source_bytes)
+            preview = svc.build_preview(rows, svc.validate(rows))
     except OSError as exc:
         raise ValueError(f"Cannot read file: {exc}") from exc
 
-    rows = parser_cls().parse(source_bytes)
-    svc = ImportValidationService()
-    issues = svc.validate(rows)
-    preview = svc.build_preview(rows, issues)
     import_sessions[preview.session_id] = preview
     return serialize_import_preview(preview)
 
 
+def _stream_preview(svc: ImportValidationService, parser, path: Path):
+    """Validate the file batch by batch; the preview keeps a sample of the
+    task rows and a count of the other records."""
+    builder = svc.preview_builder(sample_size=_PREVIEW_ROW_LIMIT)
+    task_kind = "Task" if isinstance(parser, MSProjectXmlStreamingParser) else "TASK"
+    for kind, batch in parser.iter_import_batches(path):
+        if kind == task_kind:
+            builder.add_rows(batch)
+        else:
+            builder.count_records(kind, len(batch))
+    return builder.build()
+
+
 def execute_import(
     import_sessions: dict[str, object],
     *,
@@ -73,7 +97,7 @@ def serialize_import_preview(preview) -> dict[str, object]:
         if issue.severity == ImportValidationSeverity.ERROR
     }
     rows_view = []
-    for row in preview.rows[:50]:
+    for row in preview.rows[:_PREVIEW_ROW_LIMIT]:
         rows_view.append({
             "rowNumber": row.row_number,
             "name": str(
@@ -94,4 +118,5 @@ def serialize_import_preview(preview) -> dict[str, object]:
         "canCommit": preview.can_commit,
         "rows": rows_view,
         "issueCount": len(preview.issues),
+        "recordCounts": dict(preview.record_counts),
     }
@@ -2,5 +2,8 @@
 from src.ui_qml.modules.project_management.presenters.scheduling.scheduling_workspace_presenter import (
     ProjectSchedulingWorkspacePresenter,
 )
+from src.ui_qml.modules.project_management.presenters.scheduling.section_cache import (
+    SchedulingSectionCache,
+)
 
-__all__ = ["ProjectSchedulingWorkspacePresenter"]
+__all__ = ["ProjectSchedulingWorkspacePresenter", "SchedulingSectionCache"]
@@ -13,7 +13,6 @@ from .formatters import (
     format_date,
     int_label,
     shift_label,
-    timeline_bounds,
 )
 
 def to_schedule_record(
@@ -72,8 +71,13 @@ def to_schedule_record(
         },
     )
 
-def to_timeline_record(item: Any, *, timeline_items: Any) -> SchedulingRecordViewModel:
-    bounds = timeline_bounds(timeline_items)
+def to_timeline_record(
+    item: Any,
+    *,
+    bounds: tuple[date | None, date | None],
+) -> SchedulingRecordViewModel:
+    """``bounds`` is ``timeline_bounds(...)`` of the rendered items,
+    computed once by the caller."""
     start_offset = days_between(bounds[0], item.start_date)
     finish_offset = days_between(bounds[0], item.finish_date)
     current_offset = days_between(bounds[0], date.today())
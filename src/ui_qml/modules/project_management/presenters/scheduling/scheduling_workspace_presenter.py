@@ -26,6 +26,7 @@ from .command_handler import (
     update_dependency,
 )
 from .leveling_builder import build_resource_leveling_state
+from .section_cache import SchedulingSectionCache
 from .workspace_builder import build_workspace_state
 
 class ProjectSchedulingWorkspacePresenter:
@@ -55,6 +56,7 @@ class ProjectSchedulingWorkspacePresenter:
         selected_activity_id: str | None = None,
         include_unchanged: bool = False,
         activity_log: tuple[dict[str, str], ...] = (),
+        section_cache: SchedulingSectionCache | None = None,
     ) -> SchedulingWorkspaceViewModel:
         return build_workspace_state(
             self._desktop_api,
@@ -74,6 +76,7 @@ class ProjectSchedulingWorkspacePresenter:
             selected_activity_id=selected_activity_id,
             include_unchanged=include_unchanged,
             activity_log=activity_log,
+            section_cache=section_cache,
         )
 
     def create_baseline(self, payload: dict[str, Any]) -> None:
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+PROJECTS_SECTION = "projects"
+CALENDARS_SECTION = "calendars"
+BASELINES_SECTION = "baselines"
+SCHEDULE_SECTION = "schedule"
+
+SCHEDULING_SECTIONS = (
+    PROJECTS_SECTION,
+    CALENDARS_SECTION,
+    BASELINES_SECTION,
+    SCHEDULE_SECTION,
+)
+
+
+class SchedulingSectionCache:
+    """Desktop API results of the last scheduling workspace build, grouped
+    by section.
+
+    Each result is keyed by its call arguments, so changing the selected
+    project, calendar or baselines fetches again on its own. Invalidating a
+    section drops everything it holds; the next build re-queries only the
+    invalidated sections."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, dict[Hashable, object]] = {}
+        self.fetch_count = 0
+
+    def fetch(self, section: str, key: Hashable, loader: Callable[[], T]) -> T:
+        entries = self._entries.setdefault(section, {})
+        if key in entries:
+            return entries[key]  # type: ignore[return-value]
+        value = loader()
+        entries[key] = value
+        self.fetch_count += 1
+        return value
+
+    def invalidate(self, sections: Iterable[str]) -> None:
+        for section in sections:
+            self._entries.pop(section, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def cached_fetch(
+    cache: SchedulingSectionCache | None,
+    section: str,
+    key: Hashable,
+    loader: Callable[[], T],
+) -> T:
+    if cache is None:
+        return loader()
+    return cache.fetch(section, key, loader)
+
+
+__all__ = [
+    "BASELINES_SECTION",
+    "CALENDARS_SECTION",
+    "PROJECTS_SECTION",
+    "SCHEDULE_SECTION",
+    "SCHEDULING_SECTIONS",
+    "SchedulingSectionCache",
+    "cached_fetch",
+]
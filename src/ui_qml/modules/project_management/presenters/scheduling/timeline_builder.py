@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Any
+
+from src.ui_qml.modules.project_management.view_models.scheduling import (
+    SchedulingTimelineBarViewModel,
+    SchedulingTimelineLinkViewModel,
+)
+
+
+def to_timeline_bar(item: Any) -> SchedulingTimelineBarViewModel:
+    start = item.start_date or item.finish_date
+    finish = item.finish_date or item.start_date
+    return SchedulingTimelineBarViewModel(
+        id=item.id,
+        title=item.name,
+        start_ordinal=start.toordinal() if start else 0,
+        finish_ordinal=finish.toordinal() if finish else 0,
+        progress_percent=max(0, min(100, int(round(float(item.percent_complete or 0.0))))),
+        critical=bool(item.is_critical),
+        milestone=bool(item.start_date and item.finish_date and item.start_date == item.finish_date),
+        delayed=(item.late_by_days or 0) > 0,
+    )
+
+
+def build_timeline_bars(schedule_items: Any) -> tuple[SchedulingTimelineBarViewModel, ...]:
+    """Bars for every filtered activity in table order -- not only the
+    visible page; the timeline model virtualizes them."""
+    return tuple(to_timeline_bar(item) for item in schedule_items)
+
+
+def build_timeline_links(dependency_rows: Any) -> tuple[SchedulingTimelineLinkViewModel, ...]:
+    return tuple(
+        SchedulingTimelineLinkViewModel(
+            predecessor_id=row.predecessor_task_id,
+            successor_id=row.successor_task_id,
+            dependency_type=row.dependency_type or "FS",
+        )
+        for row in dependency_rows
+    )
+
+
+__all__ = ["build_timeline_bars", "build_timeline_links", "to_timeline_bar"]
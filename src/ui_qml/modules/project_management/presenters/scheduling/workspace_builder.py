@@ -21,6 +21,7 @@ from .formatters import (
     build_schedule_empty_state,
     calendar_label as get_calendar_label,
     label_for_option,
+    timeline_bounds,
 )
 from .option_resolver import (
     build_status_options,
@@ -42,7 +43,16 @@ from .record_mappers import (
     to_timeline_record,
 )
 from .schedule_filter import matches_schedule_filters
+from .section_cache import (
+    BASELINES_SECTION,
+    CALENDARS_SECTION,
+    PROJECTS_SECTION,
+    SCHEDULE_SECTION,
+    SchedulingSectionCache,
+    cached_fetch,
+)
 from .schedule_sort import normalize_schedule_sort, sort_schedule_items
+from .timeline_builder import build_timeline_bars, build_timeline_links
 
 logger = logging.getLogger(__name__)
 
@@ -66,12 +76,14 @@ def build_workspace_state(
     selected_activity_id: str | None = None,
     include_unchanged: bool = False,
     activity_log: tuple[dict[str, str], ...] = (),
+    section_cache: SchedulingSectionCache | None = None,
 ) -> SchedulingWorkspaceViewModel:
     started = perf_counter()
+    cache = section_cache
 
     project_options = tuple(
         SchedulingSelectorOptionViewModel(value=option.value, label=option.label)
-        for option in desktop_api.list_projects()
+        for option in cached_fetch(cache, PROJECTS_SECTION, "projects", desktop_api.list_projects)
     )
     resolved_project_id = resolve_project_id(project_id, project_options)
 
@@ -81,37 +93,66 @@ def build_workspace_state(
             label=option.label,
             supporting_text=option.summary_label,
         )
-        for option in desktop_api.list_calendars()
+        for option in cached_fetch(cache, CALENDARS_SECTION, "calendars", desktop_api.list_calendars)
     )
     resolved_calendar_id = resolve_selected_option(
         selected_calendar_id,
         calendar_options,
         default_value="default",
     )
-    calendar_snapshot = desktop_api.get_calendar_snapshot(resolved_calendar_id)
+    calendar_snapshot = cached_fetch(
+        cache,
+        CALENDARS_SECTION,
+        ("snapshot", resolved_calendar_id),
+        lambda: desktop_api.get_calendar_snapshot(resolved_calendar_id),
+    )
 
     schedule_items = (
-        desktop_api.list_schedule(resolved_project_id) if resolved_project_id else ()
+        cached_fetch(
+            cache,
+            SCHEDULE_SECTION,
+            ("schedule", resolved_project_id),
+            lambda: desktop_api.list_schedule(resolved_project_id),
+        )
+        if resolved_project_id
+        else ()
     )
     dependency_rows = (
-        desktop_api.list_project_dependencies(resolved_project_id)
+        cached_fetch(
+            cache,
+            SCHEDULE_SECTION,
+            ("dependencies", resolved_project_id),
+            lambda: desktop_api.list_project_dependencies(resolved_project_id),
+        )
         if resolved_project_id
         else ()
     )
     dependency_type_options = tuple(
         SchedulingSelectorOptionViewModel(value=option.value, label=option.label)
-        for option in desktop_api.list_dependency_types()
+        for option in cached_fetch(
+            cache, SCHEDULE_SECTION, "dependency_types", desktop_api.list_dependency_types
+        )
     )
     baseline_options = (
         tuple(
             SchedulingSelectorOptionViewModel(value=option.value, label=option.label)
-            for option in desktop_api.list_baselines(resolved_project_id)
+            for option in cached_fetch(
+                cache,
+                BASELINES_SECTION,
+                ("options", resolved_project_id),
+                lambda: desktop_api.list_baselines(resolved_project_id),
+            )
         )
         if resolved_project_id
         else ()
     )
     baseline_rows = (
-        desktop_api.list_baseline_rows(resolved_project_id)
+        cached_fetch(
+            cache,
+            BASELINES_SECTION,
+            ("rows", resolved_project_id),
+            lambda: desktop_api.list_baseline_rows(resolved_project_id),
+        )
         if resolved_project_id
         else ()
     )
@@ -168,16 +209,26 @@ def build_workspace_state(
     dependency_task_options = (
         tuple(
             SchedulingSelectorOptionViewModel(value=option.value, label=option.label)
-            for option in desktop_api.list_activity_options(
-                resolved_project_id,
-                exclude_task_id=resolved_selected_activity_id,
+            for option in cached_fetch(
+                cache,
+                SCHEDULE_SECTION,
+                ("activity_options", resolved_project_id, resolved_selected_activity_id),
+                lambda: desktop_api.list_activity_options(
+                    resolved_project_id,
+                    exclude_task_id=resolved_selected_activity_id,
+                ),
             )
         )
         if resolved_project_id and resolved_selected_activity_id
         else ()
     )
     activity_dependencies = (
-        desktop_api.list_dependencies(resolved_selected_activity_id)
+        cached_fetch(
+            cache,
+            SCHEDULE_SECTION,
+            ("activity_dependencies", resolved_selected_activity_id),
+            lambda: desktop_api.list_dependencies(resolved_selected_activity_id),
+        )
         if resolved_selected_activity_id
         else ()
     )
@@ -191,11 +242,22 @@ def build_workspace_state(
         and resolved_baseline_b_id
         and resolved_baseline_a_id != resolved_baseline_b_id
     ):
-        comparison_rows = desktop_api.compare_baselines(
-            project_id=resolved_project_id,
-            baseline_a_id=resolved_baseline_a_id,
-            baseline_b_id=resolved_baseline_b_id,
-            include_unchanged=include_unchanged,
+        comparison_rows = cached_fetch(
+            cache,
+            BASELINES_SECTION,
+            (
+                "compare",
+                resolved_project_id,
+                resolved_baseline_a_id,
+                resolved_baseline_b_id,
+                include_unchanged,
+            ),
+            lambda: desktop_api.compare_baselines(
+                project_id=resolved_project_id,
+                baseline_a_id=resolved_baseline_a_id,
+                baseline_b_id=resolved_baseline_b_id,
+                include_unchanged=include_unchanged,
+            ),
         )
         comparison_summary = (
             f"{label_for_option(resolved_baseline_a_id, baseline_options)} "
@@ -213,10 +275,22 @@ def build_workspace_state(
         comparison_empty_state = "No baseline variance matches the current comparison."
 
     resource_load = (
-        desktop_api.list_resource_load(resolved_project_id) if resolved_project_id else ()
+        cached_fetch(
+            cache,
+            SCHEDULE_SECTION,
+            ("resource_load", resolved_project_id),
+            lambda: desktop_api.list_resource_load(resolved_project_id),
+        )
+        if resolved_project_id
+        else ()
     )
     constraint_violations = (
-        desktop_api.list_constraint_violations(resolved_project_id)
+        cached_fetch(
+            cache,
+            SCHEDULE_SECTION,
+            ("constraint_violations", resolved_project_id),
+            lambda: desktop_api.list_constraint_violations(resolved_project_id),
+        )
         if resolved_project_id
         else ()
     )
@@ -248,6 +322,7 @@ def build_workspace_state(
     )
 
     cal_label = get_calendar_label(calendar_options, resolved_calendar_id)
+    page_bounds = timeline_bounds(paged_schedule)
     empty_state = build_schedule_empty_state(
         resolved_project_id=resolved_project_id,
         schedule_items=filtered_schedule,
@@ -311,11 +386,13 @@ def build_workspace_state(
             title="Timeline",
             subtitle="Current schedule bars, milestone markers, and baseline-ready planner lane.",
             items=tuple(
-                to_timeline_record(item, timeline_items=paged_schedule)
+                to_timeline_record(item, bounds=page_bounds)
                 for item in paged_schedule
             ),
             empty_state=empty_state,
         ),
+        timeline_bars=build_timeline_bars(ordered_schedule),
+        timeline_links=build_timeline_links(dependency_rows),
         critical_path=SchedulingCollectionViewModel(
             title="Critical Path",
             subtitle="Zero-float activities driving the current finish date.",
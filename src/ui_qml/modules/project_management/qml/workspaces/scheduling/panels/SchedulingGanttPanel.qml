@@ -448,6 +448,7 @@ Item {
                         SplitView.fillHeight: true
                         visible: root._effectiveViewMode !== "grid"
                         timelineModel: root.timelineModel
+                        barModel: root.workspaceController ? root.workspaceController.timelineBarModel : null
                         selectedActivityId: root.workspaceController ? root.workspaceController.selectedActivityId : ""
                         onActivitySelected: function(activityId) {
                             if (root.workspaceController !== null) root.workspaceController.selectActivity(activityId)
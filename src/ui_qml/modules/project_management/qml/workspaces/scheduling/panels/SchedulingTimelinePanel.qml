@@ -15,48 +15,42 @@ SchedulingPanelFrame {
 
     signal activitySelected(string activityId)
 
-    readonly property var _items: root.timelineModel.items || []
-    readonly property int _windowDays: {
-        if (root._items.length === 0) {
-            return 1
-        }
-        const firstState = root._items[0].state || {}
-        return Math.max(1, parseInt(firstState.windowDays || 1, 10))
-    }
-    readonly property int _currentOffset: {
-        if (root._items.length === 0) {
-            return -1
-        }
-        const firstState = root._items[0].state || {}
-        return parseInt(firstState.currentOffsetDays || -1, 10)
-    }
-    readonly property string _windowStartLabel: {
-        if (root._items.length === 0) {
-            return ""
-        }
-        return String((root._items[0].state || {}).windowStartLabel || "")
-    }
-    readonly property string _windowFinishLabel: {
-        if (root._items.length === 0) {
-            return ""
-        }
-        return String((root._items[0].state || {}).windowFinishLabel || "")
-    }
+    // SchedulingTimelineModel (controller.timelineBarModel): one row per
+    // filtered activity with packed bar geometry in day ordinals.
+    property var barModel: null
+
+    readonly property int _count: root.barModel ? root.barModel.count : 0
+    readonly property int _windowStart: root.barModel ? root.barModel.windowStartOrdinal : 0
+    readonly property int _windowDays: root.barModel ? Math.max(1, root.barModel.windowDays) : 1
+    readonly property int _currentOffset: root.barModel && root._windowStart > 0
+        ? root.barModel.todayOrdinal - root._windowStart
+        : -1
+    readonly property string _windowStartLabel: root.barModel ? root.barModel.windowStartLabel : ""
+    readonly property string _windowFinishLabel: root.barModel ? root.barModel.windowFinishLabel : ""
+    readonly property int _rowHeight: 28
+    readonly property int _titleWidth: 110
+    readonly property int _statusWidth: 64
+    readonly property int _flagCritical: 1
+    readonly property int _flagMilestone: 2
+    readonly property int _flagDelayed: 4
+    readonly property int _flagUnscheduled: 8
 
     title: root.timelineModel.title || "Timeline"
     subtitle: root.timelineModel.subtitle || "Planning lane"
 
-    function _barLeft(state, laneWidth) {
-        const offset = Math.max(0, parseInt(state.startOffsetDays || 0, 10))
-        return Math.round((offset / Math.max(1, root._windowDays)) * laneWidth)
+    function _laneX(ordinal, laneWidth) {
+        return Math.round(((ordinal - root._windowStart) / root._windowDays) * laneWidth)
+    }
+
+    function _barWidth(startOrdinal, finishOrdinal, milestone, laneWidth) {
+        const span = Math.max(1, finishOrdinal - startOrdinal + 1)
+        return Math.max(milestone ? 12 : 18, Math.round((span / root._windowDays) * laneWidth))
     }
 
-    function _barWidth(state, laneWidth) {
-        const span = Math.max(1, parseInt(state.spanDays || 1, 10))
-        return Math.max(
-            state.milestone ? 12 : 18,
-            Math.round((span / Math.max(1, root._windowDays)) * laneWidth)
-        )
+    onSelectedActivityIdChanged: {
+        if (root.barModel === null || root.selectedActivityId.length === 0) return
+        const row = root.barModel.rowForTask(root.selectedActivityId)
+        if (row >= 0) _timelineList.positionViewAtIndex(row, ListView.Contain)
     }
 
     Item {
@@ -113,32 +107,52 @@ SchedulingPanelFrame {
 
                 AppControls.Label {
                     anchors.centerIn: parent
-                    visible: root._items.length === 0
+                    visible: root._count === 0
                     text: root.timelineModel.emptyState || "No timeline activities are available."
                     color: Theme.AppTheme.textMuted
                     font.family: Theme.AppTheme.fontFamily
                     font.pixelSize: Theme.AppTheme.smallSize
                 }
 
+                // Delegates exist only for the rows in view; the model holds
+                // the geometry of every filtered activity.
                 ListView {
                     id: _timelineList
                     anchors.fill: parent
-                    visible: root._items.length > 0
-                    model: root._items
+                    visible: root._count > 0
+                    model: root.barModel
                     clip: true
                     spacing: Theme.AppTheme.spacingXs
+                    reuseItems: true
+                    cacheBuffer: root._rowHeight * 4
+
+                    onContentYChanged: _connectorCanvas.requestPaint()
+                    onHeightChanged: _connectorCanvas.requestPaint()
+                    onWidthChanged: _connectorCanvas.requestPaint()
+                    onCountChanged: _connectorCanvas.requestPaint()
 
                     delegate: Item {
                         id: _row
 
-                        required property var modelData
+                        required property int index
+                        required property string taskId
+                        required property string title
+                        required property int startOrdinal
+                        required property int finishOrdinal
+                        required property int flags
+                        required property int progress
 
                         width: _timelineList.width
-                        height: 28
+                        height: root._rowHeight
 
-                        readonly property var _state: modelData.state || ({})
+                        readonly property bool _milestone: (_row.flags & root._flagMilestone) !== 0
+                        readonly property bool _critical: (_row.flags & root._flagCritical) !== 0
+                        readonly property bool _scheduled: (_row.flags & root._flagUnscheduled) === 0
                         readonly property bool _selected: root.selectedActivityId.length > 0
-                            && String(_row.modelData.id || "") === root.selectedActivityId
+                            && _row.taskId === root.selectedActivityId
+
+                        onStartOrdinalChanged: _connectorCanvas.requestPaint()
+                        onFinishOrdinalChanged: _connectorCanvas.requestPaint()
 
                         Rectangle {
                             anchors.fill: parent
@@ -151,7 +165,7 @@ SchedulingPanelFrame {
                         MouseArea {
                             anchors.fill: parent
                             cursorShape: Qt.PointingHandCursor
-                            onClicked: root.activitySelected(String(_row.modelData.id || ""))
+                            onClicked: root.activitySelected(_row.taskId)
                         }
 
                         RowLayout {
@@ -159,8 +173,8 @@ SchedulingPanelFrame {
                             spacing: Theme.AppTheme.spacingSm
 
                             AppControls.Label {
-                                Layout.preferredWidth: 110
-                                text: String(_row.modelData.title || "")
+                                Layout.preferredWidth: root._titleWidth
+                                text: _row.title
                                 color: Theme.AppTheme.textSecondary
                                 font.family: Theme.AppTheme.fontFamily
                                 font.pixelSize: Theme.AppTheme.smallSize
@@ -189,7 +203,7 @@ SchedulingPanelFrame {
 
                                 Rectangle {
                                     visible: root._currentOffset >= 0 && root._currentOffset <= root._windowDays
-                                    x: Math.round((root._currentOffset / Math.max(1, root._windowDays)) * _laneHost.width)
+                                    x: Math.round((root._currentOffset / root._windowDays) * _laneHost.width)
                                     width: 2
                                     height: _laneHost.height
                                     color: Theme.AppTheme.warning
@@ -202,24 +216,22 @@ SchedulingPanelFrame {
                                 // visualization is explicit R4.5 scope.
 
                                 Rectangle {
-                                    x: root._barLeft(_row._state, _laneHost.width)
-                                    y: Math.round((_laneHost.height - (_row._state.milestone ? 12 : 14)) / 2)
-                                    width: root._barWidth(_row._state, _laneHost.width)
-                                    height: _row._state.milestone ? 12 : 14
-                                    radius: _row._state.milestone ? 6 : 4
-                                    color: _row._state.critical
+                                    visible: _row._scheduled
+                                    x: root._laneX(_row.startOrdinal, _laneHost.width)
+                                    y: Math.round((_laneHost.height - (_row._milestone ? 12 : 14)) / 2)
+                                    width: root._barWidth(_row.startOrdinal, _row.finishOrdinal, _row._milestone, _laneHost.width)
+                                    height: _row._milestone ? 12 : 14
+                                    radius: _row._milestone ? 6 : 4
+                                    color: _row._critical
                                         ? Theme.AppTheme.danger
                                         : Theme.AppTheme.accent
 
                                     Rectangle {
-                                        visible: !_row._state.milestone
+                                        visible: !_row._milestone
                                         anchors.left: parent.left
                                         anchors.top: parent.top
                                         anchors.bottom: parent.bottom
-                                        width: Math.max(
-                                            6,
-                                            Math.round(parent.width * (Math.max(0, Math.min(100, Number(_row._state.progressPercent || 0))) / 100))
-                                        )
+                                        width: Math.max(6, Math.round(parent.width * (_row.progress / 100)))
                                         radius: parent.radius
                                         color: Theme.AppTheme.success
                                         opacity: 0.45
@@ -228,9 +240,11 @@ SchedulingPanelFrame {
                             }
 
                             AppControls.Label {
-                                Layout.preferredWidth: 64
+                                Layout.preferredWidth: root._statusWidth
                                 horizontalAlignment: Text.AlignRight
-                                text: String(_row.modelData.statusLabel || "")
+                                text: _row._critical
+                                    ? "Critical"
+                                    : ((_row.flags & root._flagDelayed) !== 0 ? "Late" : _row.progress + "%")
                                 color: Theme.AppTheme.textMuted
                                 font.family: Theme.AppTheme.fontFamily
                                 font.pixelSize: Theme.AppTheme.captionSize
@@ -239,6 +253,48 @@ SchedulingPanelFrame {
                         }
                     }
                 }
+
+                // Dependency connectors, resolved for the rows in view only.
+                Canvas {
+                    id: _connectorCanvas
+                    anchors.fill: _timelineList
+                    visible: _timelineList.visible
+
+                    onPaint: {
+                        const ctx = getContext("2d")
+                        ctx.reset()
+                        if (root.barModel === null || root._count === 0) return
+                        const pitch = root._rowHeight + _timelineList.spacing
+                        const top = _timelineList.contentY - _timelineList.originY
+                        const firstRow = Math.max(0, Math.floor(top / pitch))
+                        const lastRow = Math.min(root._count - 1, Math.ceil((top + height) / pitch))
+                        const laneLeft = root._titleWidth + Theme.AppTheme.spacingSm
+                        const laneWidth = Math.max(1, width - laneLeft - root._statusWidth - Theme.AppTheme.spacingSm * 2)
+                        const connectors = root.barModel.connectorsForRows(firstRow, lastRow)
+                        ctx.lineWidth = 1
+                        for (let i = 0; i < connectors.length; i++) {
+                            const link = connectors[i]
+                            const fromX = laneLeft + root._laneX(link.fromOrdinal + (link.type === "SS" || link.type === "SF" ? 0 : 1), laneWidth)
+                            const toX = laneLeft + root._laneX(link.toOrdinal + (link.type === "FF" || link.type === "SF" ? 1 : 0), laneWidth)
+                            const fromY = link.fromRow * pitch - top + root._rowHeight / 2
+                            const toY = link.toRow * pitch - top + root._rowHeight / 2
+                            const elbowX = Math.max(fromX + 6, toX - 6)
+                            ctx.strokeStyle = link.critical ? Theme.AppTheme.danger : Theme.AppTheme.textMuted
+                            ctx.beginPath()
+                            ctx.moveTo(fromX, fromY)
+                            ctx.lineTo(elbowX, fromY)
+                            ctx.lineTo(elbowX, toY)
+                            ctx.lineTo(toX, toY)
+                            ctx.stroke()
+                        }
+                    }
+
+                    Connections {
+                        target: root.barModel
+                        function onModelReset() { _connectorCanvas.requestPaint() }
+                        function onWindowChanged() { _connectorCanvas.requestPaint() }
+                    }
+                }
             }
         }
     }
@@ -72,6 +72,8 @@ from src.ui_qml.modules.project_management.view_models.scheduling import (
     SchedulingOverviewViewModel,
     SchedulingRecordViewModel,
     SchedulingSelectorOptionViewModel,
+    SchedulingTimelineBarViewModel,
+    SchedulingTimelineLinkViewModel,
     SchedulingWorkspaceViewModel,
 )
 from src.ui_qml.modules.project_management.view_models.tasks import (
@@ -159,6 +161,8 @@ __all__ = [
     "SchedulingOverviewViewModel",
     "SchedulingRecordViewModel",
     "SchedulingSelectorOptionViewModel",
+    "SchedulingTimelineBarViewModel",
+    "SchedulingTimelineLinkViewModel",
     "SchedulingWorkspaceViewModel",
     "TaskCatalogMetricViewModel",
     "TaskCatalogOverviewViewModel",
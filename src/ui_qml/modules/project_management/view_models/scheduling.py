@@ -86,6 +86,26 @@ class SchedulingBaselineCompareViewModel:
     rows: tuple[SchedulingRecordViewModel, ...] = field(default_factory=tuple)
     empty_state: str = ""
 
+@dataclass(frozen=True)
+class SchedulingTimelineBarViewModel:
+    """One Gantt bar. Dates are day ordinals (``date.toordinal()``); an
+    unscheduled activity has both set to 0."""
+
+    id: str
+    title: str
+    start_ordinal: int = 0
+    finish_ordinal: int = 0
+    progress_percent: int = 0
+    critical: bool = False
+    milestone: bool = False
+    delayed: bool = False
+
+@dataclass(frozen=True)
+class SchedulingTimelineLinkViewModel:
+    predecessor_id: str
+    successor_id: str
+    dependency_type: str = "FS"
+
 @dataclass(frozen=True)
 class SchedulingWorkspaceViewModel:
     overview: SchedulingOverviewViewModel
@@ -138,6 +158,8 @@ class SchedulingWorkspaceViewModel:
             subtitle="",
         )
     )
+    timeline_bars: tuple[SchedulingTimelineBarViewModel, ...] = field(default_factory=tuple)
+    timeline_links: tuple[SchedulingTimelineLinkViewModel, ...] = field(default_factory=tuple)
     critical_path: SchedulingCollectionViewModel = field(
         default_factory=lambda: SchedulingCollectionViewModel(
             title="Critical Path",
@@ -207,5 +229,7 @@ __all__ = [
     "SchedulingOverviewViewModel",
     "SchedulingRecordViewModel",
     "SchedulingSelectorOptionViewModel",
+    "SchedulingTimelineBarViewModel",
+    "SchedulingTimelineLinkViewModel",
     "SchedulingWorkspaceViewModel",
 ]
@@ -9,6 +9,7 @@ from PySide6.QtQml import QmlElement, QmlUncreatable
 
 from src.core.shared.events.domain_events import DomainChangeEvent, domain_events
 from src.core.shared.events.signal import Signal as DomainSignal
+from src.infra.platform.startup_profiler import trace_first_load
 
 QML_IMPORT_NAME = "Platform.Controllers"
 QML_IMPORT_MAJOR_VERSION = 1
@@ -138,6 +139,7 @@ class PlatformWorkspaceControllerBase(QObject):
             return
         self._is_loading = value
         self.isLoadingChanged.emit()
+        trace_first_load(self, loading=value)
         if not value:
             self._flush_pending_domain_refresh()
 
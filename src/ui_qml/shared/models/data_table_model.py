@@ -29,6 +29,10 @@ logger = logging.getLogger(__name__)
 _LARGE_ROW_WARNING_THRESHOLD = 5_000
 _RESET_STORM_WINDOW_SECONDS = 2.0
 _RESET_STORM_THRESHOLD = 10
+# Above this many moved rows a refresh is applied as one layout change
+# (same rows, new order -- e.g. a re-sort) or a reset instead of a move
+# per row.
+_MAX_DIFF_MOVES = 128
 
 
 def _safe_str(v: Any) -> str:
@@ -44,6 +48,58 @@ def _safe_float(v: Any) -> float:
         return 0.0
 
 
+def _row_keys(rows: list) -> list[str] | None:
+    """Row identities for diffing, or None when rows are not uniquely keyed
+    by ``id`` (such row sets are always applied with a model reset)."""
+    if not all(isinstance(row, dict) for row in rows):
+        return None
+    keys = [str(row.get("id", "")) for row in rows]
+    if "" in keys or "None" in keys or len(set(keys)) != len(keys):
+        return None
+    return keys
+
+
+def _ranges(indexes: list[int]) -> list[tuple[int, int]]:
+    """Collapse sorted indexes into inclusive ``(first, last)`` runs."""
+    runs: list[tuple[int, int]] = []
+    for index in indexes:
+        if runs and runs[-1][1] == index - 1:
+            runs[-1] = (runs[-1][0], index)
+        else:
+            runs.append((index, index))
+    return runs
+
+
+def _stable_positions(positions: list[int]) -> set[int]:
+    """Indexes (into ``positions``) of a longest increasing subsequence:
+    the rows that can stay put while every other row is moved around them."""
+    tails: list[int] = []
+    tail_indexes: list[int] = []
+    previous: list[int] = [-1] * len(positions)
+    for index, value in enumerate(positions):
+        low, high = 0, len(tails)
+        while low < high:
+            mid = (low + high) // 2
+            if tails[mid] < value:
+                low = mid + 1
+            else:
+                high = mid
+        if low > 0:
+            previous[index] = tail_indexes[low - 1]
+        if low == len(tails):
+            tails.append(value)
+            tail_indexes.append(index)
+        else:
+            tails[low] = value
+            tail_indexes[low] = index
+    stable: set[int] = set()
+    cursor = tail_indexes[-1] if tail_indexes else -1
+    while cursor >= 0:
+        stable.add(cursor)
+        cursor = previous[cursor]
+    return stable
+
+
 @QmlElement
 class DynamicTableModel(QAbstractTableModel):
     """Full QAbstractTableModel backing the shared enterprise DataTable.
@@ -192,10 +248,11 @@ class DynamicTableModel(QAbstractTableModel):
         next_rows = list(value) if value is not None else []
         if next_rows == self._rows:
             return
-        self._record_reset("rows", len(next_rows))
-        self.beginResetModel()
-        self._rows = next_rows
-        self.endResetModel()
+        if not self._apply_row_diff(next_rows):
+            self._record_reset("rows", len(next_rows))
+            self.beginResetModel()
+            self._rows = next_rows
+            self.endResetModel()
         self.rowsChanged.emit()
         self.rowCountChanged.emit()
 
@@ -310,6 +367,136 @@ class DynamicTableModel(QAbstractTableModel):
         self.rowsChanged.emit()
         self.rowCountChanged.emit()
 
+    def _apply_row_diff(self, next_rows: list) -> bool:
+        """Move the model to *next_rows* with row-level signals instead of a
+        reset, so views keep scroll position, selection and the delegates
+        of untouched rows. Rows are matched by ``id``.
+
+        Returns False (caller resets) when either row set is not uniquely
+        keyed, the model is empty, or the change is mostly new rows."""
+        if not self._rows or not next_rows:
+            return False
+        old_keys = _row_keys(self._rows)
+        new_keys = _row_keys(next_rows)
+        if old_keys is None or new_keys is None:
+            return False
+        new_key_set = set(new_keys)
+        old_key_set = set(old_keys)
+        kept_old = [key for key in old_keys if key in new_key_set]
+        if len(kept_old) * 2 < len(next_rows):
+            return False
+        kept_new = [key for key in new_keys if key in old_key_set]
+        if kept_new == kept_old:
+            stable_keys = set(kept_old)
+        else:
+            target_position = {key: index for index, key in enumerate(kept_new)}
+            stable = _stable_positions([target_position[key] for key in kept_old])
+            stable_keys = {kept_old[index] for index in stable}
+        move_count = len(kept_old) - len(stable_keys)
+        if move_count > _MAX_DIFF_MOVES:
+            if len(kept_old) == len(old_keys) == len(new_keys):
+                self._relayout_rows(next_rows, old_keys)
+                return True
+            return False
+
+        removed = [index for index, key in enumerate(old_keys) if key not in new_key_set]
+        for first, last in reversed(_ranges(removed)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            self.endRemoveRows()
+        first_shifted = removed[0] if removed else len(next_rows)
+
+        current = list(kept_old)
+        for position, key in enumerate(kept_new):
+            if key in stable_keys:
+                continue
+            source = current.index(key)
+            destination = current.index(kept_new[position - 1]) + 1 if position else 0
+            if destination in (source, source + 1):
+                continue
+            self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), destination)
+            final = destination if destination < source else destination - 1
+            current.insert(final, current.pop(source))
+            self._rows.insert(final, self._rows.pop(source))
+            self.endMoveRows()
+            first_shifted = min(first_shifted, source, final)
+
+        inserted = [index for index, key in enumerate(new_keys) if key not in old_key_set]
+        for first, last in _ranges(inserted):
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._rows[first:first] = next_rows[first:last + 1]
+            self.endInsertRows()
+        if inserted:
+            first_shifted = min(first_shifted, inserted[0])
+
+        self._emit_changed_rows(next_rows)
+        if first_shifted < len(self._rows) and (removed or inserted or move_count):
+            # rowIndex is positional; refresh it for every row that shifted.
+            self.dataChanged.emit(
+                self.index(first_shifted, 0),
+                self.index(len(self._rows) - 1, max(len(self._vis_cols) - 1, 0)),
+                [self.RowIndexRole],
+            )
+        logger.debug(
+            "DynamicTableModel row diff model_id=%s removed=%s inserted=%s moved=%s row_count=%s",
+            id(self),
+            len(removed),
+            len(inserted),
+            move_count,
+            len(next_rows),
+        )
+        return True
+
+    def _emit_changed_rows(self, next_rows: list) -> None:
+        """Swap in rows whose content changed and emit ``dataChanged`` for
+        just the roles those changes affect."""
+        last_column = max(len(self._vis_cols) - 1, 0)
+        for row_index, next_row in enumerate(next_rows):
+            current_row = self._rows[row_index]
+            if current_row is next_row:
+                continue
+            self._rows[row_index] = next_row
+            if current_row == next_row:
+                continue
+            changed = {
+                key
+                for key in current_row.keys() | next_row.keys()
+                if current_row.get(key) != next_row.get(key)
+            }
+            roles = [self.RowDataRole]
+            if changed & {"_status", "status"}:
+                roles.append(self.StatusRole)
+            if "_meta" in changed:
+                roles.append(self.MetadataRole)
+            if any(
+                isinstance(col_def, dict) and col_def.get("key") in changed
+                for col_def in self._vis_cols
+            ):
+                roles.extend((Qt.DisplayRole, self.RawValueRole))
+            self.dataChanged.emit(
+                self.index(row_index, 0),
+                self.index(row_index, last_column),
+                roles,
+            )
+
+    def _relayout_rows(self, next_rows: list, old_keys: list[str]) -> None:
+        """Same rows in a new order: one layout change that keeps
+        persistent indexes (selection) on their rows."""
+        new_position = {str(row.get("id")): index for index, row in enumerate(next_rows)}
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        self._rows = next_rows
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(new_position[old_keys[index.row()]], index.column()) for index in persistent],
+        )
+        self.layoutChanged.emit()
+        logger.debug(
+            "DynamicTableModel row relayout model_id=%s row_count=%s",
+            id(self),
+            len(next_rows),
+        )
+
     def _record_reset(self, reset_type: str, item_count: int) -> None:
         now = monotonic()
         self._reset_timestamps = [
@@ -0,0 +1,261 @@
+"""Incrementally fetched variant of the shared DataTable model.
+
+Rows are pulled from a page source in pages (``canFetchMore`` /
+``fetchMore``) as the table scrolls instead of being pushed up front, and
+only a sliding window of pages is kept converted in memory; rows of evicted
+pages are re-fetched on demand. Sorting and filtering re-issue the query.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Mapping, Sequence
+from dataclasses import dataclass, field
+
+from PySide6.QtCore import QModelIndex, Qt, Slot
+from PySide6.QtQml import QmlElement
+
+from src.ui_qml.shared.models.data_table_model import DynamicTableModel
+
+QML_IMPORT_NAME = "App.Models"
+QML_IMPORT_MAJOR_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PAGE_SIZE = 200
+_DEFAULT_WINDOW_PAGES = 8
+_DEFAULT_PREFETCH_ROWS = 40
+
+
+@dataclass(frozen=True)
+class TablePageRequest:
+    offset: int
+    limit: int
+    sort_key: str = ""
+    ascending: bool = True
+    filters: Mapping[str, object] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class TablePage:
+    """One fetched page. ``next_offset`` is where the following page starts
+    in the source's own numbering (sources that drop rows after the query,
+    e.g. scope filtering, return fewer rows than they advance)."""
+
+    rows: Sequence[dict]
+    next_offset: int
+    has_more: bool
+
+
+PageSource = Callable[[TablePageRequest], TablePage]
+
+
+@dataclass
+class _PageSlot:
+    offset: int
+    first_row: int
+    row_count: int
+
+
+@QmlElement
+class PagedTableModel(DynamicTableModel):
+    """DynamicTableModel whose rows come from a page source.
+
+    The view asks for more rows through ``fetchMoreIfNeeded`` (the shared
+    DataTable calls it as the last visible row changes) or Qt's
+    ``fetchMore``. ``toggleSort`` and ``set_filters`` reload from the first
+    page with the new query."""
+
+    def __init__(
+        self,
+        parent=None,
+        *,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+        window_pages: int = _DEFAULT_WINDOW_PAGES,
+        prefetch_rows: int = _DEFAULT_PREFETCH_ROWS,
+    ):
+        super().__init__(parent)
+        self._page_size = max(1, int(page_size))
+        self._window_pages = max(2, int(window_pages))
+        self._prefetch_rows = max(0, int(prefetch_rows))
+        self._page_source: PageSource | None = None
+        self._sort_keys: frozenset[str] | None = None
+        self._filters: dict[str, object] = {}
+        self._pages: list[_PageSlot] = []
+        self._page_starts: list[int] = []
+        self._resident_pages: OrderedDict[int, None] = OrderedDict()
+        self._next_offset = 0
+        self._has_more = False
+
+    # ── Page source / query ───────────────────────────────────────────
+
+    def set_page_source(
+        self,
+        page_source: PageSource | None,
+        *,
+        filters: Mapping[str, object] | None = None,
+        sort_key: str = "",
+        ascending: bool = True,
+        sort_keys: Collection[str] | None = None,
+    ) -> None:
+        """``sort_keys`` lists the columns the source can sort by (``None``:
+        any); ``toggleSort`` ignores the others."""
+        self._page_source = page_source
+        self._sort_keys = None if sort_keys is None else frozenset(sort_keys)
+        self._filters = dict(filters or {})
+        self._sort_key = sort_key
+        self._sort_ascending = ascending
+        self.reload()
+
+    def has_page_source(self) -> bool:
+        return self._page_source is not None
+
+    def set_filters(self, filters: Mapping[str, object]) -> bool:
+        """Reload with new filters; returns False when they are unchanged."""
+        next_filters = dict(filters or {})
+        if next_filters == self._filters:
+            return False
+        self._filters = next_filters
+        self.reload()
+        return True
+
+    @Slot()
+    def reload(self) -> None:
+        """Drop every fetched row and fetch the first page again."""
+        self._record_reset("rows", 0)
+        self.beginResetModel()
+        self._rows = []
+        self._unsorted_rows = []
+        self._pages = []
+        self._page_starts = []
+        self._resident_pages.clear()
+        self._next_offset = 0
+        self._has_more = self._page_source is not None
+        self.endResetModel()
+        if self._has_more:
+            self.fetchMore(QModelIndex())
+        self.rowsChanged.emit()
+        self.rowCountChanged.emit()
+
+    @Slot(str)
+    def toggleSort(self, key: str) -> None:
+        """Same toggle semantics as DynamicTableModel, but the source sorts."""
+        if not key:
+            return
+        if self._sort_keys is not None and key not in self._sort_keys:
+            logger.debug(
+                "PagedTableModel sort ignored model_id=%s unsupported sort_key=%s",
+                id(self),
+                key,
+            )
+            return
+        if self._sort_key == key:
+            self._sort_ascending = not self._sort_ascending
+        else:
+            self._sort_key = key
+            self._sort_ascending = True
+        logger.debug(
+            "PagedTableModel sort toggled model_id=%s sort_key=%s ascending=%s",
+            id(self),
+            self._sort_key,
+            self._sort_ascending,
+        )
+        self.reload()
+
+    def set_rows(self, rows: list[dict]) -> None:
+        """Pushing rows directly detaches the page source."""
+        self._page_source = None
+        self._has_more = False
+        self._pages = []
+        self._page_starts = []
+        self._resident_pages.clear()
+        super().set_rows(rows)
+
+    # ── Incremental fetching ──────────────────────────────────────────
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:  # type: ignore[override]
+        return not parent.isValid() and self._page_source is not None and self._has_more
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:  # type: ignore[override]
+        if not self.canFetchMore(parent):
+            return
+        offset = self._next_offset
+        page = self._fetch(offset)
+        self._next_offset = max(page.next_offset, offset + 1)
+        self._has_more = bool(page.has_more)
+        rows = list(page.rows)
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._pages.append(_PageSlot(offset=offset, first_row=first, row_count=len(rows)))
+        self._page_starts.append(first)
+        self.endInsertRows()
+        self._touch(len(self._pages) - 1)
+        self.rowCountChanged.emit()
+
+    @Slot(int)
+    def fetchMoreIfNeeded(self, last_visible_row: int) -> None:
+        if last_visible_row >= len(self._rows) - 1 - self._prefetch_rows and self.canFetchMore():
+            self.fetchMore(QModelIndex())
+
+    # ── Row access ────────────────────────────────────────────────────
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        if index.isValid() and 0 <= index.row() < len(self._rows):
+            self._ensure_resident(index.row())
+        return super().data(index, role)
+
+    @Slot(int, result=str)
+    def rowId(self, row: int) -> str:
+        if 0 <= row < len(self._rows):
+            self._ensure_resident(row)
+        return super().rowId(row)
+
+    def resident_row_count(self) -> int:
+        return sum(1 for row in self._rows if row is not None)
+
+    def _ensure_resident(self, row: int) -> None:
+        page_index = bisect_right(self._page_starts, row) - 1
+        if page_index < 0:
+            return
+        if self._rows[row] is None:
+            slot = self._pages[page_index]
+            fetched = list(self._fetch(slot.offset).rows)[: slot.row_count]
+            # The source may have shrunk since the page was first read;
+            # keep the row count stable and show blanks for the gap.
+            fetched.extend({} for _ in range(slot.row_count - len(fetched)))
+            self._rows[slot.first_row:slot.first_row + slot.row_count] = fetched
+        self._touch(page_index)
+
+    def _touch(self, page_index: int) -> None:
+        self._resident_pages[page_index] = None
+        self._resident_pages.move_to_end(page_index)
+        while len(self._resident_pages) > self._window_pages:
+            evicted, _ = self._resident_pages.popitem(last=False)
+            slot = self._pages[evicted]
+            self._rows[slot.first_row:slot.first_row + slot.row_count] = [None] * slot.row_count
+
+    def _fetch(self, offset: int) -> TablePage:
+        request = TablePageRequest(
+            offset=offset,
+            limit=self._page_size,
+            sort_key=self._sort_key,
+            ascending=self._sort_ascending,
+            filters=dict(self._filters),
+        )
+        page = self._page_source(request)  # type: ignore[misc]
+        logger.debug(
+            "PagedTableModel page fetched model_id=%s offset=%s row_count=%s has_more=%s",
+            id(self),
+            offset,
+            len(page.rows),
+            page.has_more,
+        )
+        return page
+
+
+__all__ = ["PagedTableModel", "PageSource", "TablePage", "TablePageRequest"]
@@ -813,6 +813,14 @@ Item {
 
         //onWidthChanged:  root._scheduleMainViewLayout()
 
+        // TableView never calls fetchMore itself; let incrementally fetched
+        // models (PagedTableModel) pull their next page near the end.
+        onBottomRowChanged: {
+            if (root.sourceModel && typeof root.sourceModel.fetchMoreIfNeeded === "function") {
+                root.sourceModel.fetchMoreIfNeeded(_mainView.bottomRow)
+            }
+        }
+
         ScrollBar.vertical:   ScrollBar { policy: ScrollBar.AsNeeded }
         ScrollBar.horizontal: _hScrollBar
 
@@ -8,16 +8,19 @@ from time import perf_counter
 from PySide6.QtCore import QEventLoop
 from PySide6.QtGui import QFont, QGuiApplication, QIcon
 
-from src.application.runtime import build_desktop_api_registry
+from src.application.runtime import LazyProxy, build_desktop_api_registry
 from src.core.platform.application.security.authorization import get_authorization_engine
 from src.infra.platform.env_loader import load_env_file
 from src.infra.composition.app_container import build_service_dict
+from src.infra.composition.background_jobs import build_background_workers
+from src.infra.composition.lazy_services import LazyServiceContainer
 from src.infra.persistence.db.engine import get_db_url
 from src.infra.persistence.db.session_factory import SessionLocal
 from src.infra.persistence.migrations.runner import run_migrations
 from src.infra.platform.app_settings import AppSettingsStore
 from src.infra.platform.logging_config import setup_logging
 from src.infra.platform.resource import resource_path
+from src.infra.platform.startup_profiler import get_startup_profiler, trace_span
 
 from src.ui_qml.modules.inventory_procurement.context import (
     InventoryProcurementWorkspaceCatalog,
@@ -42,14 +45,15 @@ logger = logging.getLogger(__name__)
 load_env_file()
 
 
-def build_services() -> dict[str, object]:
+def build_services() -> LazyServiceContainer:
     started = perf_counter()
     db_url = get_db_url()
     logger.info("Service build begin db_url=%s", db_url)
     migration_started = perf_counter()
     logger.info("Database migration step begin")
     try:
-        run_migrations(db_url=db_url)
+        with trace_span("startup.migrations"):
+            run_migrations(db_url=db_url)
     except Exception:
         logger.exception("Database migration step failed")
         raise
@@ -60,14 +64,18 @@ def build_services() -> dict[str, object]:
     session = SessionLocal()
     logger.debug("Database session created session_class=%s", type(session).__name__)
     graph_started = perf_counter()
-    services = build_service_dict(session)
+    with trace_span("startup.service_graph"):
+        services = build_service_dict(session)
     logger.info(
-        "Service graph built service_count=%s duration_ms=%.1f",
+        "Service graph registered service_count=%s duration_ms=%.1f",
         len(services),
         (perf_counter() - graph_started) * 1000,
     )
-    desktop_api_registry = build_desktop_api_registry(services)
+    with trace_span("startup.desktop_api_registry"):
+        desktop_api_registry = build_desktop_api_registry(services)
     services["desktop_api_registry"] = desktop_api_registry
+    _trace_service_builds(services)
+    services.log_build_report(logger, label="Startup service")
     logger.info(
         "Desktop API registry ready duration_ms=%.1f",
         (perf_counter() - started) * 1000,
@@ -75,6 +83,38 @@ def build_services() -> dict[str, object]:
     return services
 
 
+def _trace_service_builds(services: LazyServiceContainer) -> None:
+    profiler = get_startup_profiler()
+    if not profiler.enabled:
+        return
+    for record in services.build_report():
+        started = services.created_at + record.started_ms / 1000
+        profiler.record(
+            f"service.{record.name}",
+            started=started,
+            finished=started + record.duration_ms / 1000,
+            category="services",
+        )
+
+
+def _trace_first_frame(engine) -> None:
+    profiler = get_startup_profiler()
+    if not profiler.enabled:
+        return
+    windows = [root for root in engine.rootObjects() if hasattr(root, "frameSwapped")]
+    if not windows:
+        return
+    window = windows[0]
+    profiler.begin("startup.first_frame")
+
+    def _on_first_frame() -> None:
+        window.frameSwapped.disconnect(_on_first_frame)
+        profiler.end("startup.first_frame")
+        profiler.mark("startup.first_paint")
+
+    window.frameSwapped.connect(_on_first_frame)
+
+
 def _configure_runtime_environment(app: QGuiApplication, *, settings_store: AppSettingsStore) -> tuple[str, str]:
     startup_theme = settings_store.load_theme_mode(default_mode=os.getenv("PM_THEME", "light"))
     startup_governance = settings_store.load_governance_mode(
@@ -122,7 +162,12 @@ def _prompt_for_login_qml(*, auth_service, user_session, username: str = "admin"
 def main(argv: list[str] | None = None, desktop_api_registry: object | None = None) -> int:
     log_file = setup_logging()
     logger.info("App startup begin argv_count=%s log_file=%s", len(argv or sys.argv), log_file)
-    app = QGuiApplication(argv or sys.argv)
+    profiler = get_startup_profiler()
+    with trace_span("startup.qt_application"):
+        app = QGuiApplication(argv or sys.argv)
+    if profiler.enabled:
+        logger.info("Startup profiling enabled; traces are written after the first workspace loads.")
+        app.aboutToQuit.connect(lambda: profiler.flush("session"))
     settings_store = AppSettingsStore()
     startup_theme, _startup_governance = _configure_runtime_environment(
         app,
@@ -130,9 +175,10 @@ def main(argv: list[str] | None = None, desktop_api_registry: object | None = No
     )
     startup_density = settings_store.load_density_mode()
     logger.info("Runtime environment configured theme=%s density=%s", startup_theme, startup_density)
-    services: dict[str, object] | None = None
+    services: LazyServiceContainer | None = None
     if desktop_api_registry is None:
-        services = build_services()
+        with trace_span("startup.build_services"):
+            services = build_services()
         desktop_api_registry = services["desktop_api_registry"]
         skip_login = os.getenv("PM_SKIP_LOGIN", "0").strip().lower() in {"1", "true"}
         preauthenticated = bool(services["user_session"].is_authenticated())
@@ -141,11 +187,17 @@ def main(argv: list[str] | None = None, desktop_api_registry: object | None = No
             skip_login,
             preauthenticated,
         )
-        if (not skip_login or not preauthenticated) and not _prompt_for_login_qml(
-            auth_service=services["auth_service"],
-            user_session=services["user_session"],
-        ):
+        with trace_span("startup.login_prompt"):
+            # The auth service is only handed out once every module bundle
+            # has registered against it, so resolve it on submit rather than
+            # before the login window can open.
+            login_accepted = (skip_login and preauthenticated) or _prompt_for_login_qml(
+                auth_service=LazyProxy(lambda: services["auth_service"], label="auth_service"),
+                user_session=services["user_session"],
+            )
+        if not login_accepted:
             logger.info("Login rejected; exiting application before shell load.")
+            profiler.flush("startup")
             return 0
 
     registry = build_qml_route_registry()
@@ -174,6 +226,7 @@ def main(argv: list[str] | None = None, desktop_api_registry: object | None = No
     else:
         update_shell_runtime_state(shell_context, theme_mode=startup_theme, density_mode=startup_density)
     logger.debug("Creating workspace catalogs.")
+    profiler.begin("startup.workspace_catalogs")
     if hasattr(app, "setProperty"):
         app.setProperty(
             "platformRuntimeApi",
@@ -203,6 +256,7 @@ def main(argv: list[str] | None = None, desktop_api_registry: object | None = No
         desktop_api_registry=desktop_api_registry,
     )
     logger.debug("Maintenance workspace catalog created.")
+    profiler.end("startup.workspace_catalogs")
     platform_workspace_catalog.tenantSwitcher.tenantSwitched.connect(
         pm_workspace_catalog.refreshCapabilities
     )
@@ -241,25 +295,32 @@ def main(argv: list[str] | None = None, desktop_api_registry: object | None = No
     engine = create_qml_engine()
     shell_route = registry.get("shell.app")
     logger.info("Loading shell QML path=%s", shell_route.qml_path)
-    load_qml(
-        engine,
-        shell_route.qml_path,
-        initial_properties={
-            "shellModel": shell_context,
-            "platformCatalog": platform_workspace_catalog,
-            "pmCatalog": pm_workspace_catalog,
-            "inventoryCatalog": inventory_workspace_catalog,
-            "maintenanceCatalog": maintenance_workspace_catalog,
-        },
-    )
+    with trace_span("startup.shell_qml_load", qml_path=str(shell_route.qml_path)):
+        load_qml(
+            engine,
+            shell_route.qml_path,
+            initial_properties={
+                "shellModel": shell_context,
+                "platformCatalog": platform_workspace_catalog,
+                "pmCatalog": pm_workspace_catalog,
+                "inventoryCatalog": inventory_workspace_catalog,
+                "maintenanceCatalog": maintenance_workspace_catalog,
+            },
+        )
+    _trace_first_frame(engine)
     if runtime_session_controller is not None:
         runtime_session_controller.start()
+    background_workers = build_background_workers(services["user_session"]) if services is not None else ()
+    for worker in background_workers:
+        worker.start()
     logger.info("Shell QML loaded; entering Qt event loop.")
     if hasattr(app, "setProperty"):
         app.setProperty("pmEventLoopRunning", True)
     try:
         return app.exec()
     finally:
+        for worker in background_workers:
+            worker.stop()
         if hasattr(app, "setProperty"):
             app.setProperty("pmEventLoopRunning", False)
 
@@ -6,6 +6,7 @@ from PySide6.QtCore import Property, QObject, QTimer, Signal, Slot
 from PySide6.QtQml import QmlElement, QmlUncreatable
 
 from src.infra.platform.app_settings import AppSettingsStore
+from src.infra.platform.startup_profiler import get_startup_profiler
 from src.ui_qml.shell.navigation import NavigationItemViewModel
 
 QML_IMPORT_NAME = "Shell.Context"
@@ -13,6 +14,11 @@ QML_IMPORT_MAJOR_VERSION = 1
 
 logger = logging.getLogger(__name__)
 
+_WORKSPACE_OPEN_TRACE_KEY = "workspace.open"
+# Give controllers that defer their first load to the next event loop
+# turn a moment to finish before the trace is written.
+_WORKSPACE_TRACE_SETTLE_MS = 500
+
 
 @QmlElement
 @QmlUncreatable("Shell runtime context is provided by the application shell.")
@@ -49,6 +55,7 @@ class ShellContext(QObject):
         }
         self._current_route_source = self._route_source_for(current_route_id)
         self._route_reload_pending = False
+        self._begin_workspace_open_trace()
 
     @Property(str, notify=appTitleChanged)
     def appTitle(self) -> str:
@@ -128,6 +135,7 @@ class ShellContext(QObject):
         self._current_route_id = route_id
         self._route_reload_pending = False
         self._current_route_source = self._route_source_for(route_id)
+        self._begin_workspace_open_trace()
         self.currentRouteIdChanged.emit()
         self.currentRouteSourceChanged.emit()
         logger.info(
@@ -153,8 +161,30 @@ class ShellContext(QObject):
         if resolved_route_source == self._current_route_source:
             return
         self._current_route_source = resolved_route_source
+        self._begin_workspace_open_trace()
         self.currentRouteSourceChanged.emit()
 
+    @Slot()
+    def markWorkspaceLoaded(self) -> None:
+        """Called by the shell's workspace ``Loader`` once the page has been
+        created; closes the open-workspace trace span."""
+        profiler = get_startup_profiler()
+        if not profiler.end(_WORKSPACE_OPEN_TRACE_KEY):
+            return
+        label = f"workspace-{self._current_route_id}" if profiler.flush_count else "startup"
+        QTimer.singleShot(_WORKSPACE_TRACE_SETTLE_MS, lambda: profiler.flush(label))
+
+    def _begin_workspace_open_trace(self) -> None:
+        if not self._current_route_source:
+            return
+        get_startup_profiler().begin(
+            _WORKSPACE_OPEN_TRACE_KEY,
+            "workspace.open",
+            category="workspace",
+            route_id=self._current_route_id,
+            qml_source=self._current_route_source,
+        )
+
     def _route_source_for(self, route_id: str) -> str:
         item = self._navigation_item_by_route_id.get(route_id)
         if item is None:
@@ -81,6 +81,9 @@ Item {
                         if ("maintenanceCatalog" in item) {
                             item.maintenanceCatalog = root.maintenanceCatalog
                         }
+                        if (root.shellModel) {
+                            root.shellModel.markWorkspaceLoaded()
+                        }
                     }
                 }
             }
@@ -0,0 +1,66 @@
+"""CLI: verify or rebuild the maintenance asset hierarchy closure table.
+
+By default read-only: derives every ancestor/descendant pair afresh from
+the assets' parent links, compares it with the stored closure rows and
+prints each pair that disagrees. Exits non-zero when drift is found. With
+``--rebuild`` the stored rows are replaced by the derived ones.
+
+    python -m tools.maintenance_asset_hierarchy
+    python -m tools.maintenance_asset_hierarchy --rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from src.core.modules.maintenance.infrastructure.persistence.repositories.asset_hierarchy_repository import (
+    find_asset_closure_drift,
+    rebuild_asset_closure,
+)
+from src.infra.persistence.db.session_factory import SessionLocal
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Verify or rebuild the maintenance asset hierarchy.")
+    parser.add_argument(
+        "--organization-id",
+        help="Limit to one organization. Defaults to every organization.",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Replace the stored closure rows with ones derived from parent links.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    session = SessionLocal()
+    try:
+        if args.rebuild:
+            written = rebuild_asset_closure(session, organization_id=args.organization_id)
+            session.commit()
+            print(f"Rebuilt {written} asset closure row(s).")
+            return 0
+        drift = find_asset_closure_drift(session, organization_id=args.organization_id)
+    finally:
+        session.close()
+
+    if not drift:
+        print("OK — asset hierarchy closure matches the parent links.")
+        return 0
+    for row in drift:
+        if row.stored_depth is None:
+            problem = f"missing (depth {row.expected_depth})"
+        elif row.expected_depth is None:
+            problem = "stale"
+        else:
+            problem = f"stored depth {row.stored_depth}, expected {row.expected_depth}"
+        print(f"{row.ancestor_id} -> {row.descendant_id}: {problem}")
+    print(f"{len(drift)} closure row(s) drifted; run with --rebuild to repair.")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,72 @@
+"""CLI: check or rebuild the maintenance MTBF/MTTR failure rollups.
+
+By default read-only: folds every completed corrective work order afresh,
+compares the result with the stored rollups and prints each asset and
+failure code that disagrees. Exits non-zero when drift is found. With
+``--rebuild`` the stored rollups are replaced by the fresh fold, which is
+also how they are backfilled.
+
+    python -m tools.maintenance_failure_rollups
+    python -m tools.maintenance_failure_rollups --rebuild
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from src.core.modules.maintenance.infrastructure.persistence.repositories.failure_rollup_repository import (
+    find_failure_rollup_drift,
+    rebuild_failure_rollups,
+)
+from src.infra.persistence.db.session_factory import SessionLocal
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Check or rebuild maintenance failure rollups.")
+    parser.add_argument(
+        "--organization-id",
+        help="Limit to one organization. Defaults to every organization.",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Replace the stored rollups with ones folded from work orders.",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    session = SessionLocal()
+    try:
+        if args.rebuild:
+            written = rebuild_failure_rollups(session, organization_id=args.organization_id)
+            session.commit()
+            print(f"Rebuilt {written} failure rollup(s).")
+            return 0
+        drift = find_failure_rollup_drift(session, organization_id=args.organization_id)
+    finally:
+        session.close()
+
+    if not drift:
+        print("OK — failure rollups match their work orders.")
+        return 0
+    for row in drift:
+        if row.stored is None:
+            problem = "missing"
+        elif row.expected is None:
+            problem = "stale"
+        else:
+            problem = (
+                f"stored {row.stored.failure_count} failure(s), "
+                f"expected {row.expected.failure_count}"
+                if row.stored.failure_count != row.expected.failure_count
+                else "figures differ"
+            )
+        print(f"asset {row.asset_id} / {row.failure_code}: {problem}")
+    print(f"{len(drift)} rollup(s) drifted; run with --rebuild to repair.")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())